@@ -10,6 +10,12 @@
 #   ./cleanup.sh --backup                      Back up then clean
 #   ./cleanup.sh --backup --export-audio       Back up with audio then clean
 #   ./cleanup.sh --backup --force              Skip confirmation prompt
+#   ./cleanup.sh --backup-only --export-audio --audio-format opus
+#                                              Back up raw Opus chunks (no decoding)
+#   ./cleanup.sh --backup-only --resume /app/data/backups/backup_<timestamp>
+#                                              Continue an interrupted backup
+#   ./cleanup.sh --restore /app/data/backups/backup_<timestamp>
+#                                              Restore a backup
 
 cd "$(dirname "$0")"
 docker compose exec chronicle-backend python src/scripts/cleanup_state.py "$@"
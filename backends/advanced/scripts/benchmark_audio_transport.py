@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark Redis memory per device for the audio stream transports.
+
+Publishes synthetic 16 kHz PCM for several simulated devices through
+``AudioStreamProducer`` with each transport (``redis``: PCM inside every stream
+entry, ``segment``: PCM in a per-session file, entries carry offsets), then
+reports:
+
+- Redis memory held by the ``audio:stream:*`` streams per device
+  (``MEMORY USAGE`` of each stream key)
+- time to read every chunk back through ``get_chunk_audio``, as the
+  persistence job and streaming consumer do
+
+Uses scratch stream keys and a temporary segment directory; both are removed
+at the end.
+
+Usage:
+    uv run python scripts/benchmark_audio_transport.py --devices 10 --minutes 30
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import redis.asyncio as redis_async
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from advanced_omi_backend.services.audio_stream import segments  # noqa: E402
+from advanced_omi_backend.services.audio_stream.producer import (  # noqa: E402
+    AudioStreamProducer,
+)
+from advanced_omi_backend.services.audio_stream.segments import (  # noqa: E402
+    AudioSegmentReader,
+    get_chunk_audio,
+)
+
+SAMPLE_RATE = 16000
+# Websocket frames as sent by the wearable clients (~100 ms)
+FRAME_BYTES = 3200
+
+
+def fmt_bytes(n: float) -> str:
+    for unit in ("B", "KB", "MB"):
+        if n < 1024:
+            return f"{n:.1f} {unit}"
+        n /= 1024
+    return f"{n:.1f} GB"
+
+
+async def run_transport(redis_client, transport: str, args, segment_dir: Path) -> None:
+    producer = AudioStreamProducer(
+        redis_client,
+        {
+            "transport": transport,
+            "segment_path": str(segment_dir),
+            "segment_retention_seconds": 3600,
+            "segment_max_file_bytes": 64 * 1024 * 1024,
+        },
+    )
+    rng = np.random.default_rng(0)
+    frame = (rng.standard_normal(FRAME_BYTES // 2) * 3000).astype(np.int16).tobytes()
+    frames = int(args.minutes * 60 * SAMPLE_RATE * 2 / FRAME_BYTES)
+
+    clients = [f"bench-{transport}-{i}" for i in range(args.devices)]
+    start = time.perf_counter()
+    for client_id in clients:
+        session_id = f"{client_id}-session"
+        await producer.init_session(session_id, "bench-user", client_id)
+        for _ in range(frames):
+            await producer.add_audio_chunk(frame, session_id, "bench-user", client_id)
+        await producer.finalize_session(session_id)
+    publish_seconds = time.perf_counter() - start
+
+    stream_bytes = 0
+    for client_id in clients:
+        stream_bytes += await redis_client.memory_usage(f"audio:stream:{client_id}", samples=0) or 0
+
+    # Read everything back as the stream readers do
+    segments._reader = AudioSegmentReader(segment_dir)
+    start = time.perf_counter()
+    read_bytes = 0
+    for client_id in clients:
+        for _, fields in await redis_client.xrange(f"audio:stream:{client_id}"):
+            read_bytes += len(get_chunk_audio(fields))
+    read_seconds = time.perf_counter() - start
+
+    print(
+        f"  {transport:<8} {fmt_bytes(stream_bytes / args.devices):>10} per device   "
+        f"publish {publish_seconds:6.2f} s   read {read_seconds:6.2f} s "
+        f"({fmt_bytes(read_bytes)} PCM)"
+    )
+
+    for client_id in clients:
+        await redis_client.delete(f"audio:stream:{client_id}", f"audio:session:{client_id}-session")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--redis-url", default=os.getenv("REDIS_URL", "redis://localhost:6379/0"))
+    parser.add_argument("--devices", type=int, default=10, help="Simulated devices")
+    parser.add_argument("--minutes", type=float, default=30, help="Audio per device")
+    args = parser.parse_args()
+
+    redis_client = redis_async.from_url(args.redis_url, decode_responses=False)
+    print(f"{args.devices} devices x {args.minutes:g} min of 16 kHz PCM")
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for transport in ("redis", "segment"):
+                await run_transport(redis_client, transport, args, Path(tmp_dir))
+    finally:
+        await redis_client.aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Benchmark for worker job conversation loaders.
+
+Inserts synthetic conversations into a scratch MongoDB database and, for each
+job that now reads through a projection view, compares the previous full
+``Conversation`` load against the projected load:
+
+- bytes returned by MongoDB (BSON size of the fetched document)
+- Pydantic validation time (``Conversation`` vs the view model)
+
+Also compares the audio chunk existence check in ``reprocess_transcript``
+(loading every chunk with its audio vs a ``limit(1)`` count).
+
+Conversations are inserted both in the current storage format (word content
+in ``transcript_versions``) and in the legacy embedded format, since legacy
+documents are what the full loads used to pay for.
+
+The scratch database is dropped at the end.
+
+Usage:
+    uv run python scripts/benchmark_conversation_loaders.py --minutes 30 --versions 3
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+import bson
+from beanie import init_beanie
+from motor.motor_asyncio import AsyncIOMotorClient
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from advanced_omi_backend.models.audio_chunk import AudioChunkDocument  # noqa: E402
+from advanced_omi_backend.models.conversation import Conversation  # noqa: E402
+from advanced_omi_backend.models.conversation_views import (  # noqa: E402
+    ConversationContextView,
+    MemoryJobView,
+    TitleSummaryJobView,
+)
+from advanced_omi_backend.models.transcript_version import (  # noqa: E402
+    TranscriptVersionDocument,
+)
+
+WORDS = (
+    "so I was thinking we should move the meeting to thursday because the "
+    "client wants to review the budget first and then we can talk about hiring"
+).split()
+
+# What each job loaded before and what it loads now
+JOBS = [
+    ("process_memory_job", [MemoryJobView]),
+    ("generate_title_summary_job", [TitleSummaryJobView]),
+    # Identifiers at start, full document right before writing the new version
+    ("transcribe_full_audio_job", [ConversationContextView, Conversation]),
+]
+
+
+def make_conversation(minutes: int, versions: int, rng: random.Random) -> Conversation:
+    conversation = Conversation(
+        conversation_id=str(uuid.uuid4()),
+        user_id="benchmark-user",
+        client_id="benchmark-client",
+        created_at=datetime.utcnow(),
+        title="Benchmark conversation",
+    )
+    for v in range(versions):
+        words, segments, t = [], [], 0.0
+        while t < minutes * 60:
+            speaker = rng.randint(0, 2)
+            segment_words = []
+            for _ in range(rng.randint(5, 25)):
+                segment_words.append(
+                    Conversation.Word(
+                        word=rng.choice(WORDS),
+                        start=round(t, 3),
+                        end=round(t + 0.3, 3),
+                        confidence=rng.random(),
+                        speaker=speaker,
+                    )
+                )
+                t += 0.4
+            words.extend(segment_words)
+            segments.append(
+                Conversation.SpeakerSegment(
+                    start=segment_words[0].start,
+                    end=segment_words[-1].end,
+                    text=" ".join(w.word for w in segment_words),
+                    speaker=f"Speaker {speaker}",
+                    words=segment_words,
+                )
+            )
+            t += 1.0
+        conversation.add_transcript_version(
+            version_id=f"v{v}",
+            transcript=" ".join(w.word for w in words),
+            words=words,
+            segments=segments,
+            provider="benchmark",
+        )
+    return conversation
+
+
+async def insert_legacy(conversation: Conversation) -> None:
+    """Insert with all version content embedded, bypassing the storage split."""
+    doc = conversation.model_dump(by_alias=True, exclude={"id"})
+    doc["transcript_storage_version"] = 0
+    await Conversation.get_pymongo_collection().insert_one(doc)
+
+
+def validate_time(model, raw: dict, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        model.model_validate(raw)
+    return (time.perf_counter() - start) / repeat
+
+
+async def measure_load(conversation_id: str, models, repeat: int):
+    """Bytes returned and validation seconds for a sequence of loads."""
+    collection = Conversation.get_pymongo_collection()
+    total_bytes, total_seconds = 0, 0.0
+    for model in models:
+        projection = getattr(getattr(model, "Settings", None), "projection", None)
+        if model is Conversation:
+            projection = None
+        raw = await collection.find_one({"conversation_id": conversation_id}, projection)
+        total_bytes += len(bson.encode(raw))
+        total_seconds += validate_time(model, raw, repeat)
+    return total_bytes, total_seconds
+
+
+async def insert_chunks(conversation_id: str, minutes: int, rng: random.Random) -> None:
+    # 10 s Opus chunks at ~24 kbps
+    chunks = [
+        AudioChunkDocument(
+            conversation_id=conversation_id,
+            chunk_index=i,
+            audio_data=rng.randbytes(30_000),
+            original_size=320_000,
+            compressed_size=30_000,
+            start_time=i * 10.0,
+            end_time=(i + 1) * 10.0,
+            duration=10.0,
+        )
+        for i in range(minutes * 6)
+    ]
+    await AudioChunkDocument.insert_many(chunks)
+
+
+async def measure_chunk_check(conversation_id: str):
+    collection = AudioChunkDocument.get_pymongo_collection()
+    query = {"conversation_id": conversation_id}
+
+    start = time.perf_counter()
+    raw_chunks = await collection.find(query).to_list(None)
+    [AudioChunkDocument.model_validate(c) for c in raw_chunks]
+    before = (sum(len(bson.encode(c)) for c in raw_chunks), time.perf_counter() - start)
+
+    start = time.perf_counter()
+    count = await collection.count_documents(query, limit=1)
+    after = (len(bson.encode({"n": count})), time.perf_counter() - start)
+    return before, after
+
+
+def fmt_bytes(n: int) -> str:
+    for unit in ("B", "KB", "MB"):
+        if n < 1024:
+            return f"{n:.0f} {unit}"
+        n /= 1024
+    return f"{n:.1f} GB"
+
+
+def report(name: str, before, after) -> None:
+    (b_bytes, b_sec), (a_bytes, a_sec) = before, after
+    print(
+        f"  {name:<28} {fmt_bytes(b_bytes):>10} -> {fmt_bytes(a_bytes):>10}   "
+        f"{b_sec * 1000:8.2f} ms -> {a_sec * 1000:8.2f} ms"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--mongodb-uri", default=os.getenv("MONGODB_URI", "mongodb://localhost:27017")
+    )
+    parser.add_argument("--database", default="chronicle_benchmark_loaders")
+    parser.add_argument("--minutes", type=int, default=30, help="Conversation length")
+    parser.add_argument("--versions", type=int, default=3, help="Transcript versions")
+    parser.add_argument("--repeat", type=int, default=20, help="Validation repetitions")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    client = AsyncIOMotorClient(args.mongodb_uri)
+    database = client[args.database]
+    await init_beanie(
+        database=database,
+        document_models=[Conversation, TranscriptVersionDocument, AudioChunkDocument],
+    )
+
+    try:
+        current = make_conversation(args.minutes, args.versions, rng)
+        await current.insert()
+        legacy = make_conversation(args.minutes, args.versions, rng)
+        await insert_legacy(legacy)
+        await insert_chunks(current.conversation_id, args.minutes, rng)
+
+        print(
+            f"{args.minutes} min, {args.versions} versions; "
+            f"bytes returned and validation time, before -> after"
+        )
+        for label, conversation in (("current format", current), ("legacy format", legacy)):
+            print(f"\n{label}:")
+            for job, views in JOBS:
+                before = await measure_load(
+                    conversation.conversation_id, [Conversation], args.repeat
+                )
+                after = await measure_load(conversation.conversation_id, views, args.repeat)
+                report(job, before, after)
+
+        print("\nreprocess_transcript chunk check (fetch + validate time):")
+        before, after = await measure_chunk_check(current.conversation_id)
+        report(f"{args.minutes * 6} chunks", before, after)
+    finally:
+        await client.drop_database(args.database)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark for plugin condition matching.
+
+Compares the compiled ConditionMatcher (one pass over the transcript for all
+plugins) against a per-plugin loop that tokenizes the transcript and every
+wake word / keyword again for each plugin on every event. Both must fire the
+same number of conditions.
+
+Usage:
+    uv run python scripts/benchmark_plugin_matcher.py --plugins 20 --patterns 5
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from advanced_omi_backend.plugins.matcher import (  # noqa: E402
+    WAKE_WORD,
+    ConditionMatcher,
+    condition_patterns,
+    tokenize,
+)
+
+WORDS = (
+    "turn off the lights in kitchen please remind me tomorrow about meeting with "
+    "alex call mom set a timer for ten minutes what is weather like today play some "
+    "music living room bedroom thermostat to seventy two degrees and also hey okay"
+).split()
+
+
+def make_conditions(num_plugins: int, patterns_per_plugin: int, rng: random.Random):
+    conditions = []
+    for i in range(num_plugins):
+        patterns = [f"{rng.choice(WORDS)} name{i}x{j}" for j in range(patterns_per_plugin)]
+        if i % 2:
+            conditions.append((f"plugin{i}", {"type": "wake_word", "wake_words": patterns}))
+        else:
+            conditions.append((f"plugin{i}", {"type": "keyword_anywhere", "keywords": patterns}))
+    return conditions
+
+
+def make_transcripts(conditions, count: int, rng: random.Random):
+    transcripts = []
+    for _ in range(count):
+        words = [rng.choice(WORDS) for _ in range(rng.randint(5, 25))]
+        if rng.random() < 0.2:
+            _, condition = rng.choice(conditions)
+            pattern = rng.choice(condition.get("wake_words") or condition.get("keywords"))
+            words.insert(
+                0 if "wake_words" in condition else rng.randint(0, len(words)), pattern + ","
+            )
+        transcripts.append(" ".join(words).capitalize() + ".")
+    return transcripts
+
+
+def _words(text: str):
+    return [token for token, _, _ in tokenize(text)]
+
+
+def per_plugin_match(conditions, transcript: str) -> int:
+    """Baseline: match each plugin's patterns separately, re-tokenizing every time."""
+    fired = 0
+    for _, condition in conditions:
+        words = _words(transcript)
+        for pattern in condition_patterns(condition):
+            parts = _words(pattern)
+            if not parts:
+                continue
+            if condition["type"] == WAKE_WORD:
+                hit = words[: len(parts)] == parts
+            else:
+                hit = any(
+                    words[i : i + len(parts)] == parts for i in range(len(words) - len(parts) + 1)
+                )
+            if hit:
+                fired += 1
+                break
+    return fired
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark plugin condition matching")
+    parser.add_argument("--plugins", type=int, default=20)
+    parser.add_argument("--patterns", type=int, default=5, help="Patterns per plugin")
+    parser.add_argument("--transcripts", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    conditions = make_conditions(args.plugins, args.patterns, rng)
+    transcripts = make_transcripts(conditions, args.transcripts, rng)
+
+    start = time.perf_counter()
+    matcher = ConditionMatcher.compile(conditions)
+    compile_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    baseline_fired = sum(per_plugin_match(conditions, t) for t in transcripts)
+    baseline_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    compiled_fired = sum(len(matcher.match(t)) for t in transcripts)
+    compiled_s = time.perf_counter() - start
+
+    n = len(transcripts)
+    print(f"Plugins: {args.plugins}, patterns/plugin: {args.patterns}, transcripts: {n}")
+    print(f"Automaton: {matcher.state_count} states, compiled in {compile_ms:.2f} ms")
+    print(
+        f"Per-plugin loop:        {baseline_s / n * 1e6:8.1f} us/transcript ({baseline_fired} fired)"
+    )
+    print(
+        f"Compiled matcher:       {compiled_s / n * 1e6:8.1f} us/transcript ({compiled_fired} fired)"
+    )
+    print(f"Speedup: {baseline_s / max(compiled_s, 1e-9):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
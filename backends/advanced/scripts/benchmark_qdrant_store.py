@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Benchmark QdrantVectorStore at 100k-1M memories with synthetic embeddings.
+
+Loads random unit-length embeddings spread over ``--users`` users, then
+measures the operations the memory service runs:
+
+- upsert throughput for each ``--batch-sizes`` value (on a sample), then the
+  bulk load with the last batch size
+- user-filtered search latency (p50/p95), plus recall against exact search
+  when quantization is enabled
+- paginated get_memories for a whole user, count_memories, get_memories_by_source
+- delete_user_memories (server-side count + filter delete)
+
+By default it runs against embedded in-memory Qdrant. Embedded mode does
+brute-force search and ignores payload indexes and quantization, so use
+``--url`` with a real server to compare those settings:
+
+Usage:
+    docker run -d -p 6333:6333 qdrant/qdrant
+    uv run python scripts/benchmark_qdrant_store.py --url localhost:6333 --memories 1000000 --quantization scalar
+    uv run python scripts/benchmark_qdrant_store.py --memories 100000 --dims 384
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from qdrant_client.models import SearchParams  # noqa: E402
+
+from advanced_omi_backend.services.memory.base import MemoryEntry  # noqa: E402
+from advanced_omi_backend.services.memory.providers.vector_stores import (  # noqa: E402
+    QdrantVectorStore,
+)
+
+LOAD_CHUNK = 10_000
+MEMORIES_PER_SOURCE = 20
+
+
+def percentile(values, pct: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+def random_embeddings(rng: np.random.Generator, count: int, dims: int) -> np.ndarray:
+    vectors = rng.standard_normal((count, dims), dtype=np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def make_entries(rng: np.random.Generator, start: int, count: int, args) -> list:
+    vectors = random_embeddings(rng, count, args.dims)
+    return [
+        MemoryEntry(
+            id=str(uuid.uuid4()),
+            content=f"synthetic memory {start + i}",
+            metadata={
+                "user_id": f"user-{(start + i) % args.users}",
+                # Each user's conversations hold MEMORIES_PER_SOURCE memories
+                "source_id": f"conv-{(start + i) % args.users}-"
+                f"{(start + i) // (args.users * MEMORIES_PER_SOURCE)}",
+                "timestamp": start + i,
+            },
+            embedding=vectors[i].tolist(),
+        )
+        for i in range(count)
+    ]
+
+
+async def timed(coro):
+    start = time.perf_counter()
+    result = await coro
+    return result, time.perf_counter() - start
+
+
+async def load(store: QdrantVectorStore, rng: np.random.Generator, args) -> None:
+    loaded = 0
+    sample = min(args.batch_sample, args.memories)
+    for batch_size in args.batch_sizes:
+        store.upsert_batch_size = batch_size
+        count = min(sample, args.memories - loaded)
+        if count <= 0:
+            break
+        entries = make_entries(rng, loaded, count, args)
+        _, elapsed = await timed(store.add_memories(entries))
+        loaded += count
+        print(f"  upsert batch {batch_size:5d}: {count / elapsed:9.0f} points/s")
+
+    start = time.perf_counter()
+    while loaded < args.memories:
+        count = min(LOAD_CHUNK, args.memories - loaded)
+        await store.add_memories(make_entries(rng, loaded, count, args))
+        loaded += count
+        print(f"\r  loaded {loaded}/{args.memories}", end="", flush=True)
+    elapsed = time.perf_counter() - start
+    print(f"\r  loaded {loaded} memories ({elapsed:.0f} s for the bulk load)    ")
+
+
+async def bench_search(store: QdrantVectorStore, rng: np.random.Generator, args) -> None:
+    queries = random_embeddings(rng, args.queries, args.dims)
+    latencies = []
+    overlaps = []
+    for query in queries:
+        user_id = f"user-{random.randrange(args.users)}"
+        results, elapsed = await timed(store.search_memories(query.tolist(), user_id, args.top_k))
+        latencies.append(elapsed)
+        if store.quantization:
+            exact = await store.client.query_points(
+                collection_name=store.collection_name,
+                query=query.tolist(),
+                query_filter=store._user_filter(user_id),
+                limit=args.top_k,
+                search_params=SearchParams(exact=True),
+            )
+            expected = {str(p.id) for p in exact.points}
+            if expected:
+                overlaps.append(len(expected & {m.id for m in results}) / len(expected))
+
+    print(
+        f"  search top-{args.top_k}: p50 {percentile(latencies, 50) * 1000:.1f} ms  "
+        f"p95 {percentile(latencies, 95) * 1000:.1f} ms"
+        + (f"  recall@{args.top_k} {statistics.mean(overlaps):.3f}" if overlaps else "")
+    )
+
+
+async def bench_reads(store: QdrantVectorStore, args) -> None:
+    per_user = args.memories // args.users
+    memories, elapsed = await timed(store.get_memories("user-0", limit=per_user + 1))
+    print(f"  get_memories (whole user, {len(memories)} points): {elapsed * 1000:.0f} ms")
+
+    count, elapsed = await timed(store.count_memories("user-1"))
+    print(f"  count_memories ({count}): {elapsed * 1000:.1f} ms")
+
+    memories, elapsed = await timed(store.get_memories_by_source("user-2", "conv-2-0", limit=100))
+    print(f"  get_memories_by_source ({len(memories)}): {elapsed * 1000:.1f} ms")
+
+    deleted, elapsed = await timed(store.delete_user_memories(f"user-{args.users - 1}"))
+    print(f"  delete_user_memories ({deleted}): {elapsed * 1000:.0f} ms")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--url", help="Qdrant server as host:port (default: embedded in-memory)")
+    parser.add_argument("--memories", type=int, default=100_000)
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--dims", type=int, default=1536)
+    parser.add_argument("--quantization", choices=["none", "scalar"], default="none")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[64, 256, 1024])
+    parser.add_argument(
+        "--batch-sample", type=int, default=5_000, help="Points upserted per batch size"
+    )
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--collection", default="benchmark_memories")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    config = {
+        "collection_name": args.collection,
+        "embedding_dims": args.dims,
+        "quantization": args.quantization,
+    }
+    if args.url:
+        host, _, port = args.url.partition(":")
+        config.update(host=host, port=int(port or 6333))
+    else:
+        config["location"] = ":memory:"
+
+    random.seed(args.seed)
+    rng = np.random.default_rng(args.seed)
+    store = QdrantVectorStore(config)
+    await store.initialize()
+    # Start from an empty collection with the configured settings
+    await store.client.delete_collection(args.collection)
+    await store.initialize()
+
+    print(
+        f"{args.url or 'embedded Qdrant'}: {args.memories} memories, {args.users} users, "
+        f"{args.dims} dims, quantization {args.quantization}"
+    )
+    try:
+        await load(store, rng, args)
+        await bench_search(store, rng, args)
+        await bench_reads(store, args)
+    finally:
+        await store.client.delete_collection(args.collection)
+        await store.client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-job overhead and throughput of the RQ worker modes.
+
+Runs the same batch of ``@async_job`` jobs (a Redis round trip plus a simulated
+I/O wait, like the monitor and LLM-bound jobs) through:
+
+- ``fork``: stock ``rq.Worker`` processes, one forked work horse per job, each
+  starting a new event loop, Beanie init and Redis client
+- ``async``: one ``AsyncJobWorker`` process with a persistent loop and shared
+  connections, ``--concurrency`` jobs in flight
+
+and reports wall time, jobs/sec, mean queue-to-finish latency and per-job
+overhead (wall time per job and slot, minus the simulated I/O wait).
+
+Workers are started as subprocesses of this script and jobs go to a scratch
+queue that is removed at the end. Beanie init needs MongoDB (MONGODB_URI);
+pass ``--no-mongo`` to skip it. Job modules are already imported by the script,
+so the fork numbers leave out the per-horse import of the real job modules.
+
+Usage:
+    uv run python scripts/benchmark_rq_worker.py --jobs 200 --io-ms 50 --concurrency 8
+"""
+
+import argparse
+import asyncio
+import os
+import signal
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from redis import Redis
+from rq import Queue, Worker
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from advanced_omi_backend.models.job import async_job  # noqa: E402
+
+QUEUE_NAME = "bench-rq-worker"
+COUNTER_KEY = "bench:rq_worker:counter"
+
+
+@async_job(redis=True, beanie=True)
+async def bench_job(io_ms: float, redis_client=None):
+    await redis_client.incr(COUNTER_KEY)
+    await asyncio.sleep(io_ms / 1000)
+
+
+@async_job(redis=True, beanie=False)
+async def bench_job_no_mongo(io_ms: float, redis_client=None):
+    await redis_client.incr(COUNTER_KEY)
+    await asyncio.sleep(io_ms / 1000)
+
+
+def serve(mode: str, redis_url: str, concurrency: int) -> None:
+    """Worker subprocess entry point."""
+    if mode == "async":
+        from advanced_omi_backend.workers.async_worker import AsyncJobWorker
+
+        AsyncJobWorker([QUEUE_NAME], redis_url, max_concurrent_jobs=concurrency).work()
+    else:
+        Worker([QUEUE_NAME], connection=Redis.from_url(redis_url)).work(logging_level="WARNING")
+
+
+def run_mode(mode: str, args, redis_conn: Redis) -> None:
+    processes = args.concurrency if mode == "fork" else 1
+    expected_workers = args.concurrency
+    command = [
+        sys.executable,
+        __file__,
+        "--serve",
+        mode,
+        "--redis-url",
+        args.redis_url,
+        "--concurrency",
+        str(args.concurrency),
+    ]
+    workers = [
+        subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        for _ in range(processes)
+    ]
+    queue = Queue(QUEUE_NAME, connection=redis_conn)
+    try:
+        deadline = time.monotonic() + 60
+        while Worker.count(connection=redis_conn, queue=queue) < expected_workers:
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"{mode} workers did not register")
+            time.sleep(0.2)
+
+        # By import path: the workers import this script as a module
+        func = f"{Path(__file__).stem}.{'bench_job_no_mongo' if args.no_mongo else 'bench_job'}"
+        redis_conn.delete(COUNTER_KEY)
+        start = time.perf_counter()
+        jobs = [queue.enqueue(func, args.io_ms) for _ in range(args.jobs)]
+        while int(redis_conn.get(COUNTER_KEY) or 0) < args.jobs or any(
+            job.get_status(refresh=True) not in ("finished", "failed")
+            for job in jobs[-args.concurrency :]
+        ):
+            time.sleep(0.05)
+        wall = time.perf_counter() - start
+
+        for job in jobs:
+            job.refresh()
+        failed = sum(1 for job in jobs if job.get_status() == "failed")
+        latency = sum(
+            (job.ended_at - job.enqueued_at).total_seconds() for job in jobs if job.ended_at
+        ) / len(jobs)
+        overhead_ms = (wall * args.concurrency / args.jobs) * 1000 - args.io_ms
+        print(
+            f"  {mode:<6} {wall:7.2f} s  {args.jobs / wall:7.1f} jobs/s  "
+            f"latency {latency * 1000:7.0f} ms  overhead {overhead_ms:6.1f} ms/job"
+            + (f"  ({failed} failed)" if failed else "")
+        )
+    finally:
+        for worker in workers:
+            worker.send_signal(signal.SIGTERM)
+        for worker in workers:
+            worker.wait(timeout=60)
+        queue.delete(delete_jobs=True)
+        redis_conn.delete(COUNTER_KEY)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--redis-url", default=os.getenv("REDIS_URL", "redis://localhost:6379/0"))
+    parser.add_argument("--jobs", type=int, default=200, help="Jobs per mode")
+    parser.add_argument("--io-ms", type=float, default=50, help="Simulated I/O wait per job")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Forking worker processes, or async jobs in flight in one process",
+    )
+    parser.add_argument("--modes", nargs="+", default=["fork", "async"], choices=["fork", "async"])
+    parser.add_argument("--no-mongo", action="store_true", help="Skip Beanie init in the jobs")
+    parser.add_argument("--serve", choices=["fork", "async"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args.serve, args.redis_url, args.concurrency)
+        return
+
+    redis_conn = Redis.from_url(args.redis_url)
+    print(
+        f"{args.jobs} jobs, {args.io_ms:g} ms I/O each, concurrency {args.concurrency}"
+        f"{', no MongoDB' if args.no_mongo else ''}"
+    )
+    for mode in args.modes:
+        run_mode(mode, args, redis_conn)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Load test concurrent websocket device capacity of a running backend.
+
+Connects simulated devices to ``/ws`` (PCM, Wyoming framing) in steps and has
+each stream real-time 16 kHz audio: ``audio-start``, then one 100 ms
+``audio-chunk`` every 100 ms. For every step it reports:
+
+- devices connected, and connections refused or dropped
+- time from connect to the server's ``ready`` message (p50/p95)
+- how far the senders fall behind real time (p50/p95 lag); a server that
+  cannot keep up stops reading, and websocket backpressure shows up here
+
+Capacity is the largest step with no failures and p95 lag under
+``--max-lag-ms``. Run it against the backend started with different
+``API_WORKERS`` values to compare process counts. Devices use batch mode and
+disconnect without ``audio-stop``, so no conversations are created; each
+device name is registered on the user once (``loadtest-N``).
+
+Usage:
+    API_WORKERS=4 docker compose up -d chronicle-backend
+    uv run python scripts/loadtest_websocket_devices.py --steps 50 100 200 400 --duration 30
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import time
+from typing import List, Optional
+
+import aiohttp
+import websockets
+
+SAMPLE_RATE = 16000
+FRAME_SECONDS = 0.1
+FRAME_BYTES = int(SAMPLE_RATE * FRAME_SECONDS) * 2
+
+
+class DeviceResult:
+    def __init__(self):
+        self.ready_seconds: Optional[float] = None
+        self.lags: List[float] = []
+        self.error: Optional[str] = None
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+async def login(base_url: str, email: str, password: str) -> str:
+    async with aiohttp.ClientSession() as session:
+        async with session.post(
+            f"{base_url}/auth/jwt/login", data={"username": email, "password": password}
+        ) as response:
+            if response.status != 200:
+                raise RuntimeError(f"Login failed ({response.status}): {await response.text()}")
+            return (await response.json())["access_token"]
+
+
+async def send_event(ws, event_type: str, data: dict, payload: Optional[bytes] = None) -> None:
+    header = {"type": event_type, "data": data, "version": "1.0.0"}
+    if payload:
+        header["payload_length"] = len(payload)
+    await ws.send(json.dumps(header) + "\n")
+    if payload:
+        await ws.send(payload)
+
+
+async def run_device(
+    ws_url: str, index: int, start_at: float, duration: float, result: DeviceResult
+) -> None:
+    frame = bytes(FRAME_BYTES)
+    audio_format = {"rate": SAMPLE_RATE, "width": 2, "channels": 1, "mode": "batch"}
+    try:
+        connect_start = time.monotonic()
+        async with websockets.connect(
+            f"{ws_url}&device_name=loadtest-{index}", open_timeout=30, max_size=None
+        ) as ws:
+            while True:
+                message = json.loads(await asyncio.wait_for(ws.recv(), timeout=30))
+                if message.get("type") == "ready":
+                    break
+                if message.get("type") == "error":
+                    raise RuntimeError(message.get("message"))
+            result.ready_seconds = time.monotonic() - connect_start
+
+            # Start streaming together once the whole step is connected
+            await asyncio.sleep(max(0.0, start_at - time.monotonic()))
+            await send_event(ws, "audio-start", audio_format)
+            stream_start = time.monotonic()
+            for i in range(int(duration / FRAME_SECONDS)):
+                due = stream_start + i * FRAME_SECONDS
+                await asyncio.sleep(max(0.0, due - time.monotonic()))
+                await send_event(
+                    ws, "audio-chunk", {**audio_format, "timestamp": int(time.time() * 1000)}, frame
+                )
+                result.lags.append(time.monotonic() - due)
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+
+
+async def run_step(ws_url: str, devices: int, args) -> bool:
+    results = [DeviceResult() for _ in range(devices)]
+    # Connections ramp up over --ramp seconds, then everyone streams at once
+    start_at = time.monotonic() + args.ramp + 5
+    tasks = []
+    for i, result in enumerate(results):
+        tasks.append(asyncio.create_task(run_device(ws_url, i, start_at, args.duration, result)))
+        await asyncio.sleep(args.ramp / devices)
+    await asyncio.gather(*tasks)
+
+    failed = [r for r in results if r.error]
+    ready = [r.ready_seconds for r in results if r.ready_seconds is not None]
+    lags = [lag for r in results for lag in r.lags]
+    p95_lag_ms = percentile(lags, 95) * 1000
+    ok = not failed and p95_lag_ms <= args.max_lag_ms
+
+    print(
+        f"  {devices:5d} devices  connected {len(ready):5d}  failed {len(failed):4d}  "
+        f"ready p50 {percentile(ready, 50) * 1000:6.0f} ms p95 {percentile(ready, 95) * 1000:6.0f} ms  "
+        f"lag p50 {percentile(lags, 50) * 1000:6.1f} ms p95 {p95_lag_ms:7.1f} ms  "
+        f"{'ok' if ok else 'OVER'}"
+    )
+    if failed:
+        errors = statistics.multimode(r.error for r in failed)
+        print(f"         most common error: {errors[0]}")
+    return ok
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--url", default=os.getenv("BACKEND_URL", "http://localhost:8000"))
+    parser.add_argument("--email", default=os.getenv("ADMIN_EMAIL"))
+    parser.add_argument("--password", default=os.getenv("ADMIN_PASSWORD"))
+    parser.add_argument(
+        "--steps", type=int, nargs="+", default=[25, 50, 100, 200], help="Devices per step"
+    )
+    parser.add_argument("--duration", type=float, default=30, help="Seconds of audio per device")
+    parser.add_argument(
+        "--ramp", type=float, default=10, help="Seconds to open a step's connections"
+    )
+    parser.add_argument(
+        "--max-lag-ms", type=float, default=200, help="p95 send lag a step may reach"
+    )
+    args = parser.parse_args()
+
+    if not args.email or not args.password:
+        parser.error("--email/--password (or ADMIN_EMAIL/ADMIN_PASSWORD) are required")
+
+    token = await login(args.url, args.email, args.password)
+    ws_url = args.url.replace("http", "ws", 1) + f"/ws?codec=pcm&token={token}"
+    print(f"{args.url}: {args.duration:g} s of real-time PCM per device")
+
+    capacity = 0
+    for devices in args.steps:
+        if not await run_step(ws_url, devices, args):
+            break
+        capacity = devices
+        await asyncio.sleep(5)  # let the server finish disconnect cleanup
+    print(f"Capacity: {capacity} concurrent devices")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
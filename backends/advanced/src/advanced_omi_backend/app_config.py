@@ -81,6 +81,20 @@ class AppConfig:
         # Thread pool configuration
         self.max_workers = os.cpu_count() or 4
 
+        # Request logging: response bodies are only captured for a sampled
+        # fraction of requests or for debug path prefixes, up to a size cap
+        self.request_log_body_sample_rate = float(
+            os.getenv("REQUEST_LOG_BODY_SAMPLE_RATE", "0.0")
+        )
+        self.request_log_body_paths = [
+            p.strip()
+            for p in os.getenv("REQUEST_LOG_BODY_PATHS", "").split(",")
+            if p.strip()
+        ]
+        self.request_log_body_max_bytes = int(
+            os.getenv("REQUEST_LOG_BODY_MAX_BYTES", "4096")
+        )
+
         # Memory service configuration
         self.memory_service_supports_threshold = self.memory_provider == "chronicle"
 
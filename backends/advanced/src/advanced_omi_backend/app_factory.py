@@ -36,6 +36,7 @@ from advanced_omi_backend.services.memory import (
     get_memory_service,
     shutdown_memory_service,
 )
+from advanced_omi_backend.startup_claims import startup_claim
 from advanced_omi_backend.task_manager import get_task_manager, init_task_manager
 from advanced_omi_backend.users import (
     User,
@@ -127,6 +128,7 @@ async def lifespan(app: FastAPI):
 
     # Startup
     application_logger.info("Starting application...")
+    startup_redis = redis.from_url(config.redis_url, socket_timeout=5)
 
     # ── Phase 1 (sequential — dependencies) ──────────────────────────
     phase_start = time.monotonic()
@@ -138,19 +140,25 @@ async def lifespan(app: FastAPI):
         from advanced_omi_backend.models.annotation import Annotation
         from advanced_omi_backend.models.audio_chunk import AudioChunkDocument
         from advanced_omi_backend.models.conversation import Conversation
+        from advanced_omi_backend.models.transcript_version import (
+            TranscriptVersionDocument,
+        )
         from advanced_omi_backend.models.user import User
         from advanced_omi_backend.models.waveform import WaveformData
 
-        await init_beanie(
-            database=config.db,
-            document_models=[
-                User,
-                Conversation,
-                AudioChunkDocument,
-                WaveformData,
-                Annotation,
-            ],
-        )
+        async with startup_claim(startup_redis, "indexes") as build_indexes:
+            await init_beanie(
+                database=config.db,
+                document_models=[
+                    User,
+                    Conversation,
+                    TranscriptVersionDocument,
+                    AudioChunkDocument,
+                    WaveformData,
+                    Annotation,
+                ],
+                skip_indexes=not build_indexes,
+            )
         application_logger.info("Beanie initialized for all document models")
     except Exception as e:
         application_logger.error(f"Failed to initialize Beanie: {e}")
@@ -158,7 +166,9 @@ async def lifespan(app: FastAPI):
 
     # Create admin user if needed (requires Beanie)
     try:
-        await create_admin_user_if_needed()
+        async with startup_claim(startup_redis, "admin_user") as claimed:
+            if claimed:
+                await create_admin_user_if_needed()
     except Exception as e:
         application_logger.error(f"Failed to create admin user: {e}")
 
@@ -191,8 +201,13 @@ async def lifespan(app: FastAPI):
             raise  # Task manager is essential
 
     async def _init_client_manager():
-        get_client_manager()
-        application_logger.info("ClientManager initialized")
+        try:
+            await get_client_manager().start(config.redis_url)
+            application_logger.info("ClientManager initialized with Redis registry")
+        except Exception as e:
+            application_logger.error(
+                f"ClientManager registry unavailable, clients are local to this process: {e}"
+            )
 
     async def _init_otel():
         try:
@@ -263,12 +278,6 @@ async def lifespan(app: FastAPI):
             application_logger.info(
                 "Redis client for audio streaming producer initialized"
             )
-
-            from advanced_omi_backend.client_manager import (
-                initialize_redis_for_client_manager,
-            )
-
-            initialize_redis_for_client_manager(config.redis_url)
         except Exception as e:
             application_logger.error(
                 f"Failed to initialize Redis client for audio streaming: {e}",
@@ -285,21 +294,24 @@ async def lifespan(app: FastAPI):
         except Exception:
             return
 
-        backoff_delays = [0, 2, 4, 8, 16, 32]
-        for delay in backoff_delays:
-            if delay:
-                await asyncio.sleep(delay)
-            try:
-                await registry.seed_prompts()
-                application_logger.info("Prompt seeding to Langfuse completed")
+        async with startup_claim(startup_redis, "prompt_seed") as claimed:
+            if not claimed:
                 return
-            except Exception as e:
-                application_logger.debug(
-                    f"Prompt seeding attempt failed (next retry in {delay}s): {e}"
-                )
-        application_logger.warning(
-            "Prompt seeding to Langfuse failed after all retries"
-        )
+            backoff_delays = [0, 2, 4, 8, 16, 32]
+            for delay in backoff_delays:
+                if delay:
+                    await asyncio.sleep(delay)
+                try:
+                    await registry.seed_prompts()
+                    application_logger.info("Prompt seeding to Langfuse completed")
+                    return
+                except Exception as e:
+                    application_logger.debug(
+                        f"Prompt seeding attempt failed (next retry in {delay}s): {e}"
+                    )
+            application_logger.warning(
+                "Prompt seeding to Langfuse failed after all retries"
+            )
 
     await asyncio.gather(
         _init_llm_client(),
@@ -307,8 +319,25 @@ async def lifespan(app: FastAPI):
         _init_redis_audio_producer(),
     )
 
+    async def _migrate_transcript_storage():
+        """Move embedded transcript versions into their own collection."""
+        try:
+            from advanced_omi_backend.models.conversation import (
+                migrate_transcript_storage,
+            )
+
+            async with startup_claim(startup_redis, "transcript_migration") as claimed:
+                migrated = await migrate_transcript_storage() if claimed else 0
+            if migrated:
+                application_logger.info(
+                    f"Migrated transcript versions of {migrated} conversations"
+                )
+        except Exception as e:
+            application_logger.warning(f"Transcript storage migration failed: {e}")
+
     # Launch deferred prompt seeding as a fire-and-forget background task
     asyncio.create_task(_deferred_prompt_seed())
+    asyncio.create_task(_migrate_transcript_storage())
 
     application_logger.info(
         f"Phase 3 (LLM/AudioStream/RedisProducer) completed in {time.monotonic() - phase_start:.2f}s"
@@ -322,7 +351,9 @@ async def lifespan(app: FastAPI):
     )
 
     async def _init_openmemory():
-        await initialize_openmemory_user()
+        async with startup_claim(startup_redis, "openmemory_user") as claimed:
+            if claimed:
+                await initialize_openmemory_user()
 
     async def _init_cron_scheduler():
         try:
@@ -428,6 +459,7 @@ async def lifespan(app: FastAPI):
                 await cleanup_client_state(client_id)
             except Exception as e:
                 application_logger.error(f"Error cleaning up client {client_id}: {e}")
+        await client_manager.stop()
 
         # Shutdown BackgroundTaskManager
         try:
@@ -463,6 +495,11 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             application_logger.error(f"Error closing Redis audio streaming client: {e}")
 
+        try:
+            await startup_redis.close()
+        except Exception as e:
+            application_logger.error(f"Error closing startup Redis client: {e}")
+
         # Stop metrics collection and save final report
         application_logger.info("Metrics collection stopped")
 
@@ -21,7 +21,7 @@ from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorCollection
 
 from advanced_omi_backend.database import get_database
-from advanced_omi_backend.llm_client import get_llm_client
+from advanced_omi_backend.llm_client import async_generate_stream, get_llm_client
 from advanced_omi_backend.model_registry import get_models_registry
 from advanced_omi_backend.services.memory import get_memory_service
 from advanced_omi_backend.services.memory.base import MemoryEntry
@@ -337,15 +337,40 @@ If no relevant memories are available, respond normally based on the conversatio
             logger.error(f"Failed to retrieve memories for user {user_id}: {e}")
             return []
 
+    async def _get_obsidian_context(self, query: str) -> List[str]:
+        """Search Obsidian notes for the query."""
+        try:
+            obsidian_service = get_obsidian_service()
+            obsidian_result = await obsidian_service.search_obsidian(query)
+            return obsidian_result["results"]
+        except ObsidianSearchError as exc:
+            logger.error(
+                "Failed to get Obsidian context (%s stage): %s",
+                exc.stage,
+                exc,
+            )
+            raise
+        except Exception as e:
+            logger.error(f"Failed to get Obsidian context: {e}")
+            raise e
+
     async def format_conversation_context(
         self, session_id: str, user_id: str, current_message: str, include_obsidian_memory: bool = False
     ) -> Tuple[str, List[str]]:
-        """Format conversation context with memory integration."""
-        # Get recent conversation history
-        messages = await self.get_session_messages(session_id, user_id, MAX_CONVERSATION_HISTORY)
-        
-        # Get relevant memories
-        memories = await self.get_relevant_memories(current_message, user_id)
+        """Format conversation context with memory integration.
+
+        History, memories and (optionally) Obsidian notes are fetched
+        concurrently; an Obsidian failure is re-raised.
+        """
+        retrievals = [
+            self.get_session_messages(session_id, user_id, MAX_CONVERSATION_HISTORY),
+            self.get_relevant_memories(current_message, user_id),
+        ]
+        if include_obsidian_memory:
+            retrievals.append(self._get_obsidian_context(current_message))
+        results = await asyncio.gather(*retrievals)
+        messages, memories = results[0], results[1]
+        obsidian_context = results[2] if include_obsidian_memory else []
         memory_ids = [memory.id for memory in memories if memory.id]
 
         # Build context string
@@ -361,27 +386,12 @@ If no relevant memories are available, respond normally based on the conversatio
             context_parts.append("")
 
         # Add Obsidian context if requested
-        if include_obsidian_memory:
-            try:
-                obsidian_service = get_obsidian_service()
-                obsidian_result = await obsidian_service.search_obsidian(current_message)
-                obsidian_context = obsidian_result["results"]
-                if obsidian_context:
-                    context_parts.append("# Relevant Obsidian Notes:")
-                    for entry in obsidian_context:
-                        context_parts.append(entry)
-                    context_parts.append("")
-                    logger.info(f"Added {len(obsidian_context)} Obsidian notes to context")
-            except ObsidianSearchError as exc:
-                logger.error(
-                    "Failed to get Obsidian context (%s stage): %s",
-                    exc.stage,
-                    exc,
-                )
-                raise
-            except Exception as e:
-                logger.error(f"Failed to get Obsidian context: {e}")
-                raise e
+        if obsidian_context:
+            context_parts.append("# Relevant Obsidian Notes:")
+            for entry in obsidian_context:
+                context_parts.append(entry)
+            context_parts.append("")
+            logger.info(f"Added {len(obsidian_context)} Obsidian notes to context")
 
         # Add conversation history
         if messages:
@@ -416,9 +426,12 @@ If no relevant memories are available, respond normally based on the conversatio
             )
             await self.add_message(user_message)
 
-            # Format context with memories
-            context, memory_ids = await self.format_conversation_context(
-                session_id, user_id, message_content, include_obsidian_memory=include_obsidian_memory
+            # Format context with memories and load the system prompt concurrently
+            (context, memory_ids), system_prompt = await asyncio.gather(
+                self.format_conversation_context(
+                    session_id, user_id, message_content, include_obsidian_memory=include_obsidian_memory
+                ),
+                self._get_system_prompt(),
             )
 
             # Send memory context used
@@ -431,44 +444,44 @@ If no relevant memories are available, respond normally based on the conversatio
                 "timestamp": time.time()
             }
 
-            # Get system prompt from config
-            system_prompt = await self._get_system_prompt()
-
             # Prepare full prompt
             full_prompt = f"{system_prompt}\n\n{context}"
 
             # Generate streaming response
             logger.info(f"Generating response for session {session_id} with {len(memory_ids)} memories")
-            
-            # Resolve chat operation temperature from config
-            chat_temp = None
-            registry = get_models_registry()
-            if registry:
-                chat_op = registry.get_llm_operation("chat")
-                chat_temp = chat_op.temperature
-
-            # Note: For now, we'll use the regular generate method
-            # In the future, this should be replaced with actual streaming
-            response_content = self.llm_client.generate(
-                prompt=full_prompt,
-                temperature=chat_temp,
-            )
 
-            # Simulate streaming by yielding chunks
-            words = response_content.split()
-            current_text = ""
-            
-            for i, word in enumerate(words):
-                current_text += word + " "
-                
-                # Yield every few words to simulate streaming
-                if i % 3 == 0 or i == len(words) - 1:
-                    yield {
-                        "type": "token",
-                        "data": current_text.strip(),
-                        "timestamp": time.time()
-                    }
-                    await asyncio.sleep(0.05)  # Small delay for realistic streaming
+            # Stream tokens from the chat operation; each event carries only the new text
+            chunks: List[str] = []
+            start_time = time.perf_counter()
+            first_token_time = None
+            async for delta in async_generate_stream(full_prompt, operation="chat"):
+                if first_token_time is None:
+                    first_token_time = time.perf_counter()
+                chunks.append(delta)
+                yield {
+                    "type": "token",
+                    "data": delta,
+                    "timestamp": time.time()
+                }
+
+            end_time = time.perf_counter()
+            response_content = "".join(chunks)
+            metrics = {
+                "time_to_first_token_ms": round((first_token_time - start_time) * 1000, 1)
+                if first_token_time is not None else None,
+                "generation_ms": round((end_time - start_time) * 1000, 1),
+                # Stream chunks, not tokens: providers may batch several tokens per chunk
+                "chunks": len(chunks),
+                "chunks_per_second": round(
+                    len(chunks) / (end_time - first_token_time), 1
+                ) if first_token_time is not None and end_time > first_token_time else None,
+            }
+            logger.info(
+                f"Chat response for session {session_id}: "
+                f"ttft={metrics['time_to_first_token_ms']}ms, "
+                f"{metrics['chunks']} chunks in {metrics['generation_ms']}ms "
+                f"({metrics['chunks_per_second']} chunks/s)"
+            )
 
             # Save assistant message
             assistant_message = ChatMessage(
@@ -486,7 +499,8 @@ If no relevant memories are available, respond normally based on the conversatio
                 "type": "complete",
                 "data": {
                     "message_id": assistant_message.message_id,
-                    "memories_used": memory_ids
+                    "memories_used": memory_ids,
+                    "metrics": metrics,
                 },
                 "timestamp": time.time()
             }
@@ -4,20 +4,51 @@ Client manager service for centralizing active_clients access and client-user re
 This service provides a centralized way to manage active client connections,
 their state, and client-user relationships, allowing API endpoints to access
 this information without tight coupling to the main.py module.
+
+The API can run as several processes (or replicas). Each process keeps the
+live ClientState and websocket of the devices connected to it, and publishes
+them to a Redis registry so every process sees every client:
+
+- client:lease:{client_id}: instance ID of the owning process, with a short
+  TTL that the owner renews; a crashed process's clients expire on their own
+- client:active:{client_id}: client info hash (user, owner, session, times)
+- clients:active / user:clients:active:{user_id}: active client ID indexes
+- user:clients:{user_id}: all clients of a user, including disconnected ones
+- client:control:{instance_id}: pub/sub channel for messages to a process's
+  devices (LED/audio commands), see ClientManager.send_to_client()
 """
 
+import asyncio
+import json
 import logging
+import os
+import socket
+import time
 import uuid
-from typing import TYPE_CHECKING, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 import redis.asyncio as redis
 
 if TYPE_CHECKING:
+    from fastapi import WebSocket
+
     from advanced_omi_backend.client import ClientState
     from advanced_omi_backend.users import User
 
 logger = logging.getLogger(__name__)
 
+# Redis keys of the cross-process client registry
+CLIENT_LEASE_KEY = "client:lease:{client_id}"
+CLIENT_INFO_KEY = "client:active:{client_id}"
+ACTIVE_CLIENTS_KEY = "clients:active"
+USER_ACTIVE_CLIENTS_KEY = "user:clients:active:{user_id}"
+USER_CLIENTS_KEY = "user:clients:{user_id}"
+CLIENT_CONTROL_CHANNEL = "client:control:{instance_id}"
+
+# Ownership lease of a connected client, renewed by the owning process
+CLIENT_LEASE_TTL = 30
+CLIENT_LEASE_RENEW_INTERVAL = 10
+
 # Global client-to-user mappings
 # These will be initialized by main.py
 _client_to_user_mapping: Dict[str, str] = {}  # Active clients only
@@ -37,8 +68,35 @@ class ClientManager:
 
     def __init__(self):
         self._active_clients: Dict[str, "ClientState"] = {}
+        self._websockets: Dict[str, "WebSocket"] = {}
         self._initialized = True  # Self-initializing, no external dict needed
-        logger.info("ClientManager initialized as single source of truth")
+        # Owner ID of this process in the Redis registry
+        self.instance_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self._background_tasks: list[asyncio.Task] = []
+        logger.info(f"ClientManager initialized (instance {self.instance_id})")
+
+    async def start(self, redis_url: str):
+        """
+        Connect the Redis registry and start lease renewal and device message routing.
+
+        Without start() the manager works for a single process only.
+
+        Args:
+            redis_url: Redis connection URL
+        """
+        initialize_redis_for_client_manager(redis_url)
+        self._background_tasks = [
+            asyncio.create_task(self._renew_leases()),
+            asyncio.create_task(self._route_client_messages()),
+        ]
+        logger.info(f"✅ ClientManager registry started for instance {self.instance_id}")
+
+    async def stop(self):
+        """Stop lease renewal and message routing."""
+        for task in self._background_tasks:
+            task.cancel()
+        await asyncio.gather(*self._background_tasks, return_exceptions=True)
+        self._background_tasks = []
 
     def is_initialized(self) -> bool:
         """Check if the client manager has been initialized."""
@@ -91,19 +149,31 @@ class ClientManager:
 
     def get_client_count(self) -> int:
         """
-        Get the number of active clients.
+        Get the number of active clients connected to this process.
 
         Returns:
             Number of active clients
         """
         return len(self._active_clients)
 
-    def create_client(self, client_id: str, chunk_dir, user_id: str, user_email: Optional[str] = None) -> "ClientState":
+    async def get_registered_client_count(self) -> int:
+        """
+        Get the number of active clients across all processes.
+
+        Returns:
+            Number of active clients
+        """
+        return len(await self.get_registered_clients())
+
+    async def create_client(
+        self, client_id: str, chunk_dir, user_id: str, user_email: Optional[str] = None
+    ) -> "ClientState":
         """
         Atomically create and register a new client.
 
         This method ensures that client creation and registration happen atomically,
-        eliminating race conditions.
+        eliminating race conditions. The client's lease in Redis makes this
+        process its owner; a client ID owned by another process is rejected.
 
         Args:
             client_id: Unique client identifier
@@ -119,6 +189,8 @@ class ClientManager:
         """
         if client_id in self._active_clients:
             raise ValueError(f"Client {client_id} already exists")
+        if not await self._claim_lease(client_id):
+            raise ValueError(f"Client {client_id} is connected to another process")
 
         # Import here to avoid circular imports
         from advanced_omi_backend.client import ClientState
@@ -129,6 +201,7 @@ class ClientManager:
         # Atomically add to internal storage and register mapping
         self._active_clients[client_id] = client_state
         register_client_user_mapping(client_id, user_id)
+        await self._publish_client_info([client_id])
 
         logger.info(f"✅ Created and registered client {client_id} for user {user_id}")
         return client_state
@@ -138,6 +211,8 @@ class ClientManager:
         Atomically remove and deregister a client.
 
         This method ensures that client removal and deregistration happen atomically.
+        The Redis lease is not renewed anymore and expires within CLIENT_LEASE_TTL;
+        use remove_client_with_cleanup() to release it immediately.
 
         Args:
             client_id: Client identifier to remove
@@ -154,6 +229,7 @@ class ClientManager:
 
         # Atomically remove from storage and deregister mapping
         del self._active_clients[client_id]
+        self._websockets.pop(client_id, None)
         unregister_client_user_mapping(client_id)
 
         logger.info(f"✅ Removed and deregistered client {client_id}")
@@ -181,7 +257,9 @@ class ClientManager:
 
         # Atomically remove from storage and deregister mapping
         del self._active_clients[client_id]
+        self._websockets.pop(client_id, None)
         unregister_client_user_mapping(client_id)
+        await self._release_lease(client_id, client_state.user_id)
 
         logger.info(f"✅ Removed and cleaned up client {client_id}")
         return True
@@ -209,15 +287,65 @@ class ClientManager:
         self._active_clients[client_id] = client_state
         logger.info(f"Added existing client {client_id} to ClientManager")
 
-    def get_client_info_summary(self) -> list:
+    async def update_client_info(self, client_id: str):
+        """
+        Publish a local client's state (e.g. a new stream session) to the registry now.
+
+        Other processes otherwise see changes within CLIENT_LEASE_RENEW_INTERVAL.
+
+        Args:
+            client_id: Client identifier
+        """
+        if client_id in self._active_clients:
+            await self._publish_client_info([client_id])
+
+    def attach_websocket(self, client_id: str, websocket: "WebSocket"):
+        """
+        Attach the device websocket of a local client, for send_to_client().
+
+        Args:
+            client_id: Client identifier
+            websocket: Connected device websocket
+        """
+        self._websockets[client_id] = websocket
+
+    async def send_to_client(self, client_id: str, message: Dict[str, Any]) -> bool:
+        """
+        Send a JSON message (e.g. an LED or audio command) to a device.
+
+        Delivered directly if the device is connected to this process, otherwise
+        routed through Redis to the owning process.
+
+        Args:
+            client_id: Target client ID
+            message: Wyoming-style JSON event, e.g. {"type": "led", "data": {...}}
+
+        Returns:
+            True if the message was sent or handed to the owning process
         """
-        Get summary information about all active clients.
+        if await self._deliver_local(client_id, message):
+            return True
+        if _redis_client is None:
+            return False
+        return await publish_client_message(_redis_client, client_id, message)
+
+    async def get_client_info_summary(self, user_id: Optional[str] = None) -> list:
+        """
+        Get summary information about all active clients, on every process.
+
+        Clients of this process are reported from their live state, others
+        from the registry (refreshed every CLIENT_LEASE_RENEW_INTERVAL).
+
+        Args:
+            user_id: Only include clients of this user
 
         Returns:
             List of client info dictionaries suitable for API responses
         """
         client_info = []
         for client_id, client_state in self._active_clients.items():
+            if user_id is not None and client_state.user_id != user_id:
+                continue
             current_audio_uuid = client_state.current_audio_uuid
             client_data = {
                 "client_id": client_id,
@@ -229,11 +357,226 @@ class ClientManager:
                 "conversation_transcripts_count": len(
                     getattr(client_state, "conversation_transcripts", [])
                 ),
+                "instance": self.instance_id,
             }
             client_info.append(client_data)
 
+        for client_id, info in (await self.get_registered_clients(user_id)).items():
+            if client_id in self._active_clients:
+                continue
+            current_audio_uuid = info.get("current_audio_uuid") or None
+            client_info.append(
+                {
+                    "client_id": client_id,
+                    "connected": True,
+                    "current_audio_uuid": current_audio_uuid,
+                    "last_transcript_time": _optional_float(info.get("last_transcript_time")),
+                    "conversation_start_time": _optional_float(info.get("conversation_start_time")),
+                    "has_active_conversation": current_audio_uuid is not None,
+                    "conversation_transcripts_count": 0,
+                    "instance": info.get("instance"),
+                }
+            )
+
         return client_info
 
+    async def get_registered_clients(self, user_id: Optional[str] = None) -> Dict[str, Dict[str, str]]:
+        """
+        Get registry info of the active clients on all processes.
+
+        Args:
+            user_id: Only include clients of this user
+
+        Returns:
+            Dictionary of client_id -> info hash (user_id, instance, stream_session_id, ...)
+        """
+        if _redis_client is None:
+            return {
+                client_id: self._client_info(state)
+                for client_id, state in self._active_clients.items()
+                if user_id is None or state.user_id == user_id
+            }
+
+        index_key = (
+            ACTIVE_CLIENTS_KEY if user_id is None else USER_ACTIVE_CLIENTS_KEY.format(user_id=user_id)
+        )
+        try:
+            client_ids = sorted(await _redis_client.smembers(index_key))
+            if not client_ids:
+                return {}
+            async with _redis_client.pipeline(transaction=False) as pipe:
+                for client_id in client_ids:
+                    pipe.hgetall(CLIENT_INFO_KEY.format(client_id=client_id))
+                infos = await pipe.execute()
+
+            clients = {}
+            expired = []
+            for client_id, info in zip(client_ids, infos):
+                if info:
+                    clients[client_id] = info
+                else:
+                    expired.append(client_id)
+            if expired:
+                # Leases of a process that died without cleaning up
+                await _redis_client.srem(index_key, *expired)
+            return clients
+        except Exception as e:
+            logger.warning(f"Failed to read client registry from Redis: {e}")
+            return {
+                client_id: self._client_info(state)
+                for client_id, state in self._active_clients.items()
+                if user_id is None or state.user_id == user_id
+            }
+
+    async def get_registered_client(self, client_id: str) -> Optional[Dict[str, str]]:
+        """
+        Get registry info of an active client on any process.
+
+        Args:
+            client_id: The client ID to lookup
+
+        Returns:
+            Info hash if the client is connected anywhere, None otherwise
+        """
+        client_state = self._active_clients.get(client_id)
+        if client_state is not None:
+            return self._client_info(client_state)
+        if _redis_client is None:
+            return None
+        try:
+            return await _redis_client.hgetall(CLIENT_INFO_KEY.format(client_id=client_id)) or None
+        except Exception as e:
+            logger.warning(f"Redis lookup failed for client {client_id}: {e}")
+            return None
+
+    def _client_info(self, client_state: "ClientState") -> Dict[str, str]:
+        """Registry hash fields for a local client."""
+        return {
+            "user_id": client_state.user_id,
+            "user_email": client_state.user_email or "",
+            "instance": self.instance_id,
+            "stream_session_id": getattr(client_state, "stream_session_id", None) or "",
+            "current_audio_uuid": client_state.current_audio_uuid or "",
+            "conversation_start_time": str(client_state.conversation_start_time),
+            "last_transcript_time": (
+                str(client_state.last_transcript_time) if client_state.last_transcript_time else ""
+            ),
+        }
+
+    async def _claim_lease(self, client_id: str) -> bool:
+        """Take ownership of a client ID in Redis; False if another process holds it."""
+        if _redis_client is None:
+            return True
+        lease_key = CLIENT_LEASE_KEY.format(client_id=client_id)
+        try:
+            if await _redis_client.set(lease_key, self.instance_id, nx=True, ex=CLIENT_LEASE_TTL):
+                return True
+            return await _redis_client.get(lease_key) == self.instance_id
+        except Exception as e:
+            # Registry unavailable: serve the device anyway, as a single process would
+            logger.warning(f"Failed to claim lease for client {client_id} in Redis: {e}")
+            return True
+
+    async def _release_lease(self, client_id: str, user_id: str):
+        """Drop a client from the registry if this process still owns it."""
+        if _redis_client is None:
+            return
+        lease_key = CLIENT_LEASE_KEY.format(client_id=client_id)
+        try:
+            async with _redis_client.pipeline(transaction=True) as pipe:
+                await pipe.watch(lease_key)
+                if await pipe.get(lease_key) != self.instance_id:
+                    # Expired or taken over by a reconnect on another process
+                    await pipe.unwatch()
+                    return
+                pipe.multi()
+                pipe.delete(lease_key, CLIENT_INFO_KEY.format(client_id=client_id))
+                pipe.srem(ACTIVE_CLIENTS_KEY, client_id)
+                pipe.srem(USER_ACTIVE_CLIENTS_KEY.format(user_id=user_id), client_id)
+                await pipe.execute()
+        except redis.WatchError:
+            logger.debug(f"Lease for client {client_id} changed while releasing, left to its new owner")
+        except Exception as e:
+            logger.warning(f"Failed to release lease for client {client_id} in Redis: {e}")
+
+    async def _publish_client_info(self, client_ids: list[str]):
+        """Write registry info for local clients and extend their leases."""
+        if _redis_client is None or not client_ids:
+            return
+        try:
+            async with _redis_client.pipeline(transaction=False) as pipe:
+                for client_id in client_ids:
+                    pipe.get(CLIENT_LEASE_KEY.format(client_id=client_id))
+                owners = await pipe.execute()
+
+            async with _redis_client.pipeline(transaction=False) as pipe:
+                for client_id, owner in zip(client_ids, owners):
+                    client_state = self._active_clients.get(client_id)
+                    if client_state is None:
+                        continue
+                    if owner not in (None, self.instance_id):
+                        logger.warning(
+                            f"Client {client_id} lease is held by {owner}, not renewing from this process"
+                        )
+                        continue
+                    info_key = CLIENT_INFO_KEY.format(client_id=client_id)
+                    pipe.set(CLIENT_LEASE_KEY.format(client_id=client_id), self.instance_id, ex=CLIENT_LEASE_TTL)
+                    pipe.hset(info_key, mapping=self._client_info(client_state))
+                    pipe.expire(info_key, CLIENT_LEASE_TTL)
+                    pipe.sadd(ACTIVE_CLIENTS_KEY, client_id)
+                    pipe.sadd(USER_ACTIVE_CLIENTS_KEY.format(user_id=client_state.user_id), client_id)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Failed to publish client info to Redis: {e}")
+
+    async def _renew_leases(self):
+        """Keep this process's client leases and registry info fresh."""
+        while True:
+            await asyncio.sleep(CLIENT_LEASE_RENEW_INTERVAL)
+            await self._publish_client_info(list(self._active_clients))
+
+    async def _route_client_messages(self):
+        """Deliver messages routed to this process's devices by other processes."""
+        channel = CLIENT_CONTROL_CHANNEL.format(instance_id=self.instance_id)
+        while True:
+            pubsub = _redis_client.pubsub()
+            try:
+                await pubsub.subscribe(channel)
+                while True:
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if message is None:
+                        continue
+                    try:
+                        routed = json.loads(message["data"])
+                        if not await self._deliver_local(routed["client_id"], routed["message"]):
+                            logger.warning(
+                                f"Routed message for {routed['client_id']} dropped: not connected here"
+                            )
+                    except (ValueError, KeyError) as e:
+                        logger.error(f"Invalid routed client message: {e}")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Client message routing interrupted, resubscribing: {e}")
+                await asyncio.sleep(1)
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+
+    async def _deliver_local(self, client_id: str, message: Dict[str, Any]) -> bool:
+        websocket = self._websockets.get(client_id)
+        if websocket is None:
+            return False
+        try:
+            # Newline-terminated JSON, like the ready and interim messages
+            await websocket.send_text(json.dumps(message) + "\n")
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to send message to client {client_id}: {e}")
+            return False
+
     # Client-user relationship methods
     def client_belongs_to_user(self, client_id: str, user_id: str) -> bool:
         """
@@ -287,6 +630,10 @@ class ClientManager:
         ]
 
 
+def _optional_float(value: Optional[str]) -> Optional[float]:
+    return float(value) if value else None
+
+
 # Global instance
 _client_manager: Optional[ClientManager] = None
 
@@ -345,7 +692,12 @@ async def track_client_user_relationship_async(client_id: str, user_id: str, ttl
 
     if _redis_client:
         try:
-            await _redis_client.setex(f"client:owner:{client_id}", ttl, user_id)
+            user_clients_key = USER_CLIENTS_KEY.format(user_id=user_id)
+            async with _redis_client.pipeline(transaction=False) as pipe:
+                pipe.setex(f"client:owner:{client_id}", ttl, user_id)
+                pipe.sadd(user_clients_key, client_id)
+                pipe.expire(user_clients_key, ttl)
+                await pipe.execute()
             logger.debug(f"✅ Tracked client {client_id} → user {user_id} in Redis (TTL: {ttl}s)")
         except Exception as e:
             logger.warning(f"Failed to track client in Redis: {e}")
@@ -388,6 +740,25 @@ def client_belongs_to_user(client_id: str, user_id: str) -> bool:
     return mapped_user_id == user_id
 
 
+async def client_belongs_to_user_async(client_id: str, user_id: str) -> bool:
+    """
+    Check if a client belongs to a specific user (async Redis lookup, any process).
+
+    Args:
+        client_id: The client ID to check
+        user_id: The user ID to check ownership against
+
+    Returns:
+        True if the client belongs to the user, False otherwise
+    """
+    mapped_user_id = await get_client_owner_async(client_id)
+    if mapped_user_id is None:
+        logger.warning(f"Client {client_id} not found in user mapping")
+        return False
+
+    return mapped_user_id == user_id
+
+
 def get_user_clients_all(user_id: str) -> list[str]:
     """
     Get all client IDs (active and inactive) that belong to a specific user.
@@ -405,6 +776,67 @@ def get_user_clients_all(user_id: str) -> list[str]:
     ]
 
 
+async def get_user_clients_all_async(user_id: str) -> list[str]:
+    """
+    Get all client IDs (active and inactive) of a user, from every process (async).
+
+    Args:
+        user_id: The user ID to get clients for
+
+    Returns:
+        List of client IDs belonging to the user
+    """
+    if _redis_client:
+        try:
+            return sorted(await _redis_client.smembers(USER_CLIENTS_KEY.format(user_id=user_id)))
+        except Exception as e:
+            logger.warning(f"Redis lookup failed for clients of user {user_id}: {e}")
+
+    return get_user_clients_all(user_id)
+
+
+async def get_user_clients_active_async(user_id: str) -> list[str]:
+    """
+    Get active client IDs of a user, connected to any process (async).
+
+    Args:
+        user_id: The user ID to get clients for
+
+    Returns:
+        List of active client IDs belonging to the user
+    """
+    return list(await get_client_manager().get_registered_clients(user_id))
+
+
+async def publish_client_message(redis_client: redis.Redis, client_id: str, message: Dict[str, Any]) -> bool:
+    """
+    Route a JSON message to a device through the process that owns its connection.
+
+    Usable from any process with a Redis connection (e.g. RQ workers running plugins).
+
+    Args:
+        redis_client: Async Redis client (decode_responses=True)
+        client_id: Target client ID
+        message: Wyoming-style JSON event
+
+    Returns:
+        True if the owning process is subscribed and received the message
+    """
+    try:
+        owner = await redis_client.get(CLIENT_LEASE_KEY.format(client_id=client_id))
+        if not owner:
+            logger.debug(f"Client {client_id} is not connected, message not routed")
+            return False
+        receivers = await redis_client.publish(
+            CLIENT_CONTROL_CHANNEL.format(instance_id=owner),
+            json.dumps({"client_id": client_id, "message": message, "sent_at": time.time()}),
+        )
+        return receivers > 0
+    except Exception as e:
+        logger.warning(f"Failed to route message to client {client_id}: {e}")
+        return False
+
+
 def get_user_clients_active(user_id: str) -> list[str]:
     """
     Get active client IDs that belong to a specific user.
@@ -496,12 +928,13 @@ async def get_client_manager_dependency() -> ClientManager:
     return client_manager
 
 
-def generate_client_id(user: "User", device_name: Optional[str] = None) -> str:
+async def generate_client_id(user: "User", device_name: Optional[str] = None) -> str:
     """
     Generate a unique client_id in the format: user_id_suffix-device_suffix[-counter]
 
     This function checks both the database (user.registered_clients) and active
-    connections to ensure no conflicts with existing or currently connected clients.
+    connections on every process to ensure no conflicts with existing or
+    currently connected clients.
 
     Args:
         user: The User object
@@ -525,7 +958,8 @@ def generate_client_id(user: "User", device_name: Optional[str] = None) -> str:
         client_manager = get_client_manager()
         active_client_ids = set()
         if client_manager.is_initialized():
-            active_client_ids = set(client_manager.get_all_clients().keys())
+            active_client_ids = set(await client_manager.get_registered_clients())
+            active_client_ids |= set(client_manager.get_all_client_ids())
 
         # Combine both sets of existing IDs
         all_existing_ids = set(existing_client_ids) | active_client_ids
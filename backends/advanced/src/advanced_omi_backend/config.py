@@ -179,6 +179,43 @@ def get_audio_storage_settings() -> dict:
     return OmegaConf.to_container(cfg, resolve=True)
 
 
+def get_audio_stream_settings() -> dict:
+    """
+    Get audio stream transport settings using OmegaConf.
+
+    Returns:
+        Dict with transport, segment_path, segment_retention_seconds,
+        segment_max_file_bytes
+    """
+    cfg = get_backend_config('audio_stream')
+    settings = OmegaConf.to_container(cfg, resolve=True) if cfg else {}
+    return {
+        'transport': settings.get('transport', 'redis'),
+        'segment_path': settings.get('segment_path', str(DATA_DIR / 'audio_segments')),
+        'segment_retention_seconds': int(settings.get('segment_retention_seconds', 7200)),
+        'segment_max_file_bytes': int(settings.get('segment_max_file_bytes', 64 * 1024 * 1024)),
+    }
+
+
+# ============================================================================
+# RQ Worker Settings (OmegaConf-based)
+# ============================================================================
+
+def get_rq_worker_settings() -> dict:
+    """
+    Get RQ worker process settings using OmegaConf.
+
+    Returns:
+        Dict with mode ('fork' or 'async') and max_concurrent_jobs
+    """
+    cfg = get_backend_config('rq_worker')
+    settings = OmegaConf.to_container(cfg, resolve=True) if cfg else {}
+    return {
+        'mode': settings.get('mode', 'fork'),
+        'max_concurrent_jobs': max(1, int(settings.get('max_concurrent_jobs', 4))),
+    }
+
+
 # ============================================================================
 # Transcription Job Timeout (OmegaConf-based)
 # ============================================================================
@@ -4,13 +4,16 @@ Audio file upload and processing controller.
 Handles audio file uploads and processes them directly.
 Simplified to write files immediately and enqueue transcription.
 
-Also includes audio cropping operations that work with the Conversation model.
+Also includes audio cropping operations that work with the Conversation model,
+and resumable backfill uploads of audio recorded offline on a wearable.
 """
 
+import hashlib
 import logging
 import os
 import time
 import uuid
+from datetime import datetime, timedelta
 
 from advanced_omi_backend.config import get_transcription_job_timeout
 from advanced_omi_backend.controllers.queue_controller import (
@@ -18,7 +21,8 @@ from advanced_omi_backend.controllers.queue_controller import (
     start_post_conversation_jobs,
     transcription_queue,
 )
-from advanced_omi_backend.models.conversation import create_conversation
+from advanced_omi_backend.models.audio_chunk import AudioChunkDocument
+from advanced_omi_backend.models.conversation import Conversation, create_conversation
 from advanced_omi_backend.models.user import User
 from advanced_omi_backend.services.transcription import is_transcription_available
 from advanced_omi_backend.utils.audio_chunk_utils import convert_audio_to_chunks
@@ -29,11 +33,14 @@ from advanced_omi_backend.utils.audio_utils import (
     convert_any_to_wav,
     validate_and_prepare_audio,
 )
+from advanced_omi_backend.utils.ogg_opus import parse_ogg_opus
 from advanced_omi_backend.workers.transcription_jobs import (
     transcribe_full_audio_job,
 )
+from bson import Binary, ObjectId
 from fastapi import UploadFile
 from fastapi.responses import JSONResponse
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 
 logger = logging.getLogger(__name__)
 audio_logger = logging.getLogger("audio_processing")
@@ -46,6 +53,60 @@ def generate_client_id(user: User, device_name: str) -> str:
     return f"{user_id_suffix}-{device_name}"
 
 
+def enqueue_conversation_processing(
+    conversation_id: str,
+    user: User,
+    client_id: str,
+    description: str,
+) -> tuple:
+    """
+    Enqueue batch transcription and the post-conversation job chain for stored audio.
+
+    Args:
+        conversation_id: Conversation whose audio chunks are already stored
+        user: Owner of the conversation
+        client_id: Client ID for UI tracking
+        description: What the audio is, for job descriptions and logs
+
+    Returns:
+        Tuple of (transcription job or None, post-conversation job IDs)
+    """
+    # Enqueue batch transcription job first (file uploads need transcription)
+    version_id = str(uuid.uuid4())
+    transcribe_job_id = f"transcribe_{conversation_id[:12]}"
+
+    # Check if transcription provider is available before enqueueing
+    transcription_job = None
+    if is_transcription_available(mode="batch"):
+        transcription_job = transcription_queue.enqueue(
+            transcribe_full_audio_job,
+            conversation_id,
+            version_id,
+            "batch",  # trigger
+            job_timeout=get_transcription_job_timeout(),
+            result_ttl=JOB_RESULT_TTL,
+            job_id=transcribe_job_id,
+            description=f"Transcribe {description} {conversation_id[:8]}",
+            meta={'conversation_id': conversation_id, 'client_id': client_id}
+        )
+        audio_logger.info(f"📥 Enqueued transcription job {transcription_job.id} for {description}")
+    else:
+        audio_logger.warning(
+            f"⚠️ Skipping transcription for conversation {conversation_id}: "
+            "No transcription provider configured"
+        )
+
+    # Enqueue post-conversation processing job chain (depends on transcription)
+    job_ids = start_post_conversation_jobs(
+        conversation_id=conversation_id,
+        user_id=user.user_id,
+        transcript_version_id=version_id,  # Pass the version_id from transcription job
+        depends_on_job=transcription_job,  # Wait for transcription to complete (or None)
+        client_id=client_id  # Pass client_id for UI tracking
+    )
+    return transcription_job, job_ids
+
+
 async def upload_and_process_audio_files(
     user: User,
     files: list[UploadFile],
@@ -192,38 +253,8 @@ async def upload_and_process_audio_files(
                     await conversation.delete()
                     continue
 
-                # Enqueue batch transcription job first (file uploads need transcription)
-                version_id = str(uuid.uuid4())
-                transcribe_job_id = f"transcribe_{conversation_id[:12]}"
-
-                # Check if transcription provider is available before enqueueing
-                transcription_job = None
-                if is_transcription_available(mode="batch"):
-                    transcription_job = transcription_queue.enqueue(
-                        transcribe_full_audio_job,
-                        conversation_id,
-                        version_id,
-                        "batch",  # trigger
-                        job_timeout=get_transcription_job_timeout(),
-                        result_ttl=JOB_RESULT_TTL,
-                        job_id=transcribe_job_id,
-                        description=f"Transcribe uploaded file {conversation_id[:8]}",
-                        meta={'conversation_id': conversation_id, 'client_id': client_id}
-                    )
-                    audio_logger.info(f"📥 Enqueued transcription job {transcription_job.id} for uploaded file")
-                else:
-                    audio_logger.warning(
-                        f"⚠️ Skipping transcription for conversation {conversation_id}: "
-                        "No transcription provider configured"
-                    )
-
-                # Enqueue post-conversation processing job chain (depends on transcription)
-                job_ids = start_post_conversation_jobs(
-                    conversation_id=conversation_id,
-                    user_id=user.user_id,
-                    transcript_version_id=version_id,  # Pass the version_id from transcription job
-                    depends_on_job=transcription_job,  # Wait for transcription to complete (or None)
-                    client_id=client_id  # Pass client_id for UI tracking
+                transcription_job, job_ids = enqueue_conversation_processing(
+                    conversation_id, user, client_id, description="uploaded file"
                 )
 
                 file_result = {
@@ -309,3 +340,308 @@ async def upload_and_process_audio_files(
         return JSONResponse(
             status_code=500, content={"error": f"File upload failed: {str(e)}"}
         )
+
+
+# ---------------------------------------------------------------------------
+# Offline backfill (resumable upload of audio recorded on the device)
+# ---------------------------------------------------------------------------
+
+BACKFILL_SOURCE_TYPE = "backfill"
+# Same limit as convert_audio_to_chunks (720 chunks @ 10s each)
+BACKFILL_MAX_DURATION_SECONDS = 7200
+# Parts are stored as single chunks; keep them close to the usual 10s
+BACKFILL_MAX_PART_SECONDS = 30.0
+
+
+async def _get_backfill_conversation(user: User, conversation_id: str):
+    """Return the user's backfill conversation, or None."""
+    conversation = await Conversation.find_one(
+        Conversation.conversation_id == conversation_id
+    )
+    if (
+        conversation is None
+        or conversation.external_source_type != BACKFILL_SOURCE_TYPE
+        or conversation.user_id != user.user_id
+    ):
+        return None
+    return conversation
+
+
+async def _find_backfill_upload(user: User, upload_id: str):
+    return await Conversation.find_one(
+        Conversation.external_source_id == upload_id,
+        Conversation.external_source_type == BACKFILL_SOURCE_TYPE,
+        Conversation.user_id == user.user_id,
+    )
+
+
+def _backfill_chunk_id(conversation_id: str, part: int) -> ObjectId:
+    """Deterministic ``_id`` of a backfill part.
+
+    The ``(conversation_id, chunk_index)`` index is not unique (streaming
+    writers don't need it to be), so a part stored by two concurrent requests
+    is rejected by the ``_id`` index instead.
+    """
+    digest = hashlib.sha256(f"backfill:{conversation_id}:{part}".encode()).digest()
+    return ObjectId(digest[:12])
+
+
+async def _stored_part_state(conversation_id: str) -> tuple:
+    """Return (next part index, end time in seconds) of the chunks stored so far."""
+    last = await AudioChunkDocument.find(
+        AudioChunkDocument.conversation_id == conversation_id
+    ).sort("-chunk_index").first_or_none()
+    if last is None:
+        return 0, 0.0
+    return last.chunk_index + 1, last.end_time
+
+
+async def _backfill_status(conversation) -> dict:
+    next_part, duration = await _stored_part_state(conversation.conversation_id)
+    return {
+        "conversation_id": conversation.conversation_id,
+        "upload_id": conversation.external_source_id,
+        "recorded_at": conversation.created_at.isoformat(),
+        "next_part": next_part,
+        "duration_seconds": round(duration, 3),
+        "completed": conversation.completed_at is not None,
+    }
+
+
+async def start_backfill_upload(
+    user: User,
+    upload_id: str,
+    recorded_at: float,
+    device_name: str = "wearable",
+    title: str | None = None,
+) -> dict:
+    """
+    Create (or resume) the conversation for one offline recording.
+
+    The conversation is keyed by the client's ``upload_id``, so calling this
+    again after an interrupted transfer returns the same conversation and the
+    index of the first part the backend does not have yet.
+
+    Args:
+        user: Authenticated user
+        upload_id: Client-chosen stable identifier for this recording
+        recorded_at: Capture time of the first sample (Unix seconds)
+        device_name: Device identifier
+        title: Optional title (replaced once the transcript is summarized)
+    """
+    conversation = await _find_backfill_upload(user, upload_id)
+    if conversation is None:
+        created_at = datetime.utcfromtimestamp(recorded_at)
+        conversation = create_conversation(
+            user_id=user.user_id,
+            client_id=generate_client_id(user, device_name),
+            title=title or f"Offline recording {created_at:%Y-%m-%d %H:%M}",
+            summary="Receiving offline recording...",
+            external_source_id=upload_id,
+            external_source_type=BACKFILL_SOURCE_TYPE,
+        )
+        # Place the conversation at capture time, not upload time
+        conversation.created_at = created_at
+        try:
+            await conversation.insert()
+            audio_logger.info(
+                f"📝 Created backfill conversation {conversation.conversation_id} "
+                f"for {upload_id} (recorded {created_at.isoformat()})"
+            )
+        except DuplicateKeyError:
+            # A concurrent request for the same upload created it first
+            conversation = await _find_backfill_upload(user, upload_id)
+
+    return await _backfill_status(conversation)
+
+
+async def get_backfill_upload(user: User, conversation_id: str):
+    """Return the progress of a backfill upload."""
+    conversation = await _get_backfill_conversation(user, conversation_id)
+    if conversation is None:
+        return JSONResponse(status_code=404, content={"error": "Backfill upload not found"})
+    return await _backfill_status(conversation)
+
+
+async def upload_backfill_parts(
+    user: User,
+    conversation_id: str,
+    first_part: int,
+    files: list[UploadFile],
+):
+    """
+    Store consecutive Ogg/Opus parts of a backfill upload as audio chunks.
+
+    Parts are stored without re-encoding, one chunk per part. Parts the
+    backend already has (from an earlier, interrupted request) are skipped,
+    so a client can always resend from its last confirmed position.
+
+    Args:
+        user: Authenticated user
+        conversation_id: Conversation returned by start_backfill_upload
+        first_part: Part index of the first file
+        files: Ogg/Opus files, in order
+    """
+    conversation = await _get_backfill_conversation(user, conversation_id)
+    if conversation is None:
+        return JSONResponse(status_code=404, content={"error": "Backfill upload not found"})
+    if conversation.completed_at is not None:
+        return JSONResponse(
+            status_code=409, content={"error": "Backfill upload already completed"}
+        )
+
+    next_part, end_time = await _stored_part_state(conversation_id)
+    if first_part > next_part:
+        return JSONResponse(
+            status_code=409,
+            content={"error": f"Missing parts before {first_part}", "next_part": next_part},
+        )
+
+    chunks = []
+    for index, file in enumerate(files, start=first_part):
+        if index < next_part:
+            continue  # stored by an earlier attempt
+
+        data = await file.read()
+        try:
+            info = parse_ogg_opus(data)
+        except AudioValidationError as e:
+            return JSONResponse(
+                status_code=400,
+                content={"error": f"Part {index}: {e}", "next_part": next_part},
+            )
+        if info.duration > BACKFILL_MAX_PART_SECONDS:
+            return JSONResponse(
+                status_code=400,
+                content={
+                    "error": f"Part {index} is {info.duration:.1f}s long "
+                    f"(max {BACKFILL_MAX_PART_SECONDS:.0f}s)",
+                    "next_part": next_part,
+                },
+            )
+        if end_time + info.duration > BACKFILL_MAX_DURATION_SECONDS:
+            return JSONResponse(
+                status_code=400,
+                content={
+                    "error": f"Recording exceeds {BACKFILL_MAX_DURATION_SECONDS}s; "
+                    "start a new upload for the rest",
+                    "next_part": next_part,
+                },
+            )
+
+        pcm_size = int(info.duration * info.sample_rate) * 2 * info.channels
+        chunks.append(
+            AudioChunkDocument(
+                id=_backfill_chunk_id(conversation_id, index),
+                conversation_id=conversation_id,
+                chunk_index=index,
+                audio_data=Binary(data),
+                original_size=pcm_size,
+                compressed_size=len(data),
+                start_time=end_time,
+                end_time=end_time + info.duration,
+                duration=info.duration,
+                sample_rate=info.sample_rate,
+                channels=info.channels,
+            )
+        )
+        end_time += info.duration
+        next_part = index + 1
+
+    stored = len(chunks)
+    if chunks:
+        try:
+            await AudioChunkDocument.insert_many(chunks, ordered=False)
+        except BulkWriteError as e:
+            # Parts a concurrent request stored first are skipped like resent ones
+            errors = e.details.get("writeErrors", [])
+            if any(error.get("code") != 11000 for error in errors):
+                raise
+            stored -= len(errors)
+
+        next_part, end_time = await _update_backfill_audio_metadata(conversation_id)
+        audio_logger.info(
+            f"📦 Stored {stored} backfill part(s) for conversation "
+            f"{conversation_id[:12]} ({end_time:.1f}s total)"
+        )
+
+    return {
+        "conversation_id": conversation_id,
+        "stored": stored,
+        "next_part": next_part,
+        "duration_seconds": round(end_time, 3),
+    }
+
+
+async def _update_backfill_audio_metadata(conversation_id: str) -> tuple:
+    """Recompute the conversation's chunk count, duration and compression ratio
+    from its stored chunks; return (next part index, end time in seconds).
+
+    Summing the stored sizes keeps the ratio consistent whatever each part's
+    sample rate, and concurrent requests converge on the same values.
+    """
+    totals = await AudioChunkDocument.find(
+        AudioChunkDocument.conversation_id == conversation_id
+    ).aggregate(
+        [
+            {
+                "$group": {
+                    "_id": None,
+                    "last_index": {"$max": "$chunk_index"},
+                    "end_time": {"$max": "$end_time"},
+                    "original_size": {"$sum": "$original_size"},
+                    "compressed_size": {"$sum": "$compressed_size"},
+                }
+            }
+        ]
+    ).to_list()
+    if not totals:
+        return 0, 0.0
+    totals = totals[0]
+    next_part = totals["last_index"] + 1
+    await Conversation.set_fields(
+        conversation_id,
+        audio_chunks_count=next_part,
+        audio_total_duration=totals["end_time"],
+        audio_compression_ratio=(
+            totals["compressed_size"] / totals["original_size"] if totals["original_size"] else 0.0
+        ),
+    )
+    return next_part, totals["end_time"]
+
+
+async def complete_backfill_upload(user: User, conversation_id: str):
+    """
+    Finish a backfill upload and start transcription and post-processing.
+
+    Completing twice is a no-op, so a client that lost the first response
+    can safely retry.
+    """
+    conversation = await _get_backfill_conversation(user, conversation_id)
+    if conversation is None:
+        return JSONResponse(status_code=404, content={"error": "Backfill upload not found"})
+    if conversation.completed_at is not None:
+        return await _backfill_status(conversation)
+
+    next_part, duration = await _stored_part_state(conversation_id)
+    if next_part == 0:
+        return JSONResponse(status_code=400, content={"error": "No audio parts uploaded"})
+
+    transcription_job, job_ids = enqueue_conversation_processing(
+        conversation_id, user, conversation.client_id, description="offline recording"
+    )
+
+    conversation.completed_at = conversation.created_at + timedelta(seconds=duration)
+    await conversation.save()
+    audio_logger.info(
+        f"✅ Backfill upload {conversation.external_source_id} complete → conversation "
+        f"{conversation_id}, {next_part} part(s), {duration:.1f}s"
+    )
+
+    status = await _backfill_status(conversation)
+    status.update(
+        transcript_job_id=transcription_job.id if transcription_job else None,
+        speaker_job_id=job_ids["speaker_recognition"],
+        memory_job_id=job_ids["memory"],
+    )
+    return status
@@ -6,10 +6,7 @@ import logging
 
 from fastapi.responses import JSONResponse
 
-from advanced_omi_backend.client_manager import (
-    ClientManager,
-    get_user_clients_active,
-)
+from advanced_omi_backend.client_manager import ClientManager
 from advanced_omi_backend.users import User
 
 logger = logging.getLogger(__name__)
@@ -26,19 +23,14 @@ async def get_active_clients(user: User, client_manager: ClientManager):
 
         if user.is_superuser:
             # Admin: return all active clients
+            all_clients = await client_manager.get_client_info_summary()
             return {
-                "active_clients": client_manager.get_client_info_summary(),
-                "total_count": client_manager.get_client_count(),
+                "active_clients": all_clients,
+                "total_count": len(all_clients),
             }
         else:
             # Regular user: return only their own clients
-            user_active_clients = get_user_clients_active(user.user_id)
-            all_clients = client_manager.get_client_info_summary()
-
-            # Filter to only the user's clients
-            user_clients = [
-                client for client in all_clients if client["client_id"] in user_active_clients
-            ]
+            user_clients = await client_manager.get_client_info_summary(user.user_id)
 
             return {
                 "active_clients": user_clients,
@@ -2,19 +2,23 @@
 Conversation controller for handling conversation-related business logic.
 """
 
+import base64
+import binascii
 import logging
 import os
 import time
 import uuid
 from datetime import datetime
 from pathlib import Path
+from typing import Any, Optional
 
 import redis.asyncio as aioredis
+from bson import json_util
 from fastapi.responses import JSONResponse
 from pymongo.errors import OperationFailure
 
 from advanced_omi_backend.client_manager import (
-    client_belongs_to_user,
+    client_belongs_to_user_async,
     get_client_manager,
 )
 from advanced_omi_backend.config import get_transcription_job_timeout
@@ -31,6 +35,12 @@ from advanced_omi_backend.controllers.session_controller import (
 )
 from advanced_omi_backend.models.audio_chunk import AudioChunkDocument
 from advanced_omi_backend.models.conversation import Conversation
+from advanced_omi_backend.models.conversation_counts import (
+    ACTIVE_VARIANT,
+    ALL_USERS,
+    cached_conversation_total,
+)
+from advanced_omi_backend.models.conversation_views import ConversationContextView
 from advanced_omi_backend.models.job import JobPriority
 from advanced_omi_backend.plugins.events import ConversationCloseReason, PluginEvent
 from advanced_omi_backend.services.memory import get_memory_service
@@ -46,13 +56,19 @@ logger = logging.getLogger(__name__)
 audio_logger = logging.getLogger("audio_processing")
 
 
-async def _get_conversation_or_error(conversation_id: str, user: User):
+async def _get_conversation_or_error(
+    conversation_id: str, user: User, projection_model=None
+):
     """Fetch a conversation and validate user access.
 
+    Pass a view from ``conversation_views`` as ``projection_model`` when the
+    caller only needs a few fields.
+
     Returns (conversation, None) on success, or (None, error_response) on failure.
     """
     conversation = await Conversation.find_one(
-        Conversation.conversation_id == conversation_id
+        Conversation.conversation_id == conversation_id,
+        projection_model=projection_model,
     )
     if not conversation:
         return None, JSONResponse(
@@ -72,7 +88,9 @@ async def close_current_conversation(client_id: str, user: User):
     and trigger post-processing. The session stays active for new conversations.
     """
     # Validate client ownership
-    if not user.is_superuser and not client_belongs_to_user(client_id, user.user_id):
+    if not user.is_superuser and not await client_belongs_to_user_async(
+        client_id, user.user_id
+    ):
         logger.warning(
             f"User {user.user_id} attempted to close conversation for client {client_id} without permission"
         )
@@ -84,15 +102,15 @@ async def close_current_conversation(client_id: str, user: User):
             status_code=403,
         )
 
-    client_manager = get_client_manager()
-    client_state = client_manager.get_client(client_id)
-    if client_state is None or not client_state.connected:
+    # The device may be connected to another API process
+    client_info = await get_client_manager().get_registered_client(client_id)
+    if client_info is None:
         return JSONResponse(
             content={"error": f"Client '{client_id}' not found or not connected"},
             status_code=404,
         )
 
-    session_id = getattr(client_state, "stream_session_id", None)
+    session_id = client_info.get("stream_session_id")
     if not session_id:
         return JSONResponse(
             content={"error": "No active session"},
@@ -135,6 +153,11 @@ async def get_conversation(conversation_id: str, user: User):
         if error:
             return error
 
+        if conversation.active_transcript_version:
+            await conversation.load_transcript_versions(
+                [conversation.active_transcript_version]
+            )
+
         # Build response with explicit curated fields
         response = {
             "conversation_id": conversation.conversation_id,
@@ -354,6 +377,40 @@ _LIST_PROJECTION = {
 ALLOWED_SORT_FIELDS = {"created_at", "title", "audio_total_duration"}
 
 
+def _encode_cursor(values: dict) -> str:
+    """Opaque page cursor: base64url of the extended-JSON keyset values."""
+    return base64.urlsafe_b64encode(json_util.dumps(values).encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> dict:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json_util.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, ValueError, UnicodeDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+    if not isinstance(values, dict) or "id" not in values:
+        raise ValueError("Invalid cursor")
+    return values
+
+
+def _keyset_filter(field: str, direction: int, value: Any, conversation_id: str) -> dict:
+    """Match documents after ``(value, conversation_id)`` in ``(field, conversation_id)`` order.
+
+    Missing/null values sort before everything in MongoDB, i.e. first when
+    ascending and last when descending.
+    """
+    op = "$gt" if direction == 1 else "$lt"
+    conditions = [{field: value, "conversation_id": {op: conversation_id}}]
+    if value is None:
+        if direction == 1:
+            conditions.append({field: {"$ne": None}})
+    else:
+        conditions.append({field: {op: value}})
+        if direction == -1:
+            conditions.append({field: None})
+    return {"$or": conditions}
+
+
 async def get_conversations(
     user: User,
     include_deleted: bool = False,
@@ -363,12 +420,17 @@ async def get_conversations(
     offset: int = 0,
     sort_by: str = "created_at",
     sort_order: str = "desc",
+    cursor: Optional[str] = None,
 ):
     """Get conversations with speech only (speech-driven architecture).
 
     Uses a single consolidated query with ``$or`` when ``include_unprocessed``
     is True, eliminating multiple round-trips and Python-side merge/sort.
-    Results are paginated with ``limit``/``offset``.
+
+    Results are ordered by ``(sort_by, conversation_id)``. Pass the returned
+    ``next_cursor`` back as ``cursor`` to fetch the next page with an indexed
+    range query; ``limit``/``offset`` paging is still accepted. ``total`` comes
+    from the cached per-user counts (see ``models.conversation_counts``).
     """
     try:
         user_filter = {} if user.is_superuser else {"user_id": str(user.user_id)}
@@ -422,13 +484,60 @@ async def get_conversations(
             sort_by = "created_at"
         sort_direction = 1 if sort_order == "asc" else -1
 
+        page_query = query
+        if cursor:
+            try:
+                after = _decode_cursor(cursor)
+            except ValueError:
+                return JSONResponse(status_code=400, content={"error": "Invalid cursor"})
+            if after.get("sort") != [sort_by, sort_direction]:
+                return JSONResponse(
+                    status_code=400,
+                    content={"error": "Cursor does not match sort_by/sort_order"},
+                )
+            page_query = {
+                "$and": [
+                    query,
+                    _keyset_filter(sort_by, sort_direction, after.get("value"), after["id"]),
+                ]
+            }
+            offset = 0
+
         collection = Conversation.get_pymongo_collection()
 
-        total = await collection.count_documents(query)
+        variant = "+".join(
+            flag
+            for flag, enabled in (
+                ("deleted", include_deleted),
+                ("unprocessed", include_unprocessed),
+                ("starred", starred_only),
+            )
+            if enabled
+        ) or ACTIVE_VARIANT
+        total = await cached_conversation_total(
+            collection,
+            query,
+            scope=ALL_USERS if user.is_superuser else str(user.user_id),
+            variant=variant,
+        )
 
-        cursor = collection.find(query, _LIST_PROJECTION)
-        cursor = cursor.sort(sort_by, sort_direction).skip(offset).limit(limit)
-        raw_docs = await cursor.to_list(length=limit)
+        find_cursor = collection.find(page_query, _LIST_PROJECTION)
+        find_cursor = find_cursor.sort(
+            [(sort_by, sort_direction), ("conversation_id", sort_direction)]
+        ).skip(offset).limit(limit + 1)
+        raw_docs = await find_cursor.to_list(length=limit + 1)
+
+        next_cursor = None
+        if len(raw_docs) > limit:
+            raw_docs = raw_docs[:limit]
+            last = raw_docs[-1]
+            next_cursor = _encode_cursor(
+                {
+                    "sort": [sort_by, sort_direction],
+                    "value": last.get(sort_by),
+                    "id": last["conversation_id"],
+                }
+            )
 
         # Mark orphans in results (lightweight in-memory check on the page)
         orphan_ids: set = set()
@@ -466,6 +575,7 @@ async def get_conversations(
             "total": total,
             "limit": limit,
             "offset": offset,
+            "next_cursor": next_cursor,
         }
 
     except Exception as e:
@@ -480,8 +590,14 @@ async def search_conversations(
     user: User,
     limit: int = 50,
     offset: int = 0,
+    cursor: Optional[str] = None,
 ):
-    """Full-text search across conversation titles, summaries, and transcripts."""
+    """Full-text search across conversation titles, summaries, and transcripts.
+
+    Results are ordered by ``(score, conversation_id)`` and paginate with
+    ``next_cursor`` like ``get_conversations``. The total is counted on the
+    first page only; cursor pages return ``total: None``.
+    """
     try:
         collection = Conversation.get_pymongo_collection()
 
@@ -489,20 +605,33 @@ async def search_conversations(
         if not user.is_superuser:
             match_filter["user_id"] = str(user.user_id)
 
+        after = None
+        if cursor:
+            try:
+                after = _decode_cursor(cursor)
+            except ValueError:
+                return JSONResponse(status_code=400, content={"error": "Invalid cursor"})
+            offset = 0
+
+        results_stages = []
+        if after is not None:
+            results_stages.append(
+                {"$match": _keyset_filter("score", -1, after.get("value"), after["id"])}
+            )
+        results_stages += [
+            {"$skip": offset},
+            {"$limit": limit + 1},
+            {"$project": {**_LIST_PROJECTION, "score": 1}},
+        ]
+        facet = {"results": results_stages}
+        if after is None:
+            facet["count"] = [{"$count": "total"}]
+
         pipeline = [
             {"$match": match_filter},
             {"$addFields": {"score": {"$meta": "textScore"}}},
-            {"$sort": {"score": -1}},
-            {
-                "$facet": {
-                    "results": [
-                        {"$skip": offset},
-                        {"$limit": limit},
-                        {"$project": {**_LIST_PROJECTION, "score": 1}},
-                    ],
-                    "count": [{"$count": "total"}],
-                }
-            },
+            {"$sort": {"score": -1, "conversation_id": -1}},
+            {"$facet": facet},
         ]
 
         try:
@@ -519,6 +648,7 @@ async def search_conversations(
                     "total": 0,
                     "limit": limit,
                     "offset": offset,
+                    "next_cursor": None,
                     "query": query,
                     "error": "Text search index not available. Try restarting the backend.",
                 }
@@ -527,8 +657,19 @@ async def search_conversations(
         facet = facet_result[0] if facet_result else {"results": [], "count": []}
 
         raw_docs = facet.get("results", [])
-        count_list = facet.get("count", [])
-        total = count_list[0]["total"] if count_list else 0
+        if after is None:
+            count_list = facet.get("count", [])
+            total = count_list[0]["total"] if count_list else 0
+        else:
+            total = None
+
+        next_cursor = None
+        if len(raw_docs) > limit:
+            raw_docs = raw_docs[:limit]
+            last = raw_docs[-1]
+            next_cursor = _encode_cursor(
+                {"sort": ["score", -1], "value": last.get("score"), "id": last["conversation_id"]}
+            )
 
         conversations = []
         for doc in raw_docs:
@@ -543,6 +684,7 @@ async def search_conversations(
             "total": total,
             "limit": limit,
             "offset": offset,
+            "next_cursor": next_cursor,
             "query": query,
         }
 
@@ -772,6 +914,7 @@ def _enqueue_transcript_reprocessing(
     source: str,
     job_id_prefix: str,
     end_reason: str,
+    force_summary: bool = False,
 ) -> tuple:
     """Enqueue transcribe job + post-conversation chain.
 
@@ -801,6 +944,7 @@ def _enqueue_transcript_reprocessing(
         transcript_version_id=version_id,
         depends_on_job=transcript_job,
         end_reason=end_reason,
+        force_summary=force_summary,
     )
 
     return version_id, transcript_job, post_jobs
@@ -849,6 +993,7 @@ def _enqueue_speaker_reprocessing_chain(
     conversation_id: str,
     version_id: str,
     source_version_id: str,
+    force_summary: bool = False,
 ) -> dict:
     """Enqueue speaker -> memory -> title_summary chain.
 
@@ -890,6 +1035,7 @@ def _enqueue_speaker_reprocessing_chain(
     title_summary_job = default_queue.enqueue(
         generate_title_summary_job,
         conversation_id,
+        force=force_summary,
         job_timeout=300,
         result_ttl=JOB_RESULT_TTL,
         depends_on=memory_job,
@@ -995,6 +1141,7 @@ async def reprocess_orphan(conversation_id: str, user: User):
         conversation.title = "Reprocessing..."
         conversation.summary = None
         conversation.detailed_summary = None
+        conversation.summary_input_hash = None
         await conversation.save()
 
         # Enqueue the same job chain as reprocess_transcript
@@ -1028,22 +1175,23 @@ async def reprocess_orphan(conversation_id: str, user: User):
         )
 
 
-async def reprocess_transcript(conversation_id: str, user: User):
+async def reprocess_transcript(
+    conversation_id: str, user: User, regenerate_summary: bool = False
+):
     """Reprocess transcript for a conversation. Users can only reprocess their own conversations."""
     try:
-        conversation_model, error = await _get_conversation_or_error(
-            conversation_id, user
+        _, error = await _get_conversation_or_error(
+            conversation_id, user, projection_model=ConversationContextView
         )
         if error:
             return error
 
-        # Get audio_uuid from conversation
-        # Validate audio chunks exist in MongoDB
-        chunks = await AudioChunkDocument.find(
+        # Validate audio chunks exist in MongoDB (existence only, no audio bytes)
+        has_chunks = await AudioChunkDocument.find(
             AudioChunkDocument.conversation_id == conversation_id
-        ).to_list()
+        ).limit(1).count()
 
-        if not chunks:
+        if not has_chunks:
             return JSONResponse(
                 status_code=404,
                 content={
@@ -1059,6 +1207,7 @@ async def reprocess_transcript(conversation_id: str, user: User):
             source="reprocess",
             job_id_prefix="reprocess",
             end_reason="reprocess_transcript",
+            force_summary=regenerate_summary,
         )
 
         logger.info(
@@ -1132,7 +1281,10 @@ async def reprocess_memory(
 
 
 async def reprocess_speakers(
-    conversation_id: str, transcript_version_id: str, user: User
+    conversation_id: str,
+    transcript_version_id: str,
+    user: User,
+    regenerate_summary: bool = False,
 ):
     """
     Reprocess speaker identification for a specific transcript version.
@@ -1154,6 +1306,7 @@ async def reprocess_speakers(
         )
         if error:
             return error
+        await conversation_model.load_transcript_versions([source_version_id])
 
         # 4. Validate transcript has content and words (or provider-diarized segments)
         if not source_version.transcript:
@@ -1248,6 +1401,7 @@ async def reprocess_speakers(
             conversation_id,
             new_version_id,
             source_version_id,
+            force_summary=regenerate_summary,
         )
 
         # 9. Return job information
@@ -1357,6 +1511,10 @@ async def get_conversation_version_history(conversation_id: str, user: User):
         if error:
             return error
 
+        # Version content lives outside the conversation document; words are
+        # not part of the history view
+        await conversation_model.load_transcript_versions(words=False)
+
         # Get version history from model
         # Convert datetime objects to ISO strings for JSON serialization
         transcript_versions = []
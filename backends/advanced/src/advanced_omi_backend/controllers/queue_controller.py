@@ -481,6 +481,7 @@ def start_post_conversation_jobs(
     depends_on_job=None,
     client_id: Optional[str] = None,
     end_reason: str = "file_upload",
+    force_summary: bool = False,
 ) -> Dict[str, str]:
     """
     Start post-conversation processing jobs after conversation is created.
@@ -501,6 +502,7 @@ def start_post_conversation_jobs(
         depends_on_job: Optional job dependency for first job (e.g., transcription for file uploads)
         client_id: Client ID for UI tracking
         end_reason: Reason conversation ended (e.g., 'file_upload', 'websocket_disconnect', 'user_stopped')
+        force_summary: Regenerate the title/summary even if its input is unchanged
 
     Returns:
         Dict with job IDs for speaker_recognition, memory, title_summary, event_dispatch
@@ -616,6 +618,7 @@ def start_post_conversation_jobs(
     title_summary_job = default_queue.enqueue(
         generate_title_summary_job,
         conversation_id,
+        force=force_summary,
         job_timeout=300,  # 5 minutes
         result_ttl=JOB_RESULT_TTL,
         depends_on=title_dependency,
@@ -838,6 +838,23 @@ async def delete_all_user_memories(user: User):
         raise e
 
 
+# Prompt Cache Functions
+
+
+async def invalidate_prompt_cache(prompt_id: Optional[str] = None):
+    """Drop cached LangFuse prompts after they were edited (all if prompt_id is None)."""
+    from advanced_omi_backend.prompt_registry import get_prompt_registry
+
+    registry = get_prompt_registry()
+    removed = registry.invalidate(prompt_id)
+    return {
+        "success": True,
+        "prompt_id": prompt_id,
+        "invalidated": removed,
+        "cache": registry.cache.stats(),
+    }
+
+
 # Memory Provider Configuration Functions
 
 
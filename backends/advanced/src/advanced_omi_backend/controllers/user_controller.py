@@ -17,6 +17,8 @@ from advanced_omi_backend.auth import (
 from advanced_omi_backend.client_manager import get_user_clients_all
 from advanced_omi_backend.database import db, users_col
 from advanced_omi_backend.models.conversation import Conversation
+from advanced_omi_backend.models.conversation_counts import invalidate_conversation_totals
+from advanced_omi_backend.models.transcript_version import delete_transcript_versions
 from advanced_omi_backend.services.memory import get_memory_service
 from advanced_omi_backend.users import User, UserCreate, UserUpdate
 
@@ -177,6 +179,10 @@ async def delete_user(
         if delete_conversations:
             # Delete all conversations for this user
             conversations_result = await Conversation.find(Conversation.user_id == user_id).delete()
+            await delete_transcript_versions(user_id=user_id)
+            await invalidate_conversation_totals(
+                Conversation.get_pymongo_collection(), user_id
+            )
             deleted_data["conversations_deleted"] = conversations_result.deleted_count
 
         if delete_memories:
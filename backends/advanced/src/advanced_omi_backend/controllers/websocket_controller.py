@@ -31,6 +31,11 @@ from advanced_omi_backend.services.audio_stream import AudioStreamProducer
 from advanced_omi_backend.services.audio_stream.producer import (
     get_audio_stream_producer,
 )
+from advanced_omi_backend.utils.wyoming_framing import (
+    FRAMING_BINARY,
+    FRAMING_WYOMING,
+    decode_audio_frame,
+)
 
 # Thread pool executors for audio decoding
 _DEC_IO_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
@@ -144,9 +149,15 @@ async def subscribe_to_interim_results(websocket: WebSocket, session_id: str) ->
             )
 
 
-async def parse_wyoming_protocol(ws: WebSocket) -> tuple[dict, Optional[bytes]]:
+async def parse_wyoming_protocol(
+    ws: WebSocket, framing: str = FRAMING_WYOMING
+) -> tuple[dict, Optional[bytes]]:
     """Parse Wyoming protocol: JSON header line followed by optional binary payload.
 
+    With ``framing="binary"`` an audio chunk may instead arrive as a single
+    binary message (see ``utils.wyoming_framing``); control events are JSON
+    text in both modes.
+
     Returns:
         Tuple of (header_dict, payload_bytes or None)
     """
@@ -190,8 +201,10 @@ async def parse_wyoming_protocol(ws: WebSocket) -> tuple[dict, Optional[bytes]]:
 
         return header, payload
 
-    # Handle binary message (invalid - Wyoming protocol requires JSONL headers)
+    # Handle binary message (compact audio-chunk frame, if negotiated)
     elif "bytes" in message:
+        if framing == FRAMING_BINARY:
+            return decode_audio_frame(message["bytes"])
         raise ValueError(
             "Raw binary messages not supported - Wyoming protocol requires JSONL headers"
         )
@@ -213,7 +226,7 @@ async def create_client_state(client_id: str, user, device_name: Optional[str] =
     )  # This will be mounted to ./data/audio_chunks by Docker
 
     # Use ClientManager for atomic client creation and registration
-    client_state = client_manager.create_client(
+    client_state = await client_manager.create_client(
         client_id, CHUNK_DIR, user.user_id, user.email
     )
 
@@ -372,6 +385,7 @@ async def _setup_websocket_connection(
     device_name: Optional[str],
     pending_client_id: str,
     connection_type: str,
+    framing: str = FRAMING_WYOMING,
 ) -> tuple[Optional[str], Optional[object], Optional[object]]:
     """
     Setup WebSocket connection: accept, authenticate, create client state.
@@ -382,6 +396,7 @@ async def _setup_websocket_connection(
         device_name: Optional device name for client ID
         pending_client_id: Temporary tracking ID
         connection_type: "OMI" or "PCM" for logging
+        framing: Negotiated audio framing, echoed in the ready message
 
     Returns:
         tuple: (client_id, client_state, user) or (None, None, None) on failure
@@ -415,7 +430,7 @@ async def _setup_websocket_connection(
         return None, None, None
 
     # Generate proper client_id using user and device_name
-    client_id = generate_client_id(user, device_name)
+    client_id = await generate_client_id(user, device_name)
 
     # Remove from pending now that we have real client_id
     pending_connections.discard(pending_client_id)
@@ -426,7 +441,13 @@ async def _setup_websocket_connection(
     # Send ready message to confirm connection is established
     try:
         ready_msg = (
-            json.dumps({"type": "ready", "message": "WebSocket connection established"})
+            json.dumps(
+                {
+                    "type": "ready",
+                    "message": "WebSocket connection established",
+                    "framing": framing,
+                }
+            )
             + "\n"
         )
         await ws.send_text(ready_msg)
@@ -436,6 +457,8 @@ async def _setup_websocket_connection(
 
     # Create client state
     client_state = await create_client_state(client_id, user, device_name)
+    # Route LED/audio commands for this device to this connection
+    get_client_manager().attach_websocket(client_id, ws)
 
     return client_id, client_state, user
 
@@ -478,6 +501,7 @@ async def _initialize_streaming_session(
     application_logger.info(
         f"🆔 Created stream session: {client_state.stream_session_id}"
     )
+    await get_client_manager().update_client_info(client_state.client_id)
 
     # Determine transcription provider from config.yml
     from advanced_omi_backend.model_registry import get_models_registry
@@ -1306,7 +1330,9 @@ from contextlib import asynccontextmanager
 
 
 @asynccontextmanager
-async def _websocket_session(ws, token, device_name, connection_type):
+async def _websocket_session(
+    ws, token, device_name, connection_type, framing=FRAMING_WYOMING
+):
     """Lifecycle wrapper: pending tracking, auth, client setup, cleanup.
 
     Yields (client_id, client_state, user, audio_stream_producer, interim_holder)
@@ -1321,7 +1347,7 @@ async def _websocket_session(ws, token, device_name, connection_type):
 
     try:
         client_id, client_state, user = await _setup_websocket_connection(
-            ws, token, device_name, pending_client_id, connection_type
+            ws, token, device_name, pending_client_id, connection_type, framing
         )
         if not user:
             yield None
@@ -1355,9 +1381,10 @@ async def handle_omi_websocket(
     ws: WebSocket,
     token: Optional[str] = None,
     device_name: Optional[str] = None,
+    framing: str = FRAMING_WYOMING,
 ):
     """Handle OMI WebSocket connections with Opus decoding."""
-    async with _websocket_session(ws, token, device_name, "OMI") as session:
+    async with _websocket_session(ws, token, device_name, "OMI", framing) as session:
         if session is None:
             return
         client_id, client_state, user, audio_stream_producer, interim_holder = session
@@ -1371,7 +1398,7 @@ async def handle_omi_websocket(
 
         while True:
             # Parse Wyoming protocol
-            header, payload = await parse_wyoming_protocol(ws)
+            header, payload = await parse_wyoming_protocol(ws, framing)
 
             if header["type"] == "audio-start":
                 application_logger.info(
@@ -1451,10 +1478,13 @@ async def handle_omi_websocket(
 
 
 async def handle_pcm_websocket(
-    ws: WebSocket, token: Optional[str] = None, device_name: Optional[str] = None
+    ws: WebSocket,
+    token: Optional[str] = None,
+    device_name: Optional[str] = None,
+    framing: str = FRAMING_WYOMING,
 ):
     """Handle PCM WebSocket connections with batch and streaming mode support."""
-    async with _websocket_session(ws, token, device_name, "PCM") as session:
+    async with _websocket_session(ws, token, device_name, "PCM", framing) as session:
         if session is None:
             return
         client_id, client_state, user, audio_stream_producer, interim_holder = session
@@ -1473,7 +1503,7 @@ async def handle_pcm_websocket(
                     application_logger.debug(
                         f"📨 About to receive control message for {client_id}"
                     )
-                    header, payload = await parse_wyoming_protocol(ws)
+                    header, payload = await parse_wyoming_protocol(ws, framing)
                     application_logger.debug(
                         f"✅ Received message type: {header.get('type')} for {client_id}"
                     )
@@ -1637,7 +1667,15 @@ async def handle_pcm_websocket(
                                 continue
 
                         elif "bytes" in message:
-                            audio_data = message["bytes"]
+                            if framing == FRAMING_BINARY:
+                                # Compact frame: format header + payload in one message
+                                chunk_header, audio_data = decode_audio_frame(
+                                    message["bytes"]
+                                )
+                                audio_format = chunk_header["data"]
+                            else:
+                                audio_data = message["bytes"]
+                                audio_format = {"rate": 16000, "width": 2, "channels": 1}
                             packet_count += 1
                             total_bytes += len(audio_data)
 
@@ -1645,12 +1683,11 @@ async def handle_pcm_websocket(
                                 f"🎵 Received raw audio chunk #{packet_count}: {len(audio_data)} bytes"
                             )
 
-                            default_format = {"rate": 16000, "width": 2, "channels": 1}
                             task = await _handle_audio_chunk(
                                 client_state,
                                 audio_stream_producer,
                                 audio_data,
-                                default_format,
+                                audio_format,
                                 user.user_id,
                                 user.email,
                                 client_id,
@@ -23,6 +23,7 @@ from motor.motor_asyncio import AsyncIOMotorClient
 
 from advanced_omi_backend.models.annotation import Annotation
 from advanced_omi_backend.models.conversation import Conversation
+from advanced_omi_backend.models.transcript_version import TranscriptVersionDocument
 from advanced_omi_backend.models.user import User
 from advanced_omi_backend.workers.annotation_jobs import (
     finetune_hallucination_model,
@@ -56,7 +57,7 @@ async def init_db():
         client = AsyncIOMotorClient(MONGODB_URI)
         await init_beanie(
             database=client.chronicle,
-            document_models=[Annotation, Conversation, User],
+            document_models=[Annotation, Conversation, TranscriptVersionDocument, User],
         )
         logger.info("✅ Database connection initialized")
     except Exception as e:
@@ -27,6 +27,9 @@ logger = logging.getLogger(__name__)
 # Redis key prefixes
 _LAST_RUN_KEY = "cron:last_run:{job_id}"
 _NEXT_RUN_KEY = "cron:next_run:{job_id}"
+# One claim per scheduled run, so only one API process executes it
+_RUN_CLAIM_KEY = "cron:claim:{job_id}:{run_at}"
+_RUN_CLAIM_TTL = 24 * 3600
 
 # ---------------------------------------------------------------------------
 # Data classes
@@ -253,6 +256,17 @@ class CronScheduler:
         finally:
             cfg.running = False
 
+    async def _claim_run(self, job_id: str, run_at: datetime) -> bool:
+        """Claim a scheduled run in Redis (False if another process did)."""
+        if not self._redis:
+            return True
+        try:
+            key = _RUN_CLAIM_KEY.format(job_id=job_id, run_at=int(run_at.timestamp()))
+            return bool(await self._redis.set(key, "1", nx=True, ex=_RUN_CLAIM_TTL))
+        except Exception as e:
+            logger.warning(f"Failed to claim run of cron job '{job_id}', running anyway: {e}")
+            return True
+
     async def _loop(self) -> None:
         """Main scheduler loop – checks every 30s for due jobs."""
         while self._running:
@@ -262,6 +276,10 @@ class CronScheduler:
                     if not cfg.enabled or cfg.running:
                         continue
                     if cfg.next_run and now >= cfg.next_run:
+                        if not await self._claim_run(job_id, cfg.next_run):
+                            # Another process runs this one; wait for the next slot
+                            cfg.next_run = croniter(cfg.schedule, now).get_next(datetime)
+                            continue
                         task = asyncio.create_task(self._execute_job(job_id))
                         self._active_tasks.add(task)
                         task.add_done_callback(self._active_tasks.discard)
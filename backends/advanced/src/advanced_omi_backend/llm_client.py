@@ -8,7 +8,7 @@ OpenAI, Ollama, and other OpenAI-compatible APIs.
 import asyncio
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Optional
 
 from advanced_omi_backend.model_registry import get_models_registry
 from advanced_omi_backend.openai_factory import create_openai_client
@@ -265,6 +265,48 @@ async def async_generate(
     )
 
 
+async def async_generate_stream(
+    prompt: str,
+    model: str | None = None,
+    temperature: float | None = None,
+    operation: str | None = None,
+) -> AsyncIterator[str]:
+    """Async streaming LLM text generation, yielding content deltas.
+
+    When ``operation`` is provided, parameters are resolved from config as in
+    ``async_generate()`` and tokens are streamed from the async client as the
+    provider produces them. Without an operation config, the singleton client
+    generates in a worker thread and the full text is yielded as one delta.
+    """
+    if operation:
+        registry = get_models_registry()
+        if registry:
+            op = registry.get_llm_operation(operation)
+            client = op.get_client(is_async=True)
+            api_params = op.to_api_params()
+            if temperature is not None:
+                api_params["temperature"] = temperature
+            if model is not None:
+                api_params["model"] = model
+            api_params["messages"] = [{"role": "user", "content": prompt}]
+            api_params["stream"] = True
+            stream = await client.chat.completions.create(**api_params)
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    yield delta
+            return
+
+    # Fallback: use singleton client (no incremental output)
+    client = get_llm_client()
+    loop = asyncio.get_running_loop()
+    yield await loop.run_in_executor(
+        None, lambda: client.generate(prompt, model, temperature)
+    )
+
+
 async def async_chat_with_tools(
     messages: list,
     tools: list | None = None,
@@ -36,8 +36,12 @@ if __name__ == "__main__":
     # Get port from environment or use default
     port = int(os.getenv("PORT", 8000))
     host = os.getenv("HOST", "0.0.0.0")
+    # Worker processes; client ownership and routing are shared through Redis.
+    # More than 1 is experimental: plugins keep per-process state (see
+    # Docs/architecture.md, "Multiple API Processes").
+    workers = int(os.getenv("API_WORKERS", 1))
 
-    logger.info(f"Starting server on {host}:{port}")
+    logger.info(f"Starting server on {host}:{port} ({workers} worker process(es))")
 
     # Run the application
     uvicorn.run(
@@ -45,6 +49,7 @@ if __name__ == "__main__":
         host=host,
         port=port,
         reload=False,  # Set to True for development
+        workers=workers,
         access_log=False,  # Disabled - using custom RequestLoggingMiddleware instead
         log_level="info"
     )
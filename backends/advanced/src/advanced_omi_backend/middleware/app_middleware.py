@@ -4,16 +4,15 @@ Middleware configuration for Chronicle backend.
 Centralizes CORS configuration and global exception handlers.
 """
 
-import json
 import logging
+import random
 import time
-from typing import Optional
+from typing import List, Optional
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import JSONResponse
 from pymongo.errors import ConnectionFailure, PyMongoError
-from starlette.middleware.base import BaseHTTPMiddleware
 
 from advanced_omi_backend.app_config import get_app_config
 
@@ -38,15 +37,19 @@ def setup_cors_middleware(app: FastAPI) -> None:
     )
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
+class RequestLoggingMiddleware:
     """
-    Middleware to log API requests and JSON responses.
+    Pure ASGI middleware that logs API requests and responses.
+
+    Every logged request records method, path, status, latency and response
+    size; the response is passed through untouched (no buffering). Response
+    bodies are captured only for a sampled fraction of requests or for debug
+    path prefixes, and truncated to ``max_body_bytes``.
 
     Excludes:
     - Authentication endpoints (login, logout)
     - WebSocket connections
-    - Binary file responses (audio, images)
-    - Streaming responses
+    - Binary file responses (audio, images) from body capture
     """
 
     # Paths to exclude from logging
@@ -71,6 +74,18 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         "application/octet-stream",
     }
 
+    def __init__(
+        self,
+        app,
+        body_sample_rate: float = 0.0,
+        body_debug_paths: Optional[List[str]] = None,
+        max_body_bytes: int = 4096,
+    ):
+        self.app = app
+        self.body_sample_rate = body_sample_rate
+        self.body_debug_paths = tuple(body_debug_paths or ())
+        self.max_body_bytes = max_body_bytes
+
     def should_log_request(self, path: str) -> bool:
         """Determine if request should be logged."""
         # Exclude exact path matches
@@ -100,82 +115,76 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
 
         return True
 
-    async def dispatch(self, request: Request, call_next):
-        """Process request and log request/response information."""
-        path = request.url.path
-
-        # Skip logging for excluded paths
-        if not self.should_log_request(path):
-            return await call_next(request)
-
-        # Start timing
-        start_time = time.time()
-
-        # Log request
-        request_logger.info(f"→ {request.method} {path}")
-
-        # Process request
-        response = await call_next(request)
-
-        # Calculate duration
-        duration_ms = (time.time() - start_time) * 1000
-
-        # Check if we should log response body
-        content_type = response.headers.get("content-type", "")
-        should_log_body = self.should_log_response_body(content_type)
-
-        # Skip body logging for streaming responses
-        if isinstance(response, StreamingResponse):
-            request_logger.info(
-                f"← {request.method} {path} - {response.status_code} "
-                f"(streaming response) - {duration_ms:.2f}ms"
+    def should_capture_body(self, path: str) -> bool:
+        """Decide up front whether this request's response body is captured."""
+        if self.max_body_bytes <= 0:
+            return False
+        if self.body_debug_paths and path.startswith(self.body_debug_paths):
+            return True
+        return self.body_sample_rate > 0 and random.random() < self.body_sample_rate
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.should_log_request(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        path = scope["path"]
+        start_time = time.perf_counter()
+        request_logger.info(f"→ {method} {path}")
+
+        capture = self.should_capture_body(path)
+        captured = bytearray()
+        state = {"status": None, "bytes": 0, "chunks": 0, "truncated": False}
+
+        async def send_wrapper(message):
+            nonlocal capture
+            if message["type"] == "http.response.start":
+                state["status"] = message["status"]
+                if capture:
+                    content_type = ""
+                    for key, value in message.get("headers", []):
+                        if key.lower() == b"content-type":
+                            content_type = value.decode("latin-1")
+                            break
+                    capture = self.should_log_response_body(content_type)
+            elif message["type"] == "http.response.body":
+                body = message.get("body", b"")
+                state["bytes"] += len(body)
+                state["chunks"] += 1
+                if capture and body:
+                    room = self.max_body_bytes - len(captured)
+                    if room > 0:
+                        captured.extend(body[:room])
+                    if len(body) > room:
+                        state["truncated"] = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception:
+            duration_ms = (time.perf_counter() - start_time) * 1000
+            request_logger.warning(
+                f"← {method} {path} - {state['status'] or 500} - {duration_ms:.2f}ms "
+                f"(unhandled exception)"
             )
-            return response
-
-        # For non-streaming responses, try to extract and log JSON body
-        if should_log_body and response.status_code != 204:  # No content
-            try:
-                # Read response body
-                response_body = b""
-                async for chunk in response.body_iterator:
-                    response_body += chunk
-
-                # Try to parse as JSON for pretty printing
-                try:
-                    json_body = json.loads(response_body)
-                    formatted_json = json.dumps(json_body, indent=2)
-                    request_logger.info(
-                        f"← {request.method} {path} - {response.status_code} - {duration_ms:.2f}ms\n"
-                        f"Response body:\n{formatted_json}"
-                    )
-                except (json.JSONDecodeError, UnicodeDecodeError):
-                    # Not JSON or not UTF-8, just log the status
-                    request_logger.info(
-                        f"← {request.method} {path} - {response.status_code} - {duration_ms:.2f}ms "
-                        f"(non-JSON response)"
-                    )
-
-                # Recreate response with the body we consumed
-                from starlette.responses import Response
-                return Response(
-                    content=response_body,
-                    status_code=response.status_code,
-                    headers=dict(response.headers),
-                    media_type=response.media_type,
-                )
-            except Exception as e:
-                # If anything goes wrong, just log basic info
-                request_logger.warning(
-                    f"← {request.method} {path} - {response.status_code} - {duration_ms:.2f}ms "
-                    f"(error reading response: {e})"
-                )
-                return response
+            raise
+
+        duration_ms = (time.perf_counter() - start_time) * 1000
+        summary = (
+            f"← {method} {path} - {state['status']} - {duration_ms:.2f}ms - "
+            f"{state['bytes']} bytes"
+        )
+        if state["chunks"] > 1:
+            summary += " (streamed)"
+
+        if capture and captured:
+            body_text = captured.decode("utf-8", errors="replace")
+            if state["truncated"]:
+                body_text += f"... [truncated at {self.max_body_bytes} bytes]"
+            request_logger.info(f"{summary}\nResponse body:\n{body_text}")
         else:
-            # Just log status for responses without body
-            request_logger.info(
-                f"← {request.method} {path} - {response.status_code} - {duration_ms:.2f}ms"
-            )
-            return response
+            request_logger.info(summary)
 
 
 def setup_exception_handlers(app: FastAPI) -> None:
@@ -232,8 +241,17 @@ def setup_exception_handlers(app: FastAPI) -> None:
 def setup_middleware(app: FastAPI) -> None:
     """Set up all middleware for the FastAPI application."""
     # Add request logging middleware
-    app.add_middleware(RequestLoggingMiddleware)
-    logger.info("📝 Request logging middleware enabled")
+    config = get_app_config()
+    app.add_middleware(
+        RequestLoggingMiddleware,
+        body_sample_rate=config.request_log_body_sample_rate,
+        body_debug_paths=config.request_log_body_paths,
+        max_body_bytes=config.request_log_body_max_bytes,
+    )
+    logger.info(
+        f"📝 Request logging middleware enabled (body sample rate: "
+        f"{config.request_log_body_sample_rate}, debug paths: {config.request_log_body_paths})"
+    )
 
     setup_cors_middleware(app)
     setup_exception_handlers(app)
\ No newline at end of file
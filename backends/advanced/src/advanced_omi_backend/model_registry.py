@@ -162,10 +162,19 @@ class ResolvedLLMOperation(BaseModel):
     def get_client(self, is_async: bool = False):
         """Create an OpenAI-compatible client for this operation.
 
-        Uses create_openai_client which handles Langfuse tracing.
+        Uses create_openai_client which handles Langfuse tracing. Async clients
+        are shared per event loop so their connection pools stay warm.
         """
-        from advanced_omi_backend.openai_factory import create_openai_client
+        from advanced_omi_backend.openai_factory import (
+            create_openai_client,
+            get_shared_async_client,
+        )
 
+        if is_async:
+            return get_shared_async_client(
+                api_key=self.model_def.api_key or "",
+                base_url=self.model_def.model_url,
+            )
         return create_openai_client(
             api_key=self.model_def.api_key or "",
             base_url=self.model_def.model_url,
@@ -325,6 +334,33 @@ class AppModels(BaseModel):
         )
 
 
+# Operations that were merged into another; settings written under the old
+# name are applied to the new one (later entries win)
+RENAMED_LLM_OPERATIONS = {
+    "title_summary": "conversation_summary",
+    "detailed_summary": "conversation_summary",
+}
+
+
+def _apply_renamed_llm_operations(llm_operations: Dict[str, LLMOperationConfig]) -> None:
+    """Move settings of renamed operations to their new name, in place.
+
+    The new operation keeps its own ``response_format``, which its caller
+    depends on.
+    """
+    for old_name, new_name in RENAMED_LLM_OPERATIONS.items():
+        legacy = llm_operations.pop(old_name, None)
+        if legacy is None:
+            continue
+        logging.warning(
+            f"llm_operations.{old_name} was replaced by llm_operations.{new_name}; "
+            f"applying its settings there. Rename it in config.yml."
+        )
+        overrides = legacy.model_dump(exclude_unset=True, exclude={"response_format"})
+        current = llm_operations.get(new_name, LLMOperationConfig())
+        llm_operations[new_name] = current.model_copy(update=overrides)
+
+
 # Global registry singleton
 _REGISTRY: Optional[AppModels] = None
 
@@ -398,6 +434,7 @@ def load_models_config(force_reload: bool = False) -> Optional[AppModels]:
             llm_operations[op_name] = LLMOperationConfig(**(op_dict or {}))
         except ValidationError as e:
             logging.warning(f"Failed to load llm_operation '{op_name}': {e}")
+    _apply_renamed_llm_operations(llm_operations)
 
     # Create and cache registry
     _REGISTRY = AppModels(
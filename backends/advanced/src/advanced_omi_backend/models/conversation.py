@@ -5,15 +5,34 @@ This module contains Beanie Document and Pydantic models for conversations,
 transcript versions, and memory versions.
 """
 
+import copy
 import uuid
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Set, Union
 
 from beanie import Document, Indexed
-from pydantic import BaseModel, Field, computed_field, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    Field,
+    PrivateAttr,
+    computed_field,
+    field_validator,
+    model_validator,
+)
 from pymongo import IndexModel
 
+from advanced_omi_backend.models.conversation_counts import adjust_conversation_total
+from advanced_omi_backend.models.transcript_version import (
+    TRANSCRIPT_STORAGE_VERSION,
+    delete_transcript_versions,
+    encode_version_content,
+    fetch_transcript_versions,
+    insert_transcript_versions,
+    unpack_segment_words,
+    write_transcript_versions,
+)
+
 
 class Conversation(Document):
     """Complete conversation model with versioned processing."""
@@ -73,7 +92,12 @@ class Conversation(Document):
         words: List["Conversation.Word"] = Field(default_factory=list, description="Word-level timestamps for this segment")
 
     class TranscriptVersion(BaseModel):
-        """Version of a transcript with processing metadata."""
+        """Version of a transcript with processing metadata.
+
+        Only the header (and, for the active version, transcript and segments
+        without words) is stored on the conversation; the rest is loaded on
+        demand with ``Conversation.load_transcript_versions``.
+        """
         version_id: str = Field(description="Unique version identifier")
         transcript: Optional[str] = Field(None, description="Full transcript text")
         words: List["Conversation.Word"] = Field(
@@ -93,6 +117,7 @@ class Conversation(Document):
             description="Source of speaker diarization: 'provider' (transcription service), 'pyannote' (speaker recognition), or None"
         )
         metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional provider-specific metadata")
+        word_count: int = Field(0, description="Number of words, available without loading them")
 
     class MemoryVersion(BaseModel):
         """Version of memory extraction with processing metadata."""
@@ -170,6 +195,10 @@ class Conversation(Document):
     title: Optional[str] = Field(None, description="Auto-generated conversation title")
     summary: Optional[str] = Field(None, description="Auto-generated short summary (1-2 sentences)")
     detailed_summary: Optional[str] = Field(None, description="Auto-generated detailed summary (comprehensive, corrected content)")
+    summary_input_hash: Optional[str] = Field(
+        None,
+        description="Hash of the transcript and speaker labels the summary fields were generated from"
+    )
 
     # Versioned processing
     transcript_versions: List["Conversation.TranscriptVersion"] = Field(
@@ -190,6 +219,20 @@ class Conversation(Document):
         None,
         description="Version ID of currently active memory extraction"
     )
+    transcript_storage_version: int = Field(
+        0,
+        description="0 = versions embedded in full (legacy), 1 = content in transcript_versions collection"
+    )
+
+    # Versions whose full content (including words) is in memory and is
+    # written back to the transcript_versions collection on save
+    _loaded_transcript_versions: Set[str] = PrivateAttr(default_factory=set)
+    # Fingerprints of versions carrying transcript/segments without words, used
+    # to push in-place edits of those fields to the store on save
+    _summary_fingerprints: Dict[str, int] = PrivateAttr(default_factory=dict)
+    # Value of ``deleted`` in the database (None = not stored yet), used to
+    # keep the cached listing totals in step with creates and deletes
+    _stored_deleted: Optional[bool] = PrivateAttr(default=None)
 
     # Legacy fields removed - use transcript_versions[active_transcript_version] and memory_versions[active_memory_version]
     # Frontend should access: conversation.active_transcript.segments, conversation.active_transcript.transcript
@@ -226,6 +269,195 @@ class Conversation(Document):
 
         return data
 
+    def model_post_init(self, __context: Any) -> None:
+        super().model_post_init(__context)
+        if self.id is not None:
+            self._stored_deleted = self.deleted
+        if self.transcript_storage_version < TRANSCRIPT_STORAGE_VERSION:
+            # Legacy document: versions are embedded in full and get moved
+            # out on the next save
+            self._loaded_transcript_versions = {
+                v.version_id for v in self.transcript_versions
+            }
+        else:
+            self._summary_fingerprints = {
+                v.version_id: self._summary_fingerprint(v)
+                for v in self.transcript_versions
+                if v.transcript is not None or v.segments
+            }
+
+    @staticmethod
+    def _summary_fingerprint(version: "Conversation.TranscriptVersion") -> int:
+        return hash((
+            version.transcript,
+            tuple(
+                (s.start, s.end, s.text, s.speaker, s.segment_type, s.identified_as, s.confidence)
+                for s in version.segments
+            ),
+        ))
+
+    def is_transcript_version_loaded(self, version_id: str) -> bool:
+        """Whether a version's words are in memory."""
+        return version_id in self._loaded_transcript_versions
+
+    async def load_transcript_versions(
+        self, version_ids: Optional[Iterable[str]] = None, words: bool = True
+    ) -> None:
+        """Load transcript version content from the transcript_versions collection.
+
+        Args:
+            version_ids: Versions to load (default: all)
+            words: Also load word timestamps. Versions loaded without words
+                are read-only: only their transcript and segment fields are
+                written back on save.
+        """
+        wanted_ids = set(version_ids) if version_ids is not None else None
+        wanted = [
+            v for v in self.transcript_versions
+            if (wanted_ids is None or v.version_id in wanted_ids)
+            and v.version_id not in self._loaded_transcript_versions
+        ]
+        if not wanted:
+            return
+
+        stored = await fetch_transcript_versions(
+            self.conversation_id, [v.version_id for v in wanted], words=words
+        )
+        for version in wanted:
+            content = stored.get(version.version_id)
+            if content is None:
+                # Never externalized: the header is all there is
+                if words:
+                    self._loaded_transcript_versions.add(version.version_id)
+                else:
+                    self._summary_fingerprints[version.version_id] = self._summary_fingerprint(version)
+                continue
+            self._apply_stored_content(version, content, words)
+
+    def _apply_stored_content(self, version, content, words: bool) -> None:
+        version_words = content.words.unpack() if words else []
+        segment_words = [
+            unpack_segment_words(sw, version_words) for sw in content.segment_words
+        ]
+
+        if version.version_id in self._summary_fingerprints:
+            # The conversation document is authoritative for the summary it
+            # carries; only attach words to its segments
+            if words:
+                self._attach_segment_words(version.segments, segment_words, version_words)
+        else:
+            version.transcript = content.transcript
+            version.segments = [
+                Conversation.SpeakerSegment(
+                    **segment,
+                    words=[
+                        Conversation.Word.model_construct(**w)
+                        for w in (segment_words[i] if i < len(segment_words) else [])
+                    ],
+                )
+                for i, segment in enumerate(content.segments)
+            ]
+            self._summary_fingerprints[version.version_id] = self._summary_fingerprint(version)
+
+        if words:
+            version.words = [Conversation.Word.model_construct(**w) for w in version_words]
+            version.word_count = len(version.words)
+            self._loaded_transcript_versions.add(version.version_id)
+
+    @staticmethod
+    def _attach_segment_words(segments, segment_words, version_words) -> None:
+        if len(segments) == len(segment_words):
+            for segment, seg_words in zip(segments, segment_words):
+                segment.words = [Conversation.Word.model_construct(**w) for w in seg_words]
+            return
+        # Segments were edited since the words were stored: fall back to timing
+        for segment in segments:
+            segment.words = [
+                Conversation.Word.model_construct(**w)
+                for w in version_words
+                if w["start"] >= segment.start and w["end"] <= segment.end
+            ]
+
+    def _transcript_version_header(
+        self, version: "Conversation.TranscriptVersion"
+    ) -> "Conversation.TranscriptVersion":
+        if version.version_id == self.active_transcript_version:
+            return version.model_copy(update={
+                "words": [],
+                "segments": [s.model_copy(update={"words": []}) for s in version.segments],
+            })
+        return version.model_copy(update={"transcript": None, "words": [], "segments": []})
+
+    async def _store_transcript_versions(self) -> None:
+        """Write loaded or edited version content to the transcript_versions collection."""
+        active = self.active_transcript
+        if (
+            active
+            and active.version_id not in self._loaded_transcript_versions
+            and active.version_id not in self._summary_fingerprints
+        ):
+            # Newly activated version: the document must carry its summary
+            await self.load_transcript_versions([active.version_id], words=False)
+
+        replace = []
+        summaries = []
+        for version in self.transcript_versions:
+            if version.version_id in self._loaded_transcript_versions:
+                version.word_count = len(version.words)
+                replace.append(
+                    encode_version_content(self.conversation_id, self.user_id, version)
+                )
+            elif version.version_id in self._summary_fingerprints:
+                fingerprint = self._summary_fingerprint(version)
+                if fingerprint != self._summary_fingerprints[version.version_id]:
+                    summaries.append(version)
+                    self._summary_fingerprints[version.version_id] = fingerprint
+
+        await write_transcript_versions(self.conversation_id, replace, summaries)
+        for version in self.transcript_versions:
+            if version.version_id in self._loaded_transcript_versions:
+                self._summary_fingerprints[version.version_id] = self._summary_fingerprint(version)
+        self.transcript_storage_version = TRANSCRIPT_STORAGE_VERSION
+
+    async def _write_with_transcript_headers(self, write, *args, **kwargs):
+        await self._store_transcript_versions()
+        full_versions = self.transcript_versions
+        self.transcript_versions = [self._transcript_version_header(v) for v in full_versions]
+        try:
+            return await write(*args, **kwargs)
+        finally:
+            self.transcript_versions = full_versions
+
+    async def _update_cached_total(self, stored_deleted: Optional[bool]) -> None:
+        """Adjust the cached active total when the document is created,
+        soft-deleted or restored."""
+        self._stored_deleted = self.deleted
+        if stored_deleted is None:
+            delta = 0 if self.deleted else 1
+        else:
+            delta = int(stored_deleted) - int(self.deleted)
+        if delta:
+            await adjust_conversation_total(self.get_pymongo_collection(), self.user_id, delta)
+
+    async def insert(self, *args, **kwargs):
+        result = await self._write_with_transcript_headers(super().insert, *args, **kwargs)
+        await self._update_cached_total(None)
+        return result
+
+    async def save(self, *args, **kwargs):
+        stored_deleted = self._stored_deleted
+        result = await self._write_with_transcript_headers(super().save, *args, **kwargs)
+        await self._update_cached_total(stored_deleted)
+        return result
+
+    async def delete(self, *args, **kwargs):
+        result = await super().delete(*args, **kwargs)
+        await delete_transcript_versions(conversation_id=self.conversation_id)
+        if self._stored_deleted is False:
+            await adjust_conversation_total(self.get_pymongo_collection(), self.user_id, -1)
+        self._stored_deleted = None
+        return result
+
     @computed_field
     @property
     def active_transcript(self) -> Optional["Conversation.TranscriptVersion"]:
@@ -337,10 +569,12 @@ class Conversation(Document):
             model=model,
             created_at=datetime.now(),
             processing_time_seconds=processing_time_seconds,
-            metadata=metadata or {}
+            metadata=metadata or {},
+            word_count=len(words or []),
         )
 
         self.transcript_versions.append(new_version)
+        self._loaded_transcript_versions.add(version_id)
 
         if set_as_active:
             self.active_transcript_version = version_id
@@ -377,6 +611,51 @@ class Conversation(Document):
 
         return new_version
 
+    @classmethod
+    async def push_memory_version(
+        cls,
+        conversation_id: str,
+        version_id: str,
+        memory_count: int,
+        transcript_version_id: str,
+        provider: "Conversation.MemoryProvider",
+        model: Optional[str] = None,
+        processing_time_seconds: Optional[float] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        set_as_active: bool = True
+    ) -> Optional["Conversation.MemoryVersion"]:
+        """Append a memory version with one atomic update, without loading the document.
+
+        Returns the new version, or None if the conversation does not exist.
+        """
+        new_version = Conversation.MemoryVersion(
+            version_id=version_id,
+            memory_count=memory_count,
+            transcript_version_id=transcript_version_id,
+            provider=provider,
+            model=model,
+            created_at=datetime.now(),
+            processing_time_seconds=processing_time_seconds,
+            metadata=metadata or {}
+        )
+        update: Dict[str, Any] = {"$push": {"memory_versions": new_version}}
+        if set_as_active:
+            update["$set"] = {"active_memory_version": version_id}
+
+        result = await cls.find_one(cls.conversation_id == conversation_id).update(update)
+        return new_version if result.matched_count else None
+
+    @classmethod
+    async def set_fields(cls, conversation_id: str, **fields: Any) -> bool:
+        """Set top-level fields without loading the document.
+
+        Returns False if the conversation does not exist.
+        """
+        result = await cls.find_one(cls.conversation_id == conversation_id).update(
+            {"$set": fields}
+        )
+        return bool(result.matched_count)
+
     def set_active_transcript_version(self, version_id: str) -> bool:
         """Set a specific transcript version as active."""
         for version in self.transcript_versions:
@@ -399,8 +678,19 @@ class Conversation(Document):
             "conversation_id",
             "user_id",
             "created_at",
-            [("user_id", 1), ("deleted", 1), ("created_at", -1)],  # Compound index for paginated list queries
+            # Compound indexes for keyset-paginated list queries, one per sort field
+            [("user_id", 1), ("deleted", 1), ("created_at", -1), ("conversation_id", -1)],
+            [("user_id", 1), ("deleted", 1), ("title", 1), ("conversation_id", 1)],
+            [("user_id", 1), ("deleted", 1), ("audio_total_duration", -1), ("conversation_id", -1)],
+            [("deleted", 1), ("created_at", -1), ("conversation_id", -1)],  # Admin listing
             IndexModel([("external_source_id", 1)], sparse=True),  # Sparse index for deduplication
+            # One conversation per offline backfill upload
+            IndexModel(
+                [("user_id", 1), ("external_source_id", 1)],
+                unique=True,
+                partialFilterExpression={"external_source_type": "backfill"},
+                name="backfill_upload_unique",
+            ),
             IndexModel(
                 [("title", "text"), ("summary", "text"), ("detailed_summary", "text"),
                  ("transcript_versions.transcript", "text")],
@@ -458,4 +748,73 @@ def create_conversation(
     if conversation_id is not None:
         conv_data["conversation_id"] = conversation_id
 
-    return Conversation(**conv_data)
\ No newline at end of file
+    return Conversation(**conv_data)
+
+async def migrate_transcript_storage(batch_size: int = 50) -> int:
+    """Move embedded transcript version content into the transcript_versions collection.
+
+    Legacy conversations are also migrated lazily on their next save; this
+    drains the rest. Each conversation is migrated with targeted writes (see
+    ``_migrate_legacy_conversation``), so it is safe to run concurrently with
+    workers and with other runs.
+
+    Returns:
+        Number of conversations migrated by this run
+    """
+    collection = Conversation.get_pymongo_collection()
+    legacy = {
+        "transcript_storage_version": {"$not": {"$gte": TRANSCRIPT_STORAGE_VERSION}},
+        "transcript_versions.0": {"$exists": True},
+    }
+    migrated = 0
+    last_id = None
+    while True:
+        query = legacy if last_id is None else {**legacy, "_id": {"$gt": last_id}}
+        batch = await collection.find(query).sort("_id", 1).limit(batch_size).to_list(None)
+        if not batch:
+            return migrated
+        for raw in batch:
+            last_id = raw["_id"]
+            if await _migrate_legacy_conversation(collection, raw):
+                migrated += 1
+
+
+async def _migrate_legacy_conversation(collection, raw: Dict[str, Any]) -> bool:
+    """Migrate one legacy conversation document.
+
+    Version content is written first with insert-only upserts, then the
+    embedded versions are replaced by their headers in a single ``$set``
+    that only applies if the document is still legacy and has the same
+    number of versions. If a worker saved the conversation in between, its
+    save already migrated it and both steps leave its data alone.
+
+    Returns:
+        True if this call migrated the document
+    """
+    versions = raw.get("transcript_versions") or []
+    # The model's legacy-data cleanup edits the dict it validates
+    conversation = Conversation.model_validate(copy.deepcopy(raw))
+    await insert_transcript_versions(
+        conversation.conversation_id,
+        [
+            encode_version_content(conversation.conversation_id, conversation.user_id, version)
+            for version in conversation.transcript_versions
+        ],
+    )
+    result = await collection.update_one(
+        {
+            "_id": raw["_id"],
+            "transcript_storage_version": {"$not": {"$gte": TRANSCRIPT_STORAGE_VERSION}},
+            "transcript_versions": {"$size": len(versions)},
+        },
+        {
+            "$set": {
+                "transcript_versions": [
+                    conversation._transcript_version_header(version).model_dump()
+                    for version in conversation.transcript_versions
+                ],
+                "transcript_storage_version": TRANSCRIPT_STORAGE_VERSION,
+            }
+        },
+    )
+    return bool(result.modified_count)
@@ -0,0 +1,90 @@
+"""Cached conversation totals for paginated listing.
+
+Counting a user's conversations on every page request gets slower as the
+history grows, so totals are cached in the ``conversation_counts`` collection
+(one document per ``{user_id}:{variant}``, ``*`` for all users):
+
+- the default listing (``active``: not deleted) is kept current incrementally
+  by ``Conversation.insert/save/delete`` and recounted every
+  ``ACTIVE_REFRESH_SECONDS`` to correct drift from writes that bypass them
+- other filter combinations (deleted, orphans, starred) are recounted once
+  they are older than ``VARIANT_TTL_SECONDS``, so they are approximate
+"""
+
+import logging
+import re
+from datetime import datetime, timedelta
+from typing import Any, Dict
+
+logger = logging.getLogger(__name__)
+
+COUNTS_COLLECTION = "conversation_counts"
+ALL_USERS = "*"
+ACTIVE_VARIANT = "active"
+
+ACTIVE_REFRESH_SECONDS = 600
+VARIANT_TTL_SECONDS = 60
+
+
+def _counts(conversations):
+    return conversations.database[COUNTS_COLLECTION]
+
+
+def count_key(scope: str, variant: str) -> str:
+    return f"{scope}:{variant}"
+
+
+async def cached_conversation_total(
+    conversations, query: Dict[str, Any], scope: str, variant: str
+) -> int:
+    """Return the number of conversations matching ``query``, from cache if fresh.
+
+    Args:
+        conversations: The conversations pymongo collection
+        query: Listing filter (without pagination conditions)
+        scope: User ID, or ``ALL_USERS`` for admin listings
+        variant: Name of the filter combination, ``ACTIVE_VARIANT`` for the default
+    """
+    key = count_key(scope, variant)
+    max_age = ACTIVE_REFRESH_SECONDS if variant == ACTIVE_VARIANT else VARIANT_TTL_SECONDS
+    now = datetime.utcnow()
+
+    cached = await _counts(conversations).find_one({"_id": key})
+    if cached and now - cached["refreshed_at"] < timedelta(seconds=max_age):
+        return max(0, cached["count"])
+
+    count = await conversations.count_documents(query)
+    await _counts(conversations).replace_one(
+        {"_id": key}, {"count": count, "refreshed_at": now}, upsert=True
+    )
+    return count
+
+
+async def adjust_conversation_total(conversations, user_id: str, delta: int) -> None:
+    """Apply a create (+1) or delete (-1) to the cached active totals.
+
+    Totals that are not cached yet are left alone; they are counted on the
+    next listing.
+    """
+    try:
+        await _counts(conversations).update_many(
+            {
+                "_id": {
+                    "$in": [
+                        count_key(user_id, ACTIVE_VARIANT),
+                        count_key(ALL_USERS, ACTIVE_VARIANT),
+                    ]
+                }
+            },
+            {"$inc": {"count": delta}},
+        )
+    except Exception as e:
+        # The total self-corrects on the next refresh; never fail the write
+        logger.warning(f"Failed to update cached conversation total for {user_id}: {e}")
+
+
+async def invalidate_conversation_totals(conversations, user_id: str) -> None:
+    """Drop cached totals for a user (and all-user totals) after bulk changes."""
+    await _counts(conversations).delete_many(
+        {"_id": {"$regex": f"^({re.escape(user_id)}|{re.escape(ALL_USERS)}):"}}
+    )
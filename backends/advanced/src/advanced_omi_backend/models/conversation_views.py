@@ -0,0 +1,145 @@
+"""
+Read-only projection views of the Conversation document.
+
+Worker jobs that only read a few fields load one of these views instead of the
+full ``Conversation`` Beanie document, so MongoDB sends (and Pydantic
+validates) only those fields. Views are plain Pydantic models used as Beanie
+projection models; they cannot be saved. Jobs write back with targeted
+``$set``/``$push`` updates or by loading the full document just before the
+write.
+
+Usage:
+    view = await load_conversation_view(conversation_id, MemoryJobView)
+"""
+
+from typing import Any, List, Optional, Type, TypeVar
+
+from pydantic import BaseModel, Field, field_validator
+
+from advanced_omi_backend.models.conversation import Conversation
+
+ViewType = TypeVar("ViewType", bound=BaseModel)
+
+
+class SegmentView(BaseModel):
+    """Segment fields needed to build dialogue text (no word timestamps)."""
+
+    start: float = 0.0
+    end: float = 0.0
+    text: str = ""
+    speaker: str = ""
+    segment_type: str = "speech"
+
+    @field_validator("speaker", mode="before")
+    @classmethod
+    def _legacy_speaker(cls, value: Any) -> str:
+        # Same normalization as Conversation.clean_legacy_data
+        if isinstance(value, int):
+            return f"Speaker {value}"
+        return value if isinstance(value, str) else "unknown"
+
+    @field_validator("text", mode="before")
+    @classmethod
+    def _none_text(cls, value: Any) -> str:
+        return value or ""
+
+
+class TranscriptSummaryView(BaseModel):
+    """Transcript text and segments of one version."""
+
+    version_id: str
+    transcript: Optional[str] = None
+    segments: List[SegmentView] = Field(default_factory=list)
+
+    @field_validator("transcript", mode="before")
+    @classmethod
+    def _legacy_transcript(cls, value: Any) -> Optional[str]:
+        return value if isinstance(value, str) else None
+
+    @field_validator("segments", mode="before")
+    @classmethod
+    def _legacy_segments(cls, value: Any) -> list:
+        return value if isinstance(value, list) else []
+
+
+_CONTEXT_PROJECTION = {"conversation_id": 1, "user_id": 1, "client_id": 1}
+
+_ACTIVE_TRANSCRIPT_PROJECTION = {
+    **_CONTEXT_PROJECTION,
+    "active_transcript_version": 1,
+    "transcript_versions.version_id": 1,
+    "transcript_versions.transcript": 1,
+    "transcript_versions.segments.start": 1,
+    "transcript_versions.segments.end": 1,
+    "transcript_versions.segments.text": 1,
+    "transcript_versions.segments.speaker": 1,
+    "transcript_versions.segments.segment_type": 1,
+}
+
+
+class ConversationContextView(BaseModel):
+    """Identifiers only: ownership checks and plugin context."""
+
+    conversation_id: str
+    user_id: str
+    client_id: str
+
+    class Settings:
+        projection = _CONTEXT_PROJECTION
+
+
+class ActiveTranscriptView(ConversationContextView):
+    """Identifiers plus the active version's transcript and segments."""
+
+    active_transcript_version: Optional[str] = None
+    transcript_versions: List[TranscriptSummaryView] = Field(default_factory=list)
+
+    class Settings:
+        projection = _ACTIVE_TRANSCRIPT_PROJECTION
+
+    @property
+    def active_transcript(self) -> Optional[TranscriptSummaryView]:
+        if not self.active_transcript_version:
+            return None
+        for version in self.transcript_versions:
+            if version.version_id == self.active_transcript_version:
+                return version
+        return None
+
+    @property
+    def transcript(self) -> Optional[str]:
+        return self.active_transcript.transcript if self.active_transcript else None
+
+    @property
+    def segments(self) -> List[SegmentView]:
+        return self.active_transcript.segments if self.active_transcript else []
+
+
+class MemoryJobView(ActiveTranscriptView):
+    """What ``process_memory_job`` reads."""
+
+    title: Optional[str] = None
+
+    class Settings:
+        projection = {**_ACTIVE_TRANSCRIPT_PROJECTION, "title": 1}
+
+
+class TitleSummaryJobView(ActiveTranscriptView):
+    """What ``generate_title_summary_job`` reads."""
+
+    processing_status: Optional[str] = None
+    summary_input_hash: Optional[str] = None
+
+    class Settings:
+        projection = {
+            **_ACTIVE_TRANSCRIPT_PROJECTION,
+            "processing_status": 1,
+            "summary_input_hash": 1,
+        }
+
+
+async def load_conversation_view(conversation_id: str, view: Type[ViewType]) -> Optional[ViewType]:
+    """Load a projection view of a conversation, or None if it does not exist."""
+    return await Conversation.find_one(
+        Conversation.conversation_id == conversation_id, projection_model=view
+    )
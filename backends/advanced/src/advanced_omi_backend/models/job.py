@@ -5,18 +5,24 @@ This module provides:
 - JobPriority enum for job priority levels
 - BaseRQJob abstract class for common job setup and teardown
 - async_job decorator for simplified job creation
+- the shared event loop hooks used by the persistent worker (workers/async_worker.py)
 """
 
 import asyncio
+import concurrent.futures
 import logging
+import threading
 import time
 from abc import ABC, abstractmethod
+from contextvars import ContextVar
 from datetime import datetime, timezone
 from enum import Enum
 from functools import wraps
 from typing import Any, Callable, Dict, Optional
 
 import redis.asyncio as redis_async
+from rq import get_current_job
+from rq.job import _job_stack
 
 from advanced_omi_backend.prompt_defaults import register_all_defaults
 from advanced_omi_backend.prompt_registry import get_prompt_registry
@@ -27,6 +33,15 @@ logger = logging.getLogger(__name__)
 _beanie_initialized = False
 _beanie_init_lock = asyncio.Lock()
 
+# Persistent event loop of an AsyncJobWorker process. None under the forking
+# worker, where every job runs on its own short-lived loop.
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+_worker_redis: Optional[redis_async.Redis] = None
+
+# Identifies the job a coroutine on the shared loop belongs to, so that
+# rq.get_current_job() works inside concurrent jobs (and tasks they spawn).
+_job_context: ContextVar[Optional[object]] = ContextVar("async_job_context", default=None)
+
 async def _ensure_beanie_initialized():
     """Ensure Beanie is initialized in the current process (for RQ workers)."""
     global _beanie_initialized
@@ -42,6 +57,9 @@ async def _ensure_beanie_initialized():
 
             from advanced_omi_backend.models.audio_chunk import AudioChunkDocument
             from advanced_omi_backend.models.conversation import Conversation
+            from advanced_omi_backend.models.transcript_version import (
+                TranscriptVersionDocument,
+            )
             from advanced_omi_backend.models.user import User
             from advanced_omi_backend.models.waveform import WaveformData
 
@@ -56,11 +74,16 @@ async def _ensure_beanie_initialized():
             except ConfigurationError:
                 database = client[mongodb_database]
                 raise
-            _beanie_initialized = True
             # Initialize Beanie
             await init_beanie(
                 database=database,
-                document_models=[User, Conversation, AudioChunkDocument, WaveformData],
+                document_models=[
+                    User,
+                    Conversation,
+                    TranscriptVersionDocument,
+                    AudioChunkDocument,
+                    WaveformData,
+                ],
             )
 
             _beanie_initialized = True
@@ -76,6 +99,93 @@ async def _ensure_beanie_initialized():
             raise
 
 
+async def _drain_plugin_background():
+    """Wait for background plugin dispatches started during this job."""
+    try:
+        from advanced_omi_backend.services.plugin_service import get_plugin_router
+
+        plugin_router = get_plugin_router()
+        if plugin_router:
+            await plugin_router.drain_background()
+    except Exception as e:
+        logger.warning(f"Failed to drain background plugin tasks: {e}")
+
+
+def _job_stack_ident():
+    """RQ job stack key: the job context on the shared loop, else the thread."""
+    token = _job_context.get()
+    return token if token is not None else threading.get_ident()
+
+
+def set_worker_loop(loop: Optional[asyncio.AbstractEventLoop]) -> None:
+    """Run ``async_job`` coroutines on ``loop`` instead of a new loop per job.
+
+    Called by the persistent worker with its running loop (and with None on
+    shutdown). While set, jobs share Beanie, a pooled Redis client and any
+    loop-bound clients cached by the services they use.
+    """
+    global _worker_loop, _worker_redis
+    _worker_loop = loop
+    if loop is None:
+        _worker_redis = None
+        _job_stack.__ident_func__ = threading.get_ident
+    else:
+        _job_stack.__ident_func__ = _job_stack_ident
+
+
+def _get_worker_redis() -> redis_async.Redis:
+    """Pooled Redis client shared by all jobs on the worker loop."""
+    global _worker_redis
+    if _worker_redis is None:
+        from advanced_omi_backend.controllers.queue_controller import REDIS_URL
+
+        _worker_redis = redis_async.from_url(REDIS_URL)
+    return _worker_redis
+
+
+async def warm_up_worker_loop() -> None:
+    """Open the shared Mongo and Redis connections before the first job arrives."""
+    await _ensure_beanie_initialized()
+    await _get_worker_redis().ping()
+
+
+async def close_worker_loop() -> None:
+    """Let background plugin runs finish and close the shared Redis client."""
+    await _drain_plugin_background()
+    if _worker_redis is not None:
+        await _worker_redis.close()
+
+
+def _run_on_worker_loop(coro) -> Any:
+    """Run a job coroutine on the worker loop and block the RQ thread until it ends.
+
+    The current RQ job is pushed onto the job stack inside the coroutine's own
+    context. If the waiting thread is interrupted (RQ's job timeout raises
+    into it), the coroutine is cancelled.
+    """
+    job = get_current_job()
+
+    async def run_as_job():
+        _job_context.set(object())
+        if job is not None:
+            _job_stack.push(job)
+        try:
+            return await coro
+        finally:
+            if job is not None:
+                _job_stack.pop()
+
+    future = asyncio.run_coroutine_threadsafe(run_as_job(), _worker_loop)
+    try:
+        # Wait in short slices so RQ's timer-based timeout can interrupt us
+        while not future.done():
+            concurrent.futures.wait([future], timeout=1)
+        return future.result()
+    except BaseException:
+        future.cancel()
+        raise
+
+
 class JobPriority(str, Enum):
     """Priority levels for RQ job processing.
 
@@ -246,49 +356,58 @@ def async_job(redis: bool = True, beanie: bool = True, timeout: int = 300, resul
             start_time = time.time()
             logger.info(f"🚀 Starting {job_name}")
 
+            shared_loop = _worker_loop is not None
             redis_client = None
 
-            try:
-                # Create new event loop for this job
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
+            async def process():
+                nonlocal redis_client
+
+                # Initialize Beanie for MongoDB access
+                if beanie:
+                    await _ensure_beanie_initialized()
+                    logger.debug("Beanie initialized")
+
+                # Provide a Redis client if requested
+                if redis:
+                    if shared_loop:
+                        kwargs['redis_client'] = _get_worker_redis()
+                    else:
+                        from advanced_omi_backend.controllers.queue_controller import (
+                            REDIS_URL,
+                        )
+                        redis_client = redis_async.from_url(REDIS_URL)
+                        kwargs['redis_client'] = redis_client
+                        logger.debug(f"Redis client created")
 
                 try:
-                    async def process():
-                        nonlocal redis_client
-
-                        # Initialize Beanie for MongoDB access
-                        if beanie:
-                            await _ensure_beanie_initialized()
-                            logger.debug("Beanie initialized")
-
-                        # Create Redis client if requested
-                        if redis:
-                            from advanced_omi_backend.controllers.queue_controller import (
-                                REDIS_URL,
-                            )
-                            redis_client = redis_async.from_url(REDIS_URL)
-                            kwargs['redis_client'] = redis_client
-                            logger.debug(f"Redis client created")
-
-                        try:
-                            # Call the actual job function
-                            result = await func(*args, **kwargs)
-                            return result
-                        finally:
-                            # Cleanup Redis client
-                            if redis_client:
-                                await redis_client.close()
-                                logger.debug("Redis client closed")
-
-                    result = loop.run_until_complete(process())
-
-                    elapsed = time.time() - start_time
-                    logger.info(f"✅ {job_name} completed in {elapsed:.2f}s")
+                    # Call the actual job function
+                    result = await func(*args, **kwargs)
                     return result
-
                 finally:
-                    loop.close()
+                    if not shared_loop:
+                        # Let fire-and-forget plugin runs finish before the loop closes
+                        await _drain_plugin_background()
+
+                    # Cleanup Redis client (the shared one outlives the job)
+                    if redis_client:
+                        await redis_client.close()
+                        logger.debug("Redis client closed")
+
+            try:
+                if shared_loop:
+                    result = _run_on_worker_loop(process())
+                else:
+                    # Create new event loop for this job
+                    loop = asyncio.new_event_loop()
+                    asyncio.set_event_loop(loop)
+                    try:
+                        result = loop.run_until_complete(process())
+                    finally:
+                        loop.close()
+
+                elapsed = time.time() - start_time
+                logger.info(f"✅ {job_name} completed in {elapsed:.2f}s")
+                return result
 
             except Exception as e:
                 elapsed = time.time() - start_time
@@ -0,0 +1,300 @@
+"""
+Out-of-document storage for transcript version content.
+
+Word-level timestamps dominate the size of a conversation: every word carries
+six fields and used to be stored twice (once on the version and once on its
+segment), for every transcript version ever produced. Loading a conversation
+to flip a status flag paid for all of it.
+
+Version content now lives in the ``transcript_versions`` collection, one
+document per version, with words encoded column-wise:
+
+- ``words.text`` is a plain list of strings
+- ``start_ms`` / ``end_ms`` are packed little-endian uint32 milliseconds
+- ``confidence`` / ``speaker_confidence`` are packed float32 (NaN = missing)
+- ``speaker`` is packed int16 (-1 = missing)
+
+Optional columns that are missing for every word are stored as empty bytes.
+Segment words are stored as an (offset, count) slice into the version words
+whenever they match it exactly, and as their own columns otherwise.
+
+The ``Conversation`` document keeps version headers (provider, model,
+metadata, counts) plus the active version's transcript and segments without
+words; see ``Conversation.load_transcript_versions`` for lazy loading.
+"""
+
+import math
+import struct
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from beanie import Document, Indexed
+from pydantic import BaseModel, Field
+from pymongo import IndexModel, ReplaceOne, UpdateOne
+from pymongo.errors import BulkWriteError
+
+# Conversations whose ``transcript_storage_version`` is lower still embed full
+# versions and are migrated on their next save.
+TRANSCRIPT_STORAGE_VERSION = 1
+
+_MISSING_SPEAKER = -1
+
+
+def _pack(fmt: str, values: Sequence) -> bytes:
+    return struct.pack(f"<{len(values)}{fmt}", *values)
+
+
+def _unpack(fmt: str, data: bytes, count: int) -> tuple:
+    if not data:
+        return (None,) * count
+    return struct.unpack(f"<{count}{fmt}", data)
+
+
+def _pack_optional_floats(values: Sequence[Optional[float]]) -> bytes:
+    if all(v is None for v in values):
+        return b""
+    return _pack("f", [math.nan if v is None else v for v in values])
+
+
+def _unpack_optional_floats(data: bytes, count: int) -> List[Optional[float]]:
+    return [None if v is None or math.isnan(v) else round(v, 6) for v in _unpack("f", data, count)]
+
+
+def _word_key(word: Any) -> tuple:
+    return (
+        word.word,
+        round(word.start * 1000),
+        round(word.end * 1000),
+        word.confidence,
+        word.speaker,
+        word.speaker_confidence,
+    )
+
+
+class WordColumns(BaseModel):
+    """A word list stored column-wise with packed numeric columns."""
+
+    text: List[str] = Field(default_factory=list, description="Word texts")
+    start_ms: bytes = Field(b"", description="Packed uint32 start times (ms)")
+    end_ms: bytes = Field(b"", description="Packed uint32 end times (ms)")
+    confidence: bytes = Field(b"", description="Packed float32, NaN = missing")
+    speaker: bytes = Field(b"", description="Packed int16, -1 = missing")
+    speaker_confidence: bytes = Field(b"", description="Packed float32, NaN = missing")
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+    @classmethod
+    def pack(cls, words: Sequence[Any]) -> "WordColumns":
+        """Encode objects with ``Conversation.Word`` attributes."""
+        speakers = [w.speaker for w in words]
+        return cls(
+            text=[w.word for w in words],
+            start_ms=_pack("I", [max(0, round(w.start * 1000)) for w in words]),
+            end_ms=_pack("I", [max(0, round(w.end * 1000)) for w in words]),
+            confidence=_pack_optional_floats([w.confidence for w in words]),
+            speaker=(
+                b""
+                if all(s is None for s in speakers)
+                else _pack("h", [_MISSING_SPEAKER if s is None else s for s in speakers])
+            ),
+            speaker_confidence=_pack_optional_floats([w.speaker_confidence for w in words]),
+        )
+
+    def unpack(self) -> List[Dict[str, Any]]:
+        """Decode into ``Conversation.Word`` field dicts."""
+        count = len(self.text)
+        if not count:
+            return []
+        starts = _unpack("I", self.start_ms, count)
+        ends = _unpack("I", self.end_ms, count)
+        confidences = _unpack_optional_floats(self.confidence, count)
+        speakers = _unpack("h", self.speaker, count)
+        speaker_confidences = _unpack_optional_floats(self.speaker_confidence, count)
+        return [
+            {
+                "word": self.text[i],
+                "start": starts[i] / 1000,
+                "end": ends[i] / 1000,
+                "confidence": confidences[i],
+                "speaker": None if speakers[i] in (None, _MISSING_SPEAKER) else speakers[i],
+                "speaker_confidence": speaker_confidences[i],
+            }
+            for i in range(count)
+        ]
+
+
+class SegmentWords(BaseModel):
+    """Words of one segment: a slice of the version's words, or its own columns."""
+
+    offset: int = 0
+    count: int = 0
+    columns: Optional[WordColumns] = None
+
+
+def pack_segment_words(
+    version_keys: List[tuple], first_offsets: Dict[tuple, int], segment_words: Sequence[Any]
+) -> SegmentWords:
+    """Encode a segment's words, referencing the version words when they match.
+
+    ``version_keys`` are ``_word_key`` tuples of the version words and
+    ``first_offsets`` maps each key to its first position.
+    """
+    if not segment_words:
+        return SegmentWords()
+
+    keys = [_word_key(w) for w in segment_words]
+    offset = first_offsets.get(keys[0])
+    if offset is not None and version_keys[offset : offset + len(keys)] == keys:
+        return SegmentWords(offset=offset, count=len(keys))
+    return SegmentWords(count=len(keys), columns=WordColumns.pack(segment_words))
+
+
+def unpack_segment_words(
+    segment_words: SegmentWords, version_words: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    if segment_words.columns is not None:
+        return segment_words.columns.unpack()
+    return version_words[segment_words.offset : segment_words.offset + segment_words.count]
+
+
+class TranscriptVersionDocument(Document):
+    """Transcript, segments and columnar words of one transcript version."""
+
+    conversation_id: Indexed(str) = Field(description="Parent conversation ID")
+    user_id: Indexed(str) = Field(description="Owner of the parent conversation")
+    version_id: str = Field(description="Transcript version ID")
+    transcript: Optional[str] = Field(None, description="Full transcript text")
+    words: WordColumns = Field(default_factory=WordColumns)
+    segments: List[Dict[str, Any]] = Field(
+        default_factory=list,
+        description="SpeakerSegment fields without words",
+    )
+    segment_words: List[SegmentWords] = Field(
+        default_factory=list,
+        description="Words of each segment, parallel to segments",
+    )
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+    class Settings:
+        name = "transcript_versions"
+        indexes = [
+            "conversation_id",
+            "user_id",
+            IndexModel([("conversation_id", 1), ("version_id", 1)], unique=True),
+        ]
+
+
+def encode_version_content(conversation_id: str, user_id: str, version: Any) -> Dict[str, Any]:
+    """Build the stored document for a fully loaded ``Conversation.TranscriptVersion``."""
+    version_keys = [_word_key(w) for w in version.words]
+    first_offsets: Dict[tuple, int] = {}
+    for offset, key in enumerate(version_keys):
+        first_offsets.setdefault(key, offset)
+
+    return {
+        "conversation_id": conversation_id,
+        "user_id": user_id,
+        "version_id": version.version_id,
+        "transcript": version.transcript,
+        "words": WordColumns.pack(version.words).model_dump(),
+        "segments": [s.model_dump(exclude={"words"}) for s in version.segments],
+        "segment_words": [
+            pack_segment_words(version_keys, first_offsets, s.words).model_dump()
+            for s in version.segments
+        ],
+        "updated_at": datetime.utcnow(),
+    }
+
+
+async def write_transcript_versions(
+    conversation_id: str,
+    replace: Iterable[Dict[str, Any]] = (),
+    summaries: Iterable[Any] = (),
+) -> None:
+    """Upsert full version content and refresh transcript/segment summaries.
+
+    ``replace`` holds documents from ``encode_version_content``; ``summaries``
+    holds versions whose words were never loaded, so only their transcript and
+    segment fields are written.
+    """
+    operations = [
+        ReplaceOne(
+            {"conversation_id": conversation_id, "version_id": doc["version_id"]},
+            doc,
+            upsert=True,
+        )
+        for doc in replace
+    ]
+    operations.extend(
+        UpdateOne(
+            {"conversation_id": conversation_id, "version_id": version.version_id},
+            {
+                "$set": {
+                    "transcript": version.transcript,
+                    "segments": [s.model_dump(exclude={"words"}) for s in version.segments],
+                    "updated_at": datetime.utcnow(),
+                }
+            },
+        )
+        for version in summaries
+    )
+    if operations:
+        await TranscriptVersionDocument.get_pymongo_collection().bulk_write(
+            operations, ordered=False
+        )
+
+
+async def insert_transcript_versions(conversation_id: str, docs: Iterable[Dict[str, Any]]) -> None:
+    """Store version content that is not stored yet; existing documents are kept.
+
+    Idempotent, and safe against a concurrent save of the same conversation:
+    whatever is already in the collection (e.g. written by that save) wins.
+    """
+    operations = [
+        UpdateOne(
+            {"conversation_id": conversation_id, "version_id": doc["version_id"]},
+            {"$setOnInsert": doc},
+            upsert=True,
+        )
+        for doc in docs
+    ]
+    if not operations:
+        return
+    try:
+        await TranscriptVersionDocument.get_pymongo_collection().bulk_write(
+            operations, ordered=False
+        )
+    except BulkWriteError as e:
+        # Two upserts racing on the unique index: the other one stored it
+        if any(error.get("code") != 11000 for error in e.details.get("writeErrors", [])):
+            raise
+
+
+async def fetch_transcript_versions(
+    conversation_id: str, version_ids: List[str], words: bool = True
+) -> Dict[str, TranscriptVersionDocument]:
+    """Load stored version content, optionally without the word columns."""
+    projection = None if words else {"words": 0, "segment_words": 0}
+    cursor = TranscriptVersionDocument.get_pymongo_collection().find(
+        {"conversation_id": conversation_id, "version_id": {"$in": version_ids}},
+        projection,
+    )
+    return {
+        doc["version_id"]: TranscriptVersionDocument.model_validate(doc) async for doc in cursor
+    }
+
+
+async def delete_transcript_versions(
+    conversation_id: Optional[str] = None, user_id: Optional[str] = None
+) -> int:
+    """Delete stored versions of one conversation or of all a user's conversations."""
+    query: Dict[str, Any] = {}
+    if conversation_id is not None:
+        query["conversation_id"] = conversation_id
+    if user_id is not None:
+        query["user_id"] = user_id
+    if not query:
+        raise ValueError("conversation_id or user_id is required")
+    result = await TranscriptVersionDocument.get_pymongo_collection().delete_many(query)
+    return result.deleted_count
@@ -8,12 +8,20 @@ Tracing is handled by the OTEL instrumentor (see observability/otel_setup.py),
 which auto-instruments all OpenAI calls at startup. No per-client wrapping needed.
 """
 
+import asyncio
 import logging
+import weakref
+from typing import Dict, Tuple
 
 import openai
 
 logger = logging.getLogger(__name__)
 
+# AsyncOpenAI clients hold an httpx connection pool bound to the event loop that
+# first used them, so they are cached per loop. Entries go away with the loop.
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[str, str], openai.AsyncOpenAI]]"
+_async_clients = weakref.WeakKeyDictionary()
+
 
 def create_openai_client(api_key: str, base_url: str, is_async: bool = False):
     """Create an OpenAI client.
@@ -30,3 +38,31 @@ def create_openai_client(api_key: str, base_url: str, is_async: bool = False):
         return openai.AsyncOpenAI(api_key=api_key, base_url=base_url)
     else:
         return openai.OpenAI(api_key=api_key, base_url=base_url)
+
+
+def get_shared_async_client(api_key: str, base_url: str):
+    """Return an AsyncOpenAI client shared by all callers on the running loop.
+
+    Reusing the client keeps its connections (and TLS sessions) warm across
+    calls and, on the persistent RQ worker, across jobs. Outside a running
+    loop a new client is returned.
+
+    Args:
+        api_key: OpenAI API key
+        base_url: OpenAI API base URL
+
+    Returns:
+        AsyncOpenAI client instance
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return create_openai_client(api_key, base_url, is_async=True)
+
+    clients = _async_clients.setdefault(loop, {})
+    client = clients.get((api_key, base_url))
+    if client is None:
+        client = clients[(api_key, base_url)] = create_openai_client(
+            api_key, base_url, is_async=True
+        )
+    return client
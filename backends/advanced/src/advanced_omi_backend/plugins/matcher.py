@@ -0,0 +1,167 @@
+"""
+Compiled wake word / keyword matcher for plugin conditions.
+
+All ``wake_word`` and ``keyword_anywhere`` patterns of all registered plugins
+are compiled once into a token-level Aho-Corasick automaton. Matching a
+transcript is then a single pass over its tokens that yields, per plugin,
+the matched pattern and the command text around it.
+
+Tokens are lowercase, with punctuation and whitespace acting as separators. Matches are
+token-aligned, so "vivi" matches "Vivi," but not "Vivian".
+"""
+
+import re
+import string
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Runs of characters that are neither whitespace nor ASCII punctuation
+_TOKEN_RE = re.compile(r"[^\s" + re.escape(string.punctuation) + r"]+")
+# Separators consumed around a matched wake word / keyword
+_SEPARATORS = " \t\n\r,.-!?;:"
+_MULTI_SPACE_RE = re.compile(r"\s{2,}")
+
+WAKE_WORD = "wake_word"
+KEYWORD_ANYWHERE = "keyword_anywhere"
+
+
+def tokenize(text: str) -> List[Tuple[str, int, int]]:
+    """Split text into normalized tokens with their (start, end) offsets in ``text``."""
+    return [(m.group().lower(), m.start(), m.end()) for m in _TOKEN_RE.finditer(text)]
+
+
+def condition_patterns(condition: Dict) -> List[str]:
+    """Return the wake words / keywords configured for a plugin condition.
+
+    Supports both the plural list form and the singular legacy key.
+    """
+    condition_type = condition.get("type", "always")
+    if condition_type == WAKE_WORD:
+        patterns = condition.get("wake_words", [])
+        singular = condition.get("wake_word", "")
+    elif condition_type == KEYWORD_ANYWHERE:
+        patterns = condition.get("keywords", [])
+        singular = condition.get("keyword", "")
+    else:
+        return []
+    if not patterns and singular:
+        patterns = [singular]
+    return list(patterns)
+
+
+@dataclass(frozen=True)
+class _Pattern:
+    plugin_id: str
+    condition_type: str
+    priority: int  # Position in the plugin's list; lower wins
+    text: str  # Pattern as configured
+    length: int  # Number of tokens
+
+
+@dataclass(frozen=True)
+class ConditionMatch:
+    """Where a plugin's condition matched in a transcript."""
+
+    plugin_id: str
+    pattern: str
+    start: int  # Character offsets of the matched span in the transcript
+    end: int
+    command: str
+
+
+class ConditionMatcher:
+    """Token-level Aho-Corasick automaton over all plugin condition patterns."""
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[_Pattern]] = [[]]
+        self.plugin_ids: set = set()
+
+    @classmethod
+    def compile(cls, conditions: Iterable[Tuple[str, Dict]]) -> "ConditionMatcher":
+        """Build a matcher from ``(plugin_id, condition)`` pairs."""
+        matcher = cls()
+        for plugin_id, condition in conditions:
+            condition_type = (condition or {}).get("type", "always")
+            for priority, text in enumerate(condition_patterns(condition or {})):
+                tokens = [token for token, _, _ in tokenize(text)]
+                if tokens:
+                    matcher._add(
+                        tokens, _Pattern(plugin_id, condition_type, priority, text, len(tokens))
+                    )
+                    matcher.plugin_ids.add(plugin_id)
+        matcher._build_failure_links()
+        return matcher
+
+    def _add(self, tokens: List[str], pattern: _Pattern) -> None:
+        state = 0
+        for token in tokens:
+            nxt = self._goto[state].get(token)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][token] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = nxt
+        self._output[state].append(pattern)
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(token, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._output[nxt] = self._output[nxt] + self._output[self._fail[nxt]]
+
+    def match(self, transcript: str) -> Dict[str, ConditionMatch]:
+        """Find, in one pass, every plugin whose condition fires on ``transcript``.
+
+        For each plugin the pattern listed first in its config wins; for
+        keywords the earliest occurrence of that pattern is used.
+        """
+        if not self.plugin_ids or not transcript:
+            return {}
+
+        tokens = tokenize(transcript)
+        best: Dict[str, Tuple[int, int, _Pattern, int, int]] = {}
+        state = 0
+        for index, (token, _, end) in enumerate(tokens):
+            while state and token not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(token, 0)
+            for pattern in self._output[state]:
+                first = index - pattern.length + 1
+                if pattern.condition_type == WAKE_WORD and first != 0:
+                    continue
+                rank = (pattern.priority, first)
+                current = best.get(pattern.plugin_id)
+                if current is None or rank < current[:2]:
+                    best[pattern.plugin_id] = (*rank, pattern, tokens[first][1], end)
+
+        matches = {}
+        for plugin_id, (_, _, pattern, start, end) in best.items():
+            if pattern.condition_type == WAKE_WORD:
+                command = transcript[end:].lstrip(_SEPARATORS).strip()
+            else:
+                left = transcript[:start].rstrip(_SEPARATORS)
+                right = transcript[end:].lstrip(_SEPARATORS)
+                command = _MULTI_SPACE_RE.sub(" ", f"{left} {right}".strip())
+            matches[plugin_id] = ConditionMatch(plugin_id, pattern.text, start, end, command)
+        return matches
+
+    @property
+    def state_count(self) -> int:
+        return len(self._goto)
+
+
+def match_condition(condition: Dict, transcript: str) -> Optional[ConditionMatch]:
+    """Match a single condition without a prebuilt automaton (convenience/tests)."""
+    return ConditionMatcher.compile([("_", condition)]).match(transcript).get("_")
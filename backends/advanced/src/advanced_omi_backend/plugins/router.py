@@ -5,144 +5,97 @@ Routes pipeline events to appropriate plugins based on access level and triggers
 """
 
 import asyncio
+import bisect
 import json
 import logging
 import os
-import re
-import string
 import time
-from typing import Any, Dict, List, NamedTuple, Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 
 import redis
 
 from .base import BasePlugin, PluginContext, PluginResult
 from .events import PluginEvent
+from .matcher import ConditionMatcher, condition_patterns, match_condition
 
 logger = logging.getLogger(__name__)
 
 
-def normalize_text_for_wake_word(text: str) -> str:
-    """
-    Normalize text for wake word matching.
-    - Lowercase
-    - Replace punctuation with spaces
-    - Collapse multiple spaces to single space
-    - Strip leading/trailing whitespace
-
-    Example:
-        "Hey, Vivi!" -> "hey vivi"
-        "HEY  VIVI" -> "hey vivi"
-        "Hey-Vivi" -> "hey vivi"
-    """
-    # Lowercase
-    text = text.lower()
-    # Replace punctuation with spaces (instead of removing, to preserve word boundaries)
-    text = text.translate(
-        str.maketrans(string.punctuation, " " * len(string.punctuation))
-    )
-    # Normalize whitespace (collapse multiple spaces to single space)
-    text = re.sub(r"\s+", " ", text)
-    # Strip leading/trailing whitespace
-    return text.strip()
-
-
-def extract_command_around_keyword(transcript: str, keyword: str) -> str:
-    """
-    Extract command by removing a keyword from anywhere in the transcript.
-
-    Handles punctuation and spacing around the keyword gracefully.
-
-    Example:
-        transcript: "Turn off the lights, Vivi"
-        keyword: "vivi"
-        -> "Turn off the lights"
-
-        transcript: "Vivi, turn off the lights in the hall"
-        keyword: "vivi"
-        -> "turn off the lights in the hall"
-
-        transcript: "Turn off the hall lights, Vivi, please"
-        keyword: "vivi"
-        -> "Turn off the hall lights, please"
-
-    Args:
-        transcript: Original transcript text
-        keyword: Keyword to remove (will be normalized)
-
-    Returns:
-        Command text with keyword removed
-    """
-    keyword_parts = normalize_text_for_wake_word(keyword).split()
-    if not keyword_parts:
-        return transcript.strip()
+class ConditionResult(NamedTuple):
+    """Result of a plugin condition check."""
 
-    pattern_parts = [re.escape(part) for part in keyword_parts]
-    # Match keyword with optional surrounding punctuation/whitespace
-    kw_pattern = r"[\s,.\-!?;:]*".join(pattern_parts)
-    # Consume adjacent punctuation/whitespace on both sides
-    full_pattern = r"[\s,.\-!?;:]*" + kw_pattern + r"[\s,.\-!?;:]*"
+    execute: bool
+    extra: Dict[str, Any] = {}
 
-    command = re.sub(
-        full_pattern, " ", transcript, count=1, flags=re.IGNORECASE
-    ).strip()
-    # Collapse any doubled spaces left behind
-    command = re.sub(r"\s{2,}", " ", command)
-    return command
 
+@dataclass
+class DispatchPolicy:
+    """Per-plugin dispatch settings, read from the ``dispatch`` block in plugins.yml.
 
-def extract_command_after_wake_word(transcript: str, wake_word: str) -> str:
+    By default plugins run concurrently with each other. ``ordered`` plugins
+    run one after another (in registration order) and are the only ones whose
+    ``should_continue=False`` stops further processing.
     """
-    Intelligently extract command after wake word in original transcript.
 
-    Handles punctuation and spacing variations by creating a flexible regex pattern.
+    ordered: bool = False
+    timeout: Optional[float] = 30.0  # Seconds per invocation (None = no limit)
+    max_in_flight: int = 4  # Bulkhead: concurrent invocations before rejecting
+    background_events: List[str] = field(default_factory=list)  # Fire-and-forget
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> "DispatchPolicy":
+        config = config or {}
+        timeout = config.get("timeout", cls.timeout)
+        return cls(
+            ordered=bool(config.get("ordered", False)),
+            timeout=float(timeout) if timeout else None,
+            max_in_flight=max(1, int(config.get("max_in_flight", cls.max_in_flight))),
+            background_events=list(config.get("background_events", [])),
+        )
 
-    Example:
-        transcript: "Hey, Vivi, turn off lights"
-        wake_word: "hey vivi"
-        -> extracts: "turn off lights"
 
-    Args:
-        transcript: Original transcript text with punctuation
-        wake_word: Configured wake word (will be normalized)
+class LatencyHistogram:
+    """Fixed-bucket latency histogram in milliseconds."""
 
-    Returns:
-        Command text after wake word, or full transcript if wake word boundary not found
-    """
-    # Split wake word into parts (normalized)
-    wake_word_parts = normalize_text_for_wake_word(wake_word).split()
-
-    if not wake_word_parts:
-        return transcript.strip()
-
-    # Create regex pattern that allows punctuation/whitespace between parts
-    # Example: "hey" + "vivi" -> r"hey[\s,.\-!?]*vivi[\s,.\-!?]*"
-    # The pattern matches the wake word parts with optional punctuation/whitespace between and after
-    pattern_parts = [re.escape(part) for part in wake_word_parts]
-    # Allow optional punctuation/whitespace between parts
-    pattern = r"[\s,.\-!?;:]*".join(pattern_parts)
-    # Add trailing punctuation/whitespace consumption after last wake word part
-    pattern = "^" + pattern + r"[\s,.\-!?;:]*"
-
-    # Try to match wake word at start of transcript (case-insensitive)
-    match = re.match(pattern, transcript, re.IGNORECASE)
-
-    if match:
-        # Extract everything after the matched wake word (including trailing punctuation)
-        command = transcript[match.end() :].strip()
-        return command
-    else:
-        # Fallback: couldn't find wake word boundary, return full transcript
-        logger.warning(
-            f"Could not find wake word boundary for '{wake_word}' in '{transcript}', using full transcript"
-        )
-        return transcript.strip()
+    BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
 
+    def __init__(self):
+        self.counts = [0] * (len(self.BUCKETS_MS) + 1)  # Last bucket is overflow
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, latency_ms: float) -> None:
+        self.counts[bisect.bisect_left(self.BUCKETS_MS, latency_ms)] += 1
+        self.count += 1
+        self.total_ms += latency_ms
+        self.max_ms = max(self.max_ms, latency_ms)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket containing the q-th percentile."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        cumulative = 0
+        for i, bucket_count in enumerate(self.counts):
+            cumulative += bucket_count
+            if cumulative >= rank:
+                return float(self.BUCKETS_MS[i]) if i < len(self.BUCKETS_MS) else self.max_ms
+        return self.max_ms
 
-class ConditionResult(NamedTuple):
-    """Result of a plugin condition check."""
-
-    execute: bool
-    extra: Dict[str, Any] = {}
+    def to_dict(self) -> Dict[str, Any]:
+        buckets = {f"le_{b}": c for b, c in zip(self.BUCKETS_MS, self.counts)}
+        buckets["le_inf"] = self.counts[-1]
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total_ms / self.count, 2) if self.count else None,
+            "max_ms": round(self.max_ms, 2),
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "buckets": buckets,
+        }
 
 
 class PluginHealth:
@@ -158,10 +111,24 @@ class PluginHealth:
         self.status: str = self.REGISTERED
         self.error: Optional[str] = None
 
+        # Dispatch statistics
+        self.latency = LatencyHistogram()
+        self.in_flight = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.rejected = 0
+
     def to_dict(self) -> Dict[str, Any]:
         result: Dict[str, Any] = {
             "plugin_id": self.plugin_id,
             "status": self.status,
+            "dispatch": {
+                "in_flight": self.in_flight,
+                "failures": self.failures,
+                "timeouts": self.timeouts,
+                "rejected": self.rejected,
+                "latency": self.latency.to_dict(),
+            },
         }
         if self.error:
             result["error"] = self.error
@@ -173,12 +140,17 @@ class PluginRouter:
 
     _EVENT_LOG_KEY = "system:event_log"
     _EVENT_LOG_MAX = 1000
+    _BACKGROUND_MAX_PENDING = 100
 
     def __init__(self):
         self.plugins: Dict[str, BasePlugin] = {}
         self.plugin_health: Dict[str, PluginHealth] = {}
+        self.dispatch_policies: Dict[str, DispatchPolicy] = {}
         # Index plugins by event for fast lookup
         self._plugins_by_event: Dict[str, List[str]] = {}
+        self._background_tasks: set = set()
+        # All wake word / keyword conditions compiled into one automaton
+        self._condition_matcher = ConditionMatcher()
         self._services = None
 
         # Sync Redis for event logging (works from both FastAPI and RQ workers)
@@ -197,6 +169,9 @@ class PluginRouter:
         """Register a plugin with the router"""
         self.plugins[plugin_id] = plugin
         self.plugin_health[plugin_id] = PluginHealth(plugin_id)
+        self.dispatch_policies[plugin_id] = DispatchPolicy.from_config(
+            plugin.config.get("dispatch")
+        )
 
         # Index by each event
         for event in plugin.events:
@@ -204,8 +179,16 @@ class PluginRouter:
                 self._plugins_by_event[event] = []
             self._plugins_by_event[event].append(plugin_id)
 
+        self._compile_conditions()
+
         logger.info(f"Registered plugin '{plugin_id}' for events: {plugin.events}")
 
+    def _compile_conditions(self) -> None:
+        """Rebuild the condition automaton from all registered plugins."""
+        self._condition_matcher = ConditionMatcher.compile(
+            (plugin_id, plugin.condition) for plugin_id, plugin in self.plugins.items()
+        )
+
     def mark_plugin_initialized(self, plugin_id: str) -> None:
         """Mark a plugin as successfully initialized."""
         if plugin_id in self.plugin_health:
@@ -236,6 +219,12 @@ class PluginRouter:
         """
         Dispatch event to all subscribed plugins.
 
+        Plugins whose condition matches run concurrently, each under its own
+        timeout and bulkhead. Plugins with ``dispatch.ordered`` run one after
+        another and may stop the ordered chain via ``should_continue=False``.
+        Plugins listing this event in ``dispatch.background_events`` are
+        scheduled fire-and-forget and do not contribute results.
+
         Args:
             event: Event name (e.g., 'transcript.streaming', 'conversation.complete')
             user_id: User ID for context
@@ -243,12 +232,11 @@ class PluginRouter:
             metadata: Optional metadata
 
         Returns:
-            List of plugin results
+            List of plugin results (ordered plugins first, then concurrent ones)
         """
         # Add at start
         logger.info(f"🔌 ROUTER: Dispatching '{event}' event (user={user_id})")
 
-        results = []
         executed = []  # Track per-plugin outcomes for event log
 
         # Get plugins subscribed to this event
@@ -261,6 +249,14 @@ class PluginRouter:
                 f"🔌 ROUTER: Found {len(plugin_ids)} subscribed plugin(s): {plugin_ids}"
             )
 
+        # Match every plugin's wake words / keywords in a single pass
+        matches = None
+        if any(pid in self._condition_matcher.plugin_ids for pid in plugin_ids):
+            matches = self._condition_matcher.match(data.get("transcript", ""))
+
+        ordered: List[Tuple[str, PluginContext]] = []
+        concurrent: List[Tuple[str, PluginContext]] = []
+
         for plugin_id in plugin_ids:
             plugin = self.plugins[plugin_id]
 
@@ -270,62 +266,62 @@ class PluginRouter:
 
             # Check execution condition (wake_word, etc.)
             logger.info(f"   → Checking execution condition for '{plugin_id}'")
-            condition = await self._should_execute(plugin, data, event=event)
+            condition = await self._should_execute(
+                plugin, data, event=event, plugin_id=plugin_id, matches=matches
+            )
             if not condition.execute:
                 logger.info(f"   ⊘ Skipping '{plugin_id}': condition not met")
                 continue
 
-            # Execute plugin
-            try:
-                logger.info(f"   ▶ Executing '{plugin_id}' for event '{event}'")
-                # Per-plugin data copy: merge extra context (e.g. wake word
-                # command) without mutating the shared data dict.
-                plugin_data = {**data, **condition.extra} if condition.extra else data
-                context = PluginContext(
-                    user_id=user_id,
-                    event=event,
-                    data=plugin_data,
-                    metadata=metadata or {},
-                    services=self._services,
-                )
-
-                result = await self._execute_plugin(plugin, event, context)
-
-                if result:
-                    status_icon = "✓" if result.success else "✗"
-                    logger.info(
-                        f"   {status_icon} Plugin '{plugin_id}' completed: "
-                        f"success={result.success}, message={result.message}"
-                    )
-                    results.append(result)
-                    executed.append(
-                        {
-                            "plugin_id": plugin_id,
-                            "success": result.success,
-                            "message": result.message,
-                        }
-                    )
-
-                    # If plugin says stop processing, break
-                    if not result.should_continue:
-                        logger.info(
-                            f"   ⊗ Plugin '{plugin_id}' stopped further processing"
-                        )
-                        break
-                else:
-                    logger.info(
-                        f"   ⊘ Plugin '{plugin_id}' returned no result for '{event}'"
-                    )
+            # Per-plugin data copy: merge extra context (e.g. wake word
+            # command) without mutating the shared data dict.
+            plugin_data = {**data, **condition.extra} if condition.extra else data
+            context = PluginContext(
+                user_id=user_id,
+                event=event,
+                data=plugin_data,
+                metadata=metadata or {},
+                services=self._services,
+            )
 
-            except Exception as e:
-                # CRITICAL: Log exception details
-                logger.error(
-                    f"   ✗ Plugin '{plugin_id}' FAILED with exception: {e}",
-                    exc_info=True,
-                )
+            policy = self.dispatch_policies.get(plugin_id, DispatchPolicy())
+            if event in policy.background_events:
+                queued = self._submit_background(plugin_id, event, context)
                 executed.append(
-                    {"plugin_id": plugin_id, "success": False, "message": str(e)}
+                    {
+                        "plugin_id": plugin_id,
+                        "success": queued,
+                        "message": "queued in background" if queued else "background queue full",
+                    }
                 )
+            elif policy.ordered:
+                ordered.append((plugin_id, context))
+            else:
+                concurrent.append((plugin_id, context))
+
+        # Start independent plugins right away so ordered ones cannot delay them
+        concurrent_tasks = [
+            asyncio.ensure_future(self._run_plugin(plugin_id, event, context))
+            for plugin_id, context in concurrent
+        ]
+
+        outcomes: List[Tuple[Optional[PluginResult], Optional[Dict]]] = []
+        try:
+            for plugin_id, context in ordered:
+                result, record = await self._run_plugin(plugin_id, event, context)
+                outcomes.append((result, record))
+                # If an ordered plugin says stop processing, skip the rest of the chain
+                if result and not result.should_continue:
+                    logger.info(f"   ⊗ Plugin '{plugin_id}' stopped further processing")
+                    break
+            outcomes.extend(await asyncio.gather(*concurrent_tasks))
+        except asyncio.CancelledError:
+            for task in concurrent_tasks:
+                task.cancel()
+            raise
+
+        results = [result for result, _ in outcomes if result]
+        executed.extend(record for _, record in outcomes if record)
 
         # Add at end
         logger.info(
@@ -343,11 +339,115 @@ class PluginRouter:
 
         return results
 
+    async def _run_plugin(
+        self, plugin_id: str, event: str, context: PluginContext
+    ) -> Tuple[Optional[PluginResult], Optional[Dict]]:
+        """Run one plugin under its timeout and bulkhead, recording health stats.
+
+        Never raises (except on cancellation); failures become event-log records.
+        """
+        plugin = self.plugins[plugin_id]
+        policy = self.dispatch_policies.get(plugin_id, DispatchPolicy())
+        health = self.plugin_health[plugin_id]
+
+        if health.in_flight >= policy.max_in_flight:
+            health.rejected += 1
+            logger.warning(
+                f"   ⊘ Plugin '{plugin_id}' rejected: {health.in_flight} invocation(s) "
+                f"already in flight (max_in_flight={policy.max_in_flight})"
+            )
+            return None, {
+                "plugin_id": plugin_id,
+                "success": False,
+                "message": "rejected: too many in-flight invocations",
+            }
+
+        logger.info(f"   ▶ Executing '{plugin_id}' for event '{event}'")
+        health.in_flight += 1
+        start = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(
+                self._execute_plugin(plugin, event, context), timeout=policy.timeout
+            )
+        except asyncio.TimeoutError:
+            health.timeouts += 1
+            logger.error(f"   ✗ Plugin '{plugin_id}' timed out after {policy.timeout}s")
+            return None, {
+                "plugin_id": plugin_id,
+                "success": False,
+                "message": f"timed out after {policy.timeout}s",
+            }
+        except Exception as e:
+            health.failures += 1
+            # CRITICAL: Log exception details
+            logger.error(
+                f"   ✗ Plugin '{plugin_id}' FAILED with exception: {e}",
+                exc_info=True,
+            )
+            return None, {"plugin_id": plugin_id, "success": False, "message": str(e)}
+        finally:
+            health.in_flight -= 1
+            health.latency.observe((time.perf_counter() - start) * 1000)
+
+        if not result:
+            logger.info(f"   ⊘ Plugin '{plugin_id}' returned no result for '{event}'")
+            return None, None
+
+        status_icon = "✓" if result.success else "✗"
+        logger.info(
+            f"   {status_icon} Plugin '{plugin_id}' completed: "
+            f"success={result.success}, message={result.message}"
+        )
+        return result, {
+            "plugin_id": plugin_id,
+            "success": result.success,
+            "message": result.message,
+        }
+
+    def _submit_background(self, plugin_id: str, event: str, context: PluginContext) -> bool:
+        """Schedule a fire-and-forget plugin run. Returns False if the queue is full."""
+        if len(self._background_tasks) >= self._BACKGROUND_MAX_PENDING:
+            self.plugin_health[plugin_id].rejected += 1
+            logger.warning(
+                f"   ⊘ Background queue full ({self._BACKGROUND_MAX_PENDING}), "
+                f"dropping '{plugin_id}' for '{event}'"
+            )
+            return False
+
+        logger.info(f"   ⇢ Queued '{plugin_id}' for '{event}' in background")
+        task = asyncio.ensure_future(self._run_plugin(plugin_id, event, context))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return True
+
+    async def drain_background(self, timeout: float = 30.0) -> int:
+        """Wait for background plugin runs started on this event loop.
+
+        Call before a short-lived event loop (e.g. an RQ job) is closed so that
+        fire-and-forget work is not dropped. Returns the number still pending
+        (and cancelled) after the timeout.
+        """
+        loop = asyncio.get_running_loop()
+        tasks = [t for t in self._background_tasks if t.get_loop() is loop]
+        if not tasks:
+            return 0
+        _, pending = await asyncio.wait(tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        if pending:
+            logger.warning(f"Cancelled {len(pending)} background plugin run(s) after {timeout}s")
+        return len(pending)
+
     _SKIP = ConditionResult(execute=False)
     _PASS = ConditionResult(execute=True)
 
     async def _should_execute(
-        self, plugin: BasePlugin, data: Dict, event: Optional[str] = None
+        self,
+        plugin: BasePlugin,
+        data: Dict,
+        event: Optional[str] = None,
+        plugin_id: Optional[str] = None,
+        matches: Optional[Dict[str, Any]] = None,
     ) -> ConditionResult:
         """Check if plugin should be executed based on condition configuration.
 
@@ -355,6 +455,9 @@ class PluginRouter:
         (e.g. wake word command extraction) that gets merged into a copy of data
         for the plugin's PluginContext — never mutating the shared data dict.
 
+        ``matches`` is the precomputed output of the router's condition
+        matcher for this transcript; it is computed here if not supplied.
+
         Button events bypass transcript-based conditions (wake_word) since they
         have no transcript to match against.
         """
@@ -371,63 +474,28 @@ class PluginRouter:
         ):
             return self._PASS
 
-        elif condition_type == "wake_word":
-            # Normalize transcript for matching (handles punctuation and spacing)
-            transcript = data.get("transcript", "")
-            normalized_transcript = normalize_text_for_wake_word(transcript)
-
-            # Support both singular 'wake_word' and plural 'wake_words' (list)
-            wake_words = plugin.condition.get("wake_words", [])
-            if not wake_words:
-                # Fallback to singular wake_word for backward compatibility
-                wake_word = plugin.condition.get("wake_word", "")
-                if wake_word:
-                    wake_words = [wake_word]
-
-            # Check if transcript starts with any wake word (after normalization)
-            for wake_word in wake_words:
-                normalized_wake_word = normalize_text_for_wake_word(wake_word)
-                if normalized_wake_word and normalized_transcript.startswith(
-                    normalized_wake_word
-                ):
-                    # Smart extraction: find where wake word actually ends in original text
-                    command = extract_command_after_wake_word(transcript, wake_word)
-                    logger.debug(
-                        f"Wake word '{wake_word}' detected. Original: '{transcript}', Command: '{command}'"
-                    )
-                    return ConditionResult(
-                        execute=True,
-                        extra={"command": command, "original_transcript": transcript},
-                    )
-
-            return self._SKIP
-
-        elif condition_type == "keyword_anywhere":
-            # Trigger when keyword appears anywhere in the transcript.
-            # Command is the transcript with the keyword removed.
+        elif condition_type in ("wake_word", "keyword_anywhere"):
+            # wake_word: transcript starts with a wake word, command follows it.
+            # keyword_anywhere: keyword appears anywhere, command is the rest.
             transcript = data.get("transcript", "")
-            normalized_transcript = normalize_text_for_wake_word(transcript)
-
-            keywords = plugin.condition.get("keywords", [])
-            if not keywords:
-                keyword = plugin.condition.get("keyword", "")
-                if keyword:
-                    keywords = [keyword]
-
-            for keyword in keywords:
-                normalized_keyword = normalize_text_for_wake_word(keyword)
-                if normalized_keyword and normalized_keyword in normalized_transcript:
-                    command = extract_command_around_keyword(transcript, keyword)
-                    logger.debug(
-                        f"Keyword '{keyword}' found in transcript. "
-                        f"Original: '{transcript}', Command: '{command}'"
-                    )
-                    return ConditionResult(
-                        execute=True,
-                        extra={"command": command, "original_transcript": transcript},
-                    )
-
-            return self._SKIP
+            if plugin_id in self._condition_matcher.plugin_ids:
+                if matches is None:
+                    matches = self._condition_matcher.match(transcript)
+                match = matches.get(plugin_id)
+            else:
+                match = match_condition(plugin.condition, transcript)
+
+            if not match:
+                return self._SKIP
+
+            logger.debug(
+                f"{condition_type} '{match.pattern}' matched. "
+                f"Original: '{transcript}', Command: '{match.command}'"
+            )
+            return ConditionResult(
+                execute=True,
+                extra={"command": match.command, "original_transcript": transcript},
+            )
 
         elif condition_type == "conditional":
             # Future: Custom condition checking
@@ -567,24 +635,7 @@ class PluginRouter:
         for plugin in self.plugins.values():
             if not plugin.enabled:
                 continue
-            condition = plugin.condition or {}
-            condition_type = condition.get("type", "always")
-
-            words: list[str] = []
-            if condition_type == "wake_word":
-                words = condition.get("wake_words", [])
-                if not words:
-                    w = condition.get("wake_word", "")
-                    if w:
-                        words = [w]
-            elif condition_type == "keyword_anywhere":
-                words = condition.get("keywords", [])
-                if not words:
-                    w = condition.get("keyword", "")
-                    if w:
-                        words = [w]
-
-            for w in words:
+            for w in condition_patterns(plugin.condition or {}):
                 normalised = w.strip().lower()
                 if normalised and normalised not in seen:
                     seen.add(normalised)
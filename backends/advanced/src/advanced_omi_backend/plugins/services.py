@@ -115,6 +115,31 @@ class PluginServices:
         # toggle_star returns a dict on success, JSONResponse on error
         return isinstance(result, dict) and "starred" in result
 
+    async def send_to_device(self, client_id: str, event_type: str, data: dict) -> bool:
+        """Send a command (e.g. LED or audio feedback) to a connected device.
+
+        Works from any process: the message is routed through Redis to the
+        API process holding the device's websocket.
+
+        Args:
+            client_id: Target device client ID
+            event_type: Event type sent to the device (e.g., "led")
+            data: Event payload
+
+        Returns:
+            True if the message reached the device's process
+        """
+        from advanced_omi_backend.client_manager import (
+            get_client_manager,
+            publish_client_message,
+        )
+
+        message = {"type": event_type, "data": data}
+        client_manager = get_client_manager()
+        if client_manager.has_client(client_id):
+            return await client_manager.send_to_client(client_id, message)
+        return await publish_client_message(self._async_redis, client_id, message)
+
     async def call_plugin(
         self,
         plugin_id: str,
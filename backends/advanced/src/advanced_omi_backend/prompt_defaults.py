@@ -397,58 +397,66 @@ If no relevant memories are available, respond normally based on the conversatio
     )
 
     # ------------------------------------------------------------------
-    # conversation.title_summary
+    # conversation.summary
     # ------------------------------------------------------------------
     registry.register_default(
-        "conversation.title_summary",
+        "conversation.summary",
         template="""\
-Based on the full conversation transcript below, generate a concise title and a brief summary.
+Based on the full conversation below, generate a title, a brief summary and a detailed summary.
 
-Respond in this exact format:
-Title: <concise descriptive title, 3-6 words, no speaker names>
-Summary: <brief summary, 1-2 sentences, max 120 characters>
+{{memory_section}}Respond with a JSON object with exactly these keys:
+{
+  "title": "<concise descriptive title, 3-6 words, no speaker names>",
+  "summary": "<brief summary, 1-2 sentences, max 120 characters>",
+  "detailed_summary": "<comprehensive summary of everything discussed>"
+}
 
-Rules:
+Title and summary rules:
 - Title: Maximum 6 words, capture the main topic/theme, no quotes or special characters
 - Summary: Maximum 120 characters, capture key topics and outcomes, use present tense
-{{speaker_instruction}}""",
-        name="Conversation Title & Summary",
-        description="Generates both title and short summary from full conversation context in one LLM call.",
+{{speaker_instruction}}
+Detailed summary rules:
+- We know it's a conversation, so no need to say "This conversation involved..."
+- Provide complete coverage of all topics, points, and important details discussed
+- Correct obvious transcription errors and remove filler words (um, uh, like, you know)
+- Organize information logically by topic or chronologically as appropriate
+- Use clear, well-structured paragraphs or bullet points, but make the length relative to the amount of content.
+- Maintain the meaning and intent of what was said, but improve clarity and coherence
+- Include relevant context, decisions made, action items mentioned, and conclusions reached
+{{detailed_speaker_instruction}}- Write in a natural, flowing narrative style
+- Only include word-for-word quotes if it's more efficient than rephrasing
+- Focus on substantive content - what was actually discussed and decided
+
+The detailed summary should let someone understand everything important that happened in this conversation without reading the full transcript.""",
+        name="Conversation Title & Summaries",
+        description="Generates the title, short summary and detailed summary of a conversation in one LLM call (JSON output).",
         category="conversation",
-        variables=["speaker_instruction"],
+        variables=["speaker_instruction", "detailed_speaker_instruction", "memory_section"],
         is_dynamic=True,
     )
 
     # ------------------------------------------------------------------
-    # conversation.detailed_summary
+    # conversation.summary_chunk
     # ------------------------------------------------------------------
     registry.register_default(
-        "conversation.detailed_summary",
+        "conversation.summary_chunk",
         template="""\
-Generate a comprehensive, detailed summary of this conversation transcript.
-
-{{memory_section}}INSTRUCTIONS:
-Your task is to create a high-quality, detailed summary of a conversation transcription that captures the full information and context of what was discussed. This is NOT a brief summary - provide comprehensive coverage.
+Below is part {{part}} of {{parts}} of a long conversation: either transcript or notes condensed from it. Write notes on this part; they will be combined with the notes on the other parts to summarize the whole conversation.
 
-Rules:
-- We know it's a conversation, so no need to say "This conversation involved..."
-- Provide complete coverage of all topics, points, and important details discussed
-- Correct obvious transcription errors and remove filler words (um, uh, like, you know)
-- Organize information logically by topic or chronologically as appropriate
-- Use clear, well-structured paragraphs or bullet points, but make the length relative to the amound of content.
-- Maintain the meaning and intent of what was said, but improve clarity and coherence
-- Include relevant context, decisions made, action items mentioned, and conclusions reached
-{{speaker_instruction}}- Write in a natural, flowing narrative style
-- Only include word-for-word quotes if it's more efficiency than rephrasing
-- Focus on substantive content - what was actually discussed and decided
+Cover everything substantive, in the order it came up:
+- Topics discussed and the key points made
+- Decisions, agreements, disagreements and conclusions
+- Action items, commitments and deadlines
+- Names, places, numbers and other specifics
+- Who said what, using the speaker names given
 
-Think of this as creating a high-quality information set that someone could use to understand everything important that happened in this conversation without reading the full transcript.
+Correct obvious transcription errors and leave out filler and small talk. Do not add anything that is not in the text. Be dense: the notes should be much shorter than the text.
 
-DETAILED SUMMARY:""",
-        name="Conversation Detailed Summary",
-        description="Generates a comprehensive multi-paragraph summary of a conversation.",
+NOTES:""",
+        name="Conversation Summary Chunk Notes",
+        description="Condenses one part of a long transcript into notes before the conversation is summarized.",
         category="conversation",
-        variables=["speaker_instruction", "memory_section"],
+        variables=["part", "parts"],
         is_dynamic=True,
     )
 
@@ -663,7 +671,7 @@ Each shows what the LLM generated vs what the user preferred:
 1. Identify patterns: Do users prefer shorter/longer titles? Different vocabulary?
    More/less specific? Different framing (noun phrases vs descriptions)?
 2. Revise the prompt to produce titles matching user preferences
-3. Keep the exact output format (Title: ... / Summary: ...) and {{variable}} placeholders
+3. Keep the exact output format (the JSON object and its keys) and {{variable}} placeholders
 4. Add specific style guidance based on the correction patterns
 
 ## Output Format
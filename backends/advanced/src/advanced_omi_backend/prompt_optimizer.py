@@ -10,15 +10,18 @@ import logging
 from typing import Optional
 
 from advanced_omi_backend.models.annotation import AnnotationType
-from advanced_omi_backend.prompt_registry import get_prompt_registry
+from advanced_omi_backend.prompt_registry import RENAMED_PROMPTS, get_prompt_registry
 
 logger = logging.getLogger(__name__)
 
+# User-scoped prompts of renamed prompt IDs already reported by this process
+_reported_legacy_prompts: set[str] = set()
+
 # Maps annotation types to the prompts they optimize and the meta-optimizer
 # prompt used to do the rewriting.
 ANNOTATION_PROMPT_MAP = {
     AnnotationType.TITLE: {
-        "target_prompt": "conversation.title_summary",
+        "target_prompt": "conversation.summary",
         "optimizer_prompt": "prompt_optimization.title_optimizer",
     },
     AnnotationType.MEMORY: {
@@ -40,10 +43,11 @@ async def get_user_prompt(
     2. Global prompt via ``registry.get_prompt(prompt_id)``
 
     Falls back gracefully on any error (LangFuse unavailable, prompt not
-    found, etc.) so callers always get a usable prompt string.
+    found, etc.) so callers always get a usable prompt string. Lookups are
+    served from the registry's prompt cache.
 
     Args:
-        prompt_id: Dotted prompt identifier (e.g. "conversation.title_summary")
+        prompt_id: Dotted prompt identifier (e.g. "conversation.summary")
         user_id: Optional user ID for per-user override lookup
         **variables: Template variables to compile into the prompt
 
@@ -52,13 +56,13 @@ async def get_user_prompt(
     """
     registry = get_prompt_registry()
 
-    # Try user-scoped override when user_id is provided
+    # Try user-scoped override when user_id is provided (missing overrides
+    # are negatively cached by the registry, so this is usually free)
     if user_id:
         user_prompt_name = f"{prompt_id}:user:{user_id}"
         try:
-            client = registry._get_client()
-            if client is not None:
-                prompt_obj = client.get_prompt(user_prompt_name)
+            prompt_obj = await registry.fetch_prompt(user_prompt_name)
+            if prompt_obj is not None:
                 if variables:
                     return prompt_obj.compile(**variables)
                 return prompt_obj.compile()
@@ -67,6 +71,27 @@ async def get_user_prompt(
             logger.debug(
                 f"No user-scoped prompt '{user_prompt_name}', falling back to global"
             )
+        await _report_legacy_user_prompt(prompt_id, user_id)
 
     # Fall back to global prompt (LangFuse override or code default)
     return await registry.get_prompt(prompt_id, **variables)
+
+
+async def _report_legacy_user_prompt(prompt_id: str, user_id: str) -> None:
+    """Warn once when a user's override exists only under a replaced prompt ID."""
+    registry = get_prompt_registry()
+    for old_id, new_id in RENAMED_PROMPTS.items():
+        legacy_name = f"{old_id}:user:{user_id}"
+        if new_id != prompt_id or legacy_name in _reported_legacy_prompts:
+            continue
+        try:
+            found = await registry.fetch_prompt(legacy_name) is not None
+        except Exception:
+            found = False
+        if found:
+            _reported_legacy_prompts.add(legacy_name)
+            logger.warning(
+                f"User-scoped prompt '{legacy_name}' is no longer used; '{prompt_id}' "
+                f"replaced it. Corrections already optimized into it are not carried "
+                f"over; new ones go into '{prompt_id}:user:{user_id}'."
+            )
@@ -3,13 +3,223 @@
 Stores default prompts registered at startup and resolves overrides from
 LangFuse's prompt management. Falls back to defaults when LangFuse is
 unavailable. Admin prompt editing is handled via the LangFuse web UI.
+
+LangFuse lookups go through a process-local TTL cache (``PromptCache``) so
+LLM operations don't make a blocking round trip per call. Missing prompts
+(e.g. per-user overrides that were never created) are cached as misses.
+Invalidation is shared through a Redis counter (``SharedGeneration``), so an
+edit clears the cache of every API process and RQ worker, not only the one
+that handled the request.
 """
 
+import asyncio
+import concurrent.futures
 import logging
-from typing import Dict, List, Optional
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
+PROMPT_CACHE_TTL_SECONDS = float(os.getenv("PROMPT_CACHE_TTL_SECONDS", "300"))
+PROMPT_CACHE_NEGATIVE_TTL_SECONDS = float(os.getenv("PROMPT_CACHE_NEGATIVE_TTL_SECONDS", "600"))
+# How often a process checks Redis for invalidations made by other processes
+PROMPT_CACHE_SYNC_SECONDS = float(os.getenv("PROMPT_CACHE_SYNC_SECONDS", "5"))
+PROMPT_CACHE_GENERATION_KEY = "prompt_cache:generation"
+# Back off this long after Redis is unreachable
+_SYNC_RETRY_SECONDS = 60.0
+
+# Prompts replaced by another with a different output format: overrides of the
+# old prompt can't be used as-is, so they are reported rather than applied
+RENAMED_PROMPTS = {
+    "conversation.title_summary": "conversation.summary",
+    "conversation.detailed_summary": "conversation.summary",
+}
+
+
+@dataclass
+class _CacheEntry:
+    value: Any  # LangFuse prompt object, or None for a cached miss
+    expires_at: float
+
+
+class SharedGeneration:
+    """Redis counter that is bumped whenever any process invalidates prompts.
+
+    Each process remembers the last value it saw and compares at most every
+    ``check_interval`` seconds; a different value means another process
+    invalidated, and the local cache is cleared. Invalidation is therefore
+    whole-cache across processes (per prompt only within the process that
+    handled the edit). Redis errors are logged and ignored; entries then
+    expire through their TTL as before.
+    """
+
+    def __init__(
+        self,
+        redis_client=None,
+        key: str = PROMPT_CACHE_GENERATION_KEY,
+        check_interval: float = PROMPT_CACHE_SYNC_SECONDS,
+    ):
+        self._redis = redis_client
+        self.key = key
+        self.check_interval = check_interval
+        self._seen: Optional[int] = None
+        self._next_check = 0.0
+
+    def _client(self):
+        if self._redis is None:
+            import redis
+
+            self._redis = redis.from_url(
+                os.getenv("REDIS_URL", "redis://localhost:6379/0"),
+                socket_timeout=0.5,
+                socket_connect_timeout=0.5,
+            )
+        return self._redis
+
+    def changed(self) -> bool:
+        """Return True if another process invalidated since the last check."""
+        now = time.monotonic()
+        if now < self._next_check:
+            return False
+        try:
+            value = int(self._client().get(self.key) or 0)
+        except Exception as e:
+            logger.debug(f"Prompt cache generation check failed: {e}")
+            self._next_check = now + _SYNC_RETRY_SECONDS
+            return False
+        self._next_check = now + self.check_interval
+        changed = self._seen is not None and value != self._seen
+        self._seen = value
+        return changed
+
+    def bump(self) -> bool:
+        """Announce an invalidation to other processes.
+
+        Returns:
+            True if other processes had invalidated since the last check
+            (so the caller should clear everything, not just one prompt)
+        """
+        try:
+            value = int(self._client().incr(self.key))
+        except Exception as e:
+            logger.warning(f"Could not broadcast prompt cache invalidation: {e}")
+            return False
+        missed = self._seen is not None and value != self._seen + 1
+        self._seen = value
+        self._next_check = time.monotonic() + self.check_interval
+        return missed
+
+
+class PromptCache:
+    """TTL cache for LangFuse prompt lookups with negative caching.
+
+    - Fresh entries are returned without touching LangFuse.
+    - Expired entries are returned immediately while a refresh runs in the
+      background (stale-while-revalidate).
+    - Misses (lookup raised or returned None) are cached for
+      ``negative_ttl`` seconds.
+    - Concurrent lookups of the same name share one in-flight fetch.
+
+    - With ``shared``, invalidations by other processes clear this cache
+      on the next lookup (see SharedGeneration).
+
+    Fetches run on a small thread pool and are awaited through
+    ``asyncio.wrap_future``, so the cache works from any event loop
+    (including the per-job loops of RQ workers).
+    """
+
+    def __init__(
+        self,
+        ttl: float = PROMPT_CACHE_TTL_SECONDS,
+        negative_ttl: float = PROMPT_CACHE_NEGATIVE_TTL_SECONDS,
+        max_workers: int = 4,
+        shared: Optional[SharedGeneration] = None,
+    ):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.shared = shared
+        self._entries: Dict[str, _CacheEntry] = {}
+        self._inflight: Dict[str, concurrent.futures.Future] = {}
+        self._generation = 0  # Bumped on invalidation; stale fetches are dropped
+        self._lock = threading.Lock()
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="prompt_cache"
+        )
+
+    async def get(self, name: str, loader: Callable[[], Any]) -> Any:
+        """Return the cached value for ``name``, loading it with ``loader`` if needed."""
+        if self.shared is not None and self.shared.changed():
+            removed = self._clear(None)
+            logger.info(f"Prompt cache invalidated by another process ({removed} entries dropped)")
+        entry = self._entries.get(name)
+        if entry is not None:
+            if time.monotonic() >= entry.expires_at:
+                self._submit(name, loader)  # Refresh in the background
+            return entry.value
+        return await asyncio.wrap_future(self._submit(name, loader))
+
+    def _submit(self, name: str, loader: Callable[[], Any]) -> concurrent.futures.Future:
+        with self._lock:
+            future = self._inflight.get(name)
+            if future is None:
+                future = self._executor.submit(self._load, name, loader, self._generation)
+                self._inflight[name] = future
+            return future
+
+    def _load(self, name: str, loader: Callable[[], Any], generation: int) -> Any:
+        try:
+            value = loader()
+        except Exception as e:
+            logger.debug(f"Prompt lookup for '{name}' failed (caching miss): {e}")
+            value = None
+
+        with self._lock:
+            self._inflight.pop(name, None)
+            if value is None:
+                # Keep serving a previously found prompt over a failed refresh
+                previous = self._entries.get(name)
+                value = previous.value if previous is not None else None
+            if generation == self._generation:
+                ttl = self.ttl if value is not None else self.negative_ttl
+                self._entries[name] = _CacheEntry(value, time.monotonic() + ttl)
+        return value
+
+    def invalidate(self, name: Optional[str] = None) -> int:
+        """Drop one entry (and its per-user overrides), or everything if ``name`` is None.
+
+        Also tells other processes to drop their caches when ``shared`` is set.
+
+        Returns:
+            Number of entries removed
+        """
+        if self.shared is not None and self.shared.bump():
+            name = None  # Missed another process's invalidation; clear everything
+        return self._clear(name)
+
+    def _clear(self, name: Optional[str]) -> int:
+        with self._lock:
+            self._generation += 1
+            if name is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                return removed
+            keys = [k for k in self._entries if k == name or k.startswith(f"{name}:user:")]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def stats(self) -> Dict[str, int]:
+        """Entry counts for diagnostics."""
+        entries = list(self._entries.values())
+        return {
+            "entries": len(entries),
+            "misses_cached": sum(1 for e in entries if e.value is None),
+            "in_flight": len(self._inflight),
+        }
+
 
 class PromptRegistry:
     """Registry that holds default prompts and resolves overrides from LangFuse."""
@@ -17,6 +227,7 @@ class PromptRegistry:
     def __init__(self):
         self._defaults: Dict[str, str] = {}  # prompt_id -> default template text
         self._langfuse = None  # Lazy-init LangFuse client
+        self.cache = PromptCache(shared=SharedGeneration())
 
     def register_default(
         self,
@@ -46,6 +257,32 @@ class PromptRegistry:
                 return None
         return self._langfuse
 
+    async def fetch_prompt(self, name: str, fallback: Optional[str] = None) -> Any:
+        """Return the LangFuse prompt object for ``name`` via the cache.
+
+        Returns None when LangFuse is unavailable or the prompt doesn't exist.
+        """
+        client = self._get_client()
+        if client is None:
+            return None
+        if fallback is None:
+            return await self.cache.get(name, lambda: client.get_prompt(name))
+
+        def load():
+            prompt_obj = client.get_prompt(name, fallback=fallback)
+            # The SDK returns the fallback when the fetch fails; cache that as a miss
+            return None if getattr(prompt_obj, "is_fallback", False) else prompt_obj
+
+        return await self.cache.get(name, load)
+
+    def invalidate(self, prompt_id: Optional[str] = None) -> int:
+        """Invalidate cached prompts after an edit (all prompts if ``prompt_id`` is None)."""
+        removed = self.cache.invalidate(prompt_id)
+        logger.info(
+            f"Invalidated {removed} cached prompt(s)" + (f" for '{prompt_id}'" if prompt_id else "")
+        )
+        return removed
+
     async def get_prompt(self, prompt_id: str, **variables) -> str:
         """Return prompt text from LangFuse with fallback to default.
 
@@ -54,12 +291,11 @@ class PromptRegistry:
         """
         template_text = None
 
-        # Try LangFuse first
+        # Try LangFuse first (cached)
         try:
-            client = self._get_client()
-            if client is not None:
-                fallback = self._defaults.get(prompt_id, "")
-                prompt_obj = client.get_prompt(prompt_id, fallback=fallback)
+            fallback = self._defaults.get(prompt_id, "")
+            prompt_obj = await self.fetch_prompt(prompt_id, fallback=fallback)
+            if prompt_obj is not None:
                 if variables:
                     return prompt_obj.compile(**variables)
                 return prompt_obj.compile()
@@ -111,12 +347,24 @@ class PromptRegistry:
                     prompt=template_text,
                     labels=["production"],
                 )
+                self.cache.invalidate(prompt_id)
                 seeded += 1
             except Exception as e:
                 logger.warning(f"Failed to seed prompt '{prompt_id}': {e}")
 
         logger.info(f"Prompt seeding complete: {seeded} created, {skipped} unchanged")
 
+        for old_id, new_id in RENAMED_PROMPTS.items():
+            try:
+                client.get_prompt(old_id)
+            except Exception:
+                continue  # Not in LangFuse
+            logger.warning(
+                f"Prompt '{old_id}' is no longer used, it was replaced by '{new_id}'. "
+                f"Move any edits into '{new_id}' (keeping its output format) and "
+                f"archive '{old_id}'."
+            )
+
 
 # ---------------------------------------------------------------------------
 # Singleton
@@ -975,6 +975,8 @@ async def apply_diarization_annotations(
         active_transcript = conversation.active_transcript
         if not active_transcript:
             raise HTTPException(status_code=404, detail="No active transcript found")
+        # Words are copied into the new version
+        await conversation.load_transcript_versions([active_transcript.version_id])
 
         # Create NEW transcript version with corrected speakers
         import uuid
@@ -1117,6 +1119,8 @@ async def apply_all_annotations(
         active_transcript = conversation.active_transcript
         if not active_transcript:
             raise HTTPException(status_code=404, detail="No active transcript found")
+        # Words are copied into the new version
+        await conversation.load_transcript_versions([active_transcript.version_id])
 
         # Create new version with ALL corrections applied
         import uuid
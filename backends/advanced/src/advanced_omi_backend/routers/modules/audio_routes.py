@@ -11,6 +11,7 @@ from typing import Optional
 
 from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, UploadFile
 from fastapi.responses import FileResponse, Response, StreamingResponse
+from pydantic import BaseModel, Field
 
 from advanced_omi_backend.app_config import get_audio_chunk_dir
 from advanced_omi_backend.auth import (
@@ -35,6 +36,13 @@ from advanced_omi_backend.utils.gdrive_audio_utils import (
 router = APIRouter(prefix="/audio", tags=["audio"])
 
 
+class BackfillStartRequest(BaseModel):
+    upload_id: str = Field(..., min_length=1, max_length=200, description="Stable client-chosen ID of the recording")
+    recorded_at: float = Field(..., gt=0, description="Capture time of the first sample (Unix seconds)")
+    device_name: str = Field(default="wearable", description="Device the audio was recorded on")
+    title: Optional[str] = None
+
+
 def _safe_filename(conversation: "Conversation") -> str:
     """Build a filesystem-safe filename from the conversation title, falling back to ID."""
     title = conversation.title
@@ -404,3 +412,61 @@ async def upload_audio_files(
     return await audio_controller.upload_and_process_audio_files(
         current_user, files, device_name
     )
+
+
+@router.post("/backfill")
+async def start_backfill_upload(
+    request: BackfillStartRequest,
+    current_user: User = Depends(current_superuser),
+):
+    """
+    Start or resume a backfill upload of audio recorded offline on a device. Admin only.
+
+    Creates a conversation dated at the recording's capture time (or returns
+    the existing one for the same ``upload_id``) together with ``next_part``,
+    the first part the backend still needs.
+    """
+    return await audio_controller.start_backfill_upload(
+        current_user,
+        upload_id=request.upload_id,
+        recorded_at=request.recorded_at,
+        device_name=request.device_name,
+        title=request.title,
+    )
+
+
+@router.get("/backfill/{conversation_id}")
+async def get_backfill_upload(
+    conversation_id: str,
+    current_user: User = Depends(current_superuser),
+):
+    """Get the progress of a backfill upload. Admin only."""
+    return await audio_controller.get_backfill_upload(current_user, conversation_id)
+
+
+@router.post("/backfill/{conversation_id}/parts")
+async def upload_backfill_parts(
+    conversation_id: str,
+    current_user: User = Depends(current_superuser),
+    files: list[UploadFile] = File(...),
+    first_part: int = Query(..., ge=0, description="Part index of the first file"),
+):
+    """
+    Upload consecutive Ogg/Opus parts (up to 30s each) of a backfill upload. Admin only.
+
+    Parts are stored as audio chunks without re-encoding. Parts the backend
+    already has are skipped, so resending from the last confirmed
+    ``next_part`` is always safe.
+    """
+    return await audio_controller.upload_backfill_parts(
+        current_user, conversation_id, first_part, files
+    )
+
+
+@router.post("/backfill/{conversation_id}/complete")
+async def complete_backfill_upload(
+    conversation_id: str,
+    current_user: User = Depends(current_superuser),
+):
+    """Finish a backfill upload and start transcription and memory processing. Admin only."""
+    return await audio_controller.complete_backfill_upload(current_user, conversation_id)
@@ -402,7 +402,6 @@ async def _stream_openai_format(
     completion_id: str, created: int, model_name: str,
 ):
     """Map internal streaming events to OpenAI SSE chunk format."""
-    previous_text = ""
     try:
         async for event in chat_service.generate_response_stream(
             session_id=session_id,
@@ -427,10 +426,8 @@ async def _stream_openai_format(
                 yield f"data: {chunk.model_dump_json()}\n\n"
 
             elif event_type == "token":
-                # Internal events carry accumulated text; compute delta
-                accumulated = event["data"]
-                delta_text = accumulated[len(previous_text):]
-                previous_text = accumulated
+                # Internal token events carry only the new text
+                delta_text = event["data"]
                 if delta_text:
                     chunk = ChatCompletionChunk(
                         id=completion_id, created=created, model=model_name,
@@ -451,6 +448,7 @@ async def _stream_openai_format(
                         "session_id": session_id,
                         "message_id": event["data"].get("message_id"),
                         "memories_used": event["data"].get("memories_used", []),
+                        "metrics": event["data"].get("metrics"),
                     },
                 )
                 yield f"data: {chunk.model_dump_json()}\n\n"
@@ -478,7 +476,7 @@ async def _non_streaming_response(
     completion_id: str, created: int, model_name: str,
 ) -> ChatCompletionResponse:
     """Collect all events and return a single ChatCompletionResponse."""
-    full_content = ""
+    content_parts: List[str] = []
     metadata: Dict[str, Any] = {"session_id": session_id}
 
     async for event in chat_service.generate_response_stream(
@@ -492,10 +490,11 @@ async def _non_streaming_response(
         if event_type == "memory_context":
             metadata.update(event["data"])
         elif event_type == "token":
-            full_content = event["data"]  # accumulated text
+            content_parts.append(event["data"])
         elif event_type == "complete":
             metadata["message_id"] = event["data"].get("message_id")
             metadata["memories_used"] = event["data"].get("memories_used", [])
+            metadata["metrics"] = event["data"].get("metrics")
         elif event_type == "error":
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -507,7 +506,7 @@ async def _non_streaming_response(
         created=created,
         model=model_name,
         choices=[ChatCompletionChoice(
-            message=ChatCompletionMessage(role="assistant", content=full_content.strip()),
+            message=ChatCompletionMessage(role="assistant", content="".join(content_parts).strip()),
         )],
         usage={"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
         session_id=session_id,
@@ -38,12 +38,13 @@ async def get_conversations(
     offset: int = Query(0, ge=0, description="Number of conversations to skip"),
     sort_by: str = Query("created_at", description="Sort field: created_at, title, audio_total_duration"),
     sort_order: str = Query("desc", description="Sort direction: asc or desc"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page (replaces offset)"),
     current_user: User = Depends(current_active_user)
 ):
     """Get conversations. Admins see all conversations, users see only their own."""
     return await conversation_controller.get_conversations(
         current_user, include_deleted, include_unprocessed, starred_only, limit, offset,
-        sort_by=sort_by, sort_order=sort_order,
+        sort_by=sort_by, sort_order=sort_order, cursor=cursor,
     )
 
 
@@ -53,10 +54,13 @@ async def search_conversations(
     q: str = Query(..., min_length=1, description="Text search query"),
     limit: int = Query(50, ge=1, le=200, description="Max results to return"),
     offset: int = Query(0, ge=0, description="Number of results to skip"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page (replaces offset)"),
     current_user: User = Depends(current_active_user),
 ):
     """Full-text search across conversation titles, summaries, and transcripts."""
-    return await conversation_controller.search_conversations(q, current_user, limit, offset)
+    return await conversation_controller.search_conversations(
+        q, current_user, limit, offset, cursor=cursor
+    )
 
 
 @router.get("/{conversation_id}")
@@ -91,10 +95,18 @@ async def reprocess_orphan(
 
 @router.post("/{conversation_id}/reprocess-transcript")
 async def reprocess_transcript(
-    conversation_id: str, current_user: User = Depends(current_active_user)
+    conversation_id: str,
+    current_user: User = Depends(current_active_user),
+    regenerate_summary: bool = Query(default=False),
 ):
-    """Reprocess transcript for a conversation. Users can only reprocess their own conversations."""
-    return await conversation_controller.reprocess_transcript(conversation_id, current_user)
+    """Reprocess transcript for a conversation. Users can only reprocess their own conversations.
+
+    The title and summaries are only regenerated if the transcript, speakers,
+    prompt or model changed, unless ``regenerate_summary`` is set.
+    """
+    return await conversation_controller.reprocess_transcript(
+        conversation_id, current_user, regenerate_summary
+    )
 
 
 @router.post("/{conversation_id}/reprocess-memory")
@@ -111,7 +123,8 @@ async def reprocess_memory(
 async def reprocess_speakers(
     conversation_id: str,
     current_user: User = Depends(current_active_user),
-    transcript_version_id: str = Query(default="active")
+    transcript_version_id: str = Query(default="active"),
+    regenerate_summary: bool = Query(default=False),
 ):
     """
     Re-run speaker identification/diarization on existing transcript.
@@ -122,6 +135,7 @@ async def reprocess_speakers(
     Args:
         conversation_id: Conversation to reprocess
         transcript_version_id: Which transcript version to use as source (default: "active")
+        regenerate_summary: Regenerate the title/summaries even if speakers are unchanged
 
     Returns:
         Job status with job_id and new version_id
@@ -129,7 +143,8 @@ async def reprocess_speakers(
     return await conversation_controller.reprocess_speakers(
         conversation_id,
         transcript_version_id,
-        current_user
+        current_user,
+        regenerate_summary,
     )
 
 
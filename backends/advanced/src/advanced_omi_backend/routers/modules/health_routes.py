@@ -137,7 +137,7 @@ async def health_check():
                 transcription_provider.mode if transcription_provider else "none"
             ),
             "chunk_dir": str(os.getenv("CHUNK_DIR", "./audio_chunks")),
-            "active_clients": get_client_manager().get_client_count(),
+            "active_clients": await get_client_manager().get_registered_client_count(),
             "new_conversation_timeout_minutes": float(
                 os.getenv("NEW_CONVERSATION_TIMEOUT_MINUTES", "1.5")
             ),
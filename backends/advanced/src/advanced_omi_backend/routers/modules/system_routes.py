@@ -641,3 +641,17 @@ async def set_memory_provider(
 
 # ── Prompt Management ──────────────────────────────────────────────────────
 # Prompt editing is now handled via the LangFuse web UI at http://localhost:3002/prompts
+
+
+@router.post("/admin/prompts/cache/invalidate")
+async def invalidate_prompt_cache(
+    prompt_id: Optional[str] = Body(None, embed=True),
+    current_user: User = Depends(current_superuser),
+):
+    """Invalidate cached prompts after editing them in LangFuse. Admin only.
+
+    Omit ``prompt_id`` to clear the whole cache. Other API processes and
+    workers drop their caches within PROMPT_CACHE_SYNC_SECONDS. Prompts
+    otherwise refresh on their own after PROMPT_CACHE_TTL_SECONDS.
+    """
+    return await system_controller.invalidate_prompt_cache(prompt_id)
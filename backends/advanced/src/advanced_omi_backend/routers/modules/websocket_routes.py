@@ -13,6 +13,7 @@ from advanced_omi_backend.controllers.websocket_controller import (
     handle_omi_websocket,
     handle_pcm_websocket,
 )
+from advanced_omi_backend.utils.wyoming_framing import SUPPORTED_FRAMINGS
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +26,7 @@ async def ws_endpoint(
     codec: str = Query("pcm"),
     token: Optional[str] = Query(None),
     device_name: Optional[str] = Query(None),
+    framing: str = Query("wyoming"),
 ):
     """
     WebSocket endpoint for audio streaming with multiple codec support.
@@ -33,10 +35,14 @@ async def ws_endpoint(
         codec: Audio codec (pcm, opus). Default: pcm
         token: JWT auth token
         device_name: Device identifier
+        framing: Audio chunk framing (wyoming, binary). Default: wyoming.
+            "binary" sends each audio chunk as one binary message with a
+            compact header; the ready message echoes the accepted framing.
 
     Examples:
         /ws?codec=pcm&token=xxx&device_name=laptop
         /ws?codec=opus&token=xxx&device_name=omi-device
+        /ws?codec=opus&framing=binary&token=xxx&device_name=omi-device
     """
     # Validate and normalize codec
     codec = codec.lower()
@@ -45,8 +51,17 @@ async def ws_endpoint(
         await ws.close(code=1008, reason=f"Unsupported codec: {codec}. Supported: pcm, opus")
         return
 
+    framing = framing.lower()
+    if framing not in SUPPORTED_FRAMINGS:
+        logger.warning(f"Unsupported framing requested: {framing}")
+        await ws.close(
+            code=1008,
+            reason=f"Unsupported framing: {framing}. Supported: {', '.join(SUPPORTED_FRAMINGS)}",
+        )
+        return
+
     # Route to appropriate handler
     if codec == "opus":
-        await handle_omi_websocket(ws, token, device_name)
+        await handle_omi_websocket(ws, token, device_name, framing)
     else:
-        await handle_pcm_websocket(ws, token, device_name)
\ No newline at end of file
+        await handle_pcm_websocket(ws, token, device_name, framing)
\ No newline at end of file
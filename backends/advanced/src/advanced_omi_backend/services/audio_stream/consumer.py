@@ -12,6 +12,8 @@ from abc import ABC, abstractmethod
 import redis.asyncio as redis
 from redis import exceptions as redis_exceptions
 
+from .segments import get_chunk_audio
+
 logger = logging.getLogger(__name__)
 
 
@@ -288,7 +290,7 @@ class BaseAudioStreamConsumer(ABC):
         """
         try:
             # Extract message data
-            audio_data = fields[b"audio_data"]
+            audio_data = get_chunk_audio(fields)
             session_id = fields[b"session_id"].decode()
             chunk_id = fields[b"chunk_id"].decode()
             sample_rate = int(fields[b"sample_rate"].decode())
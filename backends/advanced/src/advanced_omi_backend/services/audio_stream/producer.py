@@ -5,9 +5,12 @@ Audio stream producer - publishes audio chunks to Redis Streams.
 import json
 import logging
 import time
+from pathlib import Path
 
 import redis.asyncio as redis
 
+from .segments import TRANSPORT_SEGMENT, AudioSegmentWriter
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,17 +23,37 @@ class AudioStreamProducer:
     Multiple workers can consume from the same stream using consumer groups for horizontal scaling.
     Buffers incoming audio and creates fixed-size chunks aligned to sample boundaries.
     This prevents cutting audio mid-word and improves transcription accuracy.
+
+    With the ``segment`` transport (``backend.audio_stream.transport``) chunks are
+    appended to a per-session segment file and entries carry only the offset.
     """
 
-    def __init__(self, redis_client: redis.Redis):
+    def __init__(self, redis_client: redis.Redis, audio_stream_settings: dict = None):
         """
         Initialize producer.
 
         Args:
             redis_client: Connected Redis client
+            audio_stream_settings: Transport settings (defaults to config)
         """
         self.redis_client = redis_client
 
+        if audio_stream_settings is None:
+            from advanced_omi_backend.config import get_audio_stream_settings
+
+            audio_stream_settings = get_audio_stream_settings()
+        self.transport = audio_stream_settings["transport"]
+        self.segment_writer = None
+        if self.transport == TRANSPORT_SEGMENT:
+            self.segment_writer = AudioSegmentWriter(
+                Path(audio_stream_settings["segment_path"]),
+                audio_stream_settings["segment_retention_seconds"],
+                audio_stream_settings["segment_max_file_bytes"],
+            )
+            logger.info(
+                f"Audio stream transport: segment files in {audio_stream_settings['segment_path']}"
+            )
+
         # Per-session audio buffers for sample-aligned chunking
         # {session_id: {"buffer": bytes, "chunk_count": int, "stream_name": str, ...}}
         self.session_buffers = {}
@@ -94,6 +117,9 @@ class AudioStreamProducer:
         # No TTL — sessions live until explicitly cleaned up via finalize_session()
         # or mark_session_complete(). TTLs destroy state mid-session, causing zombie jobs.
 
+        if self.segment_writer:
+            self.segment_writer.cleanup_expired()
+
         # Initialize audio buffer for this session
         self.session_buffers[session_id] = {
             "buffer": b"",
@@ -264,10 +290,23 @@ class AudioStreamProducer:
 
             # Clean up session buffer
             del self.session_buffers[session_id]
+            if self.segment_writer:
+                self.segment_writer.close(session_id)
             logger.debug(f"🧹 Cleaned up buffer for session {session_id}")
 
         logger.info(f"📊 Marked session {session_id} as finalizing")
 
+    def _audio_fields(self, session_id: str, chunk_audio: bytes) -> dict:
+        """Stream entry fields carrying a chunk's audio (inline or as a segment offset)."""
+        if self.segment_writer:
+            name, offset = self.segment_writer.append(session_id, chunk_audio)
+            return {
+                b"segment_name": name.encode(),
+                b"segment_offset": str(offset).encode(),
+                b"segment_length": str(len(chunk_audio)).encode(),
+            }
+        return {b"audio_data": chunk_audio}
+
     async def add_audio_chunk(
         self,
         audio_data: bytes,
@@ -334,7 +373,7 @@ class AudioStreamProducer:
 
             # Prepare chunk data
             chunk_data = {
-                b"audio_data": chunk_audio,
+                **self._audio_fields(session_id, chunk_audio),
                 b"session_id": session_id.encode(),
                 b"chunk_id": chunk_id_formatted.encode(),
                 b"user_id": user_id.encode(),
@@ -417,7 +456,7 @@ class AudioStreamProducer:
 
             # Prepare chunk data
             chunk_data = {
-                b"audio_data": chunk_audio,
+                **self._audio_fields(session_id, chunk_audio),
                 b"session_id": session_id.encode(),
                 b"chunk_id": chunk_id_formatted.encode(),
                 b"user_id": session_buffer["user_id"].encode(),
@@ -0,0 +1,177 @@
+"""
+Per-session PCM segment files for the ``segment`` audio stream transport.
+
+With ``backend.audio_stream.transport: segment`` the producer appends each PCM
+chunk once to ``{segment_path}/{session_id}.pcm`` and the
+``audio:stream:{client_id}`` entry carries ``segment_offset`` and
+``segment_length`` instead of the audio bytes. Readers resolve entries with
+``get_chunk_audio``, which handles both transports, so entries written before a
+transport switch stay readable.
+
+A session's file rolls over to ``{session_id}.{n}.pcm`` once it reaches the
+size cap, and entries name the file they point into (``segment_name``), so
+long sessions don't grow one file without bound. Files no longer written to are
+deleted after the retention period.
+"""
+
+import logging
+import mmap
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+TRANSPORT_REDIS = "redis"
+TRANSPORT_SEGMENT = "segment"
+
+
+def segment_file(segment_dir: Path, name: str) -> Path:
+    """Path of a segment file (see ``segment_name``)."""
+    return segment_dir / f"{name}.pcm"
+
+
+def segment_name(session_id: str, part: int) -> str:
+    """Name of a session's ``part``-th segment file (the first keeps the plain name)."""
+    return session_id if part == 0 else f"{session_id}.{part}"
+
+
+class AudioSegmentWriter:
+    """Appends PCM chunks to per-session segment files."""
+
+    def __init__(
+        self,
+        segment_dir: Path,
+        retention_seconds: int = 7200,
+        max_file_bytes: int = 64 * 1024 * 1024,
+    ):
+        self.segment_dir = Path(segment_dir)
+        self.retention_seconds = retention_seconds
+        self.max_file_bytes = max_file_bytes
+        self.segment_dir.mkdir(parents=True, exist_ok=True)
+        # {session_id: [unbuffered file, next offset, part]}
+        self._files: Dict[str, list] = {}
+
+    def append(self, session_id: str, audio: bytes) -> Tuple[str, int]:
+        """Append a chunk and return the segment file name and offset it was written at.
+
+        The file is unbuffered, so the bytes are visible to readers in other
+        processes before the stream entry pointing at them is published. A file
+        that reached ``max_file_bytes`` is closed and the chunk starts the next one.
+        """
+        entry = self._files.get(session_id)
+        if entry is not None and entry[1] and entry[1] + len(audio) > self.max_file_bytes:
+            entry[0].close()
+            entry = self._open(session_id, entry[2] + 1)
+            # Long sessions also expire their own earlier files
+            self.cleanup_expired()
+        elif entry is None:
+            entry = self._open(session_id, 0)
+        handle, offset, part = entry
+        handle.write(audio)
+        entry[1] = offset + len(audio)
+        return segment_name(session_id, part), offset
+
+    def _open(self, session_id: str, part: int) -> list:
+        path = segment_file(self.segment_dir, segment_name(session_id, part))
+        handle = open(path, "ab", buffering=0)
+        entry = self._files[session_id] = [handle, handle.seek(0, os.SEEK_END), part]
+        return entry
+
+    def close(self, session_id: str) -> None:
+        """Close a session's file; it stays on disk for late readers until it expires."""
+        entry = self._files.pop(session_id, None)
+        if entry:
+            entry[0].close()
+
+    def cleanup_expired(self) -> int:
+        """Delete segment files not written to within the retention period."""
+        cutoff = time.time() - self.retention_seconds
+        open_names = {
+            segment_name(session_id, entry[2]) for session_id, entry in self._files.items()
+        }
+        removed = 0
+        for path in self.segment_dir.glob("*.pcm"):
+            if path.stem in open_names:
+                continue
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except FileNotFoundError:
+                continue
+        if removed:
+            logger.info(f"🧹 Removed {removed} expired audio segment files")
+        return removed
+
+
+class AudioSegmentReader:
+    """Reads chunks from segment files through a small LRU of memory maps."""
+
+    MAX_OPEN_MAPS = 64
+
+    def __init__(self, segment_dir: Path):
+        self.segment_dir = Path(segment_dir)
+        self._maps: "OrderedDict[str, mmap.mmap]" = OrderedDict()
+
+    def read(self, name: str, offset: int, length: int) -> bytes:
+        """Return ``length`` bytes at ``offset`` of segment file ``name``.
+
+        Empty if the file is gone (expired) or too short.
+        """
+        mapped = self._maps.get(name)
+        if mapped is None or offset + length > len(mapped):
+            mapped = self._map(name)
+            if mapped is None or offset + length > len(mapped):
+                logger.warning(f"Audio segment {name} missing bytes {offset}-{offset + length}")
+                return b""
+        self._maps.move_to_end(name)
+        return mapped[offset : offset + length]
+
+    def _map(self, name: str) -> Optional[mmap.mmap]:
+        """(Re)map a segment file at its current size; the file grows while live."""
+        old = self._maps.pop(name, None)
+        if old is not None:
+            old.close()
+        try:
+            with open(segment_file(self.segment_dir, name), "rb") as handle:
+                mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except (FileNotFoundError, ValueError):
+            # ValueError: empty file cannot be mapped
+            return None
+        self._maps[name] = mapped
+        while len(self._maps) > self.MAX_OPEN_MAPS:
+            self._maps.popitem(last=False)[1].close()
+        return mapped
+
+
+_reader: Optional[AudioSegmentReader] = None
+
+
+def _get_reader() -> AudioSegmentReader:
+    global _reader
+    if _reader is None:
+        from advanced_omi_backend.config import get_audio_stream_settings
+
+        _reader = AudioSegmentReader(Path(get_audio_stream_settings()["segment_path"]))
+    return _reader
+
+
+def _field(fields: dict, name: str):
+    value = fields.get(name.encode())
+    return fields.get(name) if value is None else value
+
+
+def get_chunk_audio(fields: dict) -> bytes:
+    """Return a stream entry's PCM, from the entry itself or from its segment file."""
+    offset = _field(fields, "segment_offset")
+    if offset is None:
+        return _field(fields, "audio_data") or b""
+
+    # Entries written before files rolled over only carry the session ID
+    name = _field(fields, "segment_name") or _field(fields, "session_id")
+    if isinstance(name, bytes):
+        name = name.decode()
+    return _get_reader().read(name, int(offset), int(_field(fields, "segment_length")))
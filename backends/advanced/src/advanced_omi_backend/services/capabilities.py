@@ -81,7 +81,7 @@ def check_requirements(
     available: Set[FeatureRequirement] = set()
 
     # Check what's available in the transcript
-    if transcript.words:
+    if transcript.words or transcript.word_count:
         available.add(FeatureRequirement.WORDS)
     if transcript.segments:
         available.add(FeatureRequirement.SEGMENTS)
@@ -164,7 +164,7 @@ def should_run_pyannote_diarization(
         return True, "Provider has word timestamps, can run pyannote"
 
     # Check if words exist in transcript (legacy check)
-    if transcript_version.words:
+    if transcript_version.words or transcript_version.word_count:
         return True, "Words available in transcript"
 
     return False, "No word timestamps available for diarization"
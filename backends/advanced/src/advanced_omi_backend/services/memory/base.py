@@ -14,7 +14,13 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Tuple
 
-__all__ = ["MemoryEntry", "MemoryServiceBase", "LLMProviderBase", "VectorStoreBase"]
+__all__ = [
+    "MemoryBatchItem",
+    "MemoryEntry",
+    "MemoryServiceBase",
+    "LLMProviderBase",
+    "VectorStoreBase",
+]
 
 
 @dataclass
@@ -65,6 +71,25 @@ class MemoryEntry:
         }
 
 
+@dataclass
+class MemoryBatchItem:
+    """One transcript to process in ``MemoryServiceBase.add_memories_batch``.
+
+    Attributes:
+        transcript: Raw transcript text to extract memories from
+        client_id: Client identifier
+        source_id: Source (conversation) identifier; results are keyed by it
+        user_id: User identifier
+        user_email: User email address
+    """
+
+    transcript: str
+    client_id: str
+    source_id: str
+    user_id: str
+    user_email: str
+
+
 class MemoryServiceBase(ABC):
     """Abstract base class defining the core memory service interface.
 
@@ -265,6 +290,39 @@ class MemoryServiceBase(ABC):
             transcript, client_id, source_id, user_id, user_email, allow_update=True
         )
 
+    async def add_memories_batch(
+        self, items: List[MemoryBatchItem], allow_update: bool = False
+    ) -> Dict[str, Tuple[bool, List[str]]]:
+        """Add memories for several transcripts at once.
+
+        Used by batch memory processing (imports, bulk reprocessing). The
+        default implementation calls ``add_memory`` for each item in turn.
+        Providers that can share embedding, search and update-proposal calls
+        across transcripts should override this method.
+
+        Args:
+            items: Transcripts to process
+            allow_update: Whether to allow updating existing memories
+
+        Returns:
+            Dict mapping each item's ``source_id`` to the ``add_memory``
+            result tuple. An item that raised maps to ``(False, [])``.
+        """
+        results: Dict[str, Tuple[bool, List[str]]] = {}
+        for item in items:
+            try:
+                results[item.source_id] = await self.add_memory(
+                    item.transcript,
+                    item.client_id,
+                    item.source_id,
+                    item.user_id,
+                    item.user_email,
+                    allow_update=allow_update,
+                )
+            except Exception:
+                results[item.source_id] = (False, [])
+        return results
+
     @abstractmethod
     async def delete_memory(
         self,
@@ -495,6 +553,32 @@ class VectorStoreBase(ABC):
         """
         pass
 
+    async def search_memories_batch(
+        self,
+        query_embeddings: List[List[float]],
+        user_id: str,
+        limit: int,
+        score_threshold: float = 0.0,
+    ) -> List[List[MemoryEntry]]:
+        """Run several similarity searches for one user.
+
+        Default implementation calls ``search_memories`` for each embedding.
+        Vector stores should override this to send all queries in one request.
+
+        Args:
+            query_embeddings: Query vectors
+            user_id: User identifier to filter results
+            limit: Maximum number of results per query
+            score_threshold: Minimum similarity score (0.0 = no threshold)
+
+        Returns:
+            One result list per query embedding, in the same order
+        """
+        return [
+            await self.search_memories(embedding, user_id, limit, score_threshold)
+            for embedding in query_embeddings
+        ]
+
     @abstractmethod
     async def get_memories(self, user_id: str, limit: int) -> List[MemoryEntry]:
         """Get all memories for a user without similarity filtering.
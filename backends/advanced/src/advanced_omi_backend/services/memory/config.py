@@ -117,6 +117,9 @@ def create_qdrant_config(
     port: int = 6333,
     collection_name: str = "chronicle_memories",
     embedding_dims: int = 1536,
+    quantization: Optional[str] = None,
+    oversampling: float = 2.0,
+    upsert_batch_size: int = 256,
 ) -> Dict[str, Any]:
     """Create Qdrant vector store configuration."""
     return {
@@ -124,6 +127,9 @@ def create_qdrant_config(
         "port": port,
         "collection_name": collection_name,
         "embedding_dims": embedding_dims,
+        "quantization": quantization,
+        "oversampling": oversampling,
+        "upsert_batch_size": upsert_batch_size,
     }
 
 
@@ -207,6 +213,9 @@ def build_memory_config_from_env() -> MemoryConfig:
             port=port,
             collection_name=collection_name,
             embedding_dims=embedding_dims,
+            quantization=vs_def.model_params.get("quantization"),
+            oversampling=float(vs_def.model_params.get("oversampling", 2.0)),
+            upsert_batch_size=int(vs_def.model_params.get("upsert_batch_size", 256)),
         )
         vector_store_provider_enum = VectorStoreProvider.QDRANT
 
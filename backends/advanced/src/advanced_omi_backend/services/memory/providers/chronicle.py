@@ -7,11 +7,18 @@ functionality.
 
 import asyncio
 import logging
+import math
 import time
 import uuid
-from typing import Any, List, Optional, Tuple
-
-from ..base import LLMProviderBase, MemoryEntry, MemoryServiceBase, VectorStoreBase
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..base import (
+    LLMProviderBase,
+    MemoryBatchItem,
+    MemoryEntry,
+    MemoryServiceBase,
+    VectorStoreBase,
+)
 from ..config import LLMProvider as LLMProviderEnum
 from ..config import MemoryConfig, VectorStoreProvider
 from .llm_providers import OpenAIProvider
@@ -39,6 +46,11 @@ class MemoryService(MemoryServiceBase):
         _initialized: Whether the service has been initialized
     """
 
+    # Batch processing limits (see add_memories_batch)
+    BATCH_EXTRACTION_CONCURRENCY = 4
+    EMBEDDING_BATCH_SIZE = 256
+    UPDATE_PROPOSAL_MAX_FACTS = 40
+
     @property
     def provider_identifier(self) -> str:
         return "chronicle"
@@ -155,33 +167,8 @@ class MemoryService(MemoryServiceBase):
                 memory_logger.info(f"Skipping empty transcript for {source_id}")
                 return True, []
 
-            # Extract memories using LLM if enabled
-            fact_memories_text = []
-            if self.config.extraction_enabled and self.config.extraction_prompt:
-                fact_memories_text = await asyncio.wait_for(
-                    self.llm_provider.extract_memories(
-                        transcript,
-                        self.config.extraction_prompt,
-                        user_id=user_id,
-                    ),
-                    timeout=self.config.timeout_seconds,
-                )
-                memory_logger.info(
-                    f"🧠 Extracted {len(fact_memories_text)} memories from transcript for {source_id}"
-                )
-
-            # Fallback to storing raw transcript if no memories extracted
-            if not fact_memories_text:
-                fact_memories_text = [transcript]
-                memory_logger.info(
-                    f"💾 No memories extracted, storing raw transcript for {source_id}"
-                )
-
-            memory_logger.debug(f"🧠 fact_memories_text: {fact_memories_text}")
-            # Simple deduplication of extracted memories within the same call
-            fact_memories_text = self._deduplicate_memories(fact_memories_text)
-            memory_logger.debug(
-                f"🧠 fact_memories_text after deduplication: {fact_memories_text}"
+            fact_memories_text = await self._extract_facts(
+                transcript, source_id, user_id
             )
             # Generate embeddings
             embeddings = await asyncio.wait_for(
@@ -251,6 +238,116 @@ class MemoryService(MemoryServiceBase):
             memory_logger.error(f"❌ Add memory failed for {source_id}: {e}")
             raise e
 
+    async def add_memories_batch(
+        self, items: List[MemoryBatchItem], allow_update: bool = False
+    ) -> Dict[str, Tuple[bool, List[str]]]:
+        """Add memories for several transcripts, sharing calls across them.
+
+        Extraction still takes one LLM call per transcript (run concurrently).
+        Everything after it is batched: the facts of all transcripts are
+        embedded together, and with ``allow_update`` each user's facts get one
+        batched vector search and one update proposal per group of
+        ``UPDATE_PROPOSAL_MAX_FACTS`` facts. Resulting memory IDs are
+        attributed back to the transcript each fact came from.
+
+        Args:
+            items: Transcripts to process
+            allow_update: Whether to allow updating existing memories
+
+        Returns:
+            Dict mapping each item's ``source_id`` to ``(success, memory_ids)``
+        """
+        await self._ensure_initialized()
+
+        results: Dict[str, Tuple[bool, List[str]]] = {}
+        pending: List[MemoryBatchItem] = []
+        for item in items:
+            if not item.transcript or len(item.transcript.strip()) < 10:
+                memory_logger.info(f"Skipping empty transcript for {item.source_id}")
+                results[item.source_id] = (True, [])
+            else:
+                pending.append(item)
+
+        # Extraction: one LLM call per transcript, bounded concurrency
+        semaphore = asyncio.Semaphore(self.BATCH_EXTRACTION_CONCURRENCY)
+
+        async def extract(item: MemoryBatchItem) -> List[str]:
+            async with semaphore:
+                return await self._extract_facts(
+                    item.transcript, item.source_id, item.user_id
+                )
+
+        extracted = await asyncio.gather(
+            *(extract(item) for item in pending), return_exceptions=True
+        )
+
+        facts: List[Tuple[MemoryBatchItem, str]] = []
+        for item, item_facts in zip(pending, extracted):
+            if isinstance(item_facts, BaseException):
+                memory_logger.error(
+                    f"❌ Memory extraction failed for {item.source_id}: {item_facts}"
+                )
+                results[item.source_id] = (False, [])
+                continue
+            results[item.source_id] = (True, [])
+            facts.extend((item, text) for text in item_facts)
+
+        if not facts:
+            return results
+
+        # Embeddings for all facts of all transcripts
+        try:
+            embeddings = await self._generate_embeddings_batched(
+                [text for _, text in facts]
+            )
+        except Exception as e:
+            memory_logger.error(f"❌ Batch embedding generation failed: {e}")
+            for item, _ in facts:
+                results[item.source_id] = (False, [])
+            return results
+
+        # Store (or propose updates) per user
+        by_user: Dict[str, List[Tuple[MemoryBatchItem, str, List[float]]]] = {}
+        for (item, text), embedding in zip(facts, embeddings):
+            by_user.setdefault(item.user_id, []).append((item, text, embedding))
+
+        for user_id, user_facts in by_user.items():
+            try:
+                if allow_update:
+                    created = await self._process_memory_updates_batch(user_facts)
+                else:
+                    entries = []
+                    for item, text, embedding in user_facts:
+                        entries.extend(
+                            self._create_memory_entries(
+                                [text],
+                                [embedding],
+                                item.client_id,
+                                item.source_id,
+                                item.user_id,
+                                item.user_email,
+                            )
+                        )
+                    stored_ids = set(await self.vector_store.add_memories(entries))
+                    created = {}
+                    for entry in entries:
+                        if entry.id in stored_ids:
+                            created.setdefault(entry.metadata["source_id"], []).append(
+                                entry.id
+                            )
+                for source_id, ids in created.items():
+                    results[source_id] = (True, ids)
+            except Exception as e:
+                memory_logger.error(f"❌ Batch memory update failed for user {user_id}: {e}")
+                for item, _, _ in user_facts:
+                    results[item.source_id] = (False, [])
+
+        memory_logger.info(
+            f"✅ Batch processed {len(items)} transcripts: {len(facts)} facts, "
+            f"{sum(len(ids) for _, ids in results.values())} memories affected"
+        )
+        return results
+
     async def search_memories(
         self, query: str, user_id: str, limit: int = 10, score_threshold: float = 0.0
     ) -> List[MemoryEntry]:
@@ -745,6 +842,65 @@ class MemoryService(MemoryServiceBase):
 
     # Private helper methods
 
+    async def _extract_facts(
+        self, transcript: str, source_id: str, user_id: str
+    ) -> List[str]:
+        """Extract deduplicated facts from a transcript.
+
+        Falls back to the raw transcript when extraction is disabled or
+        returns nothing.
+        """
+        # Extract memories using LLM if enabled
+        fact_memories_text = []
+        if self.config.extraction_enabled and self.config.extraction_prompt:
+            fact_memories_text = await asyncio.wait_for(
+                self.llm_provider.extract_memories(
+                    transcript,
+                    self.config.extraction_prompt,
+                    user_id=user_id,
+                ),
+                timeout=self.config.timeout_seconds,
+            )
+            memory_logger.info(
+                f"🧠 Extracted {len(fact_memories_text)} memories from transcript for {source_id}"
+            )
+
+        # Fallback to storing raw transcript if no memories extracted
+        if not fact_memories_text:
+            fact_memories_text = [transcript]
+            memory_logger.info(
+                f"💾 No memories extracted, storing raw transcript for {source_id}"
+            )
+
+        memory_logger.debug(f"🧠 fact_memories_text: {fact_memories_text}")
+        # Simple deduplication of extracted memories within the same call
+        fact_memories_text = self._deduplicate_memories(fact_memories_text)
+        memory_logger.debug(
+            f"🧠 fact_memories_text after deduplication: {fact_memories_text}"
+        )
+        return fact_memories_text
+
+    async def _generate_embeddings_batched(self, texts: List[str]) -> List[List[float]]:
+        """Embed texts in requests of at most ``EMBEDDING_BATCH_SIZE``.
+
+        Raises:
+            RuntimeError: If the provider returns the wrong number of embeddings
+        """
+        embeddings: List[List[float]] = []
+        for start in range(0, len(texts), self.EMBEDDING_BATCH_SIZE):
+            batch = texts[start : start + self.EMBEDDING_BATCH_SIZE]
+            batch_embeddings = await asyncio.wait_for(
+                self.llm_provider.generate_embeddings(batch),
+                timeout=self.config.timeout_seconds,
+            )
+            if not batch_embeddings or len(batch_embeddings) != len(batch):
+                raise RuntimeError(
+                    f"Embedding generation returned {len(batch_embeddings or [])} "
+                    f"embeddings for {len(batch)} texts"
+                )
+            embeddings.extend(batch_embeddings)
+        return embeddings
+
     def _deduplicate_memories(self, memories_text: List[str]) -> List[str]:
         """Remove near-duplicate memories from the same extraction session.
 
@@ -856,31 +1012,115 @@ class MemoryService(MemoryServiceBase):
         Returns:
             List of created/updated memory IDs
         """
-        created_ids: List[str] = []
-
         # For each new fact, find top-5 existing memories as retrieval set
-        retrieved_old_memory = []
-        new_message_embeddings = {}
+        new_message_embeddings = dict(zip(memories_text, embeddings))
+        candidates = await self.vector_store.search_memories_batch(
+            embeddings, user_id=user_id, limit=5
+        )
+        retrieved_old_memory, temp_uuid_mapping = self._prepare_retrieved_memories(
+            candidates
+        )
 
-        for new_mem, emb in zip(memories_text, embeddings):
-            new_message_embeddings[new_mem] = emb
-            try:
-                candidates = await self.vector_store.search_memories(
-                    query_embedding=emb,
-                    user_id=user_id,
-                    limit=5,
-                )
-                for mem in candidates:
-                    retrieved_old_memory.append({"id": mem.id, "text": mem.content})
-            except Exception as e_search:
-                memory_logger.warning(
-                    f"Search failed while preparing updates: {e_search}"
-                )
+        actions_obj = await self._propose_memory_actions(
+            retrieved_old_memory, memories_text
+        )
 
+        # Process the proposed actions
+        actions_list = self._normalize_actions(actions_obj)
+        created_ids = await self._apply_memory_actions(
+            actions_list,
+            new_message_embeddings,
+            temp_uuid_mapping,
+            client_id,
+            source_id,
+            user_id,
+            user_email,
+        )
+
+        return created_ids
+
+    async def _process_memory_updates_batch(
+        self, user_facts: List[Tuple[MemoryBatchItem, str, List[float]]]
+    ) -> Dict[str, List[str]]:
+        """Propose and apply updates for one user's facts from several sources.
+
+        Facts are handled in groups of ``UPDATE_PROPOSAL_MAX_FACTS``: one
+        batched vector search and one update proposal per group. Each action
+        is attributed to the source of the fact it repeats, or failing that to
+        the source of the most similar fact in the group.
+
+        Args:
+            user_facts: ``(item, fact text, embedding)`` tuples of a single user
+
+        Returns:
+            Dict mapping source_id to created/updated memory IDs
+        """
+        user_id = user_facts[0][0].user_id
+        user_email = user_facts[0][0].user_email
+        created: Dict[str, List[str]] = {}
+
+        for start in range(0, len(user_facts), self.UPDATE_PROPOSAL_MAX_FACTS):
+            group = user_facts[start : start + self.UPDATE_PROPOSAL_MAX_FACTS]
+            texts = [text for _, text, _ in group]
+            embeddings = [embedding for _, _, embedding in group]
+            fact_items = {text: item for item, text, _ in group}
+
+            candidates = await self.vector_store.search_memories_batch(
+                embeddings, user_id=user_id, limit=5
+            )
+            retrieved_old_memory, temp_uuid_mapping = (
+                self._prepare_retrieved_memories(candidates)
+            )
+            actions_obj = await self._propose_memory_actions(retrieved_old_memory, texts)
+
+            def resolve_source(
+                text: str, embedding: Optional[List[float]]
+            ) -> Tuple[str, str]:
+                item = fact_items.get(text) or self._nearest_fact_item(embedding, group)
+                return item.client_id, item.source_id
+
+            group_created = await self._apply_memory_actions_by_source(
+                self._normalize_actions(actions_obj),
+                dict(zip(texts, embeddings)),
+                temp_uuid_mapping,
+                resolve_source,
+                user_id,
+                user_email,
+            )
+            for source_id, ids in group_created.items():
+                created.setdefault(source_id, []).extend(ids)
+
+        return created
+
+    @staticmethod
+    def _nearest_fact_item(
+        embedding: Optional[List[float]],
+        group: List[Tuple[MemoryBatchItem, str, List[float]]],
+    ) -> MemoryBatchItem:
+        """Return the item whose fact embedding is most similar (cosine) to ``embedding``."""
+        if embedding is None:
+            return group[0][0]
+
+        def cosine(a: List[float], b: List[float]) -> float:
+            norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+            return sum(x * y for x, y in zip(a, b)) / norm if norm else 0.0
+
+        return max(group, key=lambda fact: cosine(embedding, fact[2]))[0]
+
+    @staticmethod
+    def _prepare_retrieved_memories(
+        candidate_lists: List[List[MemoryEntry]],
+    ) -> Tuple[List[dict], dict]:
+        """Dedupe search results by ID and map them to temporary IDs for the LLM.
+
+        Returns:
+            Tuple of (retrieved memories with temp IDs, temp ID -> real ID mapping)
+        """
         # Dedupe by id and prepare temp mapping
         uniq = {}
-        for item in retrieved_old_memory:
-            uniq[item["id"]] = item
+        for candidates in candidate_lists:
+            for mem in candidates:
+                uniq[mem.id] = {"id": mem.id, "text": mem.content}
         retrieved_old_memory = list(uniq.values())
 
         # Map to temp IDs to avoid hallucinations
@@ -889,42 +1129,32 @@ class MemoryService(MemoryServiceBase):
             temp_uuid_mapping[str(idx)] = item["id"]
             retrieved_old_memory[idx]["id"] = str(idx)
 
-        # Ask LLM for actions
+        return retrieved_old_memory, temp_uuid_mapping
+
+    async def _propose_memory_actions(
+        self, retrieved_old_memory: List[dict], new_facts: List[str]
+    ) -> Any:
+        """Ask the LLM for ADD/UPDATE/DELETE/NONE actions; returns {} on failure."""
         try:
             memory_logger.info(
                 f"🔍 Asking LLM for actions with {len(retrieved_old_memory)} old memories "
-                f"and {len(memories_text)} new facts"
-            )
-            memory_logger.debug(
-                f"🧠 Individual facts being sent to LLM: {memories_text}"
+                f"and {len(new_facts)} new facts"
             )
+            memory_logger.debug(f"🧠 Individual facts being sent to LLM: {new_facts}")
 
             # add update or delete etc actions using DEFAULT_UPDATE_MEMORY_PROMPT
             actions_obj = await self.llm_provider.propose_memory_actions(
                 retrieved_old_memory=retrieved_old_memory,
-                new_facts=memories_text,
+                new_facts=new_facts,
                 custom_prompt=None,
             )
             memory_logger.info(
                 f"📝 UpdateMemory LLM returned: {type(actions_obj)} - {actions_obj}"
             )
+            return actions_obj
         except Exception as e_actions:
             memory_logger.error(f"LLM propose_memory_actions failed: {e_actions}")
-            actions_obj = {}
-
-        # Process the proposed actions
-        actions_list = self._normalize_actions(actions_obj)
-        created_ids = await self._apply_memory_actions(
-            actions_list,
-            new_message_embeddings,
-            temp_uuid_mapping,
-            client_id,
-            source_id,
-            user_id,
-            user_email,
-        )
-
-        return created_ids
+            return {}
 
     def _normalize_actions(self, actions_obj: Any) -> List[dict]:
         """Normalize LLM response into a list of action dictionaries.
@@ -975,7 +1205,7 @@ class MemoryService(MemoryServiceBase):
         user_id: str,
         user_email: str,
     ) -> List[str]:
-        """Apply the proposed memory actions.
+        """Apply the proposed memory actions for a single source.
 
         Args:
             actions_list: List of action dictionaries
@@ -989,18 +1219,74 @@ class MemoryService(MemoryServiceBase):
         Returns:
             List of created/updated memory IDs
         """
-        created_ids: List[str] = []
+        created = await self._apply_memory_actions_by_source(
+            actions_list,
+            new_message_embeddings,
+            temp_uuid_mapping,
+            lambda text, embedding: (client_id, source_id),
+            user_id,
+            user_email,
+        )
+        return created.get(source_id, [])
+
+    async def _apply_memory_actions_by_source(
+        self,
+        actions_list: List[dict],
+        new_message_embeddings: dict,
+        temp_uuid_mapping: dict,
+        resolve_source: Callable[[str, Optional[List[float]]], Tuple[str, str]],
+        user_id: str,
+        user_email: str,
+    ) -> Dict[str, List[str]]:
+        """Apply the proposed memory actions.
+
+        Args:
+            actions_list: List of action dictionaries
+            new_message_embeddings: Pre-computed embeddings for new content
+            temp_uuid_mapping: Mapping from temporary IDs to real IDs
+            resolve_source: Maps (action text, embedding) to the
+                (client_id, source_id) the action is recorded under
+            user_id: User identifier
+            user_email: User email
+
+        Returns:
+            Dict mapping source_id to created/updated memory IDs
+        """
+        created: Dict[str, List[str]] = {}
         memory_entries = []
 
         memory_logger.info(f"⚡ Processing {len(actions_list)} actions")
 
-        for resp in actions_list:
-            # Allow plain string entries → ADD action
-            if isinstance(resp, str):
-                resp = {"event": "ADD", "text": resp}
-            if not isinstance(resp, dict):
-                continue
+        # Allow plain string entries → ADD action
+        actions = [
+            {"event": "ADD", "text": resp} if isinstance(resp, str) else resp
+            for resp in actions_list
+        ]
+        actions = [resp for resp in actions if isinstance(resp, dict)]
+
+        # Embed action texts that are not one of the new facts, in one request
+        missing = list(
+            {
+                text
+                for resp in actions
+                if resp.get("event", "ADD") in ("ADD", "UPDATE")
+                for text in [resp.get("text") or resp.get("memory")]
+                if isinstance(text, str) and text and text not in new_message_embeddings
+            }
+        )
+        if missing:
+            try:
+                generated = await self._generate_embeddings_batched(missing)
+                new_message_embeddings = {
+                    **new_message_embeddings,
+                    **dict(zip(missing, generated)),
+                }
+            except Exception as gen_err:
+                memory_logger.warning(
+                    f"Embedding generation failed for action text: {gen_err}"
+                )
 
+        for resp in actions:
             event_type = resp.get("event", "ADD")
             action_text = resp.get("text") or resp.get("memory")
 
@@ -1012,6 +1298,10 @@ class MemoryService(MemoryServiceBase):
                 f"Processing action: {event_type} - {action_text[:50]}..."
             )
 
+            # Get embedding (precomputed above)
+            emb = new_message_embeddings.get(action_text)
+            client_id, source_id = resolve_source(action_text, emb)
+
             base_metadata = {
                 "source": "offline_streaming",
                 "client_id": client_id,
@@ -1022,21 +1312,6 @@ class MemoryService(MemoryServiceBase):
                 "extraction_enabled": self.config.extraction_enabled,
             }
 
-            # Get embedding (use precomputed if available, otherwise generate)
-            emb = new_message_embeddings.get(action_text)
-            if emb is None:
-                try:
-                    gen = await asyncio.wait_for(
-                        self.llm_provider.generate_embeddings([action_text]),
-                        timeout=self.config.timeout_seconds,
-                    )
-                    emb = gen[0] if gen else None
-                except Exception as gen_err:
-                    memory_logger.warning(
-                        f"Embedding generation failed for action text: {gen_err}"
-                    )
-                    emb = None
-
             if event_type == "ADD":
                 if emb is None:
                     memory_logger.warning(
@@ -1073,7 +1348,7 @@ class MemoryService(MemoryServiceBase):
                             new_metadata=base_metadata,
                         )
                         if updated:
-                            created_ids.append(str(actual_id))
+                            created.setdefault(source_id, []).append(str(actual_id))
                             memory_logger.info(
                                 f"🔄 Updated memory: {actual_id} - {action_text[:50]}..."
                             )
@@ -1117,13 +1392,16 @@ class MemoryService(MemoryServiceBase):
 
         # Store new entries
         if memory_entries:
-            stored_ids = await self.vector_store.add_memories(memory_entries)
-            created_ids.extend(stored_ids)
+            stored_ids = set(await self.vector_store.add_memories(memory_entries))
+            for entry in memory_entries:
+                if entry.id in stored_ids:
+                    created.setdefault(entry.metadata["source_id"], []).append(entry.id)
 
         memory_logger.info(
-            f"✅ Actions processed: {len(memory_entries)} new entries, {len(created_ids)} total changes"
+            f"✅ Actions processed: {len(memory_entries)} new entries, "
+            f"{sum(len(ids) for ids in created.values())} total changes"
         )
-        return created_ids
+        return created
 
     async def _update_database_relationships(
         self, db_helper: Any, source_id: str, created_ids: List[str]
@@ -18,8 +18,15 @@ from qdrant_client.models import (
     Filter,
     FilterSelector,
     MatchValue,
+    PayloadSchemaType,
     PointStruct,
+    QuantizationSearchParams,
+    QueryRequest,
     Range,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    SearchParams,
     VectorParams,
 )
 
@@ -27,6 +34,14 @@ from ..base import MemoryEntry, VectorStoreBase
 
 memory_logger = logging.getLogger("memory_service")
 
+# Payload fields used in filters; indexed so filtered search and scroll don't
+# scan every point in the collection.
+PAYLOAD_INDEXES = {
+    "metadata.user_id": PayloadSchemaType.KEYWORD,
+    "metadata.source_id": PayloadSchemaType.KEYWORD,
+    "metadata.timestamp": PayloadSchemaType.INTEGER,
+}
+
 
 class QdrantVectorStore(VectorStoreBase):
     """Qdrant vector store implementation.
@@ -38,23 +53,41 @@ class QdrantVectorStore(VectorStoreBase):
     Attributes:
         host: Qdrant server hostname
         port: Qdrant server port
+        location: Optional embedded/local location (":memory:" or a path)
+            used instead of host/port, e.g. for benchmarks
         collection_name: Name of the collection to store memories
         embedding_dims: Dimensionality of the embedding vectors
+        quantization: "scalar" to keep int8-quantized vectors in RAM and
+            rescore the top candidates with the original vectors, or None
+        oversampling: Candidates fetched per result before rescoring
+        upsert_batch_size: Maximum points sent per upsert request
+        scroll_page_size: Points fetched per scroll request when paginating
         client: Qdrant async client instance
     """
 
     def __init__(self, config: Dict[str, Any]):
         self.host = config.get("host", "localhost")
         self.port = config.get("port", 6333)
+        self.location = config.get("location")
         self.collection_name = config.get("collection_name", "memories")
         self.embedding_dims = config.get("embedding_dims", 1536)
+        quantization = config.get("quantization")
+        self.quantization = str(quantization).lower() if quantization else None
+        if self.quantization not in (None, "none", "scalar"):
+            raise ValueError(f"Unsupported Qdrant quantization: {quantization}")
+        if self.quantization == "none":
+            self.quantization = None
+        self.oversampling = float(config.get("oversampling", 2.0))
+        self.upsert_batch_size = int(config.get("upsert_batch_size", 256))
+        self.scroll_page_size = int(config.get("scroll_page_size", 1000))
         self.client = None
 
     async def initialize(self) -> None:
         """Initialize Qdrant client and collection.
         
         Creates the collection if it doesn't exist with appropriate
-        vector configuration for cosine similarity search.
+        vector configuration for cosine similarity search, then makes sure
+        the payload indexes and quantization settings are in place.
         
         If the collection exists but has different dimensions, it will
         be recreated with the correct dimensions (data will be lost).
@@ -63,7 +96,10 @@ class QdrantVectorStore(VectorStoreBase):
             RuntimeError: If initialization fails
         """
         try:
-            self.client = AsyncQdrantClient(host=self.host, port=self.port)
+            if self.location:
+                self.client = AsyncQdrantClient(location=self.location)
+            else:
+                self.client = AsyncQdrantClient(host=self.host, port=self.port)
             
             # Check if collection exists and get its info
             collections = await self.client.get_collections()
@@ -92,6 +128,7 @@ class QdrantVectorStore(VectorStoreBase):
                         memory_logger.info(
                             f"Collection {self.collection_name} exists with correct dimensions ({self.embedding_dims})"
                         )
+                        await self._ensure_quantization(collection_info)
                 except Exception as e:
                     memory_logger.warning(f"Error checking collection info: {e}. Recreating...")
                     try:
@@ -108,18 +145,112 @@ class QdrantVectorStore(VectorStoreBase):
                     vectors_config=VectorParams(
                         size=self.embedding_dims,
                         distance=Distance.COSINE
-                    )
+                    ),
+                    quantization_config=self._quantization_config(),
                 )
                 memory_logger.info(
                     f"Created Qdrant collection: {self.collection_name} with {self.embedding_dims} dimensions"
+                    f" (quantization: {self.quantization or 'none'})"
                 )
-                
+
+            await self._ensure_payload_indexes()
+
         except Exception as e:
             memory_logger.error(f"Qdrant initialization failed: {e}")
             raise
 
+    def _quantization_config(self) -> Optional[ScalarQuantization]:
+        if self.quantization != "scalar":
+            return None
+        return ScalarQuantization(
+            scalar=ScalarQuantizationConfig(
+                type=ScalarType.INT8, quantile=0.99, always_ram=True
+            )
+        )
+
+    def _search_params(self) -> Optional[SearchParams]:
+        """Rescore quantized candidates with the original vectors."""
+        if self.quantization != "scalar":
+            return None
+        return SearchParams(
+            quantization=QuantizationSearchParams(
+                rescore=True, oversampling=self.oversampling
+            )
+        )
+
+    async def _ensure_quantization(self, collection_info) -> None:
+        """Enable quantization on an existing collection created without it."""
+        if self.quantization and collection_info.config.quantization_config is None:
+            await self.client.update_collection(
+                collection_name=self.collection_name,
+                quantization_config=self._quantization_config(),
+            )
+            memory_logger.info(
+                f"Enabled {self.quantization} quantization on {self.collection_name}"
+            )
+
+    async def _ensure_payload_indexes(self) -> None:
+        """Create missing payload indexes for the fields memories are filtered on.
+
+        Indexes are built in the background by Qdrant, so this doesn't block
+        startup on large existing collections.
+        """
+        collection_info = await self.client.get_collection(self.collection_name)
+        existing = collection_info.payload_schema or {}
+        for field_name, schema in PAYLOAD_INDEXES.items():
+            if field_name in existing:
+                continue
+            await self.client.create_payload_index(
+                collection_name=self.collection_name,
+                field_name=field_name,
+                field_schema=schema,
+                wait=False,
+            )
+            memory_logger.info(
+                f"Creating {schema.value} payload index on {field_name} in {self.collection_name}"
+            )
+
+    @staticmethod
+    def _user_filter(user_id: str, *conditions: FieldCondition) -> Filter:
+        return Filter(
+            must=[
+                FieldCondition(
+                    key="metadata.user_id",
+                    match=MatchValue(value=user_id)
+                ),
+                *conditions,
+            ]
+        )
+
+    async def _scroll(self, scroll_filter: Filter, limit: int) -> List[MemoryEntry]:
+        """Page through points matching ``scroll_filter`` up to ``limit``."""
+        memories = []
+        offset = None
+        while len(memories) < limit:
+            points, offset = await self.client.scroll(
+                collection_name=self.collection_name,
+                scroll_filter=scroll_filter,
+                limit=min(self.scroll_page_size, limit - len(memories)),
+                offset=offset,
+                with_payload=True,
+                with_vectors=False,
+            )
+            for point in points:
+                memories.append(
+                    MemoryEntry(
+                        id=str(point.id),
+                        content=point.payload.get("content", ""),
+                        metadata=point.payload.get("metadata", {}),
+                        created_at=point.payload.get("created_at"),
+                        updated_at=point.payload.get("updated_at"),
+                    )
+                )
+            if offset is None:
+                break
+        return memories
+
     async def add_memories(self, memories: List[MemoryEntry]) -> List[str]:
-        """Add memories to Qdrant."""
+        """Add memories to Qdrant, upserting in batches of ``upsert_batch_size``."""
         try:
             points = []
             for memory in memories:
@@ -137,14 +268,16 @@ class QdrantVectorStore(VectorStoreBase):
                     )
                     points.append(point)
 
-            if points:
+            stored_ids = []
+            for start in range(0, len(points), self.upsert_batch_size):
+                batch = points[start:start + self.upsert_batch_size]
                 await self.client.upsert(
                     collection_name=self.collection_name,
-                    points=points
+                    points=batch
                 )
-                return [str(point.id) for point in points]
+                stored_ids.extend(str(point.id) for point in batch)
 
-            return []
+            return stored_ids
 
         except Exception as e:
             memory_logger.error(f"Qdrant add memories failed: {e}")
@@ -161,22 +294,16 @@ class QdrantVectorStore(VectorStoreBase):
         """
         try:
             # Filter by user_id
-            search_filter = Filter(
-                must=[
-                    FieldCondition(
-                        key="metadata.user_id",
-                        match=MatchValue(value=user_id)
-                    )
-                ]
-            )
-            
+            search_filter = self._user_filter(user_id)
+
             # Apply similarity threshold if provided
             # For cosine similarity, scores range from -1 to 1, where 1 is most similar
             search_params = {
                 "collection_name": self.collection_name,
                 "query": query_embedding,
                 "query_filter": search_filter,
-                "limit": limit
+                "limit": limit,
+                "search_params": self._search_params(),
             }
 
             if score_threshold > 0.0:
@@ -209,38 +336,63 @@ class QdrantVectorStore(VectorStoreBase):
             memory_logger.error(f"Qdrant search failed: {e}")
             return []
 
-    async def get_memories(self, user_id: str, limit: int) -> List[MemoryEntry]:
-        """Get all memories for a user from Qdrant."""
+    async def search_memories_batch(
+        self,
+        query_embeddings: List[List[float]],
+        user_id: str,
+        limit: int,
+        score_threshold: float = 0.0,
+    ) -> List[List[MemoryEntry]]:
+        """Run all similarity searches for a user in one Qdrant batch request."""
+        if not query_embeddings:
+            return []
         try:
-            # Filter by user_id
-            search_filter = Filter(
-                must=[
-                    FieldCondition(
-                        key="metadata.user_id",
-                        match=MatchValue(value=user_id)
+            search_filter = self._user_filter(user_id)
+            requests = [
+                QueryRequest(
+                    query=embedding,
+                    filter=search_filter,
+                    limit=limit,
+                    params=self._search_params(),
+                    with_payload=True,
+                    score_threshold=score_threshold if score_threshold > 0.0 else None,
+                )
+                for embedding in query_embeddings
+            ]
+            responses = await self.client.query_batch_points(
+                collection_name=self.collection_name,
+                requests=requests
+            )
+
+            results = [
+                [
+                    MemoryEntry(
+                        id=str(result.id),
+                        content=result.payload.get("content", ""),
+                        metadata=result.payload.get("metadata", {}),
+                        score=result.score if result.score is not None else None,
+                        created_at=result.payload.get("created_at"),
+                        updated_at=result.payload.get("updated_at")
                     )
+                    for result in response.points
                 ]
+                for response in responses
+            ]
+            memory_logger.info(
+                f"Batch search: {len(requests)} queries, "
+                f"{sum(len(r) for r in results)} results for user {user_id}"
             )
-            
-            results = await self.client.scroll(
-                collection_name=self.collection_name,
-                scroll_filter=search_filter,
-                limit=limit
-            )
-            
-            memories = []
-            for point in results[0]:  # results is tuple (points, next_page_offset)
-                memory = MemoryEntry(
-                    id=str(point.id),
-                    content=point.payload.get("content", ""),
-                    metadata=point.payload.get("metadata", {}),
-                    created_at=point.payload.get("created_at"),
-                    updated_at=point.payload.get("updated_at")
-                )
-                memories.append(memory)
+            return results
+
+        except Exception as e:
+            memory_logger.error(f"Qdrant batch search failed: {e}")
+            return [[] for _ in query_embeddings]
+
+    async def get_memories(self, user_id: str, limit: int) -> List[MemoryEntry]:
+        """Get up to ``limit`` memories for a user, paging through Qdrant scroll."""
+        try:
+            return await self._scroll(self._user_filter(user_id), limit)
 
-            return memories
-            
         except Exception as e:
             memory_logger.error(f"Qdrant get memories failed: {e}")
             return []
@@ -275,27 +427,21 @@ class QdrantVectorStore(VectorStoreBase):
     async def delete_user_memories(self, user_id: str) -> int:
         """Delete all memories for a user from Qdrant."""
         try:
-            # First count memories to delete
-            memories = await self.get_memories(user_id, limit=10000)
-            count = len(memories)
-            
-            if count > 0:
-                # Delete by filter
-                delete_filter = Filter(
-                    must=[
-                        FieldCondition(
-                            key="metadata.user_id",
-                            match=MatchValue(value=user_id)
-                        )
-                    ]
-                )
-                
+            delete_filter = self._user_filter(user_id)
+            # Count server-side instead of scrolling the points to count them
+            result = await self.client.count(
+                collection_name=self.collection_name,
+                count_filter=delete_filter,
+                exact=True,
+            )
+
+            if result.count > 0:
                 await self.client.delete(
                     collection_name=self.collection_name,
                     points_selector=FilterSelector(filter=delete_filter)
                 )
-            
-            return count
+
+            return result.count
             
         except Exception as e:
             memory_logger.error(f"Qdrant delete user memories failed: {e}")
@@ -366,15 +512,7 @@ class QdrantVectorStore(VectorStoreBase):
     async def count_memories(self, user_id: str) -> int:
         """Count total number of memories for a user in Qdrant using native count API."""
         try:
-
-            search_filter = Filter(
-                must=[
-                    FieldCondition(
-                        key="metadata.user_id",
-                        match=MatchValue(value=user_id)
-                    )
-                ]
-            )
+            search_filter = self._user_filter(user_id)
 
             # Use Qdrant's native count API (documented in qdrant/qdrant/docs)
             # Count operation: CountPoints -> CountResponse with count result
@@ -468,35 +606,14 @@ class QdrantVectorStore(VectorStoreBase):
             List of MemoryEntry objects for the specified source
         """
         try:
-            search_filter = Filter(
-                must=[
-                    FieldCondition(
-                        key="metadata.user_id",
-                        match=MatchValue(value=user_id),
-                    ),
-                    FieldCondition(
-                        key="metadata.source_id",
-                        match=MatchValue(value=source_id),
-                    ),
-                ]
-            )
-
-            results = await self.client.scroll(
-                collection_name=self.collection_name,
-                scroll_filter=search_filter,
-                limit=limit,
+            search_filter = self._user_filter(
+                user_id,
+                FieldCondition(
+                    key="metadata.source_id",
+                    match=MatchValue(value=source_id),
+                ),
             )
-
-            memories = []
-            for point in results[0]:
-                memory = MemoryEntry(
-                    id=str(point.id),
-                    content=point.payload.get("content", ""),
-                    metadata=point.payload.get("metadata", {}),
-                    created_at=point.payload.get("created_at"),
-                    updated_at=point.payload.get("updated_at"),
-                )
-                memories.append(memory)
+            memories = await self._scroll(search_filter, limit)
 
             memory_logger.info(
                 f"Found {len(memories)} memories for source {source_id} (user {user_id})"
@@ -521,35 +638,14 @@ class QdrantVectorStore(VectorStoreBase):
             List of MemoryEntry objects
         """
         try:
-            search_filter = Filter(
-                must=[
-                    FieldCondition(
-                        key="metadata.user_id",
-                        match=MatchValue(value=user_id),
-                    ),
-                    FieldCondition(
-                        key="metadata.timestamp",
-                        range=Range(gte=since_timestamp),
-                    ),
-                ]
-            )
-
-            results = await self.client.scroll(
-                collection_name=self.collection_name,
-                scroll_filter=search_filter,
-                limit=limit,
+            search_filter = self._user_filter(
+                user_id,
+                FieldCondition(
+                    key="metadata.timestamp",
+                    range=Range(gte=since_timestamp),
+                ),
             )
-
-            memories = []
-            for point in results[0]:
-                memory = MemoryEntry(
-                    id=str(point.id),
-                    content=point.payload.get("content", ""),
-                    metadata=point.payload.get("metadata", {}),
-                    created_at=point.payload.get("created_at"),
-                    updated_at=point.payload.get("updated_at"),
-                )
-                memories.append(memory)
+            memories = await self._scroll(search_filter, limit)
 
             memory_logger.info(
                 f"Found {len(memories)} recent memories since {since_timestamp} for user {user_id}"
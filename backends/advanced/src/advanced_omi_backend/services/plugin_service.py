@@ -172,7 +172,7 @@ def load_plugin_config(
     Configuration is loaded and merged in this order:
     1. Plugin-specific config.yml (non-secret settings)
     2. Expand environment variables from .env (secrets)
-    3. Merge orchestration settings from config/plugins.yml (enabled, events, condition)
+    3. Merge orchestration settings from config/plugins.yml (enabled, events, condition, dispatch)
 
     Args:
         plugin_id: Plugin identifier (e.g., 'email_summarizer')
@@ -223,6 +223,7 @@ def load_plugin_config(
     config["enabled"] = orchestration_config.get("enabled", False)
     config["events"] = orchestration_config.get("events", [])
     config["condition"] = orchestration_config.get("condition", {"type": "always"})
+    config["dispatch"] = orchestration_config.get("dispatch", {})
 
     # Add plugin ID for reference
     config["plugin_id"] = plugin_id
@@ -25,6 +25,7 @@ from advanced_omi_backend.plugins.events import PluginEvent
 from advanced_omi_backend.client_manager import get_client_owner_async
 from advanced_omi_backend.models.user import get_user_by_id
 from advanced_omi_backend.plugins.router import PluginRouter
+from advanced_omi_backend.services.audio_stream.segments import get_chunk_audio
 from advanced_omi_backend.speaker_recognition_client import SpeakerRecognitionClient
 from advanced_omi_backend.services.transcription import get_transcription_provider
 from advanced_omi_backend.utils.audio_utils import pcm_to_wav_bytes
@@ -681,8 +682,8 @@ class StreamingTranscriptionConsumer:
                                 await self.redis_client.xack(stream_name, self.group_name, msg_id)
                                 break
 
-                            # Extract audio data (producer sends as 'audio_data', not 'audio_chunk')
-                            audio_chunk = fields.get(b'audio_data') or fields.get('audio_data')
+                            # Extract audio data (inline 'audio_data' or a segment file offset)
+                            audio_chunk = get_chunk_audio(fields)
                             if audio_chunk:
                                 logger.debug(f"Processing audio chunk {msg_id} ({len(audio_chunk)} bytes)")
                                 # Process audio chunk through streaming provider
@@ -692,7 +693,7 @@ class StreamingTranscriptionConsumer:
                                     chunk_id=msg_id
                                 )
                             else:
-                                logger.warning(f"Message {msg_id} has no audio_data field")
+                                logger.warning(f"Message {msg_id} has no audio data")
 
                             # ACK the message after processing
                             await self.redis_client.xack(stream_name, self.group_name, msg_id)
@@ -0,0 +1,56 @@
+"""
+Claims that let one API process run one-time startup work.
+
+With several API processes (``API_WORKERS``) or replicas, every process runs
+the application lifespan. Work that only needs to happen once per deployment
+(index builds, data migrations, prompt seeding) is claimed in Redis first, and
+processes that lose the claim skip it.
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
+logger = logging.getLogger(__name__)
+
+# The claim is renewed while the work runs and then left to expire, so
+# processes starting alongside the one that ran it skip it too.
+STARTUP_CLAIM_KEY = "startup:claim:{task}"
+STARTUP_CLAIM_TTL = 60
+
+
+@asynccontextmanager
+async def startup_claim(redis_client, task: str):
+    """Yield True if this process should run the one-time startup ``task``.
+
+    Without Redis every process runs it; the tasks are idempotent, only wasteful
+    when repeated.
+    """
+    key = STARTUP_CLAIM_KEY.format(task=task)
+    try:
+        claimed = bool(await redis_client.set(key, "1", nx=True, ex=STARTUP_CLAIM_TTL))
+    except Exception as e:
+        logger.warning(f"Could not claim startup task '{task}', running it: {e}")
+        claimed = None
+    if claimed is None:
+        yield True
+        return
+    if not claimed:
+        logger.info(f"Startup task '{task}' is run by another process, skipping")
+        yield False
+        return
+
+    renewal = asyncio.create_task(_renew(redis_client, key))
+    try:
+        yield True
+    finally:
+        renewal.cancel()
+
+
+async def _renew(redis_client, key: str) -> None:
+    while True:
+        await asyncio.sleep(STARTUP_CLAIM_TTL / 3)
+        try:
+            await redis_client.expire(key, STARTUP_CLAIM_TTL)
+        except Exception as e:
+            logger.warning(f"Failed to renew startup claim {key}: {e}")
@@ -5,6 +5,8 @@ Audio extraction utilities for getting audio chunks from Redis.
 import logging
 from typing import List, Tuple
 
+from advanced_omi_backend.services.audio_stream.segments import get_chunk_audio
+
 logger = logging.getLogger(__name__)
 
 
@@ -106,7 +108,7 @@ async def extract_audio_for_results(
 
         # Check if this chunk is in our range
         if min_chunk <= chunk_num <= max_chunk:
-            audio_data = fields.get(b"audio_data", b"")
+            audio_data = get_chunk_audio(fields)
             audio_chunks[chunk_num] = audio_data
             logger.debug(f"🎵 [AUDIO EXTRACT] Collected chunk {chunk_num}: {len(audio_data)} bytes")
 
@@ -5,16 +5,20 @@ Extracted from legacy TranscriptionService to be reusable across V2 architecture
 """
 
 import asyncio
+import hashlib
 import logging
+import textwrap
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, NamedTuple, Optional
 
 from advanced_omi_backend.config import get_speech_detection_settings
 from advanced_omi_backend.llm_client import async_generate
+from advanced_omi_backend.model_registry import get_models_registry
 from advanced_omi_backend.prompt_optimizer import get_user_prompt
 from advanced_omi_backend.prompt_registry import get_prompt_registry
+from advanced_omi_backend.services.memory.utils import extract_json_from_text
 
 logger = logging.getLogger(__name__)
 
@@ -173,28 +177,36 @@ def analyze_speech(transcript_data: dict) -> dict:
     }
 
 
-async def generate_title_and_summary(
-    text: str,
-    segments: Optional[list] = None,
-    user_id: Optional[str] = None,
-) -> tuple[str, str]:
+# Transcripts longer than this are condensed chunk by chunk before the final
+# summary call, so no single LLM call sees more than about this much text
+SUMMARY_CHUNK_CHARS = 24_000
+SUMMARY_MAP_CONCURRENCY = 4
+SUMMARY_MAX_PASSES = 3
+
+
+class ConversationSummary(NamedTuple):
+    """Generated title, short summary and detailed summary of a conversation."""
+
+    title: str
+    summary: str
+    detailed_summary: str
+    # False when the LLM call failed and the fields hold fallback text
+    generated: bool = True
+
+
+def format_conversation_text(text: str, segments: Optional[list] = None) -> tuple[str, bool]:
     """
-    Generate title and short summary in a single LLM call using full conversation context.
+    Build the text summarized for a conversation.
 
     Args:
         text: Conversation transcript (used if segments not provided)
         segments: Optional list of speaker segments with structure:
             [{"speaker": str, "text": str, "start": float, "end": float}, ...]
-            If provided, uses speaker-formatted text for richer context
-        user_id: Optional user ID for per-user prompt override resolution
+            If provided, uses speaker-formatted text ("Speaker: text" lines)
 
     Returns:
-        Tuple of (title, short_summary)
+        Tuple of (conversation_text, include_speakers)
     """
-    # Format conversation text from segments if provided
-    conversation_text = text
-    include_speakers = False
-
     if segments:
         formatted_text = ""
         speakers_in_conv = set()
@@ -209,111 +221,170 @@ async def generate_title_and_summary(
                     formatted_text += f"{segment_text}\n"
 
         if formatted_text.strip():
-            conversation_text = formatted_text
-            include_speakers = len(speakers_in_conv) > 0
-
-    if not conversation_text or len(conversation_text.strip()) < 10:
-        return "Conversation", "No content"
+            return formatted_text, len(speakers_in_conv) > 0
 
-    try:
-        speaker_instruction = (
-            '- Include speaker names when relevant in the summary (e.g., "John discusses X with Sarah")\n'
-            if include_speakers
-            else ""
-        )
+    return text or "", False
 
-        prompt_text = await get_user_prompt(
-            "conversation.title_summary",
-            user_id,
-            speaker_instruction=speaker_instruction,
-        )
 
-        prompt = f"""{prompt_text}
+def summary_input_hash(
+    text: str, segments: Optional[list] = None, prompt_version: str = ""
+) -> str:
+    """
+    Hash of the summarization input: transcript text plus speaker labels.
 
-TRANSCRIPT:
-"{conversation_text}"
-"""
+    Stored on the conversation with its summaries so reprocessing that leaves
+    the transcript and speakers unchanged can skip regenerating them.
+    ``prompt_version`` (see ``summary_prompt_version``) is hashed along, so an
+    edited prompt or a different model regenerates them too.
+    """
+    conversation_text, _ = format_conversation_text(text, segments)
+    digest = hashlib.sha256(conversation_text.encode("utf-8"))
+    if prompt_version:
+        digest.update(b"\0" + prompt_version.encode("utf-8"))
+    return digest.hexdigest()
 
-        response = await async_generate(prompt, operation="title_summary")
 
-        # Parse response for Title: and Summary: lines
-        title = None
-        summary = None
-        for line in response.strip().split("\n"):
-            line = line.strip()
-            if line.startswith("Title:"):
-                title = line.replace("Title:", "").strip().strip('"').strip("'")
-            elif line.startswith("Summary:"):
-                summary = line.replace("Summary:", "").strip().strip('"').strip("'")
+async def summary_prompt_version(user_id: Optional[str] = None) -> str:
+    """
+    Fingerprint of the summary prompt template (per-user override if any) and
+    the model of the ``conversation_summary`` operation.
+    """
+    template = await get_user_prompt("conversation.summary", user_id)
+    model = ""
+    registry = get_models_registry()
+    if registry:
+        try:
+            model = registry.get_llm_operation("conversation_summary").model_def.model_name
+        except RuntimeError:
+            pass  # No LLM configured; the call itself will fail and fall back
+    return hashlib.sha256(f"{model}\0{template}".encode("utf-8")).hexdigest()
+
+
+def split_for_summary(text: str, max_chars: int) -> List[str]:
+    """Split text into chunks of at most ``max_chars``, on line boundaries where possible."""
+    chunks: List[str] = []
+    current: List[str] = []
+    current_len = 0
+    for line in text.splitlines():
+        pieces = textwrap.wrap(line, max_chars) if len(line) > max_chars else [line]
+        for piece in pieces:
+            if current and current_len + len(piece) + 1 > max_chars:
+                chunks.append("\n".join(current))
+                current, current_len = [], 0
+            current.append(piece)
+            current_len += len(piece) + 1
+    if current:
+        chunks.append("\n".join(current))
+    return chunks
+
+
+async def _summarize_chunk(
+    chunk: str, part: int, parts: int, semaphore: asyncio.Semaphore
+) -> str:
+    registry = get_prompt_registry()
+    prompt_text = await registry.get_prompt(
+        "conversation.summary_chunk", part=str(part), parts=str(parts)
+    )
+    async with semaphore:
+        notes = await async_generate(
+            f"{prompt_text}\n\n{chunk}\n", operation="summary_chunk"
+        )
+    return notes.strip()
 
-        title = title or "Conversation"
-        summary = summary or "No content"
 
-        return title, summary
+async def condense_for_summary(conversation_text: str) -> str:
+    """
+    Reduce a long transcript to notes that fit in one summary call.
 
-    except Exception as e:
-        logger.warning(f"Failed to generate title and summary: {e}")
-        # Fallback
-        words = text.split()[:6]
-        fallback_title = " ".join(words)
-        fallback_title = (
-            fallback_title[:40] + "..." if len(fallback_title) > 40 else fallback_title
+    Map-reduce: each chunk of ``SUMMARY_CHUNK_CHARS`` is condensed to notes in
+    parallel, and the joined notes are condensed again until they fit. Text
+    that already fits is returned unchanged.
+    """
+    text = conversation_text
+    semaphore = asyncio.Semaphore(SUMMARY_MAP_CONCURRENCY)
+    for _ in range(SUMMARY_MAX_PASSES):
+        if len(text) <= SUMMARY_CHUNK_CHARS:
+            return text
+        chunks = split_for_summary(text, SUMMARY_CHUNK_CHARS)
+        logger.info(
+            f"📚 Condensing {len(text)} chars in {len(chunks)} chunks before summarizing"
+        )
+        notes = await asyncio.gather(
+            *(
+                _summarize_chunk(chunk, i + 1, len(chunks), semaphore)
+                for i, chunk in enumerate(chunks)
+            )
+        )
+        condensed = "\n\n".join(note for note in notes if note)
+        if len(condensed) >= len(text):
+            break  # Not converging; truncate below
+        text = condensed
+
+    if len(text) > SUMMARY_CHUNK_CHARS:
+        logger.warning(
+            f"Summary notes still {len(text)} chars after condensing, truncating"
         )
-        fallback_summary = text[:120] + "..." if len(text) > 120 else text
-        return fallback_title or "Conversation", fallback_summary or "No content"
+        text = text[:SUMMARY_CHUNK_CHARS]
+    return text
 
 
-async def generate_detailed_summary(
+def _fallback_summary(text: str, conversation_text: str) -> ConversationSummary:
+    words = text.split()[:6]
+    fallback_title = " ".join(words)
+    fallback_title = (
+        fallback_title[:40] + "..." if len(fallback_title) > 40 else fallback_title
+    )
+    fallback_summary = text[:120] + "..." if len(text) > 120 else text
+    lines = conversation_text.split("\n")
+    cleaned = "\n".join(line.strip() for line in lines if line.strip())
+    fallback_detailed = cleaned[:2000] + "..." if len(cleaned) > 2000 else cleaned
+    return ConversationSummary(
+        fallback_title or "Conversation",
+        fallback_summary or "No content",
+        fallback_detailed or "No meaningful content to summarize",
+        generated=False,
+    )
+
+
+async def generate_conversation_summary(
     text: str,
     segments: Optional[list] = None,
+    user_id: Optional[str] = None,
     memory_context: Optional[str] = None,
-) -> str:
+) -> ConversationSummary:
     """
-    Generate a comprehensive, detailed summary of the conversation.
+    Generate title, short summary and detailed summary in a single LLM call.
 
-    This summary provides full information about what was discussed and said,
-    correcting transcript errors and removing filler words to create a higher
-    quality information set. Not word-for-word like the transcript, but captures
-    all key points, context, and meaningful content.
+    Transcripts longer than ``SUMMARY_CHUNK_CHARS`` are first condensed with
+    ``condense_for_summary`` so cost and latency stay bounded.
 
     Args:
         text: Conversation transcript (used if segments not provided)
         segments: Optional list of speaker segments with structure:
             [{"speaker": str, "text": str, "start": float, "end": float}, ...]
-            If provided, includes speaker attribution in detailed summary
+            If provided, uses speaker-formatted text for richer context
+        user_id: Optional user ID for per-user prompt override resolution
         memory_context: Optional context from prior conversations/memories.
             When provided, injected into the prompt so the LLM can produce
             more informed, contextual summaries.
 
     Returns:
-        str: Comprehensive detailed summary (multiple paragraphs) or fallback
+        ConversationSummary (with ``generated=False`` if the LLM call failed)
     """
-    # Format conversation text from segments if provided
-    conversation_text = text
-    include_speakers = False
-
-    if segments:
-        formatted_text = ""
-        speakers_in_conv = set()
-        for segment in segments:
-            speaker = segment.speaker or ""
-            segment_text = segment.text.strip() if segment.text else ""
-            if segment_text:
-                if speaker:
-                    formatted_text += f"{speaker}: {segment_text}\n"
-                    speakers_in_conv.add(speaker)
-                else:
-                    formatted_text += f"{segment_text}\n"
-
-        if formatted_text.strip():
-            conversation_text = formatted_text
-            include_speakers = len(speakers_in_conv) > 0
+    conversation_text, include_speakers = format_conversation_text(text, segments)
 
     if not conversation_text or len(conversation_text.strip()) < 10:
-        return "No meaningful content to summarize"
+        return ConversationSummary(
+            "Conversation", "No content", "No meaningful content to summarize"
+        )
 
     try:
         speaker_instruction = (
+            '- Include speaker names when relevant in the summary (e.g., "John discusses X with Sarah")\n'
+            if include_speakers
+            else ""
+        )
+        detailed_speaker_instruction = (
             """- Attribute key points and statements to specific speakers when relevant
 - Capture the flow of conversation between participants
 - Note any agreements, disagreements, or important exchanges
@@ -329,36 +400,55 @@ async def generate_detailed_summary(
 
 """
 
-        registry = get_prompt_registry()
-        prompt_text = await registry.get_prompt(
-            "conversation.detailed_summary",
+        prompt_text = await get_user_prompt(
+            "conversation.summary",
+            user_id,
             speaker_instruction=speaker_instruction,
+            detailed_speaker_instruction=detailed_speaker_instruction,
             memory_section=memory_section,
         )
 
-        prompt = f"""{prompt_text}
+        if len(conversation_text) <= SUMMARY_CHUNK_CHARS:
+            prompt = f"""{prompt_text}
 
 TRANSCRIPT:
 "{conversation_text}"
 """
+        else:
+            notes = await condense_for_summary(conversation_text)
+            prompt = f"""{prompt_text}
+
+The transcript is too long to include; these notes cover all of it, in order.
+
+TRANSCRIPT NOTES:
+{notes}
+"""
+
+        response = await async_generate(prompt, operation="conversation_summary")
+        parsed = extract_json_from_text(response) or {}
 
-        summary = await async_generate(prompt, operation="detailed_summary")
-        return (
-            summary.strip().strip('"').strip("'")
-            or "No meaningful content to summarize"
+        def field(key: str) -> str:
+            value = parsed.get(key)
+            return value.strip().strip('"').strip("'") if isinstance(value, str) else ""
+
+        title, summary, detailed_summary = (
+            field("title"),
+            field("summary"),
+            field("detailed_summary"),
         )
+        if not title and not summary and not detailed_summary:
+            raise ValueError(f"No summary fields in LLM response: {response[:200]!r}")
 
-    except Exception as e:
-        logger.warning(f"Failed to generate detailed summary: {e}")
-        # Fallback to returning cleaned transcript
-        lines = conversation_text.split("\n")
-        cleaned = "\n".join(line.strip() for line in lines if line.strip())
-        return (
-            cleaned[:2000] + "..."
-            if len(cleaned) > 2000
-            else cleaned or "No meaningful content to summarize"
+        return ConversationSummary(
+            title or "Conversation",
+            summary or "No content",
+            detailed_summary or "No meaningful content to summarize",
         )
 
+    except Exception as e:
+        logger.warning(f"Failed to generate conversation summary: {e}")
+        return _fallback_summary(text, conversation_text)
+
 
 # ============================================================================
 # Conversation Job Helpers
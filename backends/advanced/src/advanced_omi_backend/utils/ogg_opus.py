@@ -0,0 +1,94 @@
+"""
+Ogg/Opus container inspection.
+
+Offline backfill uploads arrive as Ogg/Opus files assembled on the client from
+the device's stored Opus packets. They are stored as audio chunks as-is, so
+the backend only needs to validate the container and read its duration —
+no decoding.
+"""
+
+import struct
+from typing import NamedTuple
+
+from advanced_omi_backend.utils.audio_utils import AudioValidationError
+
+OGG_CAPTURE_PATTERN = b"OggS"
+# capture pattern, version, header type, granule, serial, sequence, CRC, segments
+OGG_PAGE_HEADER = struct.Struct("<4sBBqIIIB")
+# magic, version, channels, pre-skip, input sample rate, output gain, mapping family
+OPUS_HEAD = struct.Struct("<8sBBHIhB")
+# Opus granule positions always count 48 kHz samples
+OPUS_GRANULE_RATE = 48000
+
+
+class OggOpusInfo(NamedTuple):
+    """Stream parameters and length of an Ogg/Opus file."""
+
+    duration: float
+    sample_rate: int
+    channels: int
+    pages: int
+
+
+def parse_ogg_opus(data: bytes) -> OggOpusInfo:
+    """
+    Validate an Ogg/Opus file and compute its duration from the last granule position.
+
+    Args:
+        data: Complete Ogg/Opus file bytes (one logical stream)
+
+    Returns:
+        OggOpusInfo with duration in seconds, the encoder's input sample rate
+        (16000 if unset) and channel count
+
+    Raises:
+        AudioValidationError: If the data is not a complete Ogg/Opus stream
+    """
+    offset = 0
+    pages = 0
+    head = None
+    last_granule = -1
+
+    while offset < len(data):
+        if len(data) - offset < OGG_PAGE_HEADER.size:
+            raise AudioValidationError("Truncated Ogg page header")
+        capture, version, _header_type, granule, _serial, _sequence, _crc, segments = (
+            OGG_PAGE_HEADER.unpack_from(data, offset)
+        )
+        if capture != OGG_CAPTURE_PATTERN or version != 0:
+            raise AudioValidationError(f"Not an Ogg page at byte {offset}")
+
+        lacing_start = offset + OGG_PAGE_HEADER.size
+        lacing = data[lacing_start : lacing_start + segments]
+        if len(lacing) < segments:
+            raise AudioValidationError("Truncated Ogg page header")
+        body_start = lacing_start + segments
+        body_end = body_start + sum(lacing)
+        if body_end > len(data):
+            raise AudioValidationError("Truncated Ogg page")
+
+        if pages == 0:
+            body = data[body_start:body_end]
+            if len(body) < OPUS_HEAD.size or not body.startswith(b"OpusHead"):
+                raise AudioValidationError("Ogg stream does not contain Opus audio")
+            head = OPUS_HEAD.unpack_from(body)
+        if granule != -1:
+            last_granule = granule
+
+        pages += 1
+        offset = body_end
+
+    if head is None:
+        raise AudioValidationError("Empty Ogg/Opus file")
+
+    _magic, _version, channels, pre_skip, input_rate, _gain, _mapping = head
+    samples = last_granule - pre_skip
+    if samples <= 0:
+        raise AudioValidationError("Ogg/Opus file contains no audio")
+
+    return OggOpusInfo(
+        duration=samples / OPUS_GRANULE_RATE,
+        sample_rate=input_rate or 16000,
+        channels=channels,
+        pages=pages,
+    )
@@ -0,0 +1,65 @@
+"""
+Compact binary framing for Wyoming audio chunks over WebSocket.
+
+Standard Wyoming-over-WebSocket sends every audio chunk as two messages: a
+JSON text header carrying ``payload_length`` and a binary payload. Clients
+that connect with ``framing=binary`` (and see ``"framing": "binary"`` echoed
+in the ``ready`` message) instead send each audio chunk as ONE binary message:
+
+    +-------+---------+----------+-------------+-------+-----+-----------+
+    | "WA"  | version | channels | rate        | width | pad | payload   |
+    | 2 B   | u8      | u8       | u32 (BE)    | u8    | 1 B | N bytes   |
+    +-------+---------+----------+-------------+-------+-----+-----------+
+
+Control events (audio-start, audio-stop, button-event, ping) stay JSON text
+messages in both modes.
+"""
+
+import struct
+from typing import Tuple
+
+FRAMING_WYOMING = "wyoming"
+FRAMING_BINARY = "binary"
+SUPPORTED_FRAMINGS = (FRAMING_WYOMING, FRAMING_BINARY)
+
+AUDIO_FRAME_MAGIC = b"WA"
+AUDIO_FRAME_VERSION = 1
+AUDIO_FRAME_HEADER = struct.Struct("!2sBBIBx")
+
+
+def encode_audio_frame(
+    payload: bytes, rate: int = 16000, width: int = 2, channels: int = 1
+) -> bytes:
+    """Build a single binary audio-chunk message."""
+    return (
+        AUDIO_FRAME_HEADER.pack(AUDIO_FRAME_MAGIC, AUDIO_FRAME_VERSION, channels, rate, width)
+        + payload
+    )
+
+
+def decode_audio_frame(message: bytes) -> Tuple[dict, bytes]:
+    """
+    Decode a binary audio-chunk message into a Wyoming header and payload.
+
+    The returned header has the same shape as a JSON ``audio-chunk`` header,
+    so callers can treat both framings identically.
+
+    Raises:
+        ValueError: If the message is not a valid binary audio frame
+    """
+    if len(message) < AUDIO_FRAME_HEADER.size:
+        raise ValueError(f"Binary audio frame too short: {len(message)} bytes")
+
+    magic, version, channels, rate, width = AUDIO_FRAME_HEADER.unpack_from(message)
+    if magic != AUDIO_FRAME_MAGIC:
+        raise ValueError(f"Invalid binary audio frame magic: {magic!r}")
+    if version != AUDIO_FRAME_VERSION:
+        raise ValueError(f"Unsupported binary audio frame version: {version}")
+
+    payload = message[AUDIO_FRAME_HEADER.size :]
+    header = {
+        "type": "audio-chunk",
+        "data": {"rate": rate, "width": width, "channels": channels},
+        "payload_length": len(payload),
+    }
+    return header, payload
@@ -0,0 +1,184 @@
+"""
+Persistent, non-forking RQ worker for async jobs.
+
+The stock ``rq.Worker`` forks a work horse for every job, so each ``@async_job``
+starts cold: a new event loop, a new Motor client and ``init_beanie``, prompt
+registration, a new Redis client and new LLM clients, all discarded when the
+horse exits. Long monitor jobs such as ``open_conversation_job`` also hold the
+whole process while they mostly wait on Redis.
+
+``AsyncJobWorker`` keeps one event loop running in a background thread for the
+life of the process and runs ``max_concurrent_jobs`` RQ ``SimpleWorker`` loops in
+threads. Each thread dequeues and executes jobs with stock RQ bookkeeping
+(registries, results, retries, failure handling, timeouts), while ``async_job``
+submits the job coroutine to the shared loop, where Beanie, the pooled Redis
+client and the per-loop LLM clients stay warm.
+
+Jobs must not block the event loop: blocking calls belong in an executor, as
+the existing jobs already do.
+"""
+
+import asyncio
+import logging
+import signal
+import threading
+import time
+from typing import List, Optional
+from uuid import uuid4
+
+from redis import Redis
+from rq import SimpleWorker
+from rq.defaults import DEFAULT_JOB_MONITORING_INTERVAL
+from rq.exceptions import StopRequested
+from rq.timeouts import TimerDeathPenalty
+from rq.worker import WorkerStatus
+
+from advanced_omi_backend.models.job import (
+    close_worker_loop,
+    set_worker_loop,
+    warm_up_worker_loop,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class _SlotWorker(SimpleWorker):
+    """One job slot of an AsyncJobWorker, running the RQ work loop in a thread."""
+
+    # SIGALRM-based timeouts only work on the main thread
+    death_penalty_class = TimerDeathPenalty
+
+    # Dequeue in short blocks so a stop request is noticed while idle
+    STOP_POLL_SECONDS = 5
+
+    @property
+    def dequeue_timeout(self) -> int:
+        return self.STOP_POLL_SECONDS
+
+    def _install_signal_handlers(self):
+        """Signals are handled by the AsyncJobWorker on the main thread."""
+
+    def dequeue_job_and_maintain_ttl(self, timeout, max_idle_time=None):
+        while not self._stop_requested:
+            # Returns None after one idle dequeue timeout
+            result = super().dequeue_job_and_maintain_ttl(timeout, max_idle_time=timeout)
+            if result is not None:
+                return result
+        raise StopRequested()
+
+
+class AsyncJobWorker:
+    """
+    Runs several async RQ jobs at once on one persistent event loop.
+
+    Attributes:
+        queue_names: Queues to listen on, in priority order
+        redis_url: Redis URL for the RQ connections
+        max_concurrent_jobs: Number of jobs in flight at once
+    """
+
+    def __init__(self, queue_names: List[str], redis_url: str, max_concurrent_jobs: int = 4):
+        self.queue_names = queue_names
+        self.redis_url = redis_url
+        self.max_concurrent_jobs = max_concurrent_jobs
+        self.name = uuid4().hex
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._slots: List[_SlotWorker] = []
+        self._slot_threads: List[threading.Thread] = []
+        self._stopping = False
+
+    def work(self) -> None:
+        """Start the loop and job slots, and block until they have all stopped."""
+        self._start_loop()
+        try:
+            self._start_slots()
+            signal.signal(signal.SIGINT, self.request_stop)
+            signal.signal(signal.SIGTERM, self.request_stop)
+            logger.info(
+                f"✅ Async RQ worker ready: {self.max_concurrent_jobs} concurrent jobs "
+                f"on {', '.join(self.queue_names)}"
+            )
+            self._wait_for_slots()
+        finally:
+            self._stop_loop()
+
+    def request_stop(self, signum=None, frame=None) -> None:
+        """Warm shutdown: finish running jobs, take no new ones. Twice: exit now."""
+        if self._stopping:
+            logger.warning("Second stop request, exiting without waiting for running jobs")
+            raise SystemExit(1)
+        self._stopping = True
+        busy = sum(1 for slot in self._slots if slot.get_state() == WorkerStatus.BUSY)
+        logger.info(f"Warm shutdown requested, waiting for {busy} running job(s)")
+        for slot in self._slots:
+            slot._stop_requested = True
+
+    def _start_loop(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(
+            target=self._run_loop, name="async-job-loop", daemon=True
+        )
+        self._loop_thread.start()
+        set_worker_loop(self.loop)
+
+        try:
+            asyncio.run_coroutine_threadsafe(warm_up_worker_loop(), self.loop).result()
+        except Exception as e:
+            # Jobs initialize lazily as well, so a dependency that is still
+            # starting up is not fatal here
+            logger.warning(f"Worker warm-up failed, continuing: {e}")
+
+    def _run_loop(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def _stop_loop(self) -> None:
+        try:
+            asyncio.run_coroutine_threadsafe(close_worker_loop(), self.loop).result(timeout=60)
+        except Exception as e:
+            logger.warning(f"Error closing worker loop resources: {e}")
+        set_worker_loop(None)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._loop_thread.join(timeout=10)
+        self.loop.close()
+
+    def _start_slots(self) -> None:
+        for i in range(self.max_concurrent_jobs):
+            slot = _SlotWorker(
+                self.queue_names,
+                name=f"{self.name}.{i + 1}",
+                connection=Redis.from_url(self.redis_url),
+                log_job_description=True,
+            )
+            thread = threading.Thread(
+                target=slot.work,
+                kwargs={"logging_level": "INFO"},
+                name=f"rq-slot-{i + 1}",
+                daemon=True,
+            )
+            self._slots.append(slot)
+            self._slot_threads.append(thread)
+            thread.start()
+
+    def _wait_for_slots(self) -> None:
+        last_heartbeat = time.monotonic()
+        while any(thread.is_alive() for thread in self._slot_threads):
+            time.sleep(1)
+
+            if not self._stopping and not all(t.is_alive() for t in self._slot_threads):
+                # A slot quit on its own (e.g. lost Redis); stop the rest so the
+                # process exits and the orchestrator restarts it
+                logger.error("A job slot stopped unexpectedly, shutting down worker")
+                self.request_stop()
+
+            # SimpleWorker does not heartbeat while a job runs; keep busy slots
+            # registered so long jobs don't make the worker look dead
+            if time.monotonic() - last_heartbeat >= DEFAULT_JOB_MONITORING_INTERVAL:
+                last_heartbeat = time.monotonic()
+                for slot in self._slots:
+                    if slot.get_state() == WorkerStatus.BUSY:
+                        try:
+                            slot.heartbeat()
+                        except Exception as e:
+                            logger.warning(f"Heartbeat failed for {slot.name}: {e}")
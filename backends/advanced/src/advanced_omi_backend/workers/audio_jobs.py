@@ -20,6 +20,7 @@ from advanced_omi_backend.models.job import (
     _ensure_beanie_initialized,
     async_job,
 )
+from advanced_omi_backend.services.audio_stream.segments import get_chunk_audio
 
 logger = logging.getLogger(__name__)
 
@@ -355,7 +356,7 @@ async def audio_streaming_persistence_job(
                 if final_messages:
                     for stream_name, msgs in final_messages:
                         for message_id, fields in msgs:
-                            audio_data = fields.get(b"audio_data", b"")
+                            audio_data = get_chunk_audio(fields)
                             chunk_id = fields.get(b"chunk_id", b"").decode()
 
                             if chunk_id != "END" and len(audio_data) > 0:
@@ -461,7 +462,7 @@ async def audio_streaming_persistence_job(
 
                 for stream_name, msgs in audio_messages:
                     for message_id, fields in msgs:
-                        audio_data = fields.get(b"audio_data", b"")
+                        audio_data = get_chunk_audio(fields)
                         chunk_id = fields.get(b"chunk_id", b"").decode()
 
                         # Check for END signal
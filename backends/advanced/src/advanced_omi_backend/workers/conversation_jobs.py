@@ -1157,7 +1157,7 @@ async def open_conversation_job(
 
 @async_job(redis=True, beanie=True)
 async def generate_title_summary_job(
-    conversation_id: str, *, redis_client=None
+    conversation_id: str, *, force: bool = False, redis_client=None
 ) -> Dict[str, Any]:
     """
     Generate title, short summary, and detailed summary for a conversation using LLM.
@@ -1166,19 +1166,28 @@ async def generate_title_summary_job(
     conversations always get meaningful titles and summaries, even if other
     processing steps fail.
 
-    Uses the utility functions from conversation_utils for consistent title/summary generation.
+    All three are generated in one LLM call by ``generate_conversation_summary``.
+    The hash of the transcript, speaker labels, prompt and model is stored with
+    them, and the job is skipped when a reprocess, speaker relabel or version
+    switch leaves that input unchanged.
 
     Args:
         conversation_id: Conversation ID
+        force: Regenerate even if the transcript and speakers are unchanged
         redis_client: Redis client (injected by decorator)
 
     Returns:
         Dict with generated title, summary, and detailed_summary
     """
     from advanced_omi_backend.models.conversation import Conversation
+    from advanced_omi_backend.models.conversation_views import (
+        TitleSummaryJobView,
+        load_conversation_view,
+    )
     from advanced_omi_backend.utils.conversation_utils import (
-        generate_detailed_summary,
-        generate_title_and_summary,
+        generate_conversation_summary,
+        summary_input_hash,
+        summary_prompt_version,
     )
 
     set_otel_session(conversation_id)
@@ -1188,10 +1197,8 @@ async def generate_title_summary_job(
 
     start_time = time.time()
 
-    # Get the conversation
-    conversation = await Conversation.find_one(
-        Conversation.conversation_id == conversation_id
-    )
+    # Get the conversation (projection: active transcript + status only)
+    conversation = await load_conversation_view(conversation_id, TitleSummaryJobView)
     if not conversation:
         logger.error(f"Conversation {conversation_id} not found")
         return {"success": False, "error": "Conversation not found"}
@@ -1210,7 +1217,26 @@ async def generate_title_summary_job(
             "conversation_id": conversation_id,
         }
 
-    # Generate title, short summary, and detailed summary using unified utilities
+    placeholder = conversation.processing_status in [
+        "pending_transcription",
+        "reprocessing",
+    ]
+    input_hash = summary_input_hash(
+        transcript_text, segments, await summary_prompt_version(conversation.user_id)
+    )
+    if not force and not placeholder and conversation.summary_input_hash == input_hash:
+        logger.info(
+            f"⏭️ Transcript and speakers unchanged for {conversation_id}, keeping existing title/summary"
+        )
+        update_job_meta(conversation_id=conversation_id, skipped=True)
+        return {
+            "success": True,
+            "skipped": True,
+            "conversation_id": conversation_id,
+            "processing_time_seconds": time.time() - start_time,
+        }
+
+    # Generate title, short summary, and detailed summary in one LLM call
     try:
         logger.info(
             f"🤖 Generating title/summary/detailed_summary using LLM for conversation {conversation_id}"
@@ -1239,38 +1265,33 @@ async def generate_title_summary_job(
                 f"⚠️ Could not fetch memory context (continuing without): {mem_error}"
             )
 
-        # Generate title+summary (one call) and detailed summary in parallel
-        import asyncio
-
-        (title, short_summary), detailed_summary = await asyncio.gather(
-            generate_title_and_summary(
-                transcript_text,
-                segments=segments,
-                user_id=conversation.user_id,
-            ),
-            generate_detailed_summary(
-                transcript_text,
-                segments=segments,
-                memory_context=memory_context,
-            ),
+        generated = await generate_conversation_summary(
+            transcript_text,
+            segments=segments,
+            user_id=conversation.user_id,
+            memory_context=memory_context,
         )
+        title = generated.title
+        short_summary = generated.summary
+        detailed_summary = generated.detailed_summary
+
+        updates = {
+            "title": title,
+            "summary": short_summary,
+            "detailed_summary": detailed_summary,
+            # Fallback text is not cached, so the next run tries the LLM again
+            "summary_input_hash": input_hash if generated.generated else None,
+        }
 
-        conversation.title = title
-        conversation.summary = short_summary
-        conversation.detailed_summary = detailed_summary
-
-        logger.info(f"✅ Generated title: '{conversation.title}'")
-        logger.info(f"✅ Generated summary: '{conversation.summary}'")
+        logger.info(f"✅ Generated title: '{title}'")
+        logger.info(f"✅ Generated summary: '{short_summary}'")
         logger.info(
-            f"✅ Generated detailed summary: {len(conversation.detailed_summary)} chars"
+            f"✅ Generated detailed summary: {len(detailed_summary)} chars"
         )
 
         # Update processing status for placeholder/reprocessing conversations
-        if getattr(conversation, "processing_status", None) in [
-            "pending_transcription",
-            "reprocessing",
-        ]:
-            conversation.processing_status = "completed"
+        if placeholder:
+            updates["processing_status"] = "completed"
             logger.info(
                 f"✅ Updated placeholder conversation {conversation_id} "
                 f"processing_status to 'completed'"
@@ -1280,14 +1301,13 @@ async def generate_title_summary_job(
         logger.error(f"❌ Title/summary generation failed: {gen_error}")
 
         # Mark placeholder/reprocessing conversation as failed
-        if getattr(conversation, "processing_status", None) in [
-            "pending_transcription",
-            "reprocessing",
-        ]:
-            conversation.title = "Audio Recording (Transcription Failed)"
-            conversation.summary = f"Title/summary generation failed: {str(gen_error)}"
-            conversation.processing_status = "transcription_failed"
-            await conversation.save()
+        if placeholder:
+            await Conversation.set_fields(
+                conversation_id,
+                title="Audio Recording (Transcription Failed)",
+                summary=f"Title/summary generation failed: {str(gen_error)}",
+                processing_status="transcription_failed",
+            )
             logger.warning(
                 f"⚠️ Marked placeholder conversation {conversation_id} "
                 f"as transcription_failed (title/summary generation error). Audio is still saved."
@@ -1300,19 +1320,17 @@ async def generate_title_summary_job(
             "processing_time_seconds": time.time() - start_time,
         }
 
-    # Save the updated conversation
-    await conversation.save()
+    # Save only the generated fields
+    await Conversation.set_fields(conversation_id, **updates)
 
     processing_time = time.time() - start_time
 
     # Update job metadata
     update_job_meta(
         conversation_id=conversation_id,
-        title=conversation.title,
-        summary=conversation.summary,
-        detailed_summary_length=(
-            len(conversation.detailed_summary) if conversation.detailed_summary else 0
-        ),
+        title=title,
+        summary=short_summary,
+        detailed_summary_length=len(detailed_summary) if detailed_summary else 0,
         segment_count=len(segments),
         processing_time=processing_time,
     )
@@ -1324,9 +1342,9 @@ async def generate_title_summary_job(
     return {
         "success": True,
         "conversation_id": conversation_id,
-        "title": conversation.title,
-        "summary": conversation.summary,
-        "detailed_summary": conversation.detailed_summary,
+        "title": title,
+        "summary": short_summary,
+        "detailed_summary": detailed_summary,
         "processing_time_seconds": processing_time,
     }
 
@@ -10,12 +10,22 @@ Supports two processing pathways:
    computes a diff between old and new speaker labels, fetches existing
    conversation-specific memories, and asks the LLM to make targeted
    corrections to speaker attribution in those memories.
+
+With ``memory.batch.enabled``, the normal extraction pathway runs in batch
+mode: a memory job claims other queued memory jobs of the same user and
+processes all their conversations in one ``add_memories_batch`` call. Claimed
+jobs still run (so job dependencies and per-conversation memory versions are
+unchanged) but pick up their result from Redis instead of calling the LLM.
+Claims expire unless the batch leader keeps renewing them, so if the leader's
+job is killed, its claimed jobs process their own conversations.
 """
 
+import asyncio
+import json
 import logging
 import time
 import uuid
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from advanced_omi_backend.controllers.queue_controller import (
     JOB_RESULT_TTL,
@@ -27,12 +37,21 @@ from advanced_omi_backend.observability.otel_setup import (
     set_otel_session,
 )
 from advanced_omi_backend.plugins.events import PluginEvent
+from advanced_omi_backend.services.memory.base import MemoryBatchItem
 from advanced_omi_backend.services.plugin_service import dispatch_plugin_event
 
 logger = logging.getLogger(__name__)
 
 MIN_CONVERSATION_LENGTH = 10
 
+# Batch mode Redis keys. Claims are renewed by the batch leader while it works,
+# so a claim outlives a killed leader by at most MEMORY_BATCH_CLAIM_TTL.
+MEMORY_BATCH_CLAIM_KEY = "memory_batch:claim:{conversation_id}"
+MEMORY_BATCH_RESULT_KEY = "memory_batch:result:{conversation_id}"
+MEMORY_BATCH_CLAIM_TTL = 60
+MEMORY_BATCH_RESULT_TTL = 3600
+MEMORY_BATCH_POLL_SECONDS = 1
+
 
 def compute_speaker_diff(
     old_segments: list,
@@ -138,6 +157,10 @@ async def process_memory_job(
         Dict with processing results
     """
     from advanced_omi_backend.models.conversation import Conversation
+    from advanced_omi_backend.models.conversation_views import (
+        MemoryJobView,
+        load_conversation_view,
+    )
     from advanced_omi_backend.services.memory import get_memory_service
     from advanced_omi_backend.users import get_user_by_id
 
@@ -145,10 +168,8 @@ async def process_memory_job(
     start_time = time.time()
     logger.info(f"🔄 Starting memory processing for conversation {conversation_id}")
 
-    # Get conversation data
-    conversation_model = await Conversation.find_one(
-        Conversation.conversation_id == conversation_id
-    )
+    # Get conversation data (projection: identifiers + active transcript only)
+    conversation_model = await load_conversation_view(conversation_id, MemoryJobView)
     if not conversation_model:
         logger.warning(f"No conversation found for {conversation_id}")
         return {"success": False, "error": "Conversation not found"}
@@ -168,42 +189,7 @@ async def process_memory_job(
         f"🔄 Processing memory for conversation {conversation_id}, client={client_id}, user={user_id}"
     )
 
-    # Extract conversation text and speakers from transcript segments in a single pass
-    dialogue_lines = []
-    transcript_speakers = set()
-    segments = conversation_model.segments
-    if segments:
-        for segment in segments:
-            text = segment.text.strip()
-            speaker = segment.speaker
-            seg_type = getattr(segment, "segment_type", "speech")
-            if text:
-                if seg_type == "event":
-                    # Non-speech event: include as context marker without speaker prefix
-                    dialogue_lines.append(
-                        f"[{text}]" if not text.startswith("[") else text
-                    )
-                elif seg_type == "note":
-                    # User-inserted note: include as distinct context
-                    dialogue_lines.append(f"[Note: {text}]")
-                else:
-                    # Normal speech segment
-                    dialogue_lines.append(f"{speaker}: {text}")
-            if speaker and speaker != "Unknown" and seg_type == "speech":
-                transcript_speakers.add(speaker.strip().lower())
-    full_conversation = "\n".join(dialogue_lines)
-
-    # Fallback: if segments have no text content but transcript exists, use transcript
-    # This handles cases where speaker recognition fails/is disabled
-    if (
-        len(full_conversation) < MIN_CONVERSATION_LENGTH
-        and conversation_model.transcript
-        and isinstance(conversation_model.transcript, str)
-    ):
-        logger.info(
-            f"Segments empty or too short, falling back to transcript text for {conversation_id}"
-        )
-        full_conversation = conversation_model.transcript
+    full_conversation, transcript_speakers = _build_memory_input(conversation_model)
 
     if len(full_conversation) < MIN_CONVERSATION_LENGTH:
         logger.warning(
@@ -212,18 +198,11 @@ async def process_memory_job(
         return {"success": False, "error": "Conversation too short"}
 
     # Check primary speakers filter (reuse `user` from above — no duplicate DB call)
-    if user and user.primary_speakers:
-        primary_speaker_names = {
-            ps["name"].strip().lower() for ps in user.primary_speakers
-        }
-
-        if transcript_speakers and not transcript_speakers.intersection(
-            primary_speaker_names
-        ):
-            logger.info(
-                f"Skipping memory - no primary speakers found in conversation {conversation_id}"
-            )
-            return {"success": True, "skipped": True, "reason": "No primary speakers"}
+    if not _has_primary_speaker(user, transcript_speakers):
+        logger.info(
+            f"Skipping memory - no primary speakers found in conversation {conversation_id}"
+        )
+        return {"success": True, "skipped": True, "reason": "No primary speakers"}
 
     # Detect reprocess trigger from RQ job metadata
     from rq import get_current_job as _get_current_job
@@ -240,10 +219,17 @@ async def process_memory_job(
 
     if trigger == "reprocess_after_speaker":
         # === Speaker reprocess pathway ===
-        # Compute diff between old and new transcript versions
+        # Compute diff between old and new transcript versions (needs version
+        # metadata and the source version, so load the full document)
+        full_conversation_model = await Conversation.find_one(
+            Conversation.conversation_id == conversation_id
+        )
+        if not full_conversation_model:
+            logger.warning(f"No conversation found for {conversation_id}")
+            return {"success": False, "error": "Conversation not found"}
         memory_result = await _process_speaker_reprocess(
             memory_service=memory_service,
-            conversation_model=conversation_model,
+            conversation_model=full_conversation_model,
             full_conversation=full_conversation,
             client_id=client_id,
             conversation_id=conversation_id,
@@ -252,14 +238,31 @@ async def process_memory_job(
         )
     else:
         # === Normal extraction pathway ===
-        memory_result = await memory_service.add_memory(
-            full_conversation,
-            client_id,
-            conversation_id,
-            user_id,
-            user_email,
-            allow_update=True,
-        )
+        batch_config = _memory_batch_config()
+        if batch_config["enabled"] and redis_client:
+            memory_result = await _add_memory_batched(
+                memory_service,
+                redis_client,
+                MemoryBatchItem(
+                    transcript=full_conversation,
+                    client_id=client_id,
+                    source_id=conversation_id,
+                    user_id=user_id,
+                    user_email=user_email,
+                ),
+                user,
+                _batch_size_for_job(batch_config, current_rq_job),
+                batch_config["max_wait_seconds"],
+            )
+        else:
+            memory_result = await memory_service.add_memory(
+                full_conversation,
+                client_id,
+                conversation_id,
+                user_id,
+                user_email,
+                allow_update=True,
+            )
 
     if memory_result:
         success, created_memory_ids = memory_result
@@ -272,34 +275,23 @@ async def process_memory_job(
 
             # Only create memory version if new memories were created
             if created_memory_ids:
-                # Add memory version to conversation
-                conversation_model = await Conversation.find_one(
-                    Conversation.conversation_id == conversation_id
-                )
-                if conversation_model:
-                    # Get active transcript version for reference
-                    transcript_version_id = (
+                # Add memory version to conversation (atomic $push, no full load)
+                await Conversation.push_memory_version(
+                    conversation_id,
+                    version_id=str(uuid.uuid4()),
+                    memory_count=len(created_memory_ids),
+                    transcript_version_id=(
                         conversation_model.active_transcript_version or "unknown"
-                    )
-
-                    # Create version ID for this memory extraction
-                    version_id = str(uuid.uuid4())
-
-                    # Add memory version with metadata
-                    conversation_model.add_memory_version(
-                        version_id=version_id,
-                        memory_count=len(created_memory_ids),
-                        transcript_version_id=transcript_version_id,
-                        provider=(
-                            conversation_model.MemoryProvider.OPENMEMORY_MCP
-                            if memory_provider == "openmemory_mcp"
-                            else conversation_model.MemoryProvider.CHRONICLE
-                        ),
-                        processing_time_seconds=processing_time,
-                        metadata={"memory_ids": created_memory_ids},
-                        set_as_active=True,
-                    )
-                    await conversation_model.save()
+                    ),
+                    provider=(
+                        Conversation.MemoryProvider.OPENMEMORY_MCP
+                        if memory_provider == "openmemory_mcp"
+                        else Conversation.MemoryProvider.CHRONICLE
+                    ),
+                    processing_time_seconds=processing_time,
+                    metadata={"memory_ids": created_memory_ids},
+                    set_as_active=True,
+                )
 
                 logger.info(
                     f"✅ Completed memory processing for conversation {conversation_id} - created {len(created_memory_ids)} memories in {processing_time:.2f}s"
@@ -372,11 +364,7 @@ async def process_memory_job(
                         conversation_id=conversation_id,
                         transcript=full_conversation,
                         user_id=user_id,
-                        conversation_name=(
-                            conversation_model.title
-                            if hasattr(conversation_model, "title")
-                            else None
-                        ),
+                        conversation_name=conversation_model.title,
                     )
                     if kg_result.get("entities", 0) > 0:
                         logger.info(
@@ -430,6 +418,271 @@ async def process_memory_job(
         return {"success": False, "error": "Memory service returned False"}
 
 
+def _build_memory_input(conversation_model) -> Tuple[str, Set[str]]:
+    """Build the memory extraction text and the set of speakers for a conversation.
+
+    Segments are rendered as ``speaker: text`` dialogue lines (events and notes as
+    bracketed context markers). Falls back to the plain transcript when the
+    segments carry no usable text, e.g. when speaker recognition failed.
+
+    Returns:
+        Tuple of (conversation text, lower-cased speech speaker names)
+    """
+    dialogue_lines = []
+    transcript_speakers = set()
+    for segment in conversation_model.segments or []:
+        text = segment.text.strip()
+        speaker = segment.speaker
+        seg_type = getattr(segment, "segment_type", "speech")
+        if text:
+            if seg_type == "event":
+                # Non-speech event: include as context marker without speaker prefix
+                dialogue_lines.append(f"[{text}]" if not text.startswith("[") else text)
+            elif seg_type == "note":
+                # User-inserted note: include as distinct context
+                dialogue_lines.append(f"[Note: {text}]")
+            else:
+                # Normal speech segment
+                dialogue_lines.append(f"{speaker}: {text}")
+        if speaker and speaker != "Unknown" and seg_type == "speech":
+            transcript_speakers.add(speaker.strip().lower())
+    full_conversation = "\n".join(dialogue_lines)
+
+    # Fallback: if segments have no text content but transcript exists, use transcript
+    # This handles cases where speaker recognition fails/is disabled
+    if (
+        len(full_conversation) < MIN_CONVERSATION_LENGTH
+        and conversation_model.transcript
+        and isinstance(conversation_model.transcript, str)
+    ):
+        logger.info(
+            f"Segments empty or too short, falling back to transcript text for "
+            f"{conversation_model.conversation_id}"
+        )
+        full_conversation = conversation_model.transcript
+
+    return full_conversation, transcript_speakers
+
+
+def _has_primary_speaker(user, transcript_speakers: Set[str]) -> bool:
+    """Whether the conversation passes the user's primary speakers filter."""
+    if not user or not user.primary_speakers or not transcript_speakers:
+        return True
+    primary_speaker_names = {ps["name"].strip().lower() for ps in user.primary_speakers}
+    return bool(transcript_speakers.intersection(primary_speaker_names))
+
+
+def _memory_batch_config() -> Dict[str, Any]:
+    """Read the ``memory.batch`` settings from config."""
+    from advanced_omi_backend.model_registry import get_config
+
+    batch_config = get_config().get("memory", {}).get("batch", {}) or {}
+    return {
+        "enabled": bool(batch_config.get("enabled", False)),
+        "max_conversations": max(1, int(batch_config.get("max_conversations", 20))),
+        "seconds_per_conversation": max(
+            1.0, float(batch_config.get("seconds_per_conversation", 60))
+        ),
+        "max_wait_seconds": max(0.0, float(batch_config.get("max_wait_seconds", 600))),
+    }
+
+
+def _batch_size_for_job(batch_config: Dict[str, Any], job) -> int:
+    """Cap the batch size so the leader can finish it within its job timeout.
+
+    RQ kills a job at its timeout regardless of how many conversations it
+    claimed, so the batch is sized from the timeout and the configured
+    ``seconds_per_conversation`` budget.
+    """
+    limit = batch_config["max_conversations"]
+    timeout = getattr(job, "timeout", None)
+    if isinstance(timeout, (int, float)) and timeout > 0:
+        limit = min(limit, max(1, int(timeout // batch_config["seconds_per_conversation"])))
+    return limit
+
+
+async def _add_memory_batched(
+    memory_service,
+    redis_client,
+    item: MemoryBatchItem,
+    user,
+    max_conversations: int,
+    max_wait_seconds: float = 600,
+) -> Optional[tuple]:
+    """Process a conversation's memories in batch mode.
+
+    If another memory job already claimed this conversation for its batch, waits
+    for that job to publish the result. The wait ends early if the claim expires
+    (the leader died and stopped renewing it) or after ``max_wait_seconds``; the
+    conversation is then processed by this job. Otherwise claims the
+    conversation, claims up to ``max_conversations - 1`` other queued memory jobs
+    of the same user and processes them all in one ``add_memories_batch`` call,
+    renewing the claims while it works and publishing the results of the
+    claimed conversations to Redis for their own jobs to pick up.
+
+    Returns:
+        Same shape as ``add_memory``: (success, created_memory_ids)
+    """
+    conversation_id = item.source_id
+    claim_key = MEMORY_BATCH_CLAIM_KEY.format(conversation_id=conversation_id)
+
+    # Wait while another job's batch holds this conversation
+    deadline = time.monotonic() + max_wait_seconds
+    while not await redis_client.set(claim_key, "1", nx=True, ex=MEMORY_BATCH_CLAIM_TTL):
+        result = await _pop_batch_result(redis_client, conversation_id)
+        if result:
+            logger.info(
+                f"📦 Memory for conversation {conversation_id} was processed in a batch"
+            )
+            return result
+        if time.monotonic() >= deadline:
+            logger.warning(
+                f"Batch holding conversation {conversation_id} did not finish within "
+                f"{max_wait_seconds:.0f}s, processing it separately"
+            )
+            return await _add_memory(memory_service, item)
+        await asyncio.sleep(MEMORY_BATCH_POLL_SECONDS)
+
+    # A batch that finished before this job claimed may have left a result
+    result = await _pop_batch_result(redis_client, conversation_id)
+    if result:
+        return result
+
+    claimed = [conversation_id]
+    renewal = asyncio.create_task(_renew_batch_claims(redis_client, claimed))
+    siblings: List[MemoryBatchItem] = []
+    try:
+        if max_conversations > 1:
+            siblings = await _claim_queued_memory_jobs(
+                redis_client, item, user, max_conversations - 1
+            )
+            claimed.extend(sibling.source_id for sibling in siblings)
+        if not siblings:
+            return await _add_memory(memory_service, item)
+
+        logger.info(
+            f"📦 Batch processing memories for {len(siblings) + 1} conversations "
+            f"of user {item.user_id}"
+        )
+        results = await memory_service.add_memories_batch(
+            [item] + siblings, allow_update=True
+        )
+        for sibling in siblings:
+            success, memory_ids = results.get(sibling.source_id, (False, []))
+            await redis_client.set(
+                MEMORY_BATCH_RESULT_KEY.format(conversation_id=sibling.source_id),
+                json.dumps({"success": success, "memory_ids": memory_ids}),
+                ex=MEMORY_BATCH_RESULT_TTL,
+            )
+        return results.get(conversation_id, (False, []))
+    except Exception:
+        # Release claimed conversations so their own jobs process them
+        for sibling in siblings:
+            await redis_client.delete(
+                MEMORY_BATCH_CLAIM_KEY.format(conversation_id=sibling.source_id)
+            )
+        raise
+    finally:
+        renewal.cancel()
+        await redis_client.delete(claim_key)
+
+
+async def _add_memory(memory_service, item: MemoryBatchItem) -> Optional[tuple]:
+    return await memory_service.add_memory(
+        item.transcript,
+        item.client_id,
+        item.source_id,
+        item.user_id,
+        item.user_email,
+        allow_update=True,
+    )
+
+
+async def _pop_batch_result(redis_client, conversation_id: str) -> Optional[tuple]:
+    """Take a published batch result for a conversation, releasing its claim."""
+    result_key = MEMORY_BATCH_RESULT_KEY.format(conversation_id=conversation_id)
+    result = await redis_client.get(result_key)
+    if not result:
+        return None
+    await redis_client.delete(
+        result_key, MEMORY_BATCH_CLAIM_KEY.format(conversation_id=conversation_id)
+    )
+    result = json.loads(result)
+    return result["success"], result["memory_ids"]
+
+
+async def _renew_batch_claims(redis_client, conversation_ids: List[str]) -> None:
+    """Keep a batch's claims alive until cancelled by the batch leader."""
+    while True:
+        await asyncio.sleep(MEMORY_BATCH_CLAIM_TTL / 3)
+        for conversation_id in list(conversation_ids):
+            try:
+                await redis_client.expire(
+                    MEMORY_BATCH_CLAIM_KEY.format(conversation_id=conversation_id),
+                    MEMORY_BATCH_CLAIM_TTL,
+                )
+            except Exception as e:
+                logger.warning(f"Failed to renew memory batch claim {conversation_id}: {e}")
+
+
+async def _claim_queued_memory_jobs(
+    redis_client, item: MemoryBatchItem, user, limit: int
+) -> List[MemoryBatchItem]:
+    """Claim up to ``limit`` queued memory jobs of the same user for a batch.
+
+    Only normal extraction jobs are considered (speaker reprocess jobs need their
+    own pathway). Conversations that would be skipped anyway (too short, no
+    primary speaker) are left to their own jobs.
+    """
+    from beanie.operators import In
+    from rq.job import Job
+
+    from advanced_omi_backend.models.conversation import Conversation
+    from advanced_omi_backend.models.conversation_views import MemoryJobView
+
+    job_ids = memory_queue.get_job_ids(0, limit * 10)
+    candidate_ids = []
+    for job in Job.fetch_many(job_ids, connection=memory_queue.connection):
+        if not job or not job.func_name.endswith("process_memory_job") or not job.args:
+            continue
+        if (job.meta or {}).get("trigger") == "reprocess_after_speaker":
+            continue
+        if job.args[0] != item.source_id:
+            candidate_ids.append(job.args[0])
+    if not candidate_ids:
+        return []
+
+    conversations = await Conversation.find(
+        In(Conversation.conversation_id, candidate_ids),
+        Conversation.user_id == item.user_id,
+        projection_model=MemoryJobView,
+    ).to_list()
+
+    claimed: List[MemoryBatchItem] = []
+    for conversation in conversations:
+        if len(claimed) >= limit:
+            break
+        text, speakers = _build_memory_input(conversation)
+        if len(text) < MIN_CONVERSATION_LENGTH or not _has_primary_speaker(
+            user, speakers
+        ):
+            continue
+        claim_key = MEMORY_BATCH_CLAIM_KEY.format(
+            conversation_id=conversation.conversation_id
+        )
+        if await redis_client.set(claim_key, "1", nx=True, ex=MEMORY_BATCH_CLAIM_TTL):
+            claimed.append(
+                MemoryBatchItem(
+                    transcript=text,
+                    client_id=conversation.client_id,
+                    source_id=conversation.conversation_id,
+                    user_id=item.user_id,
+                    user_email=item.user_email,
+                )
+            )
+    return claimed
+
+
 async def _process_speaker_reprocess(
     memory_service,
     conversation_model,
@@ -494,6 +747,7 @@ async def _process_speaker_reprocess(
         )
 
     # Find the source version's segments
+    await conversation_model.load_transcript_versions([source_version_id], words=False)
     source_version = None
     for v in conversation_model.transcript_versions:
         if v.version_id == source_version_id:
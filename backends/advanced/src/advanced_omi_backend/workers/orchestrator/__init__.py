@@ -9,20 +9,25 @@ Components:
 - worker_registry: Build worker list with conditional logic
 - process_manager: Process lifecycle management
 - health_monitor: Health checks and self-healing
+- autoscaler: Queue-demand-driven sizing of RQ worker pools
 """
 
-from .config import OrchestratorConfig, WorkerDefinition, WorkerType
+from .autoscaler import QueueAutoscaler
+from .config import OrchestratorConfig, WorkerDefinition, WorkerPool, WorkerType
 from .health_monitor import HealthMonitor
 from .process_manager import ManagedWorker, ProcessManager, WorkerState
-from .worker_registry import build_worker_definitions
+from .worker_registry import build_worker_definitions, build_worker_pools
 
 __all__ = [
     "WorkerDefinition",
+    "WorkerPool",
     "OrchestratorConfig",
     "WorkerType",
     "build_worker_definitions",
+    "build_worker_pools",
     "ManagedWorker",
     "ProcessManager",
     "WorkerState",
     "HealthMonitor",
+    "QueueAutoscaler",
 ]
@@ -0,0 +1,307 @@
+"""
+Queue Autoscaler
+
+Sizes each RQ worker pool between its min and max from queue demand:
+queued and running jobs, the age of the oldest queued job and, for the audio
+pool, active streaming sessions. Scale-up is immediate; scale-down waits until
+demand has stayed below the pool size for scale_down_delay seconds and only
+drains idle workers, which exit through RQ's warm shutdown.
+"""
+
+import logging
+import math
+import socket
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional
+
+from redis import Redis
+from rq import Queue, Worker
+from rq.worker import WorkerStatus
+
+from .config import OrchestratorConfig, WorkerPool
+from .process_manager import ProcessManager, WorkerState
+
+logger = logging.getLogger(__name__)
+
+# Scaling decisions kept for the health status
+DECISION_HISTORY = 20
+
+
+@dataclass
+class PoolMetrics:
+    """Demand signals for one pool, sampled from Redis."""
+
+    queued: int = 0
+    running: int = 0
+    oldest_job_age: float = 0.0
+    active_sessions: int = 0
+
+
+class _PoolState:
+    """Autoscaler bookkeeping for one pool."""
+
+    def __init__(self):
+        self.metrics = PoolMetrics()
+        self.desired = 0
+        # Start of the current below-capacity window, and the highest demand
+        # seen in it (the pool is never drained below that)
+        self.low_since: Optional[float] = None
+        self.low_peak = 0
+
+
+def desired_workers(
+    pool: WorkerPool, metrics: PoolMetrics, current: int, scale_up_job_age: int
+) -> int:
+    """
+    Number of workers a pool needs for the sampled demand, within its bounds.
+
+    Args:
+        pool: Worker pool
+        metrics: Sampled demand
+        current: Workers currently in the pool (excluding draining ones)
+        scale_up_job_age: Oldest-job age that forces one more worker
+
+    Returns:
+        Desired worker count
+    """
+    jobs = metrics.queued + metrics.running
+    if pool.track_streaming_sessions:
+        jobs = max(jobs, metrics.active_sessions)
+
+    desired = math.ceil(jobs / pool.slots_per_worker)
+    if metrics.queued and metrics.oldest_job_age >= scale_up_job_age:
+        # Jobs are waiting too long even though counts look covered
+        desired = max(desired, current + 1)
+
+    return max(pool.min_workers, min(pool.max_workers, desired))
+
+
+class QueueAutoscaler:
+    """
+    Scales RQ worker pools managed by a ProcessManager.
+
+    Called from the health monitor on every check.
+    """
+
+    def __init__(
+        self,
+        pools: List[WorkerPool],
+        process_manager: ProcessManager,
+        config: OrchestratorConfig,
+        redis_client: Redis,
+    ):
+        self.pools = {pool.name: pool for pool in pools}
+        self.process_manager = process_manager
+        self.config = config
+        self.redis = redis_client
+        self.hostname = socket.gethostname()
+        self.states: Dict[str, _PoolState] = {name: _PoolState() for name in self.pools}
+        self.decisions: Deque[dict] = deque(maxlen=DECISION_HISTORY)
+
+    def evaluate(self, now: Optional[float] = None) -> None:
+        """Sample demand and scale every pool once."""
+        now = time.time() if now is None else now
+
+        removed = self.process_manager.reap_drained_workers(self.config.drain_timeout)
+        if removed:
+            logger.debug(f"Reaped drained workers: {', '.join(removed)}")
+
+        active_sessions = self._count_active_sessions()
+        for name, pool in self.pools.items():
+            try:
+                self._scale_pool(pool, self.states[name], active_sessions, now)
+            except Exception as e:
+                logger.error(f"Autoscaler: failed to scale pool {name}: {e}", exc_info=True)
+
+    def _scale_pool(
+        self, pool: WorkerPool, state: _PoolState, active_sessions: int, now: float
+    ) -> None:
+        state.metrics = self._pool_metrics(pool)
+        state.metrics.active_sessions = active_sessions if pool.track_streaming_sessions else 0
+
+        members = self._members(pool)
+        current = len(members)
+        state.desired = desired_workers(pool, state.metrics, current, self.config.scale_up_job_age)
+
+        if state.desired > current:
+            state.low_since = None
+            self._scale_up(pool, state, current, now)
+            return
+
+        if state.desired == current:
+            state.low_since = None
+            return
+
+        # Below capacity: wait out the hysteresis window before draining
+        if state.low_since is None:
+            state.low_since = now
+            state.low_peak = state.desired
+            return
+        state.low_peak = max(state.low_peak, state.desired)
+        if now - state.low_since < self.config.scale_down_delay:
+            return
+
+        self._scale_down(pool, state, members, current, max(state.low_peak, pool.min_workers), now)
+        state.low_since = None
+
+    def _scale_up(self, pool: WorkerPool, state: _PoolState, current: int, now: float) -> None:
+        used = {self._member_index(pool, name) for name in self._all_member_names(pool)}
+        started = []
+        index = 1
+        while current + len(started) < state.desired:
+            while index in used:
+                index += 1
+            used.add(index)
+            definition = pool.member_definition(index)
+            if self.process_manager.add_worker(definition):
+                started.append(definition.name)
+            else:
+                break
+
+        if started:
+            self._record(pool, "scale_up", current, current + len(started), state, now, started)
+
+    def _scale_down(
+        self,
+        pool: WorkerPool,
+        state: _PoolState,
+        members: List[str],
+        current: int,
+        target: int,
+        now: float,
+    ) -> None:
+        idle = self._idle_members(members)
+        # Highest-numbered members go first so names stay compact
+        idle.sort(key=lambda name: self._member_index(pool, name), reverse=True)
+
+        drained = []
+        for name in idle[: current - target]:
+            if self.process_manager.drain_worker(name):
+                drained.append(name)
+
+        if drained:
+            self._record(pool, "scale_down", current, current - len(drained), state, now, drained)
+        else:
+            logger.debug(
+                f"Autoscaler: {pool.name} above target {target} but no idle workers to drain"
+            )
+
+    def _record(
+        self,
+        pool: WorkerPool,
+        action: str,
+        before: int,
+        after: int,
+        state: _PoolState,
+        now: float,
+        workers: List[str],
+    ) -> None:
+        metrics = state.metrics
+        reason = (
+            f"queued={metrics.queued} running={metrics.running} "
+            f"oldest={metrics.oldest_job_age:.0f}s sessions={metrics.active_sessions}"
+        )
+        self.decisions.append(
+            {
+                "time": now,
+                "pool": pool.name,
+                "action": action,
+                "from": before,
+                "to": after,
+                "workers": workers,
+                "reason": reason,
+            }
+        )
+        logger.info(f"Autoscaler: {pool.name} {action} {before} -> {after} ({reason})")
+
+    def _all_member_names(self, pool: WorkerPool) -> List[str]:
+        return [
+            worker.name
+            for worker in self.process_manager.get_all_workers()
+            if worker.definition.pool == pool.name
+        ]
+
+    def _members(self, pool: WorkerPool) -> List[str]:
+        """Pool members that count toward capacity (not draining)."""
+        return [
+            worker.name
+            for worker in self.process_manager.get_all_workers()
+            if worker.definition.pool == pool.name and worker.state != WorkerState.DRAINING
+        ]
+
+    @staticmethod
+    def _member_index(pool: WorkerPool, name: str) -> int:
+        try:
+            return int(name[len(pool.name) + 1 :])
+        except ValueError:
+            return 0
+
+    def _idle_members(self, members: List[str]) -> List[str]:
+        """Members whose RQ registrations are all idle (not mid-job or starting)."""
+        states_by_pid: Dict[int, List[str]] = {}
+        for rq_worker in Worker.all(connection=self.redis):
+            if rq_worker.hostname == self.hostname and rq_worker.pid:
+                states_by_pid.setdefault(rq_worker.pid, []).append(rq_worker.get_state())
+
+        idle = []
+        for name in members:
+            worker = self.process_manager.get_worker(name)
+            states = states_by_pid.get(worker.pid) if worker else None
+            if states and all(s != WorkerStatus.BUSY for s in states):
+                idle.append(name)
+        return idle
+
+    def _pool_metrics(self, pool: WorkerPool) -> PoolMetrics:
+        metrics = PoolMetrics()
+        now = time.time()
+        for queue_name in pool.queues:
+            queue = Queue(queue_name, connection=self.redis)
+            metrics.queued += queue.count
+            metrics.running += queue.started_job_registry.count
+
+            oldest_ids = queue.get_job_ids(0, 1)
+            oldest = queue.fetch_job(oldest_ids[0]) if oldest_ids else None
+            if oldest is not None and oldest.enqueued_at is not None:
+                age = now - oldest.enqueued_at.timestamp()
+                metrics.oldest_job_age = max(metrics.oldest_job_age, age)
+        return metrics
+
+    def _count_active_sessions(self) -> int:
+        """Streaming sessions whose audio:session hash is still active."""
+        if not any(pool.track_streaming_sessions for pool in self.pools.values()):
+            return 0
+        count = 0
+        for key in self.redis.scan_iter(match="audio:session:*", count=100):
+            if self.redis.hget(key, "status") == b"active":
+                count += 1
+        return count
+
+    def get_status(self) -> dict:
+        """Per-pool demand, size and bounds plus recent scaling decisions."""
+        pools = {}
+        for name, pool in self.pools.items():
+            state = self.states[name]
+            members = self._members(pool)
+            pools[name] = {
+                "queues": pool.queues,
+                "min_workers": pool.min_workers,
+                "max_workers": pool.max_workers,
+                "slots_per_worker": pool.slots_per_worker,
+                "current": len(members),
+                "draining": len(self._all_member_names(pool)) - len(members),
+                "desired": state.desired,
+                "queued": state.metrics.queued,
+                "running": state.metrics.running,
+                "oldest_job_age": round(state.metrics.oldest_job_age, 1),
+                "active_sessions": state.metrics.active_sessions,
+                "scale_down_pending_since": state.low_since,
+            }
+        return {
+            "enabled": True,
+            "scale_up_job_age": self.config.scale_up_job_age,
+            "scale_down_delay": self.config.scale_down_delay,
+            "pools": pools,
+            "recent_decisions": list(self.decisions),
+        }
@@ -30,6 +30,7 @@ class WorkerDefinition:
         enabled_check: Optional predicate function to determine if worker should start
         restart_on_failure: Whether to automatically restart on failure
         health_check: Optional custom health check function
+        pool: Name of the autoscaled pool this worker belongs to (None if fixed)
     """
 
     name: str
@@ -39,6 +40,7 @@ class WorkerDefinition:
     enabled_check: Optional[Callable[[], bool]] = None
     restart_on_failure: bool = True
     health_check: Optional[Callable[[], bool]] = None
+    pool: Optional[str] = None
 
     def is_enabled(self) -> bool:
         """Check if this worker should be started"""
@@ -47,6 +49,48 @@ class WorkerDefinition:
         return self.enabled_check()
 
 
+@dataclass
+class WorkerPool:
+    """
+    A group of identical RQ workers sized between min and max by the autoscaler.
+
+    Attributes:
+        name: Pool name, also the prefix of member worker names ("{name}-{i}")
+        command: Command for each member process
+        queues: Queues the members listen on (a queue belongs to one pool)
+        min_workers: Lower bound, kept running even when idle
+        max_workers: Upper bound, and the fixed size when autoscaling is off
+        slots_per_worker: Jobs each member runs at once (async worker mode)
+        track_streaming_sessions: Size for active streaming sessions as well,
+            since each session holds a long-running job on these queues
+    """
+
+    name: str
+    command: List[str]
+    queues: List[str]
+    min_workers: int
+    max_workers: int
+    slots_per_worker: int = 1
+    track_streaming_sessions: bool = False
+
+    def __post_init__(self):
+        if self.min_workers < 0 or self.max_workers < max(self.min_workers, 1):
+            raise ValueError(
+                f"Pool {self.name}: need 0 <= min_workers <= max_workers and max_workers >= 1"
+            )
+
+    def member_definition(self, index: int) -> WorkerDefinition:
+        """Definition of the pool member with the given 1-based index."""
+        return WorkerDefinition(
+            name=f"{self.name}-{index}",
+            command=list(self.command),
+            worker_type=WorkerType.RQ_WORKER,
+            queues=list(self.queues),
+            restart_on_failure=True,
+            pool=self.name,
+        )
+
+
 @dataclass
 class OrchestratorConfig:
     """
@@ -76,6 +120,23 @@ class OrchestratorConfig:
         default_factory=lambda: int(os.getenv("WORKER_SHUTDOWN_TIMEOUT", "30"))
     )
 
+    # Autoscaling of worker pools (off: pools run at max_workers)
+    autoscale_enabled: bool = field(
+        default_factory=lambda: os.getenv("WORKER_AUTOSCALE", "false").lower() == "true"
+    )
+    # Queued jobs at least this old trigger a scale-up even if counts look fine
+    scale_up_job_age: int = field(
+        default_factory=lambda: int(os.getenv("WORKER_SCALE_UP_JOB_AGE", "30"))
+    )
+    # Demand must stay below the pool size this long before workers are drained
+    scale_down_delay: int = field(
+        default_factory=lambda: int(os.getenv("WORKER_SCALE_DOWN_DELAY", "300"))
+    )
+    # Draining workers still running after this long are killed
+    drain_timeout: int = field(
+        default_factory=lambda: int(os.getenv("WORKER_DRAIN_TIMEOUT", "900"))
+    )
+
     # Logging
     log_level: str = field(default_factory=lambda: os.getenv("LOG_LEVEL", "INFO"))
 
@@ -89,3 +150,7 @@ class OrchestratorConfig:
             raise ValueError("startup_grace_period must be non-negative")
         if self.shutdown_timeout <= 0:
             raise ValueError("shutdown_timeout must be positive")
+        if self.scale_up_job_age < 0 or self.scale_down_delay < 0:
+            raise ValueError("scale_up_job_age and scale_down_delay must be non-negative")
+        if self.drain_timeout <= 0:
+            raise ValueError("drain_timeout must be positive")
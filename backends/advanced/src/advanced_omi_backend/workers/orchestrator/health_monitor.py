@@ -2,20 +2,22 @@
 Health Monitor
 
 Self-healing monitor that detects and recovers from worker failures.
-Periodically checks worker health and restarts failed workers.
+Periodically checks worker health and restarts failed workers, and runs the
+queue autoscaler when enabled.
 """
 
 import asyncio
 import logging
 import time
-from typing import Optional
+from typing import List, Optional
 
 from redis import Redis
 from rq import Worker
 
 from advanced_omi_backend.services.plugin_service import WORKER_RESTART_KEY
 
-from .config import OrchestratorConfig, WorkerType
+from .autoscaler import QueueAutoscaler
+from .config import OrchestratorConfig, WorkerPool, WorkerType
 from .process_manager import ProcessManager, WorkerState
 
 logger = logging.getLogger(__name__)
@@ -28,6 +30,7 @@ class HealthMonitor:
     Periodically checks:
     1. Individual worker health (process liveness)
     2. RQ worker registration count in Redis
+    3. Queue demand, scaling worker pools (if autoscaling is enabled)
 
     Automatically restarts failed workers if configured.
     """
@@ -37,10 +40,14 @@ class HealthMonitor:
         process_manager: ProcessManager,
         config: OrchestratorConfig,
         redis_client: Redis,
+        pools: Optional[List[WorkerPool]] = None,
     ):
         self.process_manager = process_manager
         self.config = config
         self.redis = redis_client
+        self.autoscaler: Optional[QueueAutoscaler] = None
+        if config.autoscale_enabled and pools:
+            self.autoscaler = QueueAutoscaler(pools, process_manager, config, redis_client)
         self.running = False
         self.monitor_task: Optional[asyncio.Task] = None
         self.start_time = time.time()
@@ -129,6 +136,10 @@ class HealthMonitor:
             # Restart failed workers
             self._restart_failed_workers()
 
+            # Resize worker pools for the current queue demand
+            if self.autoscaler:
+                self.autoscaler.evaluate()
+
             # Log summary
             if not worker_health or not rq_health:
                 logger.warning(
@@ -174,7 +185,11 @@ class HealthMonitor:
         Returns:
             True if all workers restarted successfully
         """
-        all_workers = list(self.process_manager.get_all_workers())
+        all_workers = [
+            worker
+            for worker in self.process_manager.get_all_workers()
+            if worker.state != WorkerState.DRAINING
+        ]
         if not all_workers:
             logger.warning("No workers found to restart")
             return False
@@ -209,6 +224,9 @@ class HealthMonitor:
         all_healthy = True
 
         for worker in self.process_manager.get_all_workers():
+            # Draining workers are expected to exit; the autoscaler reaps them
+            if worker.state == WorkerState.DRAINING:
+                continue
             try:
                 is_healthy = worker.check_health()
                 if not is_healthy:
@@ -228,7 +246,7 @@ class HealthMonitor:
 
         This replicates the bash script's logic:
         - Query Redis for all registered RQ workers
-        - Check if count >= min_rq_workers
+        - Check if count >= min_rq_workers (or the scaled pool size, if lower)
 
         Returns:
             True if RQ worker count is sufficient
@@ -236,11 +254,12 @@ class HealthMonitor:
         try:
             workers = Worker.all(connection=self.redis)
             worker_count = len(workers)
+            expected = self._expected_rq_workers()
 
-            if worker_count < self.config.min_rq_workers:
+            if worker_count < expected:
                 logger.warning(
                     f"RQ worker registration: {worker_count} workers "
-                    f"(expected >= {self.config.min_rq_workers})"
+                    f"(expected >= {expected})"
                 )
                 return False
 
@@ -251,6 +270,18 @@ class HealthMonitor:
             logger.error(f"Failed to check RQ worker registration: {e}")
             return False
 
+    def _expected_rq_workers(self) -> int:
+        """Minimum registered RQ workers; autoscaled pools may run fewer processes."""
+        if not self.autoscaler:
+            return self.config.min_rq_workers
+        running_rq = sum(
+            1
+            for worker in self.process_manager.get_all_workers()
+            if worker.definition.worker_type == WorkerType.RQ_WORKER
+            and worker.state != WorkerState.DRAINING
+        )
+        return min(self.config.min_rq_workers, running_rq)
+
     def _restart_failed_workers(self):
         """Restart workers that have failed and should be restarted"""
         for worker in self.process_manager.get_all_workers():
@@ -329,6 +360,7 @@ class HealthMonitor:
             worker
             for worker in self.process_manager.get_all_workers()
             if worker.definition.worker_type == WorkerType.RQ_WORKER
+            and worker.state != WorkerState.DRAINING
         ]
 
         if not rq_workers:
@@ -419,12 +451,16 @@ class HealthMonitor:
         except Exception:
             rq_worker_count = -1  # Error indicator
 
+        expected = self._expected_rq_workers()
         return {
             "running": self.running,
             "uptime": time.time() - self.start_time if self.running else 0,
             "total_workers": len(worker_status),
             "state_counts": state_counts,
             "rq_worker_count": rq_worker_count,
-            "min_rq_workers": self.config.min_rq_workers,
-            "rq_healthy": rq_worker_count >= self.config.min_rq_workers,
+            "min_rq_workers": expected,
+            "rq_healthy": rq_worker_count >= expected,
+            "autoscaling": (
+                self.autoscaler.get_status() if self.autoscaler else {"enabled": False}
+            ),
         }
@@ -24,6 +24,7 @@ class WorkerState(Enum):
     RUNNING = "running"  # Healthy and running
     UNHEALTHY = "unhealthy"  # Running but health check failed
     STOPPING = "stopping"  # Shutdown initiated
+    DRAINING = "draining"  # Scaled down, finishing its current job before exiting
     STOPPED = "stopped"  # Cleanly stopped
     FAILED = "failed"  # Crashed or failed to start
 
@@ -39,6 +40,7 @@ class ManagedWorker:
         start_time: Timestamp when worker was started
         restart_count: Number of times worker has been restarted
         last_health_check: Timestamp of last health check
+        drain_start_time: Timestamp when draining started (None if not draining)
     """
 
     def __init__(self, definition: WorkerDefinition):
@@ -48,6 +50,7 @@ class ManagedWorker:
         self.start_time: Optional[float] = None
         self.restart_count = 0
         self.last_health_check: Optional[float] = None
+        self.drain_start_time: Optional[float] = None
 
     @property
     def name(self) -> str:
@@ -146,6 +149,27 @@ class ManagedWorker:
             self.state = WorkerState.FAILED
             return False
 
+    def drain(self) -> bool:
+        """
+        Ask the worker to exit after its current job, without waiting.
+
+        RQ workers treat SIGTERM as a warm shutdown: no new jobs are taken and
+        the running one is allowed to finish.
+
+        Returns:
+            True if the shutdown request was sent, False otherwise
+        """
+        try:
+            if self.is_alive:
+                logger.info(f"{self.name}: Draining worker (PID {self.pid})...")
+                self.process.terminate()
+            self.state = WorkerState.DRAINING
+            self.drain_start_time = time.time()
+            return True
+        except Exception as e:
+            logger.error(f"{self.name}: Failed to start draining: {e}")
+            return False
+
     def check_health(self) -> bool:
         """
         Check worker health.
@@ -295,6 +319,72 @@ class ProcessManager:
 
         return success
 
+    def add_worker(self, definition: WorkerDefinition) -> bool:
+        """
+        Register and start a new worker (autoscaler scale-up).
+
+        Args:
+            definition: Worker definition with a name not already in use
+
+        Returns:
+            True if started successfully
+        """
+        if definition.name in self.workers:
+            logger.error(f"Worker '{definition.name}' already exists")
+            return False
+
+        worker = ManagedWorker(definition)
+        self.workers[definition.name] = worker
+        return worker.start()
+
+    def drain_worker(self, name: str) -> bool:
+        """
+        Start a graceful drain of a worker (autoscaler scale-down).
+
+        The worker stays managed until reap_drained_workers() sees it exit.
+
+        Args:
+            name: Worker name
+
+        Returns:
+            True if draining started
+        """
+        worker = self.workers.get(name)
+        if not worker:
+            logger.error(f"Worker '{name}' not found")
+            return False
+        return worker.drain()
+
+    def reap_drained_workers(self, drain_timeout: int) -> List[str]:
+        """
+        Remove drained workers that have exited; kill ones past the drain timeout.
+
+        Args:
+            drain_timeout: Maximum seconds a worker may take to drain
+
+        Returns:
+            Names of the workers removed
+        """
+        removed = []
+        for name, worker in list(self.workers.items()):
+            if worker.state != WorkerState.DRAINING:
+                continue
+
+            if worker.is_alive:
+                drained_for = time.time() - (worker.drain_start_time or time.time())
+                if drained_for < drain_timeout:
+                    continue
+                logger.warning(
+                    f"{name}: Still busy after {drained_for:.0f}s of draining, force stopping"
+                )
+                worker.stop(timeout=5)
+
+            del self.workers[name]
+            removed.append(name)
+            logger.info(f"{name}: Drained and removed")
+
+        return removed
+
     def get_status(self) -> Dict[str, Dict]:
         """
         Get detailed status of all workers.
@@ -313,6 +403,7 @@ class ProcessManager:
                 "start_time": worker.start_time,
                 "last_health_check": worker.last_health_check,
                 "queues": worker.definition.queues,
+                "pool": worker.definition.pool,
             }
 
         return status
@@ -7,9 +7,9 @@ Reuses model_registry.py for config.yml parsing.
 
 import logging
 import os
-from typing import List
+from typing import List, Optional
 
-from .config import WorkerDefinition, WorkerType
+from .config import WorkerDefinition, WorkerPool, WorkerType
 
 logger = logging.getLogger(__name__)
 
@@ -37,51 +37,86 @@ def has_streaming_stt_configured() -> bool:
     return False
 
 
-def build_worker_definitions() -> List[WorkerDefinition]:
+def _rq_slots_per_worker() -> int:
+    """Jobs each RQ worker process runs at once (>1 only in async worker mode)."""
+    try:
+        from advanced_omi_backend.config import get_rq_worker_settings
+
+        settings = get_rq_worker_settings()
+        if settings["mode"] == "async":
+            return settings["max_concurrent_jobs"]
+    except Exception as e:
+        logger.warning(f"Failed to read RQ worker settings: {e}")
+    return 1
+
+
+def build_worker_pools() -> List[WorkerPool]:
+    """
+    Build the RQ worker pools.
+
+    Bounds come from environment variables; without autoscaling each pool
+    runs at its max (6 multi-queue workers, 3 audio persistence workers).
+
+    Returns:
+        List of WorkerPool objects
+    """
+    slots = _rq_slots_per_worker()
+
+    return [
+        # Multi-queue workers (transcription, memory, default)
+        WorkerPool(
+            name="rq-worker",
+            command=[
+                "python",
+                "-m",
+                "advanced_omi_backend.workers.rq_worker_entry",
+                "transcription",
+                "memory",
+                "default",
+            ],
+            queues=["transcription", "memory", "default"],
+            min_workers=int(os.getenv("RQ_WORKERS_MIN", "2")),
+            max_workers=int(os.getenv("RQ_WORKERS_MAX", "6")),
+            slots_per_worker=slots,
+        ),
+        # Audio persistence workers (audio queue) - each streaming session
+        # holds one persistence job for its whole duration
+        WorkerPool(
+            name="audio-persistence",
+            command=[
+                "python",
+                "-m",
+                "advanced_omi_backend.workers.rq_worker_entry",
+                "audio",
+            ],
+            queues=["audio"],
+            min_workers=int(os.getenv("AUDIO_WORKERS_MIN", "1")),
+            max_workers=int(os.getenv("AUDIO_WORKERS_MAX", "3")),
+            slots_per_worker=slots,
+            track_streaming_sessions=True,
+        ),
+    ]
+
+
+def build_worker_definitions(
+    pools: Optional[List[WorkerPool]] = None, autoscale: bool = False
+) -> List[WorkerDefinition]:
     """
     Build the complete list of worker definitions.
 
+    Args:
+        pools: RQ worker pools (built with build_worker_pools() if omitted)
+        autoscale: Start pools at min_workers instead of max_workers
+
     Returns:
         List of WorkerDefinition objects, including conditional workers
     """
     workers = []
 
-    # 6x RQ Workers - Multi-queue workers (transcription, memory, default)
-    for i in range(1, 7):
-        workers.append(
-            WorkerDefinition(
-                name=f"rq-worker-{i}",
-                command=[
-                    "python",
-                    "-m",
-                    "advanced_omi_backend.workers.rq_worker_entry",
-                    "transcription",
-                    "memory",
-                    "default",
-                ],
-                worker_type=WorkerType.RQ_WORKER,
-                queues=["transcription", "memory", "default"],
-                restart_on_failure=True,
-            )
-        )
-
-    # Audio Persistence Workers - Single-queue workers (audio queue)
-    # Multiple workers allow concurrent audio persistence for multiple sessions
-    for i in range(1, 4):  # 3 audio workers
-        workers.append(
-            WorkerDefinition(
-                name=f"audio-persistence-{i}",
-                command=[
-                    "python",
-                    "-m",
-                    "advanced_omi_backend.workers.rq_worker_entry",
-                    "audio",
-                ],
-                worker_type=WorkerType.RQ_WORKER,
-                queues=["audio"],
-                restart_on_failure=True,
-            )
-        )
+    for pool in pools if pools is not None else build_worker_pools():
+        initial = pool.min_workers if autoscale else pool.max_workers
+        for i in range(1, initial + 1):
+            workers.append(pool.member_definition(i))
 
     # Streaming STT Worker - Conditional (if streaming STT is configured in config.yml)
     # This worker uses the registry-driven streaming provider (RegistryStreamingTranscriptionProvider)
@@ -179,6 +179,7 @@ async def run_prompt_optimization_job() -> dict:
                         )
                     else:
                         raise
+                registry.invalidate(user_prompt_name)
 
                 # Mark annotations as consumed
                 for ann in annotations:
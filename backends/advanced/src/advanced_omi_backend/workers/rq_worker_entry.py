@@ -4,6 +4,8 @@ RQ Worker Entry Point with Logging Configuration.
 
 This script configures Python logging before starting RQ workers,
 ensuring that application-level logs from job functions are visible.
+With ``backend.rq_worker.mode: async`` it runs the persistent
+``AsyncJobWorker`` instead of the forking ``rq.Worker``.
 """
 
 import logging
@@ -33,6 +35,8 @@ def main():
     from redis import Redis
     from rq import Worker
 
+    from advanced_omi_backend.config import get_rq_worker_settings
+
     # Get Redis URL from environment
     redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 
@@ -44,6 +48,16 @@ def main():
     logger.info(f"🚀 Starting RQ worker for queues: {', '.join(queue_names)}")
     logger.info(f"📡 Redis URL: {redis_url}")
 
+    settings = get_rq_worker_settings()
+    if settings["mode"] == "async":
+        from advanced_omi_backend.workers.async_worker import AsyncJobWorker
+
+        # Persistent loop and connections, several jobs in flight; blocks until stopped
+        AsyncJobWorker(
+            queue_names, redis_url, max_concurrent_jobs=settings["max_concurrent_jobs"]
+        ).work()
+        return
+
     # Create Redis connection
     redis_conn = Redis.from_url(redis_url)
 
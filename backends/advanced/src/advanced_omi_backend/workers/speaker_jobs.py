@@ -173,6 +173,18 @@ async def recognise_speakers_job(
 
     start_time = time.time()
 
+    # Check if speaker recognition is enabled before touching the database
+    speaker_client = SpeakerRecognitionClient()
+    if not speaker_client.enabled:
+        logger.info(f"🎤 Speaker recognition disabled, skipping")
+        return {
+            "success": True,
+            "conversation_id": conversation_id,
+            "version_id": version_id,
+            "speaker_recognition_enabled": False,
+            "processing_time_seconds": 0,
+        }
+
     # Get the conversation
     conversation = await Conversation.find_one(
         Conversation.conversation_id == conversation_id
@@ -194,18 +206,7 @@ async def recognise_speakers_job(
     if not transcript_version:
         logger.error(f"Transcript version {version_id} not found")
         return {"success": False, "error": "Transcript version not found"}
-
-    # Check if speaker recognition is enabled
-    speaker_client = SpeakerRecognitionClient()
-    if not speaker_client.enabled:
-        logger.info(f"🎤 Speaker recognition disabled, skipping")
-        return {
-            "success": True,
-            "conversation_id": conversation_id,
-            "version_id": version_id,
-            "speaker_recognition_enabled": False,
-            "processing_time_seconds": 0,
-        }
+    await conversation.load_transcript_versions([version_id])
 
     # Get provider capabilities from metadata
     provider_capabilities = transcript_version.metadata.get("provider_capabilities", {})
@@ -27,9 +27,14 @@ from advanced_omi_backend.controllers.queue_controller import (
 )
 from advanced_omi_backend.models.audio_chunk import AudioChunkDocument
 from advanced_omi_backend.models.conversation import Conversation
+from advanced_omi_backend.models.conversation_views import (
+    ConversationContextView,
+    load_conversation_view,
+)
 from advanced_omi_backend.models.job import async_job
 from advanced_omi_backend.plugins.events import PluginEvent
 from advanced_omi_backend.services.audio_stream import TranscriptionResultsAggregator
+from advanced_omi_backend.services.audio_stream.segments import get_chunk_audio
 from advanced_omi_backend.services.plugin_service import dispatch_plugin_event
 from advanced_omi_backend.services.transcription import (
     get_transcription_provider,
@@ -186,16 +191,14 @@ async def transcribe_full_audio_job(
 
     start_time = time.time()
 
-    # Get the conversation
-    conversation = await Conversation.find_one(
-        Conversation.conversation_id == conversation_id
-    )
-    if not conversation:
+    # Only identifiers are needed until the transcript is written back
+    context = await load_conversation_view(conversation_id, ConversationContextView)
+    if not context:
         raise ValueError(f"Conversation {conversation_id} not found")
 
     # Extract user_id and client_id for plugin context
-    user_id = str(conversation.user_id) if conversation.user_id else None
-    client_id = conversation.client_id if hasattr(conversation, "client_id") else None
+    user_id = str(context.user_id) if context.user_id else None
+    client_id = context.client_id
 
     # Get the transcription provider
     provider = get_transcription_provider(mode="batch")
@@ -509,6 +512,13 @@ async def transcribe_full_audio_job(
         "provider_capabilities": provider_capabilities,  # For speaker_jobs.py conditional logic
     }
 
+    # Load the full document only now, so the write starts from its latest state
+    conversation = await Conversation.find_one(
+        Conversation.conversation_id == conversation_id
+    )
+    if not conversation:
+        raise ValueError(f"Conversation {conversation_id} was deleted during transcription")
+
     # Create the transcript version
     new_version = conversation.add_transcript_version(
         version_id=version_id,
@@ -761,7 +771,7 @@ async def transcription_fallback_check_job(
                         continue
 
                     # Get PCM audio data
-                    audio_data = fields.get(b"audio_data", b"")
+                    audio_data = get_chunk_audio(fields)
                     if audio_data:
                         audio_chunks[chunk_num] = audio_data
 
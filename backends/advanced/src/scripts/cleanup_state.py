@@ -5,9 +5,11 @@ Chronicle Backend Cleanup & Backup Tool
 Features:
 - Rich terminal UI with progress bars, panels, and colored output
 - Backup-only mode (no cleanup)
+- Streaming NDJSON backup with concurrent exports and resumable checkpoints
 - Strict backup verification before cleanup proceeds
-- Conversation-filtered audio export (only conversations with transcripts)
+- Conversation-filtered WAV audio export, or raw Opus chunk export
 - Comprehensive backup manifest with checksums
+- Bulk restore from an NDJSON backup
 - MongoDB, Qdrant, Neo4j, Redis cleanup
 """
 
@@ -29,10 +31,12 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 try:
     import redis
     from beanie import init_beanie
+    from bson import json_util
     from motor.motor_asyncio import AsyncIOMotorClient
     from neo4j import GraphDatabase
     from qdrant_client import AsyncQdrantClient
-    from qdrant_client.models import Distance, VectorParams
+    from pymongo.errors import BulkWriteError
+    from qdrant_client.models import Distance, PointStruct, VectorParams
     from rich.console import Console
     from rich.panel import Panel
     from rich.progress import (
@@ -50,6 +54,7 @@ try:
     from advanced_omi_backend.models.annotation import Annotation
     from advanced_omi_backend.models.audio_chunk import AudioChunkDocument
     from advanced_omi_backend.models.conversation import Conversation
+    from advanced_omi_backend.models.transcript_version import TranscriptVersionDocument
     from advanced_omi_backend.models.user import User
     from advanced_omi_backend.models.waveform import WaveformData
     from advanced_omi_backend.services.memory.config import build_memory_config_from_env
@@ -287,8 +292,8 @@ class BackupResult:
 
     @property
     def critical_ok(self) -> bool:
-        """conversations, audio_metadata, and annotations are critical."""
-        critical = ("conversations", "audio_metadata", "annotations")
+        """conversations, transcript versions, audio_metadata, and annotations are critical."""
+        critical = ("conversations", "transcript_versions", "audio_metadata", "annotations")
         return all(
             self.exports.get(n, {}).get("ok", False)
             for n in critical
@@ -322,8 +327,97 @@ class BackupResult:
         return sum(e["size"] for e in self.exports.values())
 
 
+class BackupCheckpoint:
+    """Per-export resume points, rewritten atomically after every flushed batch.
+
+    Each export records how many records and bytes of its NDJSON file are
+    durable and the last ``_id`` (or scroll offset) written, so an interrupted
+    backup can truncate the partial tail and continue from there.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.state: dict[str, dict] = {}
+        if path.exists():
+            with open(path) as f:
+                self.state = json.load(f)
+
+    def get(self, name: str) -> dict:
+        return self.state.get(name, {})
+
+    def update(self, name: str, **fields):
+        self.state.setdefault(name, {}).update(fields)
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(self.state, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+
+class NdjsonFile:
+    """Append-only NDJSON writer that buffers lines and flushes in batches."""
+
+    def __init__(self, path: Path, offset: int = 0):
+        if offset and path.exists():
+            self._file = open(path, "r+b")
+            self._file.truncate(offset)
+            self._file.seek(offset)
+        else:
+            self._file = open(path, "wb")
+        self._buffer: list[bytes] = []
+
+    def write(self, record: Any):
+        self._buffer.append(
+            (json_util.dumps(record, json_options=json_util.RELAXED_JSON_OPTIONS) + "\n").encode()
+        )
+
+    def flush(self) -> int:
+        """Write buffered lines durably and return the file size."""
+        self._file.write(b"".join(self._buffer))
+        self._buffer.clear()
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        return self._file.tell()
+
+    def close(self):
+        self._file.close()
+
+
+def read_ndjson_batches(path: Path, batch_size: int):
+    """Yield lists of decoded records from an NDJSON file."""
+    batch = []
+    with open(path, "rb") as f:
+        for line in f:
+            if line.strip():
+                batch.append(json_util.loads(line))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+
+# MongoDB collections exported as raw documents: (export name, collection, projection)
+MONGO_EXPORTS = [
+    ("conversations", "conversations", None),
+    ("transcript_versions", "transcript_versions", None),
+    ("audio_metadata", "audio_chunks", {"audio_data": 0}),
+    ("waveforms", "waveforms", None),
+    ("chat_sessions", "chat_sessions", None),
+    ("chat_messages", "chat_messages", None),
+    ("annotations", "annotations", None),
+]
+
+BACKUP_FORMAT = "ndjson-v1"
+
+
 class BackupManager:
-    """Export data to a timestamped backup directory."""
+    """Stream data to NDJSON files in a timestamped (or resumed) backup directory.
+
+    Collections are read with ``_id``-ordered cursors and written in batches,
+    several exports at a time. Progress is checkpointed after every batch, so
+    passing the same directory as ``resume_path`` continues an interrupted
+    backup instead of starting over.
+    """
 
     def __init__(
         self,
@@ -332,14 +426,28 @@ class BackupManager:
         mongo_db: Any,
         neo4j_driver: Any = None,
         langfuse_client: Any = None,
+        audio_format: str = "wav",
+        batch_size: int = 500,
+        concurrency: int = 4,
+        resume_path: Optional[str] = None,
     ):
         self.backup_dir = Path(backup_dir)
         self.export_audio = export_audio
+        self.audio_format = audio_format
         self.mongo_db = mongo_db
         self.neo4j_driver = neo4j_driver
         self.langfuse_client = langfuse_client
-        self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        self.backup_path = self.backup_dir / f"backup_{self.timestamp}"
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        if resume_path:
+            self.backup_path = Path(resume_path)
+            self.timestamp = self.backup_path.name.removeprefix("backup_")
+        else:
+            self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            self.backup_path = self.backup_dir / f"backup_{self.timestamp}"
+        self.checkpoint: Optional[BackupCheckpoint] = None
+        self._progress: Optional[Progress] = None
+        self._tasks: dict[str, Any] = {}
 
     async def run(
         self,
@@ -348,57 +456,77 @@ class BackupManager:
     ) -> BackupResult:
         """Run all backup exports, return a BackupResult for verification."""
         self.backup_path.mkdir(parents=True, exist_ok=True)
+        self.checkpoint = BackupCheckpoint(self.backup_path / "checkpoint.json")
         result = BackupResult()
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(bar_width=30),
-            TimeElapsedColumn(),
-            console=console,
-        ) as progress:
-            steps = [
-                ("conversations", self._export_conversations),
-                ("audio_metadata", self._export_audio_metadata),
-                ("waveforms", self._export_waveforms),
-                ("chat_sessions", self._export_chat_sessions),
-                ("chat_messages", self._export_chat_messages),
-                ("annotations", self._export_annotations),
-            ]
+        steps = [
+            (name, self._collection_step(name, collection, projection))
+            for name, collection, projection in MONGO_EXPORTS
+        ]
 
-            if self.export_audio:
-                steps.append(("audio_wav", self._export_audio_wav))
+        if self.export_audio and self.audio_format == "opus":
+            steps.append(("audio_chunks", self._collection_step("audio_chunks", "audio_chunks")))
+        elif self.export_audio:
+            steps.append(("audio_wav", self._export_audio_wav))
 
-            if qdrant_client:
-                steps.append(
-                    ("memories", lambda r: self._export_memories(qdrant_client, r))
-                )
+        if qdrant_client:
 
-            if self.neo4j_driver:
-                steps.append(("neo4j_graph", self._export_neo4j))
+            async def export_memories(r: BackupResult) -> Path:
+                return await self._export_memories(qdrant_client, r)
+
+            steps.append(("memories", export_memories))
+
+        if self.neo4j_driver:
+            steps.append(("neo4j_graph", self._export_neo4j))
 
-            if self.langfuse_client:
-                steps.append(("langfuse_prompts", self._export_langfuse_prompts))
+        if self.langfuse_client:
+            steps.append(("langfuse_prompts", self._export_langfuse_prompts))
 
-            task = progress.add_task("Backing up...", total=len(steps))
+        semaphore = asyncio.Semaphore(self.concurrency)
 
-            for name, func in steps:
-                progress.update(task, description=f"Exporting {name}...")
+        async def run_step(name, func):
+            async with semaphore:
+                self._set_progress(name, "exporting")
                 try:
-                    ret = func(result)
-                    path = await ret if asyncio.iscoroutine(ret) else ret
+                    if asyncio.iscoroutinefunction(func):
+                        path = await func(result)
+                    else:
+                        # Neo4j and LangFuse clients are synchronous
+                        path = await asyncio.to_thread(func, result)
                     if not result.exports.get(name):
                         # func didn't record itself - record success
                         result.record(name, path, True)
+                    self._set_progress(name, "done", completed=1)
                 except Exception as e:
                     logger.warning(f"Export {name} failed: {e}")
                     result.record(name, None, False, str(e))
-                progress.advance(task)
+                    self._set_progress(name, "[red]failed[/red]", completed=1)
+
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(bar_width=30),
+            TimeElapsedColumn(),
+            console=console,
+        ) as progress:
+            self._progress = progress
+            self._tasks = {
+                name: progress.add_task(f"{name}: queued", total=1) for name, _ in steps
+            }
+            await asyncio.gather(*(run_step(name, func) for name, func in steps))
+            self._progress = None
+
+        # Keep the export order stable in the manifest and verification table
+        result.exports = {
+            name: result.exports[name] for name, _ in steps if name in result.exports
+        }
 
         # Write manifest
         manifest = {
+            "format": BACKUP_FORMAT,
             "timestamp": self.timestamp,
             "backup_path": str(self.backup_path),
+            "audio_format": self.audio_format if self.export_audio else None,
             "exports": result.exports,
             "total_size_bytes": result.total_size,
             "total_size_human": _human_size(result.total_size),
@@ -418,133 +546,111 @@ class BackupManager:
 
         return result
 
-    # -- Individual exports --------------------------------------------------
+    def _set_progress(self, name: str, status: str, completed: Optional[int] = None):
+        if self._progress is None:
+            return
+        kwargs = {"description": f"{name}: {status}"}
+        if completed is not None:
+            kwargs["completed"] = completed
+        self._progress.update(self._tasks[name], **kwargs)
 
-    async def _export_conversations(self, result: BackupResult) -> Path:
-        conversations = await Conversation.find_all().to_list()
-        data = [c.model_dump(mode="json") for c in conversations]
-        path = self.backup_path / "conversations.json"
-        with open(path, "w") as f:
-            json.dump(data, f, indent=2, default=str)
-        result.record("conversations", path, True)
-        return path
+    # -- Individual exports --------------------------------------------------
 
-    async def _export_audio_metadata(self, result: BackupResult) -> Path:
-        collection = self.mongo_db["audio_chunks"]
-        cursor = collection.find({})
-        data = []
-        async for chunk in cursor:
-            data.append(
-                {
-                    "conversation_id": chunk.get("conversation_id"),
-                    "chunk_index": chunk.get("chunk_index"),
-                    "start_time": chunk.get("start_time"),
-                    "end_time": chunk.get("end_time"),
-                    "duration": chunk.get("duration"),
-                    "original_size": chunk.get("original_size"),
-                    "compressed_size": chunk.get("compressed_size"),
-                    "sample_rate": chunk.get("sample_rate", 16000),
-                    "channels": chunk.get("channels", 1),
-                    "has_speech": chunk.get("has_speech"),
-                    "created_at": str(chunk.get("created_at", "")),
-                }
+    def _collection_step(
+        self, name: str, collection_name: str, projection: Optional[dict] = None
+    ):
+        async def step(result: BackupResult) -> Path:
+            return await self._export_collection(
+                name, collection_name, projection, result
             )
-        path = self.backup_path / "audio_chunks_metadata.json"
-        with open(path, "w") as f:
-            json.dump(data, f, indent=2, default=str)
-        result.record("audio_metadata", path, True)
-        return path
 
-    async def _export_waveforms(self, result: BackupResult) -> Path:
-        waveforms = await WaveformData.find_all().to_list()
-        data = [w.model_dump(mode="json") for w in waveforms]
-        path = self.backup_path / "waveforms.json"
-        with open(path, "w") as f:
-            json.dump(data, f, indent=2, default=str)
-        result.record("waveforms", path, True)
-        return path
+        return step
 
-    async def _export_chat_sessions(self, result: BackupResult) -> Path:
-        collection = self.mongo_db["chat_sessions"]
-        cursor = collection.find({})
-        data = []
-        async for session in cursor:
-            data.append(
-                {
-                    "session_id": session.get("session_id"),
-                    "user_id": session.get("user_id"),
-                    "title": session.get("title"),
-                    "created_at": str(session.get("created_at", "")),
-                    "updated_at": str(session.get("updated_at", "")),
-                    "metadata": session.get("metadata", {}),
-                }
-            )
-        path = self.backup_path / "chat_sessions.json"
-        with open(path, "w") as f:
-            json.dump(data, f, indent=2, default=str)
-        result.record("chat_sessions", path, True)
-        return path
+    async def _export_collection(
+        self,
+        name: str,
+        collection_name: str,
+        projection: Optional[dict],
+        result: BackupResult,
+    ) -> Path:
+        """Stream one MongoDB collection to ``<name>.ndjson`` as Extended JSON."""
+        path = self.backup_path / f"{name}.ndjson"
+        state = self.checkpoint.get(name)
+        if state.get("done") and path.exists():
+            result.record(name, path, True)
+            return path
 
-    async def _export_chat_messages(self, result: BackupResult) -> Path:
-        collection = self.mongo_db["chat_messages"]
-        cursor = collection.find({})
-        data = []
-        async for msg in cursor:
-            data.append(
-                {
-                    "message_id": msg.get("message_id"),
-                    "session_id": msg.get("session_id"),
-                    "user_id": msg.get("user_id"),
-                    "role": msg.get("role"),
-                    "content": msg.get("content"),
-                    "timestamp": str(msg.get("timestamp", "")),
-                    "memories_used": msg.get("memories_used", []),
-                    "metadata": msg.get("metadata", {}),
-                }
-            )
-        path = self.backup_path / "chat_messages.json"
-        with open(path, "w") as f:
-            json.dump(data, f, indent=2, default=str)
-        result.record("chat_messages", path, True)
-        return path
+        query = {}
+        if state.get("last_id"):
+            query = {"_id": {"$gt": json_util.loads(state["last_id"])}}
+        count = state.get("count", 0)
 
-    async def _export_annotations(self, result: BackupResult) -> Path:
-        annotations = await Annotation.find_all().to_list()
-        data = [a.model_dump(mode="json") for a in annotations]
-        path = self.backup_path / "annotations.json"
-        with open(path, "w") as f:
-            json.dump(data, f, indent=2, default=str)
-        result.record("annotations", path, True)
+        out = NdjsonFile(path, state.get("bytes", 0))
+        try:
+            cursor = (
+                self.mongo_db[collection_name]
+                .find(query, projection, batch_size=self.batch_size)
+                .sort("_id", 1)
+            )
+            pending = 0
+            async for doc in cursor:
+                out.write(doc)
+                pending += 1
+                if pending >= self.batch_size:
+                    count += pending
+                    pending = 0
+                    size = await asyncio.to_thread(out.flush)
+                    self.checkpoint.update(
+                        name, last_id=json_util.dumps(doc["_id"]), count=count, bytes=size
+                    )
+                    self._set_progress(name, f"{count} records")
+            count += pending
+            size = await asyncio.to_thread(out.flush)
+            self.checkpoint.update(name, count=count, bytes=size, done=True)
+        finally:
+            out.close()
+
+        result.record(name, path, True)
         return path
 
     async def _export_audio_wav(self, result: BackupResult) -> Optional[Path]:
         """Export audio WAV files for conversations that have transcripts."""
         # Only export audio for conversations with actual transcripts
-        conversations = await Conversation.find(
-            Conversation.active_transcript_version != None  # noqa: E711
-        ).to_list()
+        cursor = self.mongo_db["conversations"].find(
+            {"active_transcript_version": {"$ne": None}}, {"conversation_id": 1}
+        )
+        conversation_ids = [doc["conversation_id"] async for doc in cursor]
 
-        if not conversations:
+        if not conversation_ids:
             result.record("audio_wav", None, True)
             return None
 
         audio_dir = self.backup_path / "audio"
         audio_dir.mkdir(parents=True, exist_ok=True)
-        exported = 0
-        failed = 0
+        semaphore = asyncio.Semaphore(self.concurrency)
+        done = 0
 
-        for conv in conversations:
-            try:
-                ok = await self._export_conversation_audio(
-                    conv.conversation_id, audio_dir
-                )
-                if ok:
-                    exported += 1
-            except Exception as e:
-                logger.warning(f"Audio export failed for {conv.conversation_id}: {e}")
-                failed += 1
+        async def export_one(conversation_id: str) -> Optional[bool]:
+            nonlocal done
+            async with semaphore:
+                try:
+                    return await self._export_conversation_audio(
+                        conversation_id, audio_dir
+                    )
+                except Exception as e:
+                    logger.warning(f"Audio export failed for {conversation_id}: {e}")
+                    return None
+                finally:
+                    done += 1
+                    self._set_progress(
+                        "audio_wav", f"{done}/{len(conversation_ids)} conversations"
+                    )
 
-        ok = exported > 0 or (len(conversations) == 0)
+        outcomes = await asyncio.gather(*(export_one(cid) for cid in conversation_ids))
+        exported = sum(1 for o in outcomes if o)
+        failed = sum(1 for o in outcomes if o is None)
+
+        ok = exported > 0
         error = f"{failed} failed" if failed else ""
         result.record("audio_wav", audio_dir, ok, error)
         return audio_dir
@@ -552,102 +658,118 @@ class BackupManager:
     async def _export_conversation_audio(
         self, conversation_id: str, audio_dir: Path
     ) -> bool:
-        """Decode Opus chunks to WAV for a single conversation. Returns True if audio was exported."""
-        from advanced_omi_backend.utils.audio_chunk_utils import decode_opus_to_pcm
+        """Decode Opus chunks to 1-minute WAV files for a single conversation.
 
-        chunks = (
-            await AudioChunkDocument.find(
-                AudioChunkDocument.conversation_id == conversation_id
-            )
-            .sort("+chunk_index")
-            .to_list()
-        )
+        Chunks are streamed and decoded one at a time; a ``.complete`` marker
+        lets a resumed backup skip conversations that were already exported.
+        Returns True if audio was exported.
+        """
+        import wave
 
-        if not chunks:
-            return False
+        from advanced_omi_backend.utils.audio_chunk_utils import decode_opus_to_pcm
 
         conv_dir = audio_dir / conversation_id
-        conv_dir.mkdir(parents=True, exist_ok=True)
-
-        sample_rate = chunks[0].sample_rate
-        channels = chunks[0].channels
+        marker = conv_dir / ".complete"
+        if marker.exists():
+            return True
+
+        cursor = (
+            self.mongo_db["audio_chunks"]
+            .find({"conversation_id": conversation_id})
+            .sort("chunk_index", 1)
+        )
 
-        # Decode all chunks using FFmpeg (same path as UI playback)
         pcm_buffer = bytearray()
-        for chunk in chunks:
+        wav_count = 0
+        sample_rate = channels = None
+        bytes_per_minute = 0
+
+        def write_wav(pcm: bytes):
+            nonlocal wav_count
+            wav_count += 1
+            wav_path = conv_dir / f"chunk_{wav_count:03d}.wav"
+            with wave.open(str(wav_path), "wb") as wf:
+                wf.setnchannels(channels)
+                wf.setsampwidth(2)
+                wf.setframerate(sample_rate)
+                wf.writeframes(pcm)
+
+        async for chunk in cursor:
+            if sample_rate is None:
+                sample_rate = chunk.get("sample_rate", 16000)
+                channels = chunk.get("channels", 1)
+                bytes_per_minute = sample_rate * channels * 2 * 60  # 16-bit samples
+                conv_dir.mkdir(parents=True, exist_ok=True)
             try:
-                pcm_data = await decode_opus_to_pcm(
-                    opus_data=bytes(chunk.audio_data),
-                    sample_rate=sample_rate,
-                    channels=channels,
+                # Decode using FFmpeg (same path as UI playback)
+                pcm_buffer.extend(
+                    await decode_opus_to_pcm(
+                        opus_data=bytes(chunk["audio_data"]),
+                        sample_rate=sample_rate,
+                        channels=channels,
+                    )
                 )
-                pcm_buffer.extend(pcm_data)
             except Exception as e:
                 logger.warning(
-                    f"Opus decode error for {conversation_id} chunk {chunk.chunk_index}: {e}"
+                    f"Opus decode error for {conversation_id} chunk {chunk.get('chunk_index')}: {e}"
                 )
                 continue
 
-        if not pcm_buffer:
-            return False
+            # Split into 1-minute WAV files as soon as a minute is buffered
+            while len(pcm_buffer) >= bytes_per_minute:
+                write_wav(bytes(pcm_buffer[:bytes_per_minute]))
+                del pcm_buffer[:bytes_per_minute]
 
-        # Split into 1-minute WAV files
-        import wave
+        if pcm_buffer:
+            write_wav(bytes(pcm_buffer))
 
-        bytes_per_minute = (
-            sample_rate * channels * 2 * 60
-        )  # 16-bit = 2 bytes per sample
-        all_pcm = bytes(pcm_buffer)
-        chunk_num = 1
-
-        for start in range(0, len(all_pcm), bytes_per_minute):
-            wav_path = conv_dir / f"chunk_{chunk_num:03d}.wav"
-            segment_pcm = all_pcm[start : start + bytes_per_minute]
-            with wave.open(str(wav_path), "wb") as wf:
-                wf.setnchannels(channels)
-                wf.setsampwidth(2)
-                wf.setframerate(sample_rate)
-                wf.writeframes(segment_pcm)
-            chunk_num += 1
+        if not wav_count:
+            return False
 
+        marker.touch()
         return True
 
     async def _export_memories(
         self, qdrant_client: AsyncQdrantClient, result: BackupResult
     ) -> Path:
+        """Stream Qdrant points to ``memories.ndjson``, checkpointing the scroll offset."""
         collection_name = get_qdrant_collection_name()
-        collections = await qdrant_client.get_collections()
-        exists = any(c.name == collection_name for c in collections.collections)
-
-        path = self.backup_path / "memories.json"
-        if not exists:
-            with open(path, "w") as f:
-                json.dump([], f)
+        path = self.backup_path / "memories.ndjson"
+        state = self.checkpoint.get("memories")
+        if state.get("done") and path.exists():
             result.record("memories", path, True)
             return path
 
-        data = []
-        offset = None
-        while True:
-            points, next_offset = await qdrant_client.scroll(
-                collection_name=collection_name,
-                limit=100,
-                offset=offset,
-                with_payload=True,
-                with_vectors=True,
-            )
-            if not points:
-                break
-            for pt in points:
-                data.append(
-                    {"id": str(pt.id), "vector": pt.vector, "payload": pt.payload}
+        collections = await qdrant_client.get_collections()
+        exists = any(c.name == collection_name for c in collections.collections)
+
+        out = NdjsonFile(path, state.get("bytes", 0))
+        count = state.get("count", 0)
+        offset = state.get("offset")
+        try:
+            while exists:
+                points, next_offset = await qdrant_client.scroll(
+                    collection_name=collection_name,
+                    limit=self.batch_size,
+                    offset=offset,
+                    with_payload=True,
+                    with_vectors=True,
                 )
-            if next_offset is None:
-                break
-            offset = next_offset
+                for pt in points:
+                    out.write({"id": str(pt.id), "vector": pt.vector, "payload": pt.payload})
+                count += len(points)
+                offset = next_offset
+                size = await asyncio.to_thread(out.flush)
+                if not points or next_offset is None:
+                    break
+                self.checkpoint.update("memories", offset=offset, count=count, bytes=size)
+                self._set_progress("memories", f"{count} points")
+            self.checkpoint.update(
+                "memories", count=count, bytes=await asyncio.to_thread(out.flush), done=True
+            )
+        finally:
+            out.close()
 
-        with open(path, "w") as f:
-            json.dump(data, f, indent=2)
         result.record("memories", path, True)
         return path
 
@@ -796,6 +918,7 @@ class CleanupManager:
 
     async def _cleanup_mongodb(self, stats: Stats):
         await Conversation.find_all().delete()
+        await TranscriptVersionDocument.find_all().delete()
         await self.mongo_db["audio_chunks"].delete_many({})
         await WaveformData.find_all().delete()
         await self.mongo_db["chat_sessions"].delete_many({})
@@ -849,6 +972,174 @@ class CleanupManager:
             f.unlink()
 
 
+# ---------------------------------------------------------------------------
+# Restore
+# ---------------------------------------------------------------------------
+
+# NDJSON files restored into MongoDB, in dependency order: (file stem, collection).
+# audio_metadata is not restorable (no audio bytes); audio_chunks only exists
+# in backups taken with --audio-format opus.
+MONGO_RESTORES = [
+    ("conversations", "conversations"),
+    ("transcript_versions", "transcript_versions"),
+    ("audio_chunks", "audio_chunks"),
+    ("waveforms", "waveforms"),
+    ("chat_sessions", "chat_sessions"),
+    ("chat_messages", "chat_messages"),
+    ("annotations", "annotations"),
+]
+
+
+class RestoreManager:
+    """Bulk-insert an NDJSON backup back into MongoDB and Qdrant.
+
+    Documents keep their original ``_id``, and duplicate-key errors are
+    ignored, so a restore can be re-run after an interruption or on top of
+    partially restored data without creating duplicates.
+    """
+
+    def __init__(
+        self,
+        backup_path: str,
+        mongo_db: Any,
+        qdrant_client: Optional[AsyncQdrantClient],
+        batch_size: int = 500,
+        concurrency: int = 4,
+    ):
+        self.backup_path = Path(backup_path)
+        self.mongo_db = mongo_db
+        self.qdrant_client = qdrant_client
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.restored: dict[str, dict] = {}  # name -> {inserted, skipped, error}
+
+    def read_manifest(self) -> dict:
+        manifest_path = self.backup_path / "manifest.json"
+        if not manifest_path.exists():
+            raise FileNotFoundError(f"No manifest.json in {self.backup_path}")
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        if manifest.get("format") != BACKUP_FORMAT:
+            raise ValueError(
+                f"Unsupported backup format {manifest.get('format')!r} "
+                f"(expected {BACKUP_FORMAT!r})"
+            )
+        return manifest
+
+    async def run(self) -> bool:
+        """Restore every export present in the backup. Returns True if all succeeded."""
+        manifest = self.read_manifest()
+        exports = manifest.get("exports", {})
+
+        steps = [
+            (name, self._restore_step(name, collection))
+            for name, collection in MONGO_RESTORES
+            if exports.get(name, {}).get("ok")
+        ]
+        if self.qdrant_client and exports.get("memories", {}).get("ok"):
+            steps.append(("memories", self._restore_memories))
+
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(bar_width=30),
+            TimeElapsedColumn(),
+            console=console,
+        ) as progress:
+            tasks = {name: progress.add_task(f"{name}: queued", total=1) for name, _ in steps}
+            semaphore = asyncio.Semaphore(self.concurrency)
+
+            async def run_step(name, func):
+                async with semaphore:
+                    progress.update(tasks[name], description=f"{name}: restoring")
+                    try:
+                        inserted, skipped = await func(
+                            lambda n: progress.update(
+                                tasks[name], description=f"{name}: {n} records"
+                            )
+                        )
+                        self.restored[name] = {"inserted": inserted, "skipped": skipped}
+                        progress.update(tasks[name], description=f"{name}: done", completed=1)
+                    except Exception as e:
+                        logger.warning(f"Restore {name} failed: {e}")
+                        self.restored[name] = {"error": str(e)}
+                        progress.update(
+                            tasks[name], description=f"{name}: [red]failed[/red]", completed=1
+                        )
+
+            await asyncio.gather(*(run_step(name, func) for name, func in steps))
+
+        return all("error" not in r for r in self.restored.values())
+
+    def _restore_step(self, name: str, collection_name: str):
+        async def step(on_progress) -> tuple[int, int]:
+            return await self._restore_collection(name, collection_name, on_progress)
+
+        return step
+
+    async def _restore_collection(
+        self, name: str, collection_name: str, on_progress
+    ) -> tuple[int, int]:
+        """Insert ``<name>.ndjson`` in unordered batches, skipping existing documents."""
+        collection = self.mongo_db[collection_name]
+        inserted = skipped = 0
+        for batch in read_ndjson_batches(self.backup_path / f"{name}.ndjson", self.batch_size):
+            try:
+                result = await collection.insert_many(batch, ordered=False)
+                inserted += len(result.inserted_ids)
+            except BulkWriteError as e:
+                errors = e.details.get("writeErrors", [])
+                if any(err.get("code") != 11000 for err in errors):
+                    raise
+                inserted += e.details.get("nInserted", 0)
+                skipped += len(errors)
+            on_progress(inserted + skipped)
+        return inserted, skipped
+
+    async def _restore_memories(self, on_progress) -> tuple[int, int]:
+        """Upsert ``memories.ndjson`` points, creating the collection if needed."""
+        collection_name = get_qdrant_collection_name()
+        collections = await self.qdrant_client.get_collections()
+        exists = any(c.name == collection_name for c in collections.collections)
+
+        restored = 0
+        for batch in read_ndjson_batches(self.backup_path / "memories.ndjson", self.batch_size):
+            if not exists:
+                await self.qdrant_client.create_collection(
+                    collection_name=collection_name,
+                    vectors_config=VectorParams(
+                        size=len(batch[0]["vector"]), distance=Distance.COSINE
+                    ),
+                )
+                exists = True
+            points = [
+                PointStruct(
+                    id=int(p["id"]) if p["id"].isdigit() else p["id"],
+                    vector=p["vector"],
+                    payload=p["payload"],
+                )
+                for p in batch
+            ]
+            await self.qdrant_client.upsert(collection_name=collection_name, points=points)
+            restored += len(points)
+            on_progress(restored)
+        return restored, 0
+
+    def render_table(self) -> Table:
+        table = Table(title="Restore", border_style="dim", title_style="bold white")
+        table.add_column("Export", style="white", min_width=24)
+        table.add_column("Inserted", justify="right", min_width=10)
+        table.add_column("Skipped (existing)", justify="right", min_width=10)
+
+        for name, info in self.restored.items():
+            if "error" in info:
+                table.add_row(name, "[red]FAILED[/red]", info["error"][:30])
+            else:
+                table.add_row(name, f"[green]{info['inserted']}[/green]", str(info["skipped"]))
+
+        return table
+
+
 # ---------------------------------------------------------------------------
 # Connection setup
 # ---------------------------------------------------------------------------
@@ -865,6 +1156,7 @@ async def connect_services():
         database=mongo_db,
         document_models=[
             Conversation,
+            TranscriptVersionDocument,
             AudioChunkDocument,
             WaveformData,
             User,
@@ -945,9 +1237,13 @@ def print_dry_run(stats: Stats, args):
     if args.backup or args.backup_only:
         console.print(
             "[cyan]Would create backup at:[/cyan]",
-            str(Path(args.backup_dir) / f"backup_..."),
+            args.resume or str(Path(args.backup_dir) / f"backup_..."),
         )
-        if args.export_audio:
+        if args.export_audio and args.audio_format == "opus":
+            console.print(
+                f"[cyan]Would export raw Opus audio[/cyan] ({stats.audio_chunks} chunks)"
+            )
+        elif args.export_audio:
             audio_note = f"(from {stats.conversations_with_transcript} conversations with transcripts)"
             console.print(f"[cyan]Would export audio WAV files[/cyan] {audio_note}")
         console.print()
@@ -992,9 +1288,9 @@ def print_confirmation(stats: Stats, args) -> bool:
             Panel(
                 f"[green]Backup will be created at:[/green] {args.backup_dir}\n"
                 + (
-                    "[green]Audio WAV export included[/green]"
+                    f"[green]Audio export included ({args.audio_format})[/green]"
                     if args.export_audio
-                    else "[dim]Audio WAV export: off[/dim]"
+                    else "[dim]Audio export: off[/dim]"
                 ),
                 title="Backup",
                 border_style="green",
@@ -1046,6 +1342,58 @@ def print_confirmation(stats: Stats, args) -> bool:
 # ---------------------------------------------------------------------------
 
 
+async def run_restore(args, mongo_db: Any, qdrant_client: Optional[AsyncQdrantClient]):
+    """Confirm and run a restore from ``args.restore``."""
+    restore_mgr = RestoreManager(
+        args.restore,
+        mongo_db,
+        qdrant_client,
+        batch_size=args.batch_size,
+        concurrency=args.concurrency,
+    )
+    try:
+        manifest = restore_mgr.read_manifest()
+    except (FileNotFoundError, ValueError) as e:
+        console.print(f"[red]Cannot restore:[/red] {e}")
+        sys.exit(1)
+
+    exports = manifest.get("exports", {})
+    summary = "\n".join(
+        f"  {name} ({_human_size(info.get('size', 0))})"
+        for name, info in exports.items()
+        if info.get("ok")
+        and (name == "memories" or name in dict(MONGO_RESTORES))
+    )
+    console.print(
+        Panel(
+            f"[green]Restore from:[/green] {args.restore}\n"
+            f"[dim]Backup taken {manifest.get('timestamp')}[/dim]\n\n{summary}\n\n"
+            "[dim]Existing documents are kept; only missing ones are inserted.[/dim]",
+            title="Restore",
+            border_style="green",
+        )
+    )
+
+    if args.dry_run:
+        console.print("[dim]Run without --dry-run to proceed[/dim]")
+        return
+    if not args.force and not Confirm.ask("[bold]Proceed?[/bold]", default=False):
+        console.print("[yellow]Cancelled.[/yellow]")
+        return
+
+    success = await restore_mgr.run()
+    console.print()
+    console.print(restore_mgr.render_table())
+    if not success:
+        console.print(
+            Panel("[bold red]Restore encountered errors![/bold red]", border_style="red")
+        )
+        sys.exit(1)
+    console.print(
+        Panel("[bold green]Restore completed successfully![/bold green]", border_style="green")
+    )
+
+
 async def main():
     parser = argparse.ArgumentParser(
         description="Chronicle Cleanup & Backup Tool",
@@ -1057,6 +1405,12 @@ Examples:
   ./cleanup.sh --backup-only --export-audio Back up everything including audio WAV
   ./cleanup.sh --backup                     Back up then clean
   ./cleanup.sh --backup --export-audio      Back up with audio then clean
+  ./cleanup.sh --backup-only --export-audio --audio-format opus
+                                            Back up raw Opus chunks (no decoding)
+  ./cleanup.sh --backup-only --resume /app/data/backups/backup_20250101_120000
+                                            Continue an interrupted backup
+  ./cleanup.sh --restore /app/data/backups/backup_20250101_120000
+                                            Restore a backup
   ./cleanup.sh --backup --force             Skip confirmation prompt
         """,
     )
@@ -1072,7 +1426,38 @@ Examples:
     parser.add_argument(
         "--export-audio",
         action="store_true",
-        help="Include audio WAV export in backup (conversations with transcripts only)",
+        help="Include audio in backup (WAV: conversations with transcripts only)",
+    )
+    parser.add_argument(
+        "--audio-format",
+        choices=("wav", "opus"),
+        default="wav",
+        help="wav: decode to 1-minute WAV files; opus: export raw Opus chunks "
+        "as restorable NDJSON without decoding (default: wav)",
+    )
+    parser.add_argument(
+        "--resume",
+        type=str,
+        metavar="BACKUP_PATH",
+        help="Resume an interrupted backup in this backup directory",
+    )
+    parser.add_argument(
+        "--restore",
+        type=str,
+        metavar="BACKUP_PATH",
+        help="Restore an NDJSON backup (skips documents that already exist)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=500,
+        help="Records per write/insert batch and checkpoint (default: 500)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Exports or restores running at once (default: 4)",
     )
     parser.add_argument(
         "--include-wav", action="store_true", help="Include legacy WAV file cleanup"
@@ -1099,6 +1484,12 @@ Examples:
     if args.export_audio and not (args.backup or args.backup_only):
         console.print("[red]--export-audio requires --backup or --backup-only[/red]")
         sys.exit(1)
+    if args.resume and not (args.backup or args.backup_only):
+        console.print("[red]--resume requires --backup or --backup-only[/red]")
+        sys.exit(1)
+    if args.restore and (args.backup or args.backup_only):
+        console.print("[red]--restore cannot be combined with --backup[/red]")
+        sys.exit(1)
 
     # Header
     print_header()
@@ -1119,6 +1510,10 @@ Examples:
     console.print(render_stats_table(stats, "Current Backend State"))
     console.print()
 
+    if args.restore:
+        await run_restore(args, mongo_db, qdrant_client)
+        return
+
     # Dry-run
     if args.dry_run:
         print_dry_run(stats, args)
@@ -1135,7 +1530,15 @@ Examples:
     if do_backup:
         console.print()
         backup_mgr = BackupManager(
-            args.backup_dir, args.export_audio, mongo_db, neo4j_driver, langfuse_client
+            args.backup_dir,
+            args.export_audio,
+            mongo_db,
+            neo4j_driver,
+            langfuse_client,
+            audio_format=args.audio_format,
+            batch_size=args.batch_size,
+            concurrency=args.concurrency,
+            resume_path=args.resume,
         )
         result = await backup_mgr.run(qdrant_client, stats)
 
@@ -1152,7 +1555,7 @@ Examples:
             console.print(
                 Panel(
                     "[bold red]Critical backup exports failed![/bold red]\n"
-                    "Conversations or audio metadata could not be exported.\n"
+                    "Conversations, transcripts or audio metadata could not be exported.\n"
                     "Cleanup will NOT proceed to protect your data.",
                     title="Backup Verification Failed",
                     border_style="red",
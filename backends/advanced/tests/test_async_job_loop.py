@@ -0,0 +1,75 @@
+"""Unit tests for running async_job coroutines on a shared worker loop."""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from rq import get_current_job
+from rq.job import _job_stack
+
+from advanced_omi_backend.models.job import async_job, set_worker_loop
+
+
+@async_job(redis=False, beanie=False)
+async def _report_job(seconds):
+    await asyncio.sleep(seconds)
+
+    async def child():
+        return get_current_job()
+
+    return get_current_job(), await asyncio.create_task(child())
+
+
+class TestSharedWorkerLoop(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+        set_worker_loop(self.loop)
+
+    def tearDown(self):
+        set_worker_loop(None)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+
+    def _run_as_rq(self, job, results):
+        # What rq's Job.perform() does in the worker thread
+        _job_stack.push(job)
+        try:
+            results[job] = _report_job(0.3)
+        finally:
+            _job_stack.pop()
+
+    def test_concurrent_jobs_see_their_own_job(self):
+        jobs = ["job-a", "job-b", "job-c"]
+        results = {}
+        threads = [threading.Thread(target=self._run_as_rq, args=(job, results)) for job in jobs]
+
+        start = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # All three waited on the same loop at once
+        self.assertLess(time.monotonic() - start, 0.8)
+        for job in jobs:
+            self.assertEqual(results[job], (job, job))
+
+    def test_job_errors_propagate(self):
+        @async_job(redis=False, beanie=False)
+        async def failing():
+            raise TimeoutError("from the job")
+
+        with self.assertRaises(TimeoutError):
+            failing()
+
+
+if __name__ == "__main__":
+    unittest.main()
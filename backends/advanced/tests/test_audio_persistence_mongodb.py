@@ -21,6 +21,7 @@ from beanie import init_beanie
 
 from advanced_omi_backend.models.audio_chunk import AudioChunkDocument
 from advanced_omi_backend.models.conversation import Conversation
+from advanced_omi_backend.models.transcript_version import TranscriptVersionDocument
 from advanced_omi_backend.utils.audio_chunk_utils import (
     encode_pcm_to_opus,
     decode_opus_to_pcm,
@@ -68,7 +69,7 @@ async def init_db(mongodb_client):
 
     await init_beanie(
         database=db,
-        document_models=[AudioChunkDocument, Conversation]
+        document_models=[AudioChunkDocument, Conversation, TranscriptVersionDocument]
     )
 
     yield db
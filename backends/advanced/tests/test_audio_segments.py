@@ -0,0 +1,110 @@
+"""Unit tests for the segment-file audio stream transport."""
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from advanced_omi_backend.services.audio_stream import segments
+from advanced_omi_backend.services.audio_stream.segments import (
+    AudioSegmentReader,
+    AudioSegmentWriter,
+    get_chunk_audio,
+    segment_file,
+)
+
+
+class TestAudioSegments(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.segment_dir = Path(self.tmp.name)
+        self.writer = AudioSegmentWriter(self.segment_dir)
+        self.reader = AudioSegmentReader(self.segment_dir)
+
+    def tearDown(self):
+        self.writer.close("s1")
+        self.tmp.cleanup()
+
+    def test_read_while_file_grows(self):
+        name, first = self.writer.append("s1", b"a" * 8000)
+        self.assertEqual(name, "s1")
+        self.assertEqual(self.reader.read("s1", first, 8000), b"a" * 8000)
+
+        # The reader's map must be refreshed to see later chunks
+        _, second = self.writer.append("s1", b"b" * 8000)
+        self.assertEqual(second, 8000)
+        self.assertEqual(self.reader.read("s1", second, 8000), b"b" * 8000)
+
+    def test_missing_bytes(self):
+        self.assertEqual(self.reader.read("missing", 0, 10), b"")
+        self.writer.append("s1", b"abc")
+        self.assertEqual(self.reader.read("s1", 2, 10), b"")
+
+    def test_get_chunk_audio_both_transports(self):
+        _, offset = self.writer.append("s1", b"pcm")
+        previous_reader, segments._reader = segments._reader, self.reader
+        try:
+            segment_entry = {
+                b"session_id": b"s1",
+                b"segment_offset": str(offset).encode(),
+                b"segment_length": b"3",
+            }
+            # Entries from before rollover carry no segment_name
+            self.assertEqual(get_chunk_audio(segment_entry), b"pcm")
+            self.assertEqual(get_chunk_audio({**segment_entry, b"segment_name": b"s1"}), b"pcm")
+            self.assertEqual(get_chunk_audio({b"audio_data": b"inline"}), b"inline")
+            self.assertEqual(get_chunk_audio({b"chunk_id": b"END"}), b"")
+        finally:
+            segments._reader = previous_reader
+
+    def test_cleanup_expired_skips_open_sessions(self):
+        self.writer.append("s1", b"live")
+        stale = segment_file(self.segment_dir, "old")
+        stale.write_bytes(b"old")
+        old = time.time() - 3 * 3600
+        os.utime(stale, (old, old))
+        os.utime(segment_file(self.segment_dir, "s1"), (old, old))
+
+        self.assertEqual(self.writer.cleanup_expired(), 1)
+        self.assertFalse(stale.exists())
+        self.assertTrue(segment_file(self.segment_dir, "s1").exists())
+
+    def test_long_session_rolls_over_and_expires_old_files(self):
+        writer = AudioSegmentWriter(self.segment_dir, retention_seconds=3600, max_file_bytes=10)
+        self.addCleanup(writer.close, "long")
+
+        written = [writer.append("long", bytes([i]) * 4) for i in range(5)]
+
+        self.assertEqual(
+            written,
+            [("long", 0), ("long", 4), ("long.1", 0), ("long.1", 4), ("long.2", 0)],
+        )
+        for i, (name, offset) in enumerate(written):
+            self.assertEqual(self.reader.read(name, offset, 4), bytes([i]) * 4)
+
+        # Files the session has moved past expire while it keeps streaming
+        old = time.time() - 2 * 3600
+        for name in ("long", "long.1"):
+            os.utime(segment_file(self.segment_dir, name), (old, old))
+        writer.append("long", b"x" * 4)
+        writer.append("long", b"x" * 4)  # Rolls over to long.3
+
+        self.assertFalse(segment_file(self.segment_dir, "long").exists())
+        self.assertFalse(segment_file(self.segment_dir, "long.1").exists())
+        self.assertTrue(segment_file(self.segment_dir, "long.2").exists())
+        self.assertTrue(segment_file(self.segment_dir, "long.3").exists())
+
+    def test_chunk_larger_than_cap_gets_its_own_file(self):
+        writer = AudioSegmentWriter(self.segment_dir, max_file_bytes=10)
+        self.addCleanup(writer.close, "s2")
+
+        self.assertEqual(writer.append("s2", b"a" * 32), ("s2", 0))
+        self.assertEqual(writer.append("s2", b"b" * 4), ("s2.1", 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
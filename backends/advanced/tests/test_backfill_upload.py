@@ -0,0 +1,262 @@
+"""Unit tests for resumable offline backfill uploads."""
+
+import asyncio
+import os
+import struct
+import sys
+import unittest
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from advanced_omi_backend.controllers import audio_controller as ac
+from advanced_omi_backend.utils.audio_utils import AudioValidationError
+from advanced_omi_backend.utils.ogg_opus import parse_ogg_opus
+
+# 20 ms CELT frame (TOC config 31, one frame)
+OPUS_FRAME = bytes([0xF8]) + b"\x00" * 40
+
+
+def _page(packets, granule, sequence, flags=0):
+    lacing = bytearray()
+    for packet in packets:
+        lacing.extend(b"\xff" * (len(packet) // 255))
+        lacing.append(len(packet) % 255)
+    header = struct.pack("<4sBBqIIIB", b"OggS", 0, flags, granule, 1, sequence, 0, len(lacing))
+    return header + bytes(lacing) + b"".join(packets)
+
+
+def ogg_opus(seconds, pre_skip=0, magic=b"OpusHead"):
+    head = struct.pack("<8sBBHIhB", magic, 1, 1, pre_skip, 16000, 0, 0)
+    frames = int(seconds * 50)
+    pages = [_page([head], 0, 0, 0x02), _page([b"OpusTags" + b"\x00" * 8], 0, 1)]
+    # 100 frames (2 s) per page
+    for sequence, start in enumerate(range(0, frames, 100), start=2):
+        count = min(100, frames - start)
+        granule = (start + count) * 960 + pre_skip
+        pages.append(_page([OPUS_FRAME] * count, granule, sequence))
+    return b"".join(pages)
+
+
+def _file(data):
+    return SimpleNamespace(read=AsyncMock(return_value=data))
+
+
+class FakeChunkDocument:
+    """Chunks stored by ``insert_many``; ``find().aggregate()`` sums them."""
+
+    stored = []
+    conversation_id = "conversation_id"
+
+    def __init__(self, **fields):
+        self.__dict__.update(fields)
+
+    @classmethod
+    async def insert_many(cls, chunks, ordered=True):
+        cls.stored.extend(chunks)
+
+    @classmethod
+    def find(cls, *args):
+        return cls
+
+    @classmethod
+    def aggregate(cls, pipeline):
+        chunks = cls.stored
+        totals = [
+            {
+                "_id": None,
+                "last_index": max(c.chunk_index for c in chunks),
+                "end_time": max(c.end_time for c in chunks),
+                "original_size": sum(c.original_size for c in chunks),
+                "compressed_size": sum(c.compressed_size for c in chunks),
+            }
+        ]
+        return SimpleNamespace(to_list=AsyncMock(return_value=totals if chunks else []))
+
+
+def _stored_chunk(index, seconds=10.0, sample_rate=16000):
+    return FakeChunkDocument(
+        chunk_index=index,
+        end_time=(index + 1) * seconds,
+        original_size=int(seconds * sample_rate) * 2,
+        compressed_size=1000,
+    )
+
+
+class TestParseOggOpus(unittest.TestCase):
+    def test_duration_from_last_granule(self):
+        info = parse_ogg_opus(ogg_opus(10, pre_skip=312))
+
+        self.assertAlmostEqual(info.duration, 10.0)
+        self.assertEqual((info.sample_rate, info.channels, info.pages), (16000, 1, 7))
+
+    def test_rejects_other_data(self):
+        for data in (
+            b"RIFF" + b"\x00" * 40,
+            ogg_opus(2, magic=b"OpusTag!"),
+            ogg_opus(2)[:-10],
+            b"",
+        ):
+            with self.assertRaises(AudioValidationError):
+                parse_ogg_opus(data)
+
+
+class TestUploadBackfillParts(unittest.TestCase):
+    def setUp(self):
+        # Parts 0 and 1 were stored at 8 kHz by an earlier request
+        FakeChunkDocument.stored = [_stored_chunk(i, sample_rate=8000) for i in range(2)]
+        self.conversation = SimpleNamespace(conversation_id="c1", completed_at=None)
+        self.set_fields = AsyncMock(return_value=True)
+
+    def _upload(self, first_part, files, stored=(2, 20.0)):
+        with (
+            patch.object(
+                ac, "_get_backfill_conversation", AsyncMock(return_value=self.conversation)
+            ),
+            patch.object(ac, "_stored_part_state", AsyncMock(return_value=stored)),
+            patch.object(ac, "AudioChunkDocument", FakeChunkDocument),
+            patch.object(ac.Conversation, "set_fields", self.set_fields),
+        ):
+            return asyncio.run(ac.upload_backfill_parts(MagicMock(), "c1", first_part, files))
+
+    def _new_chunks(self):
+        return FakeChunkDocument.stored[2:]
+
+    def test_resent_parts_are_skipped_and_timeline_continues(self):
+        files = [_file(ogg_opus(10)) for _ in range(3)]  # parts 1-3, part 1 already stored
+
+        result = self._upload(1, files)
+
+        self.assertEqual(result["next_part"], 4)
+        self.assertEqual(result["stored"], 2)
+        files[0].read.assert_not_awaited()
+        chunks = self._new_chunks()
+        self.assertEqual([c.chunk_index for c in chunks], [2, 3])
+        self.assertEqual([(c.start_time, c.end_time) for c in chunks], [(20.0, 30.0), (30.0, 40.0)])
+        self.assertEqual([c.id for c in chunks], [ac._backfill_chunk_id("c1", i) for i in (2, 3)])
+        fields = self.set_fields.await_args.kwargs
+        self.assertEqual((fields["audio_chunks_count"], fields["audio_total_duration"]), (4, 40.0))
+
+    def test_compression_ratio_uses_each_part_sample_rate(self):
+        data = ogg_opus(10)
+
+        self._upload(2, [_file(data)])
+
+        # 2 x 10 s at 8 kHz already stored, plus 10 s at 16 kHz
+        original = 2 * 160_000 + 320_000
+        self.assertAlmostEqual(
+            self.set_fields.await_args.kwargs["audio_compression_ratio"],
+            (2 * 1000 + len(data)) / original,
+        )
+
+    def test_parts_stored_by_concurrent_request_are_skipped(self):
+        async def insert_many(chunks, ordered=True):
+            self.assertFalse(ordered)
+            FakeChunkDocument.stored.extend(chunks)
+            raise BulkWriteError(
+                {"writeErrors": [{"index": 0, "code": 11000}], "nInserted": len(chunks) - 1}
+            )
+
+        with patch.object(FakeChunkDocument, "insert_many", insert_many):
+            result = self._upload(2, [_file(ogg_opus(10)) for _ in range(2)])
+
+        self.assertEqual((result["stored"], result["next_part"]), (1, 4))
+
+    def test_other_write_errors_are_raised(self):
+        async def insert_many(chunks, ordered=True):
+            raise BulkWriteError({"writeErrors": [{"index": 0, "code": 121}], "nInserted": 0})
+
+        with patch.object(FakeChunkDocument, "insert_many", insert_many):
+            with self.assertRaises(BulkWriteError):
+                self._upload(2, [_file(ogg_opus(10))])
+        self.set_fields.assert_not_awaited()
+
+    def test_part_ids_are_deterministic(self):
+        self.assertEqual(ac._backfill_chunk_id("c1", 3), ac._backfill_chunk_id("c1", 3))
+        self.assertNotEqual(ac._backfill_chunk_id("c1", 3), ac._backfill_chunk_id("c1", 4))
+        self.assertNotEqual(ac._backfill_chunk_id("c1", 3), ac._backfill_chunk_id("c2", 3))
+
+    def test_gap_is_rejected_with_backend_position(self):
+        response = self._upload(5, [_file(ogg_opus(10))])
+
+        self.assertEqual(response.status_code, 409)
+        self.assertIn(b'"next_part":2', response.body)
+        self.assertEqual(self._new_chunks(), [])
+
+    def test_invalid_part_stores_nothing(self):
+        response = self._upload(2, [_file(ogg_opus(10)), _file(b"not audio")])
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self._new_chunks(), [])
+
+    def test_completed_upload_rejects_parts(self):
+        self.conversation.completed_at = datetime(2025, 1, 1)
+
+        response = self._upload(2, [_file(ogg_opus(10))])
+
+        self.assertEqual(response.status_code, 409)
+
+
+class TestStartBackfillUpload(unittest.TestCase):
+    def _start(self, existing, conversation):
+        user = SimpleNamespace(id="0123456789", user_id="u1")
+        status = AsyncMock(side_effect=lambda c: {"conversation_id": c.conversation_id})
+        with (
+            patch.object(ac, "_find_backfill_upload", AsyncMock(side_effect=existing)),
+            patch.object(ac, "create_conversation", return_value=conversation),
+            patch.object(ac, "_backfill_status", status),
+        ):
+            return asyncio.run(ac.start_backfill_upload(user, "dev-1-0", 1735718400.0))
+
+    def test_new_upload_is_placed_at_capture_time_in_utc(self):
+        conversation = SimpleNamespace(conversation_id="new", insert=AsyncMock())
+
+        self.assertEqual(self._start([None], conversation), {"conversation_id": "new"})
+        self.assertEqual(conversation.created_at, datetime(2025, 1, 1, 8, 0, 0))
+
+    def test_concurrent_start_returns_the_stored_conversation(self):
+        conversation = SimpleNamespace(
+            conversation_id="new", insert=AsyncMock(side_effect=DuplicateKeyError("dup"))
+        )
+        stored = SimpleNamespace(conversation_id="stored")
+
+        self.assertEqual(self._start([None, stored], conversation), {"conversation_id": "stored"})
+
+
+class TestCompleteBackfillUpload(unittest.TestCase):
+    def test_complete_enqueues_processing_once(self):
+        conversation = SimpleNamespace(
+            conversation_id="c1",
+            external_source_id="dev-1-0",
+            client_id="abc123-wearable",
+            created_at=datetime(2025, 1, 1, 8, 0, 0),
+            completed_at=None,
+            save=AsyncMock(),
+        )
+        enqueue = MagicMock(return_value=(None, {"speaker_recognition": "s1", "memory": "m1"}))
+
+        async def scenario():
+            first = await ac.complete_backfill_upload(MagicMock(), "c1")
+            second = await ac.complete_backfill_upload(MagicMock(), "c1")
+            return first, second
+
+        with (
+            patch.object(ac, "_get_backfill_conversation", AsyncMock(return_value=conversation)),
+            patch.object(ac, "_stored_part_state", AsyncMock(return_value=(90, 900.0))),
+            patch.object(ac, "enqueue_conversation_processing", enqueue),
+        ):
+            first, second = asyncio.run(scenario())
+
+        enqueue.assert_called_once()
+        self.assertEqual(conversation.completed_at, datetime(2025, 1, 1, 8, 15, 0))
+        self.assertEqual((first["memory_job_id"], first["completed"]), ("m1", True))
+        self.assertTrue(second["completed"])
+        self.assertNotIn("memory_job_id", second)
+
+
+if __name__ == "__main__":
+    unittest.main()
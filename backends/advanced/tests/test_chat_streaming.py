@@ -0,0 +1,206 @@
+"""Unit tests for incremental chat streaming, from the LLM client to the OpenAI-compatible route."""
+
+import asyncio
+import json
+import os
+import sys
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from advanced_omi_backend import chat_service as cs
+from advanced_omi_backend import llm_client
+
+try:
+    # Route modules build the memory service at import time
+    with patch("advanced_omi_backend.services.memory.get_memory_service", return_value=MagicMock()):
+        from advanced_omi_backend.routers.modules import chat_routes
+except ImportError:  # pragma: no cover - needs the full backend dependencies
+    chat_routes = None
+
+
+DELTAS = ["Hel", "lo", " world"]
+
+
+def _chunk(content, choices=True):
+    if not choices:
+        return SimpleNamespace(choices=[])
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content))])
+
+
+class FakeStream:
+    """Async iterator standing in for an OpenAI streaming response."""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._chunks)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+async def _fake_generate_stream(prompt, operation=None):
+    for delta in DELTAS:
+        await asyncio.sleep(0)
+        yield delta
+
+
+class Rendezvous:
+    """Completes only once ``parties`` callers are waiting at the same time."""
+
+    def __init__(self, parties):
+        self.parties = parties
+        self.arrived = 0
+        self.event = asyncio.Event()
+
+    async def wait(self):
+        self.arrived += 1
+        if self.arrived == self.parties:
+            self.event.set()
+        await asyncio.wait_for(self.event.wait(), timeout=1.0)
+
+
+async def _collect(agen):
+    return [item async for item in agen]
+
+
+class TestAsyncGenerateStream(unittest.TestCase):
+    def test_yields_provider_deltas(self):
+        create = AsyncMock(
+            return_value=FakeStream(
+                [
+                    _chunk(None, choices=False),
+                    _chunk("Hel"),
+                    _chunk(None),
+                    _chunk("lo"),
+                    _chunk(" world"),
+                ]
+            )
+        )
+        client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+        op = SimpleNamespace(
+            get_client=lambda is_async: client,
+            to_api_params=lambda: {"model": "m", "temperature": 0.2},
+        )
+        registry = SimpleNamespace(get_llm_operation=lambda name: op)
+
+        with patch.object(llm_client, "get_models_registry", return_value=registry):
+            deltas = asyncio.run(_collect(llm_client.async_generate_stream("hi", operation="chat")))
+
+        self.assertEqual(deltas, DELTAS)
+        params = create.await_args.kwargs
+        self.assertTrue(params["stream"])
+        self.assertEqual(params["messages"], [{"role": "user", "content": "hi"}])
+
+
+class TestGenerateResponseStream(unittest.TestCase):
+    def _service(self, rendezvous):
+        service = cs.ChatService()
+        service._initialized = True
+        service.add_message = AsyncMock(return_value=True)
+
+        async def get_session_messages(session_id, user_id, limit):
+            await rendezvous.wait()
+            return []
+
+        async def get_relevant_memories(query, user_id):
+            await rendezvous.wait()
+            return [SimpleNamespace(id="m1", content="Likes tea")]
+
+        async def get_system_prompt():
+            await rendezvous.wait()
+            return "system"
+
+        service.get_session_messages = get_session_messages
+        service.get_relevant_memories = get_relevant_memories
+        service._get_system_prompt = get_system_prompt
+        return service
+
+    def _run(self):
+        async def scenario():
+            service = self._service(Rendezvous(3))
+            with patch.object(cs, "async_generate_stream", _fake_generate_stream):
+                events = await _collect(service.generate_response_stream("s1", "u1", "hello"))
+            return service, events
+
+        return asyncio.run(scenario())
+
+    def test_token_events_carry_deltas(self):
+        service, events = self._run()
+
+        self.assertEqual(
+            [e["type"] for e in events], ["memory_context", "token", "token", "token", "complete"]
+        )
+        self.assertEqual([e["data"] for e in events if e["type"] == "token"], DELTAS)
+        self.assertEqual(events[0]["data"]["memory_ids"], ["m1"])
+
+        assistant = service.add_message.await_args_list[-1].args[0]
+        self.assertEqual(assistant.role, "assistant")
+        self.assertEqual(assistant.content, "Hello world")
+        self.assertEqual(assistant.memories_used, ["m1"])
+
+    def test_history_memories_and_prompt_are_fetched_concurrently(self):
+        # Each retrieval waits for the other two; run one after another they would time out
+        _, events = self._run()
+        self.assertNotIn("error", [e["type"] for e in events])
+
+    def test_metrics_count_stream_chunks(self):
+        _, events = self._run()
+
+        metrics = events[-1]["data"]["metrics"]
+        self.assertEqual(metrics["chunks"], len(DELTAS))
+        self.assertNotIn("tokens", metrics)
+        self.assertIsNotNone(metrics["time_to_first_token_ms"])
+
+
+@unittest.skipIf(chat_routes is None, "chat routes dependencies not installed")
+class TestOpenAICompatibleRoute(unittest.TestCase):
+    def _chat_service(self):
+        async def generate_response_stream(**kwargs):
+            yield {"type": "memory_context", "data": {"memory_ids": ["m1"], "memory_count": 1}}
+            for delta in DELTAS:
+                yield {"type": "token", "data": delta}
+            yield {
+                "type": "complete",
+                "data": {"message_id": "msg1", "memories_used": ["m1"], "metrics": {"chunks": 3}},
+            }
+
+        return SimpleNamespace(generate_response_stream=generate_response_stream)
+
+    def test_stream_concatenates_to_full_response(self):
+        frames = asyncio.run(
+            _collect(
+                chat_routes._stream_openai_format(
+                    self._chat_service(), "s1", "u1", "hello", False, "chatcmpl-1", 0, "chronicle"
+                )
+            )
+        )
+
+        self.assertEqual(frames[-1], "data: [DONE]\n\n")
+        chunks = [json.loads(frame[len("data: ") :]) for frame in frames[:-1]]
+        content = "".join(c["choices"][0]["delta"].get("content") or "" for c in chunks)
+        self.assertEqual(content, "Hello world")
+        self.assertEqual(chunks[0]["choices"][0]["delta"]["role"], "assistant")
+        self.assertEqual(chunks[-1]["choices"][0]["finish_reason"], "stop")
+        self.assertEqual(chunks[-1]["chronicle_metadata"]["metrics"], {"chunks": 3})
+
+    def test_non_streaming_response_joins_deltas(self):
+        response = asyncio.run(
+            chat_routes._non_streaming_response(
+                self._chat_service(), "s1", "u1", "hello", False, "chatcmpl-1", 0, "chronicle"
+            )
+        )
+
+        self.assertEqual(response.choices[0].message.content, "Hello world")
+        self.assertEqual(response.chronicle_metadata["message_id"], "msg1")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,255 @@
+"""Unit tests for the cleanup tool's NDJSON backup, resume and restore."""
+
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from bson import ObjectId
+from pymongo.errors import BulkWriteError
+
+from advanced_omi_backend.utils import audio_chunk_utils
+from scripts.cleanup_state import (
+    BackupCheckpoint,
+    BackupManager,
+    BackupResult,
+    NdjsonFile,
+    RestoreManager,
+    read_ndjson_batches,
+)
+
+
+def make_docs(count):
+    return [
+        {
+            "_id": ObjectId(),
+            "conversation_id": f"c{i}",
+            "created_at": datetime(2026, 1, 1, 12, i),
+            "audio_data": bytes([i]) * 4,
+            "nested": {"index": i, "tags": ["a", i]},
+        }
+        for i in range(count)
+    ]
+
+
+class Interrupted(Exception):
+    pass
+
+
+class FakeCursor:
+    def __init__(self, docs, fail_after=None):
+        self.docs = docs
+        self.fail_after = fail_after
+
+    def sort(self, *args):
+        return self
+
+    async def __aiter__(self):
+        for i, doc in enumerate(self.docs):
+            if self.fail_after is not None and i >= self.fail_after:
+                raise Interrupted()
+            yield doc
+
+
+class FakeCollection:
+    """The motor calls the backup and restore make, over a list of documents."""
+
+    def __init__(self, docs=(), fail_after=None):
+        self.docs = sorted(docs, key=lambda d: d["_id"])
+        self.fail_after = fail_after
+        self.queries = []
+
+    def find(self, query=None, projection=None, **kwargs):
+        query = query or {}
+        self.queries.append(query)
+        docs = self.docs
+        if "_id" in query:
+            docs = [d for d in docs if d["_id"] > query["_id"]["$gt"]]
+        for key, value in query.items():
+            if key != "_id":
+                docs = [d for d in docs if d.get(key) == value]
+        return FakeCursor(docs, self.fail_after)
+
+    async def insert_many(self, docs, ordered=True):
+        existing = {d["_id"] for d in self.docs}
+        errors = []
+        inserted = []
+        for i, doc in enumerate(docs):
+            if doc["_id"] in existing:
+                errors.append({"index": i, "code": 11000, "errmsg": "duplicate key"})
+            else:
+                self.docs.append(doc)
+                existing.add(doc["_id"])
+                inserted.append(doc["_id"])
+        if errors:
+            raise BulkWriteError({"writeErrors": errors, "nInserted": len(inserted)})
+        return type("InsertManyResult", (), {"inserted_ids": inserted})()
+
+
+class BackupTestCase(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+
+
+class TestNdjson(BackupTestCase):
+    def test_batches_round_trip_bson_types(self):
+        docs = make_docs(5)
+        path = self.dir / "docs.ndjson"
+        out = NdjsonFile(path)
+        for doc in docs:
+            out.write(doc)
+        size = out.flush()
+        out.close()
+
+        self.assertEqual(size, path.stat().st_size)
+        batches = list(read_ndjson_batches(path, batch_size=2))
+        self.assertEqual([len(b) for b in batches], [2, 2, 1])
+        self.assertEqual([d for batch in batches for d in batch], docs)
+
+    def test_reopening_at_offset_drops_partial_tail(self):
+        docs = make_docs(3)
+        path = self.dir / "docs.ndjson"
+        out = NdjsonFile(path)
+        out.write(docs[0])
+        offset = out.flush()
+        out.close()
+        with open(path, "ab") as f:
+            f.write(b'{"_id": {"$oid": "trunc')  # Killed mid-write
+
+        out = NdjsonFile(path, offset)
+        for doc in docs[1:]:
+            out.write(doc)
+        out.flush()
+        out.close()
+
+        self.assertEqual(next(read_ndjson_batches(path, batch_size=10)), docs)
+
+
+class TestResumableBackup(BackupTestCase):
+    def manager(self, mongo_db, resume_path=None):
+        manager = BackupManager(
+            str(self.dir),
+            export_audio=True,
+            mongo_db=mongo_db,
+            batch_size=2,
+            resume_path=resume_path,
+        )
+        manager.backup_path.mkdir(parents=True, exist_ok=True)
+        manager.checkpoint = BackupCheckpoint(manager.backup_path / "checkpoint.json")
+        return manager
+
+    def export(self, manager, name="conversations"):
+        result = BackupResult()
+        path = asyncio.run(manager._export_collection(name, name, None, result))
+        return path, result
+
+    def test_interrupted_export_resumes_from_checkpoint(self):
+        docs = make_docs(5)
+        manager = self.manager({"conversations": FakeCollection(docs, fail_after=3)})
+        with self.assertRaises(Interrupted):
+            self.export(manager)
+
+        with open(manager.backup_path / "checkpoint.json") as f:
+            state = json.load(f)["conversations"]
+        self.assertEqual(state["count"], 2)
+        self.assertNotIn("done", state)
+
+        collection = FakeCollection(docs)
+        resumed = self.manager({"conversations": collection}, resume_path=str(manager.backup_path))
+        path, result = self.export(resumed)
+
+        self.assertEqual(collection.queries, [{"_id": {"$gt": docs[1]["_id"]}}])
+        self.assertTrue(result.exports["conversations"]["ok"])
+        self.assertEqual(next(read_ndjson_batches(path, batch_size=10)), docs)
+        self.assertTrue(resumed.checkpoint.get("conversations")["done"])
+        self.assertEqual(resumed.checkpoint.get("conversations")["count"], 5)
+
+        # A finished export is not read again
+        finished = self.manager({}, resume_path=str(manager.backup_path))
+        self.assertEqual(self.export(finished)[0], path)
+
+    def test_completed_conversation_audio_is_skipped_on_resume(self):
+        chunks = [
+            {
+                "_id": ObjectId(),
+                "conversation_id": "c1",
+                "chunk_index": i,
+                "audio_data": b"opus",
+                "sample_rate": 4,
+                "channels": 1,
+            }
+            for i in range(3)
+        ]
+        audio_dir = self.dir / "audio"
+        decoded = []
+
+        async def decode(opus_data, sample_rate, channels):
+            decoded.append(opus_data)
+            return b"\x00\x01" * 180  # 45 s of 16-bit audio at 4 Hz
+
+        manager = self.manager({"audio_chunks": FakeCollection(chunks)})
+        with patch.object(audio_chunk_utils, "decode_opus_to_pcm", decode):
+            self.assertTrue(asyncio.run(manager._export_conversation_audio("c1", audio_dir)))
+        self.assertEqual(len(decoded), 3)
+        wavs = sorted(p.name for p in (audio_dir / "c1").glob("*.wav"))
+        self.assertEqual(wavs, [f"chunk_{i:03d}.wav" for i in range(1, 4)])
+        self.assertTrue((audio_dir / "c1" / ".complete").exists())
+
+        resumed = self.manager({}, resume_path=str(manager.backup_path))
+        with patch.object(audio_chunk_utils, "decode_opus_to_pcm", decode):
+            self.assertTrue(asyncio.run(resumed._export_conversation_audio("c1", audio_dir)))
+        self.assertEqual(len(decoded), 3)
+
+
+class TestRestore(BackupTestCase):
+    def write_backup(self, docs):
+        out = NdjsonFile(self.dir / "conversations.ndjson")
+        for doc in docs:
+            out.write(doc)
+        out.flush()
+        out.close()
+
+    def restore(self, collection):
+        manager = RestoreManager(str(self.dir), {"conversations": collection}, None, batch_size=2)
+        progress = []
+        counts = asyncio.run(
+            manager._restore_collection("conversations", "conversations", progress.append)
+        )
+        return counts, progress
+
+    def test_rerun_skips_existing_documents(self):
+        docs = make_docs(5)
+        self.write_backup(docs)
+        collection = FakeCollection(docs[1:3])
+
+        counts, progress = self.restore(collection)
+
+        self.assertEqual(counts, (3, 2))
+        self.assertEqual(progress, [2, 4, 5])
+        self.assertEqual(sorted(d["_id"] for d in collection.docs), [d["_id"] for d in docs])
+
+        self.assertEqual(self.restore(collection)[0], (0, 5))
+
+    def test_other_write_errors_fail_the_restore(self):
+        self.write_backup(make_docs(2))
+        collection = FakeCollection()
+
+        async def reject(docs, ordered=True):
+            raise BulkWriteError({"writeErrors": [{"index": 0, "code": 121}], "nInserted": 1})
+
+        collection.insert_many = reject
+        with self.assertRaises(BulkWriteError):
+            self.restore(collection)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,209 @@
+"""Unit tests for the Redis-backed client registry shared by API processes."""
+
+import asyncio
+import json
+import os
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+try:
+    import fakeredis
+except ImportError:  # pragma: no cover - optional test dependency
+    fakeredis = None
+
+from advanced_omi_backend import client_manager as cm
+from advanced_omi_backend import startup_claims
+from advanced_omi_backend.startup_claims import startup_claim
+
+
+class FakeWebSocket:
+    def __init__(self):
+        self.sent = []
+
+    async def send_text(self, text):
+        self.sent.append(json.loads(text))
+
+
+@unittest.skipIf(fakeredis is None, "fakeredis not installed")
+class TestClientRegistry(unittest.TestCase):
+    def setUp(self):
+        self.redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+        patcher = patch.object(cm, "_redis_client", self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # Two API processes sharing one Redis
+        self.process_a = cm.ClientManager()
+        self.process_b = cm.ClientManager()
+
+    def _run(self, coro):
+        return asyncio.run(coro)
+
+    def test_clients_are_visible_to_every_process(self):
+        async def scenario():
+            await self.process_a.create_client(
+                "abc123-omi", Path("/tmp"), "user-1", "u@example.com"
+            )
+            await self.process_b.create_client("abc123-phone", Path("/tmp"), "user-1")
+            await self.process_b.create_client("def456-omi", Path("/tmp"), "user-2")
+
+            clients = await self.process_b.get_registered_clients()
+            user_clients = await self.process_a.get_client_info_summary("user-1")
+            return clients, user_clients
+
+        clients, user_clients = self._run(scenario())
+
+        self.assertEqual(set(clients), {"abc123-omi", "abc123-phone", "def456-omi"})
+        self.assertEqual(clients["abc123-omi"]["instance"], self.process_a.instance_id)
+        self.assertEqual(
+            {c["client_id"]: c["instance"] for c in user_clients},
+            {
+                "abc123-omi": self.process_a.instance_id,
+                "abc123-phone": self.process_b.instance_id,
+            },
+        )
+
+    def test_client_id_is_owned_by_one_process(self):
+        async def scenario():
+            await self.process_a.create_client("abc123-omi", Path("/tmp"), "user-1")
+            with self.assertRaises(ValueError):
+                await self.process_b.create_client("abc123-omi", Path("/tmp"), "user-1")
+
+            # Once released, another process may take the client over
+            await self.process_a.remove_client_with_cleanup("abc123-omi")
+            await self.process_b.create_client("abc123-omi", Path("/tmp"), "user-1")
+            return await self.process_a.get_registered_client("abc123-omi")
+
+        info = self._run(scenario())
+        self.assertEqual(info["instance"], self.process_b.instance_id)
+
+    def test_release_does_not_drop_a_newer_owner(self):
+        async def scenario():
+            await self.process_a.create_client("abc123-omi", Path("/tmp"), "user-1")
+            # A's lease expired (e.g. the process stalled) and B took over
+            await self.redis.delete("client:lease:abc123-omi")
+            await self.process_b.create_client("abc123-omi", Path("/tmp"), "user-1")
+            await self.process_a.remove_client_with_cleanup("abc123-omi")
+            return await self.process_a.get_registered_client("abc123-omi")
+
+        info = self._run(scenario())
+        self.assertEqual(info["instance"], self.process_b.instance_id)
+
+    def test_expired_clients_are_pruned(self):
+        async def scenario():
+            await self.process_a.create_client("abc123-omi", Path("/tmp"), "user-1")
+            # Process A crashed: its lease and info expired without cleanup
+            await self.redis.delete("client:lease:abc123-omi", "client:active:abc123-omi")
+            clients = await self.process_b.get_registered_clients()
+            return clients, await self.redis.smembers(cm.ACTIVE_CLIENTS_KEY)
+
+        clients, index = self._run(scenario())
+        self.assertEqual(clients, {})
+        self.assertEqual(index, set())
+
+    def test_message_routed_to_owning_process(self):
+        async def scenario():
+            websocket = FakeWebSocket()
+            await self.process_a.create_client("abc123-omi", Path("/tmp"), "user-1")
+            self.process_a.attach_websocket("abc123-omi", websocket)
+
+            router = asyncio.create_task(self.process_a._route_client_messages())
+            try:
+                await asyncio.sleep(0.1)  # let the subscription start
+                sent = await self.process_b.send_to_client(
+                    "abc123-omi", {"type": "led", "data": {"on": True}}
+                )
+                for _ in range(50):
+                    if websocket.sent:
+                        break
+                    await asyncio.sleep(0.02)
+            finally:
+                router.cancel()
+                await asyncio.gather(router, return_exceptions=True)
+
+            unknown = await self.process_b.send_to_client("nobody", {"type": "led", "data": {}})
+            return sent, unknown, websocket.sent
+
+        sent, unknown, messages = self._run(scenario())
+        self.assertTrue(sent)
+        self.assertFalse(unknown)
+        self.assertEqual(messages, [{"type": "led", "data": {"on": True}}])
+
+
+class TestLocalFallback(unittest.TestCase):
+    def test_without_redis_clients_are_local(self):
+        async def scenario():
+            manager = cm.ClientManager()
+            await manager.create_client("abc123-omi", Path("/tmp"), "user-1")
+            return (
+                await manager.get_registered_clients("user-1"),
+                await manager.get_registered_client_count(),
+            )
+
+        with patch.object(cm, "_redis_client", None):
+            clients, count = asyncio.run(scenario())
+
+        self.assertEqual(list(clients), ["abc123-omi"])
+        self.assertEqual(count, 1)
+
+
+class FailingRedis:
+    async def set(self, *args, **kwargs):
+        raise ConnectionError("Redis down")
+
+
+@unittest.skipIf(fakeredis is None, "fakeredis not installed")
+class TestStartupClaim(unittest.TestCase):
+    """One-time startup work across processes starting together."""
+
+    def setUp(self):
+        self.redis = fakeredis.FakeAsyncRedis()
+
+    def test_only_one_process_runs_a_task(self):
+        async def scenario():
+            runs = []
+
+            async def process(name):
+                async with startup_claim(self.redis, "migration") as claimed:
+                    if claimed:
+                        runs.append(name)
+                        await asyncio.sleep(0.01)
+
+            await asyncio.gather(*(process(name) for name in "abc"))
+            # Also skipped by a process starting right after the work finished
+            await process("d")
+            async with startup_claim(self.redis, "indexes") as claimed:
+                return runs, claimed
+
+        runs, other_task_claimed = asyncio.run(scenario())
+        self.assertEqual(len(runs), 1)
+        self.assertTrue(other_task_claimed)
+
+    def test_claim_renewed_while_work_runs(self):
+        async def scenario():
+            async with startup_claim(self.redis, "migration"):
+                await asyncio.sleep(1.5)  # Longer than the claim TTL
+                ttl = await self.redis.ttl(
+                    startup_claims.STARTUP_CLAIM_KEY.format(task="migration")
+                )
+            async with startup_claim(self.redis, "migration") as claimed:
+                return ttl, claimed
+
+        with patch.object(startup_claims, "STARTUP_CLAIM_TTL", 1):
+            ttl, claimed_again = asyncio.run(scenario())
+        self.assertGreater(ttl, 0)
+        self.assertFalse(claimed_again)
+
+    def test_runs_without_redis(self):
+        async def scenario():
+            async with startup_claim(FailingRedis(), "migration") as claimed:
+                return claimed
+
+        self.assertTrue(asyncio.run(scenario()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,151 @@
+"""Unit tests for conversation list cursors and cached totals."""
+
+import asyncio
+import os
+import sys
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from advanced_omi_backend.controllers import conversation_controller as cc
+from advanced_omi_backend.models import conversation as conversation_module
+from advanced_omi_backend.models import conversation_counts as counts
+from advanced_omi_backend.models.conversation import Conversation
+
+
+class FakeCountsCollection:
+    def __init__(self):
+        self.docs = {}
+
+    async def find_one(self, query):
+        return self.docs.get(query["_id"])
+
+    async def replace_one(self, query, doc, upsert=False):
+        self.docs[query["_id"]] = dict(doc)
+
+    async def update_many(self, query, update):
+        for key in query["_id"]["$in"]:
+            if key in self.docs:
+                self.docs[key]["count"] += update["$inc"]["count"]
+
+
+class FakeConversations:
+    def __init__(self, total):
+        self.total = total
+        self.count_calls = 0
+        self.database = {counts.COUNTS_COLLECTION: FakeCountsCollection()}
+
+    async def count_documents(self, query):
+        self.count_calls += 1
+        return self.total
+
+
+class TestCursor(unittest.TestCase):
+    def test_round_trip_preserves_types(self):
+        values = {
+            "sort": ["created_at", -1],
+            "value": datetime(2025, 1, 2, 3, 4, 5, 678000),
+            "id": "conv-1",
+        }
+        cursor = cc._encode_cursor(values)
+
+        self.assertNotIn("=", cursor)
+        self.assertEqual(cc._decode_cursor(cursor), values)
+
+    def test_invalid_cursor(self):
+        for cursor in ("not-a-cursor!", cc._encode_cursor({"value": 1})):
+            with self.assertRaises(ValueError):
+                cc._decode_cursor(cursor)
+
+    def test_keyset_filter_descending(self):
+        self.assertEqual(
+            cc._keyset_filter("title", -1, "b", "c2"),
+            {
+                "$or": [
+                    {"title": "b", "conversation_id": {"$lt": "c2"}},
+                    {"title": {"$lt": "b"}},
+                    {"title": None},  # untitled conversations come last
+                ]
+            },
+        )
+
+    def test_keyset_filter_after_null_value(self):
+        # Ascending: nulls come first, so everything non-null follows
+        self.assertEqual(
+            cc._keyset_filter("title", 1, None, "c2"),
+            {"$or": [{"title": None, "conversation_id": {"$gt": "c2"}}, {"title": {"$ne": None}}]},
+        )
+        # Descending: nulls come last, only later nulls follow
+        self.assertEqual(
+            cc._keyset_filter("title", -1, None, "c2"),
+            {"$or": [{"title": None, "conversation_id": {"$lt": "c2"}}]},
+        )
+
+
+class TestCachedTotals(unittest.TestCase):
+    def test_active_total_is_cached_and_adjusted(self):
+        conversations = FakeConversations(total=10)
+
+        async def scenario():
+            first = await counts.cached_conversation_total(
+                conversations, {}, "u1", counts.ACTIVE_VARIANT
+            )
+            await counts.adjust_conversation_total(conversations, "u1", 1)
+            await counts.adjust_conversation_total(conversations, "u1", -1)
+            await counts.adjust_conversation_total(conversations, "u1", 1)
+            second = await counts.cached_conversation_total(
+                conversations, {}, "u1", counts.ACTIVE_VARIANT
+            )
+            return first, second
+
+        first, second = asyncio.run(scenario())
+
+        self.assertEqual((first, second), (10, 11))
+        self.assertEqual(conversations.count_calls, 1)
+
+    def test_stale_totals_are_recounted(self):
+        conversations = FakeConversations(total=3)
+        stale = datetime.utcnow() - timedelta(seconds=counts.VARIANT_TTL_SECONDS + 1)
+        conversations.database[counts.COUNTS_COLLECTION].docs["u1:starred"] = {
+            "count": 99,
+            "refreshed_at": stale,
+        }
+
+        total = asyncio.run(counts.cached_conversation_total(conversations, {}, "u1", "starred"))
+
+        self.assertEqual(total, 3)
+        self.assertEqual(conversations.count_calls, 1)
+
+
+class TestConversationTotalHooks(unittest.TestCase):
+    def _conversation(self):
+        # model_construct skips Beanie's collection lookup in __init__
+        return Conversation.model_construct(conversation_id="c1", user_id="u1", client_id="dev")
+
+    def _deltas(self, conversation, stored_deleted):
+        adjust = AsyncMock()
+        with (
+            patch.object(conversation_module, "adjust_conversation_total", adjust),
+            patch.object(Conversation, "get_pymongo_collection", return_value=None),
+        ):
+            asyncio.run(conversation._update_cached_total(stored_deleted))
+        return [c.args[2] for c in adjust.call_args_list]
+
+    def test_insert_counts_active_conversation(self):
+        self.assertEqual(self._deltas(self._conversation(), None), [1])
+
+    def test_soft_delete_and_restore(self):
+        conversation = self._conversation()
+        conversation.deleted = True
+        self.assertEqual(self._deltas(conversation, False), [-1])
+        conversation.deleted = False
+        self.assertEqual(self._deltas(conversation, True), [1])
+
+    def test_unrelated_save_does_not_adjust(self):
+        self.assertEqual(self._deltas(self._conversation(), False), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
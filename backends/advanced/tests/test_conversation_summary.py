@@ -0,0 +1,184 @@
+"""Unit tests for single-call, change-aware conversation summarization."""
+
+import asyncio
+import json
+import os
+import sys
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from advanced_omi_backend import model_registry
+from advanced_omi_backend.model_registry import LLMOperationConfig
+from advanced_omi_backend.utils import conversation_utils as cu
+
+
+def _segments(*pairs):
+    return [SimpleNamespace(speaker=speaker, text=text) for speaker, text in pairs]
+
+
+class FakeRegistry:
+    async def get_prompt(self, prompt_id, **variables):
+        return f"[{prompt_id} {variables.get('part')}/{variables.get('parts')}]"
+
+
+class FakeLLM:
+    """Answers chunk prompts with short notes and summary prompts with JSON."""
+
+    def __init__(self, summary_response=None):
+        self.calls = []
+        self.summary_response = summary_response or json.dumps(
+            {
+                "title": "Trip Planning",
+                "summary": "Alice plans a trip.",
+                "detailed_summary": "Details.",
+            }
+        )
+
+    async def __call__(self, prompt, operation=None):
+        self.calls.append((operation, prompt))
+        if operation == "summary_chunk":
+            return f"notes {len(self.calls)}"
+        return self.summary_response
+
+
+class TestSummaryInputHash(unittest.TestCase):
+    def test_speaker_relabel_changes_hash(self):
+        original = _segments(("Speaker 0", "Hello there"), ("Speaker 1", "Hi"))
+        relabeled = _segments(("Alice", "Hello there"), ("Speaker 1", "Hi"))
+
+        self.assertEqual(
+            cu.summary_input_hash("Hello there Hi", original),
+            cu.summary_input_hash(
+                "Hello there Hi", _segments(("Speaker 0", "Hello there"), ("Speaker 1", "Hi"))
+            ),
+        )
+        self.assertNotEqual(
+            cu.summary_input_hash("Hello there Hi", original),
+            cu.summary_input_hash("Hello there Hi", relabeled),
+        )
+
+    def test_transcript_without_segments(self):
+        self.assertNotEqual(cu.summary_input_hash("one"), cu.summary_input_hash("two"))
+
+    def test_prompt_or_model_change_changes_hash(self):
+        class FakeModels:
+            model_name = "model-a"
+
+            def get_llm_operation(self, name):
+                return SimpleNamespace(model_def=SimpleNamespace(model_name=self.model_name))
+
+        models = FakeModels()
+
+        def version(template):
+            with (
+                patch.object(cu, "get_user_prompt", AsyncMock(return_value=template)),
+                patch.object(cu, "get_models_registry", return_value=models),
+            ):
+                return asyncio.run(cu.summary_prompt_version("user-1"))
+
+        original = version("PROMPT v1")
+        self.assertEqual(version("PROMPT v1"), original)
+        self.assertNotEqual(version("PROMPT v2"), original)
+        models.model_name = "model-b"
+        self.assertNotEqual(version("PROMPT v1"), original)
+
+        self.assertNotEqual(
+            cu.summary_input_hash("Hello there", prompt_version=original),
+            cu.summary_input_hash("Hello there", prompt_version=version("PROMPT v2")),
+        )
+
+
+class TestSplitForSummary(unittest.TestCase):
+    def test_chunks_respect_limit_and_keep_lines(self):
+        text = "\n".join(f"Speaker {i % 2}: line {i}" for i in range(100))
+        chunks = cu.split_for_summary(text, max_chars=120)
+
+        self.assertTrue(all(len(chunk) <= 120 for chunk in chunks))
+        self.assertEqual("\n".join(chunks), text)
+
+    def test_long_line_is_wrapped(self):
+        chunks = cu.split_for_summary("word " * 100, max_chars=50)
+
+        self.assertTrue(all(len(chunk) <= 50 for chunk in chunks))
+        self.assertEqual(" ".join(chunks).split(), ["word"] * 100)
+
+
+class TestGenerateConversationSummary(unittest.TestCase):
+    def _generate(self, llm, text, segments=None):
+        with (
+            patch.object(cu, "async_generate", llm),
+            patch.object(cu, "get_user_prompt", AsyncMock(return_value="SUMMARY PROMPT")),
+            patch.object(cu, "get_prompt_registry", return_value=FakeRegistry()),
+        ):
+            return asyncio.run(cu.generate_conversation_summary(text, segments=segments))
+
+    def test_short_transcript_uses_one_call(self):
+        llm = FakeLLM()
+        segments = _segments(("Alice", "Let's plan the trip to Lisbon."))
+
+        result = self._generate(llm, "Let's plan the trip to Lisbon.", segments)
+
+        self.assertEqual(
+            result, cu.ConversationSummary("Trip Planning", "Alice plans a trip.", "Details.")
+        )
+        self.assertEqual([op for op, _ in llm.calls], ["conversation_summary"])
+        self.assertIn("Alice: Let's plan the trip to Lisbon.", llm.calls[0][1])
+
+    def test_long_transcript_is_condensed_first(self):
+        llm = FakeLLM()
+        text = "\n".join(f"Speaker 0: sentence number {i} about the budget." for i in range(200))
+
+        with patch.object(cu, "SUMMARY_CHUNK_CHARS", 2000):
+            result = self._generate(llm, text)
+
+        operations = [op for op, _ in llm.calls]
+        self.assertTrue(result.generated)
+        self.assertGreater(operations.count("summary_chunk"), 1)
+        self.assertEqual(operations[-1], "conversation_summary")
+        final_prompt = llm.calls[-1][1]
+        self.assertIn("TRANSCRIPT NOTES:", final_prompt)
+        self.assertNotIn("sentence number 0", final_prompt)
+
+    def test_unparseable_response_falls_back(self):
+        llm = FakeLLM(summary_response="Sorry, I can't help with that.")
+
+        result = self._generate(llm, "We talked about the quarterly budget review.")
+
+        self.assertFalse(result.generated)
+        self.assertEqual(result.title, "We talked about the quarterly budget")
+
+
+class TestRenamedOperations(unittest.TestCase):
+    def test_legacy_settings_move_to_conversation_summary(self):
+        operations = {
+            "conversation_summary": LLMOperationConfig(temperature=0.3, response_format="json"),
+            "title_summary": LLMOperationConfig(model="small", temperature=0.7),
+            "detailed_summary": LLMOperationConfig(model="large", response_format="text"),
+        }
+
+        with self.assertLogs(level="WARNING") as logs:
+            model_registry._apply_renamed_llm_operations(operations)
+
+        self.assertEqual(len(logs.records), 2)
+        self.assertEqual(
+            operations,
+            {
+                "conversation_summary": LLMOperationConfig(
+                    model="large", temperature=0.7, response_format="json"
+                )
+            },
+        )
+
+    def test_current_config_is_unchanged(self):
+        operations = {"conversation_summary": LLMOperationConfig(temperature=0.3)}
+
+        model_registry._apply_renamed_llm_operations(operations)
+
+        self.assertEqual(operations, {"conversation_summary": LLMOperationConfig(temperature=0.3)})
+
+
+if __name__ == "__main__":
+    unittest.main()
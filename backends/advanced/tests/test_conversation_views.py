@@ -0,0 +1,65 @@
+"""Unit tests for the Conversation projection views used by worker jobs."""
+
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from advanced_omi_backend.models.conversation_views import (
+    ConversationContextView,
+    MemoryJobView,
+    TitleSummaryJobView,
+)
+
+
+def projected_doc():
+    """A raw document as MongoDB returns it for the active-transcript projection."""
+    return {
+        "conversation_id": "c1",
+        "user_id": "u1",
+        "client_id": "client",
+        "active_transcript_version": "v2",
+        "transcript_versions": [
+            {"version_id": "v1", "transcript": "old"},
+            {
+                "version_id": "v2",
+                "transcript": "hello there",
+                "segments": [
+                    {"start": 0.0, "end": 1.0, "text": "hello", "speaker": 0},
+                    {"start": 1.0, "end": 2.0, "text": None, "speaker": "Alice"},
+                ],
+            },
+        ],
+    }
+
+
+class TestConversationViews(unittest.TestCase):
+    def test_active_transcript(self):
+        view = MemoryJobView.model_validate(projected_doc())
+
+        self.assertEqual(view.transcript, "hello there")
+        self.assertEqual([s.text for s in view.segments], ["hello", ""])
+        self.assertIsNone(view.title)
+
+    def test_legacy_speaker_labels(self):
+        view = TitleSummaryJobView.model_validate(projected_doc())
+
+        self.assertEqual([s.speaker for s in view.segments], ["Speaker 0", "Alice"])
+
+    def test_missing_active_version(self):
+        doc = projected_doc()
+        doc["active_transcript_version"] = None
+
+        view = MemoryJobView.model_validate(doc)
+
+        self.assertIsNone(view.transcript)
+        self.assertEqual(view.segments, [])
+
+    def test_projections_exclude_words(self):
+        for view in (ConversationContextView, MemoryJobView, TitleSummaryJobView):
+            self.assertFalse(any("words" in path for path in view.Settings.projection))
+
+
+if __name__ == "__main__":
+    unittest.main()
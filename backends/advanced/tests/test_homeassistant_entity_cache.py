@@ -0,0 +1,105 @@
+"""Unit tests for the Home Assistant plugin's entity cache indexes."""
+
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../plugins")))
+
+from homeassistant.entity_cache import EntityCache
+
+
+def _state(friendly_name, area_id=None):
+    state = {"attributes": {"friendly_name": friendly_name}}
+    if area_id:
+        state["area_id"] = area_id
+    return state
+
+
+def make_cache():
+    entities = {
+        "light.tubelight_3": _state("Study Tubelight", "study"),
+        "switch.desk_fan": _state("Desk Fan", "study"),
+        "light.hue_7": _state("Sofa Lamp", "living_room"),
+    }
+    return EntityCache(
+        areas=["study", "living_room", "kitchen"],
+        area_entities={
+            "study": ["light.tubelight_3", "switch.desk_fan"],
+            "living_room": ["light.hue_7"],
+            "kitchen": [],
+        },
+        entity_details=entities,
+        label_areas={"downstairs": ["living_room", "kitchen"]},
+    )
+
+
+class TestEntityCacheLookups(unittest.TestCase):
+    def test_initial_indexes(self):
+        cache = make_cache()
+
+        self.assertEqual(cache.find_entity_by_name("study tubelight"), "light.tubelight_3")
+        self.assertEqual(cache.find_entity_by_name("tubelite"), "light.tubelight_3")
+        self.assertEqual(cache.find_entity_by_name("desk_fan"), "switch.desk_fan")
+        self.assertEqual(
+            cache.get_entities_in_area("Study"), ["light.tubelight_3", "switch.desk_fan"]
+        )
+        self.assertEqual(cache.get_entities_in_area("study", "light"), ["light.tubelight_3"])
+        self.assertEqual(cache.get_entities_in_area("downstairs", "light"), ["light.hue_7"])
+
+    def test_added_entity_is_found_by_name_area_and_domain(self):
+        cache = make_cache()
+        entities = dict(cache.entity_details)
+        entities["light.pendant"] = _state("Kitchen Pendant", "kitchen")
+
+        self.assertEqual(cache.update_entities(entities), (1, 0))
+
+        self.assertEqual(cache.find_entity_by_name("kitchen pendant"), "light.pendant")
+        self.assertEqual(cache.find_entity_by_name("pendant"), "light.pendant")
+        self.assertEqual(cache.get_entities_in_area("kitchen"), ["light.pendant"])
+        self.assertEqual(cache.get_entities_in_area("kitchen", "light"), ["light.pendant"])
+        self.assertEqual(
+            sorted(cache.get_entities_in_area("downstairs", "light")),
+            ["light.hue_7", "light.pendant"],
+        )
+
+    def test_renamed_and_moved_entity_is_reindexed(self):
+        cache = make_cache()
+        entities = dict(cache.entity_details)
+        entities["light.hue_7"] = _state("Reading Light", "study")
+
+        self.assertEqual(cache.update_entities(entities), (1, 0))
+
+        self.assertEqual(cache.find_entity_by_name("reading light"), "light.hue_7")
+        self.assertIsNone(cache.find_entity_by_name("sofa"))
+        self.assertEqual(
+            cache.get_entities_in_area("study", "light"), ["light.tubelight_3", "light.hue_7"]
+        )
+        self.assertEqual(cache.get_entities_in_area("living_room"), [])
+        self.assertEqual(cache.get_entities_in_area("living_room", "light"), [])
+
+    def test_state_only_change_does_not_reindex(self):
+        cache = make_cache()
+        entities = dict(cache.entity_details)
+        entities["switch.desk_fan"] = {**_state("Desk Fan", "study"), "state": "on"}
+
+        self.assertEqual(cache.update_entities(entities), (0, 0))
+        self.assertEqual(cache.entity_details["switch.desk_fan"]["state"], "on")
+        self.assertEqual(cache.find_entity_by_name("desk fan"), "switch.desk_fan")
+
+    def test_removed_entity_disappears_from_all_indexes(self):
+        cache = make_cache()
+        entities = dict(cache.entity_details)
+        del entities["switch.desk_fan"]
+
+        self.assertEqual(cache.update_entities(entities), (0, 1))
+
+        self.assertIsNone(cache.find_entity_by_name("desk fan"))
+        self.assertEqual(cache.rank_entities_by_name("fan"), [])
+        self.assertEqual(cache.get_entities_in_area("study"), ["light.tubelight_3"])
+        self.assertEqual(cache.get_entities_in_area("study", "switch"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,223 @@
+"""Unit tests for batched memory processing helpers."""
+
+import asyncio
+import json
+import os
+import sys
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+try:
+    import fakeredis.aioredis as fakeredis
+except ImportError:  # pragma: no cover - optional test dependency
+    fakeredis = None
+
+from advanced_omi_backend.services.memory.base import (
+    MemoryBatchItem,
+    MemoryEntry,
+    MemoryServiceBase,
+)
+from advanced_omi_backend.services.memory.providers.chronicle import MemoryService
+from advanced_omi_backend.workers import memory_jobs
+from advanced_omi_backend.workers.memory_jobs import (
+    MEMORY_BATCH_CLAIM_KEY,
+    MEMORY_BATCH_RESULT_KEY,
+    _add_memory_batched,
+    _batch_size_for_job,
+)
+
+
+def batch_item(source_id: str, transcript: str = "hello there, nice day") -> MemoryBatchItem:
+    return MemoryBatchItem(
+        transcript=transcript,
+        client_id="client",
+        source_id=source_id,
+        user_id="u1",
+        user_email="u1@example.com",
+    )
+
+
+class TestChronicleBatchHelpers(unittest.TestCase):
+    def test_nearest_fact_item(self):
+        a, b = batch_item("a"), batch_item("b")
+        group = [(a, "likes tea", [1.0, 0.0]), (b, "has a dog", [0.0, 1.0])]
+
+        self.assertIs(MemoryService._nearest_fact_item([0.1, 0.9], group), b)
+        self.assertIs(MemoryService._nearest_fact_item([0.9, 0.2], group), a)
+        self.assertIs(MemoryService._nearest_fact_item(None, group), a)
+
+    def test_prepare_retrieved_memories_dedupes(self):
+        first = [MemoryEntry(id="m1", content="one"), MemoryEntry(id="m2", content="two")]
+        second = [MemoryEntry(id="m2", content="two")]
+
+        retrieved, mapping = MemoryService._prepare_retrieved_memories([first, second])
+
+        self.assertEqual(retrieved, [{"id": "0", "text": "one"}, {"id": "1", "text": "two"}])
+        self.assertEqual(mapping, {"0": "m1", "1": "m2"})
+
+
+class TestDefaultAddMemoriesBatch(unittest.TestCase):
+    def test_falls_back_to_add_memory(self):
+        class Service(MemoryService):
+            async def add_memory(self, transcript, client_id, source_id, *args, **kwargs):
+                if source_id == "bad":
+                    raise RuntimeError("boom")
+                return True, [f"mem-{source_id}"]
+
+        # Call the base implementation, not the chronicle batch pipeline
+        service = Service.__new__(Service)
+        results = asyncio.run(
+            MemoryServiceBase.add_memories_batch(service, [batch_item("ok"), batch_item("bad")])
+        )
+
+        self.assertEqual(results, {"ok": (True, ["mem-ok"]), "bad": (False, [])})
+
+
+class FakeMemoryService:
+    def __init__(self, fail=False, delay=0.0):
+        self.fail = fail
+        self.delay = delay
+        self.calls = []
+
+    async def add_memory(self, transcript, client_id, source_id, *args, **kwargs):
+        self.calls.append([source_id])
+        return True, [f"mem-{source_id}"]
+
+    async def add_memories_batch(self, items, allow_update=False):
+        self.calls.append([item.source_id for item in items])
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("LLM unavailable")
+        return {item.source_id: (True, [f"mem-{item.source_id}"]) for item in items}
+
+
+def claim_key(conversation_id):
+    return MEMORY_BATCH_CLAIM_KEY.format(conversation_id=conversation_id)
+
+
+def result_key(conversation_id):
+    return MEMORY_BATCH_RESULT_KEY.format(conversation_id=conversation_id)
+
+
+@unittest.skipIf(fakeredis is None, "fakeredis not installed")
+class TestBatchClaims(unittest.TestCase):
+    """Leader and sibling memory jobs coordinating through one Redis."""
+
+    def setUp(self):
+        self.redis = fakeredis.FakeRedis()
+        for name, value in [("MEMORY_BATCH_POLL_SECONDS", 0.05), ("MEMORY_BATCH_CLAIM_TTL", 1)]:
+            p = patch.object(memory_jobs, name, value)
+            p.start()
+            self.addCleanup(p.stop)
+
+    def claim_siblings(self, *conversation_ids):
+        """Stand in for the queue scan: claim the given conversations like it would."""
+
+        async def claim(redis_client, item, user, limit):
+            claimed = []
+            for conversation_id in conversation_ids[:limit]:
+                if await redis_client.set(claim_key(conversation_id), "1", nx=True, ex=1):
+                    claimed.append(batch_item(conversation_id))
+            return claimed
+
+        p = patch.object(memory_jobs, "_claim_queued_memory_jobs", claim)
+        p.start()
+        self.addCleanup(p.stop)
+
+    def run_batched(self, service, conversation_id, max_conversations=20, max_wait=600):
+        return asyncio.run(
+            _add_memory_batched(
+                service,
+                self.redis,
+                batch_item(conversation_id),
+                None,
+                max_conversations,
+                max_wait,
+            )
+        )
+
+    def get(self, key):
+        return asyncio.run(self.redis.get(key))
+
+    def test_leader_publishes_sibling_results(self):
+        self.claim_siblings("b", "c")
+        service = FakeMemoryService()
+
+        self.assertEqual(self.run_batched(service, "a"), (True, ["mem-a"]))
+
+        self.assertEqual(service.calls, [["a", "b", "c"]])
+        self.assertIsNone(self.get(claim_key("a")))
+        for sibling in ("b", "c"):
+            self.assertIsNotNone(self.get(claim_key(sibling)))
+            self.assertEqual(
+                json.loads(self.get(result_key(sibling))),
+                {"success": True, "memory_ids": [f"mem-{sibling}"]},
+            )
+
+    def test_sibling_consumes_published_result(self):
+        self.claim_siblings("b")
+        self.run_batched(FakeMemoryService(), "a")
+        service = FakeMemoryService()
+
+        self.assertEqual(self.run_batched(service, "b"), (True, ["mem-b"]))
+
+        self.assertEqual(service.calls, [])
+        self.assertIsNone(self.get(claim_key("b")))
+        self.assertIsNone(self.get(result_key("b")))
+
+    def test_claims_released_when_batch_fails(self):
+        self.claim_siblings("b", "c")
+
+        with self.assertRaises(RuntimeError):
+            self.run_batched(FakeMemoryService(fail=True), "a")
+
+        for conversation_id in ("a", "b", "c"):
+            self.assertIsNone(self.get(claim_key(conversation_id)))
+
+        service = FakeMemoryService()
+        self.claim_siblings()
+        self.assertEqual(self.run_batched(service, "b"), (True, ["mem-b"]))
+        self.assertEqual(service.calls, [["b"]])
+
+    def test_leader_renews_claims_while_working(self):
+        self.claim_siblings("b")
+        # The batch outlasts the 1 s claim TTL
+        self.run_batched(FakeMemoryService(delay=1.5), "a")
+
+        self.assertIsNotNone(self.get(claim_key("b")))
+        self.assertIsNotNone(self.get(result_key("b")))
+
+    def test_sibling_processes_conversation_when_leader_died(self):
+        # A killed leader leaves its claim behind but stops renewing it
+        asyncio.run(self.redis.set(claim_key("b"), "1", ex=1))
+        service = FakeMemoryService()
+
+        self.assertEqual(self.run_batched(service, "b", max_conversations=1), (True, ["mem-b"]))
+        self.assertEqual(service.calls, [["b"]])
+        self.assertIsNone(self.get(claim_key("b")))
+
+    def test_sibling_stops_waiting_after_deadline(self):
+        # A leader that is alive but stuck keeps the claim
+        asyncio.run(self.redis.set(claim_key("b"), "1", ex=60))
+        service = FakeMemoryService()
+
+        self.assertEqual(self.run_batched(service, "b", max_wait=0.1), (True, ["mem-b"]))
+        self.assertEqual(service.calls, [["b"]])
+        self.assertIsNotNone(self.get(claim_key("b")))
+
+
+class TestBatchSize(unittest.TestCase):
+    def test_batch_fits_job_timeout(self):
+        config = {"max_conversations": 20, "seconds_per_conversation": 60}
+
+        self.assertEqual(_batch_size_for_job(config, SimpleNamespace(timeout=3600)), 20)
+        self.assertEqual(_batch_size_for_job(config, SimpleNamespace(timeout=900)), 15)
+        self.assertEqual(_batch_size_for_job(config, SimpleNamespace(timeout=30)), 1)
+        self.assertEqual(_batch_size_for_job(config, None), 20)
+
+
+if __name__ == "__main__":
+    unittest.main()
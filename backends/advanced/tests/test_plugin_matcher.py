@@ -0,0 +1,98 @@
+"""Unit tests for the compiled plugin condition matcher."""
+
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from advanced_omi_backend.plugins.matcher import (
+    ConditionMatcher,
+    match_condition,
+    tokenize,
+)
+
+
+class TestTokenize(unittest.TestCase):
+    def test_offsets_point_into_original_text(self):
+        text = "Hey, Vivi!  turn-off"
+        tokens = tokenize(text)
+        self.assertEqual([t for t, _, _ in tokens], ["hey", "vivi", "turn", "off"])
+        for token, start, end in tokens:
+            self.assertEqual(text[start:end].lower(), token)
+
+
+class TestWakeWord(unittest.TestCase):
+    condition = {"type": "wake_word", "wake_words": ["hey vivi", "ok vivi"]}
+
+    def test_command_after_wake_word(self):
+        match = match_condition(self.condition, "Hey, Vivi, turn off lights")
+        self.assertEqual(match.command, "turn off lights")
+        self.assertEqual(match.pattern, "hey vivi")
+
+    def test_must_be_at_start(self):
+        self.assertIsNone(match_condition(self.condition, "I said hey vivi"))
+
+    def test_token_aligned(self):
+        self.assertIsNone(match_condition(self.condition, "hey vivian turn off"))
+
+    def test_singular_wake_word(self):
+        match = match_condition({"type": "wake_word", "wake_word": "Vivi"}, "vivi. lights on")
+        self.assertEqual(match.command, "lights on")
+
+
+class TestKeywordAnywhere(unittest.TestCase):
+    condition = {"type": "keyword_anywhere", "keywords": ["vivi"]}
+
+    def test_keyword_at_end(self):
+        match = match_condition(self.condition, "Turn off the lights, Vivi")
+        self.assertEqual(match.command, "Turn off the lights")
+
+    def test_keyword_at_start(self):
+        match = match_condition(self.condition, "Vivi, turn off the lights in the hall")
+        self.assertEqual(match.command, "turn off the lights in the hall")
+
+    def test_keyword_in_middle(self):
+        match = match_condition(self.condition, "Turn off the hall lights, Vivi, please")
+        self.assertEqual(match.command, "Turn off the hall lights please")
+
+    def test_no_match(self):
+        self.assertIsNone(match_condition(self.condition, "nothing to see here"))
+
+    def test_first_configured_keyword_wins(self):
+        condition = {"type": "keyword_anywhere", "keywords": ["lights", "vivi"]}
+        match = match_condition(condition, "vivi lights on")
+        self.assertEqual(match.pattern, "lights")
+        self.assertEqual(match.command, "vivi on")
+
+
+class TestConditionMatcher(unittest.TestCase):
+    def test_single_pass_over_many_plugins(self):
+        matcher = ConditionMatcher.compile(
+            [
+                ("ha", {"type": "keyword_anywhere", "keywords": ["vivi"]}),
+                ("assistant", {"type": "wake_word", "wake_words": ["hey jarvis"]}),
+                ("notes", {"type": "keyword_anywhere", "keywords": ["take a note"]}),
+                ("email", {"type": "always"}),
+            ]
+        )
+        matches = matcher.match("Hey Jarvis, take a note: call vivi tomorrow")
+
+        self.assertEqual(set(matches), {"ha", "assistant", "notes"})
+        self.assertEqual(matches["assistant"].command, "take a note: call vivi tomorrow")
+        self.assertEqual(matches["notes"].command, "Hey Jarvis call vivi tomorrow")
+        self.assertNotIn("email", matcher.plugin_ids)
+
+    def test_overlapping_patterns(self):
+        matcher = ConditionMatcher.compile(
+            [
+                ("a", {"type": "keyword_anywhere", "keywords": ["lights off"]}),
+                ("b", {"type": "keyword_anywhere", "keywords": ["the lights"]}),
+            ]
+        )
+        matches = matcher.match("turn the lights off")
+        self.assertEqual(set(matches), {"a", "b"})
+
+
+if __name__ == "__main__":
+    unittest.main()
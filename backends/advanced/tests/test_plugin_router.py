@@ -0,0 +1,148 @@
+"""Unit tests for concurrent plugin dispatch in PluginRouter."""
+
+import asyncio
+import os
+import sys
+import time
+import unittest
+from unittest.mock import patch
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from advanced_omi_backend.plugins.base import BasePlugin, PluginResult
+from advanced_omi_backend.plugins.events import PluginEvent
+from advanced_omi_backend.plugins.router import DispatchPolicy, PluginRouter
+
+
+class SleepyPlugin(BasePlugin):
+    """Test plugin that sleeps, then returns a result."""
+
+    def __init__(self, config, delay=0.0, should_continue=True, calls=None, name=""):
+        super().__init__(config)
+        self.delay = delay
+        self.should_continue = should_continue
+        self.calls = calls if calls is not None else []
+        self.name = name
+
+    async def initialize(self):
+        pass
+
+    async def on_conversation_complete(self, context):
+        await asyncio.sleep(self.delay)
+        self.calls.append(self.name)
+        return PluginResult(success=True, message=self.name, should_continue=self.should_continue)
+
+
+def make_config(**dispatch):
+    return {
+        "enabled": True,
+        "events": [PluginEvent.CONVERSATION_COMPLETE],
+        "condition": {"type": "always"},
+        "dispatch": dispatch,
+    }
+
+
+class TestPluginRouterDispatch(unittest.TestCase):
+    def setUp(self):
+        redis_patcher = patch("advanced_omi_backend.plugins.router.redis.from_url")
+        redis_patcher.start()
+        self.addCleanup(redis_patcher.stop)
+        self.router = PluginRouter()
+        self.router._event_redis = None
+
+    def dispatch(self):
+        return self.router.dispatch_event(PluginEvent.CONVERSATION_COMPLETE, user_id="u1", data={})
+
+    def test_policy_defaults(self):
+        policy = DispatchPolicy.from_config(None)
+        self.assertFalse(policy.ordered)
+        self.assertEqual(policy.timeout, 30.0)
+        self.assertEqual(policy.max_in_flight, 4)
+        self.assertEqual(policy.background_events, [])
+
+    def test_independent_plugins_run_concurrently(self):
+        for name in ("a", "b", "c"):
+            self.router.register_plugin(name, SleepyPlugin(make_config(), delay=0.2, name=name))
+
+        start = time.perf_counter()
+        results = asyncio.run(self.dispatch())
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual([r.message for r in results], ["a", "b", "c"])
+        self.assertLess(elapsed, 0.5)
+
+    def test_timeout_isolates_slow_plugin(self):
+        self.router.register_plugin(
+            "slow", SleepyPlugin(make_config(timeout=0.05), delay=1.0, name="slow")
+        )
+        self.router.register_plugin("fast", SleepyPlugin(make_config(), name="fast"))
+
+        results = asyncio.run(self.dispatch())
+
+        self.assertEqual([r.message for r in results], ["fast"])
+        self.assertEqual(self.router.plugin_health["slow"].timeouts, 1)
+        self.assertEqual(self.router.plugin_health["slow"].in_flight, 0)
+
+    def test_should_continue_only_stops_ordered_chain(self):
+        calls = []
+        self.router.register_plugin(
+            "first",
+            SleepyPlugin(
+                make_config(ordered=True), should_continue=False, calls=calls, name="first"
+            ),
+        )
+        self.router.register_plugin(
+            "second", SleepyPlugin(make_config(ordered=True), calls=calls, name="second")
+        )
+        self.router.register_plugin("free", SleepyPlugin(make_config(), calls=calls, name="free"))
+
+        results = asyncio.run(self.dispatch())
+
+        self.assertEqual(sorted(calls), ["first", "free"])
+        self.assertEqual([r.message for r in results], ["first", "free"])
+
+    def test_bulkhead_rejects_when_full(self):
+        self.router.register_plugin(
+            "one", SleepyPlugin(make_config(max_in_flight=1), delay=0.1, name="one")
+        )
+
+        async def run_twice():
+            return await asyncio.gather(self.dispatch(), self.dispatch())
+
+        first, second = asyncio.run(run_twice())
+
+        self.assertEqual(len(first) + len(second), 1)
+        self.assertEqual(self.router.plugin_health["one"].rejected, 1)
+
+    def test_background_events_do_not_block(self):
+        calls = []
+        self.router.register_plugin(
+            "bg",
+            SleepyPlugin(
+                make_config(background_events=[PluginEvent.CONVERSATION_COMPLETE]),
+                delay=0.1,
+                calls=calls,
+                name="bg",
+            ),
+        )
+
+        async def run():
+            results = await self.dispatch()
+            self.assertEqual(results, [])
+            self.assertEqual(calls, [])
+            await self.router.drain_background()
+
+        asyncio.run(run())
+        self.assertEqual(calls, ["bg"])
+
+    def test_latency_recorded_in_health(self):
+        self.router.register_plugin("a", SleepyPlugin(make_config(), name="a"))
+        asyncio.run(self.dispatch())
+
+        latency = self.router.plugin_health["a"].to_dict()["dispatch"]["latency"]
+        self.assertEqual(latency["count"], 1)
+        self.assertEqual(sum(latency["buckets"].values()), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
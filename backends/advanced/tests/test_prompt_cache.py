@@ -0,0 +1,213 @@
+"""Unit tests for the LangFuse prompt cache in PromptRegistry."""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+try:
+    import fakeredis
+except ImportError:  # pragma: no cover - optional test dependency
+    fakeredis = None
+
+from advanced_omi_backend.prompt_registry import (
+    PromptCache,
+    PromptRegistry,
+    SharedGeneration,
+)
+
+
+class FakePrompt:
+    def __init__(self, text, is_fallback=False):
+        self.prompt = text
+        self.is_fallback = is_fallback
+
+    def compile(self, **variables):
+        text = self.prompt
+        for k, v in variables.items():
+            text = text.replace(f"{{{{{k}}}}}", str(v))
+        return text
+
+
+class FakeLangfuse:
+    def __init__(self, prompts=None, delay=0.0):
+        self.prompts = dict(prompts or {})
+        self.delay = delay
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def get_prompt(self, name, fallback=None):
+        with self._lock:
+            self.calls.append(name)
+        time.sleep(self.delay)
+        if name in self.prompts:
+            return FakePrompt(self.prompts[name])
+        if fallback is not None:
+            return FakePrompt(fallback, is_fallback=True)
+        raise Exception(f"Prompt not found: {name}")
+
+
+def make_registry(client, **cache_kwargs):
+    registry = PromptRegistry()
+    registry._langfuse = client
+    registry.cache = PromptCache(**cache_kwargs)
+    registry.register_default("greet", "Hello {{name}}")
+    return registry
+
+
+class TestPromptCache(unittest.TestCase):
+    def test_fresh_hits_skip_langfuse(self):
+        client = FakeLangfuse({"greet": "Hi {{name}}"})
+        registry = make_registry(client)
+
+        async def run():
+            return [await registry.get_prompt("greet", name="Ann") for _ in range(5)]
+
+        self.assertEqual(asyncio.run(run()), ["Hi Ann"] * 5)
+        self.assertEqual(client.calls, ["greet"])
+
+    def test_missing_user_override_is_negatively_cached(self):
+        client = FakeLangfuse({"greet": "Hi {{name}}"})
+        registry = make_registry(client)
+
+        async def run():
+            return [await registry.fetch_prompt("greet:user:u1") for _ in range(3)]
+
+        self.assertEqual(asyncio.run(run()), [None] * 3)
+        self.assertEqual(client.calls, ["greet:user:u1"])
+        self.assertEqual(registry.cache.stats()["misses_cached"], 1)
+
+    def test_fallback_uses_default_and_is_cached_as_miss(self):
+        client = FakeLangfuse()
+        registry = make_registry(client)
+
+        async def run():
+            return [await registry.get_prompt("greet", name="Cy") for _ in range(2)]
+
+        self.assertEqual(asyncio.run(run()), ["Hello Cy"] * 2)
+        self.assertEqual(client.calls, ["greet"])
+        self.assertEqual(registry.cache.stats()["misses_cached"], 1)
+
+    def test_concurrent_misses_share_one_fetch(self):
+        client = FakeLangfuse({"greet": "Hi"}, delay=0.05)
+        registry = make_registry(client)
+
+        async def run():
+            return await asyncio.gather(*(registry.get_prompt("greet") for _ in range(10)))
+
+        self.assertEqual(asyncio.run(run()), ["Hi"] * 10)
+        self.assertEqual(client.calls, ["greet"])
+
+    def test_expired_entry_served_stale_and_refreshed_in_background(self):
+        client = FakeLangfuse({"greet": "v1"})
+        registry = make_registry(client, ttl=0.0)
+
+        async def run():
+            first = await registry.get_prompt("greet")
+            client.prompts["greet"] = "v2"
+            stale = await registry.get_prompt("greet")
+            await asyncio.sleep(0.05)
+            fresh = await registry.get_prompt("greet")
+            return first, stale, fresh
+
+        first, stale, fresh = asyncio.run(run())
+        self.assertEqual((first, stale), ("v1", "v1"))
+        self.assertEqual(fresh, "v2")
+
+    def test_invalidate_forces_refetch(self):
+        client = FakeLangfuse({"greet": "v1", "greet:user:u1": "mine"})
+        registry = make_registry(client)
+
+        async def run():
+            await registry.get_prompt("greet")
+            await registry.fetch_prompt("greet:user:u1")
+            client.prompts["greet"] = "v2"
+            removed = registry.invalidate("greet")
+            return removed, await registry.get_prompt("greet")
+
+        removed, value = asyncio.run(run())
+        self.assertEqual(removed, 2)
+        self.assertEqual(value, "v2")
+
+
+@unittest.skipIf(fakeredis is None, "fakeredis not installed")
+class TestSharedInvalidation(unittest.TestCase):
+    """Two processes (API + worker) sharing one Redis."""
+
+    def setUp(self):
+        server = fakeredis.FakeServer()
+        self.client = FakeLangfuse({"greet": "v1", "other": "o1"})
+        self.api = make_registry(
+            self.client,
+            shared=SharedGeneration(fakeredis.FakeRedis(server=server), check_interval=0),
+        )
+        self.worker = make_registry(
+            self.client,
+            shared=SharedGeneration(fakeredis.FakeRedis(server=server), check_interval=0),
+        )
+
+    def test_invalidation_reaches_other_process(self):
+        async def run():
+            await self.worker.get_prompt("greet")
+            await self.worker.get_prompt("other")
+            self.client.prompts["greet"] = "v2"
+            self.api.invalidate("greet")
+            return await self.worker.get_prompt("greet")
+
+        self.assertEqual(asyncio.run(run()), "v2")
+        self.assertEqual(self.client.calls.count("greet"), 2)
+
+    def test_negative_entries_are_dropped_everywhere(self):
+        async def run():
+            missing = await self.worker.fetch_prompt("greet:user:u1")
+            self.client.prompts["greet:user:u1"] = "mine"
+            self.api.invalidate()
+            return missing, await self.worker.get_prompt("greet:user:u1")
+
+        self.assertEqual(asyncio.run(run()), (None, "mine"))
+
+    def test_own_invalidation_does_not_clear_twice(self):
+        async def run():
+            await self.api.get_prompt("greet")
+            await self.api.get_prompt("other")
+            self.api.invalidate("greet")
+            await self.api.get_prompt("other")
+
+        asyncio.run(run())
+        self.assertEqual(self.client.calls.count("other"), 1)
+
+    def test_checks_are_rate_limited(self):
+        self.worker.cache.shared.check_interval = 3600
+
+        async def run():
+            await self.worker.get_prompt("greet")
+            self.client.prompts["greet"] = "v2"
+            self.api.invalidate("greet")
+            return await self.worker.get_prompt("greet")
+
+        self.assertEqual(asyncio.run(run()), "v1")
+
+    def test_redis_unavailable_keeps_local_cache_working(self):
+        class DownRedis:
+            def get(self, key):
+                raise ConnectionError("redis down")
+
+            incr = get
+
+        registry = make_registry(self.client, shared=SharedGeneration(DownRedis()))
+
+        async def run():
+            first = await registry.get_prompt("greet")
+            registry.invalidate("greet")
+            self.client.prompts["greet"] = "v2"
+            return first, await registry.get_prompt("greet")
+
+        self.assertEqual(asyncio.run(run()), ("v1", "v2"))
+
+
+if __name__ == "__main__":
+    unittest.main()
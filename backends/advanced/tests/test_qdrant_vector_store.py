@@ -0,0 +1,131 @@
+"""Unit tests for QdrantVectorStore batching, pagination and indexing."""
+
+import asyncio
+import os
+import sys
+import unittest
+import uuid
+from types import SimpleNamespace
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from advanced_omi_backend.services.memory.base import MemoryEntry
+from advanced_omi_backend.services.memory.providers.vector_stores import (
+    PAYLOAD_INDEXES,
+    QdrantVectorStore,
+)
+
+
+def _entry(user_id: str, source_id: str, i: int) -> MemoryEntry:
+    return MemoryEntry(
+        id=str(uuid.uuid4()),
+        content=f"memory {i}",
+        metadata={"user_id": user_id, "source_id": source_id, "timestamp": i},
+        embedding=[1.0, float(i % 7), 0.5, 0.0],
+    )
+
+
+class FakeIndexClient:
+    """Records payload index creation against a fixed payload schema."""
+
+    def __init__(self, payload_schema):
+        self.payload_schema = payload_schema
+        self.created = []
+
+    async def get_collection(self, collection_name):
+        return SimpleNamespace(payload_schema=self.payload_schema)
+
+    async def create_payload_index(self, collection_name, field_name, field_schema, wait):
+        self.created.append(field_name)
+
+
+class TestPayloadIndexes(unittest.TestCase):
+    def test_creates_only_missing_indexes(self):
+        store = QdrantVectorStore({"collection_name": "memories"})
+        store.client = FakeIndexClient({"metadata.user_id": object()})
+
+        asyncio.run(store._ensure_payload_indexes())
+
+        self.assertEqual(
+            store.client.created,
+            [name for name in PAYLOAD_INDEXES if name != "metadata.user_id"],
+        )
+
+    def test_rejects_unknown_quantization(self):
+        with self.assertRaises(ValueError):
+            QdrantVectorStore({"quantization": "binary4"})
+        self.assertIsNone(QdrantVectorStore({"quantization": "none"}).quantization)
+
+
+class TestLocalQdrantStore(unittest.TestCase):
+    """Runs against Qdrant's embedded in-memory mode."""
+
+    def setUp(self):
+        self.store = QdrantVectorStore(
+            {
+                "location": ":memory:",
+                "collection_name": "memories",
+                "embedding_dims": 4,
+                "upsert_batch_size": 7,
+            }
+        )
+        # Small pages so pagination is exercised
+        self.store.scroll_page_size = 10
+
+    def _run(self, coro):
+        return asyncio.run(coro)
+
+    def test_batched_upsert_and_paginated_get(self):
+        async def scenario():
+            await self.store.initialize()
+            entries = [_entry("u1", "conv-a", i) for i in range(45)]
+            entries += [_entry("u2", "conv-b", i) for i in range(5)]
+            stored = await self.store.add_memories(entries)
+            everything = await self.store.get_memories("u1", limit=1000)
+            capped = await self.store.get_memories("u1", limit=23)
+            return entries, stored, everything, capped
+
+        entries, stored, everything, capped = self._run(scenario())
+
+        self.assertEqual(stored, [e.id for e in entries])
+        self.assertEqual(len(everything), 45)
+        self.assertEqual(len({m.id for m in everything}), 45)
+        self.assertEqual(len(capped), 23)
+
+    def test_filtered_scrolls(self):
+        async def scenario():
+            await self.store.initialize()
+            await self.store.add_memories(
+                [_entry("u1", "conv-a", i) for i in range(12)]
+                + [_entry("u1", "conv-b", i) for i in range(3)]
+            )
+            by_source = await self.store.get_memories_by_source("u1", "conv-a", limit=100)
+            recent = await self.store.get_recent_memories("u1", since_timestamp=10, limit=100)
+            return by_source, recent
+
+        by_source, recent = self._run(scenario())
+
+        self.assertEqual(len(by_source), 12)
+        self.assertEqual(sorted(m.metadata["timestamp"] for m in recent), [10, 11])
+
+    def test_delete_user_memories_counts_server_side(self):
+        async def scenario():
+            await self.store.initialize()
+            await self.store.add_memories(
+                [_entry("u1", "conv-a", i) for i in range(30)]
+                + [_entry("u2", "conv-b", i) for i in range(4)]
+            )
+            deleted = await self.store.delete_user_memories("u1")
+            return (
+                deleted,
+                await self.store.count_memories("u1"),
+                await self.store.count_memories("u2"),
+            )
+
+        deleted, remaining, other = self._run(scenario())
+
+        self.assertEqual((deleted, remaining, other), (30, 0, 4))
+
+
+if __name__ == "__main__":
+    unittest.main()
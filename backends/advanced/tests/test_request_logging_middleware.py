@@ -0,0 +1,133 @@
+"""ASGI-level tests for the pass-through request logging middleware."""
+
+import asyncio
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from advanced_omi_backend.middleware import app_middleware
+from advanced_omi_backend.middleware.app_middleware import RequestLoggingMiddleware
+
+
+def _scope(path="/api/conversations", method="GET"):
+    return {"type": "http", "method": method, "path": path, "headers": []}
+
+
+def _app(chunks, content_type=b"application/json", sent=None, observed=None):
+    """Downstream ASGI app sending ``chunks`` as separate body messages.
+
+    ``observed`` records how many messages had reached the client before each
+    send, which shows whether the middleware forwards them immediately.
+    """
+
+    async def app(scope, receive, send):
+        messages = [
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", content_type)],
+            }
+        ]
+        for index, chunk in enumerate(chunks):
+            messages.append(
+                {"type": "http.response.body", "body": chunk, "more_body": index < len(chunks) - 1}
+            )
+        for message in messages:
+            if observed is not None:
+                observed.append(len(sent))
+            await send(message)
+
+    return app
+
+
+class TestRequestLoggingMiddleware(unittest.TestCase):
+    def _run(self, middleware_kwargs, chunks, path="/api/conversations", content_type=None):
+        sent = []
+        observed = []
+        app = _app(
+            chunks,
+            content_type=content_type or b"application/json",
+            sent=sent,
+            observed=observed,
+        )
+        middleware = RequestLoggingMiddleware(app, **middleware_kwargs)
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            sent.append(message)
+
+        with self.assertLogs("api.requests", level="INFO") as logs:
+            asyncio.run(middleware(_scope(path), receive, send))
+        return sent, observed, logs.output
+
+    def test_streaming_response_passes_through_unbuffered(self):
+        chunks = [b"data: one\n\n", b"data: two\n\n", b"data: [DONE]\n\n"]
+        sent, observed, logs = self._run({}, chunks, content_type=b"text/event-stream")
+
+        # Each message reached the client before the app produced the next one
+        self.assertEqual(observed, [0, 1, 2, 3])
+        self.assertEqual([m.get("body") for m in sent[1:]], chunks)
+        self.assertEqual(sent[0]["headers"], [(b"content-type", b"text/event-stream")])
+        self.assertIn("200", logs[-1])
+        self.assertIn(f"{sum(map(len, chunks))} bytes (streamed)", logs[-1])
+        self.assertNotIn("Response body", logs[-1])
+
+    def test_body_capture_follows_sample_rate(self):
+        with patch.object(app_middleware.random, "random", return_value=0.3):
+            _, _, sampled = self._run({"body_sample_rate": 0.5}, [b'{"ok": true}'])
+        with patch.object(app_middleware.random, "random", return_value=0.7):
+            _, _, skipped = self._run({"body_sample_rate": 0.5}, [b'{"ok": true}'])
+
+        self.assertIn('Response body:\n{"ok": true}', sampled[-1])
+        self.assertNotIn("Response body", skipped[-1])
+
+    def test_debug_path_prefixes_always_capture(self):
+        kwargs = {"body_sample_rate": 0.0, "body_debug_paths": ["/api/chat"]}
+        _, _, debug = self._run(kwargs, [b'{"id": 1}'], path="/api/chat/sessions")
+        _, _, other = self._run(kwargs, [b'{"id": 1}'], path="/api/conversations")
+
+        self.assertIn('Response body:\n{"id": 1}', debug[-1])
+        self.assertNotIn("Response body", other[-1])
+
+    def test_binary_content_types_are_not_captured(self):
+        kwargs = {"body_debug_paths": ["/api"]}
+        for content_type in (b"audio/wav", b"image/png", b"application/octet-stream"):
+            with self.subTest(content_type=content_type):
+                sent, _, logs = self._run(kwargs, [b"\x00\x01\x02"], content_type=content_type)
+                self.assertEqual(sent[1]["body"], b"\x00\x01\x02")
+                self.assertNotIn("Response body", logs[-1])
+
+    def test_captured_body_is_truncated(self):
+        chunks = [b"a" * 6, b"b" * 6]
+        kwargs = {"body_debug_paths": ["/api"], "max_body_bytes": 8}
+        sent, _, logs = self._run(kwargs, chunks)
+
+        # The client still gets the full body
+        self.assertEqual(b"".join(m["body"] for m in sent[1:]), b"a" * 6 + b"b" * 6)
+        self.assertIn("Response body:\naaaaaabb... [truncated at 8 bytes]", logs[-1])
+
+    def test_excluded_paths_are_not_logged(self):
+        sent = []
+
+        async def app(scope, receive, send):
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b"ok"})
+
+        async def send(message):
+            sent.append(message)
+
+        middleware = RequestLoggingMiddleware(app)
+        with patch.object(app_middleware.request_logger, "info") as info:
+            asyncio.run(middleware(_scope("/health"), None, send))
+
+        info.assert_not_called()
+        self.assertEqual(sent[1]["body"], b"ok")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,335 @@
+"""Unit tests for the columnar transcript version encoding."""
+
+import asyncio
+import copy
+import os
+import sys
+import unittest
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from beanie import Document
+from bson import ObjectId
+
+from advanced_omi_backend.models import conversation as conversation_module
+from advanced_omi_backend.models.conversation import (
+    Conversation,
+    create_conversation,
+    migrate_transcript_storage,
+)
+from advanced_omi_backend.models.transcript_version import (
+    TRANSCRIPT_STORAGE_VERSION,
+    SegmentWords,
+    TranscriptVersionDocument,
+    WordColumns,
+    encode_version_content,
+    unpack_segment_words,
+)
+
+Word = Conversation.Word
+
+
+def make_words(count):
+    return [
+        Word(word=f"w{i}", start=i * 0.25, end=i * 0.25 + 0.2, confidence=0.5, speaker=i % 2)
+        for i in range(count)
+    ]
+
+
+class TestWordColumns(unittest.TestCase):
+    def test_round_trip(self):
+        words = make_words(10)
+        words[3] = Word(word="gap", start=0.75, end=0.95)
+
+        decoded = [Word(**w) for w in WordColumns.pack(words).unpack()]
+
+        self.assertEqual(decoded, words)
+
+    def test_all_missing_columns_are_empty(self):
+        columns = WordColumns.pack([Word(word="hi", start=0.0, end=0.1)])
+
+        self.assertEqual(columns.confidence, b"")
+        self.assertEqual(columns.speaker, b"")
+        self.assertEqual(columns.speaker_confidence, b"")
+        self.assertEqual(len(columns.start_ms), 4)
+
+    def test_times_are_millisecond_precision(self):
+        decoded = WordColumns.pack([Word(word="a", start=1.23449, end=1.5)]).unpack()
+
+        self.assertEqual(decoded[0]["start"], 1.234)
+
+
+class TestEncodeVersionContent(unittest.TestCase):
+    def make_version(self, words, segments):
+        return Conversation.TranscriptVersion(
+            version_id="v1",
+            transcript=" ".join(w.word for w in words),
+            words=words,
+            segments=segments,
+            created_at=datetime.now(),
+        )
+
+    def test_segment_words_reference_version_words(self):
+        words = make_words(6)
+        segments = [
+            Conversation.SpeakerSegment(start=0.0, end=0.7, text="a", speaker="A", words=words[:3]),
+            Conversation.SpeakerSegment(
+                start=0.75, end=1.45, text="b", speaker="B", words=words[3:]
+            ),
+        ]
+
+        doc = encode_version_content("c1", "u1", self.make_version(words, segments))
+        segment_words = [SegmentWords.model_validate(sw) for sw in doc["segment_words"]]
+
+        self.assertEqual(
+            [(sw.offset, sw.count, sw.columns) for sw in segment_words],
+            [(0, 3, None), (3, 3, None)],
+        )
+        self.assertNotIn("words", doc["segments"][0])
+        version_words = WordColumns.model_validate(doc["words"]).unpack()
+        self.assertEqual(
+            [Word(**w) for w in unpack_segment_words(segment_words[1], version_words)],
+            words[3:],
+        )
+
+    def test_diverging_segment_words_get_own_columns(self):
+        words = make_words(2)
+        relabelled = [w.model_copy(update={"speaker": 7}) for w in words]
+        segments = [
+            Conversation.SpeakerSegment(start=0.0, end=0.5, text="a", speaker="A", words=relabelled)
+        ]
+
+        doc = encode_version_content("c1", "u1", self.make_version(words, segments))
+        segment_words = SegmentWords.model_validate(doc["segment_words"][0])
+
+        self.assertIsNotNone(segment_words.columns)
+        self.assertEqual(
+            [Word(**w) for w in unpack_segment_words(segment_words, [])],
+            relabelled,
+        )
+
+
+class FakeVersionStore:
+    """In-memory transcript_versions collection behind the storage helpers."""
+
+    def __init__(self):
+        self.docs = {}
+
+    async def write(self, conversation_id, replace=(), summaries=()):
+        for doc in replace:
+            self.docs[(conversation_id, doc["version_id"])] = copy.deepcopy(doc)
+        for version in summaries:
+            doc = self.docs.get((conversation_id, version.version_id))
+            if doc is not None:
+                doc["transcript"] = version.transcript
+                doc["segments"] = [s.model_dump(exclude={"words"}) for s in version.segments]
+
+    async def insert(self, conversation_id, docs):
+        for doc in docs:
+            self.docs.setdefault((conversation_id, doc["version_id"]), copy.deepcopy(doc))
+
+    async def fetch(self, conversation_id, version_ids, words=True):
+        found = {}
+        for version_id in version_ids:
+            doc = self.docs.get((conversation_id, version_id))
+            if doc is None:
+                continue
+            doc = copy.deepcopy(doc)
+            if not words:
+                doc.pop("words")
+                doc.pop("segment_words")
+            found[version_id] = TranscriptVersionDocument.model_validate(doc)
+        return found
+
+
+class FakeCursor:
+    def __init__(self, docs):
+        self.docs = docs
+        self.count = None
+
+    def sort(self, *args):
+        return self
+
+    def limit(self, count):
+        self.count = count
+        return self
+
+    async def to_list(self, length):
+        return copy.deepcopy(self.docs[: self.count])
+
+
+class FakeConversations:
+    """The few query shapes migrate_transcript_storage uses, over in-memory documents."""
+
+    def __init__(self, docs):
+        self.docs = {doc["_id"]: doc for doc in docs}
+        self.before_update = None
+
+    def find(self, query):
+        return FakeCursor([d for _, d in sorted(self.docs.items()) if self._matches(d, query)])
+
+    async def update_one(self, query, update):
+        if self.before_update:
+            self.before_update(self.docs[query["_id"]])
+        doc = self.docs.get(query["_id"])
+        if doc is None or not self._matches(doc, query):
+            return SimpleNamespace(modified_count=0)
+        doc.update(copy.deepcopy(update["$set"]))
+        return SimpleNamespace(modified_count=1)
+
+    @staticmethod
+    def _matches(doc, query):
+        for key, condition in query.items():
+            if key == "_id":
+                if isinstance(condition, dict):
+                    if not doc["_id"] > condition["$gt"]:
+                        return False
+                elif doc["_id"] != condition:
+                    return False
+            elif key == "transcript_storage_version":
+                if doc.get(key, 0) >= condition["$not"]["$gte"]:
+                    return False
+            elif key == "transcript_versions.0":
+                if not doc.get("transcript_versions"):
+                    return False
+            elif key == "transcript_versions":
+                if len(doc.get(key) or []) != condition["$size"]:
+                    return False
+            else:
+                raise AssertionError(f"Unexpected filter on {key}")
+        return True
+
+
+def make_segments(words, text):
+    return [Conversation.SpeakerSegment(start=0.0, end=2.0, text=text, speaker="A", words=words)]
+
+
+class StorageTestCase(unittest.TestCase):
+    """Conversations saved through the real model, with fake collections."""
+
+    def setUp(self):
+        self.store = FakeVersionStore()
+        self.conversations = FakeConversations([])
+        self.saved = {}
+
+        async def write(document, *args, **kwargs):
+            self.saved[document.conversation_id] = document.model_dump(by_alias=True)
+            return document
+
+        patches = [
+            patch.object(Conversation, "get_pymongo_collection", return_value=self.conversations),
+            patch.object(TranscriptVersionDocument, "get_pymongo_collection", return_value=None),
+            patch.object(Document, "insert", write),
+            patch.object(Document, "save", write),
+            patch.object(conversation_module, "adjust_conversation_total", AsyncMock()),
+            patch.object(conversation_module, "write_transcript_versions", self.store.write),
+            patch.object(conversation_module, "insert_transcript_versions", self.store.insert),
+            patch.object(conversation_module, "fetch_transcript_versions", self.store.fetch),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def load(self, conversation_id):
+        return Conversation.model_validate(copy.deepcopy(self.saved[conversation_id]))
+
+
+class TestConversationVersionStorage(StorageTestCase):
+    def test_save_and_load_round_trip(self):
+        words = make_words(4)
+        conversation = create_conversation("u1", "client", conversation_id="c1")
+        conversation.add_transcript_version("v1", "w0 w1 w2 w3", words, make_segments(words, "all"))
+
+        asyncio.run(conversation.insert())
+
+        header = self.saved["c1"]["transcript_versions"][0]
+        self.assertEqual(self.saved["c1"]["transcript_storage_version"], TRANSCRIPT_STORAGE_VERSION)
+        self.assertEqual((header["transcript"], header["words"]), ("w0 w1 w2 w3", []))
+        self.assertEqual(header["segments"][0]["words"], [])
+        self.assertEqual(header["word_count"], 4)
+        self.assertIn(("c1", "v1"), self.store.docs)
+
+        loaded = self.load("c1")
+        self.assertEqual(loaded.active_transcript.segments[0].text, "all")
+        self.assertFalse(loaded.is_transcript_version_loaded("v1"))
+        asyncio.run(loaded.load_transcript_versions())
+
+        version = loaded.active_transcript
+        self.assertEqual(version.words, words)
+        self.assertEqual(version.segments[0].words, words)
+
+    def test_activating_stored_version_moves_its_summary_onto_the_document(self):
+        first, second = make_words(2), make_words(3)
+        conversation = create_conversation("u1", "client", conversation_id="c1")
+        conversation.add_transcript_version("v1", "first", first, make_segments(first, "one"))
+        conversation.add_transcript_version(
+            "v2", "second", second, make_segments(second, "two"), set_as_active=False
+        )
+        asyncio.run(conversation.insert())
+        headers = self.saved["c1"]["transcript_versions"]
+        self.assertEqual([h["transcript"] for h in headers], ["first", None])
+
+        loaded = self.load("c1")
+        self.assertTrue(loaded.set_active_transcript_version("v2"))
+        asyncio.run(loaded.save())
+
+        headers = self.saved["c1"]["transcript_versions"]
+        self.assertEqual([h["transcript"] for h in headers], [None, "second"])
+        self.assertEqual(headers[1]["segments"][0]["text"], "two")
+        stored_first = WordColumns.model_validate(self.store.docs[("c1", "v1")]["words"])
+        self.assertEqual([Word(**w) for w in stored_first.unpack()], first)
+
+        reloaded = self.load("c1")
+        asyncio.run(reloaded.load_transcript_versions(["v2"]))
+        self.assertEqual(reloaded.active_transcript.words, second)
+
+
+class TestMigrateTranscriptStorage(StorageTestCase):
+    def legacy_document(self, doc_id, conversation_id, words):
+        conversation = create_conversation("u1", "client", conversation_id=conversation_id)
+        conversation.add_transcript_version("v1", "legacy", words, make_segments(words, "old"))
+        raw = conversation.model_dump(by_alias=True)
+        raw["_id"] = doc_id
+        del raw["transcript_storage_version"]  # Predates the field
+        return raw
+
+    def test_legacy_document_is_migrated_once(self):
+        words = make_words(5)
+        doc_id = ObjectId()
+        self.conversations.docs[doc_id] = self.legacy_document(doc_id, "c1", words)
+
+        self.assertEqual(asyncio.run(migrate_transcript_storage(batch_size=1)), 1)
+        self.assertEqual(asyncio.run(migrate_transcript_storage()), 0)
+
+        doc = self.conversations.docs[doc_id]
+        self.assertEqual(doc["transcript_storage_version"], TRANSCRIPT_STORAGE_VERSION)
+        self.assertEqual(doc["transcript_versions"][0]["transcript"], "legacy")
+        self.assertEqual(doc["transcript_versions"][0]["words"], [])
+        self.assertEqual(doc["memory_versions"], [])  # Other fields untouched
+
+        self.saved["c1"] = doc
+        loaded = self.load("c1")
+        asyncio.run(loaded.load_transcript_versions())
+        self.assertEqual(loaded.active_transcript.words, words)
+
+    def test_concurrent_save_wins(self):
+        doc_id = ObjectId()
+        self.conversations.docs[doc_id] = self.legacy_document(doc_id, "c1", make_words(2))
+        # A worker saves the conversation between the content and document writes
+        self.store.docs[("c1", "v1")] = {"version_id": "v1", "transcript": "edited"}
+
+        def worker_save(doc):
+            doc["transcript_storage_version"] = TRANSCRIPT_STORAGE_VERSION
+
+        self.conversations.before_update = worker_save
+
+        self.assertEqual(asyncio.run(migrate_transcript_storage()), 0)
+        self.assertEqual(self.store.docs[("c1", "v1")]["transcript"], "edited")
+        self.assertEqual(len(self.conversations.docs[doc_id]["transcript_versions"][0]["words"]), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,182 @@
+"""Unit tests for queue-driven autoscaling of RQ worker pools."""
+
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from advanced_omi_backend.workers.orchestrator.autoscaler import (
+    PoolMetrics,
+    QueueAutoscaler,
+    desired_workers,
+)
+from advanced_omi_backend.workers.orchestrator.config import (
+    OrchestratorConfig,
+    WorkerPool,
+)
+from advanced_omi_backend.workers.orchestrator.process_manager import (
+    ManagedWorker,
+    ProcessManager,
+    WorkerState,
+)
+from advanced_omi_backend.workers.orchestrator.worker_registry import (
+    build_worker_definitions,
+)
+
+
+def _pool(**overrides):
+    kwargs = dict(
+        name="rq-worker",
+        command=["python", "-m", "worker"],
+        queues=["default"],
+        min_workers=2,
+        max_workers=6,
+    )
+    kwargs.update(overrides)
+    return WorkerPool(**kwargs)
+
+
+def _fake_start(worker):
+    worker.state = WorkerState.RUNNING
+    return True
+
+
+class TestDesiredWorkers(unittest.TestCase):
+    def test_clamped_to_pool_bounds(self):
+        pool = _pool()
+        self.assertEqual(desired_workers(pool, PoolMetrics(), 2, 30), 2)
+        self.assertEqual(desired_workers(pool, PoolMetrics(queued=3, running=1), 2, 30), 4)
+        self.assertEqual(desired_workers(pool, PoolMetrics(queued=50), 2, 30), 6)
+
+    def test_slots_per_worker(self):
+        pool = _pool(slots_per_worker=4)
+        self.assertEqual(desired_workers(pool, PoolMetrics(queued=9, running=4), 2, 30), 4)
+
+    def test_old_queued_job_adds_a_worker(self):
+        pool = _pool()
+        metrics = PoolMetrics(queued=1, running=2, oldest_job_age=45)
+        self.assertEqual(desired_workers(pool, metrics, 3, 30), 4)
+
+    def test_streaming_sessions(self):
+        metrics = PoolMetrics(queued=0, running=1, active_sessions=3)
+        self.assertEqual(desired_workers(_pool(min_workers=1, max_workers=3), metrics, 1, 30), 1)
+        self.assertEqual(
+            desired_workers(
+                _pool(min_workers=1, max_workers=3, track_streaming_sessions=True), metrics, 1, 30
+            ),
+            3,
+        )
+
+    def test_invalid_bounds(self):
+        with self.assertRaises(ValueError):
+            _pool(min_workers=4, max_workers=2)
+
+
+class TestBuildWorkerDefinitions(unittest.TestCase):
+    def test_initial_pool_size(self):
+        pools = [_pool()]
+        with patch(
+            "advanced_omi_backend.workers.orchestrator.worker_registry.has_streaming_stt_configured",
+            return_value=False,
+        ):
+            fixed = build_worker_definitions(pools, autoscale=False)
+            scaled = build_worker_definitions(pools, autoscale=True)
+
+        self.assertEqual([d.name for d in fixed if d.pool], [f"rq-worker-{i}" for i in range(1, 7)])
+        self.assertEqual([d.name for d in scaled if d.pool], ["rq-worker-1", "rq-worker-2"])
+
+
+class TestQueueAutoscaler(unittest.TestCase):
+    def setUp(self):
+        patcher = patch.object(ManagedWorker, "start", _fake_start)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.pool = _pool()
+        self.config = OrchestratorConfig()
+        self.config.scale_up_job_age = 30
+        self.config.scale_down_delay = 300
+        self.config.drain_timeout = 900
+
+        self.manager = ProcessManager([self.pool.member_definition(i) for i in (1, 2)])
+        self.manager.start_all()
+        self.autoscaler = QueueAutoscaler([self.pool], self.manager, self.config, redis_client=None)
+
+        self.metrics = PoolMetrics()
+        for name, value in (
+            ("_pool_metrics", lambda pool: PoolMetrics(**vars(self.metrics))),
+            ("_count_active_sessions", lambda: 0),
+            # Workers are never mid-job in these tests
+            ("_idle_members", lambda members: list(members)),
+        ):
+            patcher = patch.object(self.autoscaler, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _running(self):
+        return sorted(
+            w.name for w in self.manager.get_all_workers() if w.state == WorkerState.RUNNING
+        )
+
+    def test_scale_up_is_immediate(self):
+        self.metrics = PoolMetrics(queued=4, running=1)
+        self.autoscaler.evaluate(now=0)
+
+        self.assertEqual(
+            self._running(),
+            ["rq-worker-1", "rq-worker-2", "rq-worker-3", "rq-worker-4", "rq-worker-5"],
+        )
+        self.assertEqual(self.autoscaler.decisions[-1]["action"], "scale_up")
+
+    def test_scale_down_waits_for_delay_and_peak(self):
+        self.metrics = PoolMetrics(queued=6)
+        self.autoscaler.evaluate(now=0)
+        self.assertEqual(len(self._running()), 6)
+
+        # Demand drops, briefly bounces back to 4, then settles
+        self.metrics = PoolMetrics(running=1)
+        self.autoscaler.evaluate(now=10)
+        self.metrics = PoolMetrics(running=4)
+        self.autoscaler.evaluate(now=100)
+        self.metrics = PoolMetrics(running=1)
+        self.autoscaler.evaluate(now=200)
+        self.assertEqual(len(self._running()), 6)
+
+        # Delay elapsed: drain down to the peak of the window, highest first
+        self.autoscaler.evaluate(now=311)
+        self.assertEqual(
+            self._running(), ["rq-worker-1", "rq-worker-2", "rq-worker-3", "rq-worker-4"]
+        )
+        self.assertEqual(self.autoscaler.decisions[-1]["workers"], ["rq-worker-6", "rq-worker-5"])
+
+        # Next window drains to the minimum; exited drained workers are reaped
+        self.autoscaler.evaluate(now=320)
+        self.autoscaler.evaluate(now=700)
+        self.assertEqual(self._running(), ["rq-worker-1", "rq-worker-2"])
+        self.autoscaler.evaluate(now=710)
+        self.assertEqual(len(self.manager.get_all_workers()), 2)
+
+    def test_demand_back_at_capacity_cancels_scale_down(self):
+        self.metrics = PoolMetrics(queued=3)
+        self.autoscaler.evaluate(now=0)
+        self.metrics = PoolMetrics()
+        self.autoscaler.evaluate(now=10)
+        self.metrics = PoolMetrics(running=3)
+        self.autoscaler.evaluate(now=20)
+        self.metrics = PoolMetrics()
+        self.autoscaler.evaluate(now=315)
+
+        # Window restarted at 315, so nothing is drained yet
+        self.assertEqual(len(self._running()), 3)
+
+    def test_scale_up_reuses_free_indices(self):
+        self.manager.drain_worker("rq-worker-1")
+        self.autoscaler.evaluate(now=0)
+
+        self.assertEqual(self._running(), ["rq-worker-1", "rq-worker-2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+"""Unit tests for compact binary Wyoming audio framing."""
+
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from advanced_omi_backend.utils.wyoming_framing import (
+    AUDIO_FRAME_HEADER,
+    decode_audio_frame,
+    encode_audio_frame,
+)
+
+
+class TestWyomingFraming(unittest.TestCase):
+    def test_round_trip_matches_json_header_shape(self):
+        payload = bytes(range(200))
+        frame = encode_audio_frame(payload, rate=48000, width=2, channels=2)
+
+        header, decoded = decode_audio_frame(frame)
+
+        self.assertEqual(len(frame), AUDIO_FRAME_HEADER.size + len(payload))
+        self.assertEqual(decoded, payload)
+        self.assertEqual(
+            header,
+            {
+                "type": "audio-chunk",
+                "data": {"rate": 48000, "width": 2, "channels": 2},
+                "payload_length": len(payload),
+            },
+        )
+
+    def test_header_is_ten_bytes(self):
+        self.assertEqual(AUDIO_FRAME_HEADER.size, 10)
+
+    def test_rejects_bad_magic(self):
+        frame = b"XX" + encode_audio_frame(b"abc")[2:]
+        with self.assertRaises(ValueError):
+            decode_audio_frame(frame)
+
+    def test_rejects_truncated_frame(self):
+        with self.assertRaises(ValueError):
+            decode_audio_frame(b"WA\x01")
+
+    def test_rejects_unknown_version(self):
+        frame = bytearray(encode_audio_frame(b"abc"))
+        frame[2] = 9
+        with self.assertRaises(ValueError):
+            decode_audio_frame(bytes(frame))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -602,8 +602,8 @@ const OPERATION_LABELS: Record<string, string> = {
   memory_extraction: 'Memory Extraction',
   memory_update: 'Memory Update',
   memory_reprocess: 'Memory Reprocess',
-  title_summary: 'Title & Summary',
-  detailed_summary: 'Detailed Summary',
+  conversation_summary: 'Title & Summaries',
+  summary_chunk: 'Summary Chunk Notes',
   entity_extraction: 'Entity Extraction',
   chat: 'Chat',
   prompt_optimization: 'Prompt Optimization',
@@ -15,6 +15,12 @@ Environment Variables:
     MIN_RQ_WORKERS               Minimum expected RQ workers (default: 6)
     WORKER_STARTUP_GRACE_PERIOD  Grace period before health checks (default: 30)
     WORKER_SHUTDOWN_TIMEOUT      Max wait for graceful shutdown (default: 30)
+    WORKER_AUTOSCALE             Scale RQ worker pools with queue demand (default: false)
+    RQ_WORKERS_MIN/MAX           Multi-queue worker pool bounds (default: 2/6)
+    AUDIO_WORKERS_MIN/MAX        Audio persistence worker pool bounds (default: 1/3)
+    WORKER_SCALE_UP_JOB_AGE      Queued-job age (s) that forces a scale-up (default: 30)
+    WORKER_SCALE_DOWN_DELAY      Seconds of low demand before draining workers (default: 300)
+    WORKER_DRAIN_TIMEOUT         Max seconds a drained worker may finish its job (default: 900)
     LOG_LEVEL                    Logging level (default: INFO)
 """
 
@@ -35,6 +41,7 @@ from src.advanced_omi_backend.workers.orchestrator import (
     OrchestratorConfig,
     ProcessManager,
     build_worker_definitions,
+    build_worker_pools,
 )
 
 # Configure logging
@@ -63,6 +70,7 @@ class WorkerOrchestrator:
         self.config: Optional[OrchestratorConfig] = None
         self.redis: Optional[Redis] = None
         self.process_manager: Optional[ProcessManager] = None
+        self.worker_pools = []
         self.health_monitor: Optional[HealthMonitor] = None
         self.shutdown_event = asyncio.Event()
 
@@ -87,6 +95,7 @@ class WorkerOrchestrator:
         logger.info(f"Check interval: {self.config.check_interval}s")
         logger.info(f"Min RQ workers: {self.config.min_rq_workers}")
         logger.info(f"Startup grace period: {self.config.startup_grace_period}s")
+        logger.info(f"Autoscaling: {'enabled' if self.config.autoscale_enabled else 'disabled'}")
 
         # 2. Connect to Redis
         logger.info("Connecting to Redis...")
@@ -108,7 +117,15 @@ class WorkerOrchestrator:
 
         # 4. Build worker definitions
         logger.info("Building worker definitions...")
-        worker_definitions = build_worker_definitions()
+        self.worker_pools = build_worker_pools()
+        for pool in self.worker_pools:
+            logger.info(
+                f"Pool {pool.name}: {pool.min_workers}-{pool.max_workers} workers "
+                f"(queues: {', '.join(pool.queues)})"
+            )
+        worker_definitions = build_worker_definitions(
+            self.worker_pools, autoscale=self.config.autoscale_enabled
+        )
         logger.info(f"Total enabled workers: {len(worker_definitions)}")
 
         # 5. Create process manager and start all workers
@@ -138,7 +155,7 @@ class WorkerOrchestrator:
         # 7. Start health monitor
         logger.info("Starting health monitor...")
         self.health_monitor = HealthMonitor(
-            self.process_manager, self.config, self.redis
+            self.process_manager, self.config, self.redis, pools=self.worker_pools
         )
         await self.health_monitor.start()
         logger.info("✅ Health monitor started")
@@ -29,8 +29,14 @@ class BaseASRService(ABC):
     - warmup(): Initialize and warm up the model
     - get_model_id(): Return the model identifier
     - get_capabilities(): Return list of supported capabilities
+
+    Providers that accept per-request decode settings list them in
+    ``decode_options``; ``/transcribe`` passes those form fields to
+    ``transcribe()`` as keyword arguments.
     """
 
+    decode_options: tuple[str, ...] = ()
+
     def __init__(self, model_id: Optional[str] = None):
         """
         Initialize the ASR service.
@@ -183,17 +189,33 @@ def create_asr_app(service: BaseASRService) -> FastAPI:
     async def transcribe(
         file: UploadFile = File(...),
         context_info: Optional[str] = Form(None),
+        beam_size: Optional[int] = Form(None, ge=1),
+        batch_size: Optional[int] = Form(None, ge=1),
     ):
         """
         Transcribe uploaded audio file.
 
         Accepts audio files (WAV, MP3, etc.) and returns transcription
         with word-level timestamps. Optionally accepts context_info
-        (hot words, speaker names, topics) for providers that support it.
+        (hot words, speaker names, topics) for providers that support it,
+        and decode settings (beam_size, batch_size) for providers that
+        list them in ``decode_options``.
         """
         if not service.is_ready:
             raise HTTPException(status_code=503, detail="Service not ready")
 
+        decode_options = {
+            name: value
+            for name, value in (("beam_size", beam_size), ("batch_size", batch_size))
+            if value is not None
+        }
+        unsupported = sorted(set(decode_options) - set(service.decode_options))
+        if unsupported:
+            raise HTTPException(
+                status_code=400,
+                detail=f"{service.provider_name} does not support: {', '.join(unsupported)}",
+            )
+
         request_start = time.time()
         logger.info(f"Transcription request started")
 
@@ -254,6 +276,7 @@ def create_asr_app(service: BaseASRService) -> FastAPI:
             result = await service.transcribe(
                 tmp_filename,
                 context_info=context_info,
+                **decode_options,
             )
             transcribe_time = time.time() - transcribe_start
             logger.info(f"Transcription completed in {transcribe_time:.3f}s")
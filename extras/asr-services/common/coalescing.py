@@ -0,0 +1,106 @@
+"""
+Request coalescing for ASR providers that decode in batches.
+
+Concurrent ``/transcribe`` requests are collected for a short window and
+handed to the provider together, so one batched decode serves several
+requests instead of each request queueing behind the previous one. Only
+requests with the same key (e.g. language and decode settings) are decoded
+together; decodes run one at a time on a dedicated worker thread, and
+requests that arrive while a decode is running join the next one.
+"""
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _PendingRequest:
+    payload: Any
+    batch_size: int
+    future: asyncio.Future = field(repr=False)
+
+
+class RequestCoalescer:
+    """
+    Groups concurrent requests and decodes each group in one call.
+
+    Args:
+        decode_group: ``decode_group(payloads, key, batch_size) -> results``,
+            called on the worker thread with the payloads of one group; must
+            return one result per payload, in order.
+        max_wait: Seconds to wait for more requests before decoding.
+        max_requests: Most requests decoded in one call.
+    """
+
+    def __init__(
+        self,
+        decode_group: Callable[[List[Any], Hashable, int], List[Any]],
+        max_wait: float = 0.02,
+        max_requests: int = 8,
+    ):
+        self.decode_group = decode_group
+        self.max_wait = max_wait
+        self.max_requests = max_requests
+
+        self._pending: Dict[Hashable, List[_PendingRequest]] = {}
+        self._task: Optional[asyncio.Task] = None
+        # The model decodes one batch at a time
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="asr-decode"
+        )
+
+    async def submit(self, payload: Any, key: Hashable, batch_size: int) -> Any:
+        """
+        Queue one request and wait for its result.
+
+        Args:
+            payload: Provider-specific prepared input
+            key: Requests are only decoded together if their keys are equal
+            batch_size: Requested decode batch size; a group uses the
+                smallest batch size requested in it
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending.setdefault(key, []).append(
+            _PendingRequest(payload=payload, batch_size=batch_size, future=future)
+        )
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return await future
+
+    async def _run(self) -> None:
+        while self._pending:
+            # Let concurrent requests join before decoding
+            await asyncio.sleep(self.max_wait)
+            groups, self._pending = self._pending, {}
+            for key, requests in groups.items():
+                for start in range(0, len(requests), self.max_requests):
+                    await self._decode(key, requests[start : start + self.max_requests])
+
+    async def _decode(self, key: Hashable, requests: List[_PendingRequest]) -> None:
+        batch_size = min(r.batch_size for r in requests)
+        payloads = [r.payload for r in requests]
+        logger.info(
+            f"Decoding {len(requests)} coalesced request(s), batch size {batch_size}"
+        )
+        try:
+            results = await asyncio.get_running_loop().run_in_executor(
+                self._executor, self.decode_group, payloads, key, batch_size
+            )
+        except Exception as e:
+            for request in requests:
+                if not request.future.done():
+                    request.future.set_exception(e)
+            return
+
+        for request, result in zip(requests, results):
+            if not request.future.done():
+                request.future.set_result(result)
+
+    def shutdown(self) -> None:
+        """Stop the worker thread once queued decodes finish."""
+        self._executor.shutdown(wait=True)
@@ -14,8 +14,12 @@ from typing import Optional
 import uvicorn
 
 from common.base_service import BaseASRService, create_asr_app
+from common.coalescing import RequestCoalescer
 from common.response_models import TranscriptionResult
-from providers.faster_whisper.transcriber import FasterWhisperTranscriber
+from providers.faster_whisper.transcriber import (
+    DecodeOptions,
+    FasterWhisperTranscriber,
+)
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
@@ -31,15 +35,31 @@ class FasterWhisperService(BaseASRService):
         DEVICE: Device to use (default: cuda)
         VAD_FILTER: Enable VAD filtering (default: true)
         LANGUAGE: Force language code (default: None for auto-detect)
+        BATCHED_INFERENCE: Decode speech clips in batches, coalescing
+            concurrent requests (default: true)
+        BATCH_SIZE: Clips per batched forward pass (default: 8)
+        BEAM_SIZE: Beam size for decoding (default: 5)
+        COALESCE_WAIT_MS: How long to collect concurrent requests (default: 20)
+        COALESCE_MAX_REQUESTS: Most requests decoded together (default: 8)
+
+    ``beam_size`` and ``batch_size`` can also be set per request.
     """
 
+    decode_options = ("beam_size", "batch_size")
+
     def __init__(self, model_id: Optional[str] = None):
         super().__init__(model_id)
         self.transcriber: Optional[FasterWhisperTranscriber] = None
+        self.coalescer: Optional[RequestCoalescer] = None
 
         # Configuration from environment
         self.vad_filter = os.getenv("VAD_FILTER", "true").lower() == "true"
         self.language = os.getenv("LANGUAGE", None)
+        self.batched = os.getenv("BATCHED_INFERENCE", "true").lower() == "true"
+        self.batch_size = int(os.getenv("BATCH_SIZE", "8"))
+        self.beam_size = int(os.getenv("BEAM_SIZE", "5"))
+        self.coalesce_wait = int(os.getenv("COALESCE_WAIT_MS", "20")) / 1000
+        self.coalesce_max_requests = int(os.getenv("COALESCE_MAX_REQUESTS", "8"))
 
     @property
     def provider_name(self) -> str:
@@ -53,6 +73,16 @@ class FasterWhisperService(BaseASRService):
         loop = asyncio.get_event_loop()
         self.transcriber = FasterWhisperTranscriber(self.model_id)
         await loop.run_in_executor(None, self.transcriber.load_model)
+        if self.batched:
+            self.coalescer = RequestCoalescer(
+                self._decode_group,
+                max_wait=self.coalesce_wait,
+                max_requests=self.coalesce_max_requests,
+            )
+            logger.info(
+                f"Batched inference enabled: batch_size={self.batch_size}, "
+                f"coalesce_wait={self.coalesce_wait * 1000:.0f}ms"
+            )
 
         # Warm up with short audio
         logger.info("Warming up model...")
@@ -82,31 +112,60 @@ class FasterWhisperService(BaseASRService):
         self,
         audio_file_path: str,
         context_info: Optional[str] = None,
+        beam_size: Optional[int] = None,
+        batch_size: Optional[int] = None,
     ) -> TranscriptionResult:
-        """Transcribe audio file. context_info is not used by this provider."""
+        """Transcribe audio file. context_info is not used by this provider.
+
+        In batched mode the file is decoded and split into speech clips on a
+        worker thread, then decoded together with concurrent requests that
+        use the same language and beam size.
+        """
         if self.transcriber is None:
             raise RuntimeError("Service not initialized")
 
+        beam_size = beam_size or self.beam_size
         loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(
+
+        if self.coalescer is None:
+            return await loop.run_in_executor(
+                None,
+                lambda: self.transcriber.transcribe(
+                    audio_file_path,
+                    language=self.language,
+                    beam_size=beam_size,
+                    word_timestamps=True,
+                    vad_filter=self.vad_filter,
+                ),
+            )
+
+        prepared = await loop.run_in_executor(
             None,
-            lambda: self.transcriber.transcribe(
+            lambda: self.transcriber.prepare(
                 audio_file_path,
                 language=self.language,
-                word_timestamps=True,
                 vad_filter=self.vad_filter,
             ),
         )
-        return result
+        options = DecodeOptions(language=prepared.language, beam_size=beam_size)
+        return await self.coalescer.submit(
+            prepared, options, batch_size or self.batch_size
+        )
+
+    def _decode_group(self, prepared, options: DecodeOptions, batch_size: int):
+        return self.transcriber.transcribe_batch(prepared, options, batch_size)
 
     def get_capabilities(self) -> list[str]:
-        return [
+        capabilities = [
             "timestamps",
             "word_timestamps",
             "language_detection",
             "vad_filter",
             "translation",
         ]
+        if self.batched:
+            capabilities.append("batched_inference")
+        return capabilities
 
 
 def main():
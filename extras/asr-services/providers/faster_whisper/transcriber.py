@@ -2,18 +2,173 @@
 Faster-Whisper transcriber implementation.
 
 Uses CTranslate2 backend for 4-6x faster inference than OpenAI Whisper.
+
+Two decoding modes:
+- ``transcribe()``: one file at a time with the sequential pipeline
+- ``prepare()`` + ``transcribe_batch()``: audio is split into speech clips
+  of up to 30 s (VAD regions merged), and the clips of several requests are
+  decoded together in batches with faster-whisper's batched pipeline. Word
+  timestamps are mapped back to each request's own timeline.
 """
 
 import logging
 import os
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
-from faster_whisper import WhisperModel
+import numpy as np
+from faster_whisper import BatchedInferencePipeline, WhisperModel, decode_audio
+from faster_whisper.vad import VadOptions, get_speech_timestamps
 
+from common.audio_utils import STANDARD_SAMPLE_RATE
 from common.response_models import Segment, TranscriptionResult, Word
 
 logger = logging.getLogger(__name__)
 
+# Whisper decodes 30 s windows; batched clips never exceed one window
+CLIP_SECONDS = 30.0
+# Silence between requests laid out on one timeline for a batched decode,
+# so no decoded segment or word can straddle two requests
+REQUEST_GAP_SECONDS = 1.0
+
+
+class DecodeOptions(NamedTuple):
+    """Decode settings shared by all requests in one batched decode."""
+
+    language: Optional[str]
+    task: str = "transcribe"
+    beam_size: int = 5
+    word_timestamps: bool = True
+
+
+@dataclass
+class PreparedAudio:
+    """Decoded audio and its speech clips, ready for ``transcribe_batch``."""
+
+    audio: np.ndarray
+    # Contiguous spans to decode, in seconds: [{"start": float, "end": float}]
+    clips: List[Dict[str, float]] = field(default_factory=list)
+    language: Optional[str] = None
+
+    @property
+    def duration(self) -> float:
+        return len(self.audio) / STANDARD_SAMPLE_RATE
+
+
+def merge_speech_regions(
+    regions: List[Dict[str, int]],
+    max_duration: float = CLIP_SECONDS,
+    sample_rate: int = STANDARD_SAMPLE_RATE,
+) -> List[Dict[str, float]]:
+    """
+    Merge VAD speech regions into contiguous clips of at most ``max_duration``.
+
+    Each clip spans from the start of its first region to the end of its
+    last, including the short pauses between them, so clip-relative times
+    map to the original audio by adding the clip start.
+
+    Args:
+        regions: Speech regions in samples, as returned by get_speech_timestamps
+        max_duration: Longest clip in seconds
+        sample_rate: Sample rate of the region offsets
+
+    Returns:
+        Clips in seconds: [{"start": float, "end": float}, ...]
+    """
+    clips: List[Dict[str, float]] = []
+    for region in regions:
+        start = region["start"] / sample_rate
+        end = region["end"] / sample_rate
+        if clips and end - clips[-1]["start"] <= max_duration:
+            clips[-1]["end"] = end
+            continue
+        while end - start > max_duration:
+            clips.append({"start": start, "end": start + max_duration})
+            start += max_duration
+        clips.append({"start": start, "end": end})
+    return clips
+
+
+def _layout_requests(
+    prepared: List[PreparedAudio],
+) -> Tuple[np.ndarray, List[Dict[str, float]], List[float]]:
+    """Lay the requests' audio end to end for one batched decode.
+
+    Returns:
+        (audio, clips on the shared timeline, offset of each request in seconds)
+    """
+    gap = np.zeros(int(REQUEST_GAP_SECONDS * STANDARD_SAMPLE_RATE), dtype=np.float32)
+    parts = []
+    clips = []
+    offsets = []
+    offset = 0.0
+    for item in prepared:
+        offsets.append(offset)
+        clips.extend(
+            {"start": clip["start"] + offset, "end": clip["end"] + offset}
+            for clip in item.clips
+        )
+        parts.extend([item.audio.astype(np.float32, copy=False), gap])
+        offset += (len(item.audio) + len(gap)) / STANDARD_SAMPLE_RATE
+    return np.concatenate(parts), clips, offsets
+
+
+def _split_segments(
+    segments, offsets: List[float], word_timestamps: bool
+) -> List[TranscriptionResult]:
+    """Assign decoded segments to requests by start time and shift them back
+    onto each request's timeline."""
+    per_request: List[List] = [[] for _ in offsets]
+    index = 0
+    for segment in sorted(segments, key=lambda s: s.start):
+        while index + 1 < len(offsets) and segment.start >= offsets[index + 1]:
+            index += 1
+        per_request[index].append(segment)
+
+    results = []
+    for offset, request_segments in zip(offsets, per_request):
+        results.append(
+            _build_result(request_segments, word_timestamps, time_offset=-offset)
+        )
+    return results
+
+
+def _build_result(
+    segments, word_timestamps: bool, time_offset: float = 0.0
+) -> TranscriptionResult:
+    all_text_parts = []
+    all_words = []
+    all_segments = []
+
+    for segment in segments:
+        all_text_parts.append(segment.text.strip())
+
+        all_segments.append(
+            Segment(
+                text=segment.text.strip(),
+                start=max(0.0, segment.start + time_offset),
+                end=max(0.0, segment.end + time_offset),
+            )
+        )
+
+        # Extract word-level timestamps if available
+        if word_timestamps and segment.words:
+            for word_info in segment.words:
+                all_words.append(
+                    Word(
+                        word=word_info.word.strip(),
+                        start=max(0.0, word_info.start + time_offset),
+                        end=max(0.0, word_info.end + time_offset),
+                        confidence=word_info.probability,
+                    )
+                )
+
+    return TranscriptionResult(
+        text=" ".join(all_text_parts),
+        words=all_words,
+        segments=all_segments,
+    )
+
 
 class FasterWhisperTranscriber:
     """
@@ -41,6 +196,7 @@ class FasterWhisperTranscriber:
         self.device_index = int(os.getenv("DEVICE_INDEX", "0"))
 
         self.model: Optional[WhisperModel] = None
+        self.batched_pipeline: Optional[BatchedInferencePipeline] = None
         self._is_loaded = False
 
         logger.info(
@@ -64,6 +220,7 @@ class FasterWhisperTranscriber:
             device_index=self.device_index,
             compute_type=self.compute_type,
         )
+        self.batched_pipeline = BatchedInferencePipeline(self.model)
 
         self._is_loaded = True
         logger.info("Model loaded successfully")
@@ -106,49 +263,142 @@ class FasterWhisperTranscriber:
             vad_filter=vad_filter,
         )
 
-        # Process segments
-        all_text_parts = []
-        all_words = []
-        all_segments = []
+        result = _build_result(segments_generator, word_timestamps)
+        result.language = info.language
+        result.duration = info.duration
+
+        logger.info(
+            f"Transcription complete: {len(result.text)} chars, "
+            f"{len(result.words)} words, {len(result.segments)} segments"
+        )
+        logger.info(
+            f"Detected language: {info.language} (prob: {info.language_probability:.2f})"
+        )
+
+        return result
 
-        for segment in segments_generator:
-            all_text_parts.append(segment.text.strip())
+    def prepare(
+        self,
+        audio_file_path: str,
+        language: Optional[str] = None,
+        vad_filter: bool = True,
+    ) -> PreparedAudio:
+        """
+        Decode an audio file and find the clips to transcribe in batched mode.
 
-            # Create segment entry
-            seg = Segment(
-                text=segment.text.strip(),
-                start=segment.start,
-                end=segment.end,
-            )
-            all_segments.append(seg)
+        Thread-safe; run it on the request's own thread so decoding, VAD and
+        language detection overlap with batched decodes of other requests.
 
-            # Extract word-level timestamps if available
-            if word_timestamps and segment.words:
-                for word_info in segment.words:
-                    word = Word(
-                        word=word_info.word.strip(),
-                        start=word_info.start,
-                        end=word_info.end,
-                        confidence=word_info.probability,
-                    )
-                    all_words.append(word)
+        Args:
+            audio_file_path: Path to audio file
+            language: Language code (None to detect from the first 30 s of speech)
+            vad_filter: Only decode speech regions; otherwise decode the
+                whole file in 30 s clips
+
+        Returns:
+            PreparedAudio for ``transcribe_batch``
+        """
+        if not self._is_loaded or self.model is None:
+            raise RuntimeError("Model not loaded. Call load_model() first.")
+
+        audio = decode_audio(audio_file_path, sampling_rate=STANDARD_SAMPLE_RATE)
+        prepared = PreparedAudio(audio=audio, language=language)
+
+        if vad_filter:
+            regions = get_speech_timestamps(
+                audio,
+                VadOptions(
+                    max_speech_duration_s=CLIP_SECONDS, min_silence_duration_ms=160
+                ),
+            )
+            prepared.clips = merge_speech_regions(regions)
+        else:
+            prepared.clips = merge_speech_regions(
+                [{"start": 0, "end": len(audio)}] if len(audio) else []
+            )
 
-        # Combine text
-        full_text = " ".join(all_text_parts)
+        if prepared.language is None and prepared.clips:
+            if self.model.model.is_multilingual:
+                speech = np.concatenate(
+                    [
+                        audio[
+                            int(c["start"] * STANDARD_SAMPLE_RATE) : int(
+                                c["end"] * STANDARD_SAMPLE_RATE
+                            )
+                        ]
+                        for c in prepared.clips
+                    ]
+                )[: int(CLIP_SECONDS * STANDARD_SAMPLE_RATE)]
+                prepared.language, probability, _ = self.model.detect_language(
+                    audio=speech
+                )
+                logger.info(
+                    f"Detected language: {prepared.language} (prob: {probability:.2f})"
+                )
+            else:
+                prepared.language = "en"
 
         logger.info(
-            f"Transcription complete: {len(full_text)} chars, "
-            f"{len(all_words)} words, {len(all_segments)} segments"
+            f"Prepared {prepared.duration:.1f}s of audio: {len(prepared.clips)} clip(s), "
+            f"{sum(c['end'] - c['start'] for c in prepared.clips):.1f}s of speech"
         )
-        logger.info(f"Detected language: {info.language} (prob: {info.language_probability:.2f})")
-
-        return TranscriptionResult(
-            text=full_text,
-            words=all_words,
-            segments=all_segments,
-            language=info.language,
-            duration=info.duration,
+        return prepared
+
+    def transcribe_batch(
+        self,
+        prepared: List[PreparedAudio],
+        options: DecodeOptions,
+        batch_size: int = 8,
+    ) -> List[TranscriptionResult]:
+        """
+        Transcribe several prepared requests in one batched decode.
+
+        The clips of all requests are decoded together, ``batch_size`` clips
+        per forward pass, so a long file uses the whole batch and short
+        concurrent requests share one.
+
+        Args:
+            prepared: Requests from ``prepare``; all must use ``options.language``
+            options: Decode settings for the whole batch
+            batch_size: Clips decoded per forward pass
+
+        Returns:
+            One TranscriptionResult per request, in order
+        """
+        if not self._is_loaded or self.batched_pipeline is None:
+            raise RuntimeError("Model not loaded. Call load_model() first.")
+
+        with_speech = [item for item in prepared if item.clips]
+        segments = []
+        offsets = []
+        if with_speech:
+            audio, clips, offsets = _layout_requests(with_speech)
+            segments_generator, _ = self.batched_pipeline.transcribe(
+                audio,
+                language=options.language,
+                task=options.task,
+                beam_size=options.beam_size,
+                word_timestamps=options.word_timestamps,
+                # Timestamp tokens split clips into sentence-level segments
+                without_timestamps=False,
+                clip_timestamps=clips,
+                batch_size=batch_size,
+            )
+            segments = list(segments_generator)
+
+        decoded = iter(_split_segments(segments, offsets, options.word_timestamps))
+        results = []
+        for item in prepared:
+            result = next(decoded) if item.clips else TranscriptionResult()
+            result.language = item.language
+            result.duration = item.duration
+            results.append(result)
+
+        logger.info(
+            f"Batched transcription complete: {len(prepared)} request(s), "
+            f"{sum(len(item.clips) for item in prepared)} clip(s), batch size {batch_size}"
         )
+        return results
 
     @property
     def is_loaded(self) -> bool:
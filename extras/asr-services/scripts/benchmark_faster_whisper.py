@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Benchmark sequential vs batched faster-whisper decoding on CPU.
+
+Sends ``--requests`` concurrent transcriptions through FasterWhisperService
+(in-process, no HTTP) and reports wall time, per-request latency and
+throughput for each mode:
+
+- sequential: one ``WhisperModel.transcribe`` per request (requests queue
+  behind each other on the model)
+- batched: speech clips of all concurrent requests coalesced and decoded
+  ``--batch-sizes`` clips per forward pass
+
+Text agreement with the sequential output is reported for every batched run.
+Synthetic speech is generated with espeak-ng (or espeak) unless WAV files
+are given with ``--audio``.
+
+Usage:
+    uv run --group faster-whisper python scripts/benchmark_faster_whisper.py
+    uv run --group faster-whisper python scripts/benchmark_faster_whisper.py --requests 16 --batch-sizes 4 8 16
+    uv run --group faster-whisper python scripts/benchmark_faster_whisper.py --audio a.wav b.wav --model small
+
+Requirements:
+    espeak-ng (apt install espeak-ng) for synthetic speech
+"""
+
+import argparse
+import asyncio
+import difflib
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import wave
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+SENTENCES = [
+    "The meeting moved to Thursday afternoon because the design review ran long.",
+    "Please remember to order more coffee filters and a new kettle for the office.",
+    "We agreed that the first prototype should ship to five customers next month.",
+    "Her flight from Lisbon lands at seven fifteen, so dinner will be around nine.",
+    "The garden needs watering twice a day while the weather stays this hot.",
+    "Sales in the northern region grew by twelve percent over the last quarter.",
+    "Can you send me the slides before the call so I can review the numbers?",
+    "The library closes early on Sundays, but the reading room stays open late.",
+]
+
+
+def synthesize_speech(directory: Path, count: int, sentences_per_file: int) -> list:
+    """Render ``count`` WAV files of espeak speech, each a few sentences long."""
+    espeak = shutil.which("espeak-ng") or shutil.which("espeak")
+    if espeak is None:
+        sys.exit("espeak-ng not found: install it or pass --audio files")
+
+    paths = []
+    for i in range(count):
+        text = " ".join(
+            SENTENCES[(i + j) % len(SENTENCES)] for j in range(sentences_per_file)
+        )
+        path = directory / f"speech_{i:03d}.wav"
+        # Vary the speed so requests differ in length
+        subprocess.run(
+            [espeak, "-s", str(150 + 10 * (i % 4)), "-w", str(path), text],
+            check=True,
+            capture_output=True,
+        )
+        paths.append(str(path))
+    return paths
+
+
+def audio_seconds(path: str) -> float:
+    with wave.open(path, "rb") as wf:
+        return wf.getnframes() / wf.getframerate()
+
+
+def percentile(values, pct: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+async def run_requests(service, paths, beam_size, batch_size):
+    async def one(path):
+        start = time.perf_counter()
+        result = await service.transcribe(
+            path, beam_size=beam_size, batch_size=batch_size
+        )
+        return result, time.perf_counter() - start
+
+    start = time.perf_counter()
+    outcomes = await asyncio.gather(*(one(path) for path in paths))
+    return (
+        [r for r, _ in outcomes],
+        [t for _, t in outcomes],
+        time.perf_counter() - start,
+    )
+
+
+def report(label, latencies, wall, total_audio, agreement=None):
+    print(
+        f"  {label:<16} wall {wall:6.2f} s  "
+        f"p50 {percentile(latencies, 50):6.2f} s  p95 {percentile(latencies, 95):6.2f} s  "
+        f"{total_audio / wall:6.1f}x realtime"
+        + (f"  agreement {agreement:.3f}" if agreement is not None else "")
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--model", default="tiny")
+    parser.add_argument("--compute-type", default="int8")
+    parser.add_argument("--requests", type=int, default=8, help="Concurrent requests")
+    parser.add_argument(
+        "--sentences", type=int, default=6, help="Sentences per synthetic file"
+    )
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--beam-size", type=int, default=5)
+    parser.add_argument("--language", default="en")
+    parser.add_argument(
+        "--audio", nargs="+", help="WAV files to use instead of synthetic speech"
+    )
+    args = parser.parse_args()
+
+    # FasterWhisperService reads its configuration from the environment
+    os.environ.update(
+        DEVICE="cpu",
+        COMPUTE_TYPE=args.compute_type,
+        LANGUAGE=args.language,
+        BATCHED_INFERENCE="true",
+    )
+    from common.coalescing import RequestCoalescer
+    from providers.faster_whisper.service import FasterWhisperService
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.audio:
+            paths = [args.audio[i % len(args.audio)] for i in range(args.requests)]
+        else:
+            paths = synthesize_speech(Path(tmp), args.requests, args.sentences)
+        total_audio = sum(audio_seconds(p) for p in paths)
+        print(
+            f"{args.model} ({args.compute_type}, CPU): {len(paths)} concurrent requests, "
+            f"{total_audio:.0f} s of audio, beam size {args.beam_size}"
+        )
+
+        service = FasterWhisperService(args.model)
+        await service.warmup()
+
+        service.coalescer.shutdown()
+        service.coalescer = None
+        baseline, latencies, wall = await run_requests(
+            service, paths, args.beam_size, None
+        )
+        report("sequential", latencies, wall, total_audio)
+
+        for batch_size in args.batch_sizes:
+            # Fresh coalescer so every request joins the same decode
+            service.coalescer = RequestCoalescer(
+                service._decode_group, max_wait=0.05, max_requests=len(paths)
+            )
+            results, latencies, wall = await run_requests(
+                service, paths, args.beam_size, batch_size
+            )
+            agreement = statistics.mean(
+                difflib.SequenceMatcher(None, a.text.split(), b.text.split()).ratio()
+                for a, b in zip(baseline, results)
+            )
+            report(
+                f"batched (bs={batch_size})", latencies, wall, total_audio, agreement
+            )
+            service.coalescer.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
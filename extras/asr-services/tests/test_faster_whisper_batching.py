@@ -0,0 +1,231 @@
+"""
+Tests for request coalescing and batched faster-whisper decoding.
+
+Coalescer tests are pure asyncio; the transcriber tests need the
+faster-whisper package but no model (the batched pipeline is faked).
+
+Run:
+    cd extras/asr-services
+    uv run --group faster-whisper pytest tests/test_faster_whisper_batching.py -v
+"""
+
+import asyncio
+import sys
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from common.coalescing import RequestCoalescer
+
+SAMPLE_RATE = 16000
+
+
+@pytest.fixture
+def fw():
+    pytest.importorskip("faster_whisper")
+    from providers.faster_whisper import transcriber
+
+    return transcriber
+
+
+# ---------------------------------------------------------------------------
+# RequestCoalescer
+# ---------------------------------------------------------------------------
+
+
+class RecordingDecoder:
+    def __init__(self, fail=False):
+        self.calls = []
+        self.threads = set()
+        self.fail = fail
+
+    def __call__(self, payloads, key, batch_size):
+        self.calls.append((list(payloads), key, batch_size))
+        self.threads.add(threading.current_thread().name)
+        if self.fail:
+            raise RuntimeError("decode failed")
+        return [f"{key}:{payload}" for payload in payloads]
+
+
+async def _submit_all(coalescer, requests):
+    return await asyncio.gather(
+        *(coalescer.submit(payload, key, batch) for payload, key, batch in requests)
+    )
+
+
+class TestRequestCoalescer:
+    def test_concurrent_requests_share_one_decode(self):
+        decoder = RecordingDecoder()
+        coalescer = RequestCoalescer(decoder, max_wait=0.01)
+
+        results = asyncio.run(
+            _submit_all(coalescer, [("a", "en", 8), ("b", "en", 4), ("c", "en", 8)])
+        )
+
+        assert results == ["en:a", "en:b", "en:c"]
+        assert decoder.calls == [(["a", "b", "c"], "en", 4)]
+        assert all(name.startswith("asr-decode") for name in decoder.threads)
+
+    def test_different_keys_decode_separately(self):
+        decoder = RecordingDecoder()
+        coalescer = RequestCoalescer(decoder, max_wait=0.01)
+
+        results = asyncio.run(
+            _submit_all(coalescer, [("a", "en", 8), ("b", "de", 8), ("c", "en", 8)])
+        )
+
+        assert results == ["en:a", "de:b", "en:c"]
+        assert sorted((c[1], c[0]) for c in decoder.calls) == [
+            ("de", ["b"]),
+            ("en", ["a", "c"]),
+        ]
+
+    def test_max_requests_splits_group(self):
+        decoder = RecordingDecoder()
+        coalescer = RequestCoalescer(decoder, max_wait=0.01, max_requests=2)
+
+        asyncio.run(_submit_all(coalescer, [(str(i), "en", 8) for i in range(5)]))
+
+        assert [len(c[0]) for c in decoder.calls] == [2, 2, 1]
+
+    def test_requests_during_decode_join_next_round(self):
+        decoder = RecordingDecoder()
+        coalescer = RequestCoalescer(decoder, max_wait=0.01)
+
+        async def scenario():
+            first = asyncio.create_task(coalescer.submit("a", "en", 8))
+            await asyncio.sleep(0.05)
+            second = await coalescer.submit("b", "en", 8)
+            return await first, second
+
+        assert asyncio.run(scenario()) == ("en:a", "en:b")
+        assert [c[0] for c in decoder.calls] == [["a"], ["b"]]
+
+    def test_decode_error_reaches_every_request(self):
+        coalescer = RequestCoalescer(RecordingDecoder(fail=True), max_wait=0.01)
+
+        async def scenario():
+            return await asyncio.gather(
+                coalescer.submit("a", "en", 8),
+                coalescer.submit("b", "en", 8),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(scenario())
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+
+# ---------------------------------------------------------------------------
+# Clip merging and per-request reassembly
+# ---------------------------------------------------------------------------
+
+
+def _seconds(*spans):
+    return [
+        {"start": int(s * SAMPLE_RATE), "end": int(e * SAMPLE_RATE)} for s, e in spans
+    ]
+
+
+def _segment(text, start, end, words=()):
+    return SimpleNamespace(
+        text=text,
+        start=start,
+        end=end,
+        words=[
+            SimpleNamespace(word=w, start=s, end=e, probability=0.9)
+            for w, s, e in words
+        ],
+    )
+
+
+class FakeBatchedPipeline:
+    """Returns one segment per clip, with one word at the clip start."""
+
+    def __init__(self):
+        self.calls = []
+
+    def transcribe(self, audio, clip_timestamps, **kwargs):
+        self.calls.append(
+            dict(kwargs, clip_timestamps=clip_timestamps, samples=len(audio))
+        )
+        segments = [
+            _segment(
+                f" clip{i} ",
+                c["start"],
+                c["end"],
+                [(f"w{i}", c["start"], c["start"] + 0.5)],
+            )
+            for i, c in enumerate(clip_timestamps)
+        ]
+        return iter(segments), None
+
+
+class TestMergeSpeechRegions:
+    def test_regions_merged_up_to_max_duration(self, fw):
+        clips = fw.merge_speech_regions(_seconds((1, 5), (6, 20), (21, 29), (32, 40)))
+
+        assert clips == [{"start": 1.0, "end": 29.0}, {"start": 32.0, "end": 40.0}]
+
+    def test_long_region_is_split(self, fw):
+        clips = fw.merge_speech_regions(_seconds((0, 70)))
+
+        assert [(c["start"], c["end"]) for c in clips] == [(0, 30), (30, 60), (60, 70)]
+
+
+class TestTranscribeBatch:
+    def _transcriber(self, fw):
+        transcriber = fw.FasterWhisperTranscriber("tiny")
+        transcriber.batched_pipeline = FakeBatchedPipeline()
+        transcriber._is_loaded = True
+        return transcriber
+
+    def _prepared(self, fw, seconds, clips):
+        return fw.PreparedAudio(
+            audio=np.zeros(int(seconds * SAMPLE_RATE), dtype=np.float32),
+            clips=[{"start": s, "end": e} for s, e in clips],
+            language="en",
+        )
+
+    def test_results_mapped_back_to_each_request(self, fw):
+        transcriber = self._transcriber(fw)
+        prepared = [
+            self._prepared(fw, 10, [(1, 4), (6, 9)]),
+            self._prepared(fw, 5, []),  # no speech
+            self._prepared(fw, 8, [(2, 7)]),
+        ]
+
+        results = transcriber.transcribe_batch(
+            prepared, fw.DecodeOptions(language="en", beam_size=2), batch_size=4
+        )
+
+        call = transcriber.batched_pipeline.calls[0]
+        assert len(transcriber.batched_pipeline.calls) == 1
+        assert (call["beam_size"], call["batch_size"], call["language"]) == (2, 4, "en")
+        gap = fw.REQUEST_GAP_SECONDS
+        assert call["clip_timestamps"] == [
+            {"start": 1, "end": 4},
+            {"start": 6, "end": 9},
+            {"start": 10 + gap + 2, "end": 10 + gap + 7},
+        ]
+
+        assert results[0].text == "clip0 clip1"
+        assert [(s.start, s.end) for s in results[0].segments] == [(1, 4), (6, 9)]
+        assert results[1].text == "" and results[1].duration == 5
+        assert [(s.start, s.end) for s in results[2].segments] == [(2, 7)]
+        assert [(w.word, w.start, w.end) for w in results[2].words] == [("w2", 2, 2.5)]
+        assert results[2].language == "en"
+
+    def test_all_silent_requests_skip_decode(self, fw):
+        transcriber = self._transcriber(fw)
+
+        results = transcriber.transcribe_batch(
+            [self._prepared(fw, 3, [])], fw.DecodeOptions(language="en")
+        )
+
+        assert transcriber.batched_pipeline.calls == []
+        assert results[0].text == ""
@@ -19,7 +19,7 @@ import wave
 
 from dotenv import load_dotenv
 
-from relay_core import RelayConfig, get_jwt_token, run_device_session
+from relay_core import OVERFLOW_POLICIES, RelayConfig, get_jwt_token, run_device_session
 
 load_dotenv()
 logger = logging.getLogger(__name__)
@@ -113,6 +113,36 @@ async def main():
     parser.add_argument("--username", type=str, default=os.getenv("AUTH_USERNAME"))
     parser.add_argument("--password", type=str, default=os.getenv("AUTH_PASSWORD"))
     parser.add_argument("--device-name", type=str, default=os.getenv("DEVICE_NAME", "havpe"))
+    parser.add_argument(
+        "--audio-framing",
+        choices=["binary", "wyoming"],
+        default=os.getenv("AUDIO_FRAMING", "binary"),
+        help="Audio chunk framing to request from the backend (falls back to wyoming if unsupported)",
+    )
+    parser.add_argument(
+        "--latency-budget-ms",
+        type=float,
+        default=float(os.getenv("RELAY_LATENCY_BUDGET_MS", "60")),
+        help="Longest an audio chunk waits to be coalesced with later chunks",
+    )
+    parser.add_argument(
+        "--max-batch-ms",
+        type=float,
+        default=float(os.getenv("RELAY_MAX_BATCH_MS", "200")),
+        help="Most audio sent to the backend in one message",
+    )
+    parser.add_argument(
+        "--buffer-seconds",
+        type=float,
+        default=float(os.getenv("RELAY_BUFFER_SECONDS", "30")),
+        help="Audio held while the backend is slow or reconnecting",
+    )
+    parser.add_argument(
+        "--overflow-policy",
+        choices=list(OVERFLOW_POLICIES),
+        default=os.getenv("RELAY_OVERFLOW_POLICY", "drop_oldest"),
+        help="What gives when the buffer is full (block stops reading the device)",
+    )
     parser.add_argument("-v", "--verbose", action="count", default=0)
     parser.add_argument(
         "--dump-audio",
@@ -128,6 +158,11 @@ async def main():
         auth_username=args.username or "",
         auth_password=args.password or "",
         device_name=args.device_name,
+        audio_framing=args.audio_framing,
+        latency_budget_ms=args.latency_budget_ms,
+        max_batch_ms=args.max_batch_ms,
+        buffer_seconds=args.buffer_seconds,
+        overflow_policy=args.overflow_policy,
     )
 
     level = logging.WARNING - (10 * min(args.verbose, 2))
@@ -3,14 +3,23 @@ Shared relay logic for HAVPE → Chronicle WebSocket bridge.
 
 Provides the core Wyoming protocol forwarding functions used by both the CLI
 relay (main.py) and the macOS menu bar relay (menu_relay.py).
+
+Device messages go through a bounded RelayBuffer between the device TCP
+stream and the backend websocket. The device is read continuously while the
+backend is slow or reconnecting; consecutive audio chunks are coalesced into
+larger messages within a latency budget, and when the buffer is full the
+configured overflow policy decides what gives.
 """
 
 import asyncio
 import json
 import logging
 import os
+import struct
+import time
+from collections import deque
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 import httpx
 import websockets
@@ -20,6 +29,24 @@ from dotenv import load_dotenv
 load_dotenv()
 logger = logging.getLogger(__name__)
 
+# Compact audio-chunk framing (must match the backend's utils/wyoming_framing.py):
+# "WA", version, channels, rate (u32 BE), width, pad — followed by the payload.
+AUDIO_FRAME_HEADER = struct.Struct("!2sBBIBx")
+AUDIO_FRAME_MAGIC = b"WA"
+AUDIO_FRAME_VERSION = 1
+
+# What to do with new audio when the relay buffer is full:
+#   drop_oldest — discard the oldest buffered audio (stay close to live)
+#   drop_newest — discard the incoming chunk (keep the start of the backlog)
+#   block       — stop reading the device until there is room (TCP backpressure)
+OVERFLOW_POLICIES = ("drop_oldest", "drop_newest", "block")
+
+METRICS_INTERVAL = 10.0
+RECONNECT_MIN_SECONDS = 1.0
+RECONNECT_MAX_SECONDS = 30.0
+# How long to keep trying to deliver buffered audio after the device disconnects
+DRAIN_SECONDS = 10.0
+
 
 @dataclass
 class RelayConfig:
@@ -30,6 +57,14 @@ class RelayConfig:
     auth_username: str
     auth_password: str
     device_name: str
+    audio_framing: str = "binary"
+    # Longest a chunk waits for others to join its message
+    latency_budget_ms: float = 60.0
+    # Most audio sent in one coalesced message
+    max_batch_ms: float = 200.0
+    # Audio held while the backend is slow or reconnecting
+    buffer_seconds: float = 30.0
+    overflow_policy: str = "drop_oldest"
 
     @classmethod
     def from_env(cls) -> "RelayConfig":
@@ -39,8 +74,218 @@ class RelayConfig:
             auth_username=os.getenv("AUTH_USERNAME", ""),
             auth_password=os.getenv("AUTH_PASSWORD", ""),
             device_name=os.getenv("DEVICE_NAME", "havpe"),
+            audio_framing=os.getenv("AUDIO_FRAMING", "binary"),
+            latency_budget_ms=float(os.getenv("RELAY_LATENCY_BUDGET_MS", "60")),
+            max_batch_ms=float(os.getenv("RELAY_MAX_BATCH_MS", "200")),
+            buffer_seconds=float(os.getenv("RELAY_BUFFER_SECONDS", "30")),
+            overflow_policy=os.getenv("RELAY_OVERFLOW_POLICY", "drop_oldest"),
+        )
+
+
+@dataclass
+class RelayMessage:
+    """One Wyoming message read from the device."""
+
+    header: dict
+    payload: bytes | None
+    received_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def is_audio(self) -> bool:
+        return self.header.get("type") == "audio-chunk" and self.payload is not None
+
+    @property
+    def audio_format(self) -> tuple[int, int, int]:
+        data = self.header.get("data") or {}
+        return (
+            int(data.get("rate", 16000)),
+            int(data.get("width", 2)),
+            int(data.get("channels", 1)),
         )
 
+    @property
+    def duration(self) -> float:
+        """Seconds of audio in the payload (0 for control messages)."""
+        if not self.is_audio:
+            return 0.0
+        rate, width, channels = self.audio_format
+        return len(self.payload) / (rate * width * channels)
+
+
+@dataclass
+class RelayMetrics:
+    """Forwarding counters; interval fields are reset by each report."""
+
+    frames_in: int = 0
+    frames_sent: int = 0
+    messages_sent: int = 0
+    frames_dropped: int = 0
+    reconnects: int = 0
+    buffered_seconds: float = 0.0
+    max_queue_delay: float = 0.0
+    _delay_sum: float = 0.0
+    _interval_start: float = field(default_factory=time.monotonic)
+    _interval_frames_in: int = 0
+    _interval_frames_sent: int = 0
+    _interval_messages: int = 0
+
+    def record_sent(self, batch: list[RelayMessage], now: float) -> None:
+        frames = sum(1 for m in batch if m.is_audio)
+        delay = now - batch[0].received_at
+        self.frames_sent += frames
+        self.messages_sent += 1
+        self._interval_frames_sent += frames
+        self._interval_messages += 1
+        if frames:
+            self._delay_sum += delay
+            self.max_queue_delay = max(self.max_queue_delay, delay)
+
+    def report(self) -> dict:
+        """Return rates for the interval since the last report and start a new one."""
+        now = time.monotonic()
+        elapsed = max(now - self._interval_start, 1e-9)
+        frames_in = self.frames_in - self._interval_frames_in
+        messages = self._interval_messages
+        report = {
+            "frames_per_sec": frames_in / elapsed,
+            "messages_per_sec": messages / elapsed,
+            "coalescing_ratio": (
+                self._interval_frames_sent / messages if messages else 0.0
+            ),
+            "avg_queue_delay_ms": (
+                1000 * self._delay_sum / messages if messages else 0.0
+            ),
+            "max_queue_delay_ms": 1000 * self.max_queue_delay,
+            "buffered_seconds": self.buffered_seconds,
+            "frames_dropped": self.frames_dropped,
+            "reconnects": self.reconnects,
+        }
+        self._interval_start = now
+        self._interval_frames_in = self.frames_in
+        self._interval_frames_sent = 0
+        self._interval_messages = 0
+        self._delay_sum = 0.0
+        self.max_queue_delay = 0.0
+        return report
+
+
+class RelayBuffer:
+    """Bounded FIFO of device messages, drained in coalesced batches.
+
+    Only audio counts towards the bound; control messages (audio-start/stop,
+    button events) are never dropped. Single event loop only.
+    """
+
+    def __init__(self, max_seconds: float, policy: str, metrics: RelayMetrics) -> None:
+        if policy not in OVERFLOW_POLICIES:
+            raise ValueError(
+                f"Unknown overflow policy {policy!r} (expected one of {OVERFLOW_POLICIES})"
+            )
+        self.max_seconds = max_seconds
+        self.policy = policy
+        self.metrics = metrics
+        self.closed = False
+        # Last audio-start delivered to the backend without its audio-stop;
+        # re-sent after a reconnect so the backend reopens the stream
+        self.stream_start: RelayMessage | None = None
+        self._items: deque[RelayMessage] = deque()
+        self._seconds = 0.0
+        self._data = asyncio.Event()
+        self._space = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    async def put(self, message: RelayMessage) -> None:
+        duration = message.duration
+        while duration and self._items and self._seconds + duration > self.max_seconds:
+            if self.policy == "block":
+                self._space.clear()
+                await self._space.wait()
+            elif self.policy == "drop_newest" or not self._drop_oldest_audio():
+                self.metrics.frames_dropped += 1
+                return
+        self._items.append(message)
+        self._seconds += duration
+        self.metrics.buffered_seconds = self._seconds
+        self._data.set()
+
+    def _drop_oldest_audio(self) -> bool:
+        for i, item in enumerate(self._items):
+            if item.is_audio:
+                del self._items[i]
+                self._seconds -= item.duration
+                self.metrics.frames_dropped += 1
+                return True
+        return False
+
+    def close(self) -> None:
+        """No more messages will be put; the sender drains what is left."""
+        self.closed = True
+        self._data.set()
+
+    def requeue(self, batch: list[RelayMessage]) -> None:
+        """Put an unsent batch back at the front (e.g. after a failed send)."""
+        self._items.extendleft(reversed(batch))
+        self._seconds += sum(m.duration for m in batch)
+        self.metrics.buffered_seconds = self._seconds
+
+    def _pop(self) -> RelayMessage:
+        message = self._items.popleft()
+        self._seconds = self._seconds - message.duration if self._items else 0.0
+        self.metrics.buffered_seconds = self._seconds
+        self._space.set()
+        return message
+
+    async def next_batch(
+        self, latency_budget: float, max_batch: float
+    ) -> list[RelayMessage] | None:
+        """Wait for the next message and coalesce following audio chunks with it.
+
+        Consecutive audio chunks of the same format are collected until the
+        batch holds ``max_batch`` seconds of audio, a control message is next,
+        or the first chunk has waited ``latency_budget`` seconds since it was
+        read. A backlog is therefore sent in full-size batches without waiting.
+        If the caller is cancelled while the batch is filling, the chunks taken
+        so far are put back. Returns None once the buffer is closed and empty.
+        """
+        while not self._items:
+            if self.closed:
+                return None
+            self._data.clear()
+            await self._data.wait()
+
+        first = self._pop()
+        if not first.is_audio:
+            return [first]
+
+        batch = [first]
+        fmt = first.audio_format
+        seconds = first.duration
+        deadline = first.received_at + latency_budget
+        try:
+            while seconds < max_batch:
+                if self._items:
+                    nxt = self._items[0]
+                    if not nxt.is_audio or nxt.audio_format != fmt:
+                        break
+                    batch.append(self._pop())
+                    seconds += nxt.duration
+                    continue
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or self.closed:
+                    break
+                self._data.clear()
+                try:
+                    await asyncio.wait_for(self._data.wait(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+        except BaseException:
+            # Cancelled while waiting for more audio (e.g. the backend closed)
+            self.requeue(batch)
+            raise
+        return batch
+
 
 async def get_jwt_token(username: str, password: str, backend_url: str) -> str | None:
     try:
@@ -61,62 +306,158 @@ async def get_jwt_token(username: str, password: str, backend_url: str) -> str |
     return None
 
 
+def encode_audio_frame(payload: bytes, data: dict) -> bytes:
+    """Pack an audio-chunk payload into a single compact binary message."""
+    return (
+        AUDIO_FRAME_HEADER.pack(
+            AUDIO_FRAME_MAGIC,
+            AUDIO_FRAME_VERSION,
+            int(data.get("channels", 1)),
+            int(data.get("rate", 16000)),
+            int(data.get("width", 2)),
+        )
+        + payload
+    )
+
+
+async def negotiate_framing(ws, requested: str, timeout: float = 10.0) -> str:
+    """Read the backend's ready message and return the framing it accepted.
+
+    Backends without binary framing support don't echo ``framing``, in which
+    case the relay falls back to standard Wyoming (header + payload) messages.
+    """
+    try:
+        raw = await asyncio.wait_for(ws.recv(), timeout=timeout)
+        ready = json.loads(raw)
+    except (asyncio.TimeoutError, json.JSONDecodeError, TypeError) as e:
+        logger.warning(
+            "No usable ready message from backend (%s), using wyoming framing", e
+        )
+        return "wyoming"
+
+    framing = ready.get("framing", "wyoming") if isinstance(ready, dict) else "wyoming"
+    if framing != requested:
+        logger.info("Backend accepted %s framing (requested %s)", framing, requested)
+    return framing
+
+
 async def forward_tcp_to_ws(
     reader: asyncio.StreamReader,
-    ws,
-    ws_lock: asyncio.Lock,
+    buffer: RelayBuffer,
     *,
     on_audio_chunk: Callable[[bytes, int], None] | None = None,
     on_audio_event: Callable[[str, dict], None] | None = None,
 ) -> None:
-    """Forward Wyoming messages from device TCP to backend WebSocket.
+    """Read Wyoming messages from the device TCP stream into the relay buffer.
+
+    Runs for the whole device session, independent of the backend connection;
+    the buffer is closed when the device disconnects.
 
     Args:
         on_audio_chunk: Called with (payload, payload_length) for each audio-chunk.
         on_audio_event: Called with (msg_type, header) for non-audio-chunk messages
                         (e.g. audio-start, audio-stop).
     """
-    while True:
-        line = await reader.readline()
-        if not line:
-            break
-
-        line_str = line.decode().strip()
-        if not line_str:
-            continue
-
-        try:
-            header = json.loads(line_str)
-        except json.JSONDecodeError:
-            logger.warning(
-                "TCP→WS: non-JSON line (stream desynchronized) — ending. "
-                "Raw data: %s",
-                repr(line_str[:120]),
-            )
-            break
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+
+            line_str = line.decode().strip()
+            if not line_str:
+                continue
+
+            try:
+                header = json.loads(line_str)
+            except json.JSONDecodeError:
+                logger.warning(
+                    "TCP→WS: non-JSON line (stream desynchronized) — ending. "
+                    "Raw data: %s",
+                    repr(line_str[:120]),
+                )
+                break
 
-        payload_length = header.get("payload_length", 0)
-        payload: bytes | None = None
+            payload_length = header.get("payload_length") or 0
+            payload: bytes | None = None
+            msg_type = header.get("type", "")
 
-        try:
-            async with ws_lock:
-                await ws.send(line_str)
+            try:
                 if payload_length > 0:
                     payload = await reader.readexactly(payload_length)
-                    await ws.send(payload)
-        except asyncio.IncompleteReadError:
-            logger.info("TCP→WS: device disconnected mid-payload — ending")
-            break
+            except asyncio.IncompleteReadError:
+                logger.info("TCP→WS: device disconnected mid-payload — ending")
+                break
+
+            message = RelayMessage(header, payload)
+            if message.is_audio:
+                buffer.metrics.frames_in += 1
+                if on_audio_chunk:
+                    on_audio_chunk(payload, payload_length)
+            else:
+                logger.info("TCP→WS: %s", msg_type)
+                if on_audio_event:
+                    on_audio_event(msg_type, header)
+            await buffer.put(message)
+    finally:
+        buffer.close()
 
-        msg_type = header.get("type", "")
 
-        if msg_type == "audio-chunk":
-            if on_audio_chunk and payload is not None:
-                on_audio_chunk(payload, payload_length)
-        else:
-            logger.info("TCP→WS: %s", msg_type)
-            if on_audio_event:
-                on_audio_event(msg_type, header)
+def _encode_batch(batch: list[RelayMessage], binary_framing: bool) -> list[str | bytes]:
+    """Websocket messages for a batch: one per coalesced audio batch."""
+    first = batch[0]
+    if not first.is_audio:
+        messages: list[str | bytes] = [json.dumps(first.header)]
+        if first.payload is not None:
+            messages.append(first.payload)
+        return messages
+
+    data = first.header.get("data") or {}
+    payload = b"".join(m.payload for m in batch)
+    if binary_framing:
+        return [encode_audio_frame(payload, data)]
+    header = {"type": "audio-chunk", "data": data, "payload_length": len(payload)}
+    return [json.dumps(header), payload]
+
+
+async def forward_buffer_to_ws(
+    ws,
+    buffer: RelayBuffer,
+    *,
+    binary_framing: bool = False,
+    latency_budget: float = 0.06,
+    max_batch: float = 0.2,
+) -> None:
+    """Send buffered device messages to the backend WebSocket.
+
+    Consecutive audio chunks are coalesced (see RelayBuffer.next_batch) and
+    sent as a single message. A batch that fails to send goes back to the
+    front of the buffer for the next connection. Returns once the buffer is
+    closed and drained.
+
+    Args:
+        binary_framing: Send audio as one compact binary message per batch
+                        instead of a JSON header followed by the payload.
+        latency_budget: Seconds a chunk may wait for others to join its batch.
+        max_batch: Seconds of audio per batch.
+    """
+    while True:
+        batch = await buffer.next_batch(latency_budget, max_batch)
+        if batch is None:
+            return
+        try:
+            for message in _encode_batch(batch, binary_framing):
+                await ws.send(message)
+        except BaseException:
+            buffer.requeue(batch)
+            raise
+
+        buffer.metrics.record_sent(batch, time.monotonic())
+        msg_type = batch[0].header.get("type")
+        if msg_type == "audio-start":
+            buffer.stream_start = batch[0]
+        elif msg_type == "audio-stop":
+            buffer.stream_start = None
 
 
 async def handle_backend_messages(ws, device: DeviceController) -> None:
@@ -149,7 +490,11 @@ async def handle_backend_messages(ws, device: DeviceController) -> None:
             duration = float(data.get("duration", 5.0))
             logger.info(
                 "Backend→device: led-control rgb=(%.1f,%.1f,%.1f) br=%.1f dur=%.1fs",
-                r, g, b, brightness, duration,
+                r,
+                g,
+                b,
+                brightness,
+                duration,
             )
             await device.set_led(r, g, b, brightness, duration=duration)
 
@@ -157,26 +502,120 @@ async def handle_backend_messages(ws, device: DeviceController) -> None:
             logger.debug("Backend→relay (ignored): %s", msg_type or str(raw)[:80])
 
 
-async def forward_esphome_events(
-    device: DeviceController,
-    ws,
-    ws_lock: asyncio.Lock,
-) -> None:
-    """Forward button/dial events from ESPHome API to backend WebSocket."""
+async def forward_esphome_events(device: DeviceController, buffer: RelayBuffer) -> None:
+    """Queue button/dial events from ESPHome API for the backend WebSocket."""
     while True:
         event = await device.get_event()
         event_type = event.pop("type")
 
-        wyoming_msg = json.dumps({
-            "type": event_type,
-            "data": event,
-            "payload_length": 0,
-        })
-        async with ws_lock:
-            await ws.send(wyoming_msg)
+        await buffer.put(
+            RelayMessage({"type": event_type, "data": event, "payload_length": 0}, None)
+        )
         logger.info("ESPHome→WS: %s %s", event_type, event)
 
 
+async def report_metrics(
+    metrics: RelayMetrics,
+    on_metrics: Callable[[dict], None] | None = None,
+    interval: float = METRICS_INTERVAL,
+) -> None:
+    """Log forwarding metrics every ``interval`` seconds."""
+    while True:
+        await asyncio.sleep(interval)
+        report = metrics.report()
+        logger.info(
+            "Relay: %.1f frames/s in, %.1f msgs/s out (%.1f frames/msg), "
+            "queue delay avg %.0f ms max %.0f ms, buffered %.1fs, dropped %d, reconnects %d",
+            report["frames_per_sec"],
+            report["messages_per_sec"],
+            report["coalescing_ratio"],
+            report["avg_queue_delay_ms"],
+            report["max_queue_delay_ms"],
+            report["buffered_seconds"],
+            report["frames_dropped"],
+            report["reconnects"],
+        )
+        if on_metrics:
+            on_metrics(report)
+
+
+async def bridge_backend(
+    config: RelayConfig,
+    token: str,
+    buffer: RelayBuffer,
+    device: DeviceController,
+) -> None:
+    """Keep a backend WebSocket connected and send the buffer through it.
+
+    Reconnects (re-authenticating) with exponential backoff whenever the
+    backend goes away; the device stream keeps filling the buffer meanwhile.
+    Returns once the buffer has been closed and fully sent.
+    """
+    delay = RECONNECT_MIN_SECONDS
+    while True:
+        backend_uri = (
+            f"{config.backend_ws_url}/ws?codec=pcm&token={token}"
+            f"&device_name={config.device_name}&framing={config.audio_framing}"
+        )
+        tasks: list[asyncio.Task] = []
+        try:
+            async with websockets.connect(backend_uri) as ws:
+                framing = await negotiate_framing(ws, config.audio_framing)
+                logger.info(
+                    "Backend WS connected (%s framing), %.1fs buffered",
+                    framing,
+                    buffer.metrics.buffered_seconds,
+                )
+                delay = RECONNECT_MIN_SECONDS
+                if buffer.stream_start is not None:
+                    # Reopen the stream the previous connection was carrying
+                    await ws.send(json.dumps(buffer.stream_start.header))
+
+                sender = asyncio.create_task(
+                    forward_buffer_to_ws(
+                        ws,
+                        buffer,
+                        binary_framing=framing == "binary",
+                        latency_budget=config.latency_budget_ms / 1000,
+                        max_batch=config.max_batch_ms / 1000,
+                    ),
+                    name="buffer→ws",
+                )
+                tasks = [
+                    sender,
+                    asyncio.create_task(
+                        handle_backend_messages(ws, device), name="ws→device"
+                    ),
+                ]
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                if sender in done and sender.exception() is None:
+                    return
+                for t in done:
+                    if t.exception():
+                        logger.warning(
+                            "Task %s failed: %s", t.get_name(), t.exception()
+                        )
+                    else:
+                        logger.info("Task %s finished", t.get_name())
+        except (OSError, asyncio.TimeoutError, websockets.WebSocketException) as e:
+            logger.warning("Backend WS unavailable: %s", e)
+        finally:
+            for t in tasks:
+                t.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        buffer.metrics.reconnects += 1
+        logger.info("Reconnecting to backend in %.0fs", delay)
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, RECONNECT_MAX_SECONDS)
+        token = (
+            await get_jwt_token(
+                config.auth_username, config.auth_password, config.backend_url
+            )
+            or token
+        )
+
+
 async def run_device_session(
     reader: asyncio.StreamReader,
     writer: asyncio.StreamWriter,
@@ -187,15 +626,21 @@ async def run_device_session(
     on_session_start: Callable[[str], None] | None = None,
     on_session_end: Callable[[], None] | None = None,
     on_auth_failure: Callable[[], None] | None = None,
+    on_metrics: Callable[[dict], None] | None = None,
 ) -> None:
     """Run a single device session: authenticate, connect WS, bridge traffic.
 
+    The device stream is read for as long as the device stays connected; the
+    backend WebSocket is reconnected underneath it as needed.
+
     Args:
         on_audio_chunk: Forwarded to forward_tcp_to_ws.
         on_audio_event: Forwarded to forward_tcp_to_ws.
         on_session_start: Called with the device address string on connect.
         on_session_end: Called when session tears down (always, via finally).
         on_auth_failure: Called if JWT auth fails.
+        on_metrics: Called with the metrics report every METRICS_INTERVAL seconds
+                    and once more for the remainder when the session ends.
     """
     addr = writer.get_extra_info("peername")
     addr_str = f"{addr[0]}:{addr[1]}" if addr else "unknown"
@@ -205,7 +650,9 @@ async def run_device_session(
     if on_session_start:
         on_session_start(addr_str)
 
-    token = await get_jwt_token(config.auth_username, config.auth_password, config.backend_url)
+    token = await get_jwt_token(
+        config.auth_username, config.auth_password, config.backend_url
+    )
     if not token:
         logger.error("Auth failed, dropping connection")
         if on_auth_failure:
@@ -213,68 +660,84 @@ async def run_device_session(
         writer.close()
         return
 
-    backend_uri = (
-        f"{config.backend_ws_url}/ws?codec=pcm&token={token}"
-        f"&device_name={config.device_name}"
-    )
-
+    metrics = RelayMetrics()
+    buffer = RelayBuffer(config.buffer_seconds, config.overflow_policy, metrics)
     device = DeviceController()
     tasks: list[asyncio.Task] = []
 
     try:
-        async with websockets.connect(backend_uri) as ws:
-            logger.info("Backend WS connected, starting bidirectional bridge")
-
-            api_ok = await device.connect(device_ip)
-            if api_ok:
-                logger.info("ESPHome API connected — button/dial/LED/speaker enabled")
-            else:
-                logger.info("ESPHome API unavailable — audio-only mode")
-
-            ws_lock = asyncio.Lock()
-            tasks = [
-                asyncio.create_task(
-                    forward_tcp_to_ws(
-                        reader, ws, ws_lock,
-                        on_audio_chunk=on_audio_chunk,
-                        on_audio_event=on_audio_event,
-                    ),
-                    name="tcp→ws",
-                ),
+        api_ok = await device.connect(device_ip)
+        if api_ok:
+            logger.info("ESPHome API connected — button/dial/LED/speaker enabled")
+        else:
+            logger.info("ESPHome API unavailable — audio-only mode")
+
+        tcp_task = asyncio.create_task(
+            forward_tcp_to_ws(
+                reader,
+                buffer,
+                on_audio_chunk=on_audio_chunk,
+                on_audio_event=on_audio_event,
+            ),
+            name="tcp→buffer",
+        )
+        backend_task = asyncio.create_task(
+            bridge_backend(config, token, buffer, device), name="backend"
+        )
+        tasks = [
+            tcp_task,
+            backend_task,
+            asyncio.create_task(
+                report_metrics(metrics, on_metrics, METRICS_INTERVAL), name="metrics"
+            ),
+        ]
+        if api_ok:
+            tasks.append(
                 asyncio.create_task(
-                    handle_backend_messages(ws, device),
-                    name="ws→device",
-                ),
-            ]
-            if api_ok:
-                tasks.append(
-                    asyncio.create_task(
-                        forward_esphome_events(device, ws, ws_lock),
-                        name="esphome→ws",
-                    )
+                    forward_esphome_events(device, buffer), name="esphome→buffer"
                 )
+            )
 
-            done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
-
-            for t in done:
-                if t.exception():
-                    logger.error("Task %s failed: %s", t.get_name(), t.exception())
-                else:
-                    logger.info("Task %s finished", t.get_name())
-
-            for t in pending:
-                t.cancel()
+        await asyncio.wait(
+            [tcp_task, backend_task], return_when=asyncio.FIRST_COMPLETED
+        )
+        if tcp_task.done():
+            if tcp_task.exception():
+                logger.error(
+                    "Task %s failed: %s", tcp_task.get_name(), tcp_task.exception()
+                )
+            logger.info(
+                "Device stream ended, sending %.1fs of buffered audio",
+                metrics.buffered_seconds,
+            )
+            await asyncio.wait([backend_task], timeout=DRAIN_SECONDS)
+            if not backend_task.done():
+                logger.warning(
+                    "Backend did not drain in %.0fs, dropping %d buffered messages",
+                    DRAIN_SECONDS,
+                    len(buffer),
+                )
+        if backend_task.done() and backend_task.exception():
+            logger.error(
+                "Task %s failed: %s", backend_task.get_name(), backend_task.exception()
+            )
 
-    except asyncio.IncompleteReadError:
-        logger.info("Device disconnected (incomplete read)")
-    except websockets.ConnectionClosed as e:
-        logger.info("Backend WS closed: %s", e)
     except Exception as e:
         logger.error("Session error: %s", e)
     finally:
         for t in tasks:
             t.cancel()
         await asyncio.gather(*tasks, return_exceptions=True)
+        if on_metrics:
+            on_metrics(metrics.report())
+        logger.info(
+            "Session totals: %d frames in, %d sent in %d messages, %d dropped, %d reconnects",
+            metrics.frames_in,
+            metrics.frames_sent,
+            metrics.messages_sent,
+            metrics.frames_dropped,
+            metrics.reconnects,
+        )
         await device.disconnect()
         writer.close()
         if on_session_end:
@@ -0,0 +1,270 @@
+"""
+Simulate an ESP32 device and a Chronicle backend to exercise the relay.
+
+Runs the relay (relay_core.run_device_session) in-process between:
+
+- a simulated device that connects over TCP and streams Wyoming
+  audio-start / audio-chunk / audio-stop at real-time pace (``--chunk-ms``
+  chunks, like the firmware's small I2S reads)
+- a fake backend (FastAPI) with /auth/jwt/login and /ws that can process
+  messages slowly (``--backend-delay-ms``) and drop the first connection
+  after ``--drop-after`` seconds
+
+and reports, per run, what the backend received: messages per second of
+audio, coalescing ratio, queueing delay, dropped audio and whether every
+byte arrived in order across the reconnect. The first run disables
+coalescing (one message per chunk) for comparison.
+
+Usage:
+  uv run --group test python simulate_device.py
+  uv run --group test python simulate_device.py --seconds 20 --chunk-ms 10 --drop-after 5
+  uv run --group test python simulate_device.py --backend-delay-ms 100 --drop-after 0
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import socket
+import time
+from dataclasses import dataclass, field, replace
+
+import uvicorn
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+
+import relay_core
+from relay_core import (
+    AUDIO_FRAME_HEADER,
+    OVERFLOW_POLICIES,
+    RelayConfig,
+    run_device_session,
+)
+
+logger = logging.getLogger(__name__)
+
+RATE = 16000
+WIDTH = 2
+CHANNELS = 1
+
+
+@dataclass
+class BackendStats:
+    connections: int = 0
+    messages: int = 0
+    audio_messages: int = 0
+    audio: bytearray = field(default_factory=bytearray)
+    events: list[str] = field(default_factory=list)
+
+
+def make_backend(
+    stats: BackendStats, delay: float, drop_after: float | None
+) -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/auth/jwt/login")
+    async def login():
+        return {"access_token": "simulated", "token_type": "bearer"}
+
+    @app.websocket("/ws")
+    async def ws_endpoint(websocket: WebSocket):
+        await websocket.accept()
+        stats.connections += 1
+        framing = websocket.query_params.get("framing", "wyoming")
+        await websocket.send_text(json.dumps({"type": "ready", "framing": framing}))
+        closes_at = (
+            time.monotonic() + drop_after
+            if drop_after is not None and stats.connections == 1
+            else None
+        )
+        expect_payload = False
+        try:
+            while True:
+                if closes_at and time.monotonic() >= closes_at:
+                    logger.info("Backend: dropping connection")
+                    await websocket.close()
+                    return
+                message = await websocket.receive()
+                if message["type"] == "websocket.disconnect":
+                    return
+                stats.messages += 1
+                if message.get("bytes") is not None:
+                    data = message["bytes"]
+                    if expect_payload:
+                        expect_payload = False
+                        stats.audio += data
+                    else:
+                        stats.audio_messages += 1
+                        stats.audio += data[AUDIO_FRAME_HEADER.size :]
+                else:
+                    header = json.loads(message["text"])
+                    if header["type"] == "audio-chunk":
+                        stats.audio_messages += 1
+                        expect_payload = True
+                    else:
+                        stats.events.append(header["type"])
+                if delay:
+                    await asyncio.sleep(delay)
+        except WebSocketDisconnect:
+            return
+
+    return app
+
+
+def pcm_chunk(index: int, samples: int) -> bytes:
+    """Sample values count up so reordering or loss is detectable."""
+    start = index * samples
+    return b"".join(((start + n) % 32768).to_bytes(2, "little") for n in range(samples))
+
+
+async def simulate_device(port: int, seconds: float, chunk_ms: float) -> bytes:
+    """Stream one audio session to the relay in real time; return what was sent."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    audio_format = {"rate": RATE, "width": WIDTH, "channels": CHANNELS}
+
+    def send(header: dict, payload: bytes = b"") -> None:
+        header["payload_length"] = len(payload)
+        writer.write(json.dumps(header).encode() + b"\n" + payload)
+
+    samples = int(RATE * chunk_ms / 1000)
+    chunks = int(seconds * 1000 / chunk_ms)
+    sent = bytearray()
+    send({"type": "audio-start", "data": audio_format})
+    started = time.monotonic()
+    for i in range(chunks):
+        chunk = pcm_chunk(i, samples)
+        send({"type": "audio-chunk", "data": audio_format}, chunk)
+        sent += chunk
+        await writer.drain()
+        await asyncio.sleep(
+            max(0.0, started + (i + 1) * chunk_ms / 1000 - time.monotonic())
+        )
+    send({"type": "audio-stop", "data": {}})
+    await writer.drain()
+    writer.close()
+    await writer.wait_closed()
+    return bytes(sent)
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def run(label: str, config: RelayConfig, args) -> None:
+    stats = BackendStats()
+    drop_after = args.drop_after if args.drop_after > 0 else None
+    backend_port = free_port()
+    server = uvicorn.Server(
+        uvicorn.Config(
+            make_backend(stats, args.backend_delay_ms / 1000, drop_after),
+            host="127.0.0.1",
+            port=backend_port,
+            log_level="warning",
+        )
+    )
+    backend = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+
+    config = replace(
+        config,
+        backend_url=f"http://127.0.0.1:{backend_port}",
+        backend_ws_url=f"ws://127.0.0.1:{backend_port}",
+    )
+    reports: list[dict] = []
+    ended = asyncio.Event()
+    relay = await asyncio.start_server(
+        lambda r, w: run_device_session(
+            r, w, config, on_metrics=reports.append, on_session_end=ended.set
+        ),
+        "127.0.0.1",
+        0,
+    )
+    relay_port = relay.sockets[0].getsockname()[1]
+
+    sent = await simulate_device(relay_port, args.seconds, args.chunk_ms)
+    await ended.wait()
+    relay.close()
+    # A slow backend may still be reading what the relay already sent
+    deadline = time.monotonic() + 60
+    while "audio-stop" not in stats.events and time.monotonic() < deadline:
+        await asyncio.sleep(0.1)
+    server.should_exit = True
+    await backend
+
+    audio_seconds = len(sent) / (RATE * WIDTH * CHANNELS)
+    received = bytes(stats.audio)
+    chunk_bytes = int(RATE * args.chunk_ms / 1000) * WIDTH * CHANNELS
+    ratio = (
+        len(received) / chunk_bytes / stats.audio_messages
+        if stats.audio_messages
+        else 0.0
+    )
+    delays = [r["avg_queue_delay_ms"] for r in reports if r["messages_per_sec"]]
+    max_delay = max((r["max_queue_delay_ms"] for r in reports), default=0.0)
+    dropped = sum(r["frames_dropped"] for r in reports[-1:])
+    print(
+        f"  {label:<12} {stats.messages / audio_seconds:7.1f} msgs/s  "
+        f"{ratio:5.1f} chunks/msg  "
+        f"delay avg {sum(delays) / len(delays) if delays else 0:5.0f} ms max {max_delay:5.0f} ms  "
+        f"dropped {dropped}  connections {stats.connections}  "
+        f"audio {'intact' if received == sent else f'{len(received)}/{len(sent)} bytes'}  "
+        f"events {','.join(stats.events)}"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--chunk-ms", type=float, default=16, help="Device chunk size")
+    parser.add_argument("--framing", choices=["binary", "wyoming"], default="binary")
+    parser.add_argument(
+        "--backend-delay-ms", type=float, default=0, help="Backend time per message"
+    )
+    parser.add_argument(
+        "--drop-after",
+        type=float,
+        default=4,
+        help="Drop the first backend connection (0: never)",
+    )
+    parser.add_argument("--latency-budget-ms", type=float, default=60)
+    parser.add_argument("--max-batch-ms", type=float, default=200)
+    parser.add_argument("--buffer-seconds", type=float, default=30)
+    parser.add_argument(
+        "--overflow-policy", choices=list(OVERFLOW_POLICIES), default="drop_oldest"
+    )
+    parser.add_argument("-v", "--verbose", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        format="%(asctime)s %(levelname)s %(message)s",
+        level=logging.INFO if args.verbose else logging.ERROR,
+    )
+    # Report over the whole run rather than every 10 s
+    relay_core.METRICS_INTERVAL = args.seconds + 5
+    relay_core.RECONNECT_MIN_SECONDS = 0.5
+
+    config = RelayConfig(
+        backend_url="",
+        backend_ws_url="",
+        auth_username="device@example.com",
+        auth_password="simulated",
+        device_name="simulated",
+        audio_framing=args.framing,
+        latency_budget_ms=args.latency_budget_ms,
+        max_batch_ms=args.max_batch_ms,
+        buffer_seconds=args.buffer_seconds,
+        overflow_policy=args.overflow_policy,
+    )
+    print(
+        f"{args.seconds:.0f} s of audio in {args.chunk_ms:.0f} ms chunks, {args.framing} framing, "
+        f"backend {args.backend_delay_ms:.0f} ms/msg"
+        + (f", drops after {args.drop_after:.0f} s" if args.drop_after > 0 else "")
+    )
+    await run("uncoalesced", replace(config, latency_budget_ms=0, max_batch_ms=0), args)
+    await run("coalesced", config, args)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
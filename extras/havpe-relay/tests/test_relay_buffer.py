@@ -0,0 +1,119 @@
+"""
+Unit tests for the relay buffer's coalescing and requeueing.
+
+No device or backend needed: a fake websocket records what is sent.
+
+Run:
+  uv run --group test pytest extras/havpe-relay/tests/test_relay_buffer.py -v
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from relay_core import (
+    AUDIO_FRAME_HEADER,
+    RelayBuffer,
+    RelayMessage,
+    RelayMetrics,
+    forward_buffer_to_ws,
+)
+
+AUDIO_FORMAT = {"rate": 16000, "width": 2, "channels": 1}
+CHUNK_BYTES = 320  # 10 ms
+
+
+def chunk(index: int) -> RelayMessage:
+    return RelayMessage(
+        {"type": "audio-chunk", "data": AUDIO_FORMAT}, bytes([index]) * CHUNK_BYTES
+    )
+
+
+class FakeWebSocket:
+    def __init__(self):
+        self.sent: list[bytes] = []
+
+    async def send(self, message):
+        self.sent.append(message)
+
+    def audio(self) -> bytes:
+        return b"".join(m[AUDIO_FRAME_HEADER.size :] for m in self.sent)
+
+
+def make_buffer() -> RelayBuffer:
+    return RelayBuffer(max_seconds=30, policy="drop_oldest", metrics=RelayMetrics())
+
+
+def test_backlog_is_coalesced_up_to_max_batch():
+    async def scenario():
+        buffer = make_buffer()
+        for i in range(5):
+            await buffer.put(chunk(i))
+        buffer.close()
+        ws = FakeWebSocket()
+        await forward_buffer_to_ws(
+            ws, buffer, binary_framing=True, latency_budget=1.0, max_batch=0.03
+        )
+        return ws
+
+    ws = asyncio.run(scenario())
+
+    assert len(ws.sent) == 2
+    assert ws.audio() == b"".join(chunk(i).payload for i in range(5))
+
+
+def test_cancel_while_coalescing_keeps_audio():
+    async def scenario():
+        buffer = make_buffer()
+        await buffer.put(chunk(0))
+        await buffer.put(chunk(1))
+
+        # The batch is still filling (long latency budget) when the backend closes
+        first_ws = FakeWebSocket()
+        sender = asyncio.create_task(
+            forward_buffer_to_ws(
+                first_ws, buffer, binary_framing=True, latency_budget=10, max_batch=1
+            )
+        )
+        await asyncio.sleep(0.05)
+        assert len(buffer) == 0  # Both chunks taken into the pending batch
+        sender.cancel()
+        try:
+            await sender
+        except asyncio.CancelledError:
+            pass
+
+        await buffer.put(chunk(2))
+        buffer.close()
+        second_ws = FakeWebSocket()
+        await forward_buffer_to_ws(second_ws, buffer, binary_framing=True, max_batch=1)
+        return buffer, first_ws, second_ws
+
+    buffer, first_ws, second_ws = asyncio.run(scenario())
+
+    assert first_ws.sent == []
+    assert second_ws.audio() == b"".join(chunk(i).payload for i in range(3))
+    assert buffer.metrics.frames_dropped == 0
+    assert buffer.metrics.buffered_seconds == 0.0
+
+
+def test_failed_send_is_requeued():
+    class BrokenWebSocket:
+        async def send(self, message):
+            raise ConnectionError("backend closed")
+
+    async def scenario():
+        buffer = make_buffer()
+        await buffer.put(chunk(0))
+        try:
+            await forward_buffer_to_ws(BrokenWebSocket(), buffer, latency_budget=0)
+        except ConnectionError:
+            pass
+        buffer.close()
+        ws = FakeWebSocket()
+        await forward_buffer_to_ws(ws, buffer, binary_framing=True)
+        return ws
+
+    assert asyncio.run(scenario()).audio() == chunk(0).payload
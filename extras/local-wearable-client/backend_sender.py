@@ -1,16 +1,25 @@
-"""Backend streaming module — sends audio to Chronicle via Wyoming WebSocket protocol."""
+"""Backend streaming module — sends queued audio to Chronicle via Wyoming WebSocket protocol.
+
+Live audio goes over the websocket; backlog that piled up while the backend
+was unreachable is uploaded through the backfill API so its conversations
+keep their capture time.
+"""
 
 import asyncio
 import json
 import logging
 import os
 import ssl
-from typing import AsyncGenerator, Optional
+import struct
+import time
+from typing import Callable, Optional
 from urllib.parse import quote
 
 import httpx
 import websockets
+from backfill import BACKFILL_CONVERSATION_MINUTES, BackfillUploader, split_into_parts
 from dotenv import load_dotenv
+from uplink_queue import SegmentQueue, UplinkMetrics
 
 load_dotenv()
 
@@ -21,14 +30,32 @@ VERIFY_SSL = os.getenv("VERIFY_SSL", "true").lower() == "true"
 ws_protocol = "wss" if USE_HTTPS else "ws"
 http_protocol = "https" if USE_HTTPS else "http"
 
-websocket_uri = f"{ws_protocol}://{BACKEND_HOST}/ws?codec=opus"
+# "binary" sends each audio chunk as one WebSocket message (falls back to
+# standard Wyoming header + payload if the backend doesn't accept it)
+AUDIO_FRAMING = os.getenv("AUDIO_FRAMING", "binary")
+
+websocket_uri = f"{ws_protocol}://{BACKEND_HOST}/ws?codec=opus&framing={AUDIO_FRAMING}"
 backend_url = f"{http_protocol}://{BACKEND_HOST}"
 
 ADMIN_PASSWORD = os.getenv("ADMIN_PASSWORD")
 ADMIN_EMAIL = os.getenv("ADMIN_EMAIL")
 
+# Store-and-forward uplink (see uplink_queue.py)
+# Packets older than this on (re)connect are backlog, uploaded via the backfill API
+UPLINK_LIVE_LAG_SECONDS = float(os.getenv("UPLINK_LIVE_LAG_SECONDS", "2"))
+# A capture gap longer than this starts a new backlog conversation
+UPLINK_BACKLOG_GAP_SECONDS = 60.0
+UPLINK_BATCH_PACKETS = 250
+UPLINK_METRICS_INTERVAL = 10.0
+UPLINK_RECONNECT_MIN_SECONDS = 1.0
+UPLINK_RECONNECT_MAX_SECONDS = 30.0
+
 logger = logging.getLogger(__name__)
 
+# Compact audio-chunk framing (must match the backend's utils/wyoming_framing.py):
+# "WA", version, channels, rate (u32 BE), width, pad — followed by the payload.
+AUDIO_FRAME_HEADER = struct.Struct("!2sBBIBx")
+
 # Module-level websocket reference for sending control messages (e.g., button events)
 _active_websocket = None
 
@@ -121,31 +148,40 @@ async def receive_handler(websocket, logger) -> None:
         logger.error("Receive handler error: %s", e, exc_info=True)
 
 
-async def stream_to_backend(
-    stream: AsyncGenerator[bytes, None],
-    device_name: str = "wearable",
+def _ssl_context() -> Optional[ssl.SSLContext]:
+    if not USE_HTTPS:
+        return None
+    ssl_context = ssl.create_default_context()
+    if not VERIFY_SSL:
+        ssl_context.check_hostname = False
+        ssl_context.verify_mode = ssl.CERT_NONE
+    return ssl_context
+
+
+async def _run_uplink_session(
+    queue: SegmentQueue,
+    device_name: str,
+    metrics: UplinkMetrics,
+    stop: asyncio.Event,
 ) -> None:
-    """Stream raw Opus audio to backend using Wyoming protocol with JWT authentication."""
+    """One websocket session: send queued audio until stopped or disconnected.
+
+    Expects the backlog to have been uploaded already (see
+    :func:`_upload_backlog`), so everything sent here is live audio. Packets
+    go out in capture order in the negotiated framing.
+    """
     token = await get_jwt_token(ADMIN_EMAIL, ADMIN_PASSWORD)
     if not token:
-        logger.error("Failed to get JWT token, cannot stream audio")
-        return
+        raise ConnectionError("backend authentication failed")
 
     uri_with_token = f"{websocket_uri}&token={token}&device_name={quote(device_name)}"
 
-    ssl_context = None
-    if USE_HTTPS:
-        ssl_context = ssl.create_default_context()
-        if not VERIFY_SSL:
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
-
     global _active_websocket
 
     logger.info("Connecting to WebSocket: %s", websocket_uri)
     async with websockets.connect(
         uri_with_token,
-        ssl=ssl_context,
+        ssl=_ssl_context(),
         ping_interval=20,
         ping_timeout=120,
         close_timeout=10,
@@ -154,6 +190,12 @@ async def stream_to_backend(
 
         ready_msg = await websocket.recv()
         logger.info("Backend ready: %s", ready_msg)
+        try:
+            framing = json.loads(ready_msg).get("framing", "wyoming")
+        except (json.JSONDecodeError, AttributeError):
+            framing = "wyoming"
+        binary_framing = framing == "binary"
+        frame_header = AUDIO_FRAME_HEADER.pack(b"WA", 1, 1, 16000, 2)
 
         receive_task = asyncio.create_task(receive_handler(websocket, logger))
 
@@ -169,26 +211,33 @@ async def stream_to_backend(
                 "payload_length": None,
             }
             await websocket.send(json.dumps(audio_start) + "\n")
-            logger.info("Sent audio-start event")
-
-            chunk_count = 0
-            async for opus_data in stream:
-                chunk_count += 1
-
-                audio_chunk_header = {
-                    "type": "audio-chunk",
-                    "data": {
-                        "rate": 16000,
-                        "width": 2,
-                        "channels": 1,
-                    },
-                    "payload_length": len(opus_data),
-                }
-                await websocket.send(json.dumps(audio_chunk_header) + "\n")
-                await websocket.send(opus_data)
-
-                if chunk_count % 100 == 0:
-                    logger.info("Sent %d chunks", chunk_count)
+            logger.info("Sent audio-start event (%s framing)", framing)
+            metrics.connected = True
+
+            while True:
+                packets = queue.read(UPLINK_BATCH_PACKETS)
+                if not packets:
+                    if stop.is_set():
+                        break
+                    if receive_task.done():
+                        raise ConnectionError("backend closed the connection")
+                    await queue.wait_for_data(timeout=1.0)
+                    continue
+
+                for _, opus_data in packets:
+                    if binary_framing:
+                        await websocket.send(frame_header + opus_data)
+                    else:
+                        audio_chunk_header = {
+                            "type": "audio-chunk",
+                            "data": {"rate": 16000, "width": 2, "channels": 1},
+                            "payload_length": len(opus_data),
+                        }
+                        await websocket.send(json.dumps(audio_chunk_header) + "\n")
+                        await websocket.send(opus_data)
+
+                queue.commit()
+                metrics.record_sent(packets, time.time())
 
             audio_stop = {
                 "type": "audio-stop",
@@ -196,12 +245,161 @@ async def stream_to_backend(
                 "payload_length": None,
             }
             await websocket.send(json.dumps(audio_stop) + "\n")
-            logger.info("Sent audio-stop event. Total chunks: %d", chunk_count)
+            logger.info("Sent audio-stop event. Total chunks: %d", metrics.packets_sent)
 
         finally:
+            metrics.connected = False
             _active_websocket = None
             receive_task.cancel()
             try:
                 await receive_task
             except asyncio.CancelledError:
                 logger.info("Receive task cancelled successfully")
+
+
+def _read_backlog_run(queue: SegmentQueue, cutoff: float) -> list[tuple[float, bytes]]:
+    """Read the next backlog conversation from the committed cursor.
+
+    A run holds packets captured before ``cutoff`` with no capture gap over
+    ``UPLINK_BACKLOG_GAP_SECONDS``, and spans at most
+    ``BACKFILL_CONVERSATION_MINUTES``. Packets past the run stay unread.
+    """
+    max_span = BACKFILL_CONVERSATION_MINUTES * 60
+    run: list[tuple[float, bytes]] = []
+    while True:
+        packets = queue.read(UPLINK_BATCH_PACKETS, before=cutoff)
+        if not packets:
+            return run
+        for captured_at, packet in packets:
+            if run and (
+                captured_at - run[-1][0] > UPLINK_BACKLOG_GAP_SECONDS
+                or captured_at - run[0][0] >= max_span
+            ):
+                # Read past the end of the run; position the queue right after it
+                queue.rewind()
+                return queue.read(len(run))
+            run.append((captured_at, packet))
+
+
+async def _upload_backlog(
+    queue: SegmentQueue, device_name: str, metrics: UplinkMetrics
+) -> None:
+    """Upload queued audio older than ``UPLINK_LIVE_LAG_SECONDS`` as backfill.
+
+    Each run becomes its own conversation dated at the capture time of its
+    first packet, instead of being replayed into the live stream. The upload
+    ID is derived from the run's capture times, so a run re-read after a
+    crash resumes (or is recognised as done) on the backend.
+    """
+    oldest = queue.oldest_capture_time()
+    if oldest is None or time.time() - oldest <= UPLINK_LIVE_LAG_SECONDS:
+        return
+
+    uploader = BackfillUploader(
+        backend_url, ADMIN_EMAIL, ADMIN_PASSWORD, verify_ssl=VERIFY_SSL
+    )
+    try:
+        while True:
+            run = _read_backlog_run(queue, time.time() - UPLINK_LIVE_LAG_SECONDS)
+            if not run:
+                return
+            first, last = run[0][0], run[-1][0]
+            logger.info(
+                "Uploading %.0fs of queued audio captured %s as backfill",
+                last - first,
+                time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(first)),
+            )
+            result = await uploader.upload_conversation(
+                f"{queue.directory.name}-{int(first * 1000)}-{int(last * 1000)}",
+                split_into_parts([packet for _, packet in run]),
+                first,
+                device_name,
+            )
+            queue.commit()
+            metrics.record_sent(run, time.time())
+            logger.info("Backlog uploaded → %s", result["conversation_id"])
+    finally:
+        await uploader.close()
+
+
+async def _report_metrics(
+    queue: SegmentQueue,
+    metrics: UplinkMetrics,
+    on_metrics: Optional[Callable[[dict], None]],
+) -> None:
+    """Periodically refresh uplink metrics, log them and pass them on."""
+    while True:
+        await asyncio.sleep(UPLINK_METRICS_INTERVAL)
+        metrics.refresh(queue)
+        if metrics.backlog_seconds > UPLINK_LIVE_LAG_SECONDS:
+            logger.info(
+                "Uplink %s: %.0fs queued (%.1f MB), draining at %.1fx real time, lag %.1fs, %d dropped",
+                "catching up" if metrics.connected else "offline",
+                metrics.backlog_seconds,
+                metrics.queue_bytes / 1e6,
+                metrics.drain_rate,
+                metrics.lag_seconds,
+                metrics.dropped_packets,
+            )
+        else:
+            logger.debug(
+                "Uplink live: lag %.1fs, %d packets sent",
+                metrics.lag_seconds,
+                metrics.packets_sent,
+            )
+        if on_metrics:
+            on_metrics(metrics.as_dict())
+
+
+async def stream_to_backend(
+    queue: SegmentQueue,
+    device_name: str = "wearable",
+    stop: Optional[asyncio.Event] = None,
+    on_metrics: Optional[Callable[[dict], None]] = None,
+) -> None:
+    """Forward queued Opus audio to the backend, reconnecting until stopped.
+
+    Capture keeps appending to ``queue`` while the backend is unreachable;
+    each reconnect uploads the backlog through the backfill API and then
+    streams live audio over the websocket. Once ``stop`` is set, the queue is
+    sent up to its end, followed by audio-stop. If the backend is down at that
+    point, the backlog stays on disk for the next session.
+    """
+    stop = stop or asyncio.Event()
+    metrics = UplinkMetrics()
+    reporter = asyncio.create_task(_report_metrics(queue, metrics, on_metrics))
+    backoff = UPLINK_RECONNECT_MIN_SECONDS
+
+    try:
+        while True:
+            session_started = time.monotonic()
+            try:
+                await _upload_backlog(queue, device_name, metrics)
+                await _run_uplink_session(queue, device_name, metrics, stop)
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Backend uplink failed: %s", e)
+            finally:
+                # Anything read but not committed is re-sent on the next session
+                queue.rewind()
+
+            if stop.is_set():
+                logger.info(
+                    "Device disconnected while offline, %.1f MB left queued",
+                    queue.pending_bytes / 1e6,
+                )
+                return
+            if time.monotonic() - session_started > UPLINK_RECONNECT_MAX_SECONDS:
+                backoff = UPLINK_RECONNECT_MIN_SECONDS
+            logger.info("Reconnecting to backend in %.0fs (capture continues to disk)", backoff)
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=backoff)
+                return
+            except asyncio.TimeoutError:
+                pass
+            backoff = min(backoff * 2, UPLINK_RECONNECT_MAX_SECONDS)
+    finally:
+        reporter.cancel()
+        await asyncio.gather(reporter, return_exceptions=True)
@@ -0,0 +1,649 @@
+"""Offline storage backfill — ingest audio recorded on the device's flash.
+
+The device keeps recording to on-board storage while no client is connected.
+Instead of decoding that audio and replaying it through the real-time
+websocket, backfill runs in two stages:
+
+1. **Read**: storage is drained over BLE into a local spool file, byte for
+   byte. The spool's size is the read progress, so an interrupted transfer
+   resumes from the device offset where it stopped.
+2. **Upload**: stored Opus frames are packed into 10s Ogg/Opus parts without
+   decoding and sent in batches to the backend's resumable ``/audio/backfill``
+   endpoints, which create one conversation per recording (dated at capture
+   time) and start batch transcription once all parts are in.
+
+Storage holds Opus frames, each prefixed with a one-byte length — the same
+bytes ``wifi-sync`` writes to its ``.raw`` files, which can be uploaded with
+``backfill --dump`` (and used for benchmarking without a device).
+
+State directory layout (one per device or dump)::
+
+    state.json    {"device_offset": 123456, "batch": {...}} — see BackfillState
+    <batch>.bin   spool of raw storage bytes for the batch being ingested
+"""
+
+import asyncio
+import json
+import logging
+import os
+import struct
+import time
+import zlib
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+BACKFILL_DIR = os.getenv("BACKFILL_DIR", "./backfill")
+# Stored audio is split into conversations of at most this length
+BACKFILL_CONVERSATION_MINUTES = float(os.getenv("BACKFILL_CONVERSATION_MINUTES", "30"))
+# Parts per upload request (30 x 10s = 5 minutes of audio)
+BACKFILL_BATCH_PARTS = int(os.getenv("BACKFILL_BATCH_PARTS", "30"))
+BACKFILL_PART_SECONDS = 10.0
+BACKFILL_UPLOAD_RETRIES = 5
+# A storage read with no data for this long is treated as interrupted
+STORAGE_IDLE_TIMEOUT = 10.0
+# One-byte storage notifications are status codes rather than audio
+STORAGE_STATUS_OK = 0
+STORAGE_STATUS_DONE = 100
+
+STATE_FILE = "state.json"
+SAMPLE_RATE = 16000
+# Opus granule positions always count 48 kHz samples
+OPUS_GRANULE_RATE = 48000
+
+OGG_PAGE_HEADER = struct.Struct("<4sBBqIIIB")
+OGG_BOS = 0x02
+OGG_EOS = 0x04
+# Frame durations in 48 kHz samples per TOC config (RFC 6716, section 3.1)
+_SILK_FRAMES = (480, 960, 1920, 2880)
+_HYBRID_FRAMES = (480, 960)
+_CELT_FRAMES = (120, 240, 480, 960)
+# Ogg's CRC is the non-reflected form of zlib's CRC-32 polynomial
+_BIT_REVERSE = bytes(int(f"{i:08b}"[::-1], 2) for i in range(256))
+
+
+# ---------------------------------------------------------------------------
+# Storage format and Ogg/Opus packing
+# ---------------------------------------------------------------------------
+
+
+def iter_storage_frames(data: bytes) -> Iterator[bytes]:
+    """Yield the Opus frames of length-prefixed storage bytes.
+
+    A trailing incomplete frame (from an interrupted read) is dropped.
+    """
+    offset = 0
+    end = len(data)
+    while offset < end:
+        length = data[offset]
+        offset += 1
+        if length == 0:
+            continue
+        if offset + length > end:
+            return
+        yield data[offset : offset + length]
+        offset += length
+
+
+def opus_packet_samples(packet: bytes) -> int:
+    """Duration of an Opus packet in 48 kHz samples, from its TOC byte."""
+    toc = packet[0]
+    config = toc >> 3
+    if config < 12:
+        frame = _SILK_FRAMES[config % 4]
+    elif config < 16:
+        frame = _HYBRID_FRAMES[config % 2]
+    else:
+        frame = _CELT_FRAMES[config % 4]
+
+    code = toc & 0x03
+    if code == 0:
+        count = 1
+    elif code in (1, 2):
+        count = 2
+    else:
+        count = packet[1] & 0x3F if len(packet) > 1 else 0
+    return frame * count
+
+
+def ogg_crc(data: bytes) -> int:
+    """Ogg page checksum (CRC-32, polynomial 0x04C11DB7, no reflection, zero init).
+
+    Computed with zlib on bit-reversed input rather than a Python loop; the
+    second crc32 cancels zlib's initial value and final XOR.
+    """
+    crc = zlib.crc32(data.translate(_BIT_REVERSE)) ^ zlib.crc32(bytes(len(data)))
+    return int(f"{crc:032b}"[::-1], 2)
+
+
+def _ogg_page(
+    packets: list[bytes], granule: int, serial: int, sequence: int, flags: int = 0
+) -> bytes:
+    lacing = bytearray()
+    for packet in packets:
+        lacing.extend(b"\xff" * (len(packet) // 255))
+        lacing.append(len(packet) % 255)
+    header = OGG_PAGE_HEADER.pack(
+        b"OggS", 0, flags, granule, serial, sequence, 0, len(lacing)
+    )
+    page = bytearray(header + lacing + b"".join(packets))
+    struct.pack_into("<I", page, 22, ogg_crc(bytes(page)))
+    return bytes(page)
+
+
+def build_ogg_opus(
+    packets: list[bytes], serial: int, sample_rate: int = SAMPLE_RATE
+) -> bytes:
+    """Wrap mono Opus packets in an Ogg/Opus file (RFC 7845) without re-encoding."""
+    head = struct.pack("<8sBBHIhB", b"OpusHead", 1, 1, 0, sample_rate, 0, 0)
+    vendor = b"chronicle-wearable"
+    tags = b"OpusTags" + struct.pack("<I", len(vendor)) + vendor + struct.pack("<I", 0)
+
+    pages = [
+        _ogg_page([head], 0, serial, 0, OGG_BOS),
+        _ogg_page([tags], 0, serial, 1),
+    ]
+    granule = 0
+    page_packets: list[bytes] = []
+    segments = 0
+    for i, packet in enumerate(packets):
+        page_packets.append(packet)
+        segments += len(packet) // 255 + 1
+        granule += opus_packet_samples(packet)
+        last = i == len(packets) - 1
+        # A page holds at most 255 lacing values; flush before the next packet could overflow it
+        if last or segments + len(packets[i + 1]) // 255 + 1 > 255:
+            pages.append(
+                _ogg_page(
+                    page_packets, granule, serial, len(pages), OGG_EOS if last else 0
+                )
+            )
+            page_packets = []
+            segments = 0
+    return b"".join(pages)
+
+
+def split_into_parts(frames: list[bytes]) -> list[list[bytes]]:
+    """Group frames into consecutive parts of ``BACKFILL_PART_SECONDS`` of audio."""
+    part_samples = int(BACKFILL_PART_SECONDS * OPUS_GRANULE_RATE)
+    parts: list[list[bytes]] = []
+    current: list[bytes] = []
+    samples = 0
+    for frame in frames:
+        current.append(frame)
+        samples += opus_packet_samples(frame)
+        if samples >= part_samples:
+            parts.append(current)
+            current = []
+            samples = 0
+    if current:
+        parts.append(current)
+    return parts
+
+
+def parts_duration(parts: list[list[bytes]]) -> float:
+    return (
+        sum(opus_packet_samples(f) for part in parts for f in part) / OPUS_GRANULE_RATE
+    )
+
+
+# ---------------------------------------------------------------------------
+# Persistent progress
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class BackfillBatch:
+    """One contiguous stretch of storage being ingested."""
+
+    id: str
+    spool: str  # raw storage bytes, relative to the state directory (or absolute for dumps)
+    start_offset: int = 0  # device storage offset of the spool's first byte
+    read_started_at: float = field(default_factory=time.time)
+    read_complete: bool = False
+    recorded_at: Optional[float] = None  # capture time of the first frame
+    conversations_done: int = 0
+
+
+class BackfillState:
+    """Read offset and upload progress for one device, kept in ``state.json``."""
+
+    def __init__(self, directory: str | os.PathLike) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.path = self.directory / STATE_FILE
+        self.device_offset = 0
+        self.batch: Optional[BackfillBatch] = None
+        try:
+            data = json.loads(self.path.read_text())
+            self.device_offset = int(data.get("device_offset", 0))
+            if data.get("batch"):
+                self.batch = BackfillBatch(**data["batch"])
+        except FileNotFoundError:
+            pass
+        except (ValueError, TypeError) as e:
+            logger.warning("Ignoring unreadable backfill state %s: %s", self.path, e)
+
+    @property
+    def spool_path(self) -> Path:
+        return self.directory / self.batch.spool
+
+    @property
+    def spool_size(self) -> int:
+        return self.spool_path.stat().st_size if self.spool_path.exists() else 0
+
+    def save(self) -> None:
+        data = {
+            "device_offset": self.device_offset,
+            "batch": asdict(self.batch) if self.batch else None,
+        }
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data))
+        os.replace(tmp, self.path)
+
+    def finish_batch(self) -> None:
+        """Forget the uploaded batch and delete its spool (dumps are kept)."""
+        if self.batch and not os.path.isabs(self.batch.spool):
+            self.spool_path.unlink(missing_ok=True)
+        self.batch = None
+        self.save()
+
+
+# ---------------------------------------------------------------------------
+# Stage 1: device storage -> spool
+# ---------------------------------------------------------------------------
+
+
+async def read_storage(conn, state: BackfillState) -> bool:
+    """Drain the device's storage into the spool of the current batch.
+
+    Starts a new batch at the last ingested offset, or resumes an
+    interrupted one. Returns True when the batch is fully read.
+    """
+    file_size, device_offset = await conn.get_storage_info()
+
+    if state.batch is None:
+        start = (
+            state.device_offset
+            if device_offset <= state.device_offset <= file_size
+            else device_offset
+        )
+        if start >= file_size:
+            logger.info("No new stored audio (%d bytes on device)", file_size)
+            return False
+        batch_id = str(int(time.time()))
+        state.batch = BackfillBatch(
+            id=batch_id, spool=f"{batch_id}.bin", start_offset=start
+        )
+        state.save()
+    elif state.batch.read_complete:
+        return True
+
+    batch = state.batch
+    offset = batch.start_offset + state.spool_size
+    if offset > file_size:
+        # Storage was cleared since the batch started; keep what was read
+        logger.warning(
+            "Device storage shrank below the resume offset, ending batch early"
+        )
+        offset = file_size
+    remaining = file_size - offset
+
+    if remaining > 0:
+        # The device records until the read starts, so this anchors the timeline
+        batch.read_started_at = time.time()
+        state.save()
+        logger.info(
+            "Reading %.1f MB of stored audio (offset %d of %d)...",
+            remaining / 1e6,
+            offset,
+            file_size,
+        )
+        with open(state.spool_path, "ab") as spool:
+            if not await _read_into(conn, spool, offset, file_size):
+                logger.info(
+                    "Storage read interrupted, will resume at the next backfill"
+                )
+                return False
+
+    batch.read_complete = True
+    state.device_offset = batch.start_offset + state.spool_size
+    state.save()
+    return True
+
+
+async def _read_into(conn, spool: BinaryIO, offset: int, file_size: int) -> bool:
+    """Stream storage notifications into ``spool`` until the device is done.
+
+    Returns False if the read stopped early (disconnect, stall or device
+    error); the spool then ends where the next read should resume.
+    """
+    loop = asyncio.get_running_loop()
+    done = asyncio.Event()
+    failed = [False]
+    received = [0]
+    last_data = [time.monotonic()]
+    started = time.monotonic()
+
+    def _on_data(data: bytes) -> None:
+        last_data[0] = time.monotonic()
+        if len(data) == 1:
+            if data[0] == STORAGE_STATUS_DONE:
+                done.set()
+            elif data[0] != STORAGE_STATUS_OK:
+                logger.error("Storage read failed with status %d", data[0])
+                failed[0] = True
+                done.set()
+            return
+        spool.write(data)
+        received[0] += len(data)
+        if offset + received[0] >= file_size:
+            done.set()
+
+    def handle_storage_data(_sender, data: bytearray) -> None:
+        try:
+            loop.call_soon_threadsafe(_on_data, bytes(data))
+        except RuntimeError:
+            pass  # event loop closed
+
+    await conn.subscribe_storage_data(handle_storage_data)
+    await conn.start_storage_read(file_num=0, offset=offset)
+
+    finished = asyncio.create_task(done.wait())
+    disconnected = asyncio.create_task(conn.wait_until_disconnected())
+    try:
+        while not done.is_set():
+            await asyncio.wait(
+                [finished, disconnected],
+                timeout=1.0,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            spool.flush()
+            if disconnected.done():
+                logger.warning("Device disconnected during storage read")
+                failed[0] = True
+                break
+            if (
+                not done.is_set()
+                and time.monotonic() - last_data[0] > STORAGE_IDLE_TIMEOUT
+            ):
+                logger.warning("Storage read stalled, stopping")
+                failed[0] = True
+                break
+    finally:
+        for task in (finished, disconnected):
+            task.cancel()
+        await asyncio.gather(finished, disconnected, return_exceptions=True)
+
+    spool.flush()
+    os.fsync(spool.fileno())
+    elapsed = time.monotonic() - started
+    logger.info(
+        "Read %.1f MB in %.0fs (%.1f kB/s)",
+        received[0] / 1e6,
+        elapsed,
+        received[0] / 1e3 / elapsed if elapsed else 0,
+    )
+    return not failed[0]
+
+
+# ---------------------------------------------------------------------------
+# Stage 2: spool -> backend
+# ---------------------------------------------------------------------------
+
+
+class BackfillRejected(Exception):
+    """The backend refused a backfill request (4xx)."""
+
+    def __init__(self, status_code: int, body: dict) -> None:
+        super().__init__(f"{status_code}: {body.get('error') or body.get('detail')}")
+        self.status_code = status_code
+        self.body = body
+
+
+class BackfillUploader:
+    """Uploads Ogg/Opus parts through the backend's resumable backfill API."""
+
+    def __init__(
+        self, backend_url: str, email: str, password: str, verify_ssl: bool = True
+    ) -> None:
+        self.backend_url = backend_url
+        self.email = email
+        self.password = password
+        self.client = httpx.AsyncClient(
+            base_url=backend_url, timeout=60.0, verify=verify_ssl
+        )
+        self._token: Optional[str] = None
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+    async def _request(self, method: str, path: str, **kwargs) -> dict:
+        """Send an authenticated request, re-logging in and retrying with backoff."""
+        from backend_sender import get_jwt_token
+
+        delay = 1.0
+        for attempt in range(BACKFILL_UPLOAD_RETRIES):
+            if self._token is None:
+                self._token = await get_jwt_token(self.email, self.password)
+            try:
+                if self._token is None:
+                    raise ConnectionError("backend authentication failed")
+                response = await self.client.request(
+                    method,
+                    path,
+                    headers={"Authorization": f"Bearer {self._token}"},
+                    **kwargs,
+                )
+                if response.status_code == 401:
+                    self._token = None
+                    raise ConnectionError("backend rejected the token")
+                if response.status_code >= 500:
+                    raise ConnectionError(f"backend error {response.status_code}")
+                body = response.json()
+                if response.status_code >= 400:
+                    raise BackfillRejected(response.status_code, body)
+                return body
+            except (httpx.HTTPError, ConnectionError) as e:
+                if attempt == BACKFILL_UPLOAD_RETRIES - 1:
+                    raise
+                logger.warning(
+                    "Backfill request failed (%s), retrying in %.0fs", e, delay
+                )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 30.0)
+
+    async def upload_conversation(
+        self,
+        upload_id: str,
+        parts: list[list[bytes]],
+        recorded_at: float,
+        device_name: str,
+    ) -> dict:
+        """Upload one conversation's parts, skipping what the backend already has."""
+        status = await self._request(
+            "POST",
+            "/api/audio/backfill",
+            json={
+                "upload_id": upload_id,
+                "recorded_at": recorded_at,
+                "device_name": device_name,
+            },
+        )
+        if status["completed"]:
+            return status
+
+        conversation_id = status["conversation_id"]
+        next_part = status["next_part"]
+        while next_part < len(parts):
+            batch = range(next_part, min(next_part + BACKFILL_BATCH_PARTS, len(parts)))
+            files = [
+                (
+                    "files",
+                    (
+                        f"part{index:05d}.opus",
+                        build_ogg_opus(
+                            parts[index],
+                            serial=zlib.crc32(f"{upload_id}:{index}".encode()),
+                        ),
+                        "audio/ogg",
+                    ),
+                )
+                for index in batch
+            ]
+            try:
+                result = await self._request(
+                    "POST",
+                    f"/api/audio/backfill/{conversation_id}/parts",
+                    params={"first_part": next_part},
+                    files=files,
+                )
+            except BackfillRejected as e:
+                if "next_part" not in e.body:
+                    raise
+                result = (
+                    e.body
+                )  # out of sync after a lost response; continue from the backend's position
+                if result["next_part"] == next_part:
+                    raise
+            next_part = result["next_part"]
+
+        return await self._request(
+            "POST", f"/api/audio/backfill/{conversation_id}/complete"
+        )
+
+
+def plan_conversations(parts: list[list[bytes]]) -> list[list[list[bytes]]]:
+    """Split parts into conversations of at most ``BACKFILL_CONVERSATION_MINUTES``."""
+    per_conversation = max(
+        1, int(BACKFILL_CONVERSATION_MINUTES * 60 / BACKFILL_PART_SECONDS)
+    )
+    return [
+        parts[i : i + per_conversation] for i in range(0, len(parts), per_conversation)
+    ]
+
+
+async def upload_batch(
+    state: BackfillState,
+    uploader: BackfillUploader,
+    device_id: str,
+    device_name: str,
+) -> None:
+    """Upload the current (fully read) batch, resuming after the last finished conversation."""
+    batch = state.batch
+    data = state.spool_path.read_bytes() if state.spool_size else b""
+    parts = split_into_parts(list(iter_storage_frames(data)))
+    if not parts:
+        logger.info("Stored audio contained no frames")
+        state.finish_batch()
+        return
+
+    duration = parts_duration(parts)
+    if batch.recorded_at is None:
+        # Storage has no timestamps: assume the recording ended when the read started
+        batch.recorded_at = batch.read_started_at - duration
+        state.save()
+
+    conversations = plan_conversations(parts)
+    logger.info(
+        "Uploading %.0f min of stored audio (%.1f MB) as %d conversation(s)",
+        duration / 60,
+        len(data) / 1e6,
+        len(conversations),
+    )
+
+    started = time.monotonic()
+    recorded_at = batch.recorded_at
+    for index, conversation_parts in enumerate(conversations):
+        if index >= batch.conversations_done:
+            result = await uploader.upload_conversation(
+                f"{device_id}-{batch.id}-{index}",
+                conversation_parts,
+                recorded_at,
+                device_name,
+            )
+            batch.conversations_done = index + 1
+            state.save()
+            logger.info(
+                "Backfilled conversation %d/%d → %s",
+                index + 1,
+                len(conversations),
+                result["conversation_id"],
+            )
+        recorded_at += parts_duration(conversation_parts)
+
+    elapsed = time.monotonic() - started
+    logger.info(
+        "Backfill uploaded in %.1fs (%.0fx real time)",
+        elapsed,
+        duration / elapsed if elapsed else 0,
+    )
+    state.finish_batch()
+
+
+# ---------------------------------------------------------------------------
+# Entry points
+# ---------------------------------------------------------------------------
+
+
+def _uploader() -> BackfillUploader:
+    from backend_sender import ADMIN_EMAIL, ADMIN_PASSWORD, VERIFY_SSL, backend_url
+
+    return BackfillUploader(
+        backend_url, ADMIN_EMAIL, ADMIN_PASSWORD, verify_ssl=VERIFY_SSL
+    )
+
+
+async def backfill_device(device: dict) -> None:
+    """Read a device's stored audio and upload it, resuming any unfinished backfill."""
+    from friend_lite import OmiConnection
+
+    device_id = device["mac"].replace(":", "")
+    state = BackfillState(os.path.join(BACKFILL_DIR, device_id))
+
+    if state.batch is None or not state.batch.read_complete:
+        async with OmiConnection(device["mac"]) as conn:
+            logger.info(
+                "Connected to %s [%s] for backfill", device["name"], device["mac"]
+            )
+            if not await read_storage(conn, state):
+                return
+        # BLE is released before uploading so live streaming can reconnect
+
+    uploader = _uploader()
+    try:
+        await upload_batch(state, uploader, device_id, device["name"] or "wearable")
+    finally:
+        await uploader.close()
+
+
+async def backfill_dump(
+    path: str, recorded_at: Optional[float] = None, device_name: str = "wearable"
+) -> None:
+    """Upload a recorded storage dump (e.g. a ``wifi-sync`` ``.raw`` file).
+
+    Without ``recorded_at``, the recording is assumed to end at the file's
+    modification time.
+    """
+    path = os.path.abspath(path)
+    device_id = Path(path).stem
+    state = BackfillState(os.path.join(BACKFILL_DIR, "dumps", device_id))
+    if state.batch is None:
+        state.batch = BackfillBatch(
+            id=str(int(os.path.getmtime(path))),
+            spool=path,
+            read_started_at=os.path.getmtime(path),
+            read_complete=True,
+            recorded_at=recorded_at,
+        )
+        state.save()
+
+    uploader = _uploader()
+    try:
+        await upload_batch(state, uploader, device_id, device_name)
+    finally:
+        await uploader.close()
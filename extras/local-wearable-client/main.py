@@ -7,6 +7,7 @@ CLI usage:
     ./start.sh menu         # Menu bar mode
     ./start.sh scan         # One-shot scan, print nearby devices
     ./start.sh wifi-sync    # Download stored audio via WiFi sync
+    ./start.sh backfill     # Upload stored audio from device flash (BLE)
     ./start.sh install      # Install launchd agent
     ./start.sh uninstall    # Remove launchd agent
     ./start.sh kickstart    # Relaunch after quit
@@ -21,6 +22,7 @@ import os
 import shutil
 import socket
 import time
+from datetime import datetime
 from typing import Any, Callable
 
 import yaml
@@ -37,6 +39,7 @@ from friend_lite import (
 )
 from friend_lite.decoder import OmiOpusDecoder
 from wifi_join import get_current_wifi, join_wifi_ap
+from uplink_queue import SegmentQueue
 from wifi_receiver import WifiAudioReceiver
 from wyoming.audio import AudioChunk
 
@@ -52,6 +55,12 @@ CONFIG_PATH = os.path.join(os.path.dirname(__file__), "devices.yml")
 CONFIG_TEMPLATE_PATH = os.path.join(os.path.dirname(__file__), "devices.yml.template")
 ENV_PATH = os.path.join(os.path.dirname(__file__), ".env")
 
+# On-disk backlog for the backend uplink, one subdirectory per device
+UPLINK_QUEUE_DIR = os.getenv("UPLINK_QUEUE_DIR", "./uplink_queue")
+UPLINK_QUEUE_MAX_MB = float(os.getenv("UPLINK_QUEUE_MAX_MB", "512"))
+# How long to keep sending queued audio after the device disconnects
+UPLINK_FLUSH_SECONDS = 10.0
+
 
 def check_config() -> bool:
     """Check that required configuration is present. Returns True if backend streaming is possible."""
@@ -180,9 +189,14 @@ async def connect_and_stream(
     device: dict,
     backend_enabled: bool = True,
     on_battery_level: Callable[[int], None] | None = None,
+    on_uplink_metrics: Callable[[dict], None] | None = None,
 ) -> None:
     """Connect to a device, subscribe to audio (and buttons for OMI),
-    and stream to the Chronicle backend until disconnected."""
+    and stream to the Chronicle backend until disconnected.
+
+    Audio for the backend goes through an on-disk queue, so capture continues
+    while the backend is unreachable and the backlog is sent on reconnect.
+    """
 
     decoder = OmiOpusDecoder()
     loop = asyncio.get_running_loop()
@@ -190,7 +204,13 @@ async def connect_and_stream(
     # Raw BLE data queue — written from BLE thread via call_soon_threadsafe
     ble_queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=1000)
     # Backend Opus queue — written from BLE callback via call_soon_threadsafe
-    backend_queue: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize=500)
+    uplink_queue: SegmentQueue | None = None
+    if backend_enabled:
+        uplink_queue = SegmentQueue(
+            os.path.join(UPLINK_QUEUE_DIR, device["mac"].replace(":", "")),
+            max_bytes=int(UPLINK_QUEUE_MAX_MB * 1024 * 1024),
+        )
+    uplink_stop = asyncio.Event()
 
     def _enqueue_ble(data: bytes) -> None:
         # Push raw BLE data to local processing queue
@@ -198,12 +218,12 @@ async def connect_and_stream(
             ble_queue.put_nowait(data)
         except asyncio.QueueFull:
             logger.warning("BLE queue full, dropping frame")
-        # Push Opus payload directly to backend (decoupled from local file I/O)
-        if backend_enabled and len(data) > 3:
+        # Push Opus payload to the uplink queue (decoupled from local file I/O)
+        if uplink_queue is not None and len(data) > 3:
             try:
-                backend_queue.put_nowait(data[3:])
-            except asyncio.QueueFull:
-                logger.warning("Backend queue full, dropping frame")
+                uplink_queue.append(data[3:], time.time())
+            except OSError as e:
+                logger.warning("Uplink queue write failed, dropping frame: %s", e)
 
     def handle_ble_data(_sender: Any, data: bytes) -> None:
         try:
@@ -243,15 +263,13 @@ async def connect_and_stream(
                 await file_sink.write(chunk)
 
     async def backend_stream_wrapper() -> None:
-        async def queue_to_stream():
-            while True:
-                raw_opus = await backend_queue.get()
-                if raw_opus is None:
-                    break
-                yield raw_opus
-
         try:
-            await stream_to_backend(queue_to_stream(), device_name=device_name)
+            await stream_to_backend(
+                uplink_queue,
+                device_name=device_name,
+                stop=uplink_stop,
+                on_metrics=on_uplink_metrics,
+            )
         except Exception as e:
             logger.error("Backend streaming error: %s", e, exc_info=True)
 
@@ -323,6 +341,14 @@ async def connect_and_stream(
                     await asyncio.gather(*all_tasks, return_exceptions=True)
                     raise
 
+                # Let the uplink send what is still queued before stopping it
+                uplink_stop.set()
+                backend_tasks = [
+                    t for t in pending if t.get_name() == "backend_stream"
+                ]
+                if backend_tasks:
+                    await asyncio.wait(backend_tasks, timeout=UPLINK_FLUSH_SECONDS)
+
                 # Cancel remaining tasks and wait for cleanup
                 for task in pending:
                     task.cancel()
@@ -339,7 +365,9 @@ async def connect_and_stream(
         except Exception as e:
             logger.error("Error during device session: %s", e, exc_info=True)
         finally:
-            await backend_queue.put(None)
+            if uplink_queue is not None:
+                uplink_queue.close()
+                uplink_queue = None  # late BLE callbacks must not reopen it
 
 
 async def wifi_sync(
@@ -579,6 +607,50 @@ async def wifi_sync(
                 pass
 
 
+async def backfill(
+    target_mac: str | None = None,
+    dump: str | None = None,
+    recorded_at: str | None = None,
+    device_name: str = "wearable",
+) -> None:
+    """Upload audio stored on the device (or in a storage dump) to the backend."""
+    from backfill import backfill_device, backfill_dump
+
+    if not check_config():
+        logger.error("Backfill needs backend credentials in .env")
+        return
+
+    if dump:
+        started = datetime.fromisoformat(recorded_at).timestamp() if recorded_at else None
+        await backfill_dump(dump, recorded_at=started, device_name=device_name)
+        return
+
+    config = load_config()
+    devices = await scan_all_devices(config)
+    if target_mac:
+        device = next(
+            (d for d in devices if d["mac"].casefold() == target_mac.casefold()),
+            None,
+        )
+        if not device:
+            logger.error("Device %s not found", target_mac)
+            return
+    elif not devices:
+        logger.error("No devices found")
+        return
+    elif len(devices) == 1:
+        device = devices[0]
+    else:
+        device = prompt_device_selection(devices)
+        if device is None:
+            return
+
+    if device["type"] != "omi":
+        logger.error("Storage backfill is only supported on OMI devices")
+        return
+    await backfill_device(device)
+
+
 async def run(target_mac: str | None = None) -> None:
     config = load_config()
     scan_interval = config.get("scan_interval", 10)
@@ -713,6 +785,28 @@ def build_parser() -> argparse.ArgumentParser:
         help="Output directory (default: ./wifi_audio)",
     )
 
+    backfill_parser = sub.add_parser(
+        "backfill", help="Upload audio stored on the device's flash (resumable)"
+    )
+    backfill_parser.add_argument(
+        "--device", metavar="MAC", help="Connect to a specific device by MAC address"
+    )
+    backfill_parser.add_argument(
+        "--dump",
+        metavar="PATH",
+        help="Upload a storage dump (e.g. a wifi-sync .raw file) instead of reading a device",
+    )
+    backfill_parser.add_argument(
+        "--recorded-at",
+        metavar="ISO_TIME",
+        help="Capture time of the dump's first frame (default: dump ends at its mtime)",
+    )
+    backfill_parser.add_argument(
+        "--device-name",
+        default="wearable",
+        help="Device name for conversations created from a dump (default: wearable)",
+    )
+
     sub.add_parser("install", help="Install macOS launchd agent (auto-start on login)")
     sub.add_parser("uninstall", help="Remove macOS launchd agent")
     sub.add_parser("kickstart", help="Relaunch the menu bar app (after quit)")
@@ -738,6 +832,16 @@ def main() -> None:
             )
         )
 
+    elif command == "backfill":
+        asyncio.run(
+            backfill(
+                target_mac=args.device,
+                dump=args.dump,
+                recorded_at=args.recorded_at,
+                device_name=args.device_name,
+            )
+        )
+
     elif command == "run":
         asyncio.run(run(target_mac=getattr(args, "device", None)))
 
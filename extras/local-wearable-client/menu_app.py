@@ -44,6 +44,7 @@ class SharedState:
     error: Optional[str] = None
     chunks_sent: int = 0
     battery_level: int = -1  # -1 = unknown
+    uplink: Optional[dict] = None  # UplinkMetrics.as_dict() of the current session
 
     def snapshot(self) -> dict:
         with self._lock:
@@ -56,6 +57,7 @@ class SharedState:
                 "error": self.error,
                 "chunks_sent": self.chunks_sent,
                 "battery_level": self.battery_level,
+                "uplink": self.uplink.copy() if self.uplink else None,
             }
 
     def update(self, **kwargs) -> None:
@@ -246,7 +248,9 @@ class BLEManager:
         finally:
             self._running_task = None
             self._connecting = False
-            self.state.update(status="idle", connected_device=None, battery_level=-1)
+            self.state.update(
+                status="idle", connected_device=None, battery_level=-1, uplink=None
+            )
             logger.info("Disconnected from %s", device["name"])
 
             # Backoff logic: if connection was very short, it likely failed
@@ -274,12 +278,15 @@ class BLEManager:
 
     async def _run_connection(self, device: dict) -> None:
         """Run the actual device connection. Executed as a dedicated task."""
-        self.state.update(status="connected", connected_device=device, battery_level=-1)
+        self.state.update(
+            status="connected", connected_device=device, battery_level=-1, uplink=None
+        )
         self._save_last_connected(device["mac"])
         await connect_and_stream(
             device,
             backend_enabled=self.backend_enabled,
             on_battery_level=lambda level: self.state.update(battery_level=level),
+            on_uplink_metrics=lambda metrics: self.state.update(uplink=metrics),
         )
 
     def request_connect(self, mac: str) -> None:
@@ -333,12 +340,14 @@ class WearableMenuApp(rumps.App):
 
         # Build initial menu
         self.status_item = rumps.MenuItem("Status: Starting...", callback=None)
+        self.uplink_item = rumps.MenuItem("Backend: -", callback=None)
         self.disconnect_item = rumps.MenuItem("Disconnect", callback=self.on_disconnect)
         self.devices_header = rumps.MenuItem("Nearby Devices:", callback=None)
         self.scan_item = rumps.MenuItem("Scan Now", callback=self.on_scan)
 
         self.menu = [
             self.status_item,
+            self.uplink_item,
             self.disconnect_item,
             None,  # separator
             self.devices_header,
@@ -385,9 +394,23 @@ class WearableMenuApp(rumps.App):
         else:
             self.status_item.title = "Idle"
 
+        self.uplink_item.title = self._uplink_title(snap["uplink"])
+
         # Update device list
         self._rebuild_device_menu(snap["nearby_devices"], snap["connected_device"])
 
+    @staticmethod
+    def _uplink_title(uplink: Optional[dict]) -> str:
+        if not uplink:
+            return "Backend: -"
+        backlog = uplink["backlog_seconds"]
+        queued = f"{int(backlog // 60)}m{int(backlog % 60):02d}s queued"
+        if not uplink["connected"]:
+            return f"Backend: offline, {queued}"
+        if backlog > 5:
+            return f"Backend: catching up {uplink['drain_rate']:.1f}x, {queued}"
+        return f"Backend: live (lag {uplink['lag_seconds']:.1f}s)"
+
     def _rebuild_device_menu(
         self, devices: list[dict], connected: Optional[dict]
     ) -> None:
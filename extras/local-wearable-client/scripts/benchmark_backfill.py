@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Benchmark offline storage backfill against per-packet decoding.
+
+Replays storage dumps (the length-prefixed Opus bytes the device keeps on
+flash, e.g. ``wifi-sync`` ``.raw`` files) without a device and reports, per
+stage, time and speed as a multiple of real time:
+
+- decode: ``OmiOpusDecoder.decode_packet`` on every packet (what replaying
+  stored audio through the real-time pipeline costs before any upload)
+- read: storage notifications from a fake device (``--notify-bytes`` per
+  notification) into the backfill spool, including a resume after
+  ``--interrupt-at`` of the transfer
+- pack: stored frames to 10s Ogg/Opus parts (no decoding)
+- upload (with ``--upload``): parts to the backend's /audio/backfill API,
+  using the credentials in .env
+
+Synthetic speech-like Opus is generated when no dumps are given.
+
+Usage:
+    uv run python scripts/benchmark_backfill.py
+    uv run python scripts/benchmark_backfill.py --minutes 120
+    uv run python scripts/benchmark_backfill.py --dump wifi_audio/wifi_sync_1712345678.raw --upload
+"""
+
+import argparse
+import asyncio
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import backfill
+from backfill import (
+    BackfillState,
+    build_ogg_opus,
+    iter_storage_frames,
+    parts_duration,
+    read_storage,
+    split_into_parts,
+)
+
+SAMPLE_RATE = 16000
+# The device encodes 10 ms frames
+FRAME_SAMPLES = 160
+# Firmware sends stored data in notifications of up to 440 bytes
+NOTIFY_BYTES = 440
+
+
+def synthesize_dump(path: Path, minutes: float) -> None:
+    """Encode amplitude-modulated tones and noise to a storage dump."""
+    import opuslib
+
+    encoder = opuslib.Encoder(SAMPLE_RATE, 1, opuslib.APPLICATION_VOIP)
+    rng = random.Random(0)
+    frames = int(minutes * 60 * SAMPLE_RATE / FRAME_SAMPLES)
+    with open(path, "wb") as f:
+        for i in range(frames):
+            envelope = 0.5 + 0.5 * math.sin(i / 40)
+            pitch = 120 + 80 * math.sin(i / 300)
+            samples = bytearray()
+            for n in range(FRAME_SAMPLES):
+                t = (i * FRAME_SAMPLES + n) / SAMPLE_RATE
+                value = envelope * 8000 * math.sin(2 * math.pi * pitch * t) + rng.gauss(
+                    0, 300
+                )
+                samples += int(max(-32768, min(32767, value))).to_bytes(
+                    2, "little", signed=True
+                )
+            packet = encoder.encode(bytes(samples), FRAME_SAMPLES)
+            f.write(bytes([len(packet)]) + packet)
+
+
+class DumpConnection:
+    """Stands in for OmiConnection: serves storage reads from a dump."""
+
+    def __init__(
+        self, data: bytes, notify_bytes: int, stop_after: int | None = None
+    ) -> None:
+        self.data = data
+        self.notify_bytes = notify_bytes
+        self.stop_after = stop_after
+        self.disconnected = asyncio.Event()
+        self._callback = None
+
+    async def get_storage_info(self) -> tuple[int, int]:
+        return len(self.data), 0
+
+    async def subscribe_storage_data(self, callback) -> None:
+        self._callback = callback
+
+    async def start_storage_read(self, file_num: int = 0, offset: int = 0) -> None:
+        asyncio.get_running_loop().create_task(self._send(offset))
+
+    async def _send(self, offset: int) -> None:
+        end = (
+            len(self.data)
+            if self.stop_after is None
+            else min(self.stop_after, len(self.data))
+        )
+        for start in range(offset, end, self.notify_bytes):
+            self._callback(
+                None, bytearray(self.data[start : min(start + self.notify_bytes, end)])
+            )
+            if start // self.notify_bytes % 64 == 0:
+                await asyncio.sleep(0)
+        if end == len(self.data):
+            self._callback(None, bytearray([backfill.STORAGE_STATUS_DONE]))
+        else:
+            self.disconnected.set()
+
+    async def wait_until_disconnected(self) -> None:
+        await self.disconnected.wait()
+
+
+def report(label: str, seconds: float, audio_seconds: float, extra: str = "") -> None:
+    speed = audio_seconds / seconds if seconds else float("inf")
+    print(f"  {label:<8} {seconds:8.2f} s  {speed:9.0f}x real time  {extra}")
+
+
+def bench_decode(frames: list[bytes]) -> float:
+    from friend_lite.decoder import OmiOpusDecoder
+
+    decoder = OmiOpusDecoder()
+    started = time.perf_counter()
+    for frame in frames:
+        decoder.decode_packet(frame, strip_header=False)
+    return time.perf_counter() - started
+
+
+async def bench_read(
+    data: bytes, state_dir: Path, notify_bytes: int, interrupt_at: float
+) -> float:
+    state = BackfillState(state_dir)
+    started = time.perf_counter()
+    interrupted = DumpConnection(
+        data, notify_bytes, stop_after=int(len(data) * interrupt_at)
+    )
+    assert not await read_storage(interrupted, state)
+    assert await read_storage(DumpConnection(data, notify_bytes), state)
+    elapsed = time.perf_counter() - started
+    assert (
+        state.spool_path.read_bytes() == data
+    ), "spool differs from the dump after resume"
+    return elapsed
+
+
+async def bench_upload(path: Path) -> float:
+    from backfill import backfill_dump
+
+    started = time.perf_counter()
+    await backfill_dump(
+        str(path), recorded_at=time.time() - 24 * 3600, device_name="benchmark"
+    )
+    return time.perf_counter() - started
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--dump", nargs="+", help="Storage dumps to use instead of synthetic audio"
+    )
+    parser.add_argument(
+        "--minutes", type=float, default=30, help="Synthetic audio length"
+    )
+    parser.add_argument("--notify-bytes", type=int, default=NOTIFY_BYTES)
+    parser.add_argument(
+        "--interrupt-at",
+        type=float,
+        default=0.4,
+        help="Fraction read before the simulated disconnect",
+    )
+    parser.add_argument(
+        "--upload", action="store_true", help="Also upload to the configured backend"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        backfill.BACKFILL_DIR = tmp
+        if args.dump:
+            paths = [Path(p) for p in args.dump]
+        else:
+            paths = [Path(tmp) / "synthetic.raw"]
+            print(f"Encoding {args.minutes:.0f} min of synthetic audio...")
+            synthesize_dump(paths[0], args.minutes)
+
+        for path in paths:
+            data = path.read_bytes()
+            frames = list(iter_storage_frames(data))
+            started = time.perf_counter()
+            parts = split_into_parts(frames)
+            oggs = [build_ogg_opus(part, serial=i) for i, part in enumerate(parts)]
+            pack_seconds = time.perf_counter() - started
+            duration = parts_duration(parts)
+
+            print(
+                f"{path.name}: {duration / 60:.1f} min, {len(frames)} packets, {len(data) / 1e6:.1f} MB"
+            )
+            report(
+                "decode",
+                bench_decode(frames),
+                duration,
+                "(per-packet decode, before any upload)",
+            )
+            read_seconds = await bench_read(
+                data,
+                Path(tmp) / f"read-{path.stem}",
+                args.notify_bytes,
+                args.interrupt_at,
+            )
+            report(
+                "read", read_seconds, duration, f"(resumed at {args.interrupt_at:.0%})"
+            )
+            report(
+                "pack",
+                pack_seconds,
+                duration,
+                f"({len(parts)} parts, {sum(map(len, oggs)) / 1e6:.1f} MB Ogg/Opus)",
+            )
+            if args.upload:
+                report("upload", await bench_upload(path), duration)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
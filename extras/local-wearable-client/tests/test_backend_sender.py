@@ -0,0 +1,135 @@
+"""
+Unit tests for the uplink's backlog upload.
+
+Uses a temporary queue and a fake backfill uploader, no device or backend needed.
+
+Run:
+  uv run pytest extras/local-wearable-client/tests/test_backend_sender.py -v
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import backend_sender
+from uplink_queue import SegmentQueue, UplinkMetrics
+
+# CELT 20 ms Opus TOC byte (config 23, one frame)
+OPUS_TOC = 0xB8
+
+
+def packet(index: int) -> bytes:
+    return bytes([OPUS_TOC, index]) + b"\x00" * 38
+
+
+class FakeUploader:
+    instances: list["FakeUploader"] = []
+
+    def __init__(self, *args, fail: bool = False, **kwargs) -> None:
+        self.uploads: list[dict] = []
+        self.closed = False
+        self.fail = fail
+        FakeUploader.instances.append(self)
+
+    async def upload_conversation(self, upload_id, parts, recorded_at, device_name):
+        if self.fail:
+            raise ConnectionError("backend unreachable")
+        self.uploads.append(
+            {
+                "upload_id": upload_id,
+                "frames": [frame[1] for part in parts for frame in part],
+                "recorded_at": recorded_at,
+                "device_name": device_name,
+            }
+        )
+        return {"conversation_id": f"conv-{len(self.uploads)}", "completed": True}
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def uploader(monkeypatch):
+    FakeUploader.instances = []
+    monkeypatch.setattr(backend_sender, "BackfillUploader", FakeUploader)
+    return FakeUploader.instances
+
+
+def fill(queue: SegmentQueue, indexes: range, captured_at: float) -> None:
+    for offset, index in enumerate(indexes):
+        queue.append(packet(index), captured_at=captured_at + offset)
+
+
+def read_indexes(queue: SegmentQueue) -> list[int]:
+    return [payload[1] for _, payload in queue.read(100)]
+
+
+def test_backlog_is_uploaded_at_capture_time_and_live_audio_is_left(tmp_path, uploader):
+    queue = SegmentQueue(tmp_path / "AABBCC")
+    now = time.time()
+    fill(queue, range(0, 10), now - 1000)
+    # Device was out of range for two minutes
+    fill(queue, range(10, 15), now - 870)
+    fill(queue, range(15, 17), now - 0.5)
+
+    metrics = UplinkMetrics()
+    asyncio.run(backend_sender._upload_backlog(queue, "wearable", metrics))
+
+    (instance,) = uploader
+    assert instance.closed
+    assert [u["frames"] for u in instance.uploads] == [
+        list(range(0, 10)),
+        list(range(10, 15)),
+    ]
+    assert [u["recorded_at"] for u in instance.uploads] == [now - 1000, now - 870]
+    assert instance.uploads[0]["upload_id"] == (
+        f"AABBCC-{int((now - 1000) * 1000)}-{int((now - 991) * 1000)}"
+    )
+    assert metrics.packets_sent == 15
+
+    # Only live audio is left for the websocket
+    queue.rewind()
+    assert read_indexes(queue) == [15, 16]
+
+
+def test_backlog_is_split_into_conversations(tmp_path, uploader, monkeypatch):
+    monkeypatch.setattr(backend_sender, "BACKFILL_CONVERSATION_MINUTES", 0.1)
+    queue = SegmentQueue(tmp_path)
+    fill(queue, range(0, 15), time.time() - 100)
+
+    asyncio.run(backend_sender._upload_backlog(queue, "wearable", UplinkMetrics()))
+
+    assert [u["frames"] for u in uploader[0].uploads] == [
+        list(range(0, 6)),
+        list(range(6, 12)),
+        list(range(12, 15)),
+    ]
+
+
+def test_failed_upload_keeps_backlog_queued(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        backend_sender, "BackfillUploader", lambda *a, **kw: FakeUploader(fail=True)
+    )
+    queue = SegmentQueue(tmp_path)
+    fill(queue, range(0, 5), time.time() - 100)
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(backend_sender._upload_backlog(queue, "wearable", UplinkMetrics()))
+
+    queue.rewind()
+    assert read_indexes(queue) == [0, 1, 2, 3, 4]
+
+
+def test_live_queue_skips_the_backfill_api(tmp_path, uploader):
+    queue = SegmentQueue(tmp_path)
+    fill(queue, range(0, 2), time.time() - 0.5)
+
+    asyncio.run(backend_sender._upload_backlog(queue, "wearable", UplinkMetrics()))
+
+    assert uploader == []
+    assert read_indexes(queue) == [0, 1]
@@ -0,0 +1,171 @@
+"""
+Unit tests for the disk-backed uplink queue.
+
+Runs against a temporary directory, no device or backend needed.
+
+Run:
+  uv run pytest extras/local-wearable-client/tests/test_uplink_queue.py -v
+"""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from uplink_queue import CURSOR_FILE, RECORD_HEADER, SegmentQueue
+
+PACKET_BYTES = 100
+RECORD_BYTES = RECORD_HEADER.size + PACKET_BYTES
+
+
+def packet(index: int) -> bytes:
+    return bytes([index]) * PACKET_BYTES
+
+
+def fill(queue: SegmentQueue, count: int, start: int = 0, spacing: float = 1.0):
+    for i in range(start, start + count):
+        queue.append(packet(i), captured_at=1000.0 + i * spacing)
+
+
+def indexes(packets: list[tuple[float, bytes]]) -> list[int]:
+    return [payload[0] for _, payload in packets]
+
+
+def segments(directory: Path) -> list[str]:
+    return sorted(path.name for path in directory.glob("*.seg"))
+
+
+def test_read_commit_and_rewind(tmp_path):
+    queue = SegmentQueue(tmp_path)
+    fill(queue, 5)
+
+    batch = queue.read(3)
+    assert indexes(batch) == [0, 1, 2]
+    assert [captured_at for captured_at, _ in batch] == [1000.0, 1001.0, 1002.0]
+
+    # An unsent batch is read again after a rewind
+    queue.rewind()
+    assert indexes(queue.read(3)) == [0, 1, 2]
+    queue.commit()
+    assert queue.pending_bytes == 2 * RECORD_BYTES
+    assert queue.oldest_capture_time() == 1003.0
+
+    queue.rewind()
+    assert indexes(queue.read(10)) == [3, 4]
+    assert queue.read(10) == []
+    queue.commit()
+    assert queue.pending_bytes == 0
+    assert queue.oldest_capture_time() is None
+
+
+def test_read_before_leaves_later_packets_unread(tmp_path):
+    queue = SegmentQueue(tmp_path, segment_seconds=2.0)
+    fill(queue, 5)
+
+    assert indexes(queue.read(10, before=1003.0)) == [0, 1, 2]
+    assert queue.read(10, before=1003.0) == []
+    queue.commit()
+    assert queue.oldest_capture_time() == 1003.0
+    assert indexes(queue.read(10)) == [3, 4]
+
+
+def test_reads_across_segments_and_removes_sent_ones(tmp_path):
+    queue = SegmentQueue(tmp_path, segment_seconds=2.0)
+    fill(queue, 5)
+    assert len(segments(tmp_path)) == 3
+
+    assert indexes(queue.read(3)) == [0, 1, 2]
+    queue.commit()
+    assert segments(tmp_path) == ["000000000002.seg", "000000000003.seg"]
+
+    # Packets appended after a read are picked up by the next one
+    fill(queue, 2, start=5)
+    assert indexes(queue.read(10)) == [3, 4, 5, 6]
+    queue.commit()
+    assert segments(tmp_path) == ["000000000004.seg"]
+
+
+def test_restart_resumes_at_committed_cursor(tmp_path):
+    queue = SegmentQueue(tmp_path, segment_seconds=2.0)
+    fill(queue, 5)
+    queue.read(3)
+    queue.commit()
+    queue.read(1)  # In flight when the client stopped
+    queue.close()
+
+    reopened = SegmentQueue(tmp_path, segment_seconds=2.0)
+    assert reopened.pending_bytes == 2 * RECORD_BYTES
+    assert indexes(reopened.read(10)) == [3, 4]
+
+    # New audio goes to a new segment after the existing ones
+    fill(reopened, 1, start=5)
+    assert indexes(reopened.read(10)) == [5]
+    assert segments(tmp_path)[-1] == "000000000004.seg"
+
+
+def test_enforce_limit_drops_oldest_and_moves_cursor(tmp_path):
+    queue = SegmentQueue(tmp_path, max_bytes=3 * RECORD_BYTES, segment_seconds=1.0)
+    fill(queue, 3)
+    assert indexes(queue.read(1)) == [0]  # Read but not committed
+
+    fill(queue, 2, start=3)
+
+    assert queue.dropped_packets == 2
+    assert segments(tmp_path) == [f"{seq:012d}.seg" for seq in (3, 4, 5)]
+    assert queue.pending_bytes == 3 * RECORD_BYTES
+    assert queue.oldest_capture_time() == 1002.0
+    # Both the read position and the cursor moved past the dropped segments
+    assert indexes(queue.read(10)) == [2, 3, 4]
+    queue.rewind()
+    assert indexes(queue.read(10)) == [2, 3, 4]
+
+
+def test_enforce_limit_counts_only_unsent_packets(tmp_path):
+    queue = SegmentQueue(tmp_path, max_bytes=4 * RECORD_BYTES, segment_seconds=10.0)
+    fill(queue, 3)
+    queue.read(2)
+    queue.commit()
+
+    # A second segment pushes the first, partly sent one out
+    fill(queue, 2, start=10, spacing=10.0)
+
+    assert queue.dropped_packets == 1
+    assert indexes(queue.read(10)) == [10, 11]
+
+
+def test_load_cursor_skips_removed_segment(tmp_path):
+    queue = SegmentQueue(tmp_path, segment_seconds=1.0)
+    fill(queue, 3)
+    queue.close()
+    with open(tmp_path / CURSOR_FILE, "w") as f:
+        json.dump({"segment": 2, "offset": RECORD_BYTES}, f)
+
+    (tmp_path / "000000000002.seg").unlink()
+
+    assert indexes(SegmentQueue(tmp_path).read(10)) == [2]
+
+
+def test_load_cursor_falls_back_to_first_segment(tmp_path):
+    queue = SegmentQueue(tmp_path, segment_seconds=1.0)
+    fill(queue, 3)
+    queue.close()
+
+    # Cursor past every segment on disk
+    with open(tmp_path / CURSOR_FILE, "w") as f:
+        json.dump({"segment": 9, "offset": 0}, f)
+    assert indexes(SegmentQueue(tmp_path).read(10)) == [0, 1, 2]
+
+    # Unreadable cursor
+    (tmp_path / CURSOR_FILE).write_text("{")
+    assert indexes(SegmentQueue(tmp_path).read(10)) == [0, 1, 2]
+
+
+def test_torn_record_is_not_returned(tmp_path):
+    queue = SegmentQueue(tmp_path)
+    fill(queue, 2)
+    queue.close()
+    with open(tmp_path / "000000000001.seg", "ab") as f:
+        f.write(RECORD_HEADER.pack(1002.0, PACKET_BYTES) + b"\x00" * 10)
+
+    assert indexes(SegmentQueue(tmp_path).read(10)) == [0, 1]
@@ -0,0 +1,350 @@
+"""Disk-backed store-and-forward queue between BLE capture and the backend uplink.
+
+Opus packets are appended to segment files as they arrive from the device,
+tagged with their capture time. The uplink reads from a cursor and only
+commits it once a batch has been sent, so audio captured while the backend is
+unreachable (restart, network blip, auth failure) stays on disk and is sent
+once the connection returns. Delivery is at-least-once: a batch that was in
+flight when the connection dropped is sent again.
+
+Queue directory layout::
+
+    000000000001.seg   records: capture time (f64), length (u32), Opus payload
+    000000000002.seg
+    cursor.json        {"segment": 1, "offset": 4096} — first unsent record
+"""
+
+import asyncio
+import json
+import logging
+import os
+import struct
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+logger = logging.getLogger(__name__)
+
+RECORD_HEADER = struct.Struct("!dI")
+SEGMENT_SUFFIX = ".seg"
+CURSOR_FILE = "cursor.json"
+
+# Flush/persist at most this often; a crash re-sends or loses at most this much
+FLUSH_INTERVAL_SECONDS = 1.0
+
+
+class SegmentQueue:
+    """Bounded on-disk FIFO of timestamped Opus packets.
+
+    Single-threaded: append, read and commit must all be called from the
+    same event loop.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike,
+        max_bytes: int = 512 * 1024 * 1024,
+        segment_seconds: float = 60.0,
+    ) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.segment_seconds = segment_seconds
+
+        self.dropped_packets = 0
+        self.newest_capture_time: Optional[float] = None
+
+        self._sizes: dict[int, int] = {
+            int(path.stem): path.stat().st_size
+            for path in self.directory.glob(f"*{SEGMENT_SUFFIX}")
+            if path.stem.isdigit()
+        }
+        self._writer: Optional[BinaryIO] = None
+        self._writer_seq: Optional[int] = None
+        self._writer_started = 0.0
+        self._last_flush = 0.0
+        self._reader: Optional[BinaryIO] = None
+        self._reader_seq: Optional[int] = None
+        self._cursor_saved_at = 0.0
+        self._data_event = asyncio.Event()
+
+        self._cursor = self._load_cursor()
+        self._read_pos = self._cursor
+        if self._sizes:
+            logger.info(
+                "Uplink queue %s: %d segment(s), %.1f MB pending",
+                self.directory,
+                len(self._sizes),
+                self.pending_bytes / 1e6,
+            )
+
+    # --- Writing ------------------------------------------------------------
+
+    def append(self, packet: bytes, captured_at: Optional[float] = None) -> None:
+        """Queue one Opus packet captured at ``captured_at`` (epoch seconds)."""
+        if captured_at is None:
+            captured_at = time.time()
+        if (
+            self._writer is None
+            or captured_at - self._writer_started >= self.segment_seconds
+        ):
+            self._rotate(captured_at)
+
+        record = RECORD_HEADER.pack(captured_at, len(packet)) + packet
+        self._writer.write(record)
+        self._sizes[self._writer_seq] += len(record)
+        self.newest_capture_time = captured_at
+
+        if captured_at - self._last_flush >= FLUSH_INTERVAL_SECONDS:
+            self._writer.flush()
+            self._last_flush = captured_at
+        self._enforce_limit()
+        self._data_event.set()
+
+    def _rotate(self, captured_at: float) -> None:
+        if self._writer is not None:
+            self._writer.close()
+        seq = max(self._sizes, default=0) + 1
+        self._writer = open(self._segment_path(seq), "ab")
+        self._writer_seq = seq
+        self._writer_started = captured_at
+        self._sizes[seq] = 0
+        if self._read_pos[0] is None:
+            self._read_pos = self._cursor = (seq, 0)
+
+    def _enforce_limit(self) -> None:
+        """Drop the oldest segments while the queue is over its size bound."""
+        while sum(self._sizes.values()) > self.max_bytes and len(self._sizes) > 1:
+            oldest = min(self._sizes)
+            start = self._cursor[1] if self._cursor[0] == oldest else 0
+            dropped = (
+                self._count_records(oldest, start) if self._cursor[0] <= oldest else 0
+            )
+            self.dropped_packets += dropped
+            logger.warning(
+                "Uplink queue over %.0f MB, dropping oldest segment (%d packets)",
+                self.max_bytes / 1e6,
+                dropped,
+            )
+            self._remove_segment(oldest)
+            following = min(self._sizes)
+            if self._cursor[0] == oldest:
+                self._cursor = (following, 0)
+            if self._read_pos[0] == oldest:
+                self._read_pos = (following, 0)
+
+    # --- Reading ------------------------------------------------------------
+
+    def read(
+        self, max_packets: int, before: Optional[float] = None
+    ) -> list[tuple[float, bytes]]:
+        """Return up to ``max_packets`` ``(captured_at, packet)`` pairs after
+        the read position, advancing it. Call :meth:`commit` once they are sent,
+        or :meth:`rewind` to read them again.
+
+        With ``before``, reading stops at the first packet captured at or after
+        that time, which stays unread.
+        """
+        packets: list[tuple[float, bytes]] = []
+        seq, offset = self._read_pos
+        reached = False
+        while seq is not None and len(packets) < max_packets and not reached:
+            if seq == self._writer_seq:
+                self._writer.flush()
+            reader = self._open_reader(seq)
+            reader.seek(offset)
+            while len(packets) < max_packets:
+                header = reader.read(RECORD_HEADER.size)
+                if len(header) < RECORD_HEADER.size:
+                    break
+                captured_at, length = RECORD_HEADER.unpack(header)
+                if before is not None and captured_at >= before:
+                    reached = True
+                    break
+                payload = reader.read(length)
+                if len(payload) < length:
+                    break  # torn record left by a crash mid-write
+                packets.append((captured_at, payload))
+                offset += RECORD_HEADER.size + length
+            else:
+                break  # batch is full
+            if reached:
+                break
+
+            # End of this segment: move on if a newer one exists
+            following = self._next_segment(seq)
+            if following is None:
+                break
+            seq, offset = following, 0
+
+        self._read_pos = (seq, offset)
+        return packets
+
+    def commit(self) -> None:
+        """Mark everything read so far as sent."""
+        self._cursor = self._read_pos
+        seq = self._cursor[0]
+        for old in [s for s in self._sizes if seq is not None and s < seq]:
+            self._remove_segment(old)
+        if time.monotonic() - self._cursor_saved_at >= FLUSH_INTERVAL_SECONDS:
+            self._save_cursor()
+
+    def rewind(self) -> None:
+        """Forget uncommitted reads so they are returned again."""
+        self._read_pos = self._cursor
+
+    async def wait_for_data(self, timeout: float) -> None:
+        """Wait until a packet is appended (call after :meth:`read` came back empty)."""
+        self._data_event.clear()
+        try:
+            await asyncio.wait_for(self._data_event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    def oldest_capture_time(self) -> Optional[float]:
+        """Capture time of the first unsent packet, or None when nothing is pending."""
+        read_pos = self._read_pos
+        self._read_pos = self._cursor
+        try:
+            packets = self.read(1)
+        finally:
+            self._read_pos = read_pos
+        return packets[0][0] if packets else None
+
+    @property
+    def pending_bytes(self) -> int:
+        """Bytes on disk not yet committed as sent."""
+        seq, offset = self._cursor
+        if seq is None:
+            return 0
+        return sum(size for s, size in self._sizes.items() if s >= seq) - offset
+
+    def close(self) -> None:
+        """Flush buffered packets and persist the cursor."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            self._writer_seq = None
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+            self._reader_seq = None
+        self._save_cursor()
+
+    # --- Internals ----------------------------------------------------------
+
+    def _segment_path(self, seq: int) -> Path:
+        return self.directory / f"{seq:012d}{SEGMENT_SUFFIX}"
+
+    def _next_segment(self, seq: int) -> Optional[int]:
+        return min((s for s in self._sizes if s > seq), default=None)
+
+    def _open_reader(self, seq: int) -> BinaryIO:
+        if self._reader_seq != seq:
+            if self._reader is not None:
+                self._reader.close()
+            self._reader = open(self._segment_path(seq), "rb")
+            self._reader_seq = seq
+        return self._reader
+
+    def _remove_segment(self, seq: int) -> None:
+        if seq == self._reader_seq:
+            self._reader.close()
+            self._reader = None
+            self._reader_seq = None
+        self._sizes.pop(seq, None)
+        try:
+            self._segment_path(seq).unlink()
+        except FileNotFoundError:
+            pass
+
+    def _count_records(self, seq: int, offset: int) -> int:
+        count = 0
+        with open(self._segment_path(seq), "rb") as f:
+            f.seek(offset)
+            while header := f.read(RECORD_HEADER.size):
+                if len(header) < RECORD_HEADER.size:
+                    break
+                _, length = RECORD_HEADER.unpack(header)
+                f.seek(length, os.SEEK_CUR)
+                count += 1
+        return count
+
+    def _load_cursor(self) -> tuple[Optional[int], int]:
+        first = min(self._sizes, default=None)
+        try:
+            with open(self.directory / CURSOR_FILE) as f:
+                saved = json.load(f)
+            seq, offset = int(saved["segment"]), int(saved["offset"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return (first, 0)
+        if seq not in self._sizes:
+            # Segment was consumed or dropped; resume at the next one on disk
+            following = self._next_segment(seq)
+            return (following, 0) if following is not None else (first, 0)
+        return (seq, offset)
+
+    def _save_cursor(self) -> None:
+        seq, offset = self._cursor
+        if seq is None:
+            return
+        tmp_path = self.directory / f"{CURSOR_FILE}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"segment": seq, "offset": offset}, f)
+        os.replace(tmp_path, self.directory / CURSOR_FILE)
+        self._cursor_saved_at = time.monotonic()
+
+
+@dataclass
+class UplinkMetrics:
+    """Uplink health, refreshed periodically while the uplink runs."""
+
+    connected: bool = False
+    packets_sent: int = 0
+    # Capture time of the newest packet the backend has received
+    last_sent_capture_time: Optional[float] = None
+    # Wall-clock delay between capture and delivery of that packet
+    lag_seconds: float = 0.0
+    # Audio captured but not yet sent
+    backlog_seconds: float = 0.0
+    queue_bytes: int = 0
+    # Seconds of audio delivered per wall-clock second (1.0 = keeping up live)
+    drain_rate: float = 0.0
+    dropped_packets: int = 0
+
+    _rate_mark: Optional[tuple[float, float]] = (
+        None  # (monotonic, last_sent_capture_time)
+    )
+
+    def record_sent(self, packets: list[tuple[float, bytes]], sent_at: float) -> None:
+        self.packets_sent += len(packets)
+        self.last_sent_capture_time = packets[-1][0]
+        self.lag_seconds = max(0.0, sent_at - self.last_sent_capture_time)
+
+    def refresh(self, queue: SegmentQueue) -> None:
+        """Recompute the queue-derived figures."""
+        self.queue_bytes = queue.pending_bytes
+        self.dropped_packets = queue.dropped_packets
+        oldest = queue.oldest_capture_time()
+        if oldest is None or queue.newest_capture_time is None:
+            self.backlog_seconds = 0.0
+        else:
+            self.backlog_seconds = max(0.0, queue.newest_capture_time - oldest)
+
+        now = time.monotonic()
+        sent = self.last_sent_capture_time
+        if (
+            self._rate_mark is not None
+            and sent is not None
+            and self._rate_mark[1] is not None
+        ):
+            elapsed = now - self._rate_mark[0]
+            if elapsed > 0:
+                self.drain_rate = (sent - self._rate_mark[1]) / elapsed
+        self._rate_mark = (now, sent)
+
+    def as_dict(self) -> dict:
+        data = asdict(self)
+        data.pop("_rate_mark")
+        return data
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""Benchmark chunked diarization of long files.
+
+Builds a synthetic multi-speaker recording (default one hour) with known turns
+and diarizes it with:
+
+- the legacy path: windows processed one after another, each round-tripped
+  through a temp WAV, window-local ``SPEAKER_xx`` labels merged as-is
+- ``AudioBackend.async_diarize``: windows from the in-memory waveform on the
+  worker pool, labels linked across windows by centroid clustering
+
+For each it reports wall time, the number of distinct speaker labels and the
+fraction of speech time attributed to the right speaker (each predicted label
+mapped to the true speaker it overlaps most).
+
+Speakers are synthesized from per-speaker pitch and formants unless real
+samples are given with ``--speaker-audio`` (one clean file per speaker; turns
+are cut from them at random). Needs the PyAnnote models (HF_TOKEN).
+
+Usage:
+    uv run python scripts/benchmark_chunked_diarization.py --minutes 60 --workers 1 2 4
+    uv run python scripts/benchmark_chunked_diarization.py --speaker-audio alice.wav bob.wav carol.wav
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+import soundfile as sf
+import torch
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from simple_speaker_recognition.core.audio_backend import AudioBackend  # noqa: E402
+
+SAMPLE_RATE = 16000
+
+Turn = Tuple[float, float, int]  # (start, end, true speaker)
+
+
+def synthetic_voice(
+    seconds: float, speaker: int, rng: np.random.Generator
+) -> np.ndarray:
+    """Glottal-like pulse train with speaker-specific pitch, shaped by two formants."""
+    n = int(seconds * SAMPLE_RATE)
+    f0 = 95 + 55 * speaker + rng.uniform(-5, 5)
+    t = np.arange(n) / SAMPLE_RATE
+    pitch = f0 * (1 + 0.08 * np.sin(2 * np.pi * rng.uniform(0.5, 2.0) * t))
+    phase = 2 * np.pi * np.cumsum(pitch) / SAMPLE_RATE
+    source = sum(np.sin(k * phase) / k for k in range(1, 25))
+    spectrum = np.fft.rfft(source)
+    freqs = np.fft.rfftfreq(n, 1 / SAMPLE_RATE)
+    envelope = np.zeros_like(freqs)
+    for formant in (500 + 90 * speaker, 1500 + 160 * speaker):
+        envelope += np.exp(-(((freqs - formant) / 150) ** 2))
+    voice = np.fft.irfft(spectrum * (0.05 + envelope), n)
+    # Syllable-rate amplitude modulation
+    voice *= 0.6 + 0.4 * np.abs(np.sin(2 * np.pi * rng.uniform(3, 5) * t))
+    return 0.3 * voice / (np.abs(voice).max() + 1e-9)
+
+
+def build_recording(
+    minutes: float, speakers: int, samples: List[np.ndarray], rng: np.random.Generator
+) -> Tuple[np.ndarray, List[Turn]]:
+    parts, turns, t = [], [], 0.0
+    previous = -1
+    while t < minutes * 60:
+        speaker = int(rng.choice([s for s in range(speakers) if s != previous]))
+        previous = speaker
+        seconds = float(rng.uniform(2.0, 12.0))
+        if samples:
+            source = samples[speaker]
+            offset = rng.integers(0, max(1, len(source) - int(seconds * SAMPLE_RATE)))
+            voice = source[offset : offset + int(seconds * SAMPLE_RATE)]
+            seconds = len(voice) / SAMPLE_RATE
+        else:
+            voice = synthetic_voice(seconds, speaker, rng)
+        pause = float(rng.uniform(0.3, 1.5))
+        parts.extend([voice, np.zeros(int(pause * SAMPLE_RATE))])
+        turns.append((t, t + seconds, speaker))
+        t += seconds + pause
+    audio = np.concatenate(parts).astype(np.float32)
+    audio += 0.003 * rng.standard_normal(len(audio)).astype(np.float32)
+    return audio, turns
+
+
+def score(segments: List[Dict], turns: List[Turn]) -> Tuple[int, float]:
+    """(number of labels, fraction of speech time attributed to the right speaker)."""
+    overlap: Dict[Tuple[str, int], float] = {}
+    for seg in segments:
+        for start, end, speaker in turns:
+            shared = min(seg["end"], end) - max(seg["start"], start)
+            if shared > 0:
+                key = (seg["speaker"], speaker)
+                overlap[key] = overlap.get(key, 0.0) + shared
+    best: Dict[str, float] = {}
+    for (label, _), seconds in overlap.items():
+        best[label] = max(best.get(label, 0.0), seconds)
+    speech = sum(end - start for start, end, _ in turns)
+    labels = {seg["speaker"] for seg in segments}
+    return len(labels), sum(best.values()) / speech
+
+
+def legacy_diarize(
+    backend: AudioBackend, path: Path, max_duration: float, chunk_overlap: float
+) -> List[Dict]:
+    """The pre-parallel implementation: sequential temp-WAV windows, local labels."""
+    file_duration = float(backend.loader.get_duration(str(path)))
+    all_segments, current_start = [], 0.0
+    while current_start < file_duration:
+        chunk_duration = min(max_duration, file_duration - current_start)
+        fetch_duration = (
+            chunk_duration + chunk_overlap
+            if current_start + chunk_duration < file_duration
+            else chunk_duration
+        )
+        chunk_audio = backend.load_wave(
+            path, start=current_start, end=current_start + fetch_duration
+        )
+        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
+            sf.write(tmp.name, chunk_audio.squeeze().cpu().numpy(), SAMPLE_RATE)
+            chunk_path = Path(tmp.name)
+        try:
+            for seg in backend.diarize(chunk_path):
+                seg["start"] += current_start
+                seg["end"] += current_start
+                if seg["start"] < current_start + chunk_duration:
+                    all_segments.append(seg)
+        finally:
+            chunk_path.unlink(missing_ok=True)
+        current_start += chunk_duration
+    return backend._merge_segments(all_segments, max_gap=2.0)
+
+
+def report(
+    name: str,
+    seconds: float,
+    segments: List[Dict],
+    turns: List[Turn],
+    audio_seconds: float,
+) -> None:
+    labels, accuracy = score(segments, turns)
+    print(
+        f"  {name:<22} {seconds:8.1f} s  ({audio_seconds / seconds:6.1f}x realtime)  "
+        f"{labels:3d} labels  {accuracy * 100:5.1f}% speaker accuracy"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--minutes", type=float, default=60.0, help="Recording length")
+    parser.add_argument("--speakers", type=int, default=3, help="Synthetic speakers")
+    parser.add_argument(
+        "--speaker-audio", nargs="*", default=[], help="One clean sample per speaker"
+    )
+    parser.add_argument(
+        "--workers", type=int, nargs="+", default=[1, 2, 4], help="Worker pool sizes"
+    )
+    parser.add_argument(
+        "--max-duration", type=float, default=60.0, help="Window length (s)"
+    )
+    parser.add_argument(
+        "--chunk-overlap", type=float, default=5.0, help="Window overlap (s)"
+    )
+    parser.add_argument(
+        "--skip-legacy", action="store_true", help="Only run the parallel path"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    hf_token = os.getenv("HF_TOKEN")
+    if not hf_token:
+        parser.error("HF_TOKEN is required to load the PyAnnote models")
+
+    rng = np.random.default_rng(args.seed)
+    samples = []
+    for sample_path in args.speaker_audio:
+        audio, sr = sf.read(sample_path, dtype="float32", always_2d=True)
+        if sr != SAMPLE_RATE:
+            parser.error(f"{sample_path}: expected {SAMPLE_RATE} Hz audio, got {sr}")
+        samples.append(audio.mean(axis=1))
+    speakers = len(samples) or args.speakers
+
+    audio, turns = build_recording(args.minutes, speakers, samples, rng)
+    audio_seconds = len(audio) / SAMPLE_RATE
+    device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "recording.wav"
+        sf.write(path, audio, SAMPLE_RATE)
+        print(
+            f"{audio_seconds / 60:.1f} min, {speakers} speakers, {len(turns)} turns, "
+            f"{args.max_duration:.0f}s windows, device={device}"
+        )
+
+        for workers in args.workers:
+            # Each worker needs its own pipeline, so load a backend per pool size
+            backend = AudioBackend(hf_token, device, diarize_workers=workers)
+            start = time.perf_counter()
+            segments = await backend.async_diarize(
+                path, max_duration=args.max_duration, chunk_overlap=args.chunk_overlap
+            )
+            report(
+                f"parallel ({workers} workers)",
+                time.perf_counter() - start,
+                segments,
+                turns,
+                audio_seconds,
+            )
+
+        if not args.skip_legacy:
+            start = time.perf_counter()
+            segments = legacy_diarize(
+                backend, path, args.max_duration, args.chunk_overlap
+            )
+            report(
+                "legacy sequential",
+                time.perf_counter() - start,
+                segments,
+                turns,
+                audio_seconds,
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
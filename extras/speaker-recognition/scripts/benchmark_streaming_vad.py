@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""Benchmark per-stream CPU cost of the streaming VAD path.
+
+Simulates N concurrent websocket streams inside one event loop, each pushing
+16 kHz int16 PCM frames through the same buffer + VAD code the
+``/ws/streaming-with-scd`` and ``/v1/ws_listen`` endpoints use. The legacy
+path (deque of Python scalars, 5 s lookback re-scanned every frame) is
+reproduced here for comparison.
+
+Usage:
+    uv run python scripts/benchmark_streaming_vad.py --streams 50 --seconds 60
+    uv run python scripts/benchmark_streaming_vad.py --streams 50 --seconds 30 --realtime
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from collections import deque
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from simple_speaker_recognition.utils.streaming_vad import (  # noqa: E402
+    AudioRingBuffer,
+    IncrementalEnergyVAD,
+    UtteranceTracker,
+)
+
+SAMPLE_RATE = 16000
+
+
+def synthetic_speech(seconds: float, seed: int) -> np.ndarray:
+    """Alternate bursts of noisy tone with silences of random length."""
+    rng = np.random.default_rng(seed)
+    parts = []
+    total = 0
+    while total < seconds * SAMPLE_RATE:
+        speech = int(rng.uniform(0.5, 4.0) * SAMPLE_RATE)
+        silence = int(rng.uniform(0.2, 2.5) * SAMPLE_RATE)
+        t = np.arange(speech) / SAMPLE_RATE
+        burst = 0.3 * np.sin(
+            2 * np.pi * rng.uniform(120, 300) * t
+        ) + 0.05 * rng.standard_normal(speech)
+        parts.extend([burst, np.zeros(silence)])
+        total += speech + silence
+    audio = np.concatenate(parts)[: int(seconds * SAMPLE_RATE)]
+    return (audio * 32767).astype(np.int16)
+
+
+class LegacyPipeline:
+    """The pre-ring-buffer implementation: deque buffer and lookback VAD."""
+
+    def __init__(self):
+        self.buffer = deque(maxlen=20 * SAMPLE_RATE)
+
+    def process(self, frame: np.ndarray):
+        self.buffer.extend(frame.astype(np.float32) / 32768.0)
+        duration = len(self.buffer) / SAMPLE_RATE
+        lookback = min(5.0, duration)
+        if lookback < 0.5:
+            return
+        start = int((duration - lookback) * SAMPLE_RATE)
+        audio = np.array(list(self.buffer)[start:], dtype=np.float32)
+        frame_size, hop_size = 480, 160
+        is_speech = False
+        for i in range(0, len(audio) - frame_size, hop_size):
+            energy = np.mean(audio[i : i + frame_size] ** 2)
+            is_speech = energy > 0.001
+
+
+class IncrementalPipeline:
+    """Ring buffer + incremental energy VAD + utterance tracker."""
+
+    def __init__(self):
+        self.buffer = AudioRingBuffer(
+            max_duration_seconds=20.0, sample_rate=SAMPLE_RATE
+        )
+        self.vad = IncrementalEnergyVAD(sample_rate=SAMPLE_RATE)
+        self.tracker = UtteranceTracker()
+        self.utterances = 0
+
+    def process(self, frame: np.ndarray):
+        self.buffer.add_audio(frame)
+        closed, ongoing, processed_until = self.vad.update(self.buffer)
+        self.utterances += len(self.tracker.update(closed, ongoing, processed_until))
+
+
+async def run_stream(
+    pipeline, audio: np.ndarray, frame_samples: int, realtime: bool, lags: list
+):
+    frame_seconds = frame_samples / SAMPLE_RATE
+    loop = asyncio.get_running_loop()
+    next_deadline = loop.time()
+    for offset in range(0, len(audio), frame_samples):
+        # Bytes as received from the socket, then decoded as in the endpoints
+        data = audio[offset : offset + frame_samples].tobytes()
+        pipeline.process(np.frombuffer(data, dtype=np.int16))
+        if realtime:
+            next_deadline += frame_seconds
+            delay = next_deadline - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            else:
+                lags.append(-delay)
+        else:
+            await asyncio.sleep(0)
+
+
+async def bench(
+    name: str, factory, streams: int, seconds: float, frame_ms: int, realtime: bool
+):
+    frame_samples = SAMPLE_RATE * frame_ms // 1000
+    audios = [synthetic_speech(seconds, seed=i) for i in range(streams)]
+    pipelines = [factory() for _ in range(streams)]
+    lags: list = []
+
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    await asyncio.gather(
+        *(
+            run_stream(p, a, frame_samples, realtime, lags)
+            for p, a in zip(pipelines, audios)
+        )
+    )
+    cpu, wall = time.process_time() - cpu_start, time.perf_counter() - wall_start
+
+    audio_seconds = streams * seconds
+    print(f"\n{name}")
+    print(f"  streams:                 {streams}")
+    print(f"  audio per stream:        {seconds:.0f}s ({frame_ms} ms frames)")
+    print(f"  wall time:               {wall:.2f}s")
+    print(f"  CPU time:                {cpu:.2f}s")
+    print(f"  CPU per stream:          {cpu / streams * 1000:.1f} ms")
+    print(f"  CPU per audio second:    {cpu / audio_seconds * 1000:.3f} ms")
+    print(f"  real-time factor (all):  {cpu / seconds:.3f} cores")
+    if realtime:
+        worst = max(lags) * 1000 if lags else 0.0
+        print(f"  late frames:             {len(lags)} (worst {worst:.1f} ms behind)")
+    if isinstance(pipelines[0], IncrementalPipeline):
+        print(f"  utterances detected:     {sum(p.utterances for p in pipelines)}")
+    return cpu
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--streams", type=int, default=50, help="Concurrent simulated sockets"
+    )
+    parser.add_argument(
+        "--seconds", type=float, default=60.0, help="Audio duration per stream"
+    )
+    parser.add_argument(
+        "--frame-ms", type=int, default=100, help="Client frame size in ms"
+    )
+    parser.add_argument(
+        "--realtime", action="store_true", help="Pace frames at real-time rate"
+    )
+    parser.add_argument(
+        "--skip-legacy", action="store_true", help="Only run the incremental pipeline"
+    )
+    args = parser.parse_args()
+
+    new_cpu = asyncio.run(
+        bench(
+            "Ring buffer + incremental VAD",
+            IncrementalPipeline,
+            args.streams,
+            args.seconds,
+            args.frame_ms,
+            args.realtime,
+        )
+    )
+    if not args.skip_legacy:
+        old_cpu = asyncio.run(
+            bench(
+                "Legacy deque + lookback VAD",
+                LegacyPipeline,
+                args.streams,
+                args.seconds,
+                args.frame_ms,
+                args.realtime,
+            )
+        )
+        print(f"\nSpeedup: {old_cpu / max(new_cpu, 1e-9):.1f}x less CPU per stream")
+
+
+if __name__ == "__main__":
+    main()
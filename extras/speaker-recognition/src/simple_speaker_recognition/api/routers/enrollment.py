@@ -383,11 +383,10 @@ async def enroll_append(
         if not existing_speaker:
             raise HTTPException(404, f"Speaker {speaker_id} not found for user {user_id}")
         
-        if not existing_speaker.embedding_data:
-            raise HTTPException(400, f"Speaker {speaker_id} has no existing embedding")
-        
         # Get existing embedding and counts
-        existing_embedding = np.array(json.loads(existing_speaker.embedding_data), dtype=np.float32)
+        existing_embedding = existing_speaker.get_embedding()
+        if existing_embedding is None:
+            raise HTTPException(400, f"Speaker {speaker_id} has no existing embedding")
         existing_count = existing_speaker.audio_sample_count or 1
         existing_duration = existing_speaker.total_audio_duration or 0.0
         
@@ -1156,19 +1156,17 @@ async def analyze_segments_with_enrolled_speakers(
                 )
 
                 for speaker in enrolled_speakers:
-                    if speaker.embedding_data:
-                        try:
-                            embedding = np.array(
-                                json.loads(speaker.embedding_data), dtype=np.float32
-                            )
-                            enrolled_embeddings_dict[
-                                f"enrolled_{speaker.id}_{speaker.name}"
-                            ] = embedding
-                        except (json.JSONDecodeError, ValueError) as e:
-                            log.warning(
-                                f"Invalid embedding data for speaker {speaker.id}: {e}"
-                            )
-                            continue
+                    try:
+                        embedding = speaker.get_embedding()
+                    except (json.JSONDecodeError, ValueError) as e:
+                        log.warning(
+                            f"Invalid embedding data for speaker {speaker.id}: {e}"
+                        )
+                        continue
+                    if embedding is not None:
+                        enrolled_embeddings_dict[
+                            f"enrolled_{speaker.id}_{speaker.name}"
+                        ] = embedding
             finally:
                 db_session.close()
 
@@ -113,14 +113,14 @@ async def get_speakers_analysis(
         embeddings_dict = {}
         speaker_id_to_name = {}
         for speaker in query_speakers:
-            if speaker.embedding_data:
-                try:
-                    embedding = np.array(json.loads(speaker.embedding_data), dtype=np.float32)
-                    embeddings_dict[speaker.id] = embedding
-                    speaker_id_to_name[speaker.id] = speaker.name
-                except (json.JSONDecodeError, ValueError) as e:
-                    log.warning(f"Invalid embedding data for speaker {speaker.id}: {e}")
-                    continue
+            try:
+                embedding = speaker.get_embedding()
+            except (json.JSONDecodeError, ValueError) as e:
+                log.warning(f"Invalid embedding data for speaker {speaker.id}: {e}")
+                continue
+            if embedding is not None:
+                embeddings_dict[speaker.id] = embedding
+                speaker_id_to_name[speaker.id] = speaker.name
         
         if not embeddings_dict:
             return {
@@ -357,14 +357,11 @@ async def export_speakers(
             }
             
             # Include embedding data if available
-            if speaker.embedding_data:
-                try:
-                    embedding = json.loads(speaker.embedding_data)
-                    speaker_data["embedding_data"] = embedding
-                except json.JSONDecodeError:
-                    log.warning(f"Invalid embedding data for speaker {speaker.id}")
-                    speaker_data["embedding_data"] = None
-            else:
+            try:
+                embedding = speaker.get_embedding()
+                speaker_data["embedding_data"] = embedding.tolist() if embedding is not None else None
+            except (json.JSONDecodeError, ValueError):
+                log.warning(f"Invalid embedding data for speaker {speaker.id}")
                 speaker_data["embedding_data"] = None
             
             export_data["speakers"].append(speaker_data)
@@ -445,7 +442,7 @@ async def import_speakers(
                 
                 # Set embedding data if available
                 if speaker_data.get("embedding_data"):
-                    speaker.embedding_data = json.dumps(speaker_data["embedding_data"])
+                    speaker.set_embedding(speaker_data["embedding_data"])
                 
                 db_session.add(speaker)
                 imported_count += 1
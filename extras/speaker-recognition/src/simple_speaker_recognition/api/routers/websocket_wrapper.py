@@ -30,6 +30,11 @@ from simple_speaker_recognition.api.core.utils import (
 )
 from simple_speaker_recognition.core.models import SpeakerStatus
 from simple_speaker_recognition.core.unified_speaker_db import UnifiedSpeakerDB
+from simple_speaker_recognition.utils.streaming_vad import (
+    AudioRingBuffer,
+    IncrementalEnergyVAD,
+    UtteranceTracker,
+)
 
 router = APIRouter()
 log = logging.getLogger("websocket_wrapper")
@@ -60,67 +65,71 @@ def get_auth():
     return service.auth
 
 
-class AudioSegmentBuffer:
-    """Manages a rolling buffer of audio segments for VAD processing."""
-    
-    def __init__(self, max_duration_seconds: float = 20.0, sample_rate: int = 16000):
-        self.max_duration = max_duration_seconds
-        self.sample_rate = sample_rate
-        self.max_samples = int(max_duration_seconds * sample_rate)
-        self.buffer = deque(maxlen=self.max_samples)
-        self.timestamp_offset = 0.0  # Track absolute time offset
-        
-    def add_audio(self, audio_data: np.ndarray):
-        """Add audio samples to the buffer."""
-        # Convert to float32 if needed
-        if audio_data.dtype == np.int16:
-            audio_data = audio_data.astype(np.float32) / 32768.0
-            
-        # Add to buffer
-        self.buffer.extend(audio_data)
-        
+class AudioSegmentBuffer(AudioRingBuffer):
+    """Rolling buffer of stream audio for VAD and speaker identification.
+
+    Backed by a preallocated NumPy ring, so windows are returned as views
+    instead of being rebuilt from Python scalars on every frame.
+    """
+
     def get_audio_tensor(self, start_time: float = 0.0, duration: float = None) -> torch.Tensor:
-        """Get audio as tensor for a specific time range."""
+        """Get audio as tensor for a time range relative to the oldest buffered sample."""
+        start_sample = self.oldest_sample + int(start_time * self.sample_rate)
         if duration is None:
-            # Get all buffered audio
-            audio_array = np.array(self.buffer, dtype=np.float32)
+            end_sample = self.total_samples
         else:
-            # Get specific segment
-            start_sample = int(start_time * self.sample_rate)
-            end_sample = int((start_time + duration) * self.sample_rate)
-            audio_array = np.array(list(self.buffer)[start_sample:end_sample], dtype=np.float32)
-            
-        # Convert to tensor with shape (1, num_samples) for pyannote
-        return torch.from_numpy(audio_array).unsqueeze(0)
-    
-    def get_duration(self) -> float:
-        """Get current buffer duration in seconds."""
-        return len(self.buffer) / self.sample_rate
-    
-    def clear(self):
-        """Clear the buffer."""
-        self.buffer.clear()
-        self.timestamp_offset = 0.0
+            end_sample = start_sample + int(duration * self.sample_rate)
+
+        # Convert to tensor with shape (1, num_samples) for pyannote (shares memory)
+        return torch.from_numpy(self.view(start_sample, end_sample)).unsqueeze(0)
+
+    def get_segment_tensor(self, start_time: float, end_time: float) -> torch.Tensor:
+        """Copy an absolute stream time range out of the ring for off-loop processing."""
+        return torch.from_numpy(self.view_seconds(start_time, end_time).copy()).unsqueeze(0)
 
 
 class SpeakerChangeDetector:
-    """Detects speaker changes using Pyannote VAD."""
-    
-    def __init__(self, hf_token: str = None, device: str = "cpu"):
+    """Detects utterance boundaries using Pyannote VAD, incrementally.
+
+    Only audio that arrived since the previous call is analysed. The energy
+    fallback evaluates each frame once; Pyannote is run at most every
+    ``vad_hop_seconds`` over the new audio plus a short context window.
+    """
+
+    def __init__(self, hf_token: str = None, device: str = "cpu",
+                 vad_hop_seconds: float = 0.5, vad_context_seconds: float = 0.5,
+                 max_lookback_seconds: float = 5.0):
         self.device = torch.device(device)
         self.hf_token = hf_token or os.getenv("HF_TOKEN")
-        
+        self.sample_rate = 16000
+
         # Initialize VAD pipeline
         self.vad_model = None
         self.vad_pipeline = None
         self.initialize_vad()
-        
-        # Track speech segments
-        self.last_speech_end = 0.0
+
+        # Incremental VAD state
+        self.vad_hop_seconds = vad_hop_seconds
+        self.vad_context_seconds = vad_context_seconds
+        self.max_lookback_seconds = max_lookback_seconds
+        self.energy_vad = IncrementalEnergyVAD(sample_rate=self.sample_rate)
+        self._final_until = 0.0  # Stream time before which VAD results are final
+        self._last_run_end = 0.0
+        self._open_speech_start: Optional[float] = None
+
+        # Track speech segments / utterances
         self.min_silence_duration = 1.5  # Minimum silence for utterance boundary
-        self.current_segment_start = None
-        self.current_segment_audio = []
-        
+        self.tracker = UtteranceTracker(min_silence_duration=self.min_silence_duration)
+        self._pending_boundaries: deque = deque()
+
+    @property
+    def current_segment_start(self) -> Optional[float]:
+        return self.tracker.current_segment_start
+
+    @property
+    def last_speech_end(self) -> float:
+        return self.tracker.last_speech_end
+
     def initialize_vad(self):
         """Initialize Pyannote VAD pipeline."""
         try:
@@ -223,56 +232,128 @@ class SpeakerChangeDetector:
         
         return segments
     
-    def detect_utterance_boundary(self, audio_buffer: AudioSegmentBuffer, current_time: float) -> Optional[Tuple[float, float]]:
-        """Detect if an utterance boundary has occurred."""
-        # Get recent audio (last 5 seconds)
-        lookback_duration = min(5.0, audio_buffer.get_duration())
-        if lookback_duration < 0.5:
-            return None
-        
-        # Get audio tensor for VAD
-        audio_tensor = audio_buffer.get_audio_tensor(
-            start_time=max(0, audio_buffer.get_duration() - lookback_duration),
-            duration=lookback_duration
-        )
-        
-        # Detect speech segments
-        time_offset = current_time - lookback_duration
-        segments = self.detect_speech_segments(audio_tensor, time_offset)
-        
-        if not segments:
-            # No speech detected
-            if self.current_segment_start is not None:
-                # We were in a speech segment, now it's ended
-                segment_end = self.last_speech_end
-                segment_start = self.current_segment_start
-                self.current_segment_start = None
-                
-                if segment_end - segment_start > 0.5:  # Min utterance duration
-                    return (segment_start, segment_end)
-            return None
-        
-        # Check for gaps between segments (potential boundaries)
-        for i in range(len(segments) - 1):
-            gap_duration = segments[i + 1][0] - segments[i][1]
-            if gap_duration >= self.min_silence_duration:
-                # Found a boundary
-                if self.current_segment_start is not None:
-                    segment_start = self.current_segment_start
-                    segment_end = segments[i][1]
-                    self.current_segment_start = segments[i + 1][0]
-                    self.last_speech_end = segment_end
-                    
-                    if segment_end - segment_start > 0.5:  # Min utterance duration
-                        return (segment_start, segment_end)
-        
-        # Update tracking
-        if segments:
-            self.last_speech_end = segments[-1][1]
-            if self.current_segment_start is None:
-                self.current_segment_start = segments[0][0]
-        
-        return None
+    def _pyannote_update(self, audio_buffer: AudioSegmentBuffer) -> Tuple[List[Tuple[float, float]], Optional[float], float]:
+        """Run Pyannote over audio that arrived since the last run.
+
+        Speech touching the end of the window may still be growing, so it is
+        reported as ongoing and re-examined on the next run; everything before
+        it is final and never analysed again.
+        """
+        end_time = audio_buffer.end_time
+        oldest_time = audio_buffer.oldest_sample / audio_buffer.sample_rate
+        guard = self.vad_context_seconds
+
+        if self._open_speech_start is not None:
+            window_start = self._open_speech_start
+        else:
+            window_start = self._final_until - self.vad_context_seconds
+        window_start = max(window_start, end_time - self.max_lookback_seconds, oldest_time)
+
+        audio_tensor = torch.from_numpy(audio_buffer.view_seconds(window_start, end_time)).unsqueeze(0)
+        segments = self.detect_speech_segments(audio_tensor, window_start)
+        self._last_run_end = end_time
+
+        closed: List[Tuple[float, float]] = []
+        open_start, open_end = None, None
+        for i, (start, end) in enumerate(segments):
+            if end <= self._final_until:
+                continue  # Already reported by an earlier run
+            if i == 0 and self._open_speech_start is not None and start - window_start < 0.1:
+                start = self._open_speech_start  # Continuation of ongoing speech
+            if end >= end_time - guard:
+                open_start, open_end = start, end
+            else:
+                closed.append((start, end))
+
+        self._open_speech_start = open_start
+        if open_start is not None:
+            self._final_until = open_start
+            return closed, open_start, open_end
+        self._final_until = end_time - guard
+        return closed, None, self._final_until
+
+    def _update(self, audio_buffer: AudioSegmentBuffer) -> Optional[Tuple[float, float]]:
+        """Analyse new audio and return the next completed utterance, if any."""
+        if self.vad_pipeline is None:
+            closed, ongoing, processed_until = self.energy_vad.update(audio_buffer)
+        elif audio_buffer.end_time - self._last_run_end >= self.vad_hop_seconds:
+            closed, ongoing, processed_until = self._pyannote_update(audio_buffer)
+        else:
+            closed, ongoing, processed_until = [], None, None
+
+        if processed_until is not None:
+            self._pending_boundaries.extend(self.tracker.update(closed, ongoing, processed_until))
+        return self._pending_boundaries.popleft() if self._pending_boundaries else None
+
+    def detect_utterance_boundary(self, audio_buffer: AudioSegmentBuffer, current_time: float = None) -> Optional[Tuple[float, float]]:
+        """Detect if an utterance boundary has occurred.
+
+        Boundaries are reported in stream time (seconds of audio received),
+        so ``current_time`` is no longer needed and only kept for callers.
+        """
+        return self._update(audio_buffer)
+
+    async def async_detect_utterance_boundary(self, audio_buffer: AudioSegmentBuffer) -> Optional[Tuple[float, float]]:
+        """Like detect_utterance_boundary, but runs Pyannote off the event loop."""
+        if self.vad_pipeline is None:
+            # Energy VAD over the new frames is cheap enough to run inline
+            return self._update(audio_buffer)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._update, audio_buffer)
+
+
+async def identify_speaker_segment(
+    audio_backend,
+    speaker_db: UnifiedSpeakerDB,
+    segment_audio: torch.Tensor,
+    user_id: int,
+    confidence_threshold: float,
+    source: str,
+) -> Dict[str, Any]:
+    """Embed an utterance off the event loop and match it against enrolled speakers."""
+    try:
+        emb = await audio_backend.async_embed(segment_audio.unsqueeze(0))
+        found, speaker_info, confidence = await speaker_db.identify(emb, user_id=user_id)
+        confidence = validate_confidence(confidence, source)
+
+        if found and confidence >= confidence_threshold:
+            log.info(f"Speaker identified: {speaker_info['name']} (confidence: {confidence:.3f})")
+            return {
+                "speaker_id": speaker_info["id"],
+                "speaker_name": speaker_info["name"],
+                "confidence": float(confidence),
+                "status": SpeakerStatus.IDENTIFIED.value
+            }
+        return {
+            "speaker_id": None,
+            "speaker_name": None,
+            "confidence": float(confidence) if confidence else 0.0,
+            "status": SpeakerStatus.UNKNOWN.value
+        }
+    except Exception as e:
+        log.error(f"Speaker identification failed: {e}")
+        return {
+            "status": SpeakerStatus.ERROR.value,
+            "error": str(e)
+        }
+
+
+async def _send_identified_event(websocket: WebSocket, event: Dict[str, Any], identification):
+    """Wait for a background identification and send the completed event."""
+    event["speaker_identification"] = await identification
+    try:
+        await websocket.send_json(event)
+    except Exception as e:
+        log.warning(f"Failed to send speaker identification event: {e}")
+
+
+async def _drain_identification_tasks(tasks: set, timeout: float = 5.0):
+    """Give in-flight identifications a chance to finish, then cancel the rest."""
+    if not tasks:
+        return
+    _, pending = await asyncio.wait(tasks, timeout=timeout)
+    for task in pending:
+        task.cancel()
 
 
 class DeepgramWebSocketProxy:
@@ -501,6 +582,7 @@ async def websocket_streaming_with_scd(
     
     # Track stream start time
     stream_start_time = asyncio.get_event_loop().time()
+    identification_tasks: set = set()
     
     # Create debug WAV file
     debug_dir = "/app/debug"
@@ -552,8 +634,8 @@ async def websocket_streaming_with_scd(
                 # Forward to Deepgram
                 await deepgram_proxy.send_audio(data)
                 
-                # Check for utterance boundary
-                boundary = scd.detect_utterance_boundary(audio_buffer, current_time)
+                # Check for utterance boundary (only new audio is analysed)
+                boundary = await scd.async_detect_utterance_boundary(audio_buffer)
                 
                 if boundary:
                     start_time, end_time = boundary
@@ -577,48 +659,19 @@ async def websocket_streaming_with_scd(
                         "speaker_identification": None  # Will be populated if user_id provided
                     }
                     
-                    # Perform speaker identification if user_id provided
+                    # Identify the speaker in the background so the socket keeps draining audio
                     if user_id and utterance_text:
-                        try:
-                            # Extract audio segment for identification
-                            segment_duration = end_time - start_time
-                            segment_audio = audio_buffer.get_audio_tensor(
-                                start_time=max(0, audio_buffer.get_duration() - (current_time - start_time)),
-                                duration=segment_duration
-                            )
-                            
-                            # Get embedding
-                            emb = await audio_backend.async_embed(segment_audio.unsqueeze(0))
-                            
-                            # Identify speaker
-                            found, speaker_info, confidence = await speaker_db.identify(emb, user_id=user_id)
-                            confidence = validate_confidence(confidence, "websocket_scd")
-                            
-                            if found and confidence >= confidence_threshold:
-                                event["speaker_identification"] = {
-                                    "speaker_id": speaker_info["id"],
-                                    "speaker_name": speaker_info["name"],
-                                    "confidence": float(confidence),
-                                    "status": SpeakerStatus.IDENTIFIED.value
-                                }
-                                log.info(f"Speaker identified: {speaker_info['name']} (confidence: {confidence:.3f})")
-                            else:
-                                event["speaker_identification"] = {
-                                    "speaker_id": None,
-                                    "speaker_name": None,
-                                    "confidence": float(confidence) if confidence else 0.0,
-                                    "status": SpeakerStatus.UNKNOWN.value
-                                }
-                                
-                        except Exception as e:
-                            log.error(f"Speaker identification failed: {e}")
-                            event["speaker_identification"] = {
-                                "status": SpeakerStatus.ERROR.value,
-                                "error": str(e)
-                            }
-                    
-                    # Send event to client
-                    await websocket.send_json(event)
+                        identification = identify_speaker_segment(
+                            audio_backend, speaker_db,
+                            audio_buffer.get_segment_tensor(start_time, end_time),
+                            user_id, confidence_threshold, "websocket_scd"
+                        )
+                        task = asyncio.create_task(_send_identified_event(websocket, event, identification))
+                        identification_tasks.add(task)
+                        task.add_done_callback(identification_tasks.discard)
+                    else:
+                        # Send event to client
+                        await websocket.send_json(event)
                 
             except WebSocketDisconnect as e:
                 log.info(f"Client disconnected: code={e.code}, reason={e.reason}")
@@ -647,6 +700,7 @@ async def websocket_streaming_with_scd(
         
     finally:
         # Cleanup
+        await _drain_identification_tasks(identification_tasks)
         await deepgram_proxy.disconnect()
         
         # Close and finalize debug WAV file
@@ -835,6 +889,7 @@ async def deepgram_proxy_websocket(
     
     # Track stream start time for speaker identification
     stream_start_time = asyncio.get_event_loop().time()
+    identification_tasks: set = set()
     
     # Create debug WAV file if speaker identification is enabled
     wav_file = None
@@ -883,8 +938,8 @@ async def deepgram_proxy_websocket(
                     audio_array = np.frombuffer(data, dtype=np.int16)
                     audio_buffer.add_audio(audio_array)
                     
-                    # Check for utterance boundary
-                    boundary = scd.detect_utterance_boundary(audio_buffer, current_time)
+                    # Check for utterance boundary (only new audio is analysed)
+                    boundary = await scd.async_detect_utterance_boundary(audio_buffer)
                     
                     if boundary:
                         start_time, end_time = boundary
@@ -906,46 +961,19 @@ async def deepgram_proxy_websocket(
                             "speaker_identification": None
                         }
                         
-                        # Perform speaker identification
+                        # Perform speaker identification in the background
                         if utterance_text:
-                            try:
-                                # Extract audio segment
-                                segment_duration = end_time - start_time
-                                segment_audio = audio_buffer.get_audio_tensor(
-                                    start_time=max(0, audio_buffer.get_duration() - (current_time - start_time)),
-                                    duration=segment_duration
-                                )
-                                
-                                # Get embedding and identify speaker
-                                emb = await audio_backend.async_embed(segment_audio.unsqueeze(0))
-                                found, speaker_info, confidence = await speaker_db.identify(emb, user_id=user_id)
-                                confidence = validate_confidence(confidence, "deepgram_proxy")
-                                
-                                if found and confidence >= confidence_threshold:
-                                    event["speaker_identification"] = {
-                                        "speaker_id": speaker_info["id"],
-                                        "speaker_name": speaker_info["name"],
-                                        "confidence": float(confidence),
-                                        "status": SpeakerStatus.IDENTIFIED.value
-                                    }
-                                    log.info(f"Speaker identified: {speaker_info['name']} (confidence: {confidence:.3f})")
-                                else:
-                                    event["speaker_identification"] = {
-                                        "speaker_id": None,
-                                        "speaker_name": None,
-                                        "confidence": float(confidence) if confidence else 0.0,
-                                        "status": SpeakerStatus.UNKNOWN.value
-                                    }
-                                    
-                            except Exception as e:
-                                log.error(f"Speaker identification failed: {e}")
-                                event["speaker_identification"] = {
-                                    "status": SpeakerStatus.ERROR.value,
-                                    "error": str(e)
-                                }
-                        
-                        # Send speaker identification event
-                        await websocket.send_json(event)
+                            identification = identify_speaker_segment(
+                                audio_backend, speaker_db,
+                                audio_buffer.get_segment_tensor(start_time, end_time),
+                                user_id, confidence_threshold, "deepgram_proxy"
+                            )
+                            task = asyncio.create_task(_send_identified_event(websocket, event, identification))
+                            identification_tasks.add(task)
+                            task.add_done_callback(identification_tasks.discard)
+                        else:
+                            # Send speaker identification event
+                            await websocket.send_json(event)
                 
             except WebSocketDisconnect as e:
                 log.info(f"Client disconnected: code={e.code}")
@@ -970,6 +998,7 @@ async def deepgram_proxy_websocket(
         
     finally:
         # Cleanup
+        await _drain_identification_tasks(identification_tasks)
         await deepgram_proxy.disconnect()
         
         # Close debug WAV file
@@ -81,6 +81,10 @@ class Settings(BaseSettings):
         default=5.0,
         description="Overlap (seconds) between chunks for continuity"
     )
+    diarize_workers: int = Field(
+        default=2,
+        description="Chunks of a long file diarized in parallel"
+    )
     backend_api_url: str = Field(
         default="http://host.docker.internal:8000",
         description="Backend API URL for fetching audio segments"
@@ -104,6 +108,9 @@ class Settings(BaseSettings):
         if 'diarize_chunk_overlap' not in kwargs and 'DIARIZE_CHUNK_OVERLAP' not in os.environ:
             kwargs['diarize_chunk_overlap'] = root_config.get('diarize_chunk_overlap', 5.0)
 
+        if 'diarize_workers' not in kwargs and 'DIARIZE_WORKERS' not in os.environ:
+            kwargs['diarize_workers'] = root_config.get('diarize_workers', 2)
+
         if 'backend_api_url' not in kwargs and 'BACKEND_API_URL' not in os.environ:
             kwargs['backend_api_url'] = root_config.get('backend_api_url', 'http://host.docker.internal:8000')
 
@@ -160,7 +167,7 @@ async def lifespan(app: FastAPI):
     
     log.info("Loading models...")
     assert hf_token is not None
-    audio_backend = AudioBackend(hf_token, device)
+    audio_backend = AudioBackend(hf_token, device, diarize_workers=auth.diarize_workers)
     speaker_db = UnifiedSpeakerDB(
         emb_dim=audio_backend.embedder.dimension,
         base_dir=auth.data_dir,
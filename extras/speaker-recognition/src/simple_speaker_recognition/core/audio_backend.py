@@ -2,9 +2,11 @@
 
 import asyncio
 import logging
-import tempfile
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 import numpy as np
 import torch
@@ -12,15 +14,53 @@ from pyannote.audio import Audio, Pipeline
 from pyannote.audio.pipelines.speaker_verification import PretrainedSpeakerEmbedding
 from pyannote.core import Segment
 
+from .speaker_linking import link_window_speakers
+
 logger = logging.getLogger(__name__)
 
 
 class AudioBackend:
-    """Wrapper around PyAnnote & SpeechBrain components."""
-
-    def __init__(self, hf_token: str, device: torch.device):
+    """Wrapper around PyAnnote & SpeechBrain components.
+
+    A PyAnnote pipeline keeps per-call state (and ``instantiate`` rewrites its
+    parameters), so it must not run on several threads at once. The backend
+    loads one pipeline per diarize worker and every diarization call checks one
+    out for its duration. Concurrent calls beyond ``diarize_workers`` wait for a
+    free pipeline. The speaker embedding model is shared, since its forward pass
+    under ``torch.inference_mode`` keeps no state.
+    """
+
+    SAMPLE_RATE = 16_000
+    # Longest turns per speaker used when the pipeline returns no speaker embeddings
+    CENTROID_MAX_TURNS = 5
+    DEFAULT_MIN_DURATION_OFF = 1.5
+
+    def __init__(self, hf_token: str, device: torch.device, diarize_workers: int = 2):
         self.device = device
-        self.diar = Pipeline.from_pretrained(
+
+        # One pipeline per diarize worker (see class docstring)
+        self.diarize_workers = max(1, diarize_workers)
+        pipelines = [self._load_pipeline(hf_token, device) for _ in range(self.diarize_workers)]
+        self.diar = pipelines[0]
+        self._pipelines: "queue.Queue[Pipeline]" = queue.Queue()
+        self._min_duration_off: Dict[int, float] = {}
+        for pipeline in pipelines:
+            self._pipelines.put(pipeline)
+            self._min_duration_off[id(pipeline)] = self.DEFAULT_MIN_DURATION_OFF
+        
+        # Use the EXACT same embedding model that the diarization pipeline uses internally
+        self.embedder = PretrainedSpeakerEmbedding(
+            "pyannote/wespeaker-voxceleb-resnet34-LM", device=device
+        )
+        self.loader = Audio(sample_rate=self.SAMPLE_RATE, mono="downmix")
+
+        # Worker pool for chunked diarization windows
+        self._diarize_pool = ThreadPoolExecutor(
+            max_workers=self.diarize_workers, thread_name_prefix="diarize"
+        )
+
+    def _load_pipeline(self, hf_token: str, device: torch.device) -> Pipeline:
+        pipeline = Pipeline.from_pretrained(
             "pyannote/speaker-diarization-community-1", token=hf_token
         ).to(device)
         
@@ -28,17 +68,12 @@ class AudioBackend:
         # Note: embedding model is fixed in pre-trained pipeline and cannot be changed at instantiation
         pipeline_params = {
             'segmentation': {
-                'min_duration_off': 1.5  # Fill gaps shorter than 1.5 seconds
+                'min_duration_off': self.DEFAULT_MIN_DURATION_OFF  # Fill gaps shorter than 1.5 seconds
             }
             # embedding_exclude_overlap is also fixed in the pre-trained pipeline
         }
-        self.diar.instantiate(pipeline_params)
-        
-        # Use the EXACT same embedding model that the diarization pipeline uses internally
-        self.embedder = PretrainedSpeakerEmbedding(
-            "pyannote/wespeaker-voxceleb-resnet34-LM", device=device
-        )
-        self.loader = Audio(sample_rate=16_000, mono="downmix")
+        pipeline.instantiate(pipeline_params)
+        return pipeline
 
     def embed(self, wave: torch.Tensor) -> np.ndarray:  # (1, T)
         with torch.inference_mode():
@@ -51,6 +86,19 @@ class AudioBackend:
         loop = asyncio.get_running_loop()
         return await loop.run_in_executor(None, self.embed, wave)
 
+    @contextmanager
+    def _checkout_pipeline(self, min_duration_off: float) -> Iterator[Pipeline]:
+        """Borrow a pipeline for exclusive use, configured for ``min_duration_off``."""
+        pipeline = self._pipelines.get()
+        try:
+            # Re-instantiate only when min_duration_off actually changes
+            if min_duration_off != self._min_duration_off[id(pipeline)]:
+                pipeline.instantiate({'segmentation': {'min_duration_off': min_duration_off}})
+                self._min_duration_off[id(pipeline)] = min_duration_off
+            yield pipeline
+        finally:
+            self._pipelines.put(pipeline)
+
     def diarize(self, path: Path, min_speakers: Optional[int] = None, max_speakers: Optional[int] = None, 
                 collar: float = 2.0, min_duration_off: float = 1.5) -> List[Dict]:
         """Perform speaker diarization on an audio file.
@@ -62,16 +110,18 @@ class AudioBackend:
             collar: Gap duration (seconds) to merge between speaker segments
             min_duration_off: Minimum silence duration (seconds) before treating as segment boundary
         """
-        # Dynamically update pipeline parameters if min_duration_off is different from default
-        if min_duration_off != 1.5:
-            pipeline_params = {
-                'segmentation': {
-                    'min_duration_off': min_duration_off
-                }
-            }
-            self.diar.instantiate(pipeline_params)
-        
-        with torch.inference_mode():
+        segments, _ = self._diarize(str(path), min_speakers, max_speakers, collar, min_duration_off)
+        return segments
+
+    def _diarize(self, audio: Union[str, Dict], min_speakers: Optional[int], max_speakers: Optional[int],
+                 collar: float, min_duration_off: float,
+                 with_embeddings: bool = False) -> Tuple[List[Dict], Dict[str, np.ndarray]]:
+        """Run a pipeline on a file path or an in-memory ``{"waveform", "sample_rate"}`` dict.
+
+        Returns:
+            Tuple of (segments, per-speaker centroid embeddings if ``with_embeddings``)
+        """
+        with torch.inference_mode(), self._checkout_pipeline(min_duration_off) as pipeline:
             # Pass speaker count parameters to pyannote
             kwargs = {}
             if min_speakers is not None:
@@ -79,18 +129,20 @@ class AudioBackend:
             if max_speakers is not None:
                 kwargs['max_speakers'] = max_speakers
 
-            output = self.diar(str(path), **kwargs)
-            logger.info(f"Diarization output: {output}")
+            output = pipeline(audio, **kwargs)
+            logger.debug(f"Diarization output: {output}")
 
             # In pyannote.audio 4.0+, the pipeline returns a DiarizeOutput object
             # We need to access .speaker_diarization to get the Annotation object
             if hasattr(output, 'speaker_diarization'):
                 diarization = output.speaker_diarization
-                logger.info(f"Using speaker_diarization from output (pyannote 4.0+)")
             else:
                 # Fallback for older versions (3.x) that return Annotation directly
                 diarization = output
-                logger.info(f"Using output directly as Annotation (pyannote 3.x)")
+
+            # Speaker embeddings in diarization.labels() order (pyannote 4.0+)
+            labels = diarization.labels()
+            speaker_embeddings = getattr(output, 'speaker_embeddings', None)
 
             # Apply PyAnnote's built-in gap filling using support() method with configurable collar
             # This fills gaps shorter than collar seconds between segments from same speaker
@@ -104,91 +156,132 @@ class AudioBackend:
                 "speaker": str(speaker),
                 "duration": float(turn.end - turn.start)
             })
-        
-        return segments
+
+        centroids: Dict[str, np.ndarray] = {}
+        if with_embeddings:
+            if speaker_embeddings is not None and len(speaker_embeddings) == len(labels):
+                for label, embedding in zip(labels, speaker_embeddings):
+                    if np.all(np.isfinite(embedding)):
+                        centroids[str(label)] = np.asarray(embedding, dtype=np.float32)
+            if isinstance(audio, dict):
+                # Embed the longest turns of speakers the pipeline gave no usable embedding for
+                for label in {seg["speaker"] for seg in segments} - centroids.keys():
+                    centroid = self._speaker_centroid(audio["waveform"], segments, label)
+                    if centroid is not None:
+                        centroids[label] = centroid
+
+        return segments, centroids
+
+    def _speaker_centroid(self, waveform: torch.Tensor, segments: List[Dict], label: str) -> Optional[np.ndarray]:
+        """Mean embedding of a speaker's longest turns within ``waveform`` (channel, T)."""
+        turns = sorted(
+            (seg for seg in segments if seg["speaker"] == label), key=lambda seg: seg["duration"], reverse=True
+        )[: self.CENTROID_MAX_TURNS]
+        embeddings = []
+        for seg in turns:
+            clip = waveform[:, int(seg["start"] * self.SAMPLE_RATE):int(seg["end"] * self.SAMPLE_RATE)]
+            if clip.shape[-1] < self.SAMPLE_RATE // 2:
+                continue
+            embedding = self.embed(clip.unsqueeze(0))[0]
+            if np.all(np.isfinite(embedding)):
+                embeddings.append(embedding)
+        return np.mean(embeddings, axis=0) if embeddings else None
 
     async def async_diarize(self, path: Path, min_speakers: Optional[int] = None, max_speakers: Optional[int] = None,
                            collar: float = 2.0, min_duration_off: float = 1.5, max_duration: float = 60.0,
-                           chunk_overlap: float = 5.0) -> List[Dict]:
+                           chunk_overlap: float = 5.0, link_threshold: float = 0.5) -> List[Dict]:
         """
         Async wrapper for diarization with automatic chunking for large files.
 
+        Long files are decoded once and split into windows of ``max_duration`` (+ overlap)
+        that are diarized in parallel on the backend's worker pool. Window-local labels are
+        then linked into global speaker IDs by clustering each window speaker's centroid
+        embedding (see ``link_window_speakers``).
+
         Args:
             path: Path to the audio file
-            min_speakers: Minimum number of speakers to detect
+            min_speakers: Minimum number of speakers to detect (single-call files only;
+                windows may legitimately contain fewer speakers)
             max_speakers: Maximum number of speakers to detect
             collar: Gap duration (seconds) to merge between speaker segments
             min_duration_off: Minimum silence duration (seconds) before treating as segment boundary
             max_duration: Maximum duration (seconds) per PyAnnote call - files longer than this are chunked
             chunk_overlap: Overlap (seconds) between chunks for continuity
+            link_threshold: Minimum cosine similarity to link window speakers as the same person
 
         Returns:
             List of speaker segments (automatically merged if chunked)
         """
+        loop = asyncio.get_running_loop()
+
         # Get file duration
         file_duration = float(self.loader.get_duration(str(path)))
 
         # If file is short enough, process in one go
         if file_duration <= max_duration:
             logger.info(f"Processing audio without chunking (duration={file_duration:.1f}s ≤ {max_duration}s)")
-            loop = asyncio.get_running_loop()
-            return await loop.run_in_executor(None, self.diarize, path, min_speakers, max_speakers, collar, min_duration_off)
+            return await loop.run_in_executor(
+                None, self.diarize, path, min_speakers, max_speakers, collar, min_duration_off
+            )
 
         # File is too large - chunk it
-        logger.info(f"Processing audio with chunking (duration={file_duration:.1f}s > {max_duration}s)")
-        logger.info(f"Using {int(file_duration / max_duration) + 1} chunks with {chunk_overlap}s overlap")
-
-        all_segments = []
+        waveform, _ = await loop.run_in_executor(None, self.loader, str(path))
+        windows = []
         current_start = 0.0
-        chunk_num = 0
-
         while current_start < file_duration:
-            chunk_num += 1
             chunk_duration = min(max_duration, file_duration - current_start)
-
             # Add overlap for continuity (except for last chunk)
-            fetch_duration = chunk_duration + chunk_overlap if current_start + chunk_duration < file_duration else chunk_duration
-
-            logger.debug(f"Processing chunk {chunk_num}: start={current_start:.1f}s, duration={chunk_duration:.1f}s")
-
-            # Load audio segment
-            chunk_audio = self.load_wave(path, start=current_start, end=current_start + fetch_duration)
+            fetch_end = min(current_start + chunk_duration + chunk_overlap, file_duration)
+            windows.append((current_start, current_start + chunk_duration, fetch_end))
+            current_start += chunk_duration
 
-            # Write chunk to temp file for PyAnnote
-            with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp:
-                import soundfile as sf
-                # Extract tensor data and write as WAV
-                audio_tensor = chunk_audio.squeeze().cpu().numpy()
-                sf.write(tmp.name, audio_tensor, 16000)
-                chunk_path = Path(tmp.name)
+        logger.info(
+            f"Processing audio with chunking (duration={file_duration:.1f}s > {max_duration}s): "
+            f"{len(windows)} windows, {chunk_overlap}s overlap, {self.diarize_workers} workers"
+        )
 
-            try:
-                # Diarize this chunk
-                loop = asyncio.get_running_loop()
-                chunk_segments = await loop.run_in_executor(
-                    None, self.diarize, chunk_path, min_speakers, max_speakers, collar, min_duration_off
-                )
+        def diarize_window(start: float, fetch_end: float):
+            chunk = waveform[:, int(start * self.SAMPLE_RATE):int(fetch_end * self.SAMPLE_RATE)]
+            return self._diarize(
+                {"waveform": chunk, "sample_rate": self.SAMPLE_RATE},
+                None, max_speakers, collar, min_duration_off, with_embeddings=True,
+            )
+
+        results = await asyncio.gather(*(
+            loop.run_in_executor(self._diarize_pool, diarize_window, start, fetch_end)
+            for start, _, fetch_end in windows
+        ))
+
+        # Link window-local labels into global speakers
+        centroids = {}
+        for window_index, (_, window_centroids) in enumerate(results):
+            for label, centroid in window_centroids.items():
+                centroids[(window_index, label)] = centroid
+        global_labels = link_window_speakers(centroids, threshold=link_threshold, max_speakers=max_speakers)
 
+        all_segments = []
+        unlinked = 0
+        for window_index, ((start, cutoff, _), (chunk_segments, _)) in enumerate(zip(windows, results)):
+            for seg in chunk_segments:
                 # Adjust timestamps to absolute time
-                for seg in chunk_segments:
-                    seg['start'] += current_start
-                    seg['end'] += current_start
-                    seg['duration'] = seg['end'] - seg['start']
-
+                seg['start'] += start
+                seg['end'] += start
+                seg['duration'] = seg['end'] - seg['start']
                 # Only keep segments that start before the overlap cutoff
-                cutoff = current_start + chunk_duration
-                chunk_segments = [seg for seg in chunk_segments if seg['start'] < cutoff]
-
-                logger.debug(f"Chunk {chunk_num}: found {len(chunk_segments)} segments")
-                all_segments.extend(chunk_segments)
-
-            finally:
-                chunk_path.unlink(missing_ok=True)
-
-            # Move to next chunk
-            current_start += chunk_duration
-
-        logger.info(f"Chunked diarization complete: {len(all_segments)} segments before merging")
+                if seg['start'] >= cutoff:
+                    continue
+                key = (window_index, seg['speaker'])
+                if key not in global_labels:
+                    # No embedding to link by: keep it as a separate speaker
+                    unlinked += 1
+                    global_labels[key] = f"SPEAKER_UNLINKED_{window_index}_{seg['speaker']}"
+                seg['speaker'] = global_labels[key]
+                all_segments.append(seg)
+
+        logger.info(
+            f"Chunked diarization complete: {len(all_segments)} segments before merging, "
+            f"{len(set(global_labels.values()))} speakers ({unlinked} segments without embeddings)"
+        )
 
         # Merge adjacent segments from same speaker
         merged = self._merge_segments(all_segments, max_gap=2.0)
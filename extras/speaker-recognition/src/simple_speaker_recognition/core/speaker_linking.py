@@ -0,0 +1,82 @@
+"""Link window-local diarization labels into global speaker IDs."""
+
+import logging
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+WindowSpeaker = Tuple[int, str]  # (window index, window-local label)
+
+
+def link_window_speakers(
+    centroids: Dict[WindowSpeaker, np.ndarray],
+    threshold: float = 0.5,
+    max_speakers: Optional[int] = None,
+) -> Dict[WindowSpeaker, str]:
+    """Cluster per-window speaker centroids into global speaker labels.
+
+    Average-linkage agglomerative clustering on cosine similarity, with the
+    constraint that two speakers of the same window are never merged (the window
+    diarization already decided they are different people). Clusters merge while
+    their similarity is at least ``threshold``; if ``max_speakers`` is given,
+    merging continues below the threshold until at most that many remain (when
+    the constraint allows it).
+
+    Args:
+        centroids: Mean embedding of each (window, local label)
+        threshold: Minimum average cosine similarity to merge two clusters
+        max_speakers: Upper bound on the number of global speakers
+
+    Returns:
+        Mapping of each (window, local label) to ``SPEAKER_XX``, numbered in order
+        of first appearance
+    """
+    keys = sorted(centroids)
+    if not keys:
+        return {}
+
+    vectors = np.stack([centroids[key] for key in keys]).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True) + 1e-12
+    pair_sum = vectors @ vectors.T  # summed similarity between clusters
+
+    n = len(keys)
+    sizes = np.ones(n)
+    active = np.ones(n, dtype=bool)
+    members: List[List[int]] = [[i] for i in range(n)]
+
+    # Same-window speakers can never share a cluster
+    window_ids = np.array([key[0] for key in keys])
+    blocked = window_ids[:, None] == window_ids[None, :]
+
+    while active.sum() > 1:
+        average = pair_sum / np.outer(sizes, sizes)
+        invalid = blocked | ~active[:, None] | ~active[None, :]
+        average[invalid] = -np.inf
+        i, j = np.unravel_index(np.argmax(average), average.shape)
+        best = average[i, j]
+        if best == -np.inf:
+            break
+        if best < threshold and (max_speakers is None or active.sum() <= max_speakers):
+            break
+
+        # Merge j into i
+        pair_sum[i, :] += pair_sum[j, :]
+        pair_sum[:, i] += pair_sum[:, j]
+        sizes[i] += sizes[j]
+        blocked[i, :] |= blocked[j, :]
+        blocked[:, i] |= blocked[:, j]
+        active[j] = False
+        members[i].extend(members[j])
+
+    clusters = sorted(
+        (sorted(members[i]) for i in np.flatnonzero(active)), key=lambda m: keys[m[0]]
+    )
+    mapping = {}
+    for label, cluster in enumerate(clusters):
+        for index in cluster:
+            mapping[keys[index]] = f"SPEAKER_{label:02d}"
+
+    logger.info(f"Linked {n} window speakers into {len(clusters)} global speakers")
+    return mapping
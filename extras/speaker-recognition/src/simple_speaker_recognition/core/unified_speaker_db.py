@@ -3,11 +3,13 @@
 import asyncio
 import json
 import logging
+import os
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, cast
 
 import faiss
 import numpy as np
+from sqlalchemy import func
 
 from simple_speaker_recognition.database import get_db_session
 from simple_speaker_recognition.database.models import Speaker, User
@@ -15,6 +17,9 @@ from simple_speaker_recognition.database.queries import UserQueries
 
 log = logging.getLogger(__name__)
 
+# Bump when the on-disk index layout or ID assignment changes
+INDEX_FORMAT_VERSION = 2
+
 
 def _normalize(arr: np.ndarray) -> np.ndarray:
     """Normalize array to unit length."""
@@ -22,80 +27,159 @@ def _normalize(arr: np.ndarray) -> np.ndarray:
 
 
 class UnifiedSpeakerDB:
-    """Unified speaker database combining SQLite metadata with FAISS performance."""
+    """Unified speaker database combining SQLite metadata with FAISS performance.
+
+    Embeddings are stored in SQLite as raw float32 bytes. The FAISS index is an
+    ``IndexIDMap`` over inner product, so enrollments are added, replaced and
+    removed in place by ID. The index and its ID mapping are saved together with a
+    stamp of the speakers table; on startup they are loaded directly when the
+    stamp still matches, and rebuilt from SQLite otherwise.
+    """
 
     def __init__(self, emb_dim: int, base_dir: Path, similarity_thr: float):
         self._lock = asyncio.Lock()
         self.emb_dim = emb_dim
         self.similarity_thr = similarity_thr
         self.base_dir = base_dir
-        self.index_path = base_dir / "faiss.index"
+        self.index_path = base_dir / f"faiss.v{INDEX_FORMAT_VERSION}.index"
+        self.meta_path = base_dir / f"faiss.v{INDEX_FORMAT_VERSION}.json"
 
         # FAISS index for fast similarity search using cosine similarity (inner product)
-        self.index: faiss.IndexFlatIP = faiss.IndexFlatIP(emb_dim)
-        
-        # Mapping from FAISS index position to (user_id, speaker_id)
+        self.index: faiss.IndexIDMap = self._new_index()
+
+        # Mapping from FAISS ID to (user_id, speaker_id), and back
         self.faiss_to_speaker: Dict[int, Tuple[int, str]] = {}
+        self.speaker_to_faiss: Dict[Tuple[int, str], int] = {}
+        self._next_faiss_id = 0
 
         self.base_dir.mkdir(parents=True, exist_ok=True)
         self._load_state()
 
+    def _new_index(self) -> faiss.IndexIDMap:
+        return faiss.IndexIDMap(faiss.IndexFlatIP(self.emb_dim))
+
     def _load_state(self) -> None:
-        """Load FAISS index and rebuild mapping from SQLite."""
-        if self.index_path.exists():
+        """Load the saved FAISS index, or rebuild it from SQLite if it is missing or stale."""
+        if self.index_path.exists() and self.meta_path.exists():
             try:
-                self.index = faiss.read_index(str(self.index_path))
-                log.info("Loaded FAISS index from %s", self.index_path)
+                meta = json.loads(self.meta_path.read_text())
+                if (
+                    meta.get("format") == INDEX_FORMAT_VERSION
+                    and meta.get("emb_dim") == self.emb_dim
+                    and meta.get("db_stamp") == self._db_stamp()
+                ):
+                    self.index = faiss.read_index(str(self.index_path))
+                    self._set_mapping(
+                        {int(fid): (uid, sid) for fid, (uid, sid) in meta["ids"].items()},
+                        meta["next_id"],
+                    )
+                    log.info("Loaded FAISS index with %d speakers from %s", self.index.ntotal, self.index_path)
+                    return
+                log.info("Saved FAISS index is stale, rebuilding from SQLite")
             except Exception as e:
-                log.warning("Could not load FAISS index, creating new: %s", e)
-                self.index = faiss.IndexFlatIP(self.emb_dim)
-        
-        # Rebuild mapping from SQLite
+                log.warning("Could not load FAISS index, rebuilding: %s", e)
+
         self._rebuild_faiss_mapping()
+        self._save_faiss_index()
+
+    def _set_mapping(self, faiss_to_speaker: Dict[int, Tuple[int, str]], next_id: int) -> None:
+        self.faiss_to_speaker = faiss_to_speaker
+        self.speaker_to_faiss = {key: fid for fid, key in faiss_to_speaker.items()}
+        self._next_faiss_id = next_id
+
+    def _db_stamp(self) -> List:
+        """Cheap fingerprint of the speakers table, used to detect a stale saved index."""
+        db = get_db_session()
+        try:
+            count, last_update = db.query(func.count(Speaker.id), func.max(Speaker.updated_at)).one()
+            return [count, last_update.isoformat() if last_update else None]
+        finally:
+            db.close()
 
     def _rebuild_faiss_mapping(self) -> None:
         """Rebuild FAISS index from SQLite data."""
         db = get_db_session()
         try:
             speakers = db.query(Speaker).all()
-            self.faiss_to_speaker.clear()
-            
+            self.index = self._new_index()
+            self._set_mapping({}, 0)
+
             if not speakers:
                 log.info("No speakers found in database")
                 return
-            
-            # Recreate FAISS index for inner product (cosine similarity)
-            self.index = faiss.IndexFlatIP(self.emb_dim)
-            
-            vectors = []
-            for i, speaker in enumerate(speakers):
-                embedding_data = cast(Optional[str], speaker.embedding_data)
-                if embedding_data:
-                    try:
-                        embedding = np.array(json.loads(embedding_data), dtype=np.float32)
-                        vectors.append(embedding)
-                        self.faiss_to_speaker[i] = (cast(int, speaker.user_id), cast(str, speaker.id))
-                    except (json.JSONDecodeError, ValueError) as e:
-                        log.warning("Invalid embedding data for speaker %s: %s", speaker.id, e)
-            
+
+            vectors, ids, mapping, migrated = [], [], {}, 0
+            for speaker in speakers:
+                try:
+                    embedding = speaker.get_embedding()
+                except (json.JSONDecodeError, ValueError) as e:
+                    log.warning("Invalid embedding data for speaker %s: %s", speaker.id, e)
+                    continue
+                if embedding is None:
+                    continue
+                if speaker.embedding_vector is None:
+                    # One-time migration of legacy JSON rows to binary storage
+                    speaker.set_embedding(embedding)
+                    migrated += 1
+                mapping[len(ids)] = (cast(int, speaker.user_id), cast(str, speaker.id))
+                ids.append(len(ids))
+                vectors.append(embedding)
+
+            if migrated:
+                db.commit()
+                log.info("Migrated %d speaker embeddings from JSON to binary", migrated)
+
             if vectors:
                 # Normalize all embeddings before adding to FAISS
-                normalized_vectors = np.stack([_normalize(v) for v in vectors]).astype(np.float32)
-                self.index.add(normalized_vectors)
+                normalized_vectors = _normalize(np.stack(vectors).astype(np.float32))
+                self.index.add_with_ids(normalized_vectors, np.asarray(ids, dtype=np.int64))
+                self._set_mapping(mapping, len(ids))
                 log.info("Rebuilt FAISS index with %d speakers (normalized embeddings)", len(vectors))
-            
+
         except Exception as e:
+            db.rollback()
             log.error("Error rebuilding FAISS mapping: %s", e)
         finally:
             db.close()
 
     def _save_faiss_index(self) -> None:
-        """Save FAISS index to disk."""
+        """Save FAISS index and ID mapping to disk (each file replaced atomically)."""
         try:
-            faiss.write_index(self.index, str(self.index_path))
+            tmp_index = self.index_path.with_suffix(".index.tmp")
+            faiss.write_index(self.index, str(tmp_index))
+            os.replace(tmp_index, self.index_path)
+
+            meta = {
+                "format": INDEX_FORMAT_VERSION,
+                "emb_dim": self.emb_dim,
+                "next_id": self._next_faiss_id,
+                "ids": {str(fid): list(key) for fid, key in self.faiss_to_speaker.items()},
+                "db_stamp": self._db_stamp(),
+            }
+            tmp_meta = self.meta_path.with_suffix(".json.tmp")
+            tmp_meta.write_text(json.dumps(meta))
+            os.replace(tmp_meta, self.meta_path)
         except Exception as e:
             log.error("Error saving FAISS index: %s", e)
 
+    def _index_upsert(self, user_id: int, speaker_id: str, embedding: np.ndarray) -> None:
+        """Add or replace a speaker's vector in the FAISS index."""
+        self._index_remove([(user_id, speaker_id)])
+        faiss_id = self._next_faiss_id
+        self._next_faiss_id += 1
+        normalized_embedding = _normalize(embedding.astype(np.float32)).reshape(1, -1)
+        self.index.add_with_ids(normalized_embedding, np.array([faiss_id], dtype=np.int64))
+        self.faiss_to_speaker[faiss_id] = (user_id, speaker_id)
+        self.speaker_to_faiss[(user_id, speaker_id)] = faiss_id
+
+    def _index_remove(self, keys: List[Tuple[int, str]]) -> None:
+        """Remove speakers' vectors from the FAISS index."""
+        faiss_ids = [self.speaker_to_faiss.pop(key) for key in keys if key in self.speaker_to_faiss]
+        if faiss_ids:
+            self.index.remove_ids(np.asarray(faiss_ids, dtype=np.int64))
+            for faiss_id in faiss_ids:
+                del self.faiss_to_speaker[faiss_id]
+
     async def add_speaker(self, speaker_id: str, name: str, embedding: np.ndarray, user_id: int, 
                          sample_count: int = 1, total_duration: float = 0.0) -> bool:
         """Add speaker with user association; return True if updated (False if new)."""
@@ -110,45 +194,31 @@ class UnifiedSpeakerDB:
                 
                 is_update = existing_speaker is not None
                 
-                # Prepare embedding data
-                embedding_json = json.dumps(embedding.tolist())
-                
                 if is_update:
                     # Update existing speaker (replace enrollment)
                     existing_speaker.name = name  # type: ignore[assignment]
-                    existing_speaker.embedding_data = embedding_json  # type: ignore[assignment]
+                    existing_speaker.set_embedding(embedding)
                     existing_speaker.audio_sample_count = sample_count  # type: ignore[assignment]
                     existing_speaker.total_audio_duration = total_duration  # type: ignore[assignment]
                     log.info("Updated existing speaker: %s (user: %d) with %d samples", speaker_id, user_id, sample_count)
-                    
-                    # For updates, we need to rebuild since FAISS doesn't support updates
-                    db.commit()
-                    self._rebuild_faiss_mapping()
-                    self._save_faiss_index()
                 else:
                     # Create new speaker
                     new_speaker = Speaker(
                         id=speaker_id,
                         name=name,
                         user_id=user_id,
-                        embedding_data=embedding_json,
                         audio_sample_count=sample_count,
                         total_audio_duration=total_duration
                     )
+                    new_speaker.set_embedding(embedding)
                     db.add(new_speaker)
-                    db.commit()
                     log.info("Added new speaker: %s (user: %d) with %d samples", speaker_id, user_id, sample_count)
-                    
-                    # For new speakers, add to FAISS index incrementally
-                    normalized_embedding = _normalize(embedding.astype(np.float32)).reshape(1, -1)
-                    self.index.add(normalized_embedding)
-                    
-                    # Update mapping (new index position is ntotal - 1)
-                    new_faiss_idx = self.index.ntotal - 1
-                    self.faiss_to_speaker[new_faiss_idx] = (user_id, speaker_id)
-                    
-                    self._save_faiss_index()
-                
+                db.commit()
+
+                # Replace the vector in place (IndexIDMap), no rebuild needed
+                self._index_upsert(user_id, speaker_id, embedding)
+                self._save_faiss_index()
+
                 return is_update
                 
             except Exception as e:
@@ -174,8 +244,7 @@ class UnifiedSpeakerDB:
                 db.delete(speaker)
                 db.commit()
                 
-                # Rebuild FAISS index
-                self._rebuild_faiss_mapping()
+                self._index_remove([(user_id, speaker_id)])
                 self._save_faiss_index()
                 
                 log.info("Deleted speaker: %s (user: %d)", speaker_id, user_id)
@@ -195,8 +264,7 @@ class UnifiedSpeakerDB:
                 db.query(Speaker).filter(Speaker.user_id == user_id).delete()
                 db.commit()
                 
-                # Rebuild FAISS index
-                self._rebuild_faiss_mapping()
+                self._index_remove([key for key in self.speaker_to_faiss if key[0] == user_id])
                 self._save_faiss_index()
                 
                 log.info("Reset all speakers for user: %d", user_id)
@@ -303,11 +371,10 @@ class UnifiedSpeakerDB:
                 Speaker.user_id == user_id
             ).first()
             
-            embedding_data = cast(Optional[str], speaker.embedding_data) if speaker else None
-            if not speaker or not embedding_data:
+            stored_emb = speaker.get_embedding() if speaker else None
+            if stored_emb is None:
                 raise KeyError(f"Speaker {speaker_id} not enrolled for user {user_id}")
             
-            stored_emb = np.array(json.loads(embedding_data), dtype=np.float32)
             return float(np.dot(_normalize(embedding.flatten()), _normalize(stored_emb)))
             
         except Exception as e:
@@ -343,16 +410,16 @@ class UnifiedSpeakerDB:
             speakers = db.query(Speaker).filter(Speaker.user_id == user_id).all()
             result = {}
             for speaker in speakers:
-                embedding_data = cast(Optional[str], speaker.embedding_data)
-                if embedding_data:
-                    try:
-                        embedding = json.loads(embedding_data)
-                        result[cast(str, speaker.id)] = {
-                            "name": cast(str, speaker.name),
-                            "embedding": embedding
-                        }
-                    except (json.JSONDecodeError, ValueError) as e:
-                        log.warning("Invalid embedding for speaker %s: %s", speaker.id, e)
+                try:
+                    embedding = speaker.get_embedding()
+                except (json.JSONDecodeError, ValueError) as e:
+                    log.warning("Invalid embedding for speaker %s: %s", speaker.id, e)
+                    continue
+                if embedding is not None:
+                    result[cast(str, speaker.id)] = {
+                        "name": cast(str, speaker.name),
+                        "embedding": embedding.tolist()
+                    }
             return result
         finally:
             db.close()
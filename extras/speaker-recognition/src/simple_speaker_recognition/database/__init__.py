@@ -2,7 +2,7 @@
 
 import os
 from pathlib import Path
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
@@ -31,6 +31,18 @@ def init_db():
     """Initialize the database, creating all tables."""
     from . import models  # Import models to register them
     Base.metadata.create_all(bind=engine)
+    _add_missing_columns()
+
+def _add_missing_columns():
+    """Add columns introduced after a database was created (create_all skips existing tables)."""
+    added_columns = {"speakers": {"embedding_vector": "BLOB"}}
+    inspector = inspect(engine)
+    with engine.begin() as conn:
+        for table, columns in added_columns.items():
+            existing = {column["name"] for column in inspector.get_columns(table)}
+            for name, sql_type in columns.items():
+                if name not in existing:
+                    conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {name} {sql_type}"))
 
 def get_db():
     """Get database session for dependency injection."""
@@ -1,8 +1,13 @@
 """SQLAlchemy models for speaker recognition system."""
 
-from sqlalchemy import Column, Integer, String, Float, Text, DateTime, ForeignKey, Boolean, UniqueConstraint
-from sqlalchemy.orm import relationship
+import json
 from datetime import datetime
+from typing import Optional
+
+import numpy as np
+from sqlalchemy import Column, Integer, String, Float, Text, DateTime, ForeignKey, Boolean, UniqueConstraint, LargeBinary
+from sqlalchemy.orm import relationship
+
 from . import Base
 
 class User(Base):
@@ -31,7 +36,8 @@ class Speaker(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     embedding_version = Column(Integer, default=1)
     embedding_config = Column(Text)  # JSON: {"method": "mean", "params": {...}}
-    embedding_data = Column(Text)  # JSON: serialized embedding vector
+    embedding_data = Column(Text)  # Legacy JSON embedding, superseded by embedding_vector
+    embedding_vector = Column(LargeBinary)  # Raw float32 embedding bytes
     audio_segments_metadata = Column(Text)  # JSON: references to audio segments
     notes = Column(Text)  # Optional notes about the speaker
     audio_sample_count = Column(Integer, default=0)  # Number of audio segments used for enrollment
@@ -47,6 +53,19 @@ class Speaker(Base):
     annotations = relationship("Annotation", back_populates="speaker")
     audio_segments = relationship("SpeakerAudioSegment", back_populates="speaker", cascade="all, delete-orphan")
     
+    def get_embedding(self) -> Optional[np.ndarray]:
+        """Return the embedding as float32, reading legacy JSON rows if needed."""
+        if self.embedding_vector:
+            return np.frombuffer(self.embedding_vector, dtype=np.float32)
+        if self.embedding_data:
+            return np.asarray(json.loads(self.embedding_data), dtype=np.float32)
+        return None
+
+    def set_embedding(self, embedding) -> None:
+        """Store the embedding as raw float32 bytes (clears the legacy JSON copy)."""
+        self.embedding_vector = np.asarray(embedding, dtype=np.float32).tobytes()
+        self.embedding_data = None
+
     def __repr__(self):
         return f"<Speaker(id='{self.id}', name='{self.name}', user_id={self.user_id})>"
 
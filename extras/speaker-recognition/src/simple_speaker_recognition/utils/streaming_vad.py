@@ -0,0 +1,242 @@
+"""Streaming audio buffer and incremental voice activity detection.
+
+Used by the real-time websocket endpoints. Everything here works on absolute
+sample positions (samples since the start of the stream) so callers never
+have to re-scan audio they have already seen.
+"""
+
+import logging
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class AudioRingBuffer:
+    """Preallocated float32 ring buffer with zero-copy window views.
+
+    Samples are written twice (at ``i`` and ``i + capacity``) into a buffer of
+    ``2 * capacity`` so that any window of up to ``capacity`` samples is a
+    contiguous slice and can be returned as a view without copying.
+    """
+
+    def __init__(self, max_duration_seconds: float = 20.0, sample_rate: int = 16000):
+        self.max_duration = max_duration_seconds
+        self.sample_rate = sample_rate
+        self.capacity = int(max_duration_seconds * sample_rate)
+        self._data = np.zeros(2 * self.capacity, dtype=np.float32)
+        self.total_samples = 0  # Absolute number of samples written
+
+    def add_audio(self, audio_data: np.ndarray):
+        """Append samples (int16 PCM or float32) to the buffer."""
+        if audio_data.dtype == np.int16:
+            audio_data = np.multiply(audio_data, 1.0 / 32768.0, dtype=np.float32)
+        elif audio_data.dtype != np.float32:
+            audio_data = audio_data.astype(np.float32)
+
+        n = len(audio_data)
+        if n == 0:
+            return
+        if n > self.capacity:
+            # Only the newest `capacity` samples can be kept
+            self.total_samples += n - self.capacity
+            audio_data = audio_data[-self.capacity :]
+            n = self.capacity
+
+        cap = self.capacity
+        pos = self.total_samples % cap
+        first = min(n, cap - pos)
+        self._data[pos : pos + first] = audio_data[:first]
+        self._data[pos + cap : pos + cap + first] = audio_data[:first]
+        rest = n - first
+        if rest:
+            self._data[:rest] = audio_data[first:]
+            self._data[cap : cap + rest] = audio_data[first:]
+        self.total_samples += n
+
+    @property
+    def oldest_sample(self) -> int:
+        """Absolute index of the oldest sample still held."""
+        return max(0, self.total_samples - self.capacity)
+
+    def __len__(self) -> int:
+        return min(self.total_samples, self.capacity)
+
+    def view(self, start_sample: int, end_sample: int) -> np.ndarray:
+        """Return a view of absolute samples ``[start_sample, end_sample)``.
+
+        The range is clamped to what the buffer still holds. The view aliases
+        the ring, so copy it if it must outlive roughly ``capacity`` samples of
+        further writes.
+        """
+        start = max(start_sample, self.oldest_sample)
+        end = min(end_sample, self.total_samples)
+        if end <= start:
+            return self._data[:0]
+        offset = start % self.capacity
+        return self._data[offset : offset + (end - start)]
+
+    def view_seconds(self, start_time: float, end_time: float) -> np.ndarray:
+        """Return a view for an absolute time range in seconds."""
+        return self.view(
+            int(start_time * self.sample_rate), int(end_time * self.sample_rate)
+        )
+
+    def get_duration(self) -> float:
+        """Get current buffered duration in seconds."""
+        return len(self) / self.sample_rate
+
+    @property
+    def end_time(self) -> float:
+        """Absolute stream time (seconds) of the newest sample."""
+        return self.total_samples / self.sample_rate
+
+    def clear(self):
+        """Drop all buffered audio and reset the stream position."""
+        self.total_samples = 0
+
+
+class IncrementalEnergyVAD:
+    """Frame-energy VAD that only evaluates frames it has not seen before.
+
+    Uses the same framing and threshold as the original lookback VAD (30 ms
+    frames, 10 ms hop), but keeps its speech/silence state between calls and
+    computes frame energies with a vectorised prefix sum over the new samples.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 16000,
+        frame_size: int = 480,
+        hop_size: int = 160,
+        threshold: float = 0.001,
+        min_speech_duration: float = 0.1,
+    ):
+        self.sample_rate = sample_rate
+        self.frame_size = frame_size
+        self.hop_size = hop_size
+        self.threshold = threshold
+        self.min_speech_duration = min_speech_duration
+
+        self.next_frame = 0  # Absolute sample index of the next frame to evaluate
+        self.speech_start: Optional[int] = None  # Absolute start of ongoing speech
+
+    def update(
+        self, ring: AudioRingBuffer
+    ) -> Tuple[List[Tuple[float, float]], Optional[float], float]:
+        """Process new audio in ``ring``.
+
+        Returns:
+            ``(closed_segments, ongoing_start, processed_until)`` where closed
+            segments are final ``(start, end)`` pairs in seconds, ongoing_start
+            is the start of speech still in progress (or None) and
+            processed_until is the stream time covered so far.
+        """
+        sr = self.sample_rate
+        if self.next_frame < ring.oldest_sample:
+            # Fell behind the ring (should not happen with regular calls)
+            self.next_frame = ring.oldest_sample
+
+        available = ring.total_samples - self.next_frame
+        if available < self.frame_size:
+            return [], self._ongoing(), self.next_frame / sr
+
+        num_frames = (available - self.frame_size) // self.hop_size + 1
+        span = (num_frames - 1) * self.hop_size + self.frame_size
+        audio = ring.view(self.next_frame, self.next_frame + span)
+
+        squares = np.empty(span + 1, dtype=np.float64)
+        squares[0] = 0.0
+        np.cumsum(np.square(audio, dtype=np.float64), out=squares[1:])
+        starts = np.arange(num_frames) * self.hop_size
+        energies = (
+            squares[starts + self.frame_size] - squares[starts]
+        ) / self.frame_size
+        is_speech = energies > self.threshold
+
+        closed: List[Tuple[float, float]] = []
+        state = self.speech_start is not None
+        changes = np.flatnonzero(is_speech != np.concatenate(([state], is_speech[:-1])))
+        for idx in changes:
+            frame_pos = self.next_frame + int(starts[idx])
+            if is_speech[idx]:
+                self.speech_start = frame_pos
+            elif self.speech_start is not None:
+                seg_start, seg_end = self.speech_start / sr, frame_pos / sr
+                if seg_end - seg_start > self.min_speech_duration:
+                    closed.append((seg_start, seg_end))
+                self.speech_start = None
+
+        self.next_frame += num_frames * self.hop_size
+        return closed, self._ongoing(), self.next_frame / sr
+
+    def _ongoing(self) -> Optional[float]:
+        return (
+            None if self.speech_start is None else self.speech_start / self.sample_rate
+        )
+
+    def reset(self):
+        """Reset detection state."""
+        self.next_frame = 0
+        self.speech_start = None
+
+
+class UtteranceTracker:
+    """Turns a stream of speech segments into utterance boundaries.
+
+    An utterance ends when silence of at least ``min_silence_duration``
+    follows speech, either as a gap between two segments or as trailing
+    silence after the last one.
+    """
+
+    def __init__(
+        self, min_silence_duration: float = 1.5, min_utterance_duration: float = 0.5
+    ):
+        self.min_silence_duration = min_silence_duration
+        self.min_utterance_duration = min_utterance_duration
+        self.current_segment_start: Optional[float] = None
+        self.last_speech_end = 0.0
+
+    def update(
+        self,
+        closed_segments: List[Tuple[float, float]],
+        ongoing_start: Optional[float],
+        processed_until: float,
+    ) -> List[Tuple[float, float]]:
+        """Feed VAD output and return any utterances completed by it."""
+        boundaries: List[Tuple[float, float]] = []
+
+        for start, end in closed_segments:
+            self._begin_speech(start, boundaries)
+            self.last_speech_end = max(self.last_speech_end, end)
+
+        if ongoing_start is not None:
+            self._begin_speech(ongoing_start, boundaries)
+            # Speech is known to continue at least until here
+            self.last_speech_end = max(self.last_speech_end, processed_until)
+        elif (
+            self.current_segment_start is not None
+            and processed_until - self.last_speech_end >= self.min_silence_duration
+        ):
+            self._emit(boundaries)
+            self.current_segment_start = None
+
+        return boundaries
+
+    def _begin_speech(self, start: float, boundaries: List[Tuple[float, float]]):
+        if self.current_segment_start is None:
+            self.current_segment_start = start
+        elif start - self.last_speech_end >= self.min_silence_duration:
+            self._emit(boundaries)
+            self.current_segment_start = start
+
+    def _emit(self, boundaries: List[Tuple[float, float]]):
+        start, end = self.current_segment_start, self.last_speech_end
+        if end - start > self.min_utterance_duration:
+            boundaries.append((start, end))
+
+    def reset(self):
+        """Forget any in-progress utterance."""
+        self.current_segment_start = None
+        self.last_speech_end = 0.0
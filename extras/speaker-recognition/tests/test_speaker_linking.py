@@ -0,0 +1,89 @@
+"""
+Unit tests for linking window-local diarization labels across windows.
+
+Uses synthetic embeddings, no models needed.
+
+Run:
+  uv run pytest extras/speaker-recognition/tests/test_speaker_linking.py -v
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from simple_speaker_recognition.core.speaker_linking import link_window_speakers
+
+DIM = 64
+
+
+def voices(count: int, seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).normal(size=(count, DIM))
+
+
+def noisy(
+    voice: np.ndarray, rng: np.random.Generator, scale: float = 0.3
+) -> np.ndarray:
+    return voice + rng.normal(scale=scale, size=DIM)
+
+
+def test_same_voice_gets_one_label_across_windows():
+    rng = np.random.default_rng(1)
+    alice, bob, carol = voices(3)
+    # Window-local labels are arbitrary: the same person has different labels per window
+    centroids = {
+        (0, "SPEAKER_00"): noisy(alice, rng),
+        (0, "SPEAKER_01"): noisy(bob, rng),
+        (1, "SPEAKER_00"): noisy(bob, rng),
+        (1, "SPEAKER_01"): noisy(alice, rng),
+        (2, "SPEAKER_00"): noisy(carol, rng),
+        (3, "SPEAKER_00"): noisy(alice, rng),
+        (3, "SPEAKER_01"): noisy(carol, rng),
+    }
+
+    mapping = link_window_speakers(centroids, threshold=0.5)
+
+    assert mapping == {
+        (0, "SPEAKER_00"): "SPEAKER_00",
+        (0, "SPEAKER_01"): "SPEAKER_01",
+        (1, "SPEAKER_00"): "SPEAKER_01",
+        (1, "SPEAKER_01"): "SPEAKER_00",
+        (2, "SPEAKER_00"): "SPEAKER_02",
+        (3, "SPEAKER_00"): "SPEAKER_00",
+        (3, "SPEAKER_01"): "SPEAKER_02",
+    }
+
+
+def test_speakers_of_one_window_are_never_merged():
+    rng = np.random.default_rng(2)
+    (voice,) = voices(1)
+    centroids = {
+        (0, "SPEAKER_00"): noisy(voice, rng, 0.01),
+        (0, "SPEAKER_01"): noisy(voice, rng, 0.01),
+        (1, "SPEAKER_00"): noisy(voice, rng, 0.01),
+    }
+
+    mapping = link_window_speakers(centroids, threshold=0.5, max_speakers=1)
+
+    assert mapping[(0, "SPEAKER_00")] != mapping[(0, "SPEAKER_01")]
+    assert len(set(mapping.values())) == 2
+
+
+def test_max_speakers_merges_below_threshold():
+    rng = np.random.default_rng(3)
+    alice, bob = voices(2)
+    centroids = {
+        (0, "SPEAKER_00"): noisy(alice, rng),
+        (1, "SPEAKER_00"): noisy(bob, rng),
+        (2, "SPEAKER_00"): noisy(alice, rng),
+    }
+
+    assert len(set(link_window_speakers(centroids, threshold=0.5).values())) == 2
+    merged = link_window_speakers(centroids, threshold=0.5, max_speakers=1)
+    assert set(merged.values()) == {"SPEAKER_00"}
+
+
+def test_no_centroids():
+    assert link_window_speakers({}) == {}
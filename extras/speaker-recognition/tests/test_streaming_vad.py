@@ -0,0 +1,216 @@
+"""
+Unit tests for the streaming ring buffer, incremental VAD and utterance tracker.
+
+Uses synthetic audio, no models needed.
+
+Run:
+  uv run pytest extras/speaker-recognition/tests/test_streaming_vad.py -v
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from simple_speaker_recognition.utils.streaming_vad import (
+    AudioRingBuffer,
+    IncrementalEnergyVAD,
+    UtteranceTracker,
+)
+
+SR = 16000
+
+
+def reference_vad(audio: np.ndarray) -> list[tuple[float, float]]:
+    """The frame loop of ``WebSocketWrapper._simple_vad``, re-scanning all audio."""
+    frame_size, hop_size, threshold = 480, 160, 0.001
+    segments = []
+    is_speech = False
+    segment_start = None
+    for i in range(0, len(audio) - frame_size, hop_size):
+        energy = np.mean(audio[i : i + frame_size] ** 2)
+        if energy > threshold and not is_speech:
+            is_speech = True
+            segment_start = i / SR
+        elif energy <= threshold and is_speech:
+            is_speech = False
+            if segment_start is not None and i / SR - segment_start > 0.1:
+                segments.append((segment_start, i / SR))
+            segment_start = None
+    if is_speech and segment_start is not None:
+        segments.append((segment_start, len(audio) / SR))
+    return segments
+
+
+def synthetic_audio(
+    bursts: list[tuple[float, float]], duration: float, seed: int = 0
+) -> np.ndarray:
+    """Low-level noise with loud tones over the ``(start, end)`` second ranges."""
+    rng = np.random.default_rng(seed)
+    audio = rng.normal(scale=0.005, size=int(duration * SR)).astype(np.float32)
+    t = np.arange(len(audio)) / SR
+    for start, end in bursts:
+        span = slice(int(start * SR), int(end * SR))
+        audio[span] += 0.3 * np.sin(2 * np.pi * 220 * t[span]).astype(np.float32)
+    return audio
+
+
+def stream(audio: np.ndarray, chunk_sizes, ring=None, vad=None):
+    """Feed ``audio`` in chunks, yielding the VAD output after each one."""
+    ring = ring or AudioRingBuffer(max_duration_seconds=20.0)
+    vad = vad or IncrementalEnergyVAD()
+    position = 0
+    for size in chunk_sizes:
+        if position >= len(audio):
+            break
+        ring.add_audio(audio[position : position + size])
+        position += size
+        yield vad.update(ring)
+
+
+def chunk_sizes(seed: int = 1):
+    rng = np.random.default_rng(seed)
+    while True:
+        yield int(rng.integers(1, 4000))
+
+
+# --- AudioRingBuffer --------------------------------------------------------
+
+
+def small_ring() -> AudioRingBuffer:
+    return AudioRingBuffer(max_duration_seconds=1.0, sample_rate=10)
+
+
+def test_ring_wraparound_returns_contiguous_views():
+    ring = small_ring()
+    ring.add_audio(np.arange(0, 7, dtype=np.float32))
+    ring.add_audio(np.arange(7, 14, dtype=np.float32))
+
+    assert ring.total_samples == 14
+    assert ring.oldest_sample == 4
+    assert len(ring) == 10
+    window = ring.view(4, 14)
+    np.testing.assert_array_equal(window, np.arange(4, 14))
+    # Windows across the wrap point are views, not copies
+    assert np.shares_memory(window, ring._data)
+
+
+def test_ring_view_is_clamped_to_held_samples():
+    ring = small_ring()
+    ring.add_audio(np.arange(0, 14, dtype=np.float32))
+
+    np.testing.assert_array_equal(ring.view(0, 100), np.arange(4, 14))
+    np.testing.assert_array_equal(ring.view(12, 100), [12, 13])
+    assert len(ring.view(20, 30)) == 0
+    assert len(ring.view(8, 6)) == 0
+    np.testing.assert_array_equal(ring.view_seconds(0.5, 0.8), [5, 6, 7])
+
+
+def test_ring_keeps_newest_samples_on_overflow():
+    ring = small_ring()
+    ring.add_audio(np.arange(0, 3, dtype=np.float32))
+    ring.add_audio(np.arange(3, 28, dtype=np.float32))
+
+    assert ring.total_samples == 28
+    assert ring.oldest_sample == 18
+    np.testing.assert_array_equal(ring.view(0, 28), np.arange(18, 28))
+
+
+def test_ring_scales_int16_pcm():
+    ring = small_ring()
+    ring.add_audio(np.array([16384, -32768], dtype=np.int16))
+
+    np.testing.assert_allclose(ring.view(0, 2), [0.5, -1.0])
+
+
+# --- IncrementalEnergyVAD ---------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "bursts, duration",
+    [
+        # Includes a 50 ms click, shorter than the minimum speech duration
+        ([(0.5, 1.7), (2.0, 2.05), (2.4, 4.1), (6.0, 6.8)], 8.0),
+        # Speech still going when the audio ends
+        ([(1.0, 2.0), (3.0, 5.0)], 5.0),
+    ],
+)
+def test_vad_matches_full_rescan(bursts, duration):
+    audio = synthetic_audio(bursts, duration)
+
+    segments = []
+    ongoing, processed_until = None, 0.0
+    for closed, ongoing, processed_until in stream(audio, chunk_sizes()):
+        segments.extend(closed)
+    if ongoing is not None:
+        segments.append((ongoing, len(audio) / SR))
+
+    assert segments == reference_vad(audio)
+    assert processed_until <= duration
+
+
+def test_vad_only_evaluates_new_frames():
+    audio = synthetic_audio([(0.5, 1.0)], 2.0)
+    ring = AudioRingBuffer()
+    vad = IncrementalEnergyVAD()
+
+    list(stream(audio, [SR] * 2, ring, vad))
+    evaluated = vad.next_frame
+    assert vad.update(ring) == ([], None, evaluated / SR)
+    assert vad.next_frame == evaluated
+
+
+# --- UtteranceTracker -------------------------------------------------------
+
+
+def test_utterance_ends_after_trailing_silence():
+    tracker = UtteranceTracker(min_silence_duration=1.5)
+
+    assert tracker.update([(1.0, 2.0)], None, 2.5) == []
+    # A 0.5 s pause does not end the utterance
+    assert tracker.update([(2.5, 3.0)], None, 3.5) == []
+    assert tracker.update([], None, 4.49) == []
+    assert tracker.update([], None, 4.5) == [(1.0, 3.0)]
+    assert tracker.update([], None, 6.0) == []
+
+
+def test_ongoing_speech_extends_the_utterance():
+    tracker = UtteranceTracker(min_silence_duration=1.5)
+
+    assert tracker.update([], 6.0, 6.5) == []
+    assert tracker.update([], 6.0, 7.5) == []
+    assert tracker.update([(6.0, 7.8)], None, 8.0) == []
+    assert tracker.update([], None, 9.3) == [(6.0, 7.8)]
+
+
+def test_long_gap_between_segments_splits_utterances():
+    tracker = UtteranceTracker(min_silence_duration=1.5, min_utterance_duration=0.5)
+
+    # The second segment arrives after a 2 s gap; the 0.3 s blip before it is dropped
+    assert tracker.update([(0.2, 0.5), (2.5, 3.5)], None, 3.6) == []
+    assert tracker.update([(5.0, 6.0)], None, 6.5) == [(2.5, 3.5)]
+    assert tracker.update([], None, 7.5) == [(5.0, 6.0)]
+
+
+def test_utterance_boundaries_from_streamed_audio():
+    audio = synthetic_audio([(1.0, 2.0), (2.5, 3.0), (5.0, 6.0)], 8.0)
+    tracker = UtteranceTracker(min_silence_duration=1.5)
+
+    emitted = []
+    for closed, ongoing, processed_until in stream(audio, chunk_sizes(2)):
+        for boundary in tracker.update(closed, ongoing, processed_until):
+            emitted.append((boundary, processed_until))
+
+    frame = 480 / SR
+    assert len(emitted) == 2
+    for ((start, end), emitted_at), (expected_start, expected_end) in zip(
+        emitted, [(1.0, 3.0), (5.0, 6.0)]
+    ):
+        # VAD frames are 30 ms long, so edges land within one frame of the tone
+        assert expected_start - frame <= start <= expected_start
+        assert expected_end - frame <= end <= expected_end
+        # Emitted once 1.5 s of silence has been seen, not before
+        assert emitted_at >= end + 1.5
@@ -0,0 +1,159 @@
+"""
+Unit tests for speaker embedding storage and the ID-mapped FAISS index.
+
+Runs against a temporary SQLite database, no service or models needed.
+
+Run:
+  uv run pytest extras/speaker-recognition/tests/test_unified_speaker_db.py -v
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.orm import sessionmaker
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from simple_speaker_recognition import database
+from simple_speaker_recognition.core import unified_speaker_db
+from simple_speaker_recognition.core.unified_speaker_db import UnifiedSpeakerDB
+from simple_speaker_recognition.database.models import Speaker
+
+DIM = 8
+
+
+@pytest.fixture
+def sessions(tmp_path, monkeypatch):
+    """Point the database module and the speaker DB at a fresh SQLite file."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'speakers.db'}")
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    monkeypatch.setattr(database, "engine", engine)
+    monkeypatch.setattr(unified_speaker_db, "get_db_session", session_factory)
+    database.init_db()
+    return session_factory
+
+
+def unit(index: int) -> np.ndarray:
+    vector = np.zeros(DIM, dtype=np.float32)
+    vector[index] = 1.0
+    return vector
+
+
+def make_db(tmp_path) -> UnifiedSpeakerDB:
+    return UnifiedSpeakerDB(
+        emb_dim=DIM, base_dir=tmp_path / "faiss", similarity_thr=0.9
+    )
+
+
+def identify(db: UnifiedSpeakerDB, embedding: np.ndarray, user_id=None):
+    found, speaker, _ = asyncio.run(db.identify(embedding, user_id))
+    return speaker["id"] if found else None
+
+
+def test_embedding_round_trips_as_float32_blob():
+    embedding = np.linspace(-1, 1, DIM, dtype=np.float64)
+    speaker = Speaker(id="s1", name="Alice", user_id=1)
+
+    speaker.set_embedding(embedding)
+
+    assert len(speaker.embedding_vector) == DIM * 4
+    assert speaker.embedding_data is None
+    restored = speaker.get_embedding()
+    assert restored.dtype == np.float32
+    np.testing.assert_array_equal(restored, embedding.astype(np.float32))
+
+
+def test_legacy_json_embedding_is_still_readable():
+    speaker = Speaker(
+        id="s1", name="Alice", user_id=1, embedding_data=json.dumps([0.5] * DIM)
+    )
+
+    np.testing.assert_array_equal(
+        speaker.get_embedding(), np.full(DIM, 0.5, np.float32)
+    )
+    assert Speaker(id="s2", name="Bob", user_id=1).get_embedding() is None
+
+
+def test_missing_columns_are_added_to_existing_database(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    with engine.begin() as conn:
+        # A speakers table created before embedding_vector existed
+        conn.execute(
+            text(
+                "CREATE TABLE speakers (id VARCHAR(100) PRIMARY KEY, embedding_data TEXT)"
+            )
+        )
+        conn.execute(text("INSERT INTO speakers VALUES ('s1', '[1.0]')"))
+    monkeypatch.setattr(database, "engine", engine)
+
+    database._add_missing_columns()
+    database._add_missing_columns()  # Idempotent
+
+    columns = {column["name"] for column in inspect(engine).get_columns("speakers")}
+    assert "embedding_vector" in columns
+    with engine.connect() as conn:
+        assert (
+            conn.execute(text("SELECT embedding_data FROM speakers")).scalar()
+            == "[1.0]"
+        )
+
+
+def test_index_add_replace_and_remove_by_id(sessions, tmp_path):
+    db = make_db(tmp_path)
+    asyncio.run(db.add_speaker("alice", "Alice", unit(0), user_id=1))
+    asyncio.run(db.add_speaker("bob", "Bob", unit(1), user_id=1))
+    asyncio.run(db.add_speaker("carol", "Carol", unit(2), user_id=2))
+
+    assert db.index.ntotal == 3
+    assert identify(db, unit(0)) == "alice"
+    assert identify(db, unit(2), user_id=1) is None
+
+    # Re-enrolling replaces the vector in place
+    assert asyncio.run(db.add_speaker("alice", "Alice", unit(3), user_id=1)) is True
+    assert db.index.ntotal == 3
+    assert identify(db, unit(0)) is None
+    assert identify(db, unit(3)) == "alice"
+
+    asyncio.run(db.delete_speaker("bob", user_id=1))
+    assert db.index.ntotal == 2
+    assert identify(db, unit(1)) is None
+    assert identify(db, unit(3)) == "alice"
+
+    asyncio.run(db.reset_user(1))
+    assert db.index.ntotal == 1
+    assert set(db.faiss_to_speaker.values()) == {(2, "carol")}
+    assert identify(db, unit(2)) == "carol"
+
+
+def test_saved_index_is_reused_until_speakers_change(sessions, tmp_path):
+    db = make_db(tmp_path)
+    asyncio.run(db.add_speaker("alice", "Alice", unit(0), user_id=1))
+    asyncio.run(db.add_speaker("bob", "Bob", unit(1), user_id=1))
+    asyncio.run(db.delete_speaker("alice", user_id=1))
+
+    reloaded = make_db(tmp_path)
+    assert reloaded.faiss_to_speaker == db.faiss_to_speaker
+    assert reloaded._next_faiss_id == db._next_faiss_id
+    assert identify(reloaded, unit(1)) == "bob"
+
+    # A speaker written behind the index's back makes the saved index stale
+    session = sessions()
+    speaker = Speaker(
+        id="dave", name="Dave", user_id=1, embedding_data=json.dumps(unit(4).tolist())
+    )
+    session.add(speaker)
+    session.commit()
+    session.close()
+
+    rebuilt = make_db(tmp_path)
+    assert rebuilt.index.ntotal == 2
+    assert identify(rebuilt, unit(4)) == "dave"
+    # The legacy JSON row was migrated to a blob during the rebuild
+    session = sessions()
+    assert session.get(Speaker, "dave").embedding_vector is not None
+    session.close()
@@ -2,15 +2,39 @@
 Entity cache for Home Assistant integration.
 
 This module provides caching and lookup functionality for Home Assistant areas and entities.
+
+Lookups are served from indexes built once per refresh (lowercase names,
+name tokens, areas, labels and domains) instead of scanning every entity on
+each command. Entity states can be updated incrementally, in which case only
+the index entries of changed entities are touched.
 """
 
+import bisect
 import logging
+import re
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional
+from difflib import SequenceMatcher, get_close_matches
+from typing import Dict, List, Optional, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Domains tried when a name looks like an entity object id (e.g. "tubelight_3")
+COMMON_DOMAINS = ['light', 'switch', 'fan', 'cover']
+
+# Minimum score for a fuzzy (non-substring) match to be accepted
+MIN_FUZZY_SCORE = 0.6
+
+
+def _tokens(text: str) -> List[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _friendly_name(details: Dict) -> str:
+    return (details.get('attributes') or {}).get('friendly_name') or ''
+
 
 @dataclass
 class EntityCache:
@@ -29,7 +53,203 @@ class EntityCache:
     """Map of label names to area names (e.g., {"hall": ["dining_room", "living_room"]})"""
 
     last_refresh: datetime = field(default_factory=datetime.now)
-    """Timestamp of last cache refresh"""
+    """Timestamp of last cache refresh (full or incremental)"""
+
+    last_full_refresh: Optional[datetime] = None
+    """Timestamp of last full refresh of areas and labels (defaults to last_refresh)"""
+
+    # Indexes (derived from the fields above, rebuilt on refresh)
+    _names: Dict[str, str] = field(default_factory=dict, init=False, repr=False)
+    _name_index: Dict[str, List[str]] = field(default_factory=dict, init=False, repr=False)
+    _token_index: Dict[str, Set[str]] = field(default_factory=dict, init=False, repr=False)
+    _entity_tokens: Dict[str, Set[str]] = field(default_factory=dict, init=False, repr=False)
+    _vocabulary: List[str] = field(default_factory=list, init=False, repr=False)
+    _area_lookup: Dict[str, str] = field(default_factory=dict, init=False, repr=False)
+    _label_lookup: Dict[str, str] = field(default_factory=dict, init=False, repr=False)
+    _area_domains: Dict[str, Dict[str, List[str]]] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self):
+        if self.last_full_refresh is None:
+            self.last_full_refresh = self.last_refresh
+        self.build_indexes()
+
+    # ------------------------------------------------------------------
+    # Index maintenance
+    # ------------------------------------------------------------------
+
+    def build_indexes(self):
+        """Rebuild all lookup indexes from the cached areas, labels and entities."""
+        self._names.clear()
+        self._name_index.clear()
+        self._token_index.clear()
+        self._entity_tokens.clear()
+        for entity_id, details in self.entity_details.items():
+            self._index_entity(entity_id, details)
+        self._vocabulary = sorted(self._token_index)
+        self._index_areas()
+
+    def _index_entity(self, entity_id: str, details: Dict):
+        name = _friendly_name(details).lower().strip()
+        self._names[entity_id] = name
+        if name:
+            self._name_index.setdefault(name, []).append(entity_id)
+
+        # Tokens from both the friendly name and the object id ("tubelight_3")
+        tokens = set(_tokens(name)) | set(_tokens(entity_id.split('.', 1)[-1]))
+        self._entity_tokens[entity_id] = tokens
+        for token in tokens:
+            self._token_index.setdefault(token, set()).add(entity_id)
+
+    def _unindex_entity(self, entity_id: str):
+        name = self._names.pop(entity_id, '')
+        ids = self._name_index.get(name)
+        if ids and entity_id in ids:
+            ids.remove(entity_id)
+            if not ids:
+                del self._name_index[name]
+        for token in self._entity_tokens.pop(entity_id, ()):
+            ids = self._token_index.get(token)
+            if ids is not None:
+                ids.discard(entity_id)
+                if not ids:
+                    del self._token_index[token]
+
+    def _index_areas(self):
+        self._area_lookup = {area.lower(): area for area in self.areas}
+        self._label_lookup = {label.lower(): label for label in self.label_areas}
+        self._area_domains = {}
+        for area, entity_ids in self.area_entities.items():
+            by_domain: Dict[str, List[str]] = {}
+            for entity_id in entity_ids:
+                by_domain.setdefault(entity_id.split('.')[0], []).append(entity_id)
+            self._area_domains[area] = by_domain
+
+    def update_entities(self, entity_details: Dict[str, Dict]) -> Tuple[int, int]:
+        """
+        Replace entity states with a fresh snapshot, updating indexes incrementally.
+
+        Only entities that appeared, disappeared, or changed name or area are
+        re-indexed. Area membership is updated from each entity's ``area_id``
+        for areas known to the cache.
+
+        Args:
+            entity_details: Full entity state data keyed by entity_id
+
+        Returns:
+            Tuple of (changed or added count, removed count)
+        """
+        removed = [e for e in self.entity_details if e not in entity_details]
+        changed = []
+        for entity_id, details in entity_details.items():
+            old = self.entity_details.get(entity_id)
+            if (
+                old is None
+                or _friendly_name(old) != _friendly_name(details)
+                or old.get('area_id') != details.get('area_id')
+            ):
+                changed.append(entity_id)
+
+        membership_changed = False
+        for entity_id in removed:
+            self._unindex_entity(entity_id)
+            membership_changed |= self._set_entity_area(entity_id, None)
+        for entity_id in changed:
+            self._unindex_entity(entity_id)
+            self._index_entity(entity_id, entity_details[entity_id])
+            membership_changed |= self._set_entity_area(
+                entity_id, entity_details[entity_id].get('area_id')
+            )
+
+        self.entity_details = entity_details
+        if removed or changed:
+            self._vocabulary = sorted(self._token_index)
+        if membership_changed:
+            self._index_areas()
+        self.last_refresh = datetime.now()
+        return len(changed), len(removed)
+
+    def _set_entity_area(self, entity_id: str, area: Optional[str]) -> bool:
+        """Move an entity to ``area`` in area_entities. Returns True if anything changed."""
+        moved = False
+        for area_name, entity_ids in self.area_entities.items():
+            if area_name != area and entity_id in entity_ids:
+                entity_ids.remove(entity_id)
+                moved = True
+        if area and area in self.area_entities and entity_id not in self.area_entities[area]:
+            self.area_entities[area].append(entity_id)
+            moved = True
+        return moved
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def rank_entities_by_name(self, name: str, limit: int = 5) -> List[Tuple[str, float]]:
+        """
+        Rank entities by how well their name matches ``name``.
+
+        Candidates come from the token index (exact, prefix and close-spelling
+        token hits), so only entities sharing at least one similar token are
+        scored. Entities whose friendly name contains ``name`` rank first;
+        the rest are ordered by token overlap and edit-distance similarity.
+
+        Args:
+            name: Entity name to search for
+            limit: Maximum number of results
+
+        Returns:
+            List of (entity_id, score) pairs, best first. Scores are in [0, 2];
+            substring matches score above 1.
+        """
+        name_lower = name.lower().strip()
+        query_tokens = _tokens(name_lower)
+        if not query_tokens:
+            return []
+
+        # token similarity per candidate entity, per query token
+        hits: Dict[str, Dict[str, float]] = {}
+        for query_token in query_tokens:
+            for token, similarity in self._similar_tokens(query_token):
+                for entity_id in self._token_index.get(token, ()):
+                    per_token = hits.setdefault(entity_id, {})
+                    if similarity > per_token.get(query_token, 0.0):
+                        per_token[query_token] = similarity
+
+        ranked = []
+        for entity_id, per_token in hits.items():
+            friendly = self._names.get(entity_id, '')
+            overlap = sum(per_token.values()) / len(query_tokens)
+            similarity = SequenceMatcher(None, name_lower, friendly).ratio() if friendly else 0.0
+            score = 0.6 * overlap + 0.4 * similarity
+            if friendly and name_lower in friendly:
+                score += 1.0
+            elif score < MIN_FUZZY_SCORE:
+                continue
+            ranked.append((entity_id, round(score, 4)))
+
+        # Prefer higher score, then shorter names (closer to the query)
+        ranked.sort(key=lambda item: (-item[1], len(self._names.get(item[0], '')), item[0]))
+        return ranked[:limit]
+
+    def _similar_tokens(self, query_token: str) -> List[Tuple[str, float]]:
+        if query_token in self._token_index:
+            return [(query_token, 1.0)]
+
+        # Prefix hits ("tube" → "tubelight") via the sorted vocabulary
+        similar = []
+        start = bisect.bisect_left(self._vocabulary, query_token)
+        for token in self._vocabulary[start:]:
+            if not token.startswith(query_token):
+                break
+            similar.append((token, len(query_token) / len(token)))
+        if similar:
+            return similar
+
+        # Misspellings ("tubelite" → "tubelight")
+        return [
+            (token, SequenceMatcher(None, query_token, token).ratio())
+            for token in get_close_matches(query_token, self._vocabulary, n=3, cutoff=0.75)
+        ]
 
     def find_entity_by_name(self, name: str) -> Optional[str]:
         """
@@ -37,7 +257,8 @@ class EntityCache:
 
         Matching priority:
         1. Exact friendly_name match (case-insensitive)
-        2. Partial friendly_name match (case-insensitive)
+        2. Partial friendly_name match (case-insensitive), then ranked fuzzy
+           match on token overlap and edit distance
         3. Entity ID match (e.g., "tubelight_3" → "light.tubelight_3")
 
         Args:
@@ -49,22 +270,23 @@ class EntityCache:
         name_lower = name.lower().strip()
 
         # Step 1: Exact friendly_name match
-        for entity_id, details in self.entity_details.items():
-            friendly_name = details.get('attributes', {}).get('friendly_name', '')
-            if friendly_name.lower() == name_lower:
-                logger.debug(f"Exact match: {name} → {entity_id} (friendly_name: {friendly_name})")
-                return entity_id
-
-        # Step 2: Partial friendly_name match
-        for entity_id, details in self.entity_details.items():
-            friendly_name = details.get('attributes', {}).get('friendly_name', '')
-            if name_lower in friendly_name.lower():
-                logger.debug(f"Partial match: {name} → {entity_id} (friendly_name: {friendly_name})")
-                return entity_id
+        exact = self._name_index.get(name_lower)
+        if exact:
+            logger.debug(f"Exact match: {name} → {exact[0]}")
+            return exact[0]
+
+        # Step 2: Ranked partial / fuzzy match
+        ranked = self.rank_entities_by_name(name_lower, limit=1)
+        if ranked:
+            entity_id, score = ranked[0]
+            logger.debug(
+                f"Fuzzy match: {name} → {entity_id} "
+                f"(friendly_name: {self._names.get(entity_id)}, score: {score})"
+            )
+            return entity_id
 
         # Step 3: Entity ID match (try adding common domains)
-        common_domains = ['light', 'switch', 'fan', 'cover']
-        for domain in common_domains:
+        for domain in COMMON_DOMAINS:
             candidate_id = f"{domain}.{name_lower.replace(' ', '_')}"
             if candidate_id in self.entity_details:
                 logger.debug(f"Entity ID match: {name} → {candidate_id}")
@@ -90,41 +312,25 @@ class EntityCache:
         """
         area_lower = area.lower().strip()
 
-        # Find matching area (case-insensitive)
-        matching_area = None
-        for area_name in self.areas:
-            if area_name.lower() == area_lower:
-                matching_area = area_name
-                break
-
+        matching_area = self._area_lookup.get(area_lower)
         if matching_area:
-            entities = self.area_entities.get(matching_area, [])
+            real_areas = [matching_area]
         else:
             # Fallback: check if it's a label that maps to multiple areas
-            matching_label = None
-            for label_name in self.label_areas:
-                if label_name.lower() == area_lower:
-                    matching_label = label_name
-                    break
-
+            matching_label = self._label_lookup.get(area_lower)
             if not matching_label:
                 logger.warning(f"Area not found: {area}")
                 return []
-
-            # Resolve label → areas → entities
             real_areas = self.label_areas[matching_label]
             logger.info(f"Resolved label '{area}' → areas {real_areas}")
-            entities = []
-            for real_area in real_areas:
-                entities.extend(self.area_entities.get(real_area, []))
 
-        # Filter by entity type if specified
-        if entity_type:
-            entity_type_lower = entity_type.lower()
-            entities = [
-                e for e in entities
-                if e.split('.')[0] == entity_type_lower
-            ]
+        entities: List[str] = []
+        for real_area in real_areas:
+            if entity_type:
+                by_domain = self._area_domains.get(real_area, {})
+                entities.extend(by_domain.get(entity_type.lower(), []))
+            else:
+                entities.extend(self.area_entities.get(real_area, []))
 
         logger.debug(
             f"Found {len(entities)} entities in area '{area}'"
@@ -133,10 +339,18 @@ class EntityCache:
 
         return entities
 
+    # ------------------------------------------------------------------
+    # Staleness
+    # ------------------------------------------------------------------
+
     def get_cache_age_seconds(self) -> float:
         """Get cache age in seconds."""
         return (datetime.now() - self.last_refresh).total_seconds()
 
+    def get_full_refresh_age_seconds(self) -> float:
+        """Get seconds since areas and labels were last fetched."""
+        return (datetime.now() - self.last_full_refresh).total_seconds()
+
     def is_stale(self, max_age_seconds: int = 3600) -> bool:
         """
         Check if cache is stale.
@@ -148,3 +362,7 @@ class EntityCache:
             True if cache is older than max_age_seconds
         """
         return self.get_cache_age_seconds() > max_age_seconds
+
+    def needs_full_refresh(self, max_age_seconds: int = 3600) -> bool:
+        """True if areas and labels are older than ``max_age_seconds``."""
+        return self.get_full_refresh_age_seconds() > max_age_seconds
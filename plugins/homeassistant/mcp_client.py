@@ -305,10 +305,78 @@ class HAMCPClient:
             logger.warning(f"Unexpected entities format for area '{area_name}': {type(entities)}")
             return []
 
-    async def fetch_entity_states(self) -> Dict[str, Dict]:
+    async def fetch_area_entity_map(self) -> Dict[str, List[str]]:
+        """
+        Fetch all areas and their entity IDs in a single template call.
+
+        Returns:
+            Map of area names to entity IDs
+
+        Example:
+            >>> await client.fetch_area_entity_map()
+            {"study": ["light.tubelight_3", "switch.desk_fan"], "bedroom": []}
+        """
+        template = "{{ [areas(), areas() | map('area_entities') | list] | to_json }}"
+        result = await self._render_template(template)
+
+        if isinstance(result, list) and len(result) == 2:
+            area_map = dict(zip(result[0], result[1]))
+            logger.info(f"Fetched {len(area_map)} areas with entities from Home Assistant")
+            return area_map
+        else:
+            logger.warning(f"Unexpected area entities format: {type(result)}")
+            return {}
+
+    async def fetch_label_area_map(self) -> Dict[str, List[str]]:
+        """Fetch all labels and the area IDs carrying them in a single template call."""
+        template = "{{ [labels(), labels() | map('label_areas') | list] | to_json }}"
+        result = await self._render_template(template)
+
+        if isinstance(result, list) and len(result) == 2:
+            label_map = {label: areas for label, areas in zip(result[0], result[1]) if areas}
+            logger.info(f"Fetched {len(label_map)} labels with areas from Home Assistant")
+            return label_map
+        else:
+            logger.warning(f"Unexpected label areas format: {type(result)}")
+            return {}
+
+    async def fetch_entity_areas(
+        self, entity_ids: List[str], batch_size: int = 500
+    ) -> Dict[str, Optional[str]]:
+        """
+        Resolve the area of many entities with one template call per batch.
+
+        Args:
+            entity_ids: Entity IDs to resolve
+            batch_size: Entity IDs per template request
+
+        Returns:
+            Dict mapping entity_id to area ID (None if unassigned)
+        """
+        entity_areas: Dict[str, Optional[str]] = {}
+        for start in range(0, len(entity_ids), batch_size):
+            batch = entity_ids[start:start + batch_size]
+            template = f"{{{{ {json.dumps(batch)} | map('area_id') | list | to_json }}}}"
+            result = await self._render_template(template)
+            if not isinstance(result, list) or len(result) != len(batch):
+                logger.warning(f"Unexpected area_id batch format: {type(result)}")
+                result = [None] * len(batch)
+            for entity_id, area_id in zip(batch, result):
+                entity_areas[entity_id] = area_id or None
+        return entity_areas
+
+    async def fetch_entity_states(
+        self, known_areas: Optional[Dict[str, Optional[str]]] = None
+    ) -> Dict[str, Dict]:
         """
         Fetch all entity states from Home Assistant.
 
+        Args:
+            known_areas: Optional entity_id → area_id map from a previous
+                fetch. Only entities missing from it have their area looked
+                up, so incremental refreshes cost one states request plus at
+                most one template call for new entities.
+
         Returns:
             Dict mapping entity_id to state data (includes attributes, area_id)
 
@@ -326,6 +394,7 @@ class HAMCPClient:
             "Authorization": f"Bearer {self.token}",
             "Content-Type": "application/json"
         }
+        known_areas = known_areas or {}
 
         try:
             logger.debug("Fetching all entity states")
@@ -336,24 +405,25 @@ class HAMCPClient:
             response.raise_for_status()
 
             states = response.json()
-            entity_details = {}
-
-            # Enrich with area information
-            for state in states:
-                entity_id = state.get('entity_id')
-                if entity_id:
-                    # Get area_id using Template API
-                    try:
-                        area_template = f"{{{{ area_id('{entity_id}') }}}}"
-                        area_id = await self._render_template(area_template)
-                        state['area_id'] = area_id if area_id else None
-                    except Exception as e:
-                        logger.debug(f"Failed to get area for {entity_id}: {e}")
-                        state['area_id'] = None
-
-                    entity_details[entity_id] = state
-
-            logger.info(f"Fetched {len(entity_details)} entity states")
+            entity_details = {
+                state['entity_id']: state for state in states if state.get('entity_id')
+            }
+
+            # Enrich with area information, batching lookups for unknown entities
+            unknown = [e for e in entity_details if e not in known_areas]
+            resolved: Dict[str, Optional[str]] = {}
+            if unknown:
+                try:
+                    resolved = await self.fetch_entity_areas(unknown)
+                except MCPError as e:
+                    logger.debug(f"Failed to get areas for {len(unknown)} entities: {e}")
+            for entity_id, state in entity_details.items():
+                state['area_id'] = known_areas.get(entity_id, resolved.get(entity_id))
+
+            logger.info(
+                f"Fetched {len(entity_details)} entity states "
+                f"({len(unknown)} area lookups)"
+            )
             return entity_details
 
         except httpx.HTTPStatusError as e:
@@ -46,6 +46,8 @@ class HomeAssistantPlugin(BasePlugin):
                 - enabled: Whether plugin is enabled
                 - access_level: Should be 'transcript'
                 - trigger: Should be {'type': 'wake_word', 'wake_word': '...'}
+                - cache_refresh_interval: Seconds before entity states are refreshed
+                - cache_full_refresh_interval: Seconds before areas/labels are re-fetched
         """
         super().__init__(config)
         self.mcp_client: Optional[HAMCPClient] = None
@@ -62,6 +64,10 @@ class HomeAssistantPlugin(BasePlugin):
         self.wake_word = config.get("wake_word", "vivi")
         self.timeout = int(config.get("timeout", 30))
         self.button_actions = config.get("button_actions", {})
+        # Entity states are refreshed incrementally after this many seconds;
+        # areas and labels are re-fetched on the slower full refresh interval
+        self.cache_refresh_interval = int(config.get("cache_refresh_interval", 300))
+        self.cache_full_refresh_interval = int(config.get("cache_full_refresh_interval", 3600))
 
     def register_prompts(self, registry) -> None:
         """Register Home Assistant prompts with the prompt registry."""
@@ -473,19 +479,48 @@ class HomeAssistantPlugin(BasePlugin):
             logger.info("Closed Home Assistant MCP client")
 
     async def _ensure_cache_initialized(self):
-        """Ensure entity cache is initialized. Lazy-load on first use."""
-        if not self.cache_initialized:
+        """
+        Ensure entity cache is initialized and fresh. Lazy-load on first use.
+
+        After the first full load, stale entity states are refreshed
+        incrementally; areas and labels are only re-fetched once the full
+        refresh interval has passed. A failed scheduled refresh keeps serving
+        the previous cache.
+        """
+        if not self.cache_initialized or not self.entity_cache:
             logger.info("Entity cache not initialized, refreshing...")
             await self._refresh_cache()
             self.cache_initialized = True
+            return
+
+        try:
+            if self.entity_cache.needs_full_refresh(self.cache_full_refresh_interval):
+                await self._refresh_cache()
+            elif self.entity_cache.is_stale(self.cache_refresh_interval):
+                await self._refresh_entity_states()
+        except Exception as e:
+            logger.warning(f"Entity cache refresh failed, using cached data: {e}")
+
+    async def _refresh_entity_states(self):
+        """Incrementally refresh entity states, reusing known entity areas."""
+        known_areas = {
+            entity_id: details.get("area_id")
+            for entity_id, details in self.entity_cache.entity_details.items()
+        }
+        entity_details = await self.mcp_client.fetch_entity_states(known_areas=known_areas)
+        changed, removed = self.entity_cache.update_entities(entity_details)
+        logger.info(
+            f"Entity states refreshed: {len(entity_details)} entities "
+            f"({changed} changed, {removed} removed)"
+        )
 
     async def _refresh_cache(self):
         """
         Refresh the entity cache from Home Assistant.
 
-        Fetches:
-        - All areas
-        - Entities in each area
+        Fetches (one template call each, plus the states request):
+        - All areas with their entities
+        - Labels with their areas
         - Entity state details
         """
         if not self.mcp_client:
@@ -495,25 +530,15 @@ class HomeAssistantPlugin(BasePlugin):
         try:
             logger.info("Refreshing entity cache from Home Assistant...")
 
-            # Fetch all areas
-            areas = await self.mcp_client.fetch_areas()
+            # Fetch all areas with their entities
+            area_entities = await self.mcp_client.fetch_area_entity_map()
+            areas = list(area_entities)
             logger.debug(f"Fetched {len(areas)} areas: {areas}")
 
-            # Fetch entities for each area
-            area_entities = {}
-            for area in areas:
-                entities = await self.mcp_client.fetch_area_entities(area)
-                area_entities[area] = entities
-                logger.debug(f"Area '{area}': {len(entities)} entities")
-
             # Fetch labels and build label → areas mapping
             label_areas_map = {}
             try:
-                labels = await self.mcp_client.fetch_labels()
-                for label in labels:
-                    label_area_list = await self.mcp_client.fetch_label_areas(label)
-                    if label_area_list:
-                        label_areas_map[label] = label_area_list
+                label_areas_map = await self.mcp_client.fetch_label_area_map()
                 if label_areas_map:
                     logger.info(f"Label→area mappings: {label_areas_map}")
             except Exception as e:
@@ -523,7 +548,7 @@ class HomeAssistantPlugin(BasePlugin):
             entity_details = await self.mcp_client.fetch_entity_states()
             logger.debug(f"Fetched {len(entity_details)} entity states")
 
-            # Create cache
+            # Create cache (builds lookup indexes)
             from datetime import datetime
 
             self.entity_cache = EntityCache(